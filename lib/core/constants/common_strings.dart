@@ -9,16 +9,16 @@ import '../../data/services/l10n_service.dart';
 ///   CommonStrings.somethingWentWrong(language)
 abstract final class CommonStrings {
   static String somethingWentWrong(AppLanguage lang) =>
-      L10nService.get('common.something_went_wrong', lang);
+      L10nService.get(L10nKeys.commonSomethingWentWrong, lang);
 
   static String errorLoading(AppLanguage lang) =>
-      L10nService.get('common.error_loading', lang);
+      L10nService.get(L10nKeys.commonErrorLoading, lang);
 
   static String couldNotShareTryAgain(AppLanguage lang) =>
-      L10nService.get('common.could_not_share_try_again', lang);
+      L10nService.get(L10nKeys.commonCouldNotShareTryAgain, lang);
 
   static String errorLoadingProgram(AppLanguage lang) =>
-      L10nService.get('common.error_loading_program', lang);
+      L10nService.get(L10nKeys.commonErrorLoadingProgram, lang);
 
   // ═══════════════════════════════════════════════════════════════════════
   // MONTH NAMES
@@ -17,15 +17,15 @@ enum ImportantDateCategory {
   String label(AppLanguage language) {
     switch (this) {
       case ImportantDateCategory.personalMilestone:
-        return L10nService.get('data.content.important_date_presets.personal_milestones', language);
+        return L10nService.get(L10nKeys.dataContentImportantDatePresetsPersonalMilestones, language);
       case ImportantDateCategory.relationship:
-        return L10nService.get('data.content.important_date_presets.relationships', language);
+        return L10nService.get(L10nKeys.dataContentImportantDatePresetsRelationships, language);
       case ImportantDateCategory.challenge:
-        return L10nService.get('data.content.important_date_presets.challenges', language);
+        return L10nService.get(L10nKeys.dataContentImportantDatePresetsChallenges, language);
       case ImportantDateCategory.growth:
-        return L10nService.get('data.content.important_date_presets.growth', language);
+        return L10nService.get(L10nKeys.dataContentImportantDatePresetsGrowth, language);
       case ImportantDateCategory.reflective:
-        return L10nService.get('data.content.important_date_presets.reflective', language);
+        return L10nService.get(L10nKeys.dataContentImportantDatePresetsReflective, language);
     }
   }
 }
@@ -656,46 +656,46 @@ class ShareCardTemplates {
       // ── Identity ──────────────────────────────────────────────────────
       case 'archetype_reveal':
         result = ShareCardData(
-          headline: archetypeName ?? (L10nService.get('data.content.share_templates.the_reflector', language)),
-          subtitle: L10nService.get('data.content.share_templates.your_entries_suggest_this_archetype_patt', language),
-          detail: L10nService.get('data.content.share_templates.based_on_your_recent_journal_entries', language),
+          headline: archetypeName ?? (L10nService.get(L10nKeys.dataContentShareTemplatesTheReflector, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYourEntriesSuggestThisArchetypePatt, language),
+          detail: L10nService.get(L10nKeys.dataContentShareTemplatesBasedOnYourRecentJournalEntries, language),
         );
 
       case 'attachment_style':
         result = ShareCardData(
           headline:
               attachmentResult ??
-              (L10nService.get('data.content.share_templates.secureleaning', language)),
-          subtitle: L10nService.get('data.content.share_templates.your_entries_suggest_this_attachment_pat', language),
-          detail: L10nService.get('data.content.share_templates.drawn_from_your_selfreflection_quiz', language),
+              (L10nService.get(L10nKeys.dataContentShareTemplatesSecureleaning, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYourEntriesSuggestThisAttachmentPat, language),
+          detail: L10nService.get(L10nKeys.dataContentShareTemplatesDrawnFromYourSelfreflectionQuiz, language),
         );
 
       case 'dream_personality':
         result = ShareCardData(
-          headline: dreamType ?? (L10nService.get('data.content.share_templates.the_voyager', language)),
-          subtitle: L10nService.get('data.content.share_templates.your_dream_journal_suggests_this_persona', language),
-          detail: L10nService.get('data.content.share_templates.based_on_recurring_dream_themes', language),
+          headline: dreamType ?? (L10nService.get(L10nKeys.dataContentShareTemplatesTheVoyager, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYourDreamJournalSuggestsThisPersona, language),
+          detail: L10nService.get(L10nKeys.dataContentShareTemplatesBasedOnRecurringDreamThemes, language),
         );
 
       case 'energy_profile':
         result = ShareCardData(
-          headline: energyType ?? (L10nService.get('data.content.share_templates.steady_flow', language)),
-          subtitle: L10nService.get('data.content.share_templates.your_entries_suggest_this_energy_rhythm', language),
-          detail: L10nService.get('data.content.share_templates.patterns_drawn_from_your_daily_entries', language),
+          headline: energyType ?? (L10nService.get(L10nKeys.dataContentShareTemplatesSteadyFlow, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYourEntriesSuggestThisEnergyRhythm, language),
+          detail: L10nService.get(L10nKeys.dataContentShareTemplatesPatternsDrawnFromYourDailyEntries, language),
         );
 
       case 'emotional_archetype':
         result = ShareCardData(
           headline:
-              emotionalStyle ?? (L10nService.get('data.content.share_templates.deep_processor', language)),
-          subtitle: L10nService.get('data.content.share_templates.you_tend_to_process_feelings_with_depth', language),
+              emotionalStyle ?? (L10nService.get(L10nKeys.dataContentShareTemplatesDeepProcessor, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYouTendToProcessFeelingsWithDepth, language),
         );
 
       // ── Pattern ───────────────────────────────────────────────────────
       case 'weekly_mood_wave':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.my_week_in_feelings', language),
-          subtitle: L10nService.get('data.content.share_templates.patterns_drawn_from_7day_mood_data', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesMyWeekInFeelings, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesPatternsDrawnFrom7dayMoodData, language),
           chartValues: moodValues ?? [3, 4, 3, 5, 4, 3, 4],
           chartLabels: isEn
               ? ['M', 'T', 'W', 'T', 'F', 'S', 'S']
@@ -704,8 +704,8 @@ class ShareCardTemplates {
 
       case 'focus_area_radar':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.focus_area_balance', language),
-          subtitle: L10nService.get('data.content.share_templates.how_your_attention_spreads_across_areas', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesFocusAreaBalance, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesHowYourAttentionSpreadsAcrossAreas, language),
           chartValues: focusValues ?? [4, 3, 5, 2, 4],
           chartLabels: isEn
               ? ['Mind', 'Body', 'Heart', 'Inner', 'Social']
@@ -715,24 +715,24 @@ class ShareCardTemplates {
       case 'streak_flame':
         final streakText = streak > 0 ? '$streak' : '0';
         result = ShareCardData(
-          headline: L10nService.getWithParams('share.day_streak_headline', language, params: {'count': streakText}),
-          subtitle: L10nService.get('data.content.share_templates.consistency_builds_selfawareness', language),
+          headline: L10nService.getWithParams(L10nKeys.shareDayStreakHeadline, language, params: {'count': streakText}),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesConsistencyBuildsSelfawareness, language),
           statValue: streakText,
-          statLabel: L10nService.get('data.content.share_templates.day_streak', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesDayStreak, language),
         );
 
       case 'top_emotion':
         result = ShareCardData(
-          headline: topEmotionName ?? (L10nService.get('data.content.share_templates.calm', language)),
-          subtitle: L10nService.get('data.content.share_templates.your_most_frequent_emotion_this_month', language),
+          headline: topEmotionName ?? (L10nService.get(L10nKeys.dataContentShareTemplatesCalm, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYourMostFrequentEmotionThisMonth, language),
           statValue: topEmotionEmoji ?? '\u{1F60C}',
-          statLabel: L10nService.get('data.content.share_templates.dominant_this_month', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesDominantThisMonth, language),
         );
 
       case 'sleep_pattern':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.my_sleep_quality', language),
-          subtitle: L10nService.get('data.content.share_templates.how_your_rest_has_been_this_week', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesMySleepQuality, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesHowYourRestHasBeenThisWeek, language),
           chartValues: sleepValues ?? [3, 4, 4, 5, 3, 4, 4],
           chartLabels: isEn
               ? ['M', 'T', 'W', 'T', 'F', 'S', 'S']
@@ -743,28 +743,28 @@ class ShareCardTemplates {
       case 'journal_milestone':
         final days = journalDays > 0 ? journalDays : 30;
         result = ShareCardData(
-          headline: L10nService.getWithParams('share.days_of_journaling', language, params: {'count': '$days'}),
-          subtitle: L10nService.get('data.content.share_templates.another_milestone_of_showing_up_for_your', language),
+          headline: L10nService.getWithParams(L10nKeys.shareDaysOfJournaling, language, params: {'count': '$days'}),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesAnotherMilestoneOfShowingUpForYour, language),
           statValue: '$days',
-          statLabel: L10nService.get('data.content.share_templates.days', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesDays, language),
         );
 
       case 'dream_explorer':
         final count = dreamCount > 0 ? dreamCount : 10;
         result = ShareCardData(
-          headline: L10nService.getWithParams('share.explored_dreams', language, params: {'count': '$count'}),
-          subtitle: L10nService.get('data.content.share_templates.your_dream_world_keeps_revealing_insight', language),
+          headline: L10nService.getWithParams(L10nKeys.shareExploredDreams, language, params: {'count': '$count'}),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYourDreamWorldKeepsRevealingInsight, language),
           statValue: '$count',
-          statLabel: L10nService.get('data.content.share_templates.dreams', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesDreams, language),
         );
 
       case 'pattern_discoverer':
         final count = patternCount > 0 ? patternCount : 5;
         result = ShareCardData(
-          headline: L10nService.getWithParams('share.found_patterns', language, params: {'count': '$count'}),
-          subtitle: L10nService.get('data.content.share_templates.selfawareness_grows_with_each_discovery', language),
+          headline: L10nService.getWithParams(L10nKeys.shareFoundPatterns, language, params: {'count': '$count'}),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesSelfawarenessGrowsWithEachDiscovery, language),
           statValue: '$count',
-          statLabel: L10nService.get('data.content.share_templates.patterns', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesPatterns, language),
         );
 
       case 'consistency_star':
@@ -773,9 +773,9 @@ class ShareCardTemplates {
           headline: isEn
               ? 'Journaled $days Days This Month'
               : 'Bu Ay $days Gün Yazıldı',
-          subtitle: L10nService.get('data.content.share_templates.showing_up_consistently_for_yourself', language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesShowingUpConsistentlyForYourself, language),
           statValue: '$days',
-          statLabel: L10nService.get('data.content.share_templates.days_this_month', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesDaysThisMonth, language),
         );
 
       case 'growth_journey':
@@ -785,9 +785,9 @@ class ShareCardTemplates {
           headline: isEn
               ? 'Growth: $from \u{2192} $to'
               : 'Gelişim: $from \u{2192} $to',
-          subtitle: L10nService.get('data.content.share_templates.your_growth_score_has_been_rising_steadi', language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYourGrowthScoreHasBeenRisingSteadi, language),
           statValue: '+${to - from}',
-          statLabel: L10nService.get('data.content.share_templates.points_gained', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesPointsGained, language),
         );
 
       // ── Wisdom ────────────────────────────────────────────────────────
@@ -795,8 +795,8 @@ class ShareCardTemplates {
         result = ShareCardData(
           headline:
               reflectionText ??
-              (L10nService.get('data.content.share_templates.every_moment_of_stillness_is_a_step_inwa', language)),
-          subtitle: L10nService.get('data.content.share_templates.daily_reflection', language),
+              (L10nService.get(L10nKeys.dataContentShareTemplatesEveryMomentOfStillnessIsAStepInwa, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesDailyReflection, language),
         );
 
       case 'on_this_day_memory':
@@ -811,47 +811,47 @@ class ShareCardTemplates {
         result = ShareCardData(
           headline:
               dreamInsightText ??
-              (L10nService.get('data.content.share_templates.your_dreams_may_be_pointing_toward_unres', language)),
-          subtitle: L10nService.get('data.content.share_templates.from_your_dream_journal', language),
+              (L10nService.get(L10nKeys.dataContentShareTemplatesYourDreamsMayBePointingTowardUnres, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesFromYourDreamJournal, language),
         );
 
       case 'pattern_wisdom':
         result = ShareCardData(
           headline:
               patternInsightText ??
-              (L10nService.get('data.content.share_templates.your_entries_suggest_you_tend_to_find_cl', language)),
-          subtitle: L10nService.get('data.content.share_templates.drawn_from_your_patterns', language),
+              (L10nService.get(L10nKeys.dataContentShareTemplatesYourEntriesSuggestYouTendToFindCl, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesDrawnFromYourPatterns, language),
         );
 
       case 'seasonal_message':
-        final season = seasonName ?? (L10nService.get('data.content.share_templates.winter', language));
+        final season = seasonName ?? (L10nService.get(L10nKeys.dataContentShareTemplatesWinter, language));
         result = ShareCardData(
           headline:
               seasonMessage ??
-              (L10nService.get('data.content.share_templates.a_season_for_rest_reflection_and_inner_r', language)),
-          subtitle: '$season ${L10nService.get('data.content.share_templates.reflection', language)}',
+              (L10nService.get(L10nKeys.dataContentShareTemplatesASeasonForRestReflectionAndInnerR, language)),
+          subtitle: '$season ${L10nService.get(L10nKeys.dataContentShareTemplatesReflection, language)}',
         );
 
       case 'affirmation':
         result = ShareCardData(
           headline:
               affirmationText ??
-              (L10nService.get('data.content.share_templates.i_trust_the_process_of_my_own_growth', language)),
-          subtitle: L10nService.get('data.content.share_templates.daily_affirmation', language),
+              (L10nService.get(L10nKeys.dataContentShareTemplatesITrustTheProcessOfMyOwnGrowth, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesDailyAffirmation, language),
         );
 
       // ── Cycle Position ─────────────────────────────────────────────────
       case 'cycle_position':
         final day = cycleDay > 0 ? cycleDay : 12;
         final length = cycleLength > 0 ? cycleLength : 28;
-        final phase = cyclePhaseName ?? (L10nService.get('data.content.share_templates.expansion', language));
+        final phase = cyclePhaseName ?? (L10nService.get(L10nKeys.dataContentShareTemplatesExpansion, language));
         final desc =
             cyclePhaseDescription ??
-            (L10nService.get('data.content.share_templates.your_recent_entries_suggest_a_period_of', language));
+            (L10nService.get(L10nKeys.dataContentShareTemplatesYourRecentEntriesSuggestAPeriodOf, language));
         result = ShareCardData(
           headline: phase,
           subtitle: desc,
-          detail: L10nService.getWithParams('share.day_of_length', language, params: {'day': '$day', 'length': '$length'}),
+          detail: L10nService.getWithParams(L10nKeys.shareDayOfLength, language, params: {'day': '$day', 'length': '$length'}),
           statValue: '$day',
           statLabel: '$length',
           chartValues: [day.toDouble(), length.toDouble()],
@@ -860,63 +860,63 @@ class ShareCardTemplates {
       // ── Curated Wisdom Insights ────────────────────────────────────
       case 'wisdom_quiet_weeks':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.your_quietest_weeks_often_hold_your_deep', language),
-          subtitle: L10nService.get('data.content.share_templates.from_your_patterns', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesYourQuietestWeeksOftenHoldYourDeep, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesFromYourPatterns, language),
         );
 
       case 'wisdom_small_shifts':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.the_smallest_shifts_in_awareness_often_l', language),
-          subtitle: L10nService.get('data.content.share_templates.curated_insight', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesTheSmallestShiftsInAwarenessOftenL, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesCuratedInsight, language),
         );
 
       case 'wisdom_patterns':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.your_patterns_are_not_your_limits_they_a', language),
-          subtitle: L10nService.get('data.content.share_templates.pattern_wisdom', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesYourPatternsAreNotYourLimitsTheyA, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesPatternWisdom, language),
         );
 
       case 'wisdom_rest':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.rest_is_not_the_absence_of_progress_it_i', language),
-          subtitle: L10nService.get('data.content.share_templates.rest_insight', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesRestIsNotTheAbsenceOfProgressItI, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesRestInsight, language),
         );
 
       case 'wisdom_growth':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.growth_often_feels_like_confusion_before', language),
-          subtitle: L10nService.get('data.content.share_templates.growth_wisdom', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesGrowthOftenFeelsLikeConfusionBefore, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesGrowthWisdom, language),
         );
 
       // ── Curated Reflection Insights ─────────────────────────────────
       case 'reflection_self_awareness':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.noticing_yourself_is_the_first_act_of_ch', language),
-          subtitle: L10nService.get('data.content.share_templates.selfawareness', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesNoticingYourselfIsTheFirstActOfCh, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesSelfawareness, language),
         );
 
       case 'reflection_presence':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.the_present_moment_holds_more_wisdom_tha', language),
-          subtitle: L10nService.get('data.content.share_templates.presence', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesThePresentMomentHoldsMoreWisdomTha, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesPresence, language),
         );
 
       case 'reflection_inner_voice':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.your_inner_voice_gets_clearer_when_you_g', language),
-          subtitle: L10nService.get('data.content.share_templates.inner_voice', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesYourInnerVoiceGetsClearerWhenYouG, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesInnerVoice, language),
         );
 
       case 'reflection_resilience':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.you_have_survived_every_difficult_day_so', language),
-          subtitle: L10nService.get('data.content.share_templates.resilience', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesYouHaveSurvivedEveryDifficultDaySo, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesResilience, language),
         );
 
       case 'reflection_acceptance':
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.acceptance_is_not_giving_up_it_is_making', language),
-          subtitle: L10nService.get('data.content.share_templates.acceptance', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesAcceptanceIsNotGivingUpItIsMaking, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesAcceptance, language),
         );
 
       // ── Monthly Wrapped ─────────────────────────────────────────
@@ -934,18 +934,18 @@ class ShareCardTemplates {
               ? 'Average rating: $avg — your month at a glance'
               : 'Ortalama puan: $avg — ayına genel bakış',
           statValue: '$entries',
-          statLabel: L10nService.get('data.content.share_templates.entries', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesEntries, language),
         );
 
       // ── Challenge Complete ──────────────────────────────────────
       case 'challenge_complete':
         final emoji = challengeEmoji ?? '\u{1F3C6}';
-        final name = challengeName ?? (L10nService.get('data.content.share_templates.challenge', language));
+        final name = challengeName ?? (L10nService.get(L10nKeys.dataContentShareTemplatesChallenge, language));
         result = ShareCardData(
-          headline: L10nService.getWithParams('share.program_completed', language, params: {'name': name}),
-          subtitle: L10nService.get('data.content.share_templates.you_showed_real_commitment', language),
+          headline: L10nService.getWithParams(L10nKeys.shareProgramCompleted, language, params: {'name': name}),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesYouShowedRealCommitment, language),
           statValue: emoji,
-          statLabel: L10nService.get('data.content.share_templates.completed', language),
+          statLabel: L10nService.get(L10nKeys.dataContentShareTemplatesCompleted, language),
         );
 
       // ── Question of the Day ─────────────────────────────────────
@@ -953,14 +953,14 @@ class ShareCardTemplates {
         result = ShareCardData(
           headline:
               reflectionText ??
-              (L10nService.get('data.content.share_templates.what_would_you_tell_your_younger_self_to', language)),
-          subtitle: L10nService.get('data.content.share_templates.question_of_the_day', language),
+              (L10nService.get(L10nKeys.dataContentShareTemplatesWhatWouldYouTellYourYoungerSelfTo, language)),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesQuestionOfTheDay, language),
         );
 
       default:
         result = ShareCardData(
-          headline: L10nService.get('data.content.share_templates.innercycles', language),
-          subtitle: L10nService.get('data.content.share_templates.cyclical_intelligence', language),
+          headline: L10nService.get(L10nKeys.dataContentShareTemplatesInnercycles, language),
+          subtitle: L10nService.get(L10nKeys.dataContentShareTemplatesCyclicalIntelligence, language),
         );
     }
 
@@ -433,13 +433,13 @@ extension ElementExtension on Element {
   String localizedName(AppLanguage language) {
     switch (this) {
       case Element.fire:
-        return L10nService.get('data.models.personality_archetype.fire', language);
+        return L10nService.get(L10nKeys.dataModelsPersonalityArchetypeFire, language);
       case Element.earth:
-        return L10nService.get('data.models.personality_archetype.earth', language);
+        return L10nService.get(L10nKeys.dataModelsPersonalityArchetypeEarth, language);
       case Element.air:
-        return L10nService.get('data.models.personality_archetype.air', language);
+        return L10nService.get(L10nKeys.dataModelsPersonalityArchetypeAir, language);
       case Element.water:
-        return L10nService.get('data.models.personality_archetype.water', language);
+        return L10nService.get(L10nKeys.dataModelsPersonalityArchetypeWater, language);
     }
   }
 
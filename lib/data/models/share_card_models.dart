@@ -21,15 +21,15 @@ enum ShareCardCategory {
   String label(AppLanguage language) {
     switch (this) {
       case ShareCardCategory.identity:
-        return L10nService.get('data.models.share_models.identity', language);
+        return L10nService.get(L10nKeys.dataModelsShareModelsIdentity, language);
       case ShareCardCategory.pattern:
-        return L10nService.get('data.models.share_models.patterns', language);
+        return L10nService.get(L10nKeys.dataModelsShareModelsPatterns, language);
       case ShareCardCategory.achievement:
-        return L10nService.get('data.models.share_models.achievements', language);
+        return L10nService.get(L10nKeys.dataModelsShareModelsAchievements, language);
       case ShareCardCategory.wisdom:
-        return L10nService.get('data.models.share_models.wisdom', language);
+        return L10nService.get(L10nKeys.dataModelsShareModelsWisdom, language);
       case ShareCardCategory.reflection:
-        return L10nService.get('data.models.share_models.reflection', language);
+        return L10nService.get(L10nKeys.dataModelsShareModelsReflection, language);
     }
   }
 
@@ -18,22 +18,22 @@ enum EmotionalArc {
   String label(AppLanguage language) {
     switch (this) {
       case EmotionalArc.rising:
-        return L10nService.get('data.models.wrapped_data.rising', language);
+        return L10nService.get(L10nKeys.dataModelsWrappedDataRising, language);
       case EmotionalArc.steady:
-        return L10nService.get('data.models.wrapped_data.steady', language);
+        return L10nService.get(L10nKeys.dataModelsWrappedDataSteady, language);
       case EmotionalArc.transforming:
-        return L10nService.get('data.models.wrapped_data.transforming', language);
+        return L10nService.get(L10nKeys.dataModelsWrappedDataTransforming, language);
     }
   }
 
   String description(AppLanguage language) {
     switch (this) {
       case EmotionalArc.rising:
-        return L10nService.get('data.models.wrapped_data.your_emotional_trajectory_has_been_climb', language);
+        return L10nService.get(L10nKeys.dataModelsWrappedDataYourEmotionalTrajectoryHasBeenClimb, language);
       case EmotionalArc.steady:
-        return L10nService.get('data.models.wrapped_data.you_maintained_a_grounded_stable_emotion', language);
+        return L10nService.get(L10nKeys.dataModelsWrappedDataYouMaintainedAGroundedStableEmotion, language);
       case EmotionalArc.transforming:
-        return L10nService.get('data.models.wrapped_data.your_emotional_landscape_has_been_shifti', language);
+        return L10nService.get(L10nKeys.dataModelsWrappedDataYourEmotionalLandscapeHasBeenShifti, language);
     }
   }
 }
@@ -52,7 +52,7 @@ class DreamInterpretationService {
         whyNow:
             aiResponse['whyNow'] ??
             L10nService.get(
-              'dream_interpretation.why_now_simple',
+              L10nKeys.dreamInterpretationWhyNowSimple,
               AppLanguage.tr,
             ),
         isIntense: aiResponse['isIntense'] ?? false,
@@ -149,7 +149,7 @@ class DreamInterpretationService {
       archetypeConnection:
           archetypeData?.description ??
           L10nService.get(
-            'dream_interpretation.archetype_fallback',
+            L10nKeys.dreamInterpretationArchetypeFallback,
             AppLanguage.tr,
           ),
       archetypeName: archetypeData?.nameTr ?? archetype,
@@ -234,21 +234,21 @@ class DreamInterpretationService {
 
     if (score >= 4)
       return L10nService.get(
-        'dream_interpretation.lucid_potential.very_high',
+        L10nKeys.dreamInterpretationLucidPotentialVeryHigh,
         AppLanguage.tr,
       );
     if (score >= 3)
       return L10nService.get(
-        'dream_interpretation.lucid_potential.high',
+        L10nKeys.dreamInterpretationLucidPotentialHigh,
         AppLanguage.tr,
       );
     if (score >= 2)
       return L10nService.get(
-        'dream_interpretation.lucid_potential.medium',
+        L10nKeys.dreamInterpretationLucidPotentialMedium,
         AppLanguage.tr,
       );
     return L10nService.get(
-      'dream_interpretation.lucid_potential.low',
+      L10nKeys.dreamInterpretationLucidPotentialLow,
       AppLanguage.tr,
     );
   }
@@ -945,50 +945,50 @@ JSON FORMATI:
     final links = <DreamExplorationLink>[
       DreamExplorationLink(
         title: L10nService.get(
-          'dream_interpretation.exploration.personal_profile_title',
+          L10nKeys.dreamInterpretationExplorationPersonalProfileTitle,
           language,
         ),
         description: L10nService.get(
-          'dream_interpretation.exploration.personal_profile_desc',
+          L10nKeys.dreamInterpretationExplorationPersonalProfileDesc,
           language,
         ),
         route: Routes.insight,
         emoji: '🗺️',
         category: L10nService.get(
-          'dream_interpretation.exploration.category_self_awareness',
+          L10nKeys.dreamInterpretationExplorationCategorySelfAwareness,
           language,
         ),
       ),
       // moonCalendar exploration link removed (killed feature)
       DreamExplorationLink(
         title: L10nService.get(
-          'dream_interpretation.exploration.timing_insights_title',
+          L10nKeys.dreamInterpretationExplorationTimingInsightsTitle,
           language,
         ),
         description: L10nService.get(
-          'dream_interpretation.exploration.timing_insights_desc',
+          L10nKeys.dreamInterpretationExplorationTimingInsightsDesc,
           language,
         ),
         route: Routes.insightsDiscovery,
         emoji: '🪐',
         category: L10nService.get(
-          'dream_interpretation.exploration.category_self_awareness',
+          L10nKeys.dreamInterpretationExplorationCategorySelfAwareness,
           language,
         ),
       ),
       DreamExplorationLink(
         title: L10nService.get(
-          'dream_interpretation.exploration.journal_title',
+          L10nKeys.dreamInterpretationExplorationJournalTitle,
           language,
         ),
         description: L10nService.get(
-          'dream_interpretation.exploration.journal_desc',
+          L10nKeys.dreamInterpretationExplorationJournalDesc,
           language,
         ),
         route: Routes.journal,
         emoji: '📝',
         category: L10nService.get(
-          'dream_interpretation.exploration.category_symbols',
+          L10nKeys.dreamInterpretationExplorationCategorySymbols,
           language,
         ),
       ),
@@ -999,17 +999,17 @@ JSON FORMATI:
       links.add(
         DreamExplorationLink(
           title: L10nService.get(
-            'dream_interpretation.exploration.neptune_title',
+            L10nKeys.dreamInterpretationExplorationNeptuneTitle,
             language,
           ),
           description: L10nService.get(
-            'dream_interpretation.exploration.neptune_desc',
+            L10nKeys.dreamInterpretationExplorationNeptuneDesc,
             language,
           ),
           route: Routes.insightsDiscovery,
           emoji: '🌊',
           category: L10nService.get(
-            'dream_interpretation.exploration.category_self_awareness',
+            L10nKeys.dreamInterpretationExplorationCategorySelfAwareness,
             language,
           ),
         ),
@@ -1020,17 +1020,17 @@ JSON FORMATI:
       links.add(
         DreamExplorationLink(
           title: L10nService.get(
-            'dream_interpretation.exploration.pluto_title',
+            L10nKeys.dreamInterpretationExplorationPlutoTitle,
             language,
           ),
           description: L10nService.get(
-            'dream_interpretation.exploration.pluto_desc',
+            L10nKeys.dreamInterpretationExplorationPlutoDesc,
             language,
           ),
           route: Routes.insightsDiscovery,
           emoji: '🦋',
           category: L10nService.get(
-            'dream_interpretation.exploration.category_self_awareness',
+            L10nKeys.dreamInterpretationExplorationCategorySelfAwareness,
             language,
           ),
         ),
@@ -1057,19 +1057,19 @@ JSON FORMATI:
     return EmotionalReading(
       dominantEmotion: EmotionalTone.merak,
       surfaceMessage: L10nService.get(
-        'dream_interpretation.defaults.surface_message',
+        L10nKeys.dreamInterpretationDefaultsSurfaceMessage,
         language,
       ),
       deeperMeaning: L10nService.get(
-        'dream_interpretation.defaults.deeper_meaning',
+        L10nKeys.dreamInterpretationDefaultsDeeperMeaning,
         language,
       ),
       shadowQuestion: L10nService.get(
-        'dream_interpretation.defaults.shadow_question',
+        L10nKeys.dreamInterpretationDefaultsShadowQuestion,
         language,
       ),
       integrationPath: L10nService.get(
-        'dream_interpretation.defaults.integration_path',
+        L10nKeys.dreamInterpretationDefaultsIntegrationPath,
         language,
       ),
     );
@@ -1080,19 +1080,19 @@ JSON FORMATI:
   }) {
     return LightShadowReading(
       lightMessage: L10nService.get(
-        'dream_interpretation.defaults.light_message',
+        L10nKeys.dreamInterpretationDefaultsLightMessage,
         language,
       ),
       shadowMessage: L10nService.get(
-        'dream_interpretation.defaults.shadow_message',
+        L10nKeys.dreamInterpretationDefaultsShadowMessage,
         language,
       ),
       integrationPath: L10nService.get(
-        'dream_interpretation.defaults.light_shadow_integration',
+        L10nKeys.dreamInterpretationDefaultsLightShadowIntegration,
         language,
       ),
       archetype: L10nService.get(
-        'dream_interpretation.defaults.archetype',
+        L10nKeys.dreamInterpretationDefaultsArchetype,
         language,
       ),
     );
@@ -1101,19 +1101,19 @@ JSON FORMATI:
   PracticalGuidance _defaultGuidance({AppLanguage language = AppLanguage.tr}) {
     return PracticalGuidance(
       todayAction: L10nService.get(
-        'dream_interpretation.defaults.today_action',
+        L10nKeys.dreamInterpretationDefaultsTodayAction,
         language,
       ),
       reflectionQuestion: L10nService.get(
-        'dream_interpretation.defaults.reflection_question',
+        L10nKeys.dreamInterpretationDefaultsReflectionQuestion,
         language,
       ),
       weeklyFocus: L10nService.get(
-        'dream_interpretation.defaults.weekly_focus',
+        L10nKeys.dreamInterpretationDefaultsWeeklyFocus,
         language,
       ),
       avoidance: L10nService.get(
-        'dream_interpretation.defaults.avoidance',
+        L10nKeys.dreamInterpretationDefaultsAvoidance,
         language,
       ),
     );
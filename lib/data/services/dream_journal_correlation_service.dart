@@ -250,17 +250,17 @@ class DreamJournalCorrelationService {
     final correlations = await getTopCorrelations(3);
 
     if (correlations.isEmpty) {
-      return L10nService.get('dream_correlation.not_enough_data', lang);
+      return L10nService.get(L10nKeys.dreamCorrelationNotEnoughData, lang);
     }
 
     final buffer = StringBuffer();
-    buffer.writeln(L10nService.get('dream_correlation.connections_header', lang));
+    buffer.writeln(L10nService.get(L10nKeys.dreamCorrelationConnectionsHeader, lang));
 
     for (final c in correlations) {
       final deltaStr = c.delta.abs().toStringAsFixed(1);
       final direction = c.direction.label(lang);
       buffer.writeln(
-        L10nService.getWithParams('dream_correlation.connection_item', lang, params: {
+        L10nService.getWithParams(L10nKeys.dreamCorrelationConnectionItem, lang, params: {
           'theme': c.theme,
           'direction': direction,
           'before': c.avgMoodBefore.toStringAsFixed(1),
@@ -271,7 +271,7 @@ class DreamJournalCorrelationService {
       );
     }
 
-    buffer.write(L10nService.get('dream_correlation.patterns_note', lang));
+    buffer.write(L10nService.get(L10nKeys.dreamCorrelationPatternsNote, lang));
 
     return buffer.toString().trim();
   }
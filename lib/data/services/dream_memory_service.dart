@@ -257,11 +257,11 @@ class DreamMemoryService {
         return PatternAlert(
           type: PatternAlertType.recurringSymbol,
           title: L10nService.get(
-            'dreams.alerts.recurring_symbol_title',
+            L10nKeys.dreamsAlertsRecurringSymbolTitle,
             language,
           ),
           message: L10nService.getWithParams(
-            'dreams.alerts.recurring_symbol_message',
+            L10nKeys.dreamsAlertsRecurringSymbolMessage,
             language,
             params: {'emoji': _getSymbolEmoji(symbol), 'symbol': symbol},
           ),
@@ -275,8 +275,8 @@ class DreamMemoryService {
     if (memory.milestones.currentStreak == 7) {
       return PatternAlert(
         type: PatternAlertType.streakMilestone,
-        title: L10nService.get('dreams.alerts.streak_7_title', language),
-        message: L10nService.get('dreams.alerts.streak_7_message', language),
+        title: L10nService.get(L10nKeys.dreamsAlertsStreak7Title, language),
+        message: L10nService.get(L10nKeys.dreamsAlertsStreak7Message, language),
         count: 7,
       );
     }
@@ -285,8 +285,8 @@ class DreamMemoryService {
     if (memory.milestones.dreamCount == 10) {
       return PatternAlert(
         type: PatternAlertType.dreamMilestone,
-        title: L10nService.get('dreams.alerts.dream_10_title', language),
-        message: L10nService.get('dreams.alerts.dream_10_message', language),
+        title: L10nService.get(L10nKeys.dreamsAlertsDream10Title, language),
+        message: L10nService.get(L10nKeys.dreamsAlertsDream10Message, language),
         count: 10,
       );
     }
@@ -71,29 +71,29 @@ class ExportService {
     final buffer = StringBuffer();
     buffer.writeln(
       L10nService.get(
-          'data.services.export.innercycles_journal_export', language),
+          L10nKeys.dataServicesExportInnercyclesJournalExport, language),
     );
     buffer.writeln('=' * 40);
     buffer.writeln(
-      '${L10nService.get('data.services.export.exported', language)}: ${DateTime.now().toString().substring(0, 10)}',
+      '${L10nService.get(L10nKeys.dataServicesExportExported, language)}: ${DateTime.now().toString().substring(0, 10)}',
     );
     buffer.writeln(
-        '${L10nService.get('data.services.export.entries', language)}: ${entries.length}');
+        '${L10nService.get(L10nKeys.dataServicesExportEntries, language)}: ${entries.length}');
     buffer.writeln('=' * 40);
     buffer.writeln();
 
     for (final entry in entries) {
       buffer.writeln(
-          '${L10nService.get('data.services.export.date', language)}: ${entry.dateKey}');
+          '${L10nService.get(L10nKeys.dataServicesExportDate, language)}: ${entry.dateKey}');
       buffer.writeln(
-        '${L10nService.get('data.services.export.focus', language)}: ${entry.focusArea.localizedName(language)}',
+        '${L10nService.get(L10nKeys.dataServicesExportFocus, language)}: ${entry.focusArea.localizedName(language)}',
       );
       buffer.writeln(
-        '${L10nService.get('data.services.export.rating', language)}: ${entry.overallRating}/5',
+        '${L10nService.get(L10nKeys.dataServicesExportRating, language)}: ${entry.overallRating}/5',
       );
       if (entry.note != null && entry.note!.isNotEmpty) {
         buffer.writeln(
-            '${L10nService.get('data.services.export.note', language)}: ${entry.note}');
+            '${L10nService.get(L10nKeys.dataServicesExportNote, language)}: ${entry.note}');
       }
       buffer.writeln('-' * 30);
     }
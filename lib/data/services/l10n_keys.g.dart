@@ -0,0 +1,7097 @@
+// GENERATED by scripts/gen_l10n_keys.py from assets/l10n/en.json.
+// Do not edit; rerun the script (the migrate scripts do it for you).
+
+/// Compile-time keys for L10nService, one per catalog entry.
+abstract final class L10nKeys {
+  static const adminAddNotesHint = 'admin.add_notes_hint';
+  static const adminAdminNotes = 'admin.admin_notes';
+  static const adminAvgSession = 'admin.avg_session';
+  static const adminCacheCleared = 'admin.cache_cleared';
+  static const adminCancel = 'admin.cancel';
+  static const adminClearCache = 'admin.clear_cache';
+  static const adminCount = 'admin.count';
+  static const adminD1Return = 'admin.d1_return';
+  static const adminD7Return = 'admin.d7_return';
+  static const adminDashboardTitle = 'admin.dashboard_title';
+  static const adminDaysAgo = 'admin.days_ago';
+  static const adminEvent = 'admin.event';
+  static const adminEventLog = 'admin.event_log';
+  static const adminEvents = 'admin.events';
+  static const adminExportComingSoon = 'admin.export_coming_soon';
+  static const adminExportData = 'admin.export_data';
+  static const adminGrowth = 'admin.growth';
+  static const adminGrowthTasks = 'admin.growth_tasks';
+  static const adminHoursAgo = 'admin.hours_ago';
+  static const adminJustNow = 'admin.just_now';
+  static const adminKeyMetrics = 'admin.key_metrics';
+  static const adminLastFired = 'admin.last_fired';
+  static const adminLogout = 'admin.logout';
+  static const adminLogoutConfirm = 'admin.logout_confirm';
+  static const adminMinutesAgo = 'admin.minutes_ago';
+  static const adminNoDataAvailable = 'admin.no_data_available';
+  static const adminNoSnapshotsYet = 'admin.no_snapshots_yet';
+  static const adminNoteSaved = 'admin.note_saved';
+  static const adminNotes = 'admin.notes';
+  static const adminOverview = 'admin.overview';
+  static const adminQuickActions = 'admin.quick_actions';
+  static const adminRecoCtr = 'admin.reco_ctr';
+  static const adminRefreshData = 'admin.refresh_data';
+  static const adminRetentionOverTime = 'admin.retention_over_time';
+  static const adminRetentionTrends = 'admin.retention_trends';
+  static const adminSaveNote = 'admin.save_note';
+  static const adminSendTestPush = 'admin.send_test_push';
+  static const adminSessionExpires = 'admin.session_expires';
+  static const adminSnapshots = 'admin.snapshots';
+  static const adminTestPushSent = 'admin.test_push_sent';
+  static const adminToolUsageDistribution = 'admin.tool_usage_distribution';
+  static const adminUsageOverview = 'admin.usage_overview';
+  static const adminViewLogs = 'admin.view_logs';
+  static const adsFailedToLoad = 'ads.failed_to_load';
+  static const adsGoPremium = 'ads.go_premium';
+  static const adsNotAvailable = 'ads.not_available';
+  static const adsWatchAd = 'ads.watch_ad';
+  static const affirmationAffirmationLibraryAddToFavorites =
+      'affirmation.affirmation_library.add_to_favorites';
+  static const affirmationAffirmationLibraryAffirmationCopied =
+      'affirmation.affirmation_library.affirmation_copied';
+  static const affirmationAffirmationLibraryAffirmations =
+      'affirmation.affirmation_library.affirmations';
+  static const affirmationAffirmationLibraryAll =
+      'affirmation.affirmation_library.all';
+  static const affirmationAffirmationLibraryFavorites =
+      'affirmation.affirmation_library.favorites';
+  static const affirmationAffirmationLibraryNoFavoritesYet =
+      'affirmation.affirmation_library.no_favorites_yet';
+  static const affirmationAffirmationLibraryRemoveFromFavorites =
+      'affirmation.affirmation_library.remove_from_favorites';
+  static const affirmationAffirmationLibraryRetry =
+      'affirmation.affirmation_library.retry';
+  static const affirmationLibraryFilterLabel =
+      'affirmation.library.filter_label';
+  static const affirmationTodaysAffirmation = 'affirmation.todays_affirmation';
+  static const analysisArchetypeAnalysis = 'analysis.archetype_analysis';
+  static const analysisDiscoveryAnalysis = 'analysis.discovery_analysis';
+  static const analysisEnterBirthInfoDiscovery =
+      'analysis.enter_birth_info_discovery';
+  static const analysisEnterBirthInfoWellness =
+      'analysis.enter_birth_info_wellness';
+  static const analysisEnterBirthInfoWisdom =
+      'analysis.enter_birth_info_wisdom';
+  static const analysisWellnessAnalysis = 'analysis.wellness_analysis';
+  static const analysisWisdomAnalysis = 'analysis.wisdom_analysis';
+  static const appLoadingText = 'app.loading_text';
+  static const appName = 'app.name';
+  static const appTagline = 'app.tagline';
+  static const appLockAppLockDelete = 'app_lock.app_lock.delete';
+  static const appLockAppLockEnterPin = 'app_lock.app_lock.enter_pin';
+  static const appLockAppLockIncorrectPin = 'app_lock.app_lock.incorrect_pin';
+  static const appLockAppLockUnlockInnercycles =
+      'app_lock.app_lock.unlock_innercycles';
+  static const appLockAppLockUnlockWithBiometrics =
+      'app_lock.app_lock.unlock_with_biometrics';
+  static const archetypeAchiever = 'archetype.achiever';
+  static const archetypeAlignmentPct = 'archetype.alignment_pct';
+  static const archetypeAnalyst = 'archetype.analyst';
+  static const archetypeArchetypeAddAtLeast3EntriesToSurfaceYourD =
+      'archetype.archetype.add_at_least_3_entries_to_surface_your_d';
+  static const archetypeArchetypeCouldNotLoadYourLocalDataIsUnaffe =
+      'archetype.archetype.could_not_load_your_local_data_is_unaffe';
+  static const archetypeArchetypeCouldNotLoadYourLocalDataIsUnaffe1 =
+      'archetype.archetype.could_not_load_your_local_data_is_unaffe_1';
+  static const archetypeArchetypeEvolutionTimeline =
+      'archetype.archetype.evolution_timeline';
+  static const archetypeArchetypeFullArchetypeBreakdown =
+      'archetype.archetype.full_archetype_breakdown';
+  static const archetypeArchetypeGrowthInsight =
+      'archetype.archetype.growth_insight';
+  static const archetypeArchetypeRetry = 'archetype.archetype.retry';
+  static const archetypeArchetypeRetry1 = 'archetype.archetype.retry_1';
+  static const archetypeArchetypeShadowSide = 'archetype.archetype.shadow_side';
+  static const archetypeArchetypeShareYourArchetype =
+      'archetype.archetype.share_your_archetype';
+  static const archetypeArchetypeStrengths = 'archetype.archetype.strengths';
+  static const archetypeArchetypeWriteFirstEntry =
+      'archetype.archetype.write_first_entry';
+  static const archetypeArchetypeYourArchetype =
+      'archetype.archetype.your_archetype';
+  static const archetypeArchetypeYourArchetypeIsWaitingToEmerge =
+      'archetype.archetype.your_archetype_is_waiting_to_emerge';
+  static const archetypeBuilder = 'archetype.builder';
+  static const archetypeCommunicator = 'archetype.communicator';
+  static const archetypeDreamer = 'archetype.dreamer';
+  static const archetypeExplorer = 'archetype.explorer';
+  static const archetypeHarmonizer = 'archetype.harmonizer';
+  static const archetypeNurturer = 'archetype.nurturer';
+  static const archetypePerformer = 'archetype.performer';
+  static const archetypePioneer = 'archetype.pioneer';
+  static const archetypeTransformer = 'archetype.transformer';
+  static const archetypeVisionary = 'archetype.visionary';
+  static const authAlreadyHaveAccount = 'auth.already_have_account';
+  static const authAppleConnectionFailed = 'auth.apple_connection_failed';
+  static const authAppleErrorFailed = 'auth.apple_error_failed';
+  static const authAppleErrorInvalidResponse =
+      'auth.apple_error_invalid_response';
+  static const authAppleErrorNetwork = 'auth.apple_error_network';
+  static const authAppleErrorNotAvailable = 'auth.apple_error_not_available';
+  static const authAppleErrorNotHandled = 'auth.apple_error_not_handled';
+  static const authAppleErrorNotInteractive =
+      'auth.apple_error_not_interactive';
+  static const authAppleErrorServer = 'auth.apple_error_server';
+  static const authAppleErrorTimeout = 'auth.apple_error_timeout';
+  static const authAppleErrorTokenFailed = 'auth.apple_error_token_failed';
+  static const authAppleErrorUnknown = 'auth.apple_error_unknown';
+  static const authAppleSignInFailed = 'auth.apple_sign_in_failed';
+  static const authContinueWithApple = 'auth.continue_with_apple';
+  static const authContinueWithEmail = 'auth.continue_with_email';
+  static const authCreateAccount = 'auth.create_account';
+  static const authEmail = 'auth.email';
+  static const authEmailInvalid = 'auth.email_invalid';
+  static const authEmailRequired = 'auth.email_required';
+  static const authEnterEmail = 'auth.enter_email';
+  static const authForgotPassword = 'auth.forgot_password';
+  static const authName = 'auth.name';
+  static const authNameRequired = 'auth.name_required';
+  static const authNoAccount = 'auth.no_account';
+  static const authPassword = 'auth.password';
+  static const authPasswordMinLength = 'auth.password_min_length';
+  static const authPasswordRequired = 'auth.password_required';
+  static const authPasswordResetSent = 'auth.password_reset_sent';
+  static const authRegisterSuccess = 'auth.register_success';
+  static const authRegistrationSuccess = 'auth.registration_success';
+  static const authResetEmailSent = 'auth.reset_email_sent';
+  static const authSignIn = 'auth.sign_in';
+  static const authSignUp = 'auth.sign_up';
+  static const authSkipForNow = 'auth.skip_for_now';
+  static const authStartCosmicJourney = 'auth.start_cosmic_journey';
+  static const authUnknownError = 'auth.unknown_error';
+  static const birthdaysBirthdayAddAddBirthday =
+      'birthdays.birthday_add.add_birthday';
+  static const birthdaysBirthdayAddBirthday = 'birthdays.birthday_add.birthday';
+  static const birthdaysBirthdayAddBirthdayNotification =
+      'birthdays.birthday_add.birthday_notification';
+  static const birthdaysBirthdayAddCancel = 'birthdays.birthday_add.cancel';
+  static const birthdaysBirthdayAddChangePhoto =
+      'birthdays.birthday_add.change_photo';
+  static const birthdaysBirthdayAddCouldntSaveThisContactPleaseTryAga =
+      'birthdays.birthday_add.couldnt_save_this_contact_please_try_aga';
+  static const birthdaysBirthdayAddDayBeforeReminder =
+      'birthdays.birthday_add.day_before_reminder';
+  static const birthdaysBirthdayAddDiscard = 'birthdays.birthday_add.discard';
+  static const birthdaysBirthdayAddDiscardChanges =
+      'birthdays.birthday_add.discard_changes';
+  static const birthdaysBirthdayAddEditBirthday =
+      'birthdays.birthday_add.edit_birthday';
+  static const birthdaysBirthdayAddFriendsName =
+      'birthdays.birthday_add.friends_name';
+  static const birthdaysBirthdayAddGiftIdeasMemories =
+      'birthdays.birthday_add.gift_ideas_memories';
+  static const birthdaysBirthdayAddName = 'birthdays.birthday_add.name';
+  static const birthdaysBirthdayAddNameRequired =
+      'birthdays.birthday_add.name_required';
+  static const birthdaysBirthdayAddNotSpecified =
+      'birthdays.birthday_add.not_specified';
+  static const birthdaysBirthdayAddNoteOptional =
+      'birthdays.birthday_add.note_optional';
+  static const birthdaysBirthdayAddRelationship =
+      'birthdays.birthday_add.relationship';
+  static const birthdaysBirthdayAddReminders =
+      'birthdays.birthday_add.reminders';
+  static const birthdaysBirthdayAddSaveContact =
+      'birthdays.birthday_add.save_contact';
+  static const birthdaysBirthdayAddTapToChangePhoto =
+      'birthdays.birthday_add.tap_to_change_photo';
+  static const birthdaysBirthdayAddUpdateContact =
+      'birthdays.birthday_add.update_contact';
+  static const birthdaysBirthdayAddYearOptional =
+      'birthdays.birthday_add.year_optional';
+  static const birthdaysBirthdayAddYouHaveUnsavedChangesAreYouSureYo =
+      'birthdays.birthday_add.you_have_unsaved_changes_are_you_sure_yo';
+  static const birthdaysBirthdayAgendaAddBirthday =
+      'birthdays.birthday_agenda.add_birthday';
+  static const birthdaysBirthdayAgendaAddManually =
+      'birthdays.birthday_agenda.add_manually';
+  static const birthdaysBirthdayAgendaAddYourFriendsAndFamilyToGetRemin =
+      'birthdays.birthday_agenda.add_your_friends_and_family_to_get_remin';
+  static const birthdaysBirthdayAgendaBirthdayAgenda =
+      'birthdays.birthday_agenda.birthday_agenda';
+  static const birthdaysBirthdayAgendaCouldntLoadYourBirthdays =
+      'birthdays.birthday_agenda.couldnt_load_your_birthdays';
+  static const birthdaysBirthdayAgendaDays = 'birthdays.birthday_agenda.days';
+  static const birthdaysBirthdayAgendaImportFromFacebook =
+      'birthdays.birthday_agenda.import_from_facebook';
+  static const birthdaysBirthdayAgendaNeverMissABirthday =
+      'birthdays.birthday_agenda.never_miss_a_birthday';
+  static const birthdaysBirthdayAgendaNextMonth =
+      'birthdays.birthday_agenda.next_month';
+  static const birthdaysBirthdayAgendaNoBirthdaysOnThisDay =
+      'birthdays.birthday_agenda.no_birthdays_on_this_day';
+  static const birthdaysBirthdayAgendaPreviousMonth =
+      'birthdays.birthday_agenda.previous_month';
+  static const birthdaysBirthdayAgendaRetry = 'birthdays.birthday_agenda.retry';
+  static const birthdaysBirthdayAgendaTapForToday =
+      'birthdays.birthday_agenda.tap_for_today';
+  static const birthdaysBirthdayAgendaToday = 'birthdays.birthday_agenda.today';
+  static const birthdaysBirthdayAgendaTodaysBirthdays =
+      'birthdays.birthday_agenda.todays_birthdays';
+  static const birthdaysBirthdayAgendaUpcomingBirthdays =
+      'birthdays.birthday_agenda.upcoming_birthdays';
+  static const birthdaysBirthdayDetailBirthdayNoteCopied =
+      'birthdays.birthday_detail.birthday_note_copied';
+  static const birthdaysBirthdayDetailBirthdayNotification =
+      'birthdays.birthday_detail.birthday_notification';
+  static const birthdaysBirthdayDetailCancel =
+      'birthdays.birthday_detail.cancel';
+  static const birthdaysBirthdayDetailContactNotFound =
+      'birthdays.birthday_detail.contact_not_found';
+  static const birthdaysBirthdayDetailCouldntDeleteThisContactPleaseTryA =
+      'birthdays.birthday_detail.couldnt_delete_this_contact_please_try_a';
+  static const birthdaysBirthdayDetailCouldntLoadThisContact =
+      'birthdays.birthday_detail.couldnt_load_this_contact';
+  static const birthdaysBirthdayDetailDayBefore =
+      'birthdays.birthday_detail.day_before';
+  static const birthdaysBirthdayDetailDaysLeft =
+      'birthdays.birthday_detail.days_left';
+  static const birthdaysBirthdayDetailDelete =
+      'birthdays.birthday_detail.delete';
+  static const birthdaysBirthdayDetailDeleteContact =
+      'birthdays.birthday_detail.delete_contact';
+  static const birthdaysBirthdayDetailDeleteContact1 =
+      'birthdays.birthday_detail.delete_contact_1';
+  static const birthdaysBirthdayDetailEditBirthday =
+      'birthdays.birthday_detail.edit_birthday';
+  static const birthdaysBirthdayDetailHappyBirthday =
+      'birthdays.birthday_detail.happy_birthday';
+  static const birthdaysBirthdayDetailLongPressToCopyNote =
+      'birthdays.birthday_detail.long_press_to_copy_note';
+  static const birthdaysBirthdayDetailNote = 'birthdays.birthday_detail.note';
+  static const birthdaysBirthdayDetailReminders =
+      'birthdays.birthday_detail.reminders';
+  static const birthdaysBirthdayDetailRetry = 'birthdays.birthday_detail.retry';
+  static const birthdaysBirthdayDetailShareBirthday =
+      'birthdays.birthday_detail.share_birthday';
+  static const birthdaysBirthdayImportBirthdayImportFailedPleaseCheckYour =
+      'birthdays.birthday_import.birthday_import_failed_please_check_your';
+  static const birthdaysBirthdayImportCouldntReadThisFileMakeSureItsAV =
+      'birthdays.birthday_import.couldnt_read_this_file_make_sure_its_a_v';
+  static const birthdaysBirthdayImportDeselectAll =
+      'birthdays.birthday_import.deselect_all';
+  static const birthdaysBirthdayImportHowToExportFromFacebook =
+      'birthdays.birthday_import.how_to_export_from_facebook';
+  static const birthdaysBirthdayImportImportBirthdays =
+      'birthdays.birthday_import.import_birthdays';
+  static const birthdaysBirthdayImportImportComplete =
+      'birthdays.birthday_import.import_complete';
+  static const birthdaysBirthdayImportNoBirthdaysFoundInThisFileTryADi =
+      'birthdays.birthday_import.no_birthdays_found_in_this_file_try_a_di';
+  static const birthdaysBirthdayImportSelectAll =
+      'birthdays.birthday_import.select_all';
+  static const birthdaysBirthdayImportSelectJsonFile =
+      'birthdays.birthday_import.select_json_file';
+  static const birthdaysBirthdayImportViewBirthdays =
+      'birthdays.birthday_import.view_birthdays';
+  static const blindSpotBlindSpotALittleMoreJournalingToGo =
+      'blind_spot.blind_spot.a_little_more_journaling_to_go';
+  static const blindSpotBlindSpotBlindSpots =
+      'blind_spot.blind_spot.blind_spots';
+  static const blindSpotBlindSpotCouldNotLoadYourLocalDataIsUnaffe =
+      'blind_spot.blind_spot.could_not_load_your_local_data_is_unaffe';
+  static const blindSpotBlindSpotCouldNotLoadYourLocalDataIsUnaffe1 =
+      'blind_spot.blind_spot.could_not_load_your_local_data_is_unaffe_1';
+  static const blindSpotBlindSpotGrowthSuggestions =
+      'blind_spot.blind_spot.growth_suggestions';
+  static const blindSpotBlindSpotNoBlindSpotsDetectedAtThisTimeKee =
+      'blind_spot.blind_spot.no_blind_spots_detected_at_this_time_kee';
+  static const blindSpotBlindSpotNotable = 'blind_spot.blind_spot.notable';
+  static const blindSpotBlindSpotRetry = 'blind_spot.blind_spot.retry';
+  static const blindSpotBlindSpotRetry1 = 'blind_spot.blind_spot.retry_1';
+  static const blindSpotBlindSpotShareYourInsights =
+      'blind_spot.blind_spot.share_your_insights';
+  static const blindSpotBlindSpotSignificant =
+      'blind_spot.blind_spot.significant';
+  static const blindSpotBlindSpotSubtle = 'blind_spot.blind_spot.subtle';
+  static const blindSpotBlindSpotWhatYourJournalReveals =
+      'blind_spot.blind_spot.what_your_journal_reveals';
+  static const blindSpotBlindSpotYourOverview =
+      'blind_spot.blind_spot.your_overview';
+  static const blindSpotEntryCountProgress = 'blind_spot.entry_count_progress';
+  static const breathingBreathingTimerBreathingCircleTapStartToBegin =
+      'breathing.breathing_timer.breathing_circle_tap_start_to_begin';
+  static const breathingBreathingTimerGuidedBreathwork =
+      'breathing.breathing_timer.guided_breathwork';
+  static const breathingBreathingTimerShareSession =
+      'breathing.breathing_timer.share_session';
+  static const breathingBreathingTimerStartBreathing =
+      'breathing.breathing_timer.start_breathing';
+  static const breathingBreathingTimerStop = 'breathing.breathing_timer.stop';
+  static const calendarCalendarHeatmapHasEntry =
+      'calendar.calendar_heatmap._has_entry';
+  static const calendarCalendarHeatmapLifeEvent =
+      'calendar.calendar_heatmap._life_event';
+  static const calendarCalendarHeatmapAddLifeEvent =
+      'calendar.calendar_heatmap.add_life_event';
+  static const calendarCalendarHeatmapChallenging =
+      'calendar.calendar_heatmap.challenging';
+  static const calendarCalendarHeatmapHeatmapTimeline =
+      'calendar.calendar_heatmap.heatmap_timeline';
+  static const calendarCalendarHeatmapJournal =
+      'calendar.calendar_heatmap.journal';
+  static const calendarCalendarHeatmapLess = 'calendar.calendar_heatmap.less';
+  static const calendarCalendarHeatmapLogThisDay =
+      'calendar.calendar_heatmap.log_this_day';
+  static const calendarCalendarHeatmapMore = 'calendar.calendar_heatmap.more';
+  static const calendarCalendarHeatmapNextMonth =
+      'calendar.calendar_heatmap.next_month';
+  static const calendarCalendarHeatmapOverview =
+      'calendar.calendar_heatmap.overview';
+  static const calendarCalendarHeatmapPositive =
+      'calendar.calendar_heatmap.positive';
+  static const calendarCalendarHeatmapPreviousMonth =
+      'calendar.calendar_heatmap.previous_month';
+  static const calendarCalendarHeatmapRetry = 'calendar.calendar_heatmap.retry';
+  static const calendarCalendarHeatmapSeeYourFullYearAtAGlanceWithPro =
+      'calendar.calendar_heatmap.see_your_full_year_at_a_glance_with_pro';
+  static const calendarCalendarHeatmapStreak =
+      'calendar.calendar_heatmap.streak';
+  static const calendarCalendarHeatmapThisMonth =
+      'calendar.calendar_heatmap.this_month';
+  static const calendarCalendarHeatmapTotal = 'calendar.calendar_heatmap.total';
+  static const calendarCalendarHeatmapUpgradeToPro =
+      'calendar.calendar_heatmap.upgrade_to_pro';
+  static const calendarCalendarHeatmapViewEntry =
+      'calendar.calendar_heatmap.view_entry';
+  static const calendarCalendarHeatmapYearHeatmap =
+      'calendar.calendar_heatmap.year_heatmap';
+  static const categoriesCareer = 'categories.career';
+  static const categoriesCommunication = 'categories.communication';
+  static const categoriesFinance = 'categories.finance';
+  static const categoriesFriendship = 'categories.friendship';
+  static const categoriesHealth = 'categories.health';
+  static const categoriesLove = 'categories.love';
+  static const categoriesTrust = 'categories.trust';
+  static const challengesChallengeHubActive = 'challenges.challenge_hub.active';
+  static const challengesChallengeHubActiveChallenges =
+      'challenges.challenge_hub.active_challenges';
+  static const challengesChallengeHubAvailableChallenges =
+      'challenges.challenge_hub.available_challenges';
+  static const challengesChallengeHubChallenges =
+      'challenges.challenge_hub.challenges';
+  static const challengesChallengeHubCompleted =
+      'challenges.challenge_hub.completed';
+  static const challengesChallengeHubRetry = 'challenges.challenge_hub.retry';
+  static const challengesChallengeHubStart = 'challenges.challenge_hub.start';
+  static const challengesChallengeHubTotal = 'challenges.challenge_hub.total';
+  static const challengesChallengeListActive =
+      'challenges.challenge_list.active';
+  static const challengesChallengeListAvailable =
+      'challenges.challenge_list.available';
+  static const challengesChallengeListCompleted =
+      'challenges.challenge_list.completed';
+  static const challengesChallengeListCompleted1 =
+      'challenges.challenge_list.completed_1';
+  static const challengesChallengeListGrowthChallenges =
+      'challenges.challenge_list.growth_challenges';
+  static const challengesChallengeListInProgress =
+      'challenges.challenge_list.in_progress';
+  static const challengesChallengeListIncrementProgress =
+      'challenges.challenge_list.increment_progress';
+  static const challengesChallengeListRetry = 'challenges.challenge_list.retry';
+  static const challengesChallengeListStart = 'challenges.challenge_list.start';
+  static const challengesChallengeListStartChallenge =
+      'challenges.challenge_list.start_challenge';
+  static const challengesChallengeListTotal = 'challenges.challenge_list.total';
+  static const chartBirthDate = 'chart.birth_date';
+  static const colorsBlue = 'colors.blue';
+  static const colorsBrown = 'colors.brown';
+  static const colorsGreen = 'colors.green';
+  static const colorsGrey = 'colors.grey';
+  static const colorsOrange = 'colors.orange';
+  static const colorsPink = 'colors.pink';
+  static const colorsPurple = 'colors.purple';
+  static const colorsRed = 'colors.red';
+  static const colorsSeaBlue = 'colors.sea_blue';
+  static const colorsTurquoise = 'colors.turquoise';
+  static const colorsWhite = 'colors.white';
+  static const colorsYellow = 'colors.yellow';
+  static const commonAccessibilityHidden = 'common.accessibility.hidden';
+  static const commonAccessibilityVisible = 'common.accessibility.visible';
+  static const commonAll = 'common.all';
+  static const commonAllFeatures = 'common.all_features';
+  static const commonAlsoDiscover = 'common.also_discover';
+  static const commonAnd = 'common.and';
+  static const commonBack = 'common.back';
+  static const commonBirthDate = 'common.birth_date';
+  static const commonBirthPlace = 'common.birth_place';
+  static const commonCancel = 'common.cancel';
+  static const commonClose = 'common.close';
+  static const commonComingSoon = 'common.coming_soon';
+  static const commonContinue = 'common.continue';
+  static const commonContinueExploring = 'common.continue_exploring';
+  static const commonCopied = 'common.copied';
+  static const commonCopy = 'common.copy';
+  static const commonCouldNotShareTryAgain = 'common.could_not_share_try_again';
+  static const commonDateDayFri = 'common.date.day_fri';
+  static const commonDateDayMon = 'common.date.day_mon';
+  static const commonDateDaySat = 'common.date.day_sat';
+  static const commonDateDaySun = 'common.date.day_sun';
+  static const commonDateDayThu = 'common.date.day_thu';
+  static const commonDateDayTue = 'common.date.day_tue';
+  static const commonDateDayWed = 'common.date.day_wed';
+  static const commonDateFormatEn = 'common.date.format_en';
+  static const commonDateFormatMdy = 'common.date_format.mdy';
+  static const commonDelete = 'common.delete';
+  static const commonDiscover = 'common.discover';
+  static const commonDismiss = 'common.dismiss';
+  static const commonDone = 'common.done';
+  static const commonEdit = 'common.edit';
+  static const commonError = 'common.error';
+  static const commonErrorLoading = 'common.error_loading';
+  static const commonErrorLoadingProgram = 'common.error_loading_program';
+  static const commonExplore = 'common.explore';
+  static const commonExploreMore = 'common.explore_more';
+  static const commonGoBack = 'common.go_back';
+  static const commonGrantPermission = 'common.grant_permission';
+  static const commonHello = 'common.hello';
+  static const commonHome = 'common.home';
+  static const commonInfo = 'common.info';
+  static const commonLoading = 'common.loading';
+  static const commonMinutesShort = 'common.minutes_short';
+  static const commonName = 'common.name';
+  static const commonNext = 'common.next';
+  static const commonNo = 'common.no';
+  static const commonNoEntriesYet = 'common.no_entries_yet';
+  static const commonNotSpecified = 'common.not_specified';
+  static const commonNotifications = 'common.notifications';
+  static const commonOk = 'common.ok';
+  static const commonOpenInstagram = 'common.open_instagram';
+  static const commonOr = 'common.or';
+  static const commonPermissionRequired = 'common.permission_required';
+  static const commonProfileInfo = 'common.profile_info';
+  static const commonReadMore = 'common.read_more';
+  static const commonReset = 'common.reset';
+  static const commonResults = 'common.results';
+  static const commonSave = 'common.save';
+  static const commonSaving = 'common.saving';
+  static const commonSearch = 'common.search';
+  static const commonSelect = 'common.select';
+  static const commonSelected = 'common.selected';
+  static const commonShare = 'common.share';
+  static const commonSharing = 'common.sharing';
+  static const commonShowAll = 'common.show_all';
+  static const commonSomethingWentWrong = 'common.something_went_wrong';
+  static const commonStartJourney = 'common.start_journey';
+  static const commonSuccess = 'common.success';
+  static const commonTextCopied = 'common.text_copied';
+  static const commonTimeDaysShort = 'common.time.days_short';
+  static const commonTimeHoursShort = 'common.time.hours_short';
+  static const commonTimeInDays = 'common.time.in_days';
+  static const commonTimeInHours = 'common.time.in_hours';
+  static const commonTimeInMinutes = 'common.time.in_minutes';
+  static const commonTimeMinutesShort = 'common.time.minutes_short';
+  static const commonTryAgain = 'common.try_again';
+  static const commonUnitDaysAbbr = 'common.unit.days_abbr';
+  static const commonUnlock = 'common.unlock';
+  static const commonUpgradeToPro = 'common.upgrade_to_pro';
+  static const commonUse = 'common.use';
+  static const commonUser = 'common.user';
+  static const commonViewAll = 'common.view_all';
+  static const commonWarning = 'common.warning';
+  static const commonWeekAbbr = 'common.week_abbr';
+  static const commonYears = 'common.years';
+  static const commonYes = 'common.yes';
+  static const comparisonAdd = 'comparison.add';
+  static const comparisonAdvice = 'comparison.advice';
+  static const comparisonAllPairCompatibilities =
+      'comparison.all_pair_compatibilities';
+  static const comparisonCaution = 'comparison.caution';
+  static const comparisonCosmicHarmony = 'comparison.cosmic_harmony';
+  static const comparisonGroupHarmony = 'comparison.group_harmony';
+  static const comparisonMostCompatible = 'comparison.most_compatible';
+  static const comparisonNoProfilesYet = 'comparison.no_profiles_yet';
+  static const comparisonSelect = 'comparison.select';
+  static const comparisonSelectProfile = 'comparison.select_profile';
+  static const comparisonStrengths = 'comparison.strengths';
+  static const comparisonSubtitle = 'comparison.subtitle';
+  static const comparisonThingsToWatch = 'comparison.things_to_watch';
+  static const comparisonTitle = 'comparison.title';
+  static const comparisonUnnamed = 'comparison.unnamed';
+  static const coreConstantsCommonStringsText =
+      'core.constants.common_strings.text';
+  static const cycleSyncCycleSyncAddMoreEntriesToSurfaceCycleemotion =
+      'cycle_sync.cycle_sync.add_more_entries_to_surface_cycleemotion';
+  static const cycleSyncCycleSyncCancel = 'cycle_sync.cycle_sync.cancel';
+  static const cycleSyncCycleSyncCouldntLoadYourCycleData =
+      'cycle_sync.cycle_sync.couldnt_load_your_cycle_data';
+  static const cycleSyncCycleSyncCycleInsight =
+      'cycle_sync.cycle_sync.cycle_insight';
+  static const cycleSyncCycleSyncCycleLength =
+      'cycle_sync.cycle_sync.cycle_length';
+  static const cycleSyncCycleSyncCycleOverview =
+      'cycle_sync.cycle_sync.cycle_overview';
+  static const cycleSyncCycleSyncCycleSync = 'cycle_sync.cycle_sync.cycle_sync';
+  static const cycleSyncCycleSyncCyclesLogged =
+      'cycle_sync.cycle_sync.cycles_logged';
+  static const cycleSyncCycleSyncDay = 'cycle_sync.cycle_sync.day';
+  static const cycleSyncCycleSyncLogPeriod = 'cycle_sync.cycle_sync.log_period';
+  static const cycleSyncCycleSyncLogPeriodStart =
+      'cycle_sync.cycle_sync.log_period_start';
+  static const cycleSyncCycleSyncLogPeriodStart1 =
+      'cycle_sync.cycle_sync.log_period_start_1';
+  static const cycleSyncCycleSyncLogYourPeriodToSeeHowYourEmotiona =
+      'cycle_sync.cycle_sync.log_your_period_to_see_how_your_emotiona';
+  static const cycleSyncCycleSyncMarkTodayAsTheStartOfYourPeriod =
+      'cycle_sync.cycle_sync.mark_today_as_the_start_of_your_period';
+  static const cycleSyncCycleSyncNextPeriod =
+      'cycle_sync.cycle_sync.next_period';
+  static const cycleSyncCycleSyncPeriodLength =
+      'cycle_sync.cycle_sync.period_length';
+  static const cycleSyncCycleSyncPeriodStartedToday =
+      'cycle_sync.cycle_sync.period_started_today';
+  static const cycleSyncCycleSyncPhaseTimeline =
+      'cycle_sync.cycle_sync.phase_timeline';
+  static const cycleSyncCycleSyncRetry = 'cycle_sync.cycle_sync.retry';
+  static const cycleSyncCycleSyncStartTrackingYourCycle =
+      'cycle_sync.cycle_sync.start_tracking_your_cycle';
+  static const cycleSyncCycleSyncUnlockDeeperCycleInsights =
+      'cycle_sync.cycle_sync.unlock_deeper_cycle_insights';
+  static const cycleSyncInNDays = 'cycle_sync.in_n_days';
+  static const cycleSyncOfCycleLength = 'cycle_sync.of_cycle_length';
+  static const dataContentImportantDatePresetsChallenges =
+      'data.content.important_date_presets.challenges';
+  static const dataContentImportantDatePresetsGrowth =
+      'data.content.important_date_presets.growth';
+  static const dataContentImportantDatePresetsPersonalMilestones =
+      'data.content.important_date_presets.personal_milestones';
+  static const dataContentImportantDatePresetsReflective =
+      'data.content.important_date_presets.reflective';
+  static const dataContentImportantDatePresetsRelationships =
+      'data.content.important_date_presets.relationships';
+  static const dataContentShareTemplatesASeasonForRestReflectionAndInnerR =
+      'data.content.share_templates.a_season_for_rest_reflection_and_inner_r';
+  static const dataContentShareTemplatesAcceptance =
+      'data.content.share_templates.acceptance';
+  static const dataContentShareTemplatesAcceptanceIsNotGivingUpItIsMaking =
+      'data.content.share_templates.acceptance_is_not_giving_up_it_is_making';
+  static const dataContentShareTemplatesAnotherMilestoneOfShowingUpForYour =
+      'data.content.share_templates.another_milestone_of_showing_up_for_your';
+  static const dataContentShareTemplatesBasedOnRecurringDreamThemes =
+      'data.content.share_templates.based_on_recurring_dream_themes';
+  static const dataContentShareTemplatesBasedOnYourRecentJournalEntries =
+      'data.content.share_templates.based_on_your_recent_journal_entries';
+  static const dataContentShareTemplatesCalm =
+      'data.content.share_templates.calm';
+  static const dataContentShareTemplatesChallenge =
+      'data.content.share_templates.challenge';
+  static const dataContentShareTemplatesCompleted =
+      'data.content.share_templates.completed';
+  static const dataContentShareTemplatesConsistencyBuildsSelfawareness =
+      'data.content.share_templates.consistency_builds_selfawareness';
+  static const dataContentShareTemplatesCuratedInsight =
+      'data.content.share_templates.curated_insight';
+  static const dataContentShareTemplatesCyclicalIntelligence =
+      'data.content.share_templates.cyclical_intelligence';
+  static const dataContentShareTemplatesDailyAffirmation =
+      'data.content.share_templates.daily_affirmation';
+  static const dataContentShareTemplatesDailyReflection =
+      'data.content.share_templates.daily_reflection';
+  static const dataContentShareTemplatesDayStreak =
+      'data.content.share_templates.day_streak';
+  static const dataContentShareTemplatesDays =
+      'data.content.share_templates.days';
+  static const dataContentShareTemplatesDaysThisMonth =
+      'data.content.share_templates.days_this_month';
+  static const dataContentShareTemplatesDeepProcessor =
+      'data.content.share_templates.deep_processor';
+  static const dataContentShareTemplatesDominantThisMonth =
+      'data.content.share_templates.dominant_this_month';
+  static const dataContentShareTemplatesDrawnFromYourPatterns =
+      'data.content.share_templates.drawn_from_your_patterns';
+  static const dataContentShareTemplatesDrawnFromYourSelfreflectionQuiz =
+      'data.content.share_templates.drawn_from_your_selfreflection_quiz';
+  static const dataContentShareTemplatesDreams =
+      'data.content.share_templates.dreams';
+  static const dataContentShareTemplatesEntries =
+      'data.content.share_templates.entries';
+  static const dataContentShareTemplatesEveryMomentOfStillnessIsAStepInwa =
+      'data.content.share_templates.every_moment_of_stillness_is_a_step_inwa';
+  static const dataContentShareTemplatesExpansion =
+      'data.content.share_templates.expansion';
+  static const dataContentShareTemplatesFocusAreaBalance =
+      'data.content.share_templates.focus_area_balance';
+  static const dataContentShareTemplatesFromYourDreamJournal =
+      'data.content.share_templates.from_your_dream_journal';
+  static const dataContentShareTemplatesFromYourPatterns =
+      'data.content.share_templates.from_your_patterns';
+  static const dataContentShareTemplatesGrowthOftenFeelsLikeConfusionBefore =
+      'data.content.share_templates.growth_often_feels_like_confusion_before';
+  static const dataContentShareTemplatesGrowthWisdom =
+      'data.content.share_templates.growth_wisdom';
+  static const dataContentShareTemplatesHowYourAttentionSpreadsAcrossAreas =
+      'data.content.share_templates.how_your_attention_spreads_across_areas';
+  static const dataContentShareTemplatesHowYourRestHasBeenThisWeek =
+      'data.content.share_templates.how_your_rest_has_been_this_week';
+  static const dataContentShareTemplatesITrustTheProcessOfMyOwnGrowth =
+      'data.content.share_templates.i_trust_the_process_of_my_own_growth';
+  static const dataContentShareTemplatesInnerVoice =
+      'data.content.share_templates.inner_voice';
+  static const dataContentShareTemplatesInnercycles =
+      'data.content.share_templates.innercycles';
+  static const dataContentShareTemplatesMySleepQuality =
+      'data.content.share_templates.my_sleep_quality';
+  static const dataContentShareTemplatesMyWeekInFeelings =
+      'data.content.share_templates.my_week_in_feelings';
+  static const dataContentShareTemplatesNoticingYourselfIsTheFirstActOfCh =
+      'data.content.share_templates.noticing_yourself_is_the_first_act_of_ch';
+  static const dataContentShareTemplatesPatternWisdom =
+      'data.content.share_templates.pattern_wisdom';
+  static const dataContentShareTemplatesPatterns =
+      'data.content.share_templates.patterns';
+  static const dataContentShareTemplatesPatternsDrawnFrom7dayMoodData =
+      'data.content.share_templates.patterns_drawn_from_7day_mood_data';
+  static const dataContentShareTemplatesPatternsDrawnFromYourDailyEntries =
+      'data.content.share_templates.patterns_drawn_from_your_daily_entries';
+  static const dataContentShareTemplatesPointsGained =
+      'data.content.share_templates.points_gained';
+  static const dataContentShareTemplatesPresence =
+      'data.content.share_templates.presence';
+  static const dataContentShareTemplatesQuestionOfTheDay =
+      'data.content.share_templates.question_of_the_day';
+  static const dataContentShareTemplatesReflection =
+      'data.content.share_templates.reflection';
+  static const dataContentShareTemplatesResilience =
+      'data.content.share_templates.resilience';
+  static const dataContentShareTemplatesRestInsight =
+      'data.content.share_templates.rest_insight';
+  static const dataContentShareTemplatesRestIsNotTheAbsenceOfProgressItI =
+      'data.content.share_templates.rest_is_not_the_absence_of_progress_it_i';
+  static const dataContentShareTemplatesSecureleaning =
+      'data.content.share_templates.secureleaning';
+  static const dataContentShareTemplatesSelfawareness =
+      'data.content.share_templates.selfawareness';
+  static const dataContentShareTemplatesSelfawarenessGrowsWithEachDiscovery =
+      'data.content.share_templates.selfawareness_grows_with_each_discovery';
+  static const dataContentShareTemplatesShowingUpConsistentlyForYourself =
+      'data.content.share_templates.showing_up_consistently_for_yourself';
+  static const dataContentShareTemplatesSteadyFlow =
+      'data.content.share_templates.steady_flow';
+  static const dataContentShareTemplatesThePresentMomentHoldsMoreWisdomTha =
+      'data.content.share_templates.the_present_moment_holds_more_wisdom_tha';
+  static const dataContentShareTemplatesTheReflector =
+      'data.content.share_templates.the_reflector';
+  static const dataContentShareTemplatesTheSmallestShiftsInAwarenessOftenL =
+      'data.content.share_templates.the_smallest_shifts_in_awareness_often_l';
+  static const dataContentShareTemplatesTheVoyager =
+      'data.content.share_templates.the_voyager';
+  static const dataContentShareTemplatesWhatWouldYouTellYourYoungerSelfTo =
+      'data.content.share_templates.what_would_you_tell_your_younger_self_to';
+  static const dataContentShareTemplatesWinter =
+      'data.content.share_templates.winter';
+  static const dataContentShareTemplatesYouHaveSurvivedEveryDifficultDaySo =
+      'data.content.share_templates.you_have_survived_every_difficult_day_so';
+  static const dataContentShareTemplatesYouShowedRealCommitment =
+      'data.content.share_templates.you_showed_real_commitment';
+  static const dataContentShareTemplatesYouTendToProcessFeelingsWithDepth =
+      'data.content.share_templates.you_tend_to_process_feelings_with_depth';
+  static const dataContentShareTemplatesYourDreamJournalSuggestsThisPersona =
+      'data.content.share_templates.your_dream_journal_suggests_this_persona';
+  static const dataContentShareTemplatesYourDreamWorldKeepsRevealingInsight =
+      'data.content.share_templates.your_dream_world_keeps_revealing_insight';
+  static const dataContentShareTemplatesYourDreamsMayBePointingTowardUnres =
+      'data.content.share_templates.your_dreams_may_be_pointing_toward_unres';
+  static const dataContentShareTemplatesYourEntriesSuggestThisArchetypePatt =
+      'data.content.share_templates.your_entries_suggest_this_archetype_patt';
+  static const dataContentShareTemplatesYourEntriesSuggestThisAttachmentPat =
+      'data.content.share_templates.your_entries_suggest_this_attachment_pat';
+  static const dataContentShareTemplatesYourEntriesSuggestThisEnergyRhythm =
+      'data.content.share_templates.your_entries_suggest_this_energy_rhythm';
+  static const dataContentShareTemplatesYourEntriesSuggestYouTendToFindCl =
+      'data.content.share_templates.your_entries_suggest_you_tend_to_find_cl';
+  static const dataContentShareTemplatesYourGrowthScoreHasBeenRisingSteadi =
+      'data.content.share_templates.your_growth_score_has_been_rising_steadi';
+  static const dataContentShareTemplatesYourInnerVoiceGetsClearerWhenYouG =
+      'data.content.share_templates.your_inner_voice_gets_clearer_when_you_g';
+  static const dataContentShareTemplatesYourMostFrequentEmotionThisMonth =
+      'data.content.share_templates.your_most_frequent_emotion_this_month';
+  static const dataContentShareTemplatesYourPatternsAreNotYourLimitsTheyA =
+      'data.content.share_templates.your_patterns_are_not_your_limits_they_a';
+  static const dataContentShareTemplatesYourQuietestWeeksOftenHoldYourDeep =
+      'data.content.share_templates.your_quietest_weeks_often_hold_your_deep';
+  static const dataContentShareTemplatesYourRecentEntriesSuggestAPeriodOf =
+      'data.content.share_templates.your_recent_entries_suggest_a_period_of';
+  static const dataModelsPersonalityArchetypeAir =
+      'data.models.personality_archetype.air';
+  static const dataModelsPersonalityArchetypeEarth =
+      'data.models.personality_archetype.earth';
+  static const dataModelsPersonalityArchetypeFire =
+      'data.models.personality_archetype.fire';
+  static const dataModelsPersonalityArchetypeWater =
+      'data.models.personality_archetype.water';
+  static const dataModelsShareModelsAchievements =
+      'data.models.share_models.achievements';
+  static const dataModelsShareModelsIdentity =
+      'data.models.share_models.identity';
+  static const dataModelsShareModelsPatterns =
+      'data.models.share_models.patterns';
+  static const dataModelsShareModelsReflection =
+      'data.models.share_models.reflection';
+  static const dataModelsShareModelsWisdom = 'data.models.share_models.wisdom';
+  static const dataModelsWrappedDataRising = 'data.models.wrapped_data.rising';
+  static const dataModelsWrappedDataSteady = 'data.models.wrapped_data.steady';
+  static const dataModelsWrappedDataTransforming =
+      'data.models.wrapped_data.transforming';
+  static const dataModelsWrappedDataYouMaintainedAGroundedStableEmotion =
+      'data.models.wrapped_data.you_maintained_a_grounded_stable_emotion';
+  static const dataModelsWrappedDataYourEmotionalLandscapeHasBeenShifti =
+      'data.models.wrapped_data.your_emotional_landscape_has_been_shifti';
+  static const dataModelsWrappedDataYourEmotionalTrajectoryHasBeenClimb =
+      'data.models.wrapped_data.your_emotional_trajectory_has_been_climb';
+  static const dataServicesExportDate = 'data.services.export.date';
+  static const dataServicesExportEntries = 'data.services.export.entries';
+  static const dataServicesExportExported = 'data.services.export.exported';
+  static const dataServicesExportFocus = 'data.services.export.focus';
+  static const dataServicesExportInnercyclesJournalExport =
+      'data.services.export.innercycles_journal_export';
+  static const dataServicesExportNote = 'data.services.export.note';
+  static const dataServicesExportRating = 'data.services.export.rating';
+  static const dataServicesNotification10FriendsJoinedYouveEarnedLifetime =
+      'data.services.notification.10_friends_joined_youve_earned_lifetime';
+  static const dataServicesNotificationFullMoon =
+      'data.services.notification._full_moon';
+  static const dataServicesNotificationNewMoon =
+      'data.services.notification._new_moon';
+  static const dataServicesNotificationYourDailyReflection =
+      'data.services.notification._your_daily_reflection';
+  static const dataServicesNotificationAFriendJoinedWithYourCodeYouBoth =
+      'data.services.notification.a_friend_joined_with_your_code_you_both';
+  static const dataServicesNotificationANewMoonPhaseIsHereAGoodTimeFor =
+      'data.services.notification.a_new_moon_phase_is_here_a_good_time_for';
+  static const dataServicesNotificationAQuickCheckinKeepsYourMomentumGoin =
+      'data.services.notification.a_quick_checkin_keeps_your_momentum_goin';
+  static const dataServicesNotificationATimeForNewBeginningsAndSettingIn =
+      'data.services.notification.a_time_for_new_beginnings_and_setting_in';
+  static const dataServicesNotificationATimeForReflectionAndGratitude =
+      'data.services.notification.a_time_for_reflection_and_gratitude';
+  static const dataServicesNotificationAlertsWhenYourJournalingStreakIsAb =
+      'data.services.notification.alerts_when_your_journaling_streak_is_ab';
+  static const dataServicesNotificationBirthdayReminderNotifications =
+      'data.services.notification.birthday_reminder_notifications';
+  static const dataServicesNotificationBirthdayReminderNotifications1 =
+      'data.services.notification.birthday_reminder_notifications_1';
+  static const dataServicesNotificationBirthdayReminders =
+      'data.services.notification.birthday_reminders';
+  static const dataServicesNotificationBirthdayReminders1 =
+      'data.services.notification.birthday_reminders_1';
+  static const dataServicesNotificationBirthdayTodayBody =
+      'data.services.notification.birthday_today_body';
+  static const dataServicesNotificationBirthdayTodayTitle =
+      'data.services.notification.birthday_today_title';
+  static const dataServicesNotificationBirthdayTomorrowBody =
+      'data.services.notification.birthday_tomorrow_body';
+  static const dataServicesNotificationBirthdayTomorrowTitle =
+      'data.services.notification.birthday_tomorrow_title';
+  static const dataServicesNotificationDailyJournalReflectionReminders =
+      'data.services.notification.daily_journal_reflection_reminders';
+  static const dataServicesNotificationDailyJournalingPromptToInspireYour =
+      'data.services.notification.daily_journaling_prompt_to_inspire_your';
+  static const dataServicesNotificationDailyReflection =
+      'data.services.notification.daily_reflection';
+  static const dataServicesNotificationEncouragementToStartANewStreak =
+      'data.services.notification.encouragement_to_start_a_new_streak';
+  static const dataServicesNotificationEveningJournalReflectionReminders =
+      'data.services.notification.evening_journal_reflection_reminders';
+  static const dataServicesNotificationEveningReflection =
+      'data.services.notification.evening_reflection';
+  static const dataServicesNotificationEveningReflection1 =
+      'data.services.notification.evening_reflection_1';
+  static const dataServicesNotificationEveryStreakStartsAtDay1 =
+      'data.services.notification.every_streak_starts_at_day_1';
+  static const dataServicesNotificationHowWasYourDayTakeAMomentToJourna =
+      'data.services.notification.how_was_your_day_take_a_moment_to_journa';
+  static const dataServicesNotificationJournalPrompts =
+      'data.services.notification.journal_prompts';
+  static const dataServicesNotificationMemoriesFromPastJournalEntries =
+      'data.services.notification.memories_from_past_journal_entries';
+  static const dataServicesNotificationMoonCycleAwareness =
+      'data.services.notification.moon_cycle_awareness';
+  static const dataServicesNotificationMoonCycleAwareness1 =
+      'data.services.notification.moon_cycle_awareness_1';
+  static const dataServicesNotificationMoonCycleAwareness2 =
+      'data.services.notification.moon_cycle_awareness_2';
+  static const dataServicesNotificationMoonCycleAwareness3 =
+      'data.services.notification.moon_cycle_awareness_3';
+  static const dataServicesNotificationMoonCycleMindfulnessReminders =
+      'data.services.notification.moon_cycle_mindfulness_reminders';
+  static const dataServicesNotificationMoonCycleMindfulnessReminders1 =
+      'data.services.notification.moon_cycle_mindfulness_reminders_1';
+  static const dataServicesNotificationMoonCycleMindfulnessReminders2 =
+      'data.services.notification.moon_cycle_mindfulness_reminders_2';
+  static const dataServicesNotificationNoteReminder =
+      'data.services.notification.note_reminder';
+  static const dataServicesNotificationNoteReminders =
+      'data.services.notification.note_reminders';
+  static const dataServicesNotificationNotificationsWhenFriendsJoinWithYou =
+      'data.services.notification.notifications_when_friends_join_with_you';
+  static const dataServicesNotificationOnThisDay =
+      'data.services.notification.on_this_day';
+  static const dataServicesNotificationOnThisDayTitlePlural =
+      'data.services.notification.on_this_day_title_plural';
+  static const dataServicesNotificationOnThisDayTitleSingular =
+      'data.services.notification.on_this_day_title_singular';
+  static const dataServicesNotificationReferralBodyMonth =
+      'data.services.notification.referral_body_month';
+  static const dataServicesNotificationReferralRewards =
+      'data.services.notification.referral_rewards';
+  static const dataServicesNotificationRemindersForYourPersonalNotes =
+      'data.services.notification.reminders_for_your_personal_notes';
+  static const dataServicesNotificationSeeWhatYouWroteOnThisDayYourPast =
+      'data.services.notification.see_what_you_wrote_on_this_day_your_past';
+  static const dataServicesNotificationStreakAtRiskTitle =
+      'data.services.notification.streak_at_risk_title';
+  static const dataServicesNotificationStreakRecovery =
+      'data.services.notification.streak_recovery';
+  static const dataServicesNotificationStreakRecoveryBody =
+      'data.services.notification.streak_recovery_body';
+  static const dataServicesNotificationStreakReminders =
+      'data.services.notification.streak_reminders';
+  static const dataServicesNotificationTakeAMomentToReflectOnYourDay =
+      'data.services.notification.take_a_moment_to_reflect_on_your_day';
+  static const dataServicesNotificationTodaysJournalPrompt =
+      'data.services.notification.todays_journal_prompt';
+  static const dataServicesNotificationU1f381ReferralReward7DaysPremium =
+      'data.services.notification.u1f381_referral_reward_7_days_premium';
+  static const dataServicesNotificationU1f48eLifetimePremiumUnlocked =
+      'data.services.notification.u1f48e_lifetime_premium_unlocked';
+  static const dataServicesNotificationU2b501MonthFreePremium =
+      'data.services.notification.u2b50_1_month_free_premium';
+  static const dataServicesNotificationLifecycleANewCorrelationEmergedInYourJourna =
+      'data.services.notification_lifecycle.a_new_correlation_emerged_in_your_journa';
+  static const dataServicesNotificationLifecycleCelebrateYourProgress =
+      'data.services.notification_lifecycle.celebrate_your_progress';
+  static const dataServicesNotificationLifecycleChallengeCompleted =
+      'data.services.notification_lifecycle.challenge_completed';
+  static const dataServicesNotificationLifecycleFullMoonTonight =
+      'data.services.notification_lifecycle.full_moon_tonight';
+  static const dataServicesNotificationLifecycleMilestoneBody =
+      'data.services.notification_lifecycle.milestone_body';
+  static const dataServicesNotificationLifecycleMilestoneReached =
+      'data.services.notification_lifecycle.milestone_reached';
+  static const dataServicesNotificationLifecycleMonthlyWrappedReady =
+      'data.services.notification_lifecycle.monthly_wrapped_ready';
+  static const dataServicesNotificationLifecycleNewMoonTonight =
+      'data.services.notification_lifecycle.new_moon_tonight';
+  static const dataServicesNotificationLifecycleNewPatternFound =
+      'data.services.notification_lifecycle.new_pattern_found';
+  static const dataServicesNotificationLifecycleOneSentenceCounts =
+      'data.services.notification_lifecycle.one_sentence_counts';
+  static const dataServicesNotificationLifecycleQuickCheckin =
+      'data.services.notification_lifecycle.quick_checkin';
+  static const dataServicesNotificationLifecycleSeeYourYearInPatternsYourPersonal =
+      'data.services.notification_lifecycle.see_your_year_in_patterns_your_personal';
+  static const dataServicesNotificationLifecycleSomethingInteresting =
+      'data.services.notification_lifecycle.something_interesting';
+  static const dataServicesNotificationLifecycleSomethingInterestingEmergedInYourPa =
+      'data.services.notification_lifecycle.something_interesting_emerged_in_your_pa';
+  static const dataServicesNotificationLifecycleStillHereForYou =
+      'data.services.notification_lifecycle.still_here_for_you';
+  static const dataServicesNotificationLifecycleStreakReminderBody =
+      'data.services.notification_lifecycle.streak_reminder_body';
+  static const dataServicesNotificationLifecycleTheFullMoonIsTonightAWonderfulMom =
+      'data.services.notification_lifecycle.the_full_moon_is_tonight_a_wonderful_mom';
+  static const dataServicesNotificationLifecycleTheNewMoonIsTonightAPerfectTimeF =
+      'data.services.notification_lifecycle.the_new_moon_is_tonight_a_perfect_time_f';
+  static const dataServicesNotificationLifecycleWeeklyReflection =
+      'data.services.notification_lifecycle.weekly_reflection';
+  static const dataServicesNotificationLifecycleWelcomeBack =
+      'data.services.notification_lifecycle.welcome_back';
+  static const dataServicesNotificationLifecycleWhatsPresentForYouRightNowAQuick =
+      'data.services.notification_lifecycle.whats_present_for_you_right_now_a_quick';
+  static const dataServicesNotificationLifecycleWrappedTitle =
+      'data.services.notification_lifecycle.wrapped_title';
+  static const dataServicesNotificationLifecycleYouFinishedAChallengeShareYourAchi =
+      'data.services.notification_lifecycle.you_finished_a_challenge_share_your_achi';
+  static const dataServicesNotificationLifecycleYouReachedAMilestoneRecentlyShareI =
+      'data.services.notification_lifecycle.you_reached_a_milestone_recently_share_i';
+  static const dataServicesNotificationLifecycleYourArchetypeShifted =
+      'data.services.notification_lifecycle.your_archetype_shifted';
+  static const dataServicesNotificationLifecycleYourJournalAwaits =
+      'data.services.notification_lifecycle.your_journal_awaits';
+  static const dataServicesNotificationLifecycleYourJournalIsHereWheneverYouAreRe =
+      'data.services.notification_lifecycle.your_journal_is_here_whenever_you_are_re';
+  static const dataServicesNotificationLifecycleYourMonthlyArchetypeHasEvolvedCheck =
+      'data.services.notification_lifecycle.your_monthly_archetype_has_evolved_check';
+  static const dataServicesNotificationLifecycleYourMonthlyRecapIsReadyToReviewSe =
+      'data.services.notification_lifecycle.your_monthly_recap_is_ready_to_review_se';
+  static const dataServicesNotificationLifecycleYourPatternsAreStillHereReadyWhen =
+      'data.services.notification_lifecycle.your_patterns_are_still_here_ready_when';
+  static const dataServicesNotificationLifecycleYourStreakIsWaiting =
+      'data.services.notification_lifecycle.your_streak_is_waiting';
+  static const dataServicesNotificationLifecycleYourWeeklyReflectionIsReadyToRevie =
+      'data.services.notification_lifecycle.your_weekly_reflection_is_ready_to_revie';
+  static const dataServicesPatternEngineDecisions =
+      'data.services.pattern_engine.decisions';
+  static const dataServicesPatternEngineEmotions =
+      'data.services.pattern_engine.emotions';
+  static const dataServicesPatternEngineEnergy =
+      'data.services.pattern_engine.energy';
+  static const dataServicesPatternEngineFocus =
+      'data.services.pattern_engine.focus';
+  static const dataServicesPatternEngineSocial =
+      'data.services.pattern_engine.social';
+  static const dataServicesPatternEngineYourLastFewEntriesShowADipAGood =
+      'data.services.pattern_engine.your_last_few_entries_show_a_dip_a_good';
+  static const dataServicesPatternEngineYourRecentEntriesShowAnUpwardTrend =
+      'data.services.pattern_engine.your_recent_entries_show_an_upward_trend';
+  static const dataServicesPremiumCouldNotConnectYourLocalDataIsUna =
+      'data.services.premium.could_not_connect_your_local_data_is_una';
+  static const dataServicesPremiumCouldntRestorePurchasesPleaseTryAga =
+      'data.services.premium.couldnt_restore_purchases_please_try_aga';
+  static const dataServicesPremiumNoPurchasesFoundToRestore =
+      'data.services.premium.no_purchases_found_to_restore';
+  static const dataServicesPremiumPurchaseCancelled =
+      'data.services.premium.purchase_cancelled';
+  static const dataServicesPremiumPurchasesAreNotAllowedOnThisDevice =
+      'data.services.premium.purchases_are_not_allowed_on_this_device';
+  static const dataServicesPremiumSomethingWentWrongYourAccountWasNo =
+      'data.services.premium.something_went_wrong_your_account_was_no';
+  static const dataServicesPremiumThisProductIsNotAvailableRightNow =
+      'data.services.premium.this_product_is_not_available_right_now';
+  static const dataServicesPremiumThisPurchaseCouldntBeCompleted =
+      'data.services.premium.this_purchase_couldnt_be_completed';
+  static const dataServicesVoiceJournalCouldNotStartListening =
+      'data.services.voice_journal.could_not_start_listening';
+  static const dataServicesVoiceJournalErrorStoppingVoiceInput =
+      'data.services.voice_journal.error_stopping_voice_input';
+  static const dataServicesVoiceJournalFailedToInitializeVoiceInput =
+      'data.services.voice_journal.failed_to_initialize_voice_input';
+  static const dataServicesVoiceJournalVoiceInputIsNotAvailableOnThisDev =
+      'data.services.voice_journal.voice_input_is_not_available_on_this_dev';
+  static const daysFriShort = 'days.fri_short';
+  static const daysMonShort = 'days.mon_short';
+  static const daysSatShort = 'days.sat_short';
+  static const daysSunShort = 'days.sun_short';
+  static const daysThuShort = 'days.thu_short';
+  static const daysTueShort = 'days.tue_short';
+  static const daysWedShort = 'days.wed_short';
+  static const digestMonthlyWrappedBalanced = 'digest.monthly_wrapped.balanced';
+  static const digestMonthlyWrappedBasedOnYourMonthlyPatterns =
+      'digest.monthly_wrapped.based_on_your_monthly_patterns';
+  static const digestMonthlyWrappedClose = 'digest.monthly_wrapped.close';
+  static const digestMonthlyWrappedGoBack = 'digest.monthly_wrapped.go_back';
+  static const digestMonthlyWrappedKeepJournalingToBuildYourMonthlySt =
+      'digest.monthly_wrapped.keep_journaling_to_build_your_monthly_st';
+  static const digestMonthlyWrappedKeepJournalingYourMonthlyWrappedWil =
+      'digest.monthly_wrapped.keep_journaling_your_monthly_wrapped_wil';
+  static const digestMonthlyWrappedRetry = 'digest.monthly_wrapped.retry';
+  static const digestMonthlyWrappedShareYourMonth =
+      'digest.monthly_wrapped.share_your_month';
+  static const digestMonthlyWrappedSlide = 'digest.monthly_wrapped.slide';
+  static const digestMonthlyWrappedThisAreaDrewYourAttentionMoreThan =
+      'digest.monthly_wrapped.this_area_drew_your_attention_more_than';
+  static const digestMonthlyWrappedYourMonthAtAGlance =
+      'digest.monthly_wrapped.your_month_at_a_glance';
+  static const digestWeekOfRange = 'digest.week_of_range';
+  static const digestWeeklyDigestAvgRating = 'digest.weekly_digest.avg_rating';
+  static const digestWeeklyDigestBestDay = 'digest.weekly_digest.best_day';
+  static const digestWeeklyDigestDayStreak = 'digest.weekly_digest.day_streak';
+  static const digestWeeklyDigestDays = 'digest.weekly_digest.days';
+  static const digestWeeklyDigestEntriesThisWeek =
+      'digest.weekly_digest.entries_this_week';
+  static const digestWeeklyDigestFirstWeekTracked =
+      'digest.weekly_digest.first_week_tracked';
+  static const digestWeeklyDigestFocusAreaBreakdown =
+      'digest.weekly_digest.focus_area_breakdown';
+  static const digestWeeklyDigestMoodTrend = 'digest.weekly_digest.mood_trend';
+  static const digestWeeklyDigestMyWeeklyDebriefFromInnercyclesInner =
+      'digest.weekly_digest.my_weekly_debrief_from_innercycles_inner';
+  static const digestWeeklyDigestNoEntriesThisWeekYet =
+      'digest.weekly_digest.no_entries_this_week_yet';
+  static const digestWeeklyDigestSameAsLastWeek =
+      'digest.weekly_digest.same_as_last_week';
+  static const digestWeeklyDigestShare = 'digest.weekly_digest.share';
+  static const digestWeeklyDigestShareWeeklyDebrief =
+      'digest.weekly_digest.share_weekly_debrief';
+  static const digestWeeklyDigestStartJournalingToSeeYourWeeklyDige =
+      'digest.weekly_digest.start_journaling_to_see_your_weekly_dige';
+  static const digestWeeklyDigestTopFocusArea =
+      'digest.weekly_digest.top_focus_area';
+  static const digestWeeklyDigestViewMonthlyWrapped =
+      'digest.weekly_digest.view_monthly_wrapped';
+  static const digestWeeklyDigestWeekOf = 'digest.weekly_digest.week_of';
+  static const digestWeeklyDigestWeeklyDebrief =
+      'digest.weekly_digest.weekly_debrief';
+  static const digestWeeklyDigestWeeklyDebrief1 =
+      'digest.weekly_digest.weekly_debrief_1';
+  static const digestWeeklyDigestWeeklyInsight =
+      'digest.weekly_digest.weekly_insight';
+  static const disclaimerBeforeUsing = 'disclaimer.before_using';
+  static const disclaimerDisclaimerAPrivateSpaceForReflectionNotPredi =
+      'disclaimer.disclaimer.a_private_space_for_reflection_not_predi';
+  static const disclaimerDisclaimerWelcomeToInnercycles =
+      'disclaimer.disclaimer.welcome_to_innercycles';
+  static const disclaimerDisclaimerYourDataStaysOnYourDevice =
+      'disclaimer.disclaimer.your_data_stays_on_your_device';
+  static const disclaimerReflectionOnly = 'disclaimer.reflection_only';
+  static const disclaimerText1 = 'disclaimer.text_1';
+  static const disclaimerText2 = 'disclaimer.text_2';
+  static const disclaimerText3 = 'disclaimer.text_3';
+  static const dreamCorrelationConnectionItem =
+      'dream_correlation.connection_item';
+  static const dreamCorrelationConnectionsHeader =
+      'dream_correlation.connections_header';
+  static const dreamCorrelationNotEnoughData =
+      'dream_correlation.not_enough_data';
+  static const dreamCorrelationPatternsNote = 'dream_correlation.patterns_note';
+  static const dreamInterpretationArchetypeFallback =
+      'dream_interpretation.archetype_fallback';
+  static const dreamInterpretationArchetypeIntegrationAnima =
+      'dream_interpretation.archetype_integration.anima';
+  static const dreamInterpretationArchetypeIntegrationAnimus =
+      'dream_interpretation.archetype_integration.animus';
+  static const dreamInterpretationArchetypeIntegrationChild =
+      'dream_interpretation.archetype_integration.child';
+  static const dreamInterpretationArchetypeIntegrationGreatMother =
+      'dream_interpretation.archetype_integration.great_mother';
+  static const dreamInterpretationArchetypeIntegrationHero =
+      'dream_interpretation.archetype_integration.hero';
+  static const dreamInterpretationArchetypeIntegrationShadow =
+      'dream_interpretation.archetype_integration.shadow';
+  static const dreamInterpretationArchetypeIntegrationTrickster =
+      'dream_interpretation.archetype_integration.trickster';
+  static const dreamInterpretationArchetypeIntegrationWiseOld =
+      'dream_interpretation.archetype_integration.wise_old';
+  static const dreamInterpretationAvoidancesDonukluk =
+      'dream_interpretation.avoidances.donukluk';
+  static const dreamInterpretationAvoidancesHeyecan =
+      'dream_interpretation.avoidances.heyecan';
+  static const dreamInterpretationAvoidancesHuzur =
+      'dream_interpretation.avoidances.huzur';
+  static const dreamInterpretationAvoidancesKorku =
+      'dream_interpretation.avoidances.korku';
+  static const dreamInterpretationAvoidancesMerak =
+      'dream_interpretation.avoidances.merak';
+  static const dreamInterpretationAvoidancesOfke =
+      'dream_interpretation.avoidances.ofke';
+  static const dreamInterpretationAvoidancesOzlem =
+      'dream_interpretation.avoidances.ozlem';
+  static const dreamInterpretationAvoidancesSucluluk =
+      'dream_interpretation.avoidances.sucluluk';
+  static const dreamInterpretationCoreMessageEmpty =
+      'dream_interpretation.core_message.empty';
+  static const dreamInterpretationCoreMessageWithSymbol =
+      'dream_interpretation.core_message.with_symbol';
+  static const dreamInterpretationDeeperMeaningsDonukluk =
+      'dream_interpretation.deeper_meanings.donukluk';
+  static const dreamInterpretationDeeperMeaningsHeyecan =
+      'dream_interpretation.deeper_meanings.heyecan';
+  static const dreamInterpretationDeeperMeaningsHuzur =
+      'dream_interpretation.deeper_meanings.huzur';
+  static const dreamInterpretationDeeperMeaningsKorku =
+      'dream_interpretation.deeper_meanings.korku';
+  static const dreamInterpretationDeeperMeaningsMerak =
+      'dream_interpretation.deeper_meanings.merak';
+  static const dreamInterpretationDeeperMeaningsOfke =
+      'dream_interpretation.deeper_meanings.ofke';
+  static const dreamInterpretationDeeperMeaningsOzlem =
+      'dream_interpretation.deeper_meanings.ozlem';
+  static const dreamInterpretationDeeperMeaningsSucluluk =
+      'dream_interpretation.deeper_meanings.sucluluk';
+  static const dreamInterpretationDefaultsArchetype =
+      'dream_interpretation.defaults.archetype';
+  static const dreamInterpretationDefaultsAvoidance =
+      'dream_interpretation.defaults.avoidance';
+  static const dreamInterpretationDefaultsDeeperMeaning =
+      'dream_interpretation.defaults.deeper_meaning';
+  static const dreamInterpretationDefaultsIntegrationPath =
+      'dream_interpretation.defaults.integration_path';
+  static const dreamInterpretationDefaultsLightMessage =
+      'dream_interpretation.defaults.light_message';
+  static const dreamInterpretationDefaultsLightShadowIntegration =
+      'dream_interpretation.defaults.light_shadow_integration';
+  static const dreamInterpretationDefaultsReflectionQuestion =
+      'dream_interpretation.defaults.reflection_question';
+  static const dreamInterpretationDefaultsShadowMessage =
+      'dream_interpretation.defaults.shadow_message';
+  static const dreamInterpretationDefaultsShadowQuestion =
+      'dream_interpretation.defaults.shadow_question';
+  static const dreamInterpretationDefaultsSurfaceMessage =
+      'dream_interpretation.defaults.surface_message';
+  static const dreamInterpretationDefaultsTodayAction =
+      'dream_interpretation.defaults.today_action';
+  static const dreamInterpretationDefaultsWeeklyFocus =
+      'dream_interpretation.defaults.weekly_focus';
+  static const dreamInterpretationExplorationCardInsightDesc =
+      'dream_interpretation.exploration.card_insight_desc';
+  static const dreamInterpretationExplorationCardInsightTitle =
+      'dream_interpretation.exploration.card_insight_title';
+  static const dreamInterpretationExplorationCategoryMoon =
+      'dream_interpretation.exploration.category_moon';
+  static const dreamInterpretationExplorationCategorySelfAwareness =
+      'dream_interpretation.exploration.category_self_awareness';
+  static const dreamInterpretationExplorationCategorySymbols =
+      'dream_interpretation.exploration.category_symbols';
+  static const dreamInterpretationExplorationCyclesDesc =
+      'dream_interpretation.exploration.cycles_desc';
+  static const dreamInterpretationExplorationCyclesTitle =
+      'dream_interpretation.exploration.cycles_title';
+  static const dreamInterpretationExplorationJournalDesc =
+      'dream_interpretation.exploration.journal_desc';
+  static const dreamInterpretationExplorationJournalTitle =
+      'dream_interpretation.exploration.journal_title';
+  static const dreamInterpretationExplorationMoonCalendarDesc =
+      'dream_interpretation.exploration.moon_calendar_desc';
+  static const dreamInterpretationExplorationMoonCalendarTitle =
+      'dream_interpretation.exploration.moon_calendar_title';
+  static const dreamInterpretationExplorationNeptuneDesc =
+      'dream_interpretation.exploration.neptune_desc';
+  static const dreamInterpretationExplorationNeptuneTitle =
+      'dream_interpretation.exploration.neptune_title';
+  static const dreamInterpretationExplorationPersonalProfileDesc =
+      'dream_interpretation.exploration.personal_profile_desc';
+  static const dreamInterpretationExplorationPersonalProfileTitle =
+      'dream_interpretation.exploration.personal_profile_title';
+  static const dreamInterpretationExplorationPlutoDesc =
+      'dream_interpretation.exploration.pluto_desc';
+  static const dreamInterpretationExplorationPlutoTitle =
+      'dream_interpretation.exploration.pluto_title';
+  static const dreamInterpretationExplorationTimingInsightsDesc =
+      'dream_interpretation.exploration.timing_insights_desc';
+  static const dreamInterpretationExplorationTimingInsightsTitle =
+      'dream_interpretation.exploration.timing_insights_title';
+  static const dreamInterpretationIntegrationPathsDonukluk =
+      'dream_interpretation.integration_paths.donukluk';
+  static const dreamInterpretationIntegrationPathsHeyecan =
+      'dream_interpretation.integration_paths.heyecan';
+  static const dreamInterpretationIntegrationPathsHuzur =
+      'dream_interpretation.integration_paths.huzur';
+  static const dreamInterpretationIntegrationPathsKorku =
+      'dream_interpretation.integration_paths.korku';
+  static const dreamInterpretationIntegrationPathsMerak =
+      'dream_interpretation.integration_paths.merak';
+  static const dreamInterpretationIntegrationPathsOfke =
+      'dream_interpretation.integration_paths.ofke';
+  static const dreamInterpretationIntegrationPathsOzlem =
+      'dream_interpretation.integration_paths.ozlem';
+  static const dreamInterpretationIntegrationPathsSucluluk =
+      'dream_interpretation.integration_paths.sucluluk';
+  static const dreamInterpretationLightShadowEmptyLight =
+      'dream_interpretation.light_shadow.empty_light';
+  static const dreamInterpretationLightShadowEmptyShadow =
+      'dream_interpretation.light_shadow.empty_shadow';
+  static const dreamInterpretationLightShadowLightAspect =
+      'dream_interpretation.light_shadow.light_aspect';
+  static const dreamInterpretationLightShadowShadowAspect =
+      'dream_interpretation.light_shadow.shadow_aspect';
+  static const dreamInterpretationLucidPotentialHigh =
+      'dream_interpretation.lucid_potential.high';
+  static const dreamInterpretationLucidPotentialLow =
+      'dream_interpretation.lucid_potential.low';
+  static const dreamInterpretationLucidPotentialMedium =
+      'dream_interpretation.lucid_potential.medium';
+  static const dreamInterpretationLucidPotentialVeryHigh =
+      'dream_interpretation.lucid_potential.very_high';
+  static const dreamInterpretationMoonPhasesCrescent =
+      'dream_interpretation.moon_phases.crescent';
+  static const dreamInterpretationMoonPhasesDarkMoon =
+      'dream_interpretation.moon_phases.dark_moon';
+  static const dreamInterpretationMoonPhasesFirstQuarter =
+      'dream_interpretation.moon_phases.first_quarter';
+  static const dreamInterpretationMoonPhasesFullMoon =
+      'dream_interpretation.moon_phases.full_moon';
+  static const dreamInterpretationMoonPhasesLastQuarter =
+      'dream_interpretation.moon_phases.last_quarter';
+  static const dreamInterpretationMoonPhasesNewMoon =
+      'dream_interpretation.moon_phases.new_moon';
+  static const dreamInterpretationReflectionEmpty =
+      'dream_interpretation.reflection.empty';
+  static const dreamInterpretationReflectionSymbol =
+      'dream_interpretation.reflection.symbol';
+  static const dreamInterpretationShadowQuestionsDonukluk =
+      'dream_interpretation.shadow_questions.donukluk';
+  static const dreamInterpretationShadowQuestionsHeyecan =
+      'dream_interpretation.shadow_questions.heyecan';
+  static const dreamInterpretationShadowQuestionsHuzur =
+      'dream_interpretation.shadow_questions.huzur';
+  static const dreamInterpretationShadowQuestionsKorku =
+      'dream_interpretation.shadow_questions.korku';
+  static const dreamInterpretationShadowQuestionsMerak =
+      'dream_interpretation.shadow_questions.merak';
+  static const dreamInterpretationShadowQuestionsOfke =
+      'dream_interpretation.shadow_questions.ofke';
+  static const dreamInterpretationShadowQuestionsOzlem =
+      'dream_interpretation.shadow_questions.ozlem';
+  static const dreamInterpretationShadowQuestionsSucluluk =
+      'dream_interpretation.shadow_questions.sucluluk';
+  static const dreamInterpretationSurfaceMessagesDonukluk =
+      'dream_interpretation.surface_messages.donukluk';
+  static const dreamInterpretationSurfaceMessagesHeyecan =
+      'dream_interpretation.surface_messages.heyecan';
+  static const dreamInterpretationSurfaceMessagesHuzur =
+      'dream_interpretation.surface_messages.huzur';
+  static const dreamInterpretationSurfaceMessagesKorku =
+      'dream_interpretation.surface_messages.korku';
+  static const dreamInterpretationSurfaceMessagesMerak =
+      'dream_interpretation.surface_messages.merak';
+  static const dreamInterpretationSurfaceMessagesOfke =
+      'dream_interpretation.surface_messages.ofke';
+  static const dreamInterpretationSurfaceMessagesOzlem =
+      'dream_interpretation.surface_messages.ozlem';
+  static const dreamInterpretationSurfaceMessagesSucluluk =
+      'dream_interpretation.surface_messages.sucluluk';
+  static const dreamInterpretationTimeLayersDongusel =
+      'dream_interpretation.time_layers.dongusel';
+  static const dreamInterpretationTimeLayersGecmis =
+      'dream_interpretation.time_layers.gecmis';
+  static const dreamInterpretationTimeLayersGelecek =
+      'dream_interpretation.time_layers.gelecek';
+  static const dreamInterpretationTimeLayersSimdi =
+      'dream_interpretation.time_layers.simdi';
+  static const dreamInterpretationTodayActionDefault =
+      'dream_interpretation.today_action.default';
+  static const dreamInterpretationTodayActionFear =
+      'dream_interpretation.today_action.fear';
+  static const dreamInterpretationTodayActionLonging =
+      'dream_interpretation.today_action.longing';
+  static const dreamInterpretationTodayActionSymbol =
+      'dream_interpretation.today_action.symbol';
+  static const dreamInterpretationWeeklyFocus =
+      'dream_interpretation.weekly_focus';
+  static const dreamInterpretationWhisperQuotes0 =
+      'dream_interpretation.whisper_quotes.0';
+  static const dreamInterpretationWhisperQuotes1 =
+      'dream_interpretation.whisper_quotes.1';
+  static const dreamInterpretationWhisperQuotes2 =
+      'dream_interpretation.whisper_quotes.2';
+  static const dreamInterpretationWhisperQuotes3 =
+      'dream_interpretation.whisper_quotes.3';
+  static const dreamInterpretationWhisperQuotes4 =
+      'dream_interpretation.whisper_quotes.4';
+  static const dreamInterpretationWhisperQuotes5 =
+      'dream_interpretation.whisper_quotes.5';
+  static const dreamInterpretationWhyNow = 'dream_interpretation.why_now';
+  static const dreamInterpretationWhyNowSimple =
+      'dream_interpretation.why_now_simple';
+  static const dreamJournalArchetypeEvolving =
+      'dream_journal.archetype.evolving';
+  static const dreamJournalArchetypeFleeing = 'dream_journal.archetype.fleeing';
+  static const dreamJournalArchetypeHero = 'dream_journal.archetype.hero';
+  static const dreamJournalArchetypeObserver =
+      'dream_journal.archetype.observer';
+  static const dreamJournalArchetypeRescuer = 'dream_journal.archetype.rescuer';
+  static const dreamJournalArchetypeSeeker = 'dream_journal.archetype.seeker';
+  static const dreamJournalArchetypeStarting =
+      'dream_journal.archetype.starting';
+  static const dreamJournalEmotionsDonukluk = 'dream_journal.emotions.donukluk';
+  static const dreamJournalEmotionsHeyecan = 'dream_journal.emotions.heyecan';
+  static const dreamJournalEmotionsHuzur = 'dream_journal.emotions.huzur';
+  static const dreamJournalEmotionsKorku = 'dream_journal.emotions.korku';
+  static const dreamJournalEmotionsMerak = 'dream_journal.emotions.merak';
+  static const dreamJournalEmotionsOfke = 'dream_journal.emotions.ofke';
+  static const dreamJournalEmotionsOzlem = 'dream_journal.emotions.ozlem';
+  static const dreamJournalEmotionsSucluluk = 'dream_journal.emotions.sucluluk';
+  static const dreamJournalInsightsLucidCount =
+      'dream_journal.insights.lucid_count';
+  static const dreamJournalInsightsNightmareCount =
+      'dream_journal.insights.nightmare_count';
+  static const dreamJournalInsightsNoDreamsMonthly =
+      'dream_journal.insights.no_dreams_monthly';
+  static const dreamJournalInsightsNoDreamsWeekly =
+      'dream_journal.insights.no_dreams_weekly';
+  static const dreamJournalInsightsSummary = 'dream_journal.insights.summary';
+  static const dreamJournalInsightsSymbolFrequent =
+      'dream_journal.insights.symbol_frequent';
+  static const dreamJournalRecommendationsFearTheme =
+      'dream_journal.recommendations.fear_theme';
+  static const dreamJournalRecommendationsKeepGoing =
+      'dream_journal.recommendations.keep_going';
+  static const dreamJournalRecommendationsKeepJournal =
+      'dream_journal.recommendations.keep_journal';
+  static const dreamJournalRecommendationsLongingJournal =
+      'dream_journal.recommendations.longing_journal';
+  static const dreamJournalRecommendationsNightmareWork =
+      'dream_journal.recommendations.nightmare_work';
+  static const dreamJournalRecommendationsRealityCheck =
+      'dream_journal.recommendations.reality_check';
+  static const dreamJournalRecommendationsRelaxationRitual =
+      'dream_journal.recommendations.relaxation_ritual';
+  static const dreamJournalSeriesTitle = 'dream_journal.series_title';
+  static const dreamJournalShadowActive = 'dream_journal.shadow.active';
+  static const dreamJournalShadowCalm = 'dream_journal.shadow.calm';
+  static const dreamJournalShadowNotVisible =
+      'dream_journal.shadow.not_visible';
+  static const dreamJournalShadowProgressing =
+      'dream_journal.shadow.progressing';
+  static const dreamJournalStoryArcFlat = 'dream_journal.story_arc.flat';
+  static const dreamJournalStoryArcResolution =
+      'dream_journal.story_arc.resolution';
+  static const dreamJournalStoryArcRising = 'dream_journal.story_arc.rising';
+  static const dreamJournalStoryArcSingle = 'dream_journal.story_arc.single';
+  static const dreamJournalThemesAwareness = 'dream_journal.themes.awareness';
+  static const dreamJournalThemesExploring = 'dream_journal.themes.exploring';
+  static const dreamJournalThemesHeroJourney =
+      'dream_journal.themes.hero_journey';
+  static const dreamJournalThemesRecurringPattern =
+      'dream_journal.themes.recurring_pattern';
+  static const dreamJournalThemesSeeking = 'dream_journal.themes.seeking';
+  static const dreamJournalThemesShadowWork =
+      'dream_journal.themes.shadow_work';
+  static const dreamJournalThemesUnknown = 'dream_journal.themes.unknown';
+  static const dreamsAcceptance = 'dreams.acceptance';
+  static const dreamsAchievementAwakening = 'dreams.achievement_awakening';
+  static const dreamsAchievementAwakeningDesc =
+      'dreams.achievement_awakening_desc';
+  static const dreamsAchievementDreamExplorer =
+      'dreams.achievement_dream_explorer';
+  static const dreamsAchievementDreamExplorerDesc =
+      'dreams.achievement_dream_explorer_desc';
+  static const dreamsAchievementDreamKeeper = 'dreams.achievement_dream_keeper';
+  static const dreamsAchievementDreamKeeperDesc =
+      'dreams.achievement_dream_keeper_desc';
+  static const dreamsAchievementDreamMaster = 'dreams.achievement_dream_master';
+  static const dreamsAchievementDreamMasterDesc =
+      'dreams.achievement_dream_master_desc';
+  static const dreamsAchievementFirstStep = 'dreams.achievement_first_step';
+  static const dreamsAchievementFirstStepDesc =
+      'dreams.achievement_first_step_desc';
+  static const dreamsAchievementLucidMaster = 'dreams.achievement_lucid_master';
+  static const dreamsAchievementLucidMasterDesc =
+      'dreams.achievement_lucid_master_desc';
+  static const dreamsAchievementMonthStreak = 'dreams.achievement_month_streak';
+  static const dreamsAchievementMonthStreakDesc =
+      'dreams.achievement_month_streak_desc';
+  static const dreamsAchievementSymbolMaster =
+      'dreams.achievement_symbol_master';
+  static const dreamsAchievementSymbolMasterDesc =
+      'dreams.achievement_symbol_master_desc';
+  static const dreamsAchievementSymbolSeeker =
+      'dreams.achievement_symbol_seeker';
+  static const dreamsAchievementSymbolSeekerDesc =
+      'dreams.achievement_symbol_seeker_desc';
+  static const dreamsAchievementWeekStreak = 'dreams.achievement_week_streak';
+  static const dreamsAchievementWeekStreakDesc =
+      'dreams.achievement_week_streak_desc';
+  static const dreamsAchievements = 'dreams.achievements';
+  static const dreamsActive = 'dreams.active';
+  static const dreamsAlertsDream10Message = 'dreams.alerts.dream_10_message';
+  static const dreamsAlertsDream10Title = 'dreams.alerts.dream_10_title';
+  static const dreamsAlertsRecurringSymbolMessage =
+      'dreams.alerts.recurring_symbol_message';
+  static const dreamsAlertsRecurringSymbolTitle =
+      'dreams.alerts.recurring_symbol_title';
+  static const dreamsAlertsStreak7Message = 'dreams.alerts.streak_7_message';
+  static const dreamsAlertsStreak7Title = 'dreams.alerts.streak_7_title';
+  static const dreamsAllAchievements = 'dreams.all_achievements';
+  static const dreamsAwareness = 'dreams.awareness';
+  static const dreamsBestMoonPhase = 'dreams.best_moon_phase';
+  static const dreamsByDayOfWeek = 'dreams.by_day_of_week';
+  static const dreamsCanonicalBrandFooter = 'dreams.canonical.brand_footer';
+  static const dreamsCanonicalBrandTag = 'dreams.canonical.brand_tag';
+  static const dreamsCanonicalDarknessAction1 =
+      'dreams.canonical.darkness.action_1';
+  static const dreamsCanonicalDarknessAction2 =
+      'dreams.canonical.darkness.action_2';
+  static const dreamsCanonicalDarknessAction3 =
+      'dreams.canonical.darkness.action_3';
+  static const dreamsCanonicalDarknessAction4 =
+      'dreams.canonical.darkness.action_4';
+  static const dreamsCanonicalDarknessActionTitle =
+      'dreams.canonical.darkness.action_title';
+  static const dreamsCanonicalDarknessMeaning1 =
+      'dreams.canonical.darkness.meaning_1';
+  static const dreamsCanonicalDarknessMeaning2 =
+      'dreams.canonical.darkness.meaning_2';
+  static const dreamsCanonicalDarknessMeaning3 =
+      'dreams.canonical.darkness.meaning_3';
+  static const dreamsCanonicalDarknessRecurring1 =
+      'dreams.canonical.darkness.recurring_1';
+  static const dreamsCanonicalDarknessRecurring2 =
+      'dreams.canonical.darkness.recurring_2';
+  static const dreamsCanonicalDarknessRecurring3 =
+      'dreams.canonical.darkness.recurring_3';
+  static const dreamsCanonicalDarknessShortAnswer1 =
+      'dreams.canonical.darkness.short_answer_1';
+  static const dreamsCanonicalDarknessShortAnswer2 =
+      'dreams.canonical.darkness.short_answer_2';
+  static const dreamsCanonicalDarknessShortAnswer3 =
+      'dreams.canonical.darkness.short_answer_3';
+  static const dreamsCanonicalDarknessQuestion =
+      'dreams.canonical.darkness_question';
+  static const dreamsCanonicalDreamThemeDreamThemeNotFound =
+      'dreams.canonical.dream_theme.dream_theme_not_found';
+  static const dreamsCanonicalFallingEmotion1 =
+      'dreams.canonical.falling.emotion_1';
+  static const dreamsCanonicalFallingEmotion2 =
+      'dreams.canonical.falling.emotion_2';
+  static const dreamsCanonicalFallingEmotion3 =
+      'dreams.canonical.falling.emotion_3';
+  static const dreamsCanonicalFallingEmotionTitle =
+      'dreams.canonical.falling.emotion_title';
+  static const dreamsCanonicalFallingMeaning1 =
+      'dreams.canonical.falling.meaning_1';
+  static const dreamsCanonicalFallingMeaning2 =
+      'dreams.canonical.falling.meaning_2';
+  static const dreamsCanonicalFallingMeaning3 =
+      'dreams.canonical.falling.meaning_3';
+  static const dreamsCanonicalFallingRecurring1 =
+      'dreams.canonical.falling.recurring_1';
+  static const dreamsCanonicalFallingRecurring2 =
+      'dreams.canonical.falling.recurring_2';
+  static const dreamsCanonicalFallingRecurring3 =
+      'dreams.canonical.falling.recurring_3';
+  static const dreamsCanonicalFallingShortAnswer1 =
+      'dreams.canonical.falling.short_answer_1';
+  static const dreamsCanonicalFallingShortAnswer2 =
+      'dreams.canonical.falling.short_answer_2';
+  static const dreamsCanonicalFallingShortAnswer3 =
+      'dreams.canonical.falling.short_answer_3';
+  static const dreamsCanonicalFallingQuestion =
+      'dreams.canonical.falling_question';
+  static const dreamsCanonicalFlyingCantFly1 =
+      'dreams.canonical.flying.cant_fly_1';
+  static const dreamsCanonicalFlyingCantFly2 =
+      'dreams.canonical.flying.cant_fly_2';
+  static const dreamsCanonicalFlyingCantFly3 =
+      'dreams.canonical.flying.cant_fly_3';
+  static const dreamsCanonicalFlyingCantFlyTitle =
+      'dreams.canonical.flying.cant_fly_title';
+  static const dreamsCanonicalFlyingFeeling1 =
+      'dreams.canonical.flying.feeling_1';
+  static const dreamsCanonicalFlyingFeeling2 =
+      'dreams.canonical.flying.feeling_2';
+  static const dreamsCanonicalFlyingFeeling3 =
+      'dreams.canonical.flying.feeling_3';
+  static const dreamsCanonicalFlyingFeelingTitle =
+      'dreams.canonical.flying.feeling_title';
+  static const dreamsCanonicalFlyingMeaning1 =
+      'dreams.canonical.flying.meaning_1';
+  static const dreamsCanonicalFlyingMeaning2 =
+      'dreams.canonical.flying.meaning_2';
+  static const dreamsCanonicalFlyingMeaning3 =
+      'dreams.canonical.flying.meaning_3';
+  static const dreamsCanonicalFlyingShortAnswer1 =
+      'dreams.canonical.flying.short_answer_1';
+  static const dreamsCanonicalFlyingShortAnswer2 =
+      'dreams.canonical.flying.short_answer_2';
+  static const dreamsCanonicalFlyingShortAnswer3 =
+      'dreams.canonical.flying.short_answer_3';
+  static const dreamsCanonicalFlyingQuestion =
+      'dreams.canonical.flying_question';
+  static const dreamsCanonicalImportantNote = 'dreams.canonical.important_note';
+  static const dreamsCanonicalLifePathAnswer1 =
+      'dreams.canonical.life_path.answer1';
+  static const dreamsCanonicalLifePathAnswer2 =
+      'dreams.canonical.life_path.answer2';
+  static const dreamsCanonicalLifePathAnswer3 =
+      'dreams.canonical.life_path.answer3';
+  static const dreamsCanonicalLifePathCalc1 =
+      'dreams.canonical.life_path.calc1';
+  static const dreamsCanonicalLifePathCalc2 =
+      'dreams.canonical.life_path.calc2';
+  static const dreamsCanonicalLifePathCalc3 =
+      'dreams.canonical.life_path.calc3';
+  static const dreamsCanonicalLifePathHowCalculated =
+      'dreams.canonical.life_path.how_calculated';
+  static const dreamsCanonicalLifePathNote1 =
+      'dreams.canonical.life_path.note1';
+  static const dreamsCanonicalLifePathNote2 =
+      'dreams.canonical.life_path.note2';
+  static const dreamsCanonicalLifePathNote3 =
+      'dreams.canonical.life_path.note3';
+  static const dreamsCanonicalLifePathSuggestion =
+      'dreams.canonical.life_path.suggestion';
+  static const dreamsCanonicalLifePathTells1 =
+      'dreams.canonical.life_path.tells1';
+  static const dreamsCanonicalLifePathTells2 =
+      'dreams.canonical.life_path.tells2';
+  static const dreamsCanonicalLifePathTells3 =
+      'dreams.canonical.life_path.tells3';
+  static const dreamsCanonicalLifePathTells4 =
+      'dreams.canonical.life_path.tells4';
+  static const dreamsCanonicalLifePathTitle =
+      'dreams.canonical.life_path.title';
+  static const dreamsCanonicalLifePathWhatTells =
+      'dreams.canonical.life_path.what_tells';
+  static const dreamsCanonicalLosingMeaning1 =
+      'dreams.canonical.losing.meaning_1';
+  static const dreamsCanonicalLosingMeaning2 =
+      'dreams.canonical.losing.meaning_2';
+  static const dreamsCanonicalLosingMeaning3 =
+      'dreams.canonical.losing.meaning_3';
+  static const dreamsCanonicalLosingRecurring1 =
+      'dreams.canonical.losing.recurring_1';
+  static const dreamsCanonicalLosingRecurring2 =
+      'dreams.canonical.losing.recurring_2';
+  static const dreamsCanonicalLosingRecurring3 =
+      'dreams.canonical.losing.recurring_3';
+  static const dreamsCanonicalLosingShortAnswer1 =
+      'dreams.canonical.losing.short_answer_1';
+  static const dreamsCanonicalLosingShortAnswer2 =
+      'dreams.canonical.losing.short_answer_2';
+  static const dreamsCanonicalLosingShortAnswer3 =
+      'dreams.canonical.losing.short_answer_3';
+  static const dreamsCanonicalLosingWho1 = 'dreams.canonical.losing.who_1';
+  static const dreamsCanonicalLosingWho2 = 'dreams.canonical.losing.who_2';
+  static const dreamsCanonicalLosingWho3 = 'dreams.canonical.losing.who_3';
+  static const dreamsCanonicalLosingWhoTitle =
+      'dreams.canonical.losing.who_title';
+  static const dreamsCanonicalLosingQuestion =
+      'dreams.canonical.losing_question';
+  static const dreamsCanonicalLostFind1 = 'dreams.canonical.lost.find_1';
+  static const dreamsCanonicalLostFind2 = 'dreams.canonical.lost.find_2';
+  static const dreamsCanonicalLostFind3 = 'dreams.canonical.lost.find_3';
+  static const dreamsCanonicalLostFindTitle =
+      'dreams.canonical.lost.find_title';
+  static const dreamsCanonicalLostMeaning1 = 'dreams.canonical.lost.meaning_1';
+  static const dreamsCanonicalLostMeaning2 = 'dreams.canonical.lost.meaning_2';
+  static const dreamsCanonicalLostMeaning3 = 'dreams.canonical.lost.meaning_3';
+  static const dreamsCanonicalLostShortAnswer1 =
+      'dreams.canonical.lost.short_answer_1';
+  static const dreamsCanonicalLostShortAnswer2 =
+      'dreams.canonical.lost.short_answer_2';
+  static const dreamsCanonicalLostShortAnswer3 =
+      'dreams.canonical.lost.short_answer_3';
+  static const dreamsCanonicalLostWhere1 = 'dreams.canonical.lost.where_1';
+  static const dreamsCanonicalLostWhere2 = 'dreams.canonical.lost.where_2';
+  static const dreamsCanonicalLostWhere3 = 'dreams.canonical.lost.where_3';
+  static const dreamsCanonicalLostWhere4 = 'dreams.canonical.lost.where_4';
+  static const dreamsCanonicalLostWhereTitle =
+      'dreams.canonical.lost.where_title';
+  static const dreamsCanonicalLostQuestion = 'dreams.canonical.lost_question';
+  static const dreamsCanonicalPastMeaning1 = 'dreams.canonical.past.meaning_1';
+  static const dreamsCanonicalPastMeaning2 = 'dreams.canonical.past.meaning_2';
+  static const dreamsCanonicalPastMeaning3 = 'dreams.canonical.past.meaning_3';
+  static const dreamsCanonicalPastRecurring1 =
+      'dreams.canonical.past.recurring_1';
+  static const dreamsCanonicalPastRecurring2 =
+      'dreams.canonical.past.recurring_2';
+  static const dreamsCanonicalPastRecurring3 =
+      'dreams.canonical.past.recurring_3';
+  static const dreamsCanonicalPastShortAnswer1 =
+      'dreams.canonical.past.short_answer_1';
+  static const dreamsCanonicalPastShortAnswer2 =
+      'dreams.canonical.past.short_answer_2';
+  static const dreamsCanonicalPastShortAnswer3 =
+      'dreams.canonical.past.short_answer_3';
+  static const dreamsCanonicalPastWho1 = 'dreams.canonical.past.who_1';
+  static const dreamsCanonicalPastWho2 = 'dreams.canonical.past.who_2';
+  static const dreamsCanonicalPastWho3 = 'dreams.canonical.past.who_3';
+  static const dreamsCanonicalPastWho4 = 'dreams.canonical.past.who_4';
+  static const dreamsCanonicalPastWhoTitle = 'dreams.canonical.past.who_title';
+  static const dreamsCanonicalPastQuestion = 'dreams.canonical.past_question';
+  static const dreamsCanonicalRecurringShortAnswer1 =
+      'dreams.canonical.recurring.short_answer_1';
+  static const dreamsCanonicalRecurringShortAnswer2 =
+      'dreams.canonical.recurring.short_answer_2';
+  static const dreamsCanonicalRecurringShortAnswer3 =
+      'dreams.canonical.recurring.short_answer_3';
+  static const dreamsCanonicalRecurringWhatToDo1 =
+      'dreams.canonical.recurring.what_to_do_1';
+  static const dreamsCanonicalRecurringWhatToDo2 =
+      'dreams.canonical.recurring.what_to_do_2';
+  static const dreamsCanonicalRecurringWhatToDo3 =
+      'dreams.canonical.recurring.what_to_do_3';
+  static const dreamsCanonicalRecurringWhatToDo4 =
+      'dreams.canonical.recurring.what_to_do_4';
+  static const dreamsCanonicalRecurringWhatToDoTitle =
+      'dreams.canonical.recurring.what_to_do_title';
+  static const dreamsCanonicalRecurringWhenStops1 =
+      'dreams.canonical.recurring.when_stops_1';
+  static const dreamsCanonicalRecurringWhenStops2 =
+      'dreams.canonical.recurring.when_stops_2';
+  static const dreamsCanonicalRecurringWhenStops3 =
+      'dreams.canonical.recurring.when_stops_3';
+  static const dreamsCanonicalRecurringWhenStopsTitle =
+      'dreams.canonical.recurring.when_stops_title';
+  static const dreamsCanonicalRecurringWhy1 =
+      'dreams.canonical.recurring.why_1';
+  static const dreamsCanonicalRecurringWhy2 =
+      'dreams.canonical.recurring.why_2';
+  static const dreamsCanonicalRecurringWhy3 =
+      'dreams.canonical.recurring.why_3';
+  static const dreamsCanonicalRecurringWhy4 =
+      'dreams.canonical.recurring.why_4';
+  static const dreamsCanonicalRecurringWhyTitle =
+      'dreams.canonical.recurring.why_title';
+  static const dreamsCanonicalRecurringQuestion =
+      'dreams.canonical.recurring_question';
+  static const dreamsCanonicalRunningFrom1 = 'dreams.canonical.running.from_1';
+  static const dreamsCanonicalRunningFrom2 = 'dreams.canonical.running.from_2';
+  static const dreamsCanonicalRunningFrom3 = 'dreams.canonical.running.from_3';
+  static const dreamsCanonicalRunningFromTitle =
+      'dreams.canonical.running.from_title';
+  static const dreamsCanonicalRunningMeaning1 =
+      'dreams.canonical.running.meaning_1';
+  static const dreamsCanonicalRunningMeaning2 =
+      'dreams.canonical.running.meaning_2';
+  static const dreamsCanonicalRunningMeaning3 =
+      'dreams.canonical.running.meaning_3';
+  static const dreamsCanonicalRunningRecurring1 =
+      'dreams.canonical.running.recurring_1';
+  static const dreamsCanonicalRunningRecurring2 =
+      'dreams.canonical.running.recurring_2';
+  static const dreamsCanonicalRunningRecurring3 =
+      'dreams.canonical.running.recurring_3';
+  static const dreamsCanonicalRunningShortAnswer1 =
+      'dreams.canonical.running.short_answer_1';
+  static const dreamsCanonicalRunningShortAnswer2 =
+      'dreams.canonical.running.short_answer_2';
+  static const dreamsCanonicalRunningShortAnswer3 =
+      'dreams.canonical.running.short_answer_3';
+  static const dreamsCanonicalRunningQuestion =
+      'dreams.canonical.running_question';
+  static const dreamsCanonicalSearchingMeaning1 =
+      'dreams.canonical.searching.meaning_1';
+  static const dreamsCanonicalSearchingMeaning2 =
+      'dreams.canonical.searching.meaning_2';
+  static const dreamsCanonicalSearchingMeaning3 =
+      'dreams.canonical.searching.meaning_3';
+  static const dreamsCanonicalSearchingNotFound1 =
+      'dreams.canonical.searching.not_found_1';
+  static const dreamsCanonicalSearchingNotFound2 =
+      'dreams.canonical.searching.not_found_2';
+  static const dreamsCanonicalSearchingNotFound3 =
+      'dreams.canonical.searching.not_found_3';
+  static const dreamsCanonicalSearchingNotFoundTitle =
+      'dreams.canonical.searching.not_found_title';
+  static const dreamsCanonicalSearchingShortAnswer1 =
+      'dreams.canonical.searching.short_answer_1';
+  static const dreamsCanonicalSearchingShortAnswer2 =
+      'dreams.canonical.searching.short_answer_2';
+  static const dreamsCanonicalSearchingShortAnswer3 =
+      'dreams.canonical.searching.short_answer_3';
+  static const dreamsCanonicalSearchingWhat1 =
+      'dreams.canonical.searching.what_1';
+  static const dreamsCanonicalSearchingWhat2 =
+      'dreams.canonical.searching.what_2';
+  static const dreamsCanonicalSearchingWhat3 =
+      'dreams.canonical.searching.what_3';
+  static const dreamsCanonicalSearchingWhat4 =
+      'dreams.canonical.searching.what_4';
+  static const dreamsCanonicalSearchingWhatTitle =
+      'dreams.canonical.searching.what_title';
+  static const dreamsCanonicalSearchingQuestion =
+      'dreams.canonical.searching_question';
+  static const dreamsCanonicalSectionsIfRecurring =
+      'dreams.canonical.sections.if_recurring';
+  static const dreamsCanonicalSectionsShortAnswer =
+      'dreams.canonical.sections.short_answer';
+  static const dreamsCanonicalSectionsWhatItMeans =
+      'dreams.canonical.sections.what_it_means';
+  static const dreamsCanonicalShortAnswer = 'dreams.canonical.short_answer';
+  static const dreamsCanonicalUnableToFlyMeaning1 =
+      'dreams.canonical.unable_to_fly.meaning_1';
+  static const dreamsCanonicalUnableToFlyMeaning2 =
+      'dreams.canonical.unable_to_fly.meaning_2';
+  static const dreamsCanonicalUnableToFlyMeaning3 =
+      'dreams.canonical.unable_to_fly.meaning_3';
+  static const dreamsCanonicalUnableToFlyRecurring1 =
+      'dreams.canonical.unable_to_fly.recurring_1';
+  static const dreamsCanonicalUnableToFlyRecurring2 =
+      'dreams.canonical.unable_to_fly.recurring_2';
+  static const dreamsCanonicalUnableToFlyRecurring3 =
+      'dreams.canonical.unable_to_fly.recurring_3';
+  static const dreamsCanonicalUnableToFlyShortAnswer1 =
+      'dreams.canonical.unable_to_fly.short_answer_1';
+  static const dreamsCanonicalUnableToFlyShortAnswer2 =
+      'dreams.canonical.unable_to_fly.short_answer_2';
+  static const dreamsCanonicalUnableToFlyShortAnswer3 =
+      'dreams.canonical.unable_to_fly.short_answer_3';
+  static const dreamsCanonicalUnableToFlyWhy1 =
+      'dreams.canonical.unable_to_fly.why_1';
+  static const dreamsCanonicalUnableToFlyWhy2 =
+      'dreams.canonical.unable_to_fly.why_2';
+  static const dreamsCanonicalUnableToFlyWhy3 =
+      'dreams.canonical.unable_to_fly.why_3';
+  static const dreamsCanonicalUnableToFlyWhy4 =
+      'dreams.canonical.unable_to_fly.why_4';
+  static const dreamsCanonicalUnableToFlyWhyTitle =
+      'dreams.canonical.unable_to_fly.why_title';
+  static const dreamsCanonicalUnableToFlyQuestion =
+      'dreams.canonical.unable_to_fly_question';
+  static const dreamsCanonicalVoicelessMeaning1 =
+      'dreams.canonical.voiceless.meaning_1';
+  static const dreamsCanonicalVoicelessMeaning2 =
+      'dreams.canonical.voiceless.meaning_2';
+  static const dreamsCanonicalVoicelessMeaning3 =
+      'dreams.canonical.voiceless.meaning_3';
+  static const dreamsCanonicalVoicelessRecurring1 =
+      'dreams.canonical.voiceless.recurring_1';
+  static const dreamsCanonicalVoicelessRecurring2 =
+      'dreams.canonical.voiceless.recurring_2';
+  static const dreamsCanonicalVoicelessRecurring3 =
+      'dreams.canonical.voiceless.recurring_3';
+  static const dreamsCanonicalVoicelessShortAnswer1 =
+      'dreams.canonical.voiceless.short_answer_1';
+  static const dreamsCanonicalVoicelessShortAnswer2 =
+      'dreams.canonical.voiceless.short_answer_2';
+  static const dreamsCanonicalVoicelessShortAnswer3 =
+      'dreams.canonical.voiceless.short_answer_3';
+  static const dreamsCanonicalVoicelessWhy1 =
+      'dreams.canonical.voiceless.why_1';
+  static const dreamsCanonicalVoicelessWhy2 =
+      'dreams.canonical.voiceless.why_2';
+  static const dreamsCanonicalVoicelessWhy3 =
+      'dreams.canonical.voiceless.why_3';
+  static const dreamsCanonicalVoicelessWhyTitle =
+      'dreams.canonical.voiceless.why_title';
+  static const dreamsCanonicalVoicelessQuestion =
+      'dreams.canonical.voiceless_question';
+  static const dreamsCanonicalWaterEmotion1 =
+      'dreams.canonical.water.emotion_1';
+  static const dreamsCanonicalWaterEmotion2 =
+      'dreams.canonical.water.emotion_2';
+  static const dreamsCanonicalWaterEmotion3 =
+      'dreams.canonical.water.emotion_3';
+  static const dreamsCanonicalWaterEmotionTitle =
+      'dreams.canonical.water.emotion_title';
+  static const dreamsCanonicalWaterRecurring1 =
+      'dreams.canonical.water.recurring_1';
+  static const dreamsCanonicalWaterRecurring2 =
+      'dreams.canonical.water.recurring_2';
+  static const dreamsCanonicalWaterRecurring3 =
+      'dreams.canonical.water.recurring_3';
+  static const dreamsCanonicalWaterShortAnswer1 =
+      'dreams.canonical.water.short_answer_1';
+  static const dreamsCanonicalWaterShortAnswer2 =
+      'dreams.canonical.water.short_answer_2';
+  static const dreamsCanonicalWaterShortAnswer3 =
+      'dreams.canonical.water.short_answer_3';
+  static const dreamsCanonicalWaterState1 = 'dreams.canonical.water.state_1';
+  static const dreamsCanonicalWaterState2 = 'dreams.canonical.water.state_2';
+  static const dreamsCanonicalWaterState3 = 'dreams.canonical.water.state_3';
+  static const dreamsCanonicalWaterState4 = 'dreams.canonical.water.state_4';
+  static const dreamsCanonicalWaterStateTitle =
+      'dreams.canonical.water.state_title';
+  static const dreamsCanonicalWaterQuestion = 'dreams.canonical.water_question';
+  static const dreamsCharacterFrequency = 'dreams.character_frequency';
+  static const dreamsContextQuestionsBaby = 'dreams.context_questions.baby';
+  static const dreamsContextQuestionsBeingChased =
+      'dreams.context_questions.being_chased';
+  static const dreamsContextQuestionsCar = 'dreams.context_questions.car';
+  static const dreamsContextQuestionsDeath = 'dreams.context_questions.death';
+  static const dreamsContextQuestionsExam = 'dreams.context_questions.exam';
+  static const dreamsContextQuestionsFalling =
+      'dreams.context_questions.falling';
+  static const dreamsContextQuestionsFire = 'dreams.context_questions.fire';
+  static const dreamsContextQuestionsFlying = 'dreams.context_questions.flying';
+  static const dreamsContextQuestionsGeneral =
+      'dreams.context_questions.general';
+  static const dreamsContextQuestionsGettingLost =
+      'dreams.context_questions.getting_lost';
+  static const dreamsContextQuestionsHouse = 'dreams.context_questions.house';
+  static const dreamsContextQuestionsNakedness =
+      'dreams.context_questions.nakedness';
+  static const dreamsContextQuestionsSnake = 'dreams.context_questions.snake';
+  static const dreamsContextQuestionsTeeth = 'dreams.context_questions.teeth';
+  static const dreamsContextQuestionsWater = 'dreams.context_questions.water';
+  static const dreamsCopied = 'dreams.copied';
+  static const dreamsCopyText = 'dreams.copy_text';
+  static const dreamsCurrentStreak = 'dreams.current_streak';
+  static const dreamsDaysFri = 'dreams.days.fri';
+  static const dreamsDaysMon = 'dreams.days.mon';
+  static const dreamsDaysSat = 'dreams.days.sat';
+  static const dreamsDaysSun = 'dreams.days.sun';
+  static const dreamsDaysThu = 'dreams.days.thu';
+  static const dreamsDaysTue = 'dreams.days.tue';
+  static const dreamsDaysWed = 'dreams.days.wed';
+  static const dreamsDiscoveredEmotions = 'dreams.discovered_emotions';
+  static const dreamsDreamArchiveCancel = 'dreams.dream_archive.cancel';
+  static const dreamsDreamArchiveClearSearch =
+      'dreams.dream_archive.clear_search';
+  static const dreamsDreamArchiveDelete = 'dreams.dream_archive.delete';
+  static const dreamsDreamArchiveDeleteDream =
+      'dreams.dream_archive.delete_dream';
+  static const dreamsDreamArchiveDreamArchive =
+      'dreams.dream_archive.dream_archive';
+  static const dreamsDreamArchiveFailedToLoadDreams =
+      'dreams.dream_archive.failed_to_load_dreams';
+  static const dreamsDreamArchiveLucid = 'dreams.dream_archive.lucid';
+  static const dreamsDreamArchiveRecurring = 'dreams.dream_archive.recurring';
+  static const dreamsDreamArchiveRetry = 'dreams.dream_archive.retry';
+  static const dreamsDreamArchiveSearchBySymbolOrTheme =
+      'dreams.dream_archive.search_by_symbol_or_theme';
+  static const dreamsDreamArchiveThisDreamEntryWillBePermanentlyDel =
+      'dreams.dream_archive.this_dream_entry_will_be_permanently_del';
+  static const dreamsDreamArchiveTotal = 'dreams.dream_archive.total';
+  static const dreamsDreamContent = 'dreams.dream_content';
+  static const dreamsDreamDetailLevel = 'dreams.dream_detail_level';
+  static const dreamsDreamInsightCharacters = 'dreams.dream_insight.characters';
+  static const dreamsDreamInsightDescribeDream =
+      'dreams.dream_insight.describe_dream';
+  static const dreamsDreamInsightDreamEmotion =
+      'dreams.dream_insight.dream_emotion';
+  static const dreamsDreamInsightDreamHint = 'dreams.dream_insight.dream_hint';
+  static const dreamsDreamInsightEmotionalDeepMeaning =
+      'dreams.dream_insight.emotional.deep_meaning';
+  static const dreamsDreamInsightEmotionalIntegrationPath =
+      'dreams.dream_insight.emotional.integration_path';
+  static const dreamsDreamInsightEmotionalShadowQuestion =
+      'dreams.dream_insight.emotional.shadow_question';
+  static const dreamsDreamInsightEmotionalSurfaceMessage =
+      'dreams.dream_insight.emotional.surface_message';
+  static const dreamsDreamInsightErrorOccurred =
+      'dreams.dream_insight.error_occurred';
+  static const dreamsDreamInsightGuidanceAvoid =
+      'dreams.dream_insight.guidance.avoid';
+  static const dreamsDreamInsightGuidanceReflectionQuestion =
+      'dreams.dream_insight.guidance.reflection_question';
+  static const dreamsDreamInsightGuidanceTodayAction =
+      'dreams.dream_insight.guidance.today_action';
+  static const dreamsDreamInsightGuidanceWeeklyFocus =
+      'dreams.dream_insight.guidance.weekly_focus';
+  static const dreamsDreamInsightInterpretDream =
+      'dreams.dream_insight.interpret_dream';
+  static const dreamsDreamInsightInterpretationStyle =
+      'dreams.dream_insight.interpretation_style';
+  static const dreamsDreamInsightIsRecurring =
+      'dreams.dream_insight.is_recurring';
+  static const dreamsDreamInsightLifeHint = 'dreams.dream_insight.life_hint';
+  static const dreamsDreamInsightLifeSituation =
+      'dreams.dream_insight.life_situation';
+  static const dreamsDreamInsightLightShadowLightSide =
+      'dreams.dream_insight.light_shadow.light_side';
+  static const dreamsDreamInsightLightShadowShadowSide =
+      'dreams.dream_insight.light_shadow.shadow_side';
+  static const dreamsDreamInsightLoadingAnalyzingShadow =
+      'dreams.dream_insight.loading.analyzing_shadow';
+  static const dreamsDreamInsightLoadingCalculatingMoon =
+      'dreams.dream_insight.loading.calculating_moon';
+  static const dreamsDreamInsightLoadingConnectingArchetypes =
+      'dreams.dream_insight.loading.connecting_archetypes';
+  static const dreamsDreamInsightLoadingConsultingWisdom =
+      'dreams.dream_insight.loading.consulting_wisdom';
+  static const dreamsDreamInsightLoadingDecodingSymbols =
+      'dreams.dream_insight.loading.decoding_symbols';
+  static const dreamsDreamInsightLoadingDivingSubconscious =
+      'dreams.dream_insight.loading.diving_subconscious';
+  static const dreamsDreamInsightLoadingReadingCosmic =
+      'dreams.dream_insight.loading.reading_cosmic';
+  static const dreamsDreamInsightLoadingShapingInterpretation =
+      'dreams.dream_insight.loading.shaping_interpretation';
+  static const dreamsDreamInsightLucidHigh = 'dreams.dream_insight.lucid.high';
+  static const dreamsDreamInsightLucidLow = 'dreams.dream_insight.lucid.low';
+  static const dreamsDreamInsightLucidMedium =
+      'dreams.dream_insight.lucid.medium';
+  static const dreamsDreamInsightLucidPotentialMessage =
+      'dreams.dream_insight.lucid.potential_message';
+  static const dreamsDreamInsightLucidVeryHigh =
+      'dreams.dream_insight.lucid.very_high';
+  static const dreamsDreamInsightMoonPhaseToday =
+      'dreams.dream_insight.moon_phase_today';
+  static const dreamsDreamInsightNewDream = 'dreams.dream_insight.new_dream';
+  static const dreamsDreamInsightPleaseDescribe =
+      'dreams.dream_insight.please_describe';
+  static const dreamsDreamInsightRecurringMessage =
+      'dreams.dream_insight.recurring_message';
+  static const dreamsDreamInsightSectionsAncientIntro =
+      'dreams.dream_insight.sections.ancient_intro';
+  static const dreamsDreamInsightSectionsArchetypeConnection =
+      'dreams.dream_insight.sections.archetype_connection';
+  static const dreamsDreamInsightSectionsCoreMessage =
+      'dreams.dream_insight.sections.core_message';
+  static const dreamsDreamInsightSectionsEmotionalReading =
+      'dreams.dream_insight.sections.emotional_reading';
+  static const dreamsDreamInsightSectionsLightShadow =
+      'dreams.dream_insight.sections.light_shadow';
+  static const dreamsDreamInsightSectionsLucidPotential =
+      'dreams.dream_insight.sections.lucid_potential';
+  static const dreamsDreamInsightSectionsPersonalTiming =
+      'dreams.dream_insight.sections.personal_timing';
+  static const dreamsDreamInsightSectionsPracticalGuidance =
+      'dreams.dream_insight.sections.practical_guidance';
+  static const dreamsDreamInsightSectionsSymbolAnalysis =
+      'dreams.dream_insight.sections.symbol_analysis';
+  static const dreamsDreamInsightSectionsWhisperQuote =
+      'dreams.dream_insight.sections.whisper_quote';
+  static const dreamsDreamInsightShareHashtags =
+      'dreams.dream_insight.share_hashtags';
+  static const dreamsDreamInsightStylesFolk =
+      'dreams.dream_insight.styles.folk';
+  static const dreamsDreamInsightStylesFolkDesc =
+      'dreams.dream_insight.styles.folk_desc';
+  static const dreamsDreamInsightStylesIslamic =
+      'dreams.dream_insight.styles.islamic';
+  static const dreamsDreamInsightStylesIslamicDesc =
+      'dreams.dream_insight.styles.islamic_desc';
+  static const dreamsDreamInsightStylesJungian =
+      'dreams.dream_insight.styles.jungian';
+  static const dreamsDreamInsightStylesJungianDesc =
+      'dreams.dream_insight.styles.jungian_desc';
+  static const dreamsDreamInsightStylesQuick =
+      'dreams.dream_insight.styles.quick';
+  static const dreamsDreamInsightStylesQuickDesc =
+      'dreams.dream_insight.styles.quick_desc';
+  static const dreamsDreamInsightStylesSpiritual =
+      'dreams.dream_insight.styles.spiritual';
+  static const dreamsDreamInsightStylesSpiritualDesc =
+      'dreams.dream_insight.styles.spiritual_desc';
+  static const dreamsDreamInsightSymbolLightSide =
+      'dreams.dream_insight.symbol.light_side';
+  static const dreamsDreamInsightSymbolPersonalContext =
+      'dreams.dream_insight.symbol.personal_context';
+  static const dreamsDreamInsightSymbolRelated =
+      'dreams.dream_insight.symbol.related';
+  static const dreamsDreamInsightSymbolShadowSide =
+      'dreams.dream_insight.symbol.shadow_side';
+  static const dreamsDreamInsightTimingWhyNow =
+      'dreams.dream_insight.timing.why_now';
+  static const dreamsDreamInsightTitle = 'dreams.dream_insight.title';
+  static const dreamsDreamInsightVoiceDescribe =
+      'dreams.dream_insight.voice_describe';
+  static const dreamsDreamInsightVoiceInputSoon =
+      'dreams.dream_insight.voice_input_soon';
+  static const dreamsDreamInterpretationAccessAllPerspectives =
+      'dreams.dream_interpretation.access_all_perspectives';
+  static const dreamsDreamInterpretationAccessAllPerspectives1 =
+      'dreams.dream_interpretation.access_all_perspectives_1';
+  static const dreamsDreamInterpretationCancel =
+      'dreams.dream_interpretation.cancel';
+  static const dreamsDreamInterpretationCopied =
+      'dreams.dream_interpretation.copied';
+  static const dreamsDreamInterpretationCopy =
+      'dreams.dream_interpretation.copy';
+  static const dreamsDreamInterpretationDiscard =
+      'dreams.dream_interpretation.discard';
+  static const dreamsDreamInterpretationLeaveConversation =
+      'dreams.dream_interpretation.leave_conversation';
+  static const dreamsDreamInterpretationPsychologicalPerspectivennyour =
+      'dreams.dream_interpretation.psychological_perspectivennyour';
+  static const dreamsDreamInterpretationSeeYourDreamThroughEveryLens =
+      'dreams.dream_interpretation.see_your_dream_through_every_lens';
+  static const dreamsDreamInterpretationSendMessage =
+      'dreams.dream_interpretation.send_message';
+  static const dreamsDreamInterpretationYouHaveAnActiveDreamSessionAreYou =
+      'dreams.dream_interpretation.you_have_an_active_dream_session_are_you';
+  static const dreamsDreamRecall = 'dreams.dream_recall';
+  static const dreamsDreamsCount = 'dreams.dreams_count';
+  static const dreamsEarned = 'dreams.earned';
+  static const dreamsEmotionDistribution = 'dreams.emotion_distribution';
+  static const dreamsEmotionalReading = 'dreams.emotional_reading';
+  static const dreamsEmotionsAnger = 'dreams.emotions.anger';
+  static const dreamsEmotionsCuriosity = 'dreams.emotions.curiosity';
+  static const dreamsEmotionsFear = 'dreams.emotions.fear';
+  static const dreamsEmotionsHappiness = 'dreams.emotions.happiness';
+  static const dreamsEmotionsLove = 'dreams.emotions.love';
+  static const dreamsEmotionsPeace = 'dreams.emotions.peace';
+  static const dreamsEmotionsSadness = 'dreams.emotions.sadness';
+  static const dreamsEmotionsSurprise = 'dreams.emotions.surprise';
+  static const dreamsEnterDream = 'dreams.enter_dream';
+  static const dreamsExamplePromptsLabel = 'dreams.example_prompts_label';
+  static const dreamsHarmony = 'dreams.harmony';
+  static const dreamsInputPlaceholder = 'dreams.input_placeholder';
+  static const dreamsIntegration = 'dreams.integration';
+  static const dreamsInterpret = 'dreams.interpret';
+  static const dreamsInterpretation = 'dreams.interpretation';
+  static const dreamsInterpretationSubtitle = 'dreams.interpretation_subtitle';
+  static const dreamsInterpretationTitle = 'dreams.interpretation_title';
+  static const dreamsInterpreting = 'dreams.interpreting';
+  static const dreamsLast8Weeks = 'dreams.last_8_weeks';
+  static const dreamsLoadingData = 'dreams.loading_data';
+  static const dreamsLocationFrequency = 'dreams.location_frequency';
+  static const dreamsLocked = 'dreams.locked';
+  static const dreamsLucidDream = 'dreams.lucid_dream';
+  static const dreamsLucidDreamDevelopment = 'dreams.lucid_dream_development';
+  static const dreamsLucidProgress = 'dreams.lucid_progress';
+  static const dreamsMonthlyDistribution = 'dreams.monthly_distribution';
+  static const dreamsMonthsShortApr = 'dreams.months_short.apr';
+  static const dreamsMonthsShortAug = 'dreams.months_short.aug';
+  static const dreamsMonthsShortDec = 'dreams.months_short.dec';
+  static const dreamsMonthsShortFeb = 'dreams.months_short.feb';
+  static const dreamsMonthsShortJan = 'dreams.months_short.jan';
+  static const dreamsMonthsShortJul = 'dreams.months_short.jul';
+  static const dreamsMonthsShortJun = 'dreams.months_short.jun';
+  static const dreamsMonthsShortMar = 'dreams.months_short.mar';
+  static const dreamsMonthsShortMay = 'dreams.months_short.may';
+  static const dreamsMonthsShortNov = 'dreams.months_short.nov';
+  static const dreamsMonthsShortOct = 'dreams.months_short.oct';
+  static const dreamsMonthsShortSep = 'dreams.months_short.sep';
+  static const dreamsMoonPhaseCorrelation = 'dreams.moon_phase_correlation';
+  static const dreamsMoonPhasesFirstQuarter =
+      'dreams.moon_phases.first_quarter';
+  static const dreamsMoonPhasesFullMoon = 'dreams.moon_phases.full_moon';
+  static const dreamsMoonPhasesLastQuarter = 'dreams.moon_phases.last_quarter';
+  static const dreamsMoonPhasesNewMoon = 'dreams.moon_phases.new_moon';
+  static const dreamsMoonPhasesWaningCrescent =
+      'dreams.moon_phases.waning_crescent';
+  static const dreamsMoonPhasesWaningGibbous =
+      'dreams.moon_phases.waning_gibbous';
+  static const dreamsMoonPhasesWaxingCrescent =
+      'dreams.moon_phases.waxing_crescent';
+  static const dreamsMoonPhasesWaxingGibbous =
+      'dreams.moon_phases.waxing_gibbous';
+  static const dreamsMostFrequentSymbols = 'dreams.most_frequent_symbols';
+  static const dreamsNightmare = 'dreams.nightmare';
+  static const dreamsNightmareFrequencyChange =
+      'dreams.nightmare_frequency_change';
+  static const dreamsNightmareReduction = 'dreams.nightmare_reduction';
+  static const dreamsNoDreamsDescription = 'dreams.no_dreams_description';
+  static const dreamsNoDreamsYet = 'dreams.no_dreams_yet';
+  static const dreamsOverview = 'dreams.overview';
+  static const dreamsPatternRepeated = 'dreams.pattern_repeated';
+  static const dreamsPossibleMeanings = 'dreams.possible_meanings';
+  static const dreamsProgressMetrics = 'dreams.progress_metrics';
+  static const dreamsRecurringPatterns = 'dreams.recurring_patterns';
+  static const dreamsResultWidgetAncientWisdom =
+      'dreams.result_widget.ancient_wisdom';
+  static const dreamsResultWidgetArchetype = 'dreams.result_widget.archetype';
+  static const dreamsResultWidgetAvoid = 'dreams.result_widget.avoid';
+  static const dreamsResultWidgetCoreMessage =
+      'dreams.result_widget.core_message';
+  static const dreamsResultWidgetDepth = 'dreams.result_widget.depth';
+  static const dreamsResultWidgetEmotionalReading =
+      'dreams.result_widget.emotional_reading';
+  static const dreamsResultWidgetExplore = 'dreams.result_widget.explore';
+  static const dreamsResultWidgetIntegration =
+      'dreams.result_widget.integration';
+  static const dreamsResultWidgetLight = 'dreams.result_widget.light';
+  static const dreamsResultWidgetLightLabel =
+      'dreams.result_widget.light_label';
+  static const dreamsResultWidgetPersonal = 'dreams.result_widget.personal';
+  static const dreamsResultWidgetPersonalTiming =
+      'dreams.result_widget.personal_timing';
+  static const dreamsResultWidgetPracticalGuidance =
+      'dreams.result_widget.practical_guidance';
+  static const dreamsResultWidgetReflectionQuestion =
+      'dreams.result_widget.reflection_question';
+  static const dreamsResultWidgetShadow = 'dreams.result_widget.shadow';
+  static const dreamsResultWidgetShadowLabel =
+      'dreams.result_widget.shadow_label';
+  static const dreamsResultWidgetShadowQuestion =
+      'dreams.result_widget.shadow_question';
+  static const dreamsResultWidgetShare = 'dreams.result_widget.share';
+  static const dreamsResultWidgetShareFooter =
+      'dreams.result_widget.share_footer';
+  static const dreamsResultWidgetSubconsciousMessage =
+      'dreams.result_widget.subconscious_message';
+  static const dreamsResultWidgetSurface = 'dreams.result_widget.surface';
+  static const dreamsResultWidgetSymbolAnalysis =
+      'dreams.result_widget.symbol_analysis';
+  static const dreamsResultWidgetThisWeek = 'dreams.result_widget.this_week';
+  static const dreamsResultWidgetTitleBadge =
+      'dreams.result_widget.title_badge';
+  static const dreamsResultWidgetToday = 'dreams.result_widget.today';
+  static const dreamsResultWidgetUniversal = 'dreams.result_widget.universal';
+  static const dreamsResultWidgetWhisperWisdom =
+      'dreams.result_widget.whisper_wisdom';
+  static const dreamsResultWidgetWhyNow = 'dreams.result_widget.why_now';
+  static const dreamsSave = 'dreams.save';
+  static const dreamsSaveDream = 'dreams.save_dream';
+  static const dreamsSaveImage = 'dreams.save_image';
+  static const dreamsSaved = 'dreams.saved';
+  static const dreamsSavedToJournal = 'dreams.saved_to_journal';
+  static const dreamsShadowDescription = 'dreams.shadow_description';
+  static const dreamsShadowIntegration = 'dreams.shadow_integration';
+  static const dreamsShare = 'dreams.share';
+  static const dreamsShareDream = 'dreams.share_dream';
+  static const dreamsShareImage = 'dreams.share_image';
+  static const dreamsShareScreenAccentColor =
+      'dreams.share_screen.accent_color';
+  static const dreamsShareScreenAffirmations =
+      'dreams.share_screen.affirmations';
+  static const dreamsShareScreenArchetype = 'dreams.share_screen.archetype';
+  static const dreamsShareScreenArchetypeSymbolTemplate =
+      'dreams.share_screen.archetype_symbol_template';
+  static const dreamsShareScreenDailyAffirmations =
+      'dreams.share_screen.daily_affirmations';
+  static const dreamsShareScreenDefaultAffirmation =
+      'dreams.share_screen.default_affirmation';
+  static const dreamsShareScreenDefaultArtSuggestions =
+      'dreams.share_screen.default_art_suggestions';
+  static const dreamsShareScreenDefaultPoetry =
+      'dreams.share_screen.default_poetry';
+  static const dreamsShareScreenDefaultText =
+      'dreams.share_screen.default_text';
+  static const dreamsShareScreenDreamInterpretation =
+      'dreams.share_screen.dream_interpretation';
+  static const dreamsShareScreenDreamPoetry =
+      'dreams.share_screen.dream_poetry';
+  static const dreamsShareScreenEmojiDecoration =
+      'dreams.share_screen.emoji_decoration';
+  static const dreamsShareScreenEmojiDecorations =
+      'dreams.share_screen.emoji_decorations';
+  static const dreamsShareScreenEnergy = 'dreams.share_screen.energy';
+  static const dreamsShareScreenFontStyle = 'dreams.share_screen.font_style';
+  static const dreamsShareScreenFoundMyselfInDreams =
+      'dreams.share_screen.found_myself_in_dreams';
+  static const dreamsShareScreenImageCreationError =
+      'dreams.share_screen.image_creation_error';
+  static const dreamsShareScreenImageDownloaded =
+      'dreams.share_screen.image_downloaded';
+  static const dreamsShareScreenImageSaved = 'dreams.share_screen.image_saved';
+  static const dreamsShareScreenInspiringQuotes =
+      'dreams.share_screen.inspiring_quotes';
+  static const dreamsShareScreenInspiringQuotesList =
+      'dreams.share_screen.inspiring_quotes_list';
+  static const dreamsShareScreenInstagramStorySize =
+      'dreams.share_screen.instagram_story_size';
+  static const dreamsShareScreenMainText = 'dreams.share_screen.main_text';
+  static const dreamsShareScreenMystery = 'dreams.share_screen.mystery';
+  static const dreamsShareScreenPersonalInsight =
+      'dreams.share_screen.personal_insight';
+  static const dreamsShareScreenPoetryTemplates =
+      'dreams.share_screen.poetry_templates';
+  static const dreamsShareScreenPrivacyControls =
+      'dreams.share_screen.privacy_controls';
+  static const dreamsShareScreenQuickTemplates =
+      'dreams.share_screen.quick_templates';
+  static const dreamsShareScreenReadyTemplates =
+      'dreams.share_screen.ready_templates';
+  static const dreamsShareScreenSaveError = 'dreams.share_screen.save_error';
+  static const dreamsShareScreenSelectEmoji =
+      'dreams.share_screen.select_emoji';
+  static const dreamsShareScreenSelectTheme =
+      'dreams.share_screen.select_theme';
+  static const dreamsShareScreenShareAnonymously =
+      'dreams.share_screen.share_anonymously';
+  static const dreamsShareScreenShareAnonymouslyDesc =
+      'dreams.share_screen.share_anonymously_desc';
+  static const dreamsShareScreenShareInterpretationOnly =
+      'dreams.share_screen.share_interpretation_only';
+  static const dreamsShareScreenShareInterpretationOnlyDesc =
+      'dreams.share_screen.share_interpretation_only_desc';
+  static const dreamsShareScreenShareSymbolOnly =
+      'dreams.share_screen.share_symbol_only';
+  static const dreamsShareScreenShareSymbolOnlyDesc =
+      'dreams.share_screen.share_symbol_only_desc';
+  static const dreamsShareScreenShowMoonPhase =
+      'dreams.share_screen.show_moon_phase';
+  static const dreamsShareScreenShowWatermark =
+      'dreams.share_screen.show_watermark';
+  static const dreamsShareScreenSubconsciousMessages =
+      'dreams.share_screen.subconscious_messages';
+  static const dreamsShareScreenSubtitleHint =
+      'dreams.share_screen.subtitle_hint';
+  static const dreamsShareScreenSymbolArtSuggestions =
+      'dreams.share_screen.symbol_art_suggestions';
+  static const dreamsShareScreenSymbolArtTemplate =
+      'dreams.share_screen.symbol_art_template';
+  static const dreamsShareScreenSymbolInsightTitle =
+      'dreams.share_screen.symbol_insight_title';
+  static const dreamsShareScreenTabCards = 'dreams.share_screen.tab_cards';
+  static const dreamsShareScreenTabCustomize =
+      'dreams.share_screen.tab_customize';
+  static const dreamsShareScreenTabGenerated =
+      'dreams.share_screen.tab_generated';
+  static const dreamsShareScreenTabTemplates =
+      'dreams.share_screen.tab_templates';
+  static const dreamsShareScreenTemplateArchetype =
+      'dreams.share_screen.template_archetype';
+  static const dreamsShareScreenTemplateArchetypeDesc =
+      'dreams.share_screen.template_archetype_desc';
+  static const dreamsShareScreenTemplateMoonPhase =
+      'dreams.share_screen.template_moon_phase';
+  static const dreamsShareScreenTemplateMoonPhaseDesc =
+      'dreams.share_screen.template_moon_phase_desc';
+  static const dreamsShareScreenTemplateSymbol =
+      'dreams.share_screen.template_symbol';
+  static const dreamsShareScreenTemplateSymbolDesc =
+      'dreams.share_screen.template_symbol_desc';
+  static const dreamsShareScreenTemplateTonight =
+      'dreams.share_screen.template_tonight';
+  static const dreamsShareScreenTemplateTonightDesc =
+      'dreams.share_screen.template_tonight_desc';
+  static const dreamsShareScreenTemplateWeekly =
+      'dreams.share_screen.template_weekly';
+  static const dreamsShareScreenTemplateWeeklyDesc =
+      'dreams.share_screen.template_weekly_desc';
+  static const dreamsShareScreenTonightInMyDream =
+      'dreams.share_screen.tonight_in_my_dream';
+  static const dreamsShareScreenVisualElements =
+      'dreams.share_screen.visual_elements';
+  static const dreamsShareScreenWalkingInDreamLight =
+      'dreams.share_screen.walking_in_dream_light';
+  static const dreamsShareScreenWeeklyDreamSummary =
+      'dreams.share_screen.weekly_dream_summary';
+  static const dreamsShareScreenWeeklySubconsciousGuided =
+      'dreams.share_screen.weekly_subconscious_guided';
+  static const dreamsShareScreenWriteTextHint =
+      'dreams.share_screen.write_text_hint';
+  static const dreamsShareSubtitle = 'dreams.share_subtitle';
+  static const dreamsShareTitle = 'dreams.share_title';
+  static const dreamsStatisticsAchievementsListAwakening =
+      'dreams.statistics.achievements_list.awakening';
+  static const dreamsStatisticsAchievementsListAwakeningDesc =
+      'dreams.statistics.achievements_list.awakening_desc';
+  static const dreamsStatisticsAchievementsListDreamExplorer =
+      'dreams.statistics.achievements_list.dream_explorer';
+  static const dreamsStatisticsAchievementsListDreamExplorerDesc =
+      'dreams.statistics.achievements_list.dream_explorer_desc';
+  static const dreamsStatisticsAchievementsListDreamMaster =
+      'dreams.statistics.achievements_list.dream_master';
+  static const dreamsStatisticsAchievementsListDreamMasterDesc =
+      'dreams.statistics.achievements_list.dream_master_desc';
+  static const dreamsStatisticsAchievementsListDreamTraveler =
+      'dreams.statistics.achievements_list.dream_traveler';
+  static const dreamsStatisticsAchievementsListDreamTravelerDesc =
+      'dreams.statistics.achievements_list.dream_traveler_desc';
+  static const dreamsStatisticsAchievementsListFirstStep =
+      'dreams.statistics.achievements_list.first_step';
+  static const dreamsStatisticsAchievementsListFirstStepDesc =
+      'dreams.statistics.achievements_list.first_step_desc';
+  static const dreamsStatisticsAchievementsListLucidMaster =
+      'dreams.statistics.achievements_list.lucid_master';
+  static const dreamsStatisticsAchievementsListLucidMasterDesc =
+      'dreams.statistics.achievements_list.lucid_master_desc';
+  static const dreamsStatisticsAchievementsListMonthlyStreak =
+      'dreams.statistics.achievements_list.monthly_streak';
+  static const dreamsStatisticsAchievementsListMonthlyStreakDesc =
+      'dreams.statistics.achievements_list.monthly_streak_desc';
+  static const dreamsStatisticsAchievementsListSymbolHunter =
+      'dreams.statistics.achievements_list.symbol_hunter';
+  static const dreamsStatisticsAchievementsListSymbolHunterDesc =
+      'dreams.statistics.achievements_list.symbol_hunter_desc';
+  static const dreamsStatisticsAchievementsListSymbolMaster =
+      'dreams.statistics.achievements_list.symbol_master';
+  static const dreamsStatisticsAchievementsListSymbolMasterDesc =
+      'dreams.statistics.achievements_list.symbol_master_desc';
+  static const dreamsStatisticsAchievementsListWeeklyStreak =
+      'dreams.statistics.achievements_list.weekly_streak';
+  static const dreamsStatisticsAchievementsListWeeklyStreakDesc =
+      'dreams.statistics.achievements_list.weekly_streak_desc';
+  static const dreamsStatisticsCharacterTypesAnimal =
+      'dreams.statistics.character_types.animal';
+  static const dreamsStatisticsCharacterTypesCelebrity =
+      'dreams.statistics.character_types.celebrity';
+  static const dreamsStatisticsCharacterTypesFamily =
+      'dreams.statistics.character_types.family';
+  static const dreamsStatisticsCharacterTypesKnown =
+      'dreams.statistics.character_types.known';
+  static const dreamsStatisticsCharacterTypesOther =
+      'dreams.statistics.character_types.other';
+  static const dreamsStatisticsCharacterTypesStranger =
+      'dreams.statistics.character_types.stranger';
+  static const dreamsStatisticsCharactersAnne =
+      'dreams.statistics.characters.anne';
+  static const dreamsStatisticsCharactersArkadas =
+      'dreams.statistics.characters.arkadas';
+  static const dreamsStatisticsCharactersBaba =
+      'dreams.statistics.characters.baba';
+  static const dreamsStatisticsCharactersBebek =
+      'dreams.statistics.characters.bebek';
+  static const dreamsStatisticsCharactersCocuk =
+      'dreams.statistics.characters.cocuk';
+  static const dreamsStatisticsCharactersDede =
+      'dreams.statistics.characters.dede';
+  static const dreamsStatisticsCharactersEs = 'dreams.statistics.characters.es';
+  static const dreamsStatisticsCharactersHayvan =
+      'dreams.statistics.characters.hayvan';
+  static const dreamsStatisticsCharactersKardes =
+      'dreams.statistics.characters.kardes';
+  static const dreamsStatisticsCharactersNine =
+      'dreams.statistics.characters.nine';
+  static const dreamsStatisticsCharactersOgretmen =
+      'dreams.statistics.characters.ogretmen';
+  static const dreamsStatisticsCharactersPatron =
+      'dreams.statistics.characters.patron';
+  static const dreamsStatisticsCharactersSevgili =
+      'dreams.statistics.characters.sevgili';
+  static const dreamsStatisticsCharactersTaninmayan =
+      'dreams.statistics.characters.taninmayan';
+  static const dreamsStatisticsCharactersUnlu =
+      'dreams.statistics.characters.unlu';
+  static const dreamsStatisticsCharactersYabanci =
+      'dreams.statistics.characters.yabanci';
+  static const dreamsStatisticsLocationTypesCity =
+      'dreams.statistics.location_types.city';
+  static const dreamsStatisticsLocationTypesHome =
+      'dreams.statistics.location_types.home';
+  static const dreamsStatisticsLocationTypesNature =
+      'dreams.statistics.location_types.nature';
+  static const dreamsStatisticsLocationTypesOther =
+      'dreams.statistics.location_types.other';
+  static const dreamsStatisticsLocationTypesUnknownPlace =
+      'dreams.statistics.location_types.unknown_place';
+  static const dreamsStatisticsLocationTypesWorkplace =
+      'dreams.statistics.location_types.workplace';
+  static const dreamsStatisticsLocationsAda = 'dreams.statistics.locations.ada';
+  static const dreamsStatisticsLocationsAraba =
+      'dreams.statistics.locations.araba';
+  static const dreamsStatisticsLocationsDag = 'dreams.statistics.locations.dag';
+  static const dreamsStatisticsLocationsDeniz =
+      'dreams.statistics.locations.deniz';
+  static const dreamsStatisticsLocationsEv = 'dreams.statistics.locations.ev';
+  static const dreamsStatisticsLocationsHastane =
+      'dreams.statistics.locations.hastane';
+  static const dreamsStatisticsLocationsIs = 'dreams.statistics.locations.is';
+  static const dreamsStatisticsLocationsKale =
+      'dreams.statistics.locations.kale';
+  static const dreamsStatisticsLocationsKoy = 'dreams.statistics.locations.koy';
+  static const dreamsStatisticsLocationsMagara =
+      'dreams.statistics.locations.magara';
+  static const dreamsStatisticsLocationsOkul =
+      'dreams.statistics.locations.okul';
+  static const dreamsStatisticsLocationsOrman =
+      'dreams.statistics.locations.orman';
+  static const dreamsStatisticsLocationsSehir =
+      'dreams.statistics.locations.sehir';
+  static const dreamsStatisticsLocationsTren =
+      'dreams.statistics.locations.tren';
+  static const dreamsStatisticsLocationsUcak =
+      'dreams.statistics.locations.ucak';
+  static const dreamsStatisticsLocationsUzay =
+      'dreams.statistics.locations.uzay';
+  static const dreamsStatisticsMoonPhasesTrFirstQuarter =
+      'dreams.statistics.moon_phases_tr.first_quarter';
+  static const dreamsStatisticsMoonPhasesTrFullMoon =
+      'dreams.statistics.moon_phases_tr.full_moon';
+  static const dreamsStatisticsMoonPhasesTrLastQuarter =
+      'dreams.statistics.moon_phases_tr.last_quarter';
+  static const dreamsStatisticsMoonPhasesTrNewMoon =
+      'dreams.statistics.moon_phases_tr.new_moon';
+  static const dreamsStatisticsMoonPhasesTrWaningCrescent =
+      'dreams.statistics.moon_phases_tr.waning_crescent';
+  static const dreamsStatisticsMoonPhasesTrWaningGibbous =
+      'dreams.statistics.moon_phases_tr.waning_gibbous';
+  static const dreamsStatisticsMoonPhasesTrWaxingCrescent =
+      'dreams.statistics.moon_phases_tr.waxing_crescent';
+  static const dreamsStatisticsMoonPhasesTrWaxingGibbous =
+      'dreams.statistics.moon_phases_tr.waxing_gibbous';
+  static const dreamsStatisticsPatternTypesSymbol =
+      'dreams.statistics.pattern_types.symbol';
+  static const dreamsStatisticsPatternTypesTheme =
+      'dreams.statistics.pattern_types.theme';
+  static const dreamsStatisticsSubtitle = 'dreams.statistics_subtitle';
+  static const dreamsStatisticsTitle = 'dreams.statistics_title';
+  static const dreamsSymbolAcknowledgmentsBaby =
+      'dreams.symbol_acknowledgments.baby';
+  static const dreamsSymbolAcknowledgmentsBeingChased =
+      'dreams.symbol_acknowledgments.being_chased';
+  static const dreamsSymbolAcknowledgmentsBlood =
+      'dreams.symbol_acknowledgments.blood';
+  static const dreamsSymbolAcknowledgmentsCar =
+      'dreams.symbol_acknowledgments.car';
+  static const dreamsSymbolAcknowledgmentsCat =
+      'dreams.symbol_acknowledgments.cat';
+  static const dreamsSymbolAcknowledgmentsDeath =
+      'dreams.symbol_acknowledgments.death';
+  static const dreamsSymbolAcknowledgmentsDog =
+      'dreams.symbol_acknowledgments.dog';
+  static const dreamsSymbolAcknowledgmentsExam =
+      'dreams.symbol_acknowledgments.exam';
+  static const dreamsSymbolAcknowledgmentsFalling =
+      'dreams.symbol_acknowledgments.falling';
+  static const dreamsSymbolAcknowledgmentsFire =
+      'dreams.symbol_acknowledgments.fire';
+  static const dreamsSymbolAcknowledgmentsFlying =
+      'dreams.symbol_acknowledgments.flying';
+  static const dreamsSymbolAcknowledgmentsGeneral =
+      'dreams.symbol_acknowledgments.general';
+  static const dreamsSymbolAcknowledgmentsGettingLost =
+      'dreams.symbol_acknowledgments.getting_lost';
+  static const dreamsSymbolAcknowledgmentsHouse =
+      'dreams.symbol_acknowledgments.house';
+  static const dreamsSymbolAcknowledgmentsIllness =
+      'dreams.symbol_acknowledgments.illness';
+  static const dreamsSymbolAcknowledgmentsMoney =
+      'dreams.symbol_acknowledgments.money';
+  static const dreamsSymbolAcknowledgmentsNakedness =
+      'dreams.symbol_acknowledgments.nakedness';
+  static const dreamsSymbolAcknowledgmentsSnake =
+      'dreams.symbol_acknowledgments.snake';
+  static const dreamsSymbolAcknowledgmentsTeeth =
+      'dreams.symbol_acknowledgments.teeth';
+  static const dreamsSymbolAcknowledgmentsWater =
+      'dreams.symbol_acknowledgments.water';
+  static const dreamsSymbolAcknowledgmentsWedding =
+      'dreams.symbol_acknowledgments.wedding';
+  static const dreamsSymbolCloud = 'dreams.symbol_cloud';
+  static const dreamsSymbolsFound = 'dreams.symbols_found';
+  static const dreamsTabGeneral = 'dreams.tab_general';
+  static const dreamsTabProgress = 'dreams.tab_progress';
+  static const dreamsTabSymbols = 'dreams.tab_symbols';
+  static const dreamsTabTime = 'dreams.tab_time';
+  static const dreamsThemeClusters = 'dreams.theme_clusters';
+  static const dreamsTitle = 'dreams.title';
+  static const dreamsTotalDreams = 'dreams.total_dreams';
+  static const dreamsUnderstanding = 'dreams.understanding';
+  static const dreamsWeeklyAvg = 'dreams.weekly_avg';
+  static const dreamsWeeklyTrend = 'dreams.weekly_trend';
+  static const elementsAir = 'elements.air';
+  static const elementsEarth = 'elements.earth';
+  static const elementsFire = 'elements.fire';
+  static const elementsWater = 'elements.water';
+  static const energyEnergyMap4WeeksAgo = 'energy.energy_map.4_weeks_ago';
+  static const energyEnergyMapAddAtLeast5EntriesToSeeYourEnerg =
+      'energy.energy_map.add_at_least_5_entries_to_see_your_energ';
+  static const energyEnergyMapAverage = 'energy.energy_map.average';
+  static const energyEnergyMapBestDay = 'energy.energy_map.best_day';
+  static const energyEnergyMapCouldNotLoadYourLocalDataIsUnaffe =
+      'energy.energy_map.could_not_load_your_local_data_is_unaffe';
+  static const energyEnergyMapEnergyByDayArea =
+      'energy.energy_map.energy_by_day_area';
+  static const energyEnergyMapEnergyProfile =
+      'energy.energy_map.energy_profile';
+  static const energyEnergyMapHigh = 'energy.energy_map.high';
+  static const energyEnergyMapLast28Days = 'energy.energy_map.last_28_days';
+  static const energyEnergyMapLow = 'energy.energy_map.low';
+  static const energyEnergyMapObservations = 'energy.energy_map.observations';
+  static const energyEnergyMapRetry = 'energy.energy_map.retry';
+  static const energyEnergyMapStrongest = 'energy.energy_map.strongest';
+  static const energyEnergyMapToday = 'energy.energy_map.today';
+  static const energyEnergyMapWriteFirstEntry =
+      'energy.energy_map.write_first_entry';
+  static const energyEnergyMapYourEnergyMapIsTakingShape =
+      'energy.energy_map.your_energy_map_is_taking_shape';
+  static const errorPageNotFound = 'error.page_not_found';
+  static const errorReloadPage = 'error.reload_page';
+  static const errorsGenericError = 'errors.generic_error';
+  static const errorsNetworkError = 'errors.network_error';
+  static const errorsSaveFailed = 'errors.save_failed';
+  static const exportExportAccess = 'export.export.access';
+  static const exportExportCopyToClipboard = 'export.export.copy_to_clipboard';
+  static const exportExportCouldNotLoadYourLocalDataIsUnaffe =
+      'export.export.could_not_load_your_local_data_is_unaffe';
+  static const exportExportDeveloperfriendlyFormat =
+      'export.export.developerfriendly_format';
+  static const exportExportExportData = 'export.export.export_data';
+  static const exportExportExportDataCopiedToClipboard =
+      'export.export.export_data_copied_to_clipboard';
+  static const exportExportExportFormat = 'export.export.export_format';
+  static const exportExportExportShare = 'export.export.export_share';
+  static const exportExportExportYourFullJournalHistoryInAny =
+      'export.export.export_your_full_journal_history_in_any';
+  static const exportExportFreeLast7DaysAsTextUpgradeForFul =
+      'export.export.free_last_7_days_as_text_upgrade_for_ful';
+  static const exportExportHumanreadableFormat =
+      'export.export.humanreadable_format';
+  static const exportExportPlainText = 'export.export.plain_text';
+  static const exportExportRetry = 'export.export.retry';
+  static const exportExportSpreadsheetCompatible =
+      'export.export.spreadsheet_compatible';
+  static const exportExportTotalEntries = 'export.export.total_entries';
+  static const exportExportWillExport = 'export.export.will_export';
+  static const flowersCarnation = 'flowers.carnation';
+  static const flowersChrysanthemum = 'flowers.chrysanthemum';
+  static const flowersDaisy = 'flowers.daisy';
+  static const flowersLavender = 'flowers.lavender';
+  static const flowersLily = 'flowers.lily';
+  static const flowersOrchid = 'flowers.orchid';
+  static const flowersPansy = 'flowers.pansy';
+  static const flowersPoppy = 'flowers.poppy';
+  static const flowersRose = 'flowers.rose';
+  static const flowersSunflower = 'flowers.sunflower';
+  static const flowersViolet = 'flowers.violet';
+  static const flowersWaterLily = 'flowers.water_lily';
+  static const glossaryHintsElement = 'glossary.hints.element';
+  static const glossaryHintsModality = 'glossary.hints.modality';
+  static const glossaryHintsMoon = 'glossary.hints.moon';
+  static const glossaryHintsPersonalProfile = 'glossary.hints.personal_profile';
+  static const glossaryHintsSun = 'glossary.hints.sun';
+  static const gratitudeArchiveEntryCount = 'gratitude.archive.entry_count';
+  static const gratitudeGratitudeAddAnother = 'gratitude.gratitude.add_another';
+  static const gratitudeGratitudeDays = 'gratitude.gratitude.days';
+  static const gratitudeGratitudeGratitude = 'gratitude.gratitude.gratitude';
+  static const gratitudeGratitudeGratitudeJournal =
+      'gratitude.gratitude.gratitude_journal';
+  static const gratitudeGratitudeHistory = 'gratitude.gratitude.history';
+  static const gratitudeGratitudeImGratefulFor =
+      'gratitude.gratitude.im_grateful_for';
+  static const gratitudeGratitudeItems = 'gratitude.gratitude.items';
+  static const gratitudeGratitudePremiumAddUpTo3GratitudeItemsThem =
+      'gratitude.gratitude.premium_add_up_to_3_gratitude_items_them';
+  static const gratitudeGratitudeRetry = 'gratitude.gratitude.retry';
+  static const gratitudeGratitudeSaveGratitude =
+      'gratitude.gratitude.save_gratitude';
+  static const gratitudeGratitudeThemes = 'gratitude.gratitude.themes';
+  static const gratitudeGratitudeThisWeeksGratitude =
+      'gratitude.gratitude.this_weeks_gratitude';
+  static const gratitudeGratitudeThisWeeksThemes =
+      'gratitude.gratitude.this_weeks_themes';
+  static const gratitudeGratitudeUpdate = 'gratitude.gratitude.update';
+  static const gratitudeGratitudeWhatWentWellToday =
+      'gratitude.gratitude.what_went_well_today';
+  static const gratitudeGratitudeArchiveGratitudeArchive =
+      'gratitude.gratitude_archive.gratitude_archive';
+  static const gratitudeGratitudeArchiveGratitudeArchive1 =
+      'gratitude.gratitude_archive.gratitude_archive_1';
+  static const gratitudeGratitudeArchiveRecurringThemes =
+      'gratitude.gratitude_archive.recurring_themes';
+  static const gratitudeGratitudeArchiveRetry =
+      'gratitude.gratitude_archive.retry';
+  static const gratitudeGratitudeArchiveThisWeek =
+      'gratitude.gratitude_archive.this_week';
+  static const gratitudeGratitudeArchiveTotalDays =
+      'gratitude.gratitude_archive.total_days';
+  static const gratitudeGratitudeArchiveWeekItems =
+      'gratitude.gratitude_archive.week_items';
+  static const gratitudeTodaysGratitude = 'gratitude.todays_gratitude';
+  static const greetingsAfternoon = 'greetings.afternoon';
+  static const greetingsCosmicWelcome = 'greetings.cosmic_welcome';
+  static const greetingsEvening = 'greetings.evening';
+  static const greetingsLateNight = 'greetings.late_night';
+  static const greetingsMorning = 'greetings.morning';
+  static const greetingsNight = 'greetings.night';
+  static const growthBestStreakDays = 'growth.best_streak_days';
+  static const growthGrowthDashboard1EntryToActivate =
+      'growth.growth_dashboard.1_entry_to_activate';
+  static const growthGrowthDashboard30dayStreak =
+      'growth.growth_dashboard.30day_streak';
+  static const growthGrowthDashboard36Modules =
+      'growth.growth_dashboard.36_modules';
+  static const growthGrowthDashboard56HabitsToTry =
+      'growth.growth_dashboard.56_habits_to_try';
+  static const growthGrowthDashboard7dayObserver =
+      'growth.growth_dashboard.7day_observer';
+  static const growthGrowthDashboardAchievements =
+      'growth.growth_dashboard.achievements';
+  static const growthGrowthDashboardAverageMood =
+      'growth.growth_dashboard.average_mood';
+  static const growthGrowthDashboardBeginYourProgressOneEntryAtATime =
+      'growth.growth_dashboard.begin_your_progress_one_entry_at_a_time';
+  static const growthGrowthDashboardBlindSpots =
+      'growth.growth_dashboard.blind_spots';
+  static const growthGrowthDashboardChallengeCompleter =
+      'growth.growth_dashboard.challenge_completer';
+  static const growthGrowthDashboardChallengesCompleted =
+      'growth.growth_dashboard.challenges_completed';
+  static const growthGrowthDashboardDays = 'growth.growth_dashboard.days';
+  static const growthGrowthDashboardDreamLogger =
+      'growth.growth_dashboard.dream_logger';
+  static const growthGrowthDashboardDreamsLogged =
+      'growth.growth_dashboard.dreams_logged';
+  static const growthGrowthDashboardEmotionalProfile =
+      'growth.growth_dashboard.emotional_profile';
+  static const growthGrowthDashboardEntriesThisMonth =
+      'growth.growth_dashboard.entries_this_month';
+  static const growthGrowthDashboardExploreGrowthTools =
+      'growth.growth_dashboard.explore_growth_tools';
+  static const growthGrowthDashboardFirstEntry =
+      'growth.growth_dashboard.first_entry';
+  static const growthGrowthDashboardGoodStartEveryEntryBringsYouCloser =
+      'growth.growth_dashboard.good_start_every_entry_brings_you_closer';
+  static const growthGrowthDashboardGratitudeEntries =
+      'growth.growth_dashboard.gratitude_entries';
+  static const growthGrowthDashboardGratitudeStreak =
+      'growth.growth_dashboard.gratitude_streak';
+  static const growthGrowthDashboardGreatProgressKeepBuildingYourHabits =
+      'growth.growth_dashboard.great_progress_keep_building_your_habits';
+  static const growthGrowthDashboardGrowthScore =
+      'growth.growth_dashboard.growth_score';
+  static const growthGrowthDashboardHiddenPatterns =
+      'growth.growth_dashboard.hidden_patterns';
+  static const growthGrowthDashboardInsights =
+      'growth.growth_dashboard.insights';
+  static const growthGrowthDashboardMicrohabits =
+      'growth.growth_dashboard.microhabits';
+  static const growthGrowthDashboardMilestones =
+      'growth.growth_dashboard.milestones';
+  static const growthGrowthDashboardMilestones1 =
+      'growth.growth_dashboard.milestones_1';
+  static const growthGrowthDashboardMostTrackedArea =
+      'growth.growth_dashboard.most_tracked_area';
+  static const growthGrowthDashboardNa = 'growth.growth_dashboard.na';
+  static const growthGrowthDashboardNoneYet =
+      'growth.growth_dashboard.none_yet';
+  static const growthGrowthDashboardOutstandingYouAreDeeplyCommittedTo =
+      'growth.growth_dashboard.outstanding_you_are_deeply_committed_to';
+  static const growthGrowthDashboardPatternSeeker =
+      'growth.growth_dashboard.pattern_seeker';
+  static const growthGrowthDashboardRetry = 'growth.growth_dashboard.retry';
+  static const growthGrowthDashboardSelfAware =
+      'growth.growth_dashboard.self_aware';
+  static const growthGrowthDashboardShareYourProgress =
+      'growth.growth_dashboard.share_your_progress';
+  static const growthGrowthDashboardShareYourProgress1 =
+      'growth.growth_dashboard.share_your_progress_1';
+  static const growthGrowthDashboardStoryTeller =
+      'growth.growth_dashboard.story_teller';
+  static const growthGrowthDashboardThisMonth =
+      'growth.growth_dashboard.this_month';
+  static const growthGrowthDashboardYourArchetype =
+      'growth.growth_dashboard.your_archetype';
+  static const growthGrowthDashboardYourGrowth =
+      'growth.growth_dashboard.your_growth';
+  static const habitsDailyHabitsAllDoneForToday =
+      'habits.daily_habits.all_done_for_today';
+  static const habitsDailyHabitsBrowseAllHabits =
+      'habits.daily_habits.browse_all_habits';
+  static const habitsDailyHabitsBrowseAllHabits1 =
+      'habits.daily_habits.browse_all_habits_1';
+  static const habitsDailyHabitsBrowseHabits =
+      'habits.daily_habits.browse_habits';
+  static const habitsDailyHabitsBrowseTheHabitLibraryAndAdoptHabit =
+      'habits.daily_habits.browse_the_habit_library_and_adopt_habit';
+  static const habitsDailyHabitsMarkComplete =
+      'habits.daily_habits.mark_complete';
+  static const habitsDailyHabitsMarkIncomplete =
+      'habits.daily_habits.mark_incomplete';
+  static const habitsDailyHabitsMin = 'habits.daily_habits.min';
+  static const habitsDailyHabitsRetry = 'habits.daily_habits.retry';
+  static const habitsDailyHabitsRoutineTracker =
+      'habits.daily_habits.routine_tracker';
+  static const habitsDailyHabitsTodaysProgress =
+      'habits.daily_habits.todays_progress';
+  static const habitsDailyHabitsYourHabitRoutineStartsHere =
+      'habits.daily_habits.your_habit_routine_starts_here';
+  static const habitsHabitSuggestionsAdoptThisHabit =
+      'habits.habit_suggestions.adopt_this_habit';
+  static const habitsHabitSuggestionsAdopted =
+      'habits.habit_suggestions.adopted';
+  static const habitsHabitSuggestionsAdopted1 =
+      'habits.habit_suggestions.adopted_1';
+  static const habitsHabitSuggestionsAdopted2 =
+      'habits.habit_suggestions.adopted_2';
+  static const habitsHabitSuggestionsAll = 'habits.habit_suggestions.all';
+  static const habitsHabitSuggestionsBookmark =
+      'habits.habit_suggestions.bookmark';
+  static const habitsHabitSuggestionsHabitsExplored =
+      'habits.habit_suggestions.habits_explored';
+  static const habitsHabitSuggestionsMarkAsTried =
+      'habits.habit_suggestions.mark_as_tried';
+  static const habitsHabitSuggestionsMicrohabits =
+      'habits.habit_suggestions.microhabits';
+  static const habitsHabitSuggestionsMin = 'habits.habit_suggestions.min';
+  static const habitsHabitSuggestionsMin1 = 'habits.habit_suggestions.min_1';
+  static const habitsHabitSuggestionsMinutes =
+      'habits.habit_suggestions.minutes';
+  static const habitsHabitSuggestionsRemoveBookmark =
+      'habits.habit_suggestions.remove_bookmark';
+  static const habitsHabitSuggestionsRetry = 'habits.habit_suggestions.retry';
+  static const habitsHabitSuggestionsShowAllHabits =
+      'habits.habit_suggestions.show_all_habits';
+  static const habitsHabitSuggestionsShowBookmarks =
+      'habits.habit_suggestions.show_bookmarks';
+  static const habitsHabitSuggestionsTodaysHabit =
+      'habits.habit_suggestions.todays_habit';
+  static const habitsHabitSuggestionsTried = 'habits.habit_suggestions.tried';
+  static const habitsHabitSuggestionsTried1 =
+      'habits.habit_suggestions.tried_1';
+  static const habitsHabitSuggestionsTried2 =
+      'habits.habit_suggestions.tried_2';
+  static const habitsHabitSuggestionsTryIt = 'habits.habit_suggestions.try_it';
+  static const habitsHabitSuggestionsTryThisHabit =
+      'habits.habit_suggestions.try_this_habit';
+  static const habitsHabitSuggestionsYourBookmarkListIsReadyForHabits =
+      'habits.habit_suggestions.your_bookmark_list_is_ready_for_habits';
+  static const homeAllAnalyses = 'home.all_analyses';
+  static const homeAllServices = 'home.all_services';
+  static const homeAllServicesDesc = 'home.all_services_desc';
+  static const homeAskStarsHint = 'home.ask_stars_hint';
+  static const homeAskStarsShort = 'home.ask_stars_short';
+  static const homeChipsBreathe = 'home.chips.breathe';
+  static const homeChipsDream = 'home.chips.dream';
+  static const homeChipsGrowth = 'home.chips.growth';
+  static const homeChipsInsight = 'home.chips.insight';
+  static const homeChipsJournal = 'home.chips.journal';
+  static const homeChipsPatterns = 'home.chips.patterns';
+  static const homeCosmicConnectionLost = 'home.cosmic_connection_lost';
+  static const homeCurrentlyInSky = 'home.currently_in_sky';
+  static const homeDailyTheme = 'home.daily_theme';
+  static const homeDetailedReading = 'home.detailed_reading';
+  static const homeDiscoverStarsWisdom = 'home.discover_stars_wisdom';
+  static const homeEntriesDailyJournalSubtitle =
+      'home.entries.daily_journal.subtitle';
+  static const homeEntriesDailyJournalTitle =
+      'home.entries.daily_journal.title';
+  static const homeEntriesDreamSubtitle = 'home.entries.dream.subtitle';
+  static const homeEntriesDreamTitle = 'home.entries.dream.title';
+  static const homeEntriesShareInsightSubtitle =
+      'home.entries.share_insight.subtitle';
+  static const homeEntriesShareInsightTitle =
+      'home.entries.share_insight.title';
+  static const homeExploreCategory = 'home.explore_category';
+  static const homeFeaturedQuestionsDarkestSecret =
+      'home.featured_questions.darkest_secret';
+  static const homeFeaturedQuestionsDeepConnection =
+      'home.featured_questions.deep_connection';
+  static const homeFeaturedQuestionsFuture = 'home.featured_questions.future';
+  static const homeFeaturedQuestionsLoveImprove =
+      'home.featured_questions.love_improve';
+  static const homeFeaturedQuestionsLuckToday =
+      'home.featured_questions.luck_today';
+  static const homeFeaturedQuestionsRich = 'home.featured_questions.rich';
+  static const homeGetCosmicMessage = 'home.get_cosmic_message';
+  static const homeGreeting = 'home.greeting';
+  static const homeIllumination = 'home.illumination';
+  static const homeKozmozMaster = 'home.kozmoz_master';
+  static const homeKozmozSubtitle = 'home.kozmoz_subtitle';
+  static const homeLightMode = 'home.light_mode';
+  static const homeLuck = 'home.luck';
+  static const homeMeditationSubtitle = 'home.meditation_subtitle';
+  static const homeMoreToolsCategory = 'home.more_tools_category';
+  static const homeMostPopularQuestions = 'home.most_popular_questions';
+  static const homeNoResults = 'home.no_results';
+  static const homeOtherQuestions = 'home.other_questions';
+  static const homeOtherToolsSubtitle = 'home.other_tools.subtitle';
+  static const homeOtherToolsTitle = 'home.other_tools.title';
+  static const homeOtherToolsWeeklyTooltip = 'home.other_tools.weekly_tooltip';
+  static const homePersonalizedReadings = 'home.personalized_readings';
+  static const homeQuestionsAttentionThisWeek =
+      'home.questions.attention_this_week';
+  static const homeQuestionsBigChange = 'home.questions.big_change';
+  static const homeQuestionsCheating = 'home.questions.cheating';
+  static const homeQuestionsCommunicationThemes =
+      'home.questions.communication_themes';
+  static const homeQuestionsCommunicatorDecisions =
+      'home.questions.communicator_decisions';
+  static const homeQuestionsDeepConnectionFind =
+      'home.questions.deep_connection_find';
+  static const homeQuestionsDoesLikeMe = 'home.questions.does_like_me';
+  static const homeQuestionsExReturn = 'home.questions.ex_return';
+  static const homeQuestionsFireWater = 'home.questions.fire_water';
+  static const homeQuestionsFutureLove = 'home.questions.future_love';
+  static const homeQuestionsGambling = 'home.questions.gambling';
+  static const homeQuestionsGratitudeStar = 'home.questions.gratitude_star';
+  static const homeQuestionsJobChange = 'home.questions.job_change';
+  static const homeQuestionsLoveLuckToday = 'home.questions.love_luck_today';
+  static const homeQuestionsMarriageProposal =
+      'home.questions.marriage_proposal';
+  static const homeQuestionsMostJealous = 'home.questions.most_jealous';
+  static const homeQuestionsMostLoyal = 'home.questions.most_loyal';
+  static const homeQuestionsMostPassionate = 'home.questions.most_passionate';
+  static const homeQuestionsNoMessage = 'home.questions.no_message';
+  static const homeQuestionsPerformerAttention =
+      'home.questions.performer_attention';
+  static const homeQuestionsPioneerMan = 'home.questions.pioneer_man';
+  static const homeQuestionsPromotion = 'home.questions.promotion';
+  static const homeQuestionsRichBecome = 'home.questions.rich_become';
+  static const homeQuestionsTransformerWomen =
+      'home.questions.transformer_women';
+  static const homeSearchHint = 'home.search_hint';
+  static const homeSectionsGrowthDiscovery = 'home.sections.growth_discovery';
+  static const homeSectionsJournalPatterns = 'home.sections.journal_patterns';
+  static const homeShareCosmicEnergy = 'home.share_cosmic_energy';
+  static const homeShareOnInstagram = 'home.share_on_instagram';
+  static const homeSpecialReadings = 'home.special_readings';
+  static const homeTodaysCosmicMessage = 'home.todays_cosmic_message';
+  static const homeTodaysCosmicWhisper = 'home.todays_cosmic_whisper';
+  static const homeTooltipsAllCosmicTools = 'home.tooltips.all_cosmic_tools';
+  static const homeTooltipsAllKozmoz = 'home.tooltips.all_kozmoz';
+  static const homeTooltipsCardInsight = 'home.tooltips.card_insight';
+  static const homeTooltipsMonthly = 'home.tooltips.monthly';
+  static const homeTooltipsYearly = 'home.tooltips.yearly';
+  static const inputBirthDate = 'input.birth_date';
+  static const inputBirthDateRequired = 'input.birth_date_required';
+  static const inputBirthPlace = 'input.birth_place';
+  static const inputBirthPlaceRequired = 'input.birth_place_required';
+  static const inputBirthTime = 'input.birth_time';
+  static const inputBirthTimeRequired = 'input.birth_time_required';
+  static const inputDate = 'input.date';
+  static const inputName = 'input.name';
+  static const inputNameHint = 'input.name_hint';
+  static const inputNameRequired = 'input.name_required';
+  static const inputPlace = 'input.place';
+  static const inputPleaseEnterName = 'input.please_enter_name';
+  static const inputPopularCities = 'input.popular_cities';
+  static const inputProfileNameHint = 'input.profile_name_hint';
+  static const inputRequiredForMoon = 'input.required_for_moon';
+  static const inputRequiredForRising = 'input.required_for_rising';
+  static const inputSearchCity = 'input.search_city';
+  static const inputSelectCity = 'input.select_city';
+  static const inputSelectLocationOptional = 'input.select_location_optional';
+  static const inputSelectTime = 'input.select_time';
+  static const inputSelectTimeOptional = 'input.select_time_optional';
+  static const inputTime = 'input.time';
+  static const inputTurkeyKktc = 'input.turkey_kktc';
+  static const inputWholeWorld = 'input.whole_world';
+  static const inputYourName = 'input.your_name';
+  static const insightDefaultUser = 'insight.default_user';
+  static const insightDisclaimer = 'insight.disclaimer';
+  static const insightError = 'insight.error';
+  static const insightGreeting = 'insight.greeting';
+  static const insightInputHint = 'insight.input_hint';
+  static const insightInsightsDiscoveryAddBookmark =
+      'insight.insights_discovery.add_bookmark';
+  static const insightInsightsDiscoveryAll = 'insight.insights_discovery.all';
+  static const insightInsightsDiscoveryCouldNotLoadYourLocalDataIsUnaffe =
+      'insight.insights_discovery.could_not_load_your_local_data_is_unaffe';
+  static const insightInsightsDiscoveryDiscoverInsights =
+      'insight.insights_discovery.discover_insights';
+  static const insightInsightsDiscoveryNoInsightsFound =
+      'insight.insights_discovery.no_insights_found';
+  static const insightInsightsDiscoveryReadingProgress =
+      'insight.insights_discovery.reading_progress';
+  static const insightInsightsDiscoveryRelatedInsights =
+      'insight.insights_discovery.related_insights';
+  static const insightInsightsDiscoveryRemoveBookmark =
+      'insight.insights_discovery.remove_bookmark';
+  static const insightInsightsDiscoveryRetry =
+      'insight.insights_discovery.retry';
+  static const insightInsightsDiscoveryShowAllInsights =
+      'insight.insights_discovery.show_all_insights';
+  static const insightInsightsDiscoveryShowBookmarks =
+      'insight.insights_discovery.show_bookmarks';
+  static const insightInsightsDiscoveryTapToRead =
+      'insight.insights_discovery.tap_to_read';
+  static const insightInsightsDiscoveryTodaysInsight =
+      'insight.insights_discovery.todays_insight';
+  static const insightInsightsDiscoveryWhyThisMatters =
+      'insight.insights_discovery.why_this_matters';
+  static const insightIntro = 'insight.intro';
+  static const insightResponsesDecision1 = 'insight.responses.decision_1';
+  static const insightResponsesDecision2 = 'insight.responses.decision_2';
+  static const insightResponsesDreamChase = 'insight.responses.dream_chase';
+  static const insightResponsesDreamFalling = 'insight.responses.dream_falling';
+  static const insightResponsesDreamFlying = 'insight.responses.dream_flying';
+  static const insightResponsesDreamGeneral1 =
+      'insight.responses.dream_general_1';
+  static const insightResponsesDreamGeneral2 =
+      'insight.responses.dream_general_2';
+  static const insightResponsesDreamTeeth = 'insight.responses.dream_teeth';
+  static const insightResponsesDreamWater = 'insight.responses.dream_water';
+  static const insightResponsesEmotionAnger = 'insight.responses.emotion_anger';
+  static const insightResponsesEmotionAnxiety =
+      'insight.responses.emotion_anxiety';
+  static const insightResponsesEmotionGeneral =
+      'insight.responses.emotion_general';
+  static const insightResponsesEmotionOverwhelmed =
+      'insight.responses.emotion_overwhelmed';
+  static const insightResponsesEmotionSadness =
+      'insight.responses.emotion_sadness';
+  static const insightResponsesGeneral1 = 'insight.responses.general_1';
+  static const insightResponsesGeneral2 = 'insight.responses.general_2';
+  static const insightResponsesPattern1 = 'insight.responses.pattern_1';
+  static const insightResponsesPattern2 = 'insight.responses.pattern_2';
+  static const insightResponsesRelationship1 =
+      'insight.responses.relationship_1';
+  static const insightResponsesRelationship2 =
+      'insight.responses.relationship_2';
+  static const insightResponsesSelfDiscovery1 =
+      'insight.responses.self_discovery_1';
+  static const insightResponsesSelfDiscovery2 =
+      'insight.responses.self_discovery_2';
+  static const insightSendMessage = 'insight.send_message';
+  static const insightStartReflection = 'insight.start_reflection';
+  static const insightSuggestionsDecision = 'insight.suggestions.decision';
+  static const insightSuggestionsDream = 'insight.suggestions.dream';
+  static const insightSuggestionsFeeling = 'insight.suggestions.feeling';
+  static const insightTitle = 'insight.title';
+  static const insightTyping = 'insight.typing';
+  static const insightWelcomeAfternoon = 'insight.welcome.afternoon';
+  static const insightWelcomeEvening = 'insight.welcome.evening';
+  static const insightWelcomeMorning = 'insight.welcome.morning';
+  static const insightWelcomeNight = 'insight.welcome.night';
+  static const insightsCycleEffectTitle = 'insights.cycle_effect_title';
+  static const insightsDailyEnergyContent = 'insights.daily_energy_content';
+  static const insightsDailyEnergyTitle = 'insights.daily_energy_title';
+  static const insightsDreamGuideContent = 'insights.dream_guide_content';
+  static const insightsDreamGuideTitle = 'insights.dream_guide_title';
+  static const insightsWeeklyPreviewContent = 'insights.weekly_preview_content';
+  static const insightsWeeklyPreviewTitle = 'insights.weekly_preview_title';
+  static const journalAnnualReportAnExtraordinaryYearOfSelfreflection =
+      'journal.annual_report.an_extraordinary_year_of_selfreflection';
+  static const journalAnnualReportAverageRatingByMonth =
+      'journal.annual_report.average_rating_by_month';
+  static const journalAnnualReportAvgRating =
+      'journal.annual_report.avg_rating';
+  static const journalAnnualReportCouldntLoadYourAnnualReport =
+      'journal.annual_report.couldnt_load_your_annual_report';
+  static const journalAnnualReportEntries = 'journal.annual_report.entries';
+  static const journalAnnualReportEntriesRecorded =
+      'journal.annual_report.entries_recorded';
+  static const journalAnnualReportEveryEntryYouWroteWasAStepToward =
+      'journal.annual_report.every_entry_you_wrote_was_a_step_toward';
+  static const journalAnnualReportLongestStreak =
+      'journal.annual_report.longest_streak';
+  static const journalAnnualReportMostActiveMonth =
+      'journal.annual_report.most_active_month';
+  static const journalAnnualReportMyYearInReviewWithInnercyclesInner =
+      'journal.annual_report.my_year_in_review_with_innercycles_inner';
+  static const journalAnnualReportRetry = 'journal.annual_report.retry';
+  static const journalAnnualReportShare = 'journal.annual_report.share';
+  static const journalAnnualReportTopFocusAreas =
+      'journal.annual_report.top_focus_areas';
+  static const journalAnnualReportWriteFirstEntry =
+      'journal.annual_report.write_first_entry';
+  static const journalAnnualReportYearSynthesis =
+      'journal.annual_report.year_synthesis';
+  static const journalAnnualReportYearSynthesis1 =
+      'journal.annual_report.year_synthesis_1';
+  static const journalAnnualReportYouBeganBuildingSelfawarenessThisYe =
+      'journal.annual_report.you_began_building_selfawareness_this_ye';
+  static const journalAnnualReportYouShowedUpConsistentlyForYourself =
+      'journal.annual_report.you_showed_up_consistently_for_yourself';
+  static const journalAnnualReportYourYearSynthesis =
+      'journal.annual_report.your_year_synthesis';
+  static const journalAnnualReportYourYearinreviewWillComeAliveWithE =
+      'journal.annual_report.your_yearinreview_will_come_alive_with_e';
+  static const journalArchiveAll = 'journal.archive.all';
+  static const journalArchiveArchive = 'journal.archive.archive';
+  static const journalArchiveCancel = 'journal.archive.cancel';
+  static const journalArchiveClearSearch = 'journal.archive.clear_search';
+  static const journalArchiveDelete = 'journal.archive.delete';
+  static const journalArchiveDeleteEntry = 'journal.archive.delete_entry';
+  static const journalArchiveEntrySemanticsLabel =
+      'journal.archive.entry_semantics_label';
+  static const journalArchiveFilterLabel = 'journal.archive.filter_label';
+  static const journalArchiveRetry = 'journal.archive.retry';
+  static const journalArchiveSearchByDateMoodOrText =
+      'journal.archive.search_by_date_mood_or_text';
+  static const journalArchiveThisJournalEntryWillBePermanentlyD =
+      'journal.archive.this_journal_entry_will_be_permanently_d';
+  static const journalArchiveWordCount = 'journal.archive.word_count';
+  static const journalArchiveWriteFirstEntry =
+      'journal.archive.write_first_entry';
+  static const journalArchiveYourJournalEntriesWillAppearHereAs =
+      'journal.archive.your_journal_entries_will_appear_here_as';
+  static const journalArchiveYourJournalIsABlankPageReadyWhen =
+      'journal.archive.your_journal_is_a_blank_page_ready_when';
+  static const journalCycleSummaryCurrentAvg =
+      'journal.cycle_summary.current_avg';
+  static const journalCycleWavePainterEmotionalCycleWaveChart =
+      'journal.cycle_wave_painter.emotional_cycle_wave_chart';
+  static const journalDailyEntryAddAPhoto = 'journal.daily_entry.add_a_photo';
+  static const journalDailyEntryAddAPhoto1 =
+      'journal.daily_entry.add_a_photo_1';
+  static const journalDailyEntryCancel = 'journal.daily_entry.cancel';
+  static const journalDailyEntryChange = 'journal.daily_entry.change';
+  static const journalDailyEntryContinue = 'journal.daily_entry.continue';
+  static const journalDailyEntryContinue1 = 'journal.daily_entry.continue_1';
+  static const journalDailyEntryDayNames = 'journal.daily_entry.day_names';
+  static const journalDailyEntryDayStreak = 'journal.daily_entry.day_streak';
+  static const journalDailyEntryDetails = 'journal.daily_entry.details';
+  static const journalDailyEntryDetailsOptional =
+      'journal.daily_entry.details_optional';
+  static const journalDailyEntryDifficult = 'journal.daily_entry.difficult';
+  static const journalDailyEntryDiscard = 'journal.daily_entry.discard';
+  static const journalDailyEntryDiscardChanges =
+      'journal.daily_entry.discard_changes';
+  static const journalDailyEntryEgWorkPersonal =
+      'journal.daily_entry.eg_work_personal';
+  static const journalDailyEntryEnUs = 'journal.daily_entry.en_us';
+  static const journalDailyEntryFirstEntryHashtags =
+      'journal.daily_entry.first_entry_hashtags';
+  static const journalDailyEntryFirstEntryShare =
+      'journal.daily_entry.first_entry_share';
+  static const journalDailyEntryFirstEntrySubtitle =
+      'journal.daily_entry.first_entry_subtitle';
+  static const journalDailyEntryFocusArea = 'journal.daily_entry.focus_area';
+  static const journalDailyEntryGood = 'journal.daily_entry.good';
+  static const journalDailyEntryGreat = 'journal.daily_entry.great';
+  static const journalDailyEntryHowDidYourDayFeel =
+      'journal.daily_entry.how_did_your_day_feel';
+  static const journalDailyEntryInvite = 'journal.daily_entry.invite';
+  static const journalDailyEntryJournalPhoto =
+      'journal.daily_entry.journal_photo';
+  static const journalDailyEntryKeepJournalingToRevealYourPatterns =
+      'journal.daily_entry.keep_journaling_to_reveal_your_patterns';
+  static const journalDailyEntryLogYourDay = 'journal.daily_entry.log_your_day';
+  static const journalDailyEntryLovingInnercyclesInviteAFriendYouB =
+      'journal.daily_entry.loving_innercycles_invite_a_friend_you_b';
+  static const journalDailyEntryLow = 'journal.daily_entry.low';
+  static const journalDailyEntryMilestoneHashtags =
+      'journal.daily_entry.milestone_hashtags';
+  static const journalDailyEntryMilestoneMessage =
+      'journal.daily_entry.milestone_message';
+  static const journalDailyEntryMilestoneMessage100 =
+      'journal.daily_entry.milestone_message_100';
+  static const journalDailyEntryMilestoneShare =
+      'journal.daily_entry.milestone_share';
+  static const journalDailyEntryMilestoneShareSub =
+      'journal.daily_entry.milestone_share_sub';
+  static const journalDailyEntryMilestoneTitle =
+      'journal.daily_entry.milestone_title';
+  static const journalDailyEntryNeutral = 'journal.daily_entry.neutral';
+  static const journalDailyEntryNeutral1 = 'journal.daily_entry.neutral_1';
+  static const journalDailyEntryNotesOptional =
+      'journal.daily_entry.notes_optional';
+  static const journalDailyEntryOverallRating =
+      'journal.daily_entry.overall_rating';
+  static const journalDailyEntryPhotoOptional =
+      'journal.daily_entry.photo_optional';
+  static const journalDailyEntryRating = 'journal.daily_entry.rating';
+  static const journalDailyEntryRatingLabels =
+      'journal.daily_entry.rating_labels';
+  static const journalDailyEntryRemove = 'journal.daily_entry.remove';
+  static const journalDailyEntrySaveEntry = 'journal.daily_entry.save_entry';
+  static const journalDailyEntrySaveEntry1 = 'journal.daily_entry.save_entry_1';
+  static const journalDailyEntrySaveError = 'journal.daily_entry.save_error';
+  static const journalDailyEntryShare = 'journal.daily_entry.share';
+  static const journalDailyEntryStreakNudge =
+      'journal.daily_entry.streak_nudge';
+  static const journalDailyEntryTagsOptional =
+      'journal.daily_entry.tags_optional';
+  static const journalDailyEntryTapToSpeak = 'journal.daily_entry.tap_to_speak';
+  static const journalDailyEntryToday = 'journal.daily_entry.today';
+  static const journalDailyEntryWordCount = 'journal.daily_entry.word_count';
+  static const journalDailyEntryYesterday = 'journal.daily_entry.yesterday';
+  static const journalDailyEntryYouHaveUnsavedChangesAreYouSureYo =
+      'journal.daily_entry.you_have_unsaved_changes_are_you_sure_yo';
+  static const journalDailyEntryYouJustWroteYourFirstReflectionneve =
+      'journal.daily_entry.you_just_wrote_your_first_reflectionneve';
+  static const journalDailyEntryYourJourneyBegins =
+      'journal.daily_entry.your_journey_begins';
+  static const journalEmotionalCycleAccessFull30dayView =
+      'journal.emotional_cycle.access_full_30day_view';
+  static const journalEmotionalCycleAccessShiftOutlook =
+      'journal.emotional_cycle.access_shift_outlook';
+  static const journalEmotionalCycleAccessShiftOutlookToSeeWhenYourEm =
+      'journal.emotional_cycle.access_shift_outlook_to_see_when_your_em';
+  static const journalEmotionalCycleCycleInsights =
+      'journal.emotional_cycle.cycle_insights';
+  static const journalEmotionalCycleDaysAgo =
+      'journal.emotional_cycle.days_ago';
+  static const journalEmotionalCycleGoPro = 'journal.emotional_cycle.go_pro';
+  static const journalEmotionalCycleLastNDays =
+      'journal.emotional_cycle.last_n_days';
+  static const journalEmotionalCycleRetry = 'journal.emotional_cycle.retry';
+  static const journalEmotionalCycleShareMyInnerCycles =
+      'journal.emotional_cycle.share_my_inner_cycles';
+  static const journalEmotionalCycleShareMyInnerCycles1 =
+      'journal.emotional_cycle.share_my_inner_cycles_1';
+  static const journalEmotionalCycleShiftOutlook =
+      'journal.emotional_cycle.shift_outlook';
+  static const journalEmotionalCycleStartJournaling =
+      'journal.emotional_cycle.start_journaling';
+  static const journalEmotionalCycleStartJournalingToSeeYourCycles =
+      'journal.emotional_cycle.start_journaling_to_see_your_cycles';
+  static const journalEmotionalCycleToday = 'journal.emotional_cycle.today';
+  static const journalEmotionalCycleUnableToLoadData =
+      'journal.emotional_cycle.unable_to_load_data';
+  static const journalEmotionalCycleYourCyclesAreForming =
+      'journal.emotional_cycle.your_cycles_are_forming';
+  static const journalEmotionalCycleYourDimensions =
+      'journal.emotional_cycle.your_dimensions';
+  static const journalEmotionalCycleYourInnerCycles =
+      'journal.emotional_cycle.your_inner_cycles';
+  static const journalEmotionalCycleYourInnerCycles1 =
+      'journal.emotional_cycle.your_inner_cycles_1';
+  static const journalEntryDetailCancel = 'journal.entry_detail.cancel';
+  static const journalEntryDetailDelete = 'journal.entry_detail.delete';
+  static const journalEntryDetailDeleteEntry =
+      'journal.entry_detail.delete_entry';
+  static const journalEntryDetailDeleteEntry1 =
+      'journal.entry_detail.delete_entry_1';
+  static const journalEntryDetailEntryCopiedToClipboard =
+      'journal.entry_detail.entry_copied_to_clipboard';
+  static const journalEntryDetailEntryNotFound =
+      'journal.entry_detail.entry_not_found';
+  static const journalEntryDetailJournalEntryPhoto =
+      'journal.entry_detail.journal_entry_photo';
+  static const journalEntryDetailNotes = 'journal.entry_detail.notes';
+  static const journalEntryDetailRetry = 'journal.entry_detail.retry';
+  static const journalEntryDetailShareEntry =
+      'journal.entry_detail.share_entry';
+  static const journalEntryDetailThisJournalEntryWillBePermanentlyD =
+      'journal.entry_detail.this_journal_entry_will_be_permanently_d';
+  static const journalMonthlyReflectionAccessYourFullMonthlyReport =
+      'journal.monthly_reflection.access_your_full_monthly_report';
+  static const journalMonthlyReflectionAreaBreakdown =
+      'journal.monthly_reflection.area_breakdown';
+  static const journalMonthlyReflectionCurrentStreak =
+      'journal.monthly_reflection.current_streak';
+  static const journalMonthlyReflectionMonthlyReflection =
+      'journal.monthly_reflection.monthly_reflection';
+  static const journalMonthlyReflectionNeedsAttention =
+      'journal.monthly_reflection.needs_attention';
+  static const journalMonthlyReflectionNextMonth =
+      'journal.monthly_reflection.next_month';
+  static const journalMonthlyReflectionPreviousMonth =
+      'journal.monthly_reflection.previous_month';
+  static const journalMonthlyReflectionRetry =
+      'journal.monthly_reflection.retry';
+  static const journalMonthlyReflectionSeeFullReport =
+      'journal.monthly_reflection.see_full_report';
+  static const journalMonthlyReflectionShareMonthlySummary =
+      'journal.monthly_reflection.share_monthly_summary';
+  static const journalMonthlyReflectionStrongestArea =
+      'journal.monthly_reflection.strongest_area';
+  static const journalMonthlyReflectionThisMonthIsWaitingForYourFirstRef =
+      'journal.monthly_reflection.this_month_is_waiting_for_your_first_ref';
+  static const journalMonthlyReflectionWeeklyPrompts =
+      'journal.monthly_reflection.weekly_prompts';
+  static const journalMonthlyReflectionWriteYourFirstEntry =
+      'journal.monthly_reflection.write_your_first_entry';
+  static const journalPatternLoopAnalyzerBehavioralPatternsDetectedInYourEnt =
+      'journal.pattern_loop_analyzer.behavioral_patterns_detected_in_your_ent';
+  static const journalPatternLoopAnalyzerKeepJournalingToDiscoverYourBehavio =
+      'journal.pattern_loop_analyzer.keep_journaling_to_discover_your_behavio';
+  static const journalPatternLoopAnalyzerNegative =
+      'journal.pattern_loop_analyzer.negative';
+  static const journalPatternLoopAnalyzerNeutral =
+      'journal.pattern_loop_analyzer.neutral';
+  static const journalPatternLoopAnalyzerPatternLoops =
+      'journal.pattern_loop_analyzer.pattern_loops';
+  static const journalPatternLoopAnalyzerPositive =
+      'journal.pattern_loop_analyzer.positive';
+  static const journalPatternLoopAnalyzerStrength =
+      'journal.pattern_loop_analyzer.strength';
+  static const journalPatternsBasedOnYourPersonalJournalEntriesN =
+      'journal.patterns.based_on_your_personal_journal_entries_n';
+  static const journalPatternsConnections = 'journal.patterns.connections';
+  static const journalPatternsCrossdimensionInsights =
+      'journal.patterns.crossdimension_insights';
+  static const journalPatternsFocusAreaCycleAveragesChart =
+      'journal.patterns.focus_area_cycle_averages_chart';
+  static const journalPatternsGratitudeDays = 'journal.patterns.gratitude_days';
+  static const journalPatternsGratitudeMood = 'journal.patterns.gratitude_mood';
+  static const journalPatternsNDays = 'journal.patterns.n_days';
+  static const journalPatternsOtherDays = 'journal.patterns.other_days';
+  static const journalPatternsPatternsUnlockAfter7Entries =
+      'journal.patterns.patterns_unlock_after_7_entries';
+  static const journalPatternsRetry = 'journal.patterns.retry';
+  static const journalPatternsSeeFullAnalysis =
+      'journal.patterns.see_full_analysis';
+  static const journalPatternsSeeFullAnalysis1 =
+      'journal.patterns.see_full_analysis_1';
+  static const journalPatternsThisWeekVsLastWeek =
+      'journal.patterns.this_week_vs_last_week';
+  static const journalPatternsTrends = 'journal.patterns.trends';
+  static const journalPatternsWriteEntry = 'journal.patterns.write_entry';
+  static const journalPatternsYourPatterns = 'journal.patterns.your_patterns';
+  static const journalPhaseRingEmotionalPhaseRing =
+      'journal.phase_ring.emotional_phase_ring';
+  static const journalPostSaveEngagementBackToHome =
+      'journal.post_save_engagement.back_to_home';
+  static const journalPostSaveEngagementCaptureItBeforeItFades =
+      'journal.post_save_engagement.capture_it_before_it_fades';
+  static const journalPostSaveEngagementEndYourDayWithGratitude =
+      'journal.post_save_engagement.end_your_day_with_gratitude';
+  static const journalPostSaveEngagementExploreYourPatterns =
+      'journal.post_save_engagement.explore_your_patterns';
+  static const journalPostSaveEngagementGratitudeJournal =
+      'journal.post_save_engagement.gratitude_journal';
+  static const journalPostSaveEngagementInviteAFriend =
+      'journal.post_save_engagement.invite_a_friend';
+  static const journalPostSaveEngagementLogYourMood =
+      'journal.post_save_engagement.log_your_mood';
+  static const journalPostSaveEngagementQuick1tapCheckin =
+      'journal.post_save_engagement.quick_1tap_checkin';
+  static const journalPostSaveEngagementRecordADream =
+      'journal.post_save_engagement.record_a_dream';
+  static const journalPostSaveEngagementSaved =
+      'journal.post_save_engagement.saved';
+  static const journalPostSaveEngagementThoughtsRemindersIdeas =
+      'journal.post_save_engagement.thoughts_reminders_ideas';
+  static const journalPostSaveEngagementWhatElseWouldYouLikeToCapture =
+      'journal.post_save_engagement.what_else_would_you_like_to_capture';
+  static const journalPostSaveEngagementWriteANoteToYourself =
+      'journal.post_save_engagement.write_a_note_to_yourself';
+  static const journalPostSaveEngagementYouBothGet7DaysPremiumFree =
+      'journal.post_save_engagement.you_both_get_7_days_premium_free';
+  static const journalShiftOutlookConfidence =
+      'journal.shift_outlook.confidence';
+  static const journalShiftOutlookNotEnoughDataForShiftOutlookYet =
+      'journal.shift_outlook.not_enough_data_for_shift_outlook_yet';
+  static const journalShiftOutlookShiftOutlook =
+      'journal.shift_outlook.shift_outlook';
+  static const journalShiftOutlookSupportingSignals =
+      'journal.shift_outlook.supporting_signals';
+  static const journalVoiceInputButtonMicrophonePermissionIsRequiredForVo =
+      'journal.voice_input_button.microphone_permission_is_required_for_vo';
+  static const journalVoiceInputButtonStartVoiceInput =
+      'journal.voice_input_button.start_voice_input';
+  static const journalVoiceInputButtonStopVoiceInput =
+      'journal.voice_input_button.stop_voice_input';
+  static const journalVoiceInputButtonVoiceInputIsNotAvailableOnThisDev =
+      'journal.voice_input_button.voice_input_is_not_available_on_this_dev';
+  static const journalVoiceInputButtonVoiceInputPremium =
+      'journal.voice_input_button.voice_input_premium';
+  static const libraryLibraryHubLibrary = 'library.library_hub.library';
+  static const libraryLibraryHubYourPersonalDataVault =
+      'library.library_hub.your_personal_data_vault';
+  static const lifeEventsAdd = 'life_events.add';
+  static const lifeEventsAddLifeEvent = 'life_events.add_life_event';
+  static const lifeEventsChallenging = 'life_events.challenging';
+  static const lifeEventsCustom = 'life_events.custom';
+  static const lifeEventsDeleteConfirm = 'life_events.delete_confirm';
+  static const lifeEventsDeleteWarning = 'life_events.delete_warning';
+  static const lifeEventsEdit = 'life_events.edit';
+  static const lifeEventsEmotionTags = 'life_events.emotion_tags';
+  static const lifeEventsEventNotFound = 'life_events.event_not_found';
+  static const lifeEventsEventTitle = 'life_events.event_title';
+  static const lifeEventsIntensity = 'life_events.intensity';
+  static const lifeEventsIntensity1 = 'life_events.intensity_1';
+  static const lifeEventsIntensity2 = 'life_events.intensity_2';
+  static const lifeEventsIntensity3 = 'life_events.intensity_3';
+  static const lifeEventsIntensity4 = 'life_events.intensity_4';
+  static const lifeEventsIntensity5 = 'life_events.intensity_5';
+  static const lifeEventsLifeEventAddAPhoto =
+      'life_events.life_event.add_a_photo';
+  static const lifeEventsLifeEventCancel = 'life_events.life_event.cancel';
+  static const lifeEventsLifeEventDescribeYourLifeEvent =
+      'life_events.life_event.describe_your_life_event';
+  static const lifeEventsLifeEventDiscard = 'life_events.life_event.discard';
+  static const lifeEventsLifeEventDiscardChanges =
+      'life_events.life_event.discard_changes';
+  static const lifeEventsLifeEventEditLifeEvent =
+      'life_events.life_event.edit_life_event';
+  static const lifeEventsLifeEventEmotionTags =
+      'life_events.life_event.emotion_tags';
+  static const lifeEventsLifeEventEventPhoto =
+      'life_events.life_event.event_photo';
+  static const lifeEventsLifeEventEventTitle =
+      'life_events.life_event.event_title';
+  static const lifeEventsLifeEventEventType =
+      'life_events.life_event.event_type';
+  static const lifeEventsLifeEventHowDidThisEventShapeYou =
+      'life_events.life_event.how_did_this_event_shape_you';
+  static const lifeEventsLifeEventIntensity =
+      'life_events.life_event.intensity';
+  static const lifeEventsLifeEventNewLifeEvent =
+      'life_events.life_event.new_life_event';
+  static const lifeEventsLifeEventPhotoOptional =
+      'life_events.life_event.photo_optional';
+  static const lifeEventsLifeEventReflection =
+      'life_events.life_event.reflection';
+  static const lifeEventsLifeEventRemovePhoto =
+      'life_events.life_event.remove_photo';
+  static const lifeEventsLifeEventSaveEvent =
+      'life_events.life_event.save_event';
+  static const lifeEventsLifeEventSelectEvent =
+      'life_events.life_event.select_event';
+  static const lifeEventsLifeEventUpdateEvent =
+      'life_events.life_event.update_event';
+  static const lifeEventsLifeEventYouHaveUnsavedChangesAreYouSureYo =
+      'life_events.life_event.you_have_unsaved_changes_are_you_sure_yo';
+  static const lifeEventsLifeEventDetailCancel =
+      'life_events.life_event_detail.cancel';
+  static const lifeEventsLifeEventDetailCouldntLoadThisEvent =
+      'life_events.life_event_detail.couldnt_load_this_event';
+  static const lifeEventsLifeEventDetailDate =
+      'life_events.life_event_detail.date';
+  static const lifeEventsLifeEventDetailDelete =
+      'life_events.life_event_detail.delete';
+  static const lifeEventsLifeEventDetailDeleteEvent =
+      'life_events.life_event_detail.delete_event';
+  static const lifeEventsLifeEventDetailDeleteEvent1 =
+      'life_events.life_event_detail.delete_event_1';
+  static const lifeEventsLifeEventDetailEditEvent =
+      'life_events.life_event_detail.edit_event';
+  static const lifeEventsLifeEventDetailEmotions =
+      'life_events.life_event_detail.emotions';
+  static const lifeEventsLifeEventDetailEventCopiedToClipboard =
+      'life_events.life_event_detail.event_copied_to_clipboard';
+  static const lifeEventsLifeEventDetailEventNotFound =
+      'life_events.life_event_detail.event_not_found';
+  static const lifeEventsLifeEventDetailEventPhoto =
+      'life_events.life_event_detail.event_photo';
+  static const lifeEventsLifeEventDetailIntensity =
+      'life_events.life_event_detail.intensity';
+  static const lifeEventsLifeEventDetailLifeEvent =
+      'life_events.life_event_detail.life_event';
+  static const lifeEventsLifeEventDetailReflection =
+      'life_events.life_event_detail.reflection';
+  static const lifeEventsLifeEventDetailRetry =
+      'life_events.life_event_detail.retry';
+  static const lifeEventsLifeEventDetailShareEvent =
+      'life_events.life_event_detail.share_event';
+  static const lifeEventsLifeEventDetailThisLifeEventWillBePermanentlyDele =
+      'life_events.life_event_detail.this_life_event_will_be_permanently_dele';
+  static const lifeEventsLifeTimelineAddLifeEvent =
+      'life_events.life_timeline.add_life_event';
+  static const lifeEventsLifeTimelineAddLifeEvent1 =
+      'life_events.life_timeline.add_life_event_1';
+  static const lifeEventsLifeTimelineAll = 'life_events.life_timeline.all';
+  static const lifeEventsLifeTimelineChallenging =
+      'life_events.life_timeline.challenging';
+  static const lifeEventsLifeTimelineCouldntLoadYourTimeline =
+      'life_events.life_timeline.couldnt_load_your_timeline';
+  static const lifeEventsLifeTimelineEventPhoto =
+      'life_events.life_timeline.event_photo';
+  static const lifeEventsLifeTimelineLifeTimeline =
+      'life_events.life_timeline.life_timeline';
+  static const lifeEventsLifeTimelineNewEvent =
+      'life_events.life_timeline.new_event';
+  static const lifeEventsLifeTimelinePositive =
+      'life_events.life_timeline.positive';
+  static const lifeEventsLifeTimelineRetry = 'life_events.life_timeline.retry';
+  static const lifeEventsLifeTimelineStartRecordingTheMomentsThatShapeY =
+      'life_events.life_timeline.start_recording_the_moments_that_shape_y';
+  static const lifeEventsLifeTimelineUnlockYourFullTimelineWithPro =
+      'life_events.life_timeline.unlock_your_full_timeline_with_pro';
+  static const lifeEventsLifeTimelineUpgradeToPro =
+      'life_events.life_timeline.upgrade_to_pro';
+  static const lifeEventsLifeTimelineYourTimelineAwaitsItsFirstChapter =
+      'life_events.life_timeline.your_timeline_awaits_its_first_chapter';
+  static const lifeEventsLogThisDay = 'life_events.log_this_day';
+  static const lifeEventsNoEvents = 'life_events.no_events';
+  static const lifeEventsNoEventsSubtitle = 'life_events.no_events_subtitle';
+  static const lifeEventsPhotoOptional = 'life_events.photo_optional';
+  static const lifeEventsPositive = 'life_events.positive';
+  static const lifeEventsPresetsAcademicSetback =
+      'life_events.presets.academic_setback';
+  static const lifeEventsPresetsAddictionRecovery =
+      'life_events.presets.addiction_recovery';
+  static const lifeEventsPresetsAnniversary = 'life_events.presets.anniversary';
+  static const lifeEventsPresetsAwardRecognition =
+      'life_events.presets.award_recognition';
+  static const lifeEventsPresetsBetrayal = 'life_events.presets.betrayal';
+  static const lifeEventsPresetsBirthOfChild =
+      'life_events.presets.birth_of_child';
+  static const lifeEventsPresetsBreakup = 'life_events.presets.breakup';
+  static const lifeEventsPresetsBurnout = 'life_events.presets.burnout';
+  static const lifeEventsPresetsCareerChange =
+      'life_events.presets.career_change';
+  static const lifeEventsPresetsCaregiverBurden =
+      'life_events.presets.caregiver_burden';
+  static const lifeEventsPresetsChronicIllness =
+      'life_events.presets.chronic_illness';
+  static const lifeEventsPresetsCreativeAchievement =
+      'life_events.presets.creative_achievement';
+  static const lifeEventsPresetsFamilyConflict =
+      'life_events.presets.family_conflict';
+  static const lifeEventsPresetsFinancialGoal =
+      'life_events.presets.financial_goal';
+  static const lifeEventsPresetsFinancialSetback =
+      'life_events.presets.financial_setback';
+  static const lifeEventsPresetsFirstHome = 'life_events.presets.first_home';
+  static const lifeEventsPresetsFitnessGoal =
+      'life_events.presets.fitness_goal';
+  static const lifeEventsPresetsFriendshipEnding =
+      'life_events.presets.friendship_ending';
+  static const lifeEventsPresetsGraduation = 'life_events.presets.graduation';
+  static const lifeEventsPresetsHealthDiagnosis =
+      'life_events.presets.health_diagnosis';
+  static const lifeEventsPresetsHealthRecovery =
+      'life_events.presets.health_recovery';
+  static const lifeEventsPresetsIdentityCrisis =
+      'life_events.presets.identity_crisis';
+  static const lifeEventsPresetsJobLoss = 'life_events.presets.job_loss';
+  static const lifeEventsPresetsLegalIssue = 'life_events.presets.legal_issue';
+  static const lifeEventsPresetsLonelinessPeriod =
+      'life_events.presets.loneliness_period';
+  static const lifeEventsPresetsLossOfLovedOne =
+      'life_events.presets.loss_of_loved_one';
+  static const lifeEventsPresetsMarriage = 'life_events.presets.marriage';
+  static const lifeEventsPresetsNaturalDisaster =
+      'life_events.presets.natural_disaster';
+  static const lifeEventsPresetsNewFriendship =
+      'life_events.presets.new_friendship';
+  static const lifeEventsPresetsNewJob = 'life_events.presets.new_job';
+  static const lifeEventsPresetsPetAdoption =
+      'life_events.presets.pet_adoption';
+  static const lifeEventsPresetsPromotion = 'life_events.presets.promotion';
+  static const lifeEventsPresetsPublishedWork =
+      'life_events.presets.published_work';
+  static const lifeEventsPresetsReconciliation =
+      'life_events.presets.reconciliation';
+  static const lifeEventsPresetsRelocation = 'life_events.presets.relocation';
+  static const lifeEventsPresetsRetirement = 'life_events.presets.retirement';
+  static const lifeEventsPresetsSkillMastery =
+      'life_events.presets.skill_mastery';
+  static const lifeEventsPresetsTraumaRecovery =
+      'life_events.presets.trauma_recovery';
+  static const lifeEventsPresetsTravelMilestone =
+      'life_events.presets.travel_milestone';
+  static const lifeEventsPresetsVolunteerMilestone =
+      'life_events.presets.volunteer_milestone';
+  static const lifeEventsRecent = 'life_events.recent';
+  static const lifeEventsReflectionHint = 'life_events.reflection_hint';
+  static const lifeEventsRetentionPrompt = 'life_events.retention_prompt';
+  static const lifeEventsSaveEvent = 'life_events.save_event';
+  static const lifeEventsSelectEvent = 'life_events.select_event';
+  static const lifeEventsSelectType = 'life_events.select_type';
+  static const lifeEventsTimeline = 'life_events.timeline';
+  static const lifeEventsTitle = 'life_events.title';
+  static const lifeEventsUpdateEvent = 'life_events.update_event';
+  static const meditationMeditationTimerBePresent =
+      'meditation.meditation_timer.be_present';
+  static const meditationMeditationTimerBeginMeditation =
+      'meditation.meditation_timer.begin_meditation';
+  static const meditationMeditationTimerChooseDuration =
+      'meditation.meditation_timer.choose_duration';
+  static const meditationMeditationTimerFocusOnYourBreath =
+      'meditation.meditation_timer.focus_on_your_breath';
+  static const meditationMeditationTimerMeditation =
+      'meditation.meditation_timer.meditation';
+  static const meditationMeditationTimerMin = 'meditation.meditation_timer.min';
+  static const meditationMeditationTimerPause =
+      'meditation.meditation_timer.pause';
+  static const meditationMeditationTimerPaused =
+      'meditation.meditation_timer.paused';
+  static const meditationMeditationTimerReset =
+      'meditation.meditation_timer.reset';
+  static const meditationMeditationTimerResume =
+      'meditation.meditation_timer.resume';
+  static const meditationMeditationTimerSessionCompleteWellDone =
+      'meditation.meditation_timer.session_complete_well_done';
+  static const meditationTimerNMinutes = 'meditation.timer.n_minutes';
+  static const memoriesMemoriesCouldntLoadYourMemories =
+      'memories.memories.couldnt_load_your_memories';
+  static const memoriesMemoriesEntries = 'memories.memories.entries';
+  static const memoriesMemoriesMemories = 'memories.memories.memories';
+  static const memoriesMemoriesMemories1 = 'memories.memories.memories_1';
+  static const memoriesMemoriesMemoryPhoto = 'memories.memories.memory_photo';
+  static const memoriesMemoriesMemoryPhoto1 =
+      'memories.memories.memory_photo_1';
+  static const memoriesMemoriesOnThisDay = 'memories.memories.on_this_day';
+  static const memoriesMemoriesPhotos = 'memories.memories.photos';
+  static const memoriesMemoriesRetry = 'memories.memories.retry';
+  static const memoriesMemoriesSince = 'memories.memories.since';
+  static const memoriesMemoriesThisMonthIsABlankCanvas =
+      'memories.memories.this_month_is_a_blank_canvas';
+  static const memoriesMemoriesWriteAnEntry =
+      'memories.memories.write_an_entry';
+  static const memoriesMemoriesYourMemoriesFromThisPeriodWillAppe =
+      'memories.memories.your_memories_from_this_period_will_appe';
+  static const milestonesBadgeCelebrationKeepGoing =
+      'milestones.badge_celebration.keep_going';
+  static const milestonesBadgeCelebrationShare =
+      'milestones.badge_celebration.share';
+  static const milestonesFilterLabel = 'milestones.filter_label';
+  static const milestonesMilestoneAll = 'milestones.milestone.all';
+  static const milestonesMilestoneCloseDialog =
+      'milestones.milestone.close_dialog';
+  static const milestonesMilestoneDone = 'milestones.milestone.done';
+  static const milestonesMilestoneGoDeeper = 'milestones.milestone.go_deeper';
+  static const milestonesMilestoneKeepGrowing =
+      'milestones.milestone.keep_growing';
+  static const milestonesMilestoneKeepLogging =
+      'milestones.milestone.keep_logging';
+  static const milestonesMilestoneMilestones =
+      'milestones.milestone.milestones';
+  static const milestonesMilestoneMilestonesEarned =
+      'milestones.milestone.milestones_earned';
+  static const milestonesMilestoneRetry = 'milestones.milestone.retry';
+  static const milestonesMilestoneShareConnect =
+      'milestones.milestone.share_connect';
+  static const milestonesMilestoneStartTracking =
+      'milestones.milestone.start_tracking';
+  static const milestonesMilestoneTryNewFeatures =
+      'milestones.milestone.try_new_features';
+  static const milestonesMilestoneWriteMore = 'milestones.milestone.write_more';
+  static const milestonesMilestoneYouEarnedThemAll =
+      'milestones.milestone.you_earned_them_all';
+  static const monthsApril = 'months.april';
+  static const monthsAugust = 'months.august';
+  static const monthsDecember = 'months.december';
+  static const monthsFebruary = 'months.february';
+  static const monthsJanuary = 'months.january';
+  static const monthsJuly = 'months.july';
+  static const monthsJune = 'months.june';
+  static const monthsMarch = 'months.march';
+  static const monthsMay = 'months.may';
+  static const monthsNovember = 'months.november';
+  static const monthsOctober = 'months.october';
+  static const monthsSeptember = 'months.september';
+  static const moodEmotionalVocabularyAll = 'mood.emotional_vocabulary.all';
+  static const moodEmotionalVocabularyBodySensation =
+      'mood.emotional_vocabulary.body_sensation';
+  static const moodEmotionalVocabularyClearSearch =
+      'mood.emotional_vocabulary.clear_search';
+  static const moodEmotionalVocabularyEmotionalVocabulary =
+      'mood.emotional_vocabulary.emotional_vocabulary';
+  static const moodEmotionalVocabularyFindAFeeling =
+      'mood.emotional_vocabulary.find_a_feeling';
+  static const moodEmotionalVocabularyNoEmotionsFound =
+      'mood.emotional_vocabulary.no_emotions_found';
+  static const moodMoodCheckinGood = 'mood.mood_checkin.good';
+  static const moodMoodCheckinGreat = 'mood.mood_checkin.great';
+  static const moodMoodCheckinLow = 'mood.mood_checkin.low';
+  static const moodMoodCheckinMoodLoggedGetMoreSpecific =
+      'mood.mood_checkin.mood_logged_get_more_specific';
+  static const moodMoodCheckinOkay = 'mood.mood_checkin.okay';
+  static const moodMoodCheckinStruggling = 'mood.mood_checkin.struggling';
+  static const moodMoodCheckinTodaysMood = 'mood.mood_checkin.todays_mood';
+  static const moodMoodCheckinWhatsPresentForYouRightNow =
+      'mood.mood_checkin.whats_present_for_you_right_now';
+  static const moodMoodTrends30dayAvg = 'mood.mood_trends.30day_avg';
+  static const moodMoodTrends7dayAvg = 'mood.mood_trends.7day_avg';
+  static const moodMoodTrendsGoDeeper = 'mood.mood_trends.go_deeper';
+  static const moodMoodTrendsGood = 'mood.mood_trends.good';
+  static const moodMoodTrendsGreat = 'mood.mood_trends.great';
+  static const moodMoodTrendsHowAreYouFeelingRightNow =
+      'mood.mood_trends.how_are_you_feeling_right_now';
+  static const moodMoodTrendsLast30Days = 'mood.mood_trends.last_30_days';
+  static const moodMoodTrendsLow = 'mood.mood_trends.low';
+  static const moodMoodTrendsOkay = 'mood.mood_trends.okay';
+  static const moodMoodTrendsRecentCheckins =
+      'mood.mood_trends.recent_checkins';
+  static const moodMoodTrendsRetry = 'mood.mood_trends.retry';
+  static const moodMoodTrendsShareWeek = 'mood.mood_trends.share_week';
+  static const moodMoodTrendsSignalDashboard =
+      'mood.mood_trends.signal_dashboard';
+  static const moodMoodTrendsSignalDashboard1 =
+      'mood.mood_trends.signal_dashboard_1';
+  static const moodMoodTrendsStartYourFirstCheckin =
+      'mood.mood_trends.start_your_first_checkin';
+  static const moodMoodTrendsStruggling = 'mood.mood_trends.struggling';
+  static const moodMoodTrendsTapHowYouFeelYourDashboardLightsU =
+      'mood.mood_trends.tap_how_you_feel_your_dashboard_lights_u';
+  static const moodMoodTrendsThisWeek = 'mood.mood_trends.this_week';
+  static const moodMoodTrendsTotalLogs = 'mood.mood_trends.total_logs';
+  static const moodMoodTrendsUpgradeToPro = 'mood.mood_trends.upgrade_to_pro';
+  static const moodMoodTrendsYourDataHasMoreToShow =
+      'mood.mood_trends.your_data_has_more_to_show';
+  static const navAlsoViewedSubtitle = 'nav.also_viewed_subtitle';
+  static const navGoDeeperSubtitle = 'nav.go_deeper_subtitle';
+  static const navKeepExploring = 'nav.keep_exploring';
+  static const navKeepExploringSubtitle = 'nav.keep_exploring_subtitle';
+  static const navigationCardsAdvancedSelfAwarenessDescription =
+      'navigation.cards.advanced_self_awareness.description';
+  static const navigationCardsAllAnalysesDescription =
+      'navigation.cards.all_analyses.description';
+  static const navigationCardsAllAnalysesTitle =
+      'navigation.cards.all_analyses.title';
+  static const navigationCardsAllSignsDescription =
+      'navigation.cards.all_signs.description';
+  static const navigationCardsAllSignsTitle =
+      'navigation.cards.all_signs.title';
+  static const navigationCardsCalculatePersonalProfileDescription =
+      'navigation.cards.calculate_personal_profile.description';
+  static const navigationCardsCalculatePersonalProfileTitle =
+      'navigation.cards.calculate_personal_profile.title';
+  static const navigationCardsCardsMessageDescription =
+      'navigation.cards.cards_message.description';
+  static const navigationCardsChartConnectedDreamsDescription =
+      'navigation.cards.chart_connected_dreams.description';
+  static const navigationCardsChartConnectedDreamsTitle =
+      'navigation.cards.chart_connected_dreams.title';
+  static const navigationCardsColorMeaningsDescription =
+      'navigation.cards.color_meanings.description';
+  static const navigationCardsColorMeaningsTitle =
+      'navigation.cards.color_meanings.title';
+  static const navigationCardsCompareChartTodayDescription =
+      'navigation.cards.compare_chart_today.description';
+  static const navigationCardsContemplativeMeditationDescription =
+      'navigation.cards.contemplative_meditation.description';
+  static const navigationCardsContemplativeMeditationTitle =
+      'navigation.cards.contemplative_meditation.title';
+  static const navigationCardsCosmicDiscoveryDescription =
+      'navigation.cards.cosmic_discovery.description';
+  static const navigationCardsCosmicDiscoveryTitle =
+      'navigation.cards.cosmic_discovery.title';
+  static const navigationCardsCosmicEnergyDescription =
+      'navigation.cards.cosmic_energy.description';
+  static const navigationCardsCosmicEnergyMapDescription =
+      'navigation.cards.cosmic_energy_map.description';
+  static const navigationCardsCosmicGuidanceDescription =
+      'navigation.cards.cosmic_guidance.description';
+  static const navigationCardsCosmicGuidanceTitle =
+      'navigation.cards.cosmic_guidance.title';
+  static const navigationCardsCosmicGuidanceBeyondDescription =
+      'navigation.cards.cosmic_guidance_beyond.description';
+  static const navigationCardsCosmicGuidanceBeyondTitle =
+      'navigation.cards.cosmic_guidance_beyond.title';
+  static const navigationCardsCosmicIdentityDescription =
+      'navigation.cards.cosmic_identity.description';
+  static const navigationCardsCosmicMessageDreamsDescription =
+      'navigation.cards.cosmic_message_dreams.description';
+  static const navigationCardsCosmicPerspectiveDescription =
+      'navigation.cards.cosmic_perspective.description';
+  static const navigationCardsDailyCardDescription =
+      'navigation.cards.daily_card.description';
+  static const navigationCardsDailyCosmicMessageDescription =
+      'navigation.cards.daily_cosmic_message.description';
+  static const navigationCardsDailyCosmicMessageTitle =
+      'navigation.cards.daily_cosmic_message.title';
+  static const navigationCardsDailyEnergyMessageDescription =
+      'navigation.cards.daily_energy_message.description';
+  static const navigationCardsDailyEnergyMessageTitle =
+      'navigation.cards.daily_energy_message.title';
+  static const navigationCardsDailyReflectionDescription =
+      'navigation.cards.daily_reflection.description';
+  static const navigationCardsDailyReflectionTitle =
+      'navigation.cards.daily_reflection.title';
+  static const navigationCardsDailyReflectionReadingDescription =
+      'navigation.cards.daily_reflection_reading.description';
+  static const navigationCardsDailyReflectionReadingTitle =
+      'navigation.cards.daily_reflection_reading.title';
+  static const navigationCardsDecodeDreamSymbolsDescription =
+      'navigation.cards.decode_dream_symbols.description';
+  static const navigationCardsDecodeDreamSymbolsTitle =
+      'navigation.cards.decode_dream_symbols.title';
+  static const navigationCardsDeepDreamsDescription =
+      'navigation.cards.deep_dreams.description';
+  static const navigationCardsDeepDreamsTitle =
+      'navigation.cards.deep_dreams.title';
+  static const navigationCardsDiscoverEnergyCentersDescription =
+      'navigation.cards.discover_energy_centers.description';
+  static const navigationCardsDreamInterpretationDescription =
+      'navigation.cards.dream_interpretation.description';
+  static const navigationCardsDreamInterpretationTitle =
+      'navigation.cards.dream_interpretation.title';
+  static const navigationCardsDreamTonightDescription =
+      'navigation.cards.dream_tonight.description';
+  static const navigationCardsDreamTonightTitle =
+      'navigation.cards.dream_tonight.title';
+  static const navigationCardsDreamWithNumbersDescription =
+      'navigation.cards.dream_with_numbers.description';
+  static const navigationCardsDreamWithNumbersTitle =
+      'navigation.cards.dream_with_numbers.title';
+  static const navigationCardsEastWestEnergyMapsDescription =
+      'navigation.cards.east_west_energy_maps.description';
+  static const navigationCardsElectionalSelfAwarenessDescription =
+      'navigation.cards.electional_self_awareness.description';
+  static const navigationCardsElectionalSelfAwarenessTitle =
+      'navigation.cards.electional_self_awareness.title';
+  static const navigationCardsEnergyBlockagesDreamsDescription =
+      'navigation.cards.energy_blockages_dreams.description';
+  static const navigationCardsEnergyCleansingDescription =
+      'navigation.cards.energy_cleansing.description';
+  static const navigationCardsEnergyCleansingTitle =
+      'navigation.cards.energy_cleansing.title';
+  static const navigationCardsEnergyColorsDescription =
+      'navigation.cards.energy_colors.description';
+  static const navigationCardsEnergyColorsTitle =
+      'navigation.cards.energy_colors.title';
+  static const navigationCardsEnergyDreamsDescription =
+      'navigation.cards.energy_dreams.description';
+  static const navigationCardsEnergyDreamsTitle =
+      'navigation.cards.energy_dreams.title';
+  static const navigationCardsEnergyFieldDescription =
+      'navigation.cards.energy_field.description';
+  static const navigationCardsEnergyFieldTitle =
+      'navigation.cards.energy_field.title';
+  static const navigationCardsEnergyGuidanceDescription =
+      'navigation.cards.energy_guidance.description';
+  static const navigationCardsEnergyGuidanceTitle =
+      'navigation.cards.energy_guidance.title';
+  static const navigationCardsEnergyProfileDescription =
+      'navigation.cards.energy_profile.description';
+  static const navigationCardsEnergyProfileTitle =
+      'navigation.cards.energy_profile.title';
+  static const navigationCardsEnergyReadingDescription =
+      'navigation.cards.energy_reading.description';
+  static const navigationCardsEnergyReadingPathDescription =
+      'navigation.cards.energy_reading_path.description';
+  static const navigationCardsEnergyWorkRitualsDescription =
+      'navigation.cards.energy_work_rituals.description';
+  static const navigationCardsGematriaAndNumbersDescription =
+      'navigation.cards.gematria_and_numbers.description';
+  static const navigationCardsGetMoreInsightDescription =
+      'navigation.cards.get_more_insight.description';
+  static const navigationCardsGetPersonalMessageDescription =
+      'navigation.cards.get_personal_message.description';
+  static const navigationCardsGlossaryDescription =
+      'navigation.cards.glossary.description';
+  static const navigationCardsGlossaryTitle = 'navigation.cards.glossary.title';
+  static const navigationCardsGuidanceBeyondDreamDescription =
+      'navigation.cards.guidance_beyond_dream.description';
+  static const navigationCardsHomeDescription =
+      'navigation.cards.home.description';
+  static const navigationCardsHomeTitle = 'navigation.cards.home.title';
+  static const navigationCardsInnerEvolutionTrackingDescription =
+      'navigation.cards.inner_evolution_tracking.description';
+  static const navigationCardsIntentionGuidanceDescription =
+      'navigation.cards.intention_guidance.description';
+  static const navigationCardsIntentionGuidanceTitle =
+      'navigation.cards.intention_guidance.title';
+  static const navigationCardsKozmozDiscoveryDescription =
+      'navigation.cards.kozmoz_discovery.description';
+  static const navigationCardsKozmozDiscoveryTitle =
+      'navigation.cards.kozmoz_discovery.title';
+  static const navigationCardsKozmozHubDescription =
+      'navigation.cards.kozmoz_hub.description';
+  static const navigationCardsKozmozHubTitle =
+      'navigation.cards.kozmoz_hub.title';
+  static const navigationCardsLearnConceptsDescription =
+      'navigation.cards.learn_concepts.description';
+  static const navigationCardsLifeDimensionEnergiesDescription =
+      'navigation.cards.life_dimension_energies.description';
+  static const navigationCardsLifeDimensionGlossaryDescription =
+      'navigation.cards.life_dimension_glossary.description';
+  static const navigationCardsLifeDimensionGlossaryTitle =
+      'navigation.cards.life_dimension_glossary.title';
+  static const navigationCardsLifeDimensionMeditationDescription =
+      'navigation.cards.life_dimension_meditation.description';
+  static const navigationCardsLifeDimensionMeditationTitle =
+      'navigation.cards.life_dimension_meditation.title';
+  static const navigationCardsLifeDimensionsDescription =
+      'navigation.cards.life_dimensions.description';
+  static const navigationCardsLifeDimensionsTitle =
+      'navigation.cards.life_dimensions.title';
+  static const navigationCardsLoveReflectionDescription =
+      'navigation.cards.love_reflection.description';
+  static const navigationCardsLoveReflectionTitle =
+      'navigation.cards.love_reflection.title';
+  static const navigationCardsMonthlyDepthDescription =
+      'navigation.cards.monthly_depth.description';
+  static const navigationCardsMonthlyDepthTitle =
+      'navigation.cards.monthly_depth.title';
+  static const navigationCardsMoonCalendarDescription =
+      'navigation.cards.moon_calendar.description';
+  static const navigationCardsMoonCalendarTitle =
+      'navigation.cards.moon_calendar.title';
+  static const navigationCardsMoonPhaseDescription =
+      'navigation.cards.moon_phase.description';
+  static const navigationCardsMoonPhaseTitle =
+      'navigation.cards.moon_phase.title';
+  static const navigationCardsMoonPhasesDreamsDescription =
+      'navigation.cards.moon_phases_dreams.description';
+  static const navigationCardsMoonPhasesDreamsTitle =
+      'navigation.cards.moon_phases_dreams.title';
+  static const navigationCardsMoonPracticesDescription =
+      'navigation.cards.moon_practices.description';
+  static const navigationCardsMoonRitualsDescription =
+      'navigation.cards.moon_rituals.description';
+  static const navigationCardsMoonRitualsTitle =
+      'navigation.cards.moon_rituals.title';
+  static const navigationCardsMyCosmicIdentityDescription =
+      'navigation.cards.my_cosmic_identity.description';
+  static const navigationCardsMyEnergyCentersDescription =
+      'navigation.cards.my_energy_centers.description';
+  static const navigationCardsMyPersonalProfileDescription =
+      'navigation.cards.my_personal_profile.description';
+  static const navigationCardsMyPersonalProfileTitle =
+      'navigation.cards.my_personal_profile.title';
+  static const navigationCardsNumberMeaningsDescription =
+      'navigation.cards.number_meanings.description';
+  static const navigationCardsNumberMeaningsTitle =
+      'navigation.cards.number_meanings.title';
+  static const navigationCardsNumberMysteryDescription =
+      'navigation.cards.number_mystery.description';
+  static const navigationCardsNumberPatternsDescription =
+      'navigation.cards.number_patterns.description';
+  static const navigationCardsNumberPatternsTitle =
+      'navigation.cards.number_patterns.title';
+  static const navigationCardsNumberResonanceDescription =
+      'navigation.cards.number_resonance.description';
+  static const navigationCardsNumberSecretsDescription =
+      'navigation.cards.number_secrets.description';
+  static const navigationCardsNumberSecretsTitle =
+      'navigation.cards.number_secrets.title';
+  static const navigationCardsNumbersInCardsDescription =
+      'navigation.cards.numbers_in_cards.description';
+  static const navigationCardsNumericalHarmonyDescription =
+      'navigation.cards.numerical_harmony.description';
+  static const navigationCardsNumericalHarmonyTitle =
+      'navigation.cards.numerical_harmony.title';
+  static const navigationCardsOtherExplorationPathsDescription =
+      'navigation.cards.other_exploration_paths.description';
+  static const navigationCardsOtherPracticesDescription =
+      'navigation.cards.other_practices.description';
+  static const navigationCardsOtherSystemsDescription =
+      'navigation.cards.other_systems.description';
+  static const navigationCardsPersonalCosmicMessageDescription =
+      'navigation.cards.personal_cosmic_message.description';
+  static const navigationCardsPersonalCosmicMessageTitle =
+      'navigation.cards.personal_cosmic_message.title';
+  static const navigationCardsPersonalPerspectiveDescription =
+      'navigation.cards.personal_perspective.description';
+  static const navigationCardsPersonalProfileDescription =
+      'navigation.cards.personal_profile.description';
+  static const navigationCardsPersonalProfileTitle =
+      'navigation.cards.personal_profile.title';
+  static const navigationCardsPersonalProfileQuestionDescription =
+      'navigation.cards.personal_profile_question.description';
+  static const navigationCardsPersonalProfileQuestionTitle =
+      'navigation.cards.personal_profile_question.title';
+  static const navigationCardsPersonalYearMessageDescription =
+      'navigation.cards.personal_year_message.description';
+  static const navigationCardsPersonalYearMessageTitle =
+      'navigation.cards.personal_year_message.title';
+  static const navigationCardsPostRitualDreamsDescription =
+      'navigation.cards.post_ritual_dreams.description';
+  static const navigationCardsPostRitualDreamsTitle =
+      'navigation.cards.post_ritual_dreams.title';
+  static const navigationCardsPremiumFeaturesDescription =
+      'navigation.cards.premium_features.description';
+  static const navigationCardsPremiumFeaturesTitle =
+      'navigation.cards.premium_features.title';
+  static const navigationCardsProgressionsDescription =
+      'navigation.cards.progressions.description';
+  static const navigationCardsProgressionsTitle =
+      'navigation.cards.progressions.title';
+  static const navigationCardsReadWithNumbersDescription =
+      'navigation.cards.read_with_numbers.description';
+  static const navigationCardsRelationshipDreamsDescription =
+      'navigation.cards.relationship_dreams.description';
+  static const navigationCardsRelationshipDreamsTitle =
+      'navigation.cards.relationship_dreams.title';
+  static const navigationCardsRelationshipGuidanceDescription =
+      'navigation.cards.relationship_guidance.description';
+  static const navigationCardsRelationshipGuidanceTitle =
+      'navigation.cards.relationship_guidance.title';
+  static const navigationCardsRitualGuideDescription =
+      'navigation.cards.ritual_guide.description';
+  static const navigationCardsRitualGuideTitle =
+      'navigation.cards.ritual_guide.title';
+  static const navigationCardsRitualsDescription =
+      'navigation.cards.rituals.description';
+  static const navigationCardsRitualsTitle = 'navigation.cards.rituals.title';
+  static const navigationCardsSecretOfNumbersDescription =
+      'navigation.cards.secret_of_numbers.description';
+  static const navigationCardsSelfAwarenessConnectionDescription =
+      'navigation.cards.self_awareness_connection.description';
+  static const navigationCardsSelfAwarenessConnectionTitle =
+      'navigation.cards.self_awareness_connection.title';
+  static const navigationCardsSelfAwarenessGlossaryDescription =
+      'navigation.cards.self_awareness_glossary.description';
+  static const navigationCardsSelfAwarenessGlossaryTitle =
+      'navigation.cards.self_awareness_glossary.title';
+  static const navigationCardsSignDreamPatternsDescription =
+      'navigation.cards.sign_dream_patterns.description';
+  static const navigationCardsSignDreamPatternsTitle =
+      'navigation.cards.sign_dream_patterns.title';
+  static const navigationCardsSignPagesDescription =
+      'navigation.cards.sign_pages.description';
+  static const navigationCardsSkyTodayDescription =
+      'navigation.cards.sky_today.description';
+  static const navigationCardsSpeakSubconsciousDescription =
+      'navigation.cards.speak_subconscious.description';
+  static const navigationCardsSpiritualPracticesDescription =
+      'navigation.cards.spiritual_practices.description';
+  static const navigationCardsSymbolGlossaryDescription =
+      'navigation.cards.symbol_glossary.description';
+  static const navigationCardsSymbolGlossaryTitle =
+      'navigation.cards.symbol_glossary.title';
+  static const navigationCardsSymbolicNumberPatternsDescription =
+      'navigation.cards.symbolic_number_patterns.description';
+  static const navigationCardsSymbolicNumberPatternsTitle =
+      'navigation.cards.symbolic_number_patterns.title';
+  static const navigationCardsSymbolicNumbersDescription =
+      'navigation.cards.symbolic_numbers.description';
+  static const navigationCardsSymbolicNumbersTitle =
+      'navigation.cards.symbolic_numbers.title';
+  static const navigationCardsTellAnotherDreamDescription =
+      'navigation.cards.tell_another_dream.description';
+  static const navigationCardsTellAnotherDreamTitle =
+      'navigation.cards.tell_another_dream.title';
+  static const navigationCardsTellYourDreamDescription =
+      'navigation.cards.tell_your_dream.description';
+  static const navigationCardsTellYourDreamTitle =
+      'navigation.cards.tell_your_dream.title';
+  static const navigationCardsTermsDescription =
+      'navigation.cards.terms.description';
+  static const navigationCardsThisYearsChartDescription =
+      'navigation.cards.this_years_chart.description';
+  static const navigationCardsTodaysCosmicEnergyDescription =
+      'navigation.cards.todays_cosmic_energy.description';
+  static const navigationCardsTodaysCosmicEnergyTitle =
+      'navigation.cards.todays_cosmic_energy.title';
+  static const navigationCardsTodaysEnergyDescription =
+      'navigation.cards.todays_energy.description';
+  static const navigationCardsTwelfthHouseDreamsDescription =
+      'navigation.cards.twelfth_house_dreams.description';
+  static const navigationCardsTwelfthHouseDreamsTitle =
+      'navigation.cards.twelfth_house_dreams.title';
+  static const navigationCardsTwelveSignsDescription =
+      'navigation.cards.twelve_signs.description';
+  static const navigationCardsWeeklyOverviewDescription =
+      'navigation.cards.weekly_overview.description';
+  static const navigationCardsWeeklyOverviewTitle =
+      'navigation.cards.weekly_overview.title';
+  static const navigationCardsYourCosmicMessageDescription =
+      'navigation.cards.your_cosmic_message.description';
+  static const navigationCardsYourCosmicMessageTitle =
+      'navigation.cards.your_cosmic_message.title';
+  static const navigationPhrasesCosmicGuidance =
+      'navigation.phrases.cosmic_guidance';
+  static const navigationPhrasesHowThisPairDances =
+      'navigation.phrases.how_this_pair_dances';
+  static const navigationPhrasesSameElementDifferentEnergy =
+      'navigation.phrases.same_element_different_energy';
+  static const navigationPhrasesSiblingElementEnergy =
+      'navigation.phrases.sibling_element_energy';
+  static const navigationPhrasesSpecialMessageForToday =
+      'navigation.phrases.special_message_for_today';
+  static const navigationPhrasesWeeklyExploration =
+      'navigation.phrases.weekly_exploration';
+  static const navigationPhrasesWhereIsYourRuler =
+      'navigation.phrases.where_is_your_ruler';
+  static const navigationPhrasesWhichDreamsThisSignSees =
+      'navigation.phrases.which_dreams_this_sign_sees';
+  static const navigationProfile = 'navigation.profile';
+  static const navigationSectionTitlesAlsoViewed =
+      'navigation.section_titles.also_viewed';
+  static const navigationSectionTitlesContinueWithoutBack =
+      'navigation.section_titles.continue_without_back';
+  static const navigationSectionTitlesGoDeeper =
+      'navigation.section_titles.go_deeper';
+  static const navigationSectionTitlesKeepExploring =
+      'navigation.section_titles.keep_exploring';
+  static const notesNoteDetailAdd = 'notes.note_detail.add';
+  static const notesNoteDetailCancel = 'notes.note_detail.cancel';
+  static const notesNoteDetailCancel1 = 'notes.note_detail.cancel_1';
+  static const notesNoteDetailCancel2 = 'notes.note_detail.cancel_2';
+  static const notesNoteDetailCouldntLoadThisNote =
+      'notes.note_detail.couldnt_load_this_note';
+  static const notesNoteDetailCustomMessageOptional =
+      'notes.note_detail.custom_message_optional';
+  static const notesNoteDetailDelete = 'notes.note_detail.delete';
+  static const notesNoteDetailDeleteNote = 'notes.note_detail.delete_note';
+  static const notesNoteDetailDeleteNote1 = 'notes.note_detail.delete_note_1';
+  static const notesNoteDetailDiscard = 'notes.note_detail.discard';
+  static const notesNoteDetailDiscardChanges =
+      'notes.note_detail.discard_changes';
+  static const notesNoteDetailEditNote = 'notes.note_detail.edit_note';
+  static const notesNoteDetailEgIdeasPersonal =
+      'notes.note_detail.eg_ideas_personal';
+  static const notesNoteDetailFrequency = 'notes.note_detail.frequency';
+  static const notesNoteDetailGiveThisNoteATitle =
+      'notes.note_detail.give_this_note_a_title';
+  static const notesNoteDetailMoodWhenCreated =
+      'notes.note_detail.mood_when_created';
+  static const notesNoteDetailNewNote = 'notes.note_detail.new_note';
+  static const notesNoteDetailPickDateTime = 'notes.note_detail.pick_date_time';
+  static const notesNoteDetailRemindMe = 'notes.note_detail.remind_me';
+  static const notesNoteDetailRetry = 'notes.note_detail.retry';
+  static const notesNoteDetailSaveNote = 'notes.note_detail.save_note';
+  static const notesNoteDetailSaveNote1 = 'notes.note_detail.save_note_1';
+  static const notesNoteDetailSetADateTimeToGetNotifiedAboutTh =
+      'notes.note_detail.set_a_date_time_to_get_notified_about_th';
+  static const notesNoteDetailSetReminder = 'notes.note_detail.set_reminder';
+  static const notesNoteDetailShare = 'notes.note_detail.share';
+  static const notesNoteDetailTags = 'notes.note_detail.tags';
+  static const notesNoteDetailThisNoteWillBePermanentlyDeleted =
+      'notes.note_detail.this_note_will_be_permanently_deleted';
+  static const notesNoteDetailWillBeSetWhenYouSave =
+      'notes.note_detail.will_be_set_when_you_save';
+  static const notesNoteDetailWriteYourThoughts =
+      'notes.note_detail.write_your_thoughts';
+  static const notesNoteDetailYouHaveUnsavedChangesAreYouSureYo =
+      'notes.note_detail.you_have_unsaved_changes_are_you_sure_yo';
+  static const notesNotesListAll = 'notes.notes_list.all';
+  static const notesNotesListCancel = 'notes.notes_list.cancel';
+  static const notesNotesListCaptureYourThoughts =
+      'notes.notes_list.capture_your_thoughts';
+  static const notesNotesListClearSearch = 'notes.notes_list.clear_search';
+  static const notesNotesListCouldntLoadYourNotes =
+      'notes.notes_list.couldnt_load_your_notes';
+  static const notesNotesListDelete = 'notes.notes_list.delete';
+  static const notesNotesListDeleteNote = 'notes.notes_list.delete_note';
+  static const notesNotesListNewNote = 'notes.notes_list.new_note';
+  static const notesNotesListNoNotesMatchedYourSearch =
+      'notes.notes_list.no_notes_matched_your_search';
+  static const notesNotesListNotes = 'notes.notes_list.notes';
+  static const notesNotesListNotes1 = 'notes.notes_list.notes_1';
+  static const notesNotesListNow = 'notes.notes_list.now';
+  static const notesNotesListPinned = 'notes.notes_list.pinned';
+  static const notesNotesListPinned1 = 'notes.notes_list.pinned_1';
+  static const notesNotesListQuickNotesRemindersIdeasNeverything =
+      'notes.notes_list.quick_notes_reminders_ideas_neverything';
+  static const notesNotesListRecent = 'notes.notes_list.recent';
+  static const notesNotesListRetry = 'notes.notes_list.retry';
+  static const notesNotesListSearchNotes = 'notes.notes_list.search_notes';
+  static const notesNotesListTags = 'notes.notes_list.tags';
+  static const notesNotesListThisNoteWillBePermanentlyDeleted =
+      'notes.notes_list.this_note_will_be_permanently_deleted';
+  static const notesNotesListTryADifferentSearchTerm =
+      'notes.notes_list.try_a_different_search_term';
+  static const notesNotesListUntitled = 'notes.notes_list.untitled';
+  static const notesNotesListWriteYourFirstNote =
+      'notes.notes_list.write_your_first_note';
+  static const notificationSettingsDailyInsight =
+      'notification_settings.daily_insight';
+  static const notificationSettingsOff = 'notification_settings.off';
+  static const notificationSettingsReminderAt =
+      'notification_settings.reminder_at';
+  static const notificationSettingsWellnessReminders =
+      'notification_settings.wellness_reminders';
+  static const notificationSettingsWellnessSubtitle =
+      'notification_settings.wellness_subtitle';
+  static const notificationsCycleAlerts = 'notifications.cycle_alerts';
+  static const notificationsCycleDesc = 'notifications.cycle_desc';
+  static const notificationsDailyReflection = 'notifications.daily_reflection';
+  static const notificationsDailyReflectionDesc =
+      'notifications.daily_reflection_desc';
+  static const notificationsLifecycleInsightTeaserBody =
+      'notifications.lifecycle.insight_teaser_body';
+  static const notificationsLifecycleInsightTeaserTitle =
+      'notifications.lifecycle.insight_teaser_title';
+  static const notificationsLifecycleMilestoneBody =
+      'notifications.lifecycle.milestone_body';
+  static const notificationsLifecycleMilestoneTitle =
+      'notifications.lifecycle.milestone_title';
+  static const notificationsLifecycleMoodCheckinBody =
+      'notifications.lifecycle.mood_checkin_body';
+  static const notificationsLifecycleMoodCheckinTitle =
+      'notifications.lifecycle.mood_checkin_title';
+  static const notificationsLifecycleReEngagement14dayBody =
+      'notifications.lifecycle.re_engagement_14day_body';
+  static const notificationsLifecycleReEngagement14dayTitle =
+      'notifications.lifecycle.re_engagement_14day_title';
+  static const notificationsLifecycleReEngagement30dayBody =
+      'notifications.lifecycle.re_engagement_30day_body';
+  static const notificationsLifecycleReEngagement30dayTitle =
+      'notifications.lifecycle.re_engagement_30day_title';
+  static const notificationsLifecycleReEngagement3dayBody =
+      'notifications.lifecycle.re_engagement_3day_body';
+  static const notificationsLifecycleReEngagement3dayTitle =
+      'notifications.lifecycle.re_engagement_3day_title';
+  static const notificationsLifecycleReEngagement7dayBody =
+      'notifications.lifecycle.re_engagement_7day_body';
+  static const notificationsLifecycleReEngagement7dayTitle =
+      'notifications.lifecycle.re_engagement_7day_title';
+  static const notificationsLifecycleSeasonalFullMoonBody =
+      'notifications.lifecycle.seasonal_full_moon_body';
+  static const notificationsLifecycleSeasonalFullMoonTitle =
+      'notifications.lifecycle.seasonal_full_moon_title';
+  static const notificationsLifecycleSeasonalNewMoonBody =
+      'notifications.lifecycle.seasonal_new_moon_body';
+  static const notificationsLifecycleSeasonalNewMoonTitle =
+      'notifications.lifecycle.seasonal_new_moon_title';
+  static const notificationsLifecycleSmartNotifications =
+      'notifications.lifecycle.smart_notifications';
+  static const notificationsLifecycleSmartNotificationsDesc =
+      'notifications.lifecycle.smart_notifications_desc';
+  static const notificationsLifecycleStreakReminderBody =
+      'notifications.lifecycle.streak_reminder_body';
+  static const notificationsLifecycleStreakReminderTitle =
+      'notifications.lifecycle.streak_reminder_title';
+  static const notificationsLifecycleWeeklyDigestBody =
+      'notifications.lifecycle.weekly_digest_body';
+  static const notificationsLifecycleWeeklyDigestTitle =
+      'notifications.lifecycle.weekly_digest_title';
+  static const notificationsMoonPhases = 'notifications.moon_phases';
+  static const notificationsMoonPhasesDesc = 'notifications.moon_phases_desc';
+  static const notificationsOff = 'notifications.off';
+  static const notificationsTitle = 'notifications.title';
+  static const onboardingArchetypeQuizDiscoveringYourArchetype =
+      'onboarding.archetype_quiz.discovering_your_archetype';
+  static const onboardingArchetypeQuizGetStarted =
+      'onboarding.archetype_quiz.get_started';
+  static const onboardingArchetypeQuizGrowthTip =
+      'onboarding.archetype_quiz.growth_tip';
+  static const onboardingArchetypeQuizSkip = 'onboarding.archetype_quiz.skip';
+  static const onboardingArchetypeQuizSkipForNow =
+      'onboarding.archetype_quiz.skip_for_now';
+  static const onboardingArchetypeQuizYourInnerArchetype =
+      'onboarding.archetype_quiz.your_inner_archetype';
+  static const onboardingArchetypeQuizYourStrengths =
+      'onboarding.archetype_quiz.your_strengths';
+  static const onboardingByContinuing = 'onboarding.by_continuing';
+  static const onboardingConnectWithApple = 'onboarding.connect_with_apple';
+  static const onboardingConnecting = 'onboarding.connecting';
+  static const onboardingCosmicIdentity = 'onboarding.cosmic_identity';
+  static const onboardingEnterInfoSubtitle = 'onboarding.enter_info_subtitle';
+  static const onboardingExploreNow = 'onboarding.explore_now';
+  static const onboardingFeatureDreams = 'onboarding.feature_dreams';
+  static const onboardingFeaturePatterns = 'onboarding.feature_patterns';
+  static const onboardingFeatureReflection = 'onboarding.feature_reflection';
+  static const onboardingFeatureSymbols = 'onboarding.feature_symbols';
+  static const onboardingFeaturesDailyReading =
+      'onboarding.features.daily_reading';
+  static const onboardingFeaturesDreamJournal =
+      'onboarding.features.dream_journal';
+  static const onboardingFeaturesPatterns = 'onboarding.features.patterns';
+  static const onboardingFeaturesPersonalProfile =
+      'onboarding.features.personal_profile';
+  static const onboardingInfoBoxText = 'onboarding.info_box_text';
+  static const onboardingOnboardingAGentleNudgeAt900Am =
+      'onboarding.onboarding.a_gentle_nudge_at_900_am';
+  static const onboardingOnboardingAbcd1234 = 'onboarding.onboarding.abcd1234';
+  static const onboardingOnboardingAllSignalsUnlockAsYouJournal =
+      'onboarding.onboarding.all_signals_unlock_as_you_journal';
+  static const onboardingOnboardingCheckInDailyToSeePatternsEmerge =
+      'onboarding.onboarding.check_in_daily_to_see_patterns_emerge';
+  static const onboardingOnboardingDailyReflectionJournal =
+      'onboarding.onboarding.daily_reflection_journal';
+  static const onboardingOnboardingDailyReflectionReminder =
+      'onboarding.onboarding.daily_reflection_reminder';
+  static const onboardingOnboardingDreamJournal =
+      'onboarding.onboarding.dream_journal';
+  static const onboardingOnboardingEnableNotifications =
+      'onboarding.onboarding.enable_notifications';
+  static const onboardingOnboardingEnterYourFriendsCodeFor7DaysFree =
+      'onboarding.onboarding.enter_your_friends_code_for_7_days_free';
+  static const onboardingOnboardingGetStarted =
+      'onboarding.onboarding.get_started';
+  static const onboardingOnboardingHaveAnInviteCode =
+      'onboarding.onboarding.have_an_invite_code';
+  static const onboardingOnboardingHowAreYouFeelingRightNow =
+      'onboarding.onboarding.how_are_you_feeling_right_now';
+  static const onboardingOnboardingKvkkConsent =
+      'onboarding.onboarding.kvkk_consent';
+  static const onboardingOnboardingOneLastThingStayOnTrackWithGentle =
+      'onboarding.onboarding.one_last_thing_stay_on_track_with_gentle';
+  static const onboardingOnboardingPatternRecognition =
+      'onboarding.onboarding.pattern_recognition';
+  static const onboardingOnboardingPickYourStartingSignal =
+      'onboarding.onboarding.pick_your_starting_signal';
+  static const onboardingOnboardingPrivacyPolicyLink =
+      'onboarding.onboarding.privacy_policy_link';
+  static const onboardingOnboardingPrivateSecureYourJournalStaysOnYou =
+      'onboarding.onboarding.private_secure_your_journal_stays_on_you';
+  static const onboardingOnboardingSkipForNow =
+      'onboarding.onboarding.skip_for_now';
+  static const onboardingOnboardingSymbolGlossary =
+      'onboarding.onboarding.symbol_glossary';
+  static const onboardingOnboardingTheresNoWrongAnswerFollowYourCurio =
+      'onboarding.onboarding.theres_no_wrong_answer_follow_your_curio';
+  static const onboardingOnboardingWhatsIncluded =
+      'onboarding.onboarding.whats_included';
+  static const onboardingOnboardingYourFirstCheckinThisPowersYourMood =
+      'onboarding.onboarding.your_first_checkin_this_powers_your_mood';
+  static const onboardingOnboardingYourStoryYourPatternsYourClarity =
+      'onboarding.onboarding.your_story_your_patterns_your_clarity';
+  static const onboardingOnboardingYoureAllSet =
+      'onboarding.onboarding.youre_all_set';
+  static const onboardingProfileReady = 'onboarding.profile_ready';
+  static const onboardingReadySubtitle = 'onboarding.ready_subtitle';
+  static const onboardingStartCosmicJourney = 'onboarding.start_cosmic_journey';
+  static const onboardingTapToContinue = 'onboarding.tap_to_continue';
+  static const onboardingWelcomeText = 'onboarding.welcome_text';
+  static const onboardingWhatsIncluded = 'onboarding.whats_included';
+  static const onboardingWillBeCalculated = 'onboarding.will_be_calculated';
+  static const personalProfileTitle = 'personal_profile.title';
+  static const premiumBackToApp = 'premium.back_to_app';
+  static const premiumBestValue = 'premium.best_value';
+  static const premiumComparisonFeatureAds = 'premium.comparison.feature_ads';
+  static const premiumComparisonFeatureAdsFree =
+      'premium.comparison.feature_ads_free';
+  static const premiumComparisonFeatureAdsPro =
+      'premium.comparison.feature_ads_pro';
+  static const premiumComparisonFeatureDreams =
+      'premium.comparison.feature_dreams';
+  static const premiumComparisonFeatureDreamsFree =
+      'premium.comparison.feature_dreams_free';
+  static const premiumComparisonFeatureDreamsPro =
+      'premium.comparison.feature_dreams_pro';
+  static const premiumComparisonFeatureExport =
+      'premium.comparison.feature_export';
+  static const premiumComparisonFeatureExportFree =
+      'premium.comparison.feature_export_free';
+  static const premiumComparisonFeatureExportPro =
+      'premium.comparison.feature_export_pro';
+  static const premiumComparisonFeatureJournal =
+      'premium.comparison.feature_journal';
+  static const premiumComparisonFeatureJournalFree =
+      'premium.comparison.feature_journal_free';
+  static const premiumComparisonFeatureJournalPro =
+      'premium.comparison.feature_journal_pro';
+  static const premiumComparisonFeaturePatterns =
+      'premium.comparison.feature_patterns';
+  static const premiumComparisonFeaturePatternsFree =
+      'premium.comparison.feature_patterns_free';
+  static const premiumComparisonFeaturePatternsPro =
+      'premium.comparison.feature_patterns_pro';
+  static const premiumComparisonFeaturePrograms =
+      'premium.comparison.feature_programs';
+  static const premiumComparisonFeatureProgramsFree =
+      'premium.comparison.feature_programs_free';
+  static const premiumComparisonFeatureProgramsPro =
+      'premium.comparison.feature_programs_pro';
+  static const premiumComparisonFeatureReports =
+      'premium.comparison.feature_reports';
+  static const premiumComparisonFeatureReportsFree =
+      'premium.comparison.feature_reports_free';
+  static const premiumComparisonFeatureReportsPro =
+      'premium.comparison.feature_reports_pro';
+  static const premiumComparisonFeatureStreaks =
+      'premium.comparison.feature_streaks';
+  static const premiumComparisonFeatureStreaksFree =
+      'premium.comparison.feature_streaks_free';
+  static const premiumComparisonFeatureStreaksPro =
+      'premium.comparison.feature_streaks_pro';
+  static const premiumComparisonTitle = 'premium.comparison.title';
+  static const premiumContextualPaywall4MoreInterpretationPerspectivesAvail =
+      'premium.contextual_paywall.4_more_interpretation_perspectives_avail';
+  static const premiumContextualPaywallAcceptChallenge =
+      'premium.contextual_paywall.accept_challenge';
+  static const premiumContextualPaywallAccessAllPerspectives =
+      'premium.contextual_paywall.access_all_perspectives';
+  static const premiumContextualPaywallAccessCycleInsights =
+      'premium.contextual_paywall.access_cycle_insights';
+  static const premiumContextualPaywallAccessShadowWork =
+      'premium.contextual_paywall.access_shadow_work';
+  static const premiumContextualPaywallCancelAnytimeYourEntriesAreAlwaysY =
+      'premium.contextual_paywall.cancel_anytime_your_entries_are_always_y';
+  static const premiumContextualPaywallDiscoverMyPatterns =
+      'premium.contextual_paywall.discover_my_patterns';
+  static const premiumContextualPaywallDiscoverMyPatterns1 =
+      'premium.contextual_paywall.discover_my_patterns_1';
+  static const premiumContextualPaywallExploreYourHiddenPatterns =
+      'premium.contextual_paywall.explore_your_hidden_patterns';
+  static const premiumContextualPaywallExportEverything =
+      'premium.contextual_paywall.export_everything';
+  static const premiumContextualPaywallFreezeYourStreakAndPickUpWhereYou =
+      'premium.contextual_paywall.freeze_your_streak_and_pick_up_where_you';
+  static const premiumContextualPaywallGoAdfree =
+      'premium.contextual_paywall.go_adfree';
+  static const premiumContextualPaywallGoDeeperWithGuidedGrowth =
+      'premium.contextual_paywall.go_deeper_with_guided_growth';
+  static const premiumContextualPaywallGuidedShadowWorkHelpsYouUnderstand =
+      'premium.contextual_paywall.guided_shadow_work_helps_you_understand';
+  static const premiumContextualPaywallNoAiNoCloudJustYourWordsRevealing =
+      'premium.contextual_paywall.no_ai_no_cloud_just_your_words_revealing';
+  static const premiumContextualPaywallNotNow =
+      'premium.contextual_paywall.not_now';
+  static const premiumContextualPaywallProGrowthChallengesThatElevateYour =
+      'premium.contextual_paywall.pro_growth_challenges_that_elevate_your';
+  static const premiumContextualPaywallProtectMyStreak =
+      'premium.contextual_paywall.protect_my_streak';
+  static const premiumContextualPaywallPushYourLimits =
+      'premium.contextual_paywall.push_your_limits';
+  static const premiumContextualPaywallRemoveAllAdsAndFocusOnWhatMatters =
+      'premium.contextual_paywall.remove_all_ads_and_focus_on_what_matters';
+  static const premiumContextualPaywallSeeHowYourEmotionalPatternsAlignWi =
+      'premium.contextual_paywall.see_how_your_emotional_patterns_align_wi';
+  static const premiumContextualPaywallStartProgram =
+      'premium.contextual_paywall.start_program';
+  static const premiumContextualPaywallStructuredMultidaySequencesDesignedT =
+      'premium.contextual_paywall.structured_multiday_sequences_designed_t';
+  static const premiumContextualPaywallSurfacePatternsFromYourEntriesWith =
+      'premium.contextual_paywall.surface_patterns_from_your_entries_with';
+  static const premiumContextualPaywallUnderstandYourCyclePatterns =
+      'premium.contextual_paywall.understand_your_cycle_patterns';
+  static const premiumContextualPaywallViewMyReport =
+      'premium.contextual_paywall.view_my_report';
+  static const premiumContextualPaywallYourDataBelongsToYou =
+      'premium.contextual_paywall.your_data_belongs_to_you';
+  static const premiumContextualPaywallYourDataHasMoreToShow =
+      'premium.contextual_paywall.your_data_has_more_to_show';
+  static const premiumContextualPaywallYourDataHasMoreToShow1 =
+      'premium.contextual_paywall.your_data_has_more_to_show_1';
+  static const premiumContextualPaywallYourDreamHasMoreToSay =
+      'premium.contextual_paywall.your_dream_has_more_to_say';
+  static const premiumContextualPaywallYourEntriesHoldPatternsYouCantSee =
+      'premium.contextual_paywall.your_entries_hold_patterns_you_cant_see';
+  static const premiumContextualPaywallYourInvestmentSoFar =
+      'premium.contextual_paywall.your_investment_so_far';
+  static const premiumContextualPaywallYourMonthlyReflectionReportDistills =
+      'premium.contextual_paywall.your_monthly_reflection_report_distills';
+  static const premiumContextualPaywallYourReflectionSpaceUninterrupted =
+      'premium.contextual_paywall.your_reflection_space_uninterrupted';
+  static const premiumCosmicDoorOpened = 'premium.cosmic_door_opened';
+  static const premiumCosmicPowers = 'premium.cosmic_powers';
+  static const premiumCosmicPowersActive = 'premium.cosmic_powers_active';
+  static const premiumDayStreak = 'premium.day_streak';
+  static const premiumDreamCount = 'premium.dream_count';
+  static const premiumEntryCount = 'premium.entry_count';
+  static const premiumFeaturesDailyWhispers = 'premium.features.daily_whispers';
+  static const premiumFeaturesDeepPatternAnalysis =
+      'premium.features.deep_pattern_analysis';
+  static const premiumFeaturesEnergyAwareness =
+      'premium.features.energy_awareness';
+  static const premiumFeaturesInnerWisdomTools =
+      'premium.features.inner_wisdom_tools';
+  static const premiumFeaturesPriorityGuidance =
+      'premium.features.priority_guidance';
+  static const premiumFeaturesPureCosmicExperience =
+      'premium.features.pure_cosmic_experience';
+  static const premiumFeaturesRecurrenceDetection =
+      'premium.features.recurrence_detection';
+  static const premiumFeaturesRelationshipMapping =
+      'premium.features.relationship_mapping';
+  static const premiumFeaturesUnlimitedCardInsight =
+      'premium.features.unlimited_card_insight';
+  static const premiumLifetime = 'premium.lifetime';
+  static const premiumLifetimeAccess = 'premium.lifetime_access';
+  static const premiumManageSubscription = 'premium.manage_subscription';
+  static const premiumNoPurchasesFound = 'premium.no_purchases_found';
+  static const premiumOpenCosmicDoor = 'premium.open_cosmic_door';
+  static const premiumPaywallBenefitAdFree = 'premium.paywall.benefit_ad_free';
+  static const premiumPaywallBenefitExport = 'premium.paywall.benefit_export';
+  static const premiumPaywallBenefitPriority =
+      'premium.paywall.benefit_priority';
+  static const premiumPaywallBenefitPrograms =
+      'premium.paywall.benefit_programs';
+  static const premiumPaywallBenefitReports = 'premium.paywall.benefit_reports';
+  static const premiumPaywallBenefitUnlimited =
+      'premium.paywall.benefit_unlimited';
+  static const premiumPaywallContinuePro = 'premium.paywall.continue_pro';
+  static const premiumPaywallLegalText = 'premium.paywall.legal_text';
+  static const premiumPaywallNotNow = 'premium.paywall.not_now';
+  static const premiumPaywallPrivacyPolicy = 'premium.paywall.privacy_policy';
+  static const premiumPaywallSubtitle = 'premium.paywall.subtitle';
+  static const premiumPaywallTermsOfUse = 'premium.paywall.terms_of_use';
+  static const premiumPaywallTitle = 'premium.paywall.title';
+  static const premiumPremium50OffNewUserSpecial =
+      'premium.premium.50_off_new_user_special';
+  static const premiumPremiumOfferExpiresIn =
+      'premium.premium.offer_expires_in';
+  static const premiumPremiumPrivacyPolicy = 'premium.premium.privacy_policy';
+  static const premiumPremiumRestorePurchases =
+      'premium.premium.restore_purchases';
+  static const premiumPremiumTermsOfService =
+      'premium.premium.terms_of_service';
+  static const premiumPremiumTrustedByThousandsOfJournalers =
+      'premium.premium.trusted_by_thousands_of_journalers';
+  static const premiumPriceAnchor = 'premium.price_anchor';
+  static const premiumPriceMonthlyCrossed = 'premium.price_monthly_crossed';
+  static const premiumPricingMonthly = 'premium.pricing.monthly';
+  static const premiumPricingYearlyMonthly = 'premium.pricing.yearly_monthly';
+  static const premiumPurchasesRestored = 'premium.purchases_restored';
+  static const premiumRestorePurchases = 'premium.restore_purchases';
+  static const premiumRetentionGotIt = 'premium.retention.got_it';
+  static const premiumRetentionMessage = 'premium.retention.message';
+  static const premiumRetentionTitle = 'premium.retention.title';
+  static const premiumRiskReversal = 'premium.risk_reversal';
+  static const premiumSuccessMessage = 'premium.success_message';
+  static const premiumTermsText = 'premium.terms_text';
+  static const premiumTiersFreeFeatures = 'premium.tiers.free.features';
+  static const premiumTiersFreeName = 'premium.tiers.free.name';
+  static const premiumTiersFreeSavings = 'premium.tiers.free.savings';
+  static const premiumTiersLifetimeFeatures = 'premium.tiers.lifetime.features';
+  static const premiumTiersLifetimeName = 'premium.tiers.lifetime.name';
+  static const premiumTiersLifetimeSavings = 'premium.tiers.lifetime.savings';
+  static const premiumTiersMonthlyFeatures = 'premium.tiers.monthly.features';
+  static const premiumTiersMonthlyName = 'premium.tiers.monthly.name';
+  static const premiumTiersMonthlySavings = 'premium.tiers.monthly.savings';
+  static const premiumTiersYearlyFeatures = 'premium.tiers.yearly.features';
+  static const premiumTiersYearlyName = 'premium.tiers.yearly.name';
+  static const premiumTiersYearlySavings = 'premium.tiers.yearly.savings';
+  static const premiumViewPlans = 'premium.view_plans';
+  static const profileAddProfileSubtitle = 'profile.add_profile_subtitle';
+  static const profileBigThree = 'profile.big_three';
+  static const profileCompare = 'profile.compare';
+  static const profileCreateProfile = 'profile.create_profile';
+  static const profileDeleteProfile = 'profile.delete_profile';
+  static const profileDiscardChangesMessage = 'profile.discard_changes_message';
+  static const profileDiscardChangesTitle = 'profile.discard_changes_title';
+  static const profileEditInfo = 'profile.edit_info';
+  static const profileEmojiSelect = 'profile.emoji_select';
+  static const profileEntriesLogged = 'profile.entries_logged';
+  static const profileJournalStreak = 'profile.journal_streak';
+  static const profileMakeMainProfile = 'profile.make_main_profile';
+  static const profileMoonType = 'profile.moon_type';
+  static const profileNoProfilesDescription = 'profile.no_profiles_description';
+  static const profileNoProfilesYet = 'profile.no_profiles_yet';
+  static const profilePatternsFound = 'profile.patterns_found';
+  static const profileProfileExploreYourPatternsTrackYourGrowth =
+      'profile.profile.explore_your_patterns_track_your_growth';
+  static const profileProfileViewInsights = 'profile.profile.view_insights';
+  static const profileProfileYourProgress = 'profile.profile.your_progress';
+  static const profileProfileHeroGrowthScore =
+      'profile.profile_hero.growth_score';
+  static const profileProfileHubExplorer = 'profile.profile_hub.explorer';
+  static const profileProfileHubProfile = 'profile.profile_hub.profile';
+  static const profileProfileRateAQuickRatingHelpsUsGrow =
+      'profile.profile_rate.a_quick_rating_helps_us_grow';
+  static const profileProfileRateEnjoyingInnercycles =
+      'profile.profile_rate.enjoying_innercycles';
+  static const profileProfileRateRate = 'profile.profile_rate.rate';
+  static const profileProfileReferral7DaysFreeForEachFriend =
+      'profile.profile_referral.7_days_free_for_each_friend';
+  static const profileProfileReferralInviteEarn =
+      'profile.profile_referral.invite_earn';
+  static const profileProfileReferralInviteFriendsGetPremium =
+      'profile.profile_referral.invite_friends_get_premium';
+  static const profileProfileReferralOpenReferralProgram =
+      'profile.profile_referral.open_referral_program';
+  static const profileProfileSaved = 'profile.profile_saved';
+  static const profileProfileSettingsEditProfile =
+      'profile.profile_settings.edit_profile';
+  static const profileProfileSettingsExportData =
+      'profile.profile_settings.export_data';
+  static const profileProfileSettingsGoPremium =
+      'profile.profile_settings.go_premium';
+  static const profileProfileSettingsNotifications =
+      'profile.profile_settings.notifications';
+  static const profileProfileSettingsSettings =
+      'profile.profile_settings.settings';
+  static const profileProfileSettingsSettings1 =
+      'profile.profile_settings.settings_1';
+  static const profileProfileSettingsUnlockFullPotential =
+      'profile.profile_settings.unlock_full_potential';
+  static const profileProfileStatsDashboardDone =
+      'profile.profile_stats_dashboard.done';
+  static const profileProfileStatsDashboardEntries =
+      'profile.profile_stats_dashboard.entries';
+  static const profileProfileStatsDashboardStreak =
+      'profile.profile_stats_dashboard.streak';
+  static const profileProfileStatsDashboardWords =
+      'profile.profile_stats_dashboard.words';
+  static const profileProfileToolsGridAddToFavorites =
+      'profile.profile_tools_grid.add_to_favorites';
+  static const profileProfileToolsGridAll = 'profile.profile_tools_grid.all';
+  static const profileProfileToolsGridAnalysis =
+      'profile.profile_tools_grid.analysis';
+  static const profileProfileToolsGridClearSearch =
+      'profile.profile_tools_grid.clear_search';
+  static const profileProfileToolsGridData = 'profile.profile_tools_grid.data';
+  static const profileProfileToolsGridDiscovery =
+      'profile.profile_tools_grid.discovery';
+  static const profileProfileToolsGridFavoritesU2b50 =
+      'profile.profile_tools_grid.favorites_u2b50';
+  static const profileProfileToolsGridJournal =
+      'profile.profile_tools_grid.journal';
+  static const profileProfileToolsGridNoFavoritesYet =
+      'profile.profile_tools_grid.no_favorites_yet';
+  static const profileProfileToolsGridNoToolsFound =
+      'profile.profile_tools_grid.no_tools_found';
+  static const profileProfileToolsGridReference =
+      'profile.profile_tools_grid.reference';
+  static const profileProfileToolsGridRemoveFromFavorites =
+      'profile.profile_tools_grid.remove_from_favorites';
+  static const profileProfileToolsGridSearchByNameOrCategory =
+      'profile.profile_tools_grid.search_by_name_or_category';
+  static const profileProfileToolsGridSuggestedForYou =
+      'profile.profile_tools_grid.suggested_for_you';
+  static const profileProfileToolsGridSupport =
+      'profile.profile_tools_grid.support';
+  static const profileProfileToolsGridTools =
+      'profile.profile_tools_grid.tools';
+  static const profileProfileVaultAppLock = 'profile.profile_vault.app_lock';
+  static const profileProfileVaultPrivateVault =
+      'profile.profile_vault.private_vault';
+  static const profileProfileVaultVaultSecurity =
+      'profile.profile_vault.vault_security';
+  static const profileRelationshipType = 'profile.relationship_type';
+  static const profileRelationshipTypesColleague =
+      'profile.relationship_types.colleague';
+  static const profileRelationshipTypesFamily =
+      'profile.relationship_types.family';
+  static const profileRelationshipTypesFriend =
+      'profile.relationship_types.friend';
+  static const profileRelationshipTypesOther =
+      'profile.relationship_types.other';
+  static const profileRelationshipTypesPartner =
+      'profile.relationship_types.partner';
+  static const profileRisingType = 'profile.rising_type';
+  static const profileSavedProfiles = 'profile.saved_profiles';
+  static const profileSunType = 'profile.sun_type';
+  static const profileViewInsight = 'profile.view_insight';
+  static const profileViewPersonalProfile = 'profile.view_personal_profile';
+  static const profileYourBirthInfo = 'profile.your_birth_info';
+  static const profileYourCoreIdentity = 'profile.your_core_identity';
+  static const programsActiveProgramCompleteToday =
+      'programs.active_program.complete_today';
+  static const programsActiveProgramCompleted =
+      'programs.active_program.completed';
+  static const programsActiveProgramCompleted1 =
+      'programs.active_program.completed_1';
+  static const programsActiveProgramDay = 'programs.active_program.day';
+  static const programsActiveProgramDays = 'programs.active_program.days';
+  static const programsActiveProgramDuration =
+      'programs.active_program.duration';
+  static const programsActiveProgramProgramCompleted =
+      'programs.active_program.program_completed';
+  static const programsActiveProgramRetry = 'programs.active_program.retry';
+  static const programsActiveProgramThisProgramHasntBeenStartedYet =
+      'programs.active_program.this_program_hasnt_been_started_yet';
+  static const programsActiveProgramWriteYourReflectionHereOptional =
+      'programs.active_program.write_your_reflection_here_optional';
+  static const programsActiveProgramYouHaveFinishedThisGuidedProgramWe =
+      'programs.active_program.you_have_finished_this_guided_program_we';
+  static const programsDayComplete = 'programs.day_complete';
+  static const programsProgramCompletionBackToHome =
+      'programs.program_completion.back_to_home';
+  static const programsProgramCompletionCertificateOfCompletion =
+      'programs.program_completion.certificate_of_completion';
+  static const programsProgramCompletionCompletedOn =
+      'programs.program_completion.completed_on';
+  static const programsProgramCompletionCongratulations =
+      'programs.program_completion.congratulations';
+  static const programsProgramCompletionDaysCompleted =
+      'programs.program_completion.days_completed';
+  static const programsProgramCompletionDaysOfReflection =
+      'programs.program_completion.days_of_reflection';
+  static const programsProgramCompletionDuration =
+      'programs.program_completion.duration';
+  static const programsProgramCompletionEveryDayOfReflectionIsAStepToward =
+      'programs.program_completion.every_day_of_reflection_is_a_step_toward';
+  static const programsProgramCompletionStartAnotherProgram =
+      'programs.program_completion.start_another_program';
+  static const programsProgramListAllPrograms =
+      'programs.program_list.all_programs';
+  static const programsProgramListCouldNotLoadYourLocalDataIsUnaffe =
+      'programs.program_list.could_not_load_your_local_data_is_unaffe';
+  static const programsProgramListDays = 'programs.program_list.days';
+  static const programsProgramListFree = 'programs.program_list.free';
+  static const programsProgramListGuidedPrograms =
+      'programs.program_list.guided_programs';
+  static const programsProgramListInProgress =
+      'programs.program_list.in_progress';
+  static const programsProgramListRetry = 'programs.program_list.retry';
+  static const programsProgramListStructuredReflectionJourneysToDeepen =
+      'programs.program_list.structured_reflection_journeys_to_deepen';
+  static const progressiveUnlockAllUnlocked = 'progressive_unlock.all_unlocked';
+  static const progressiveUnlockAnnualHeatmap =
+      'progressive_unlock.annual_heatmap';
+  static const progressiveUnlockCycleCorrelation =
+      'progressive_unlock.cycle_correlation';
+  static const progressiveUnlockDreamJournal =
+      'progressive_unlock.dream_journal';
+  static const progressiveUnlockEntriesUntil =
+      'progressive_unlock.entries_until';
+  static const progressiveUnlockEntryUntil = 'progressive_unlock.entry_until';
+  static const progressiveUnlockMonthlyReflection =
+      'progressive_unlock.monthly_reflection';
+  static const progressiveUnlockPatterns = 'progressive_unlock.patterns';
+  static const progressiveUnlockProgressLabel =
+      'progressive_unlock.progress_label';
+  static const progressiveUnlockUnlocked = 'progressive_unlock.unlocked';
+  static const promptsDailyQuestionQuestionOfTheDay =
+      'prompts.daily_question.question_of_the_day';
+  static const promptsDailyQuestionQuestionOfTheDay1 =
+      'prompts.daily_question.question_of_the_day_1';
+  static const promptsDailyQuestionShare = 'prompts.daily_question.share';
+  static const promptsDailyQuestionWrite = 'prompts.daily_question.write';
+  static const promptsPromptLibraryAll = 'prompts.prompt_library.all';
+  static const promptsPromptLibraryCompleted =
+      'prompts.prompt_library.completed';
+  static const promptsPromptLibraryCreativity =
+      'prompts.prompt_library.creativity';
+  static const promptsPromptLibraryCycleAwareness =
+      'prompts.prompt_library.cycle_awareness';
+  static const promptsPromptLibraryDeep = 'prompts.prompt_library.deep';
+  static const promptsPromptLibraryEmotions = 'prompts.prompt_library.emotions';
+  static const promptsPromptLibraryGoals = 'prompts.prompt_library.goals';
+  static const promptsPromptLibraryGratitude =
+      'prompts.prompt_library.gratitude';
+  static const promptsPromptLibraryLight = 'prompts.prompt_library.light';
+  static const promptsPromptLibraryMedium = 'prompts.prompt_library.medium';
+  static const promptsPromptLibraryMindfulness =
+      'prompts.prompt_library.mindfulness';
+  static const promptsPromptLibraryPromptLibrary =
+      'prompts.prompt_library.prompt_library';
+  static const promptsPromptLibraryRecovery = 'prompts.prompt_library.recovery';
+  static const promptsPromptLibraryRelationships =
+      'prompts.prompt_library.relationships';
+  static const promptsPromptLibraryRetry = 'prompts.prompt_library.retry';
+  static const promptsPromptLibrarySkip = 'prompts.prompt_library.skip';
+  static const promptsPromptLibraryStartWriting =
+      'prompts.prompt_library.start_writing';
+  static const promptsPromptLibraryStartWriting1 =
+      'prompts.prompt_library.start_writing_1';
+  static const promptsPromptLibraryYourProgress =
+      'prompts.prompt_library.your_progress';
+  static const promptsTodaysPrompt = 'prompts.todays_prompt';
+  static const quizAttachmentQuizAttachmentStyle =
+      'quiz.attachment_quiz.attachment_style';
+  static const quizAttachmentQuizBack = 'quiz.attachment_quiz.back';
+  static const quizAttachmentQuizFullBreakdown =
+      'quiz.attachment_quiz.full_breakdown';
+  static const quizAttachmentQuizGoDeeperPremium =
+      'quiz.attachment_quiz.go_deeper_premium';
+  static const quizAttachmentQuizGrowthAreas =
+      'quiz.attachment_quiz.growth_areas';
+  static const quizAttachmentQuizRetakeQuiz =
+      'quiz.attachment_quiz.retake_quiz';
+  static const quizAttachmentQuizShareYourResult =
+      'quiz.attachment_quiz.share_your_result';
+  static const quizAttachmentQuizYourReflection =
+      'quiz.attachment_quiz.your_reflection';
+  static const quizAttachmentQuizYourStrengths =
+      'quiz.attachment_quiz.your_strengths';
+  static const quizContentDisclaimerCardInsight =
+      'quiz.content_disclaimer.card_insight';
+  static const quizContentDisclaimerDreams = 'quiz.content_disclaimer.dreams';
+  static const quizContentDisclaimerGeneral = 'quiz.content_disclaimer.general';
+  static const quizContentDisclaimerHealth = 'quiz.content_disclaimer.health';
+  static const quizContentDisclaimerInsight = 'quiz.content_disclaimer.insight';
+  static const quizContentDisclaimerNumberPatterns =
+      'quiz.content_disclaimer.number_patterns';
+  static const quizContentDisclaimerReflection =
+      'quiz.content_disclaimer.reflection';
+  static const quizContentDisclaimerSelfAwareness =
+      'quiz.content_disclaimer.self_awareness';
+  static const quizCtaDreamButton = 'quiz.cta.dream_button';
+  static const quizCtaDreamHeadline = 'quiz.cta.dream_headline';
+  static const quizCtaDreamSubtext = 'quiz.cta.dream_subtext';
+  static const quizCtaGeneralButton = 'quiz.cta.general_button';
+  static const quizCtaGeneralHeadline = 'quiz.cta.general_headline';
+  static const quizCtaGeneralSubtext = 'quiz.cta.general_subtext';
+  static const quizCtaInlineDefault = 'quiz.cta.inline_default';
+  static const quizCtaNumberAwarenessButton =
+      'quiz.cta.number_awareness_button';
+  static const quizCtaNumberAwarenessHeadline =
+      'quiz.cta.number_awareness_headline';
+  static const quizCtaNumberAwarenessSubtext =
+      'quiz.cta.number_awareness_subtext';
+  static const quizCtaSelfAwarenessButton = 'quiz.cta.self_awareness_button';
+  static const quizCtaSelfAwarenessHeadline =
+      'quiz.cta.self_awareness_headline';
+  static const quizCtaSelfAwarenessSubtext = 'quiz.cta.self_awareness_subtext';
+  static const quizDreamA11 = 'quiz.dream_a1_1';
+  static const quizDreamA12 = 'quiz.dream_a1_2';
+  static const quizDreamA13 = 'quiz.dream_a1_3';
+  static const quizDreamA14 = 'quiz.dream_a1_4';
+  static const quizDreamA21 = 'quiz.dream_a2_1';
+  static const quizDreamA22 = 'quiz.dream_a2_2';
+  static const quizDreamA23 = 'quiz.dream_a2_3';
+  static const quizDreamA24 = 'quiz.dream_a2_4';
+  static const quizDreamA31 = 'quiz.dream_a3_1';
+  static const quizDreamA32 = 'quiz.dream_a3_2';
+  static const quizDreamA33 = 'quiz.dream_a3_3';
+  static const quizDreamA34 = 'quiz.dream_a3_4';
+  static const quizDreamA41 = 'quiz.dream_a4_1';
+  static const quizDreamA42 = 'quiz.dream_a4_2';
+  static const quizDreamA43 = 'quiz.dream_a4_3';
+  static const quizDreamA44 = 'quiz.dream_a4_4';
+  static const quizDreamDescription = 'quiz.dream_description';
+  static const quizDreamQ1 = 'quiz.dream_q1';
+  static const quizDreamQ2 = 'quiz.dream_q2';
+  static const quizDreamQ3 = 'quiz.dream_q3';
+  static const quizDreamQ4 = 'quiz.dream_q4';
+  static const quizDreamTitle = 'quiz.dream_title';
+  static const quizGeneralA11 = 'quiz.general_a1_1';
+  static const quizGeneralA12 = 'quiz.general_a1_2';
+  static const quizGeneralA13 = 'quiz.general_a1_3';
+  static const quizGeneralA14 = 'quiz.general_a1_4';
+  static const quizGeneralA21 = 'quiz.general_a2_1';
+  static const quizGeneralA22 = 'quiz.general_a2_2';
+  static const quizGeneralA23 = 'quiz.general_a2_3';
+  static const quizGeneralA24 = 'quiz.general_a2_4';
+  static const quizGeneralA31 = 'quiz.general_a3_1';
+  static const quizGeneralA32 = 'quiz.general_a3_2';
+  static const quizGeneralA33 = 'quiz.general_a3_3';
+  static const quizGeneralA34 = 'quiz.general_a3_4';
+  static const quizGeneralA41 = 'quiz.general_a4_1';
+  static const quizGeneralA42 = 'quiz.general_a4_2';
+  static const quizGeneralA43 = 'quiz.general_a4_3';
+  static const quizGeneralA44 = 'quiz.general_a4_4';
+  static const quizGeneralDescription = 'quiz.general_description';
+  static const quizGeneralQ1 = 'quiz.general_q1';
+  static const quizGeneralQ2 = 'quiz.general_q2';
+  static const quizGeneralQ3 = 'quiz.general_q3';
+  static const quizGeneralQ4 = 'quiz.general_q4';
+  static const quizGeneralTitle = 'quiz.general_title';
+  static const quizGenericQuizBack = 'quiz.generic_quiz.back';
+  static const quizGenericQuizBackToAllQuizzes =
+      'quiz.generic_quiz.back_to_all_quizzes';
+  static const quizGenericQuizFullBreakdown =
+      'quiz.generic_quiz.full_breakdown';
+  static const quizGenericQuizGrowthAreas = 'quiz.generic_quiz.growth_areas';
+  static const quizGenericQuizRetakeQuiz = 'quiz.generic_quiz.retake_quiz';
+  static const quizGenericQuizYourResult = 'quiz.generic_quiz.your_result';
+  static const quizGenericQuizYourStrengths =
+      'quiz.generic_quiz.your_strengths';
+  static const quizNumberAwarenessA11 = 'quiz.number_awareness_a1_1';
+  static const quizNumberAwarenessA12 = 'quiz.number_awareness_a1_2';
+  static const quizNumberAwarenessA13 = 'quiz.number_awareness_a1_3';
+  static const quizNumberAwarenessA14 = 'quiz.number_awareness_a1_4';
+  static const quizNumberAwarenessA21 = 'quiz.number_awareness_a2_1';
+  static const quizNumberAwarenessA22 = 'quiz.number_awareness_a2_2';
+  static const quizNumberAwarenessA23 = 'quiz.number_awareness_a2_3';
+  static const quizNumberAwarenessA24 = 'quiz.number_awareness_a2_4';
+  static const quizNumberAwarenessA31 = 'quiz.number_awareness_a3_1';
+  static const quizNumberAwarenessA32 = 'quiz.number_awareness_a3_2';
+  static const quizNumberAwarenessA33 = 'quiz.number_awareness_a3_3';
+  static const quizNumberAwarenessA34 = 'quiz.number_awareness_a3_4';
+  static const quizNumberAwarenessDescription =
+      'quiz.number_awareness_description';
+  static const quizNumberAwarenessQ1 = 'quiz.number_awareness_q1';
+  static const quizNumberAwarenessQ2 = 'quiz.number_awareness_q2';
+  static const quizNumberAwarenessQ3 = 'quiz.number_awareness_q3';
+  static const quizNumberAwarenessTitle = 'quiz.number_awareness_title';
+  static const quizQuizHubCompleted = 'quiz.quiz_hub.completed';
+  static const quizQuizHubCompleted1 = 'quiz.quiz_hub.completed_1';
+  static const quizQuizHubExploreDifferentAspectsOfYourselfTh =
+      'quiz.quiz_hub.explore_different_aspects_of_yourself_th';
+  static const quizQuizHubSelfreflectionQuizzes =
+      'quiz.quiz_hub.selfreflection_quizzes';
+  static const quizResultDreamHighDesc = 'quiz.result_dream_high_desc';
+  static const quizResultDreamHighTitle = 'quiz.result_dream_high_title';
+  static const quizResultDreamLowDesc = 'quiz.result_dream_low_desc';
+  static const quizResultDreamLowTitle = 'quiz.result_dream_low_title';
+  static const quizResultDreamMediumDesc = 'quiz.result_dream_medium_desc';
+  static const quizResultDreamMediumTitle = 'quiz.result_dream_medium_title';
+  static const quizResultGeneralHighDesc = 'quiz.result_general_high_desc';
+  static const quizResultGeneralHighTitle = 'quiz.result_general_high_title';
+  static const quizResultGeneralLowDesc = 'quiz.result_general_low_desc';
+  static const quizResultGeneralLowTitle = 'quiz.result_general_low_title';
+  static const quizResultGeneralMediumDesc = 'quiz.result_general_medium_desc';
+  static const quizResultGeneralMediumTitle =
+      'quiz.result_general_medium_title';
+  static const quizResultNumberHighDesc = 'quiz.result_number_high_desc';
+  static const quizResultNumberHighTitle = 'quiz.result_number_high_title';
+  static const quizResultNumberLowDesc = 'quiz.result_number_low_desc';
+  static const quizResultNumberLowTitle = 'quiz.result_number_low_title';
+  static const quizResultNumberMediumDesc = 'quiz.result_number_medium_desc';
+  static const quizResultNumberMediumTitle = 'quiz.result_number_medium_title';
+  static const quizResultSelfAwarenessHighDesc =
+      'quiz.result_self_awareness_high_desc';
+  static const quizResultSelfAwarenessHighTitle =
+      'quiz.result_self_awareness_high_title';
+  static const quizResultSelfAwarenessLowDesc =
+      'quiz.result_self_awareness_low_desc';
+  static const quizResultSelfAwarenessLowTitle =
+      'quiz.result_self_awareness_low_title';
+  static const quizResultSelfAwarenessMediumDesc =
+      'quiz.result_self_awareness_medium_desc';
+  static const quizResultSelfAwarenessMediumTitle =
+      'quiz.result_self_awareness_medium_title';
+  static const quizSelfAwarenessA11 = 'quiz.self_awareness_a1_1';
+  static const quizSelfAwarenessA12 = 'quiz.self_awareness_a1_2';
+  static const quizSelfAwarenessA13 = 'quiz.self_awareness_a1_3';
+  static const quizSelfAwarenessA14 = 'quiz.self_awareness_a1_4';
+  static const quizSelfAwarenessA21 = 'quiz.self_awareness_a2_1';
+  static const quizSelfAwarenessA22 = 'quiz.self_awareness_a2_2';
+  static const quizSelfAwarenessA23 = 'quiz.self_awareness_a2_3';
+  static const quizSelfAwarenessA24 = 'quiz.self_awareness_a2_4';
+  static const quizSelfAwarenessA31 = 'quiz.self_awareness_a3_1';
+  static const quizSelfAwarenessA32 = 'quiz.self_awareness_a3_2';
+  static const quizSelfAwarenessA33 = 'quiz.self_awareness_a3_3';
+  static const quizSelfAwarenessDescription = 'quiz.self_awareness_description';
+  static const quizSelfAwarenessQ1 = 'quiz.self_awareness_q1';
+  static const quizSelfAwarenessQ2 = 'quiz.self_awareness_q2';
+  static const quizSelfAwarenessTitle = 'quiz.self_awareness_title';
+  static const quizHubBackToAllQuizzes = 'quiz_hub.back_to_all_quizzes';
+  static const quizHubDescription = 'quiz_hub.description';
+  static const quizHubDisclaimer = 'quiz_hub.disclaimer';
+  static const quizHubDoneBadge = 'quiz_hub.done_badge';
+  static const quizHubFullBreakdown = 'quiz_hub.full_breakdown';
+  static const quizHubGrowthAreas = 'quiz_hub.growth_areas';
+  static const quizHubQuestionOf = 'quiz_hub.question_of';
+  static const quizHubQuizNotFound = 'quiz_hub.quiz_not_found';
+  static const quizHubRetakeQuiz = 'quiz_hub.retake_quiz';
+  static const quizHubTitle = 'quiz_hub.title';
+  static const quizHubYourResult = 'quiz_hub.your_result';
+  static const quizHubYourResultLabel = 'quiz_hub.your_result_label';
+  static const quizHubYourStrengths = 'quiz_hub.your_strengths';
+  static const referralReferral10Friends = 'referral.referral.10_friends';
+  static const referralReferral1MonthFreePremium =
+      'referral.referral.1_month_free_premium';
+  static const referralReferral3Friends = 'referral.referral.3_friends';
+  static const referralReferralApplyCode = 'referral.referral.apply_code';
+  static const referralReferralApplying = 'referral.referral.applying';
+  static const referralReferralCodeAppliedYouEarned7DaysOfPremiu =
+      'referral.referral.code_applied_you_earned_7_days_of_premiu';
+  static const referralReferralDaysEarned = 'referral.referral.days_earned';
+  static const referralReferralDaysLeft = 'referral.referral.days_left';
+  static const referralReferralFriendsInvited =
+      'referral.referral.friends_invited';
+  static const referralReferralGive7DaysGet7Days =
+      'referral.referral.give_7_days_get_7_days';
+  static const referralReferralHaveACode = 'referral.referral.have_a_code';
+  static const referralReferralInviteFriends =
+      'referral.referral.invite_friends';
+  static const referralReferralLifetimePremium =
+      'referral.referral.lifetime_premium';
+  static const referralReferralMilestones = 'referral.referral.milestones';
+  static const referralReferralPasteYourReferralCode =
+      'referral.referral.paste_your_referral_code';
+  static const referralReferralReferralCodeCopiedShareItWithAFri =
+      'referral.referral.referral_code_copied_share_it_with_a_fri';
+  static const referralReferralShareInviteLink =
+      'referral.referral.share_invite_link';
+  static const referralReferralShareYourCodeWithFriendsWhenTheyJ =
+      'referral.referral.share_your_code_with_friends_when_they_j';
+  static const referralReferralTapToCopy = 'referral.referral.tap_to_copy';
+  static const referralReferralThatCodeDidntWorkPleaseDoublecheck =
+      'referral.referral.that_code_didnt_work_please_doublecheck';
+  static const referralReferralYouCantUseYourOwnCode =
+      'referral.referral.you_cant_use_your_own_code';
+  static const referralReferralYourInviteCode =
+      'referral.referral.your_invite_code';
+  static const referralReferralYouveAlreadyUsedAReferralCode =
+      'referral.referral.youve_already_used_a_referral_code';
+  static const referralReferralYouveAlreadyUsedAReferralCode1 =
+      'referral.referral.youve_already_used_a_referral_code_1';
+  static const reflectionAnalysis = 'reflection.analysis';
+  static const reflectionCareerFinance = 'reflection.career_finance';
+  static const reflectionCosmicEnergy = 'reflection.cosmic_energy';
+  static const reflectionCosmicHarmony = 'reflection.cosmic_harmony';
+  static const reflectionCosmicOverview = 'reflection.cosmic_overview';
+  static const reflectionCosmicTips = 'reflection.cosmic_tips';
+  static const reflectionDailyCosmicEnergy = 'reflection.daily_cosmic_energy';
+  static const reflectionDailyReading = 'reflection.daily_reading';
+  static const reflectionFeatureComingSoon = 'reflection.feature_coming_soon';
+  static const reflectionHealthEnergy = 'reflection.health_energy';
+  static const reflectionHealthWellness = 'reflection.health_wellness';
+  static const reflectionHermeticTeaching = 'reflection.hermetic_teaching';
+  static const reflectionImportantCycles = 'reflection.important_cycles';
+  static const reflectionImportantDays = 'reflection.important_days';
+  static const reflectionKeyDates = 'reflection.key_dates';
+  static const reflectionLoveRelationships = 'reflection.love_relationships';
+  static const reflectionLuckRate = 'reflection.luck_rate';
+  static const reflectionLuckyColor = 'reflection.lucky_color';
+  static const reflectionLuckyDays = 'reflection.lucky_days';
+  static const reflectionLuckyMonths = 'reflection.lucky_months';
+  static const reflectionLuckyNumber = 'reflection.lucky_number';
+  static const reflectionMood = 'reflection.mood';
+  static const reflectionReading = 'reflection.reading';
+  static const reflectionSelectDiscoverEnergy =
+      'reflection.select_discover_energy';
+  static const reflectionSelfAwareness = 'reflection.self_awareness';
+  static const reflectionSelfAwarenessBrand = 'reflection.self_awareness_brand';
+  static const reflectionSpecialMonths = 'reflection.special_months';
+  static const reflectionSpiritualGuidance = 'reflection.spiritual_guidance';
+  static const reflectionTitle = 'reflection.title';
+  static const reflectionWeeklyAffirmationLabel =
+      'reflection.weekly_affirmation_label';
+  static const reflectionWhatSaysToday = 'reflection.what_says_today';
+  static const reflectionYearlySummary = 'reflection.yearly_summary';
+  static const reflectionYearlyTheme = 'reflection.yearly_theme';
+  static const reflectionYourArchetypeReadings =
+      'reflection.your_archetype_readings';
+  static const retrospectiveMemoriesSaved = 'retrospective.memories_saved';
+  static const retrospectiveRetrospectiveAddJournalEntriesForTheMostMeaning =
+      'retrospective.retrospective.add_journal_entries_for_the_most_meaning';
+  static const retrospectiveRetrospectiveBackToHome =
+      'retrospective.retrospective.back_to_home';
+  static const retrospectiveRetrospectiveChooseTheDaysThatMatterToYou =
+      'retrospective.retrospective.choose_the_days_that_matter_to_you';
+  static const retrospectiveRetrospectiveLetsBegin =
+      'retrospective.retrospective.lets_begin';
+  static const retrospectiveRetrospectiveNotSelected =
+      'retrospective.retrospective.not_selected';
+  static const retrospectiveRetrospectivePickADate =
+      'retrospective.retrospective.pick_a_date';
+  static const retrospectiveRetrospectiveSelected =
+      'retrospective.retrospective.selected';
+  static const retrospectiveRetrospectiveWhenDidTheseHappen =
+      'retrospective.retrospective.when_did_these_happen';
+  static const retrospectiveRetrospectiveYourPastIsNowPartOfYourJourneyCo =
+      'retrospective.retrospective.your_past_is_now_part_of_your_journey_co';
+  static const retrospectiveRetrospectiveYourStoryDidntStartToday =
+      'retrospective.retrospective.your_story_didnt_start_today';
+  static const retrospectiveStepIndicator = 'retrospective.step_indicator';
+  static const ritualsAffirmation = 'rituals.affirmation';
+  static const ritualsAffirmationListsEvening1 =
+      'rituals.affirmation_lists.evening_1';
+  static const ritualsAffirmationListsEvening2 =
+      'rituals.affirmation_lists.evening_2';
+  static const ritualsAffirmationListsEvening3 =
+      'rituals.affirmation_lists.evening_3';
+  static const ritualsAffirmationListsMorning1 =
+      'rituals.affirmation_lists.morning_1';
+  static const ritualsAffirmationListsMorning2 =
+      'rituals.affirmation_lists.morning_2';
+  static const ritualsAffirmationListsMorning3 =
+      'rituals.affirmation_lists.morning_3';
+  static const ritualsAffirmationListsNoon1 =
+      'rituals.affirmation_lists.noon_1';
+  static const ritualsAffirmationListsNoon2 =
+      'rituals.affirmation_lists.noon_2';
+  static const ritualsAffirmationListsNoon3 =
+      'rituals.affirmation_lists.noon_3';
+  static const ritualsAffirmationTips = 'rituals.affirmation_tips';
+  static const ritualsAffirmationsSubtitle = 'rituals.affirmations_subtitle';
+  static const ritualsBestTime = 'rituals.best_time';
+  static const ritualsBreathingExercise = 'rituals.breathing_exercise';
+  static const ritualsBreathingPatternsCreativeBreath =
+      'rituals.breathing_patterns.creative_breath';
+  static const ritualsBreathingPatternsFourSevenEight =
+      'rituals.breathing_patterns.four_seven_eight';
+  static const ritualsBreathingPatternsHeartBreath =
+      'rituals.breathing_patterns.heart_breath';
+  static const ritualsBreathingPatternsNaturalBreath =
+      'rituals.breathing_patterns.natural_breath';
+  static const ritualsCrystalsAmethyst = 'rituals.crystals.amethyst';
+  static const ritualsCrystalsAmethystBenefit =
+      'rituals.crystals.amethyst_benefit';
+  static const ritualsCrystalsAventurine = 'rituals.crystals.aventurine';
+  static const ritualsCrystalsAventurineBenefit =
+      'rituals.crystals.aventurine_benefit';
+  static const ritualsCrystalsCitrine = 'rituals.crystals.citrine';
+  static const ritualsCrystalsCitrineBenefit =
+      'rituals.crystals.citrine_benefit';
+  static const ritualsCrystalsLapisLazuli = 'rituals.crystals.lapis_lazuli';
+  static const ritualsCrystalsLapisLazuliBenefit =
+      'rituals.crystals.lapis_lazuli_benefit';
+  static const ritualsCrystalsRoseQuartz = 'rituals.crystals.rose_quartz';
+  static const ritualsCrystalsRoseQuartzBenefit =
+      'rituals.crystals.rose_quartz_benefit';
+  static const ritualsCrystalsTigersEye = 'rituals.crystals.tigers_eye';
+  static const ritualsCrystalsTigersEyeBenefit =
+      'rituals.crystals.tigers_eye_benefit';
+  static const ritualsDailyRitualMeditation = 'rituals.daily_ritual_meditation';
+  static const ritualsEndOfDayReflection = 'rituals.end_of_day_reflection';
+  static const ritualsEvening = 'rituals.evening';
+  static const ritualsEveningAffirmations = 'rituals.evening_affirmations';
+  static const ritualsEveningRitual = 'rituals.evening_ritual';
+  static const ritualsEveningSubtitle = 'rituals.evening_subtitle';
+  static const ritualsExhale = 'rituals.exhale';
+  static const ritualsFindInnerPeace = 'rituals.find_inner_peace';
+  static const ritualsGratitudePractice = 'rituals.gratitude_practice';
+  static const ritualsGratitudePrompt = 'rituals.gratitude_prompt';
+  static const ritualsGratitudePromptsExperience =
+      'rituals.gratitude_prompts.experience';
+  static const ritualsGratitudePromptsPerson =
+      'rituals.gratitude_prompts.person';
+  static const ritualsGratitudePromptsPossession =
+      'rituals.gratitude_prompts.possession';
+  static const ritualsHold = 'rituals.hold';
+  static const ritualsInhale = 'rituals.inhale';
+  static const ritualsMainAffirmation = 'rituals.main_affirmation';
+  static const ritualsMeditation = 'rituals.meditation';
+  static const ritualsMeditationGuide = 'rituals.meditation_guide';
+  static const ritualsMeditationStepsAcceptReality =
+      'rituals.meditation_steps.accept_reality';
+  static const ritualsMeditationStepsCloseEyes =
+      'rituals.meditation_steps.close_eyes';
+  static const ritualsMeditationStepsExperienceSenses =
+      'rituals.meditation_steps.experience_senses';
+  static const ritualsMeditationStepsFeelBodyRelax =
+      'rituals.meditation_steps.feel_body_relax';
+  static const ritualsMeditationStepsFeelWholeBody =
+      'rituals.meditation_steps.feel_whole_body';
+  static const ritualsMeditationStepsImagineGoal =
+      'rituals.meditation_steps.imagine_goal';
+  static const ritualsMeditationStepsLieOnBack =
+      'rituals.meditation_steps.lie_on_back';
+  static const ritualsMeditationStepsMoveUpward =
+      'rituals.meditation_steps.move_upward';
+  static const ritualsMeditationStepsPayAttention =
+      'rituals.meditation_steps.pay_attention';
+  static const ritualsMeditationStepsReturnToBreath =
+      'rituals.meditation_steps.return_to_breath';
+  static const ritualsMeditationStepsSendLoveAll =
+      'rituals.meditation_steps.send_love_all';
+  static const ritualsMeditationStepsSendLoveLoved =
+      'rituals.meditation_steps.send_love_loved';
+  static const ritualsMeditationStepsSendLoveSelf =
+      'rituals.meditation_steps.send_love_self';
+  static const ritualsMeditationStepsSendLoveStranger =
+      'rituals.meditation_steps.send_love_stranger';
+  static const ritualsMeditationStepsSitComfortably =
+      'rituals.meditation_steps.sit_comfortably';
+  static const ritualsMeditationStepsStartFromToes =
+      'rituals.meditation_steps.start_from_toes';
+  static const ritualsMeditationStepsWatchBreath =
+      'rituals.meditation_steps.watch_breath';
+  static const ritualsMeditationsBodyAwareness =
+      'rituals.meditations.body_awareness';
+  static const ritualsMeditationsBodyScan = 'rituals.meditations.body_scan';
+  static const ritualsMeditationsBodyScanDesc =
+      'rituals.meditations.body_scan_desc';
+  static const ritualsMeditationsBreathDesc = 'rituals.meditations.breath_desc';
+  static const ritualsMeditationsBreathFocus =
+      'rituals.meditations.breath_focus';
+  static const ritualsMeditationsBreathMeditation =
+      'rituals.meditations.breath_meditation';
+  static const ritualsMeditationsImagination =
+      'rituals.meditations.imagination';
+  static const ritualsMeditationsLovingKindness =
+      'rituals.meditations.loving_kindness';
+  static const ritualsMeditationsLovingKindnessDesc =
+      'rituals.meditations.loving_kindness_desc';
+  static const ritualsMeditationsMettaMeditation =
+      'rituals.meditations.metta_meditation';
+  static const ritualsMeditationsVisualization =
+      'rituals.meditations.visualization';
+  static const ritualsMeditationsVisualizationDesc =
+      'rituals.meditations.visualization_desc';
+  static const ritualsMinutes = 'rituals.minutes';
+  static const ritualsMorning = 'rituals.morning';
+  static const ritualsMorningAffirmations = 'rituals.morning_affirmations';
+  static const ritualsMorningRitual = 'rituals.morning_ritual';
+  static const ritualsMorningSubtitle = 'rituals.morning_subtitle';
+  static const ritualsNoonAffirmations = 'rituals.noon_affirmations';
+  static const ritualsOilsEucalyptus = 'rituals.oils.eucalyptus';
+  static const ritualsOilsEucalyptusUsage = 'rituals.oils.eucalyptus_usage';
+  static const ritualsOilsLavender = 'rituals.oils.lavender';
+  static const ritualsOilsLavenderUsage = 'rituals.oils.lavender_usage';
+  static const ritualsOilsLemon = 'rituals.oils.lemon';
+  static const ritualsOilsLemonUsage = 'rituals.oils.lemon_usage';
+  static const ritualsOilsOrange = 'rituals.oils.orange';
+  static const ritualsOilsOrangeUsage = 'rituals.oils.orange_usage';
+  static const ritualsOilsPeppermint = 'rituals.oils.peppermint';
+  static const ritualsOilsPeppermintUsage = 'rituals.oils.peppermint_usage';
+  static const ritualsRecommendedDuration = 'rituals.recommended_duration';
+  static const ritualsReflectionPromptsWhatAccomplished =
+      'rituals.reflection_prompts.what_accomplished';
+  static const ritualsReflectionPromptsWhatDifferent =
+      'rituals.reflection_prompts.what_different';
+  static const ritualsReflectionPromptsWhatLearned =
+      'rituals.reflection_prompts.what_learned';
+  static const ritualsRelease = 'rituals.release';
+  static const ritualsReleasingDailyStress = 'rituals.releasing.daily_stress';
+  static const ritualsReleasingDescription = 'rituals.releasing.description';
+  static const ritualsReleasingNegativeThoughts =
+      'rituals.releasing.negative_thoughts';
+  static const ritualsReleasingUnfinishedTasks =
+      'rituals.releasing.unfinished_tasks';
+  static const ritualsReleasingWorries = 'rituals.releasing.worries';
+  static const ritualsReleasingRitual = 'rituals.releasing_ritual';
+  static const ritualsRepeatTimes = 'rituals.repeat_times';
+  static const ritualsRitualCreateAddAtLeastOneRitualItem =
+      'rituals.ritual_create.add_at_least_one_ritual_item';
+  static const ritualsRitualCreateAddStep = 'rituals.ritual_create.add_step';
+  static const ritualsRitualCreateCreateRitual =
+      'rituals.ritual_create.create_ritual';
+  static const ritualsRitualCreateCreateRitual1 =
+      'rituals.ritual_create.create_ritual_1';
+  static const ritualsRitualCreateEgMorningRoutine =
+      'rituals.ritual_create.eg_morning_routine';
+  static const ritualsRitualCreateName = 'rituals.ritual_create.name';
+  static const ritualsRitualCreateRemoveStep =
+      'rituals.ritual_create.remove_step';
+  static const ritualsRitualCreateSuggestions =
+      'rituals.ritual_create.suggestions';
+  static const ritualsRitualCreateWhen = 'rituals.ritual_create.when';
+  static const ritualsRitualSteps = 'rituals.ritual_steps';
+  static const ritualsRitualsAddRitual = 'rituals.rituals.add_ritual';
+  static const ritualsRitualsCancel = 'rituals.rituals.cancel';
+  static const ritualsRitualsCreateRitual = 'rituals.rituals.create_ritual';
+  static const ritualsRitualsCreateYourFirstDailyRitualToStart =
+      'rituals.rituals.create_your_first_daily_ritual_to_start';
+  static const ritualsRitualsDelete = 'rituals.rituals.delete';
+  static const ritualsRitualsDeleteRitual = 'rituals.rituals.delete_ritual';
+  static const ritualsRitualsDeleteRitual1 = 'rituals.rituals.delete_ritual_1';
+  static const ritualsRitualsItems = 'rituals.rituals.items';
+  static const ritualsRitualsMyRituals = 'rituals.rituals.my_rituals';
+  static const ritualsRitualsRetry = 'rituals.rituals.retry';
+  static const ritualsRitualsYourRitualPracticeStartsHere =
+      'rituals.rituals.your_ritual_practice_starts_here';
+  static const ritualsSleepPrepComfortablePosition =
+      'rituals.sleep_prep.comfortable_position';
+  static const ritualsSleepPrepDarkenRoom = 'rituals.sleep_prep.darken_room';
+  static const ritualsSleepPrepRelaxBody = 'rituals.sleep_prep.relax_body';
+  static const ritualsSleepPrepSleepAffirmation =
+      'rituals.sleep_prep.sleep_affirmation';
+  static const ritualsSleepPrepSlowBreath = 'rituals.sleep_prep.slow_breath';
+  static const ritualsSleepPrepTurnOffDevices =
+      'rituals.sleep_prep.turn_off_devices';
+  static const ritualsSleepPreparation = 'rituals.sleep_preparation';
+  static const ritualsStepsAwakeningBreath = 'rituals.steps.awakening_breath';
+  static const ritualsStepsAwakeningBreathDesc =
+      'rituals.steps.awakening_breath_desc';
+  static const ritualsStepsBodyAwakening = 'rituals.steps.body_awakening';
+  static const ritualsStepsBodyAwakeningDesc =
+      'rituals.steps.body_awakening_desc';
+  static const ritualsStepsGratitudeMoment = 'rituals.steps.gratitude_moment';
+  static const ritualsStepsGratitudeMomentDesc =
+      'rituals.steps.gratitude_moment_desc';
+  static const ritualsStepsSetIntention = 'rituals.steps.set_intention';
+  static const ritualsStepsSetIntentionDesc =
+      'rituals.steps.set_intention_desc';
+  static const ritualsSuggestedCrystal = 'rituals.suggested_crystal';
+  static const ritualsSuggestedEssentialOil = 'rituals.suggested_essential_oil';
+  static const ritualsTipFeel = 'rituals.tip_feel';
+  static const ritualsTipMirror = 'rituals.tip_mirror';
+  static const ritualsTipRepeat = 'rituals.tip_repeat';
+  static const ritualsTipSayAloud = 'rituals.tip_say_aloud';
+  static const ritualsTodaysAffirmations = 'rituals.todays_affirmations';
+  static const ritualsTodaysIntention = 'rituals.todays_intention';
+  static const ritualsTodaysMeditation = 'rituals.todays_meditation';
+  static const routerGoToReflection = 'router.go_to_reflection';
+  static const routerNotFoundMessage = 'router.not_found_message';
+  static const routerNotFoundPath = 'router.not_found_path';
+  static const routerNotFoundTitle = 'router.not_found_title';
+  static const routerReturnHome = 'router.return_home';
+  static const routerStarsAligning = 'router.stars_aligning';
+  static const screensAdminLoginAccessDashboard =
+      'screens.admin_login.access_dashboard';
+  static const screensAdminLoginAccountLocked =
+      'screens.admin_login.account_locked';
+  static const screensAdminLoginAttemptsRemaining =
+      'screens.admin_login.attempts_remaining';
+  static const screensAdminLoginEnterPin = 'screens.admin_login.enter_pin';
+  static const screensAdminLoginLockoutDuration =
+      'screens.admin_login.lockout_duration';
+  static const screensAdminLoginPinNotStored =
+      'screens.admin_login.pin_not_stored';
+  static const screensAdminLoginPinRequired =
+      'screens.admin_login.pin_required';
+  static const screensAdminLoginRateLimiting =
+      'screens.admin_login.rate_limiting';
+  static const screensAdminLoginSecureAccessRequired =
+      'screens.admin_login.secure_access_required';
+  static const screensAdminLoginSecureSession =
+      'screens.admin_login.secure_session';
+  static const screensAdminLoginSecurityFeatures =
+      'screens.admin_login.security_features';
+  static const screensAdminLoginTitle = 'screens.admin_login.title';
+  static const screensAdminLoginTooManyAttempts =
+      'screens.admin_login.too_many_attempts';
+  static const screensAdminLoginWaitBeforeRetry =
+      'screens.admin_login.wait_before_retry';
+  static const screensBirthdayReflectionAdviceDefault =
+      'screens.birthday_reflection.advice_default';
+  static const screensBirthdayReflectionAutumnEquinoxDesc =
+      'screens.birthday_reflection.autumn_equinox_desc';
+  static const screensBirthdayReflectionAutumnEquinoxTitle =
+      'screens.birthday_reflection.autumn_equinox_title';
+  static const screensBirthdayReflectionHouseNumber =
+      'screens.birthday_reflection.house_number';
+  static const screensBirthdayReflectionImportantDates =
+      'screens.birthday_reflection.important_dates';
+  static const screensBirthdayReflectionKeywordAction =
+      'screens.birthday_reflection.keyword_action';
+  static const screensBirthdayReflectionKeywordBalance =
+      'screens.birthday_reflection.keyword_balance';
+  static const screensBirthdayReflectionKeywordBeginning =
+      'screens.birthday_reflection.keyword_beginning';
+  static const screensBirthdayReflectionKeywordChallenge =
+      'screens.birthday_reflection.keyword_challenge';
+  static const screensBirthdayReflectionKeywordChange =
+      'screens.birthday_reflection.keyword_change';
+  static const screensBirthdayReflectionKeywordClosure =
+      'screens.birthday_reflection.keyword_closure';
+  static const screensBirthdayReflectionKeywordGrowth =
+      'screens.birthday_reflection.keyword_growth';
+  static const screensBirthdayReflectionKeywordHarvest =
+      'screens.birthday_reflection.keyword_harvest';
+  static const screensBirthdayReflectionKeywordOpportunity =
+      'screens.birthday_reflection.keyword_opportunity';
+  static const screensBirthdayReflectionKeywordProgress =
+      'screens.birthday_reflection.keyword_progress';
+  static const screensBirthdayReflectionKeywordReflection =
+      'screens.birthday_reflection.keyword_reflection';
+  static const screensBirthdayReflectionKeywordRest =
+      'screens.birthday_reflection.keyword_rest';
+  static const screensBirthdayReflectionMonthlyHighlights =
+      'screens.birthday_reflection.monthly_highlights';
+  static const screensBirthdayReflectionReturnDate =
+      'screens.birthday_reflection.return_date';
+  static const screensBirthdayReflectionSpringEquinoxDesc =
+      'screens.birthday_reflection.spring_equinox_desc';
+  static const screensBirthdayReflectionSpringEquinoxTitle =
+      'screens.birthday_reflection.spring_equinox_title';
+  static const screensBirthdayReflectionSubtitle =
+      'screens.birthday_reflection.subtitle';
+  static const screensBirthdayReflectionSummerSolsticeDesc =
+      'screens.birthday_reflection.summer_solstice_desc';
+  static const screensBirthdayReflectionSummerSolsticeTitle =
+      'screens.birthday_reflection.summer_solstice_title';
+  static const screensBirthdayReflectionSunHouse =
+      'screens.birthday_reflection.sun_house';
+  static const screensBirthdayReflectionThemeCareerDesc =
+      'screens.birthday_reflection.theme_career_desc';
+  static const screensBirthdayReflectionThemeCareerTitle =
+      'screens.birthday_reflection.theme_career_title';
+  static const screensBirthdayReflectionThemeCreativityDesc =
+      'screens.birthday_reflection.theme_creativity_desc';
+  static const screensBirthdayReflectionThemeCreativityTitle =
+      'screens.birthday_reflection.theme_creativity_title';
+  static const screensBirthdayReflectionThemeEducationTravelDesc =
+      'screens.birthday_reflection.theme_education_travel_desc';
+  static const screensBirthdayReflectionThemeEducationTravelTitle =
+      'screens.birthday_reflection.theme_education_travel_title';
+  static const screensBirthdayReflectionThemeFinancialDesc =
+      'screens.birthday_reflection.theme_financial_desc';
+  static const screensBirthdayReflectionThemeFinancialTitle =
+      'screens.birthday_reflection.theme_financial_title';
+  static const screensBirthdayReflectionThemeHealthRoutineDesc =
+      'screens.birthday_reflection.theme_health_routine_desc';
+  static const screensBirthdayReflectionThemeHealthRoutineTitle =
+      'screens.birthday_reflection.theme_health_routine_title';
+  static const screensBirthdayReflectionThemeHomeFamilyDesc =
+      'screens.birthday_reflection.theme_home_family_desc';
+  static const screensBirthdayReflectionThemeHomeFamilyTitle =
+      'screens.birthday_reflection.theme_home_family_title';
+  static const screensBirthdayReflectionThemePersonalGrowthDesc =
+      'screens.birthday_reflection.theme_personal_growth_desc';
+  static const screensBirthdayReflectionThemePersonalGrowthTitle =
+      'screens.birthday_reflection.theme_personal_growth_title';
+  static const screensBirthdayReflectionThemeRelationshipsDesc =
+      'screens.birthday_reflection.theme_relationships_desc';
+  static const screensBirthdayReflectionThemeRelationshipsTitle =
+      'screens.birthday_reflection.theme_relationships_title';
+  static const screensBirthdayReflectionTitle =
+      'screens.birthday_reflection.title';
+  static const screensBirthdayReflectionWinterSolsticeDesc =
+      'screens.birthday_reflection.winter_solstice_desc';
+  static const screensBirthdayReflectionWinterSolsticeTitle =
+      'screens.birthday_reflection.winter_solstice_title';
+  static const screensBirthdayReflectionYearAdvice =
+      'screens.birthday_reflection.year_advice';
+  static const screensBirthdayReflectionYearThemes =
+      'screens.birthday_reflection.year_themes';
+  static const screensCelebritiesChartAnalysis =
+      'screens.celebrities.chart_analysis';
+  static const screensCelebritiesNoResults = 'screens.celebrities.no_results';
+  static const screensCelebritiesNotableAspects =
+      'screens.celebrities.notable_aspects';
+  static const screensCelebritiesSearchHint = 'screens.celebrities.search_hint';
+  static const screensCelebritiesTitle = 'screens.celebrities.title';
+  static const screensContentDetailGoBack = 'screens.content_detail.go_back';
+  static const screensContentDetailNotFoundMessage =
+      'screens.content_detail.not_found_message';
+  static const screensContentDetailNotFoundTitle =
+      'screens.content_detail.not_found_title';
+  static const screensDailyRitual = 'screens.daily_ritual';
+  static const screensDreamGlossaryCategoriesAbstract =
+      'screens.dream_glossary.categories.abstract';
+  static const screensDreamGlossaryCategoriesActions =
+      'screens.dream_glossary.categories.actions';
+  static const screensDreamGlossaryCategoriesAll =
+      'screens.dream_glossary.categories.all';
+  static const screensDreamGlossaryCategoriesAnimals =
+      'screens.dream_glossary.categories.animals';
+  static const screensDreamGlossaryCategoriesNature =
+      'screens.dream_glossary.categories.nature';
+  static const screensDreamGlossaryCategoriesObjects =
+      'screens.dream_glossary.categories.objects';
+  static const screensDreamGlossaryCategoriesPeople =
+      'screens.dream_glossary.categories.people';
+  static const screensDreamGlossaryCategoriesPlaces =
+      'screens.dream_glossary.categories.places';
+  static const screensDreamGlossaryDateFormatsDaysAgo =
+      'screens.dream_glossary.date_formats.days_ago';
+  static const screensDreamGlossaryDateFormatsMonthsAgo =
+      'screens.dream_glossary.date_formats.months_ago';
+  static const screensDreamGlossaryDateFormatsToday =
+      'screens.dream_glossary.date_formats.today';
+  static const screensDreamGlossaryDateFormatsWeeksAgo =
+      'screens.dream_glossary.date_formats.weeks_ago';
+  static const screensDreamGlossaryDateFormatsYesterday =
+      'screens.dream_glossary.date_formats.yesterday';
+  static const screensDreamGlossaryDreamedButtonIDreamedThis =
+      'screens.dream_glossary.dreamed_button.i_dreamed_this';
+  static const screensDreamGlossaryDreamedButtonInJournal =
+      'screens.dream_glossary.dreamed_button.in_journal';
+  static const screensDreamGlossaryInterpretationLabelsFreud =
+      'screens.dream_glossary.interpretation_labels.freud';
+  static const screensDreamGlossaryInterpretationLabelsIslamic =
+      'screens.dream_glossary.interpretation_labels.islamic';
+  static const screensDreamGlossaryInterpretationLabelsJung =
+      'screens.dream_glossary.interpretation_labels.jung';
+  static const screensDreamGlossaryInterpretationLabelsTurkish =
+      'screens.dream_glossary.interpretation_labels.turkish';
+  static const screensDreamGlossaryInterpretationLabelsWestern =
+      'screens.dream_glossary.interpretation_labels.western';
+  static const screensDreamGlossaryInterpretationTemplatesFreudian =
+      'screens.dream_glossary.interpretation_templates.freudian';
+  static const screensDreamGlossaryInterpretationTemplatesIslamic =
+      'screens.dream_glossary.interpretation_templates.islamic';
+  static const screensDreamGlossaryInterpretationTemplatesJungian =
+      'screens.dream_glossary.interpretation_templates.jungian';
+  static const screensDreamGlossaryInterpretationTemplatesTurkish =
+      'screens.dream_glossary.interpretation_templates.turkish';
+  static const screensDreamGlossaryInterpretationTemplatesWestern =
+      'screens.dream_glossary.interpretation_templates.western';
+  static const screensDreamGlossaryNoResults =
+      'screens.dream_glossary.no_results';
+  static const screensDreamGlossaryPersonalDictionary =
+      'screens.dream_glossary.personal_dictionary';
+  static const screensDreamGlossaryPersonalDictionarySheetAddSymbolsHint =
+      'screens.dream_glossary.personal_dictionary_sheet.add_symbols_hint';
+  static const screensDreamGlossaryPersonalDictionarySheetNoSymbolsYet =
+      'screens.dream_glossary.personal_dictionary_sheet.no_symbols_yet';
+  static const screensDreamGlossaryPersonalDictionarySheetSymbolCount =
+      'screens.dream_glossary.personal_dictionary_sheet.symbol_count';
+  static const screensDreamGlossaryPersonalDictionarySheetTimesCount =
+      'screens.dream_glossary.personal_dictionary_sheet.times_count';
+  static const screensDreamGlossaryPersonalDictionarySheetTitle =
+      'screens.dream_glossary.personal_dictionary_sheet.title';
+  static const screensDreamGlossarySearchHint =
+      'screens.dream_glossary.search_hint';
+  static const screensDreamGlossarySectionsCulturalInterpretations =
+      'screens.dream_glossary.sections.cultural_interpretations';
+  static const screensDreamGlossarySectionsLightAspect =
+      'screens.dream_glossary.sections.light_aspect';
+  static const screensDreamGlossarySectionsPsychologicalInterpretations =
+      'screens.dream_glossary.sections.psychological_interpretations';
+  static const screensDreamGlossarySectionsRelatedSymbols =
+      'screens.dream_glossary.sections.related_symbols';
+  static const screensDreamGlossarySectionsShadowAspect =
+      'screens.dream_glossary.sections.shadow_aspect';
+  static const screensDreamGlossarySectionsUniversalMeanings =
+      'screens.dream_glossary.sections.universal_meanings';
+  static const screensDreamGlossarySymbolCount =
+      'screens.dream_glossary.symbol_count';
+  static const screensDreamGlossaryTitle = 'screens.dream_glossary.title';
+  static const screensDreamGlossaryTryDifferentSearch =
+      'screens.dream_glossary.try_different_search';
+  static const screensGlossaryDeepInterpretation =
+      'screens.glossary.deep_interpretation';
+  static const screensGlossaryNoResults = 'screens.glossary.no_results';
+  static const screensGlossaryRelated = 'screens.glossary.related';
+  static const screensGlossaryRuler = 'screens.glossary.ruler';
+  static const screensGlossarySearchHint = 'screens.glossary.search_hint';
+  static const screensGlossarySources = 'screens.glossary.sources';
+  static const screensGlossaryTermCount = 'screens.glossary.term_count';
+  static const screensGlossaryTitle = 'screens.glossary.title';
+  static const screensGlossaryTryDifferentTerm =
+      'screens.glossary.try_different_term';
+  static const screensMindfulnessMicroRitualBrandFooter =
+      'screens.mindfulness_micro_ritual.brand_footer';
+  static const screensMindfulnessMicroRitualDiscoverDreamTrace =
+      'screens.mindfulness_micro_ritual.discover_dream_trace';
+  static const screensMindfulnessMicroRitualMindfulnessTag =
+      'screens.mindfulness_micro_ritual.mindfulness_tag';
+  static const screensMindfulnessMicroRitualMonthsApril =
+      'screens.mindfulness_micro_ritual.months.april';
+  static const screensMindfulnessMicroRitualMonthsAugust =
+      'screens.mindfulness_micro_ritual.months.august';
+  static const screensMindfulnessMicroRitualMonthsDecember =
+      'screens.mindfulness_micro_ritual.months.december';
+  static const screensMindfulnessMicroRitualMonthsFebruary =
+      'screens.mindfulness_micro_ritual.months.february';
+  static const screensMindfulnessMicroRitualMonthsJanuary =
+      'screens.mindfulness_micro_ritual.months.january';
+  static const screensMindfulnessMicroRitualMonthsJuly =
+      'screens.mindfulness_micro_ritual.months.july';
+  static const screensMindfulnessMicroRitualMonthsJune =
+      'screens.mindfulness_micro_ritual.months.june';
+  static const screensMindfulnessMicroRitualMonthsMarch =
+      'screens.mindfulness_micro_ritual.months.march';
+  static const screensMindfulnessMicroRitualMonthsMay =
+      'screens.mindfulness_micro_ritual.months.may';
+  static const screensMindfulnessMicroRitualMonthsNovember =
+      'screens.mindfulness_micro_ritual.months.november';
+  static const screensMindfulnessMicroRitualMonthsOctober =
+      'screens.mindfulness_micro_ritual.months.october';
+  static const screensMindfulnessMicroRitualMonthsSeptember =
+      'screens.mindfulness_micro_ritual.months.september';
+  static const screensMindfulnessMicroRitualRitualsBodyScanInstruction =
+      'screens.mindfulness_micro_ritual.rituals.body_scan.instruction';
+  static const screensMindfulnessMicroRitualRitualsBodyScanIntention =
+      'screens.mindfulness_micro_ritual.rituals.body_scan.intention';
+  static const screensMindfulnessMicroRitualRitualsBodyScanName =
+      'screens.mindfulness_micro_ritual.rituals.body_scan.name';
+  static const screensMindfulnessMicroRitualRitualsBreathAwarenessInstruction =
+      'screens.mindfulness_micro_ritual.rituals.breath_awareness.instruction';
+  static const screensMindfulnessMicroRitualRitualsBreathAwarenessIntention =
+      'screens.mindfulness_micro_ritual.rituals.breath_awareness.intention';
+  static const screensMindfulnessMicroRitualRitualsBreathAwarenessName =
+      'screens.mindfulness_micro_ritual.rituals.breath_awareness.name';
+  static const screensMindfulnessMicroRitualRitualsFlowIntentionInstruction =
+      'screens.mindfulness_micro_ritual.rituals.flow_intention.instruction';
+  static const screensMindfulnessMicroRitualRitualsFlowIntentionIntention =
+      'screens.mindfulness_micro_ritual.rituals.flow_intention.intention';
+  static const screensMindfulnessMicroRitualRitualsFlowIntentionName =
+      'screens.mindfulness_micro_ritual.rituals.flow_intention.name';
+  static const screensMindfulnessMicroRitualRitualsGratitudeMomentInstruction =
+      'screens.mindfulness_micro_ritual.rituals.gratitude_moment.instruction';
+  static const screensMindfulnessMicroRitualRitualsGratitudeMomentIntention =
+      'screens.mindfulness_micro_ritual.rituals.gratitude_moment.intention';
+  static const screensMindfulnessMicroRitualRitualsGratitudeMomentName =
+      'screens.mindfulness_micro_ritual.rituals.gratitude_moment.name';
+  static const screensMindfulnessMicroRitualRitualsHeartListeningInstruction =
+      'screens.mindfulness_micro_ritual.rituals.heart_listening.instruction';
+  static const screensMindfulnessMicroRitualRitualsHeartListeningIntention =
+      'screens.mindfulness_micro_ritual.rituals.heart_listening.intention';
+  static const screensMindfulnessMicroRitualRitualsHeartListeningName =
+      'screens.mindfulness_micro_ritual.rituals.heart_listening.name';
+  static const screensMindfulnessMicroRitualRitualsIntentionSettingInstruction =
+      'screens.mindfulness_micro_ritual.rituals.intention_setting.instruction';
+  static const screensMindfulnessMicroRitualRitualsIntentionSettingIntention =
+      'screens.mindfulness_micro_ritual.rituals.intention_setting.intention';
+  static const screensMindfulnessMicroRitualRitualsIntentionSettingName =
+      'screens.mindfulness_micro_ritual.rituals.intention_setting.name';
+  static const screensMindfulnessMicroRitualRitualsSilenceMinuteInstruction =
+      'screens.mindfulness_micro_ritual.rituals.silence_minute.instruction';
+  static const screensMindfulnessMicroRitualRitualsSilenceMinuteIntention =
+      'screens.mindfulness_micro_ritual.rituals.silence_minute.intention';
+  static const screensMindfulnessMicroRitualRitualsSilenceMinuteName =
+      'screens.mindfulness_micro_ritual.rituals.silence_minute.name';
+  static const screensMindfulnessMicroRitualTodaysMicroRitual =
+      'screens.mindfulness_micro_ritual.todays_micro_ritual';
+  static const screensNumberPatternsAllLifePathNumbers =
+      'screens.number_patterns.all_life_path_numbers';
+  static const screensNumberPatternsAncientSecretDesc =
+      'screens.number_patterns.ancient_secret_desc';
+  static const screensNumberPatternsAncientSecretTitle =
+      'screens.number_patterns.ancient_secret_title';
+  static const screensNumberPatternsBirthdayNumber =
+      'screens.number_patterns.birthday_number';
+  static const screensNumberPatternsBrandText =
+      'screens.number_patterns.brand_text';
+  static const screensNumberPatternsCareerPath =
+      'screens.number_patterns.career_path';
+  static const screensNumberPatternsChallenges =
+      'screens.number_patterns.challenges';
+  static const screensNumberPatternsCompatibleNumbers =
+      'screens.number_patterns.compatible_numbers';
+  static const screensNumberPatternsDeepInterpretation =
+      'screens.number_patterns.deep_interpretation';
+  static const screensNumberPatternsExpressionNumber =
+      'screens.number_patterns.expression_number';
+  static const screensNumberPatternsExpressionNumberDesc =
+      'screens.number_patterns.expression_number_desc';
+  static const screensNumberPatternsKadimContent =
+      'screens.number_patterns.kadim_content';
+  static const screensNumberPatternsKadimTitle =
+      'screens.number_patterns.kadim_title';
+  static const screensNumberPatternsKeywords =
+      'screens.number_patterns.keywords';
+  static const screensNumberPatternsLessonsFromPastLives =
+      'screens.number_patterns.lessons_from_past_lives';
+  static const screensNumberPatternsLifePathInterpretation =
+      'screens.number_patterns.life_path_interpretation';
+  static const screensNumberPatternsLifePathNumber =
+      'screens.number_patterns.life_path_number';
+  static const screensNumberPatternsLoveRelationships =
+      'screens.number_patterns.love_relationships';
+  static const screensNumberPatternsMasterNumbers =
+      'screens.number_patterns.master_numbers';
+  static const screensNumberPatternsNameNumberPatterns =
+      'screens.number_patterns.name_number_patterns';
+  static const screensNumberPatternsNumberDepthTitle =
+      'screens.number_patterns.number_depth_title';
+  static const screensNumberPatternsPersonalYear =
+      'screens.number_patterns.personal_year';
+  static const screensNumberPatternsPersonality =
+      'screens.number_patterns.personality';
+  static const screensNumberPatternsShadowSide =
+      'screens.number_patterns.shadow_side';
+  static const screensNumberPatternsShadowSideFooter =
+      'screens.number_patterns.shadow_side_footer';
+  static const screensNumberPatternsSoulUrge =
+      'screens.number_patterns.soul_urge';
+  static const screensNumberPatternsSpiritualLesson =
+      'screens.number_patterns.spiritual_lesson';
+  static const screensNumberPatternsStrengths =
+      'screens.number_patterns.strengths';
+  static const screensNumberPatternsTitle = 'screens.number_patterns.title';
+  static const screensNumberPatternsYours = 'screens.number_patterns.yours';
+  static const screensQuizContinueCosmicJourney =
+      'screens.quiz.continue_cosmic_journey';
+  static const screensQuizContinueFree = 'screens.quiz.continue_free';
+  static const screensQuizOpenCosmicMap = 'screens.quiz.open_cosmic_map';
+  static const screensQuizReturnHome = 'screens.quiz.return_home';
+  static const screensQuizSpecialDiscount = 'screens.quiz.special_discount';
+  static const screensQuizStartExploring = 'screens.quiz.start_exploring';
+  static const screensQuizStartNow = 'screens.quiz.start_now';
+  static const screensQuizStrongProfileMessage =
+      'screens.quiz.strong_profile_message';
+  static const screensQuizValidTodayOnly = 'screens.quiz.valid_today_only';
+  static const screensQuizViewPremiumFeatures =
+      'screens.quiz.view_premium_features';
+  static const searchGlobalSearchAll = 'search.global_search.all';
+  static const searchGlobalSearchClearSearch =
+      'search.global_search.clear_search';
+  static const searchGlobalSearchCloseSearch =
+      'search.global_search.close_search';
+  static const searchGlobalSearchDoubleTapToOpen =
+      'search.global_search.double_tap_to_open';
+  static const searchGlobalSearchDreams = 'search.global_search.dreams';
+  static const searchGlobalSearchDreams1 = 'search.global_search.dreams_1';
+  static const searchGlobalSearchJournal = 'search.global_search.journal';
+  static const searchGlobalSearchJournalEntries =
+      'search.global_search.journal_entries';
+  static const searchGlobalSearchNotes = 'search.global_search.notes';
+  static const searchGlobalSearchNotes1 = 'search.global_search.notes_1';
+  static const searchGlobalSearchNothingMatchedTryDifferentWords =
+      'search.global_search.nothing_matched_try_different_words';
+  static const searchGlobalSearchQuickActions =
+      'search.global_search.quick_actions';
+  static const searchGlobalSearchRecentSearches =
+      'search.global_search.recent_searches';
+  static const searchGlobalSearchSearchEntriesNotesDreams =
+      'search.global_search.search_entries_notes_dreams';
+  static const searchGlobalSearchTags = 'search.global_search.tags';
+  static const searchGlobalSearchTools = 'search.global_search.tools';
+  static const seasonalSeasonalReflectionAllSeasons =
+      'seasonal.seasonal_reflection.all_seasons';
+  static const seasonalSeasonalReflectionComplete =
+      'seasonal.seasonal_reflection.complete';
+  static const seasonalSeasonalReflectionLoadingReflections =
+      'seasonal.seasonal_reflection.loading_reflections';
+  static const seasonalSeasonalReflectionMarkComplete =
+      'seasonal.seasonal_reflection.mark_complete';
+  static const seasonalSeasonalReflectionRetry =
+      'seasonal.seasonal_reflection.retry';
+  static const seasonalSeasonalReflectionSeasonalReflections =
+      'seasonal.seasonal_reflection.seasonal_reflections';
+  static const sectionsAdvancedSelfAwareness =
+      'sections.advanced_self_awareness';
+  static const sectionsCautionRequired = 'sections.caution_required';
+  static const sectionsCosmicSummary = 'sections.cosmic_summary';
+  static const sectionsDaySuffix = 'sections.day_suffix';
+  static const sectionsDreamsSubconscious = 'sections.dreams_subconscious';
+  static const sectionsImportantCycles = 'sections.important_cycles';
+  static const sectionsInnerDiscoveries = 'sections.inner_discoveries';
+  static const sectionsMonthlyEnergyMap = 'sections.monthly_energy_map';
+  static const sectionsMonthlyExploration = 'sections.monthly_exploration';
+  static const sectionsMonthlyMantra = 'sections.monthly_mantra';
+  static const sectionsNumberPatternsTools = 'sections.number_patterns_tools';
+  static const sectionsPersonalProfileAnalysis =
+      'sections.personal_profile_analysis';
+  static const sectionsPersonalityAnalysis = 'sections.personality_analysis';
+  static const sectionsReferencesLearning = 'sections.references_learning';
+  static const sectionsReflectionReadings = 'sections.reflection_readings';
+  static const sectionsRelationshipAnalysis = 'sections.relationship_analysis';
+  static const sectionsSharingProfile = 'sections.sharing_profile';
+  static const sectionsSpecialMonthsOfYear = 'sections.special_months_of_year';
+  static const sectionsSpiritualJourney = 'sections.spiritual_journey';
+  static const sectionsSpiritualWellness = 'sections.spiritual_wellness';
+  static const sectionsStrengths = 'sections.strengths';
+  static const sectionsTimeCycles = 'sections.time_cycles';
+  static const sectionsWeekNumber = 'sections.week_number';
+  static const sectionsWeeklyAffirmation = 'sections.weekly_affirmation';
+  static const sectionsWeeklyEnergyChart = 'sections.weekly_energy_chart';
+  static const sectionsWeeklyExploration = 'sections.weekly_exploration';
+  static const sectionsYearlyAffirmation = 'sections.yearly_affirmation';
+  static const sectionsYearlyEnergyMap = 'sections.yearly_energy_map';
+  static const sectionsYearlyExploration = 'sections.yearly_exploration';
+  static const settingsAbout = 'settings.about';
+  static const settingsAccount = 'settings.account';
+  static const settingsAccountDeleted = 'settings.account_deleted';
+  static const settingsAdmin = 'settings.admin';
+  static const settingsAppLockDisabled = 'settings.app_lock_disabled';
+  static const settingsAppLockEnabled = 'settings.app_lock_enabled';
+  static const settingsClearData = 'settings.clear_data';
+  static const settingsClearDataConfirm = 'settings.clear_data_confirm';
+  static const settingsClearDataDesc = 'settings.clear_data_desc';
+  static const settingsClearDataWarning = 'settings.clear_data_warning';
+  static const settingsComingSoonLanguage = 'settings.coming_soon_language';
+  static const settingsContactSupport = 'settings.contact_support';
+  static const settingsDarkMode = 'settings.dark_mode';
+  static const settingsDashboard = 'settings.dashboard';
+  static const settingsDelete = 'settings.delete';
+  static const settingsDisclaimer = 'settings.disclaimer';
+  static const settingsDisclaimerContent = 'settings.disclaimer_content';
+  static const settingsDisclaimerDesc = 'settings.disclaimer_desc';
+  static const settingsDisclaimerTip = 'settings.disclaimer_tip';
+  static const settingsEditProfile = 'settings.edit_profile';
+  static const settingsEditProfileDesc = 'settings.edit_profile_desc';
+  static const settingsGotIt = 'settings.got_it';
+  static const settingsLanguage = 'settings.language';
+  static const settingsLanguageTitle = 'settings.language_title';
+  static const settingsLightMode = 'settings.light_mode';
+  static const settingsManageSubscription = 'settings.manage_subscription';
+  static const settingsManageSubscriptionDesc =
+      'settings.manage_subscription_desc';
+  static const settingsNoActiveSession = 'settings.no_active_session';
+  static const settingsNoPurchasesFound = 'settings.no_purchases_found';
+  static const settingsNotificationScheduleEnableNotifications =
+      'settings.notification_schedule.enable_notifications';
+  static const settingsNotificationScheduleEnableNotificationsToReceiveJournali =
+      'settings.notification_schedule.enable_notifications_to_receive_journali';
+  static const settingsNotificationScheduleNotifications =
+      'settings.notification_schedule.notifications';
+  static const settingsNotificationScheduleNotificationsAreDisabled =
+      'settings.notification_schedule.notifications_are_disabled';
+  static const settingsNotificationScheduleNotificationsHelpYouBuildAConsisten =
+      'settings.notification_schedule.notifications_help_you_build_a_consisten';
+  static const settingsNotificationSchedulePromptTime =
+      'settings.notification_schedule.prompt_time';
+  static const settingsNotificationScheduleReminderTime =
+      'settings.notification_schedule.reminder_time';
+  static const settingsNotificationsTitle = 'settings.notifications_title';
+  static const settingsPin = 'settings.pin';
+  static const settingsPremium = 'settings.premium';
+  static const settingsPremiumActive = 'settings.premium_active';
+  static const settingsPremiumDesc = 'settings.premium_desc';
+  static const settingsPrivacyPolicy = 'settings.privacy_policy';
+  static const settingsPurchasesRestored = 'settings.purchases_restored';
+  static const settingsRateApp = 'settings.rate_app';
+  static const settingsRateAppDesc = 'settings.rate_app_desc';
+  static const settingsSettings4digitPin = 'settings.settings.4digit_pin';
+  static const settingsSettingsAccountDeletionRequestedYouHaveBeen =
+      'settings.settings.account_deletion_requested_you_have_been';
+  static const settingsSettingsAllYourCloudDataWillBePermanently =
+      'settings.settings.all_your_cloud_data_will_be_permanently';
+  static const settingsSettingsAppLock = 'settings.settings.app_lock';
+  static const settingsSettingsCancel = 'settings.settings.cancel';
+  static const settingsSettingsCancel1 = 'settings.settings.cancel_1';
+  static const settingsSettingsChangePin = 'settings.settings.change_pin';
+  static const settingsSettingsChangePin1 = 'settings.settings.change_pin_1';
+  static const settingsSettingsDeleteAccount =
+      'settings.settings.delete_account';
+  static const settingsSettingsDeleteAccount1 =
+      'settings.settings.delete_account_1';
+  static const settingsSettingsDeleteYourAccount =
+      'settings.settings.delete_your_account';
+  static const settingsSettingsKeepAccount = 'settings.settings.keep_account';
+  static const settingsSettingsNoInternetConnectionPleaseTryAgain =
+      'settings.settings.no_internet_connection_please_try_again';
+  static const settingsSettingsOffline = 'settings.settings.offline';
+  static const settingsSettingsPinMustBe4Digits =
+      'settings.settings.pin_must_be_4_digits';
+  static const settingsSettingsPinsDoNotMatch =
+      'settings.settings.pins_do_not_match';
+  static const settingsSettingsReady = 'settings.settings.ready';
+  static const settingsSettingsReenterPin = 'settings.settings.reenter_pin';
+  static const settingsSettingsRequirePinOrBiometricsToOpen =
+      'settings.settings.require_pin_or_biometrics_to_open';
+  static const settingsSettingsSaveChanges = 'settings.settings.save_changes';
+  static const settingsSettingsSet4digitPin =
+      'settings.settings.set_4digit_pin';
+  static const settingsSettingsSomethingWentWrongPleaseContactSupp =
+      'settings.settings.something_went_wrong_please_contact_supp';
+  static const settingsSettingsSyncError = 'settings.settings.sync_error';
+  static const settingsSettingsSynced = 'settings.settings.synced';
+  static const settingsSettingsSyncing = 'settings.settings.syncing';
+  static const settingsSettingsThisWillPermanentlyDeleteYourAccoun =
+      'settings.settings.this_will_permanently_delete_your_accoun';
+  static const settingsSettingsYesDelete = 'settings.settings.yes_delete';
+  static const settingsSignOutConfirm = 'settings.sign_out_confirm';
+  static const settingsSignOutMessage = 'settings.sign_out_message';
+  static const settingsSignOutSuccess = 'settings.sign_out_success';
+  static const settingsSignOutTitle = 'settings.sign_out_title';
+  static const settingsSupport = 'settings.support';
+  static const settingsTermsOfService = 'settings.terms_of_service';
+  static const settingsTheme = 'settings.theme';
+  static const settingsThemeTitle = 'settings.theme_title';
+  static const settingsTitle = 'settings.title';
+  static const settingsVersion = 'settings.version';
+  static const shadowWorkDaysAgo = 'shadow_work.days_ago';
+  static const shadowWorkShadowWorkBeginWriting =
+      'shadow_work.shadow_work.begin_writing';
+  static const shadowWorkShadowWorkBreakthroughMoment =
+      'shadow_work.shadow_work.breakthrough_moment';
+  static const shadowWorkShadowWorkBreakthroughMomentToggle =
+      'shadow_work.shadow_work.breakthrough_moment_toggle';
+  static const shadowWorkShadowWorkCancel = 'shadow_work.shadow_work.cancel';
+  static const shadowWorkShadowWorkChooseAnArchetype =
+      'shadow_work.shadow_work.choose_an_archetype';
+  static const shadowWorkShadowWorkCouldntLoadYourShadowWork =
+      'shadow_work.shadow_work.couldnt_load_your_shadow_work';
+  static const shadowWorkShadowWorkDiscard = 'shadow_work.shadow_work.discard';
+  static const shadowWorkShadowWorkDiscardChanges =
+      'shadow_work.shadow_work.discard_changes';
+  static const shadowWorkShadowWorkEntries = 'shadow_work.shadow_work.entries';
+  static const shadowWorkShadowWorkExploreYourInnerLandscape =
+      'shadow_work.shadow_work.explore_your_inner_landscape';
+  static const shadowWorkShadowWorkInsights =
+      'shadow_work.shadow_work.insights';
+  static const shadowWorkShadowWorkIntensitySlider =
+      'shadow_work.shadow_work.intensity_slider';
+  static const shadowWorkShadowWorkRecentEntries =
+      'shadow_work.shadow_work.recent_entries';
+  static const shadowWorkShadowWorkRetry = 'shadow_work.shadow_work.retry';
+  static const shadowWorkShadowWorkSaveEntry =
+      'shadow_work.shadow_work.save_entry';
+  static const shadowWorkShadowWorkShadowWork =
+      'shadow_work.shadow_work.shadow_work';
+  static const shadowWorkShadowWorkShadowWorkEntrySaved =
+      'shadow_work.shadow_work.shadow_work_entry_saved';
+  static const shadowWorkShadowWorkShadowWorkHelpsYouUnderstandHidden =
+      'shadow_work.shadow_work.shadow_work_helps_you_understand_hidden';
+  static const shadowWorkShadowWorkStreak = 'shadow_work.shadow_work.streak';
+  static const shadowWorkShadowWorkThisWasABreakthroughMoment =
+      'shadow_work.shadow_work.this_was_a_breakthrough_moment';
+  static const shadowWorkShadowWorkToday = 'shadow_work.shadow_work.today';
+  static const shadowWorkShadowWorkUnlockYourShadowMap =
+      'shadow_work.shadow_work.unlock_your_shadow_map';
+  static const shadowWorkShadowWorkWriteFreelyWithoutJudgment =
+      'shadow_work.shadow_work.write_freely_without_judgment';
+  static const shadowWorkShadowWorkYesterday =
+      'shadow_work.shadow_work.yesterday';
+  static const shadowWorkShadowWorkYouHaveUnsavedTextAreYouSureYouW =
+      'shadow_work.shadow_work.you_have_unsaved_text_are_you_sure_you_w';
+  static const shadowWorkShadowWorkYourShadowMap =
+      'shadow_work.shadow_work.your_shadow_map';
+  static const shadowWorkTodaysPrompt = 'shadow_work.todays_prompt';
+  static const shareAction = 'share.action';
+  static const shareActionDay = 'share.action_day';
+  static const shareActivates = 'share.activates';
+  static const shareAwareness = 'share.awareness';
+  static const shareBalanceLevel = 'share.balance_level';
+  static const shareBalancedDay = 'share.balanced_day';
+  static const shareBeCareful = 'share.be_careful';
+  static const shareBlocks = 'share.blocks';
+  static const shareBreath = 'share.breath';
+  static const shareChallenge = 'share.challenge';
+  static const shareCopyText = 'share.copy_text';
+  static const shareCosmicAdviceTitle = 'share.cosmic_advice_title';
+  static const shareCosmicShare = 'share.cosmic_share';
+  static const shareCosmicTiming = 'share.cosmic_timing';
+  static const shareDayOfLength = 'share.day_of_length';
+  static const shareDayStreakHeadline = 'share.day_streak_headline';
+  static const shareDaysOfJournaling = 'share.days_of_journaling';
+  static const shareDreamTrace = 'share.dream_trace';
+  static const shareEnergy = 'share.energy';
+  static const shareEnergyBalancedDesc = 'share.energy_balanced_desc';
+  static const shareEnergyHighDesc = 'share.energy_high_desc';
+  static const shareEnergyLabel = 'share.energy_label';
+  static const shareEnergyLevel = 'share.energy_level';
+  static const shareEnergyLowDesc = 'share.energy_low_desc';
+  static const shareEnergyPeakDesc = 'share.energy_peak_desc';
+  static const shareEnergyRechargeDesc = 'share.energy_recharge_desc';
+  static const shareErrorCaptureFailed = 'share.error_capture_failed';
+  static const shareErrorDismissed = 'share.error_dismissed';
+  static const shareErrorIncomplete = 'share.error_incomplete';
+  static const shareErrorSaveFailed = 'share.error_save_failed';
+  static const shareErrorShareFailed = 'share.error_share_failed';
+  static const shareExploredDreams = 'share.explored_dreams';
+  static const shareFear = 'share.fear';
+  static const shareFoundPatterns = 'share.found_patterns';
+  static const shareGoldenHour = 'share.golden_hour';
+  static const shareInstruction1 = 'share.instruction_1';
+  static const shareInstruction2 = 'share.instruction_2';
+  static const shareInstruction3 = 'share.instruction_3';
+  static const shareInstruction4 = 'share.instruction_4';
+  static const shareIntensityCalm = 'share.intensity_calm';
+  static const shareIntensityCalmDesc = 'share.intensity_calm_desc';
+  static const shareIntensityDefault = 'share.intensity_default';
+  static const shareIntensityDefaultDesc = 'share.intensity_default_desc';
+  static const shareIntensityIntense = 'share.intensity_intense';
+  static const shareIntensityIntenseDesc = 'share.intensity_intense_desc';
+  static const shareIntensityRising = 'share.intensity_rising';
+  static const shareIntensityRisingDesc = 'share.intensity_rising_desc';
+  static const shareIntensityStormy = 'share.intensity_stormy';
+  static const shareIntensityStormyDesc = 'share.intensity_stormy_desc';
+  static const shareIntuitionAnalyticalDesc = 'share.intuition_analytical_desc';
+  static const shareIntuitionBalancedDesc = 'share.intuition_balanced_desc';
+  static const shareIntuitionHighDesc = 'share.intuition_high_desc';
+  static const shareIntuitionLowDesc = 'share.intuition_low_desc';
+  static const shareIntuitionPeakDesc = 'share.intuition_peak_desc';
+  static const shareIntuitionPower = 'share.intuition_power';
+  static const shareKeyStrength = 'share.key_strength';
+  static const shareLight = 'share.light';
+  static const shareListenToUniverse = 'share.listen_to_universe';
+  static const shareLuckyHour = 'share.lucky_hour';
+  static const shareMindfulnessTitle = 'share.mindfulness_title';
+  static const shareMonths = 'share.months';
+  static const shareOpenInstagram = 'share.open_instagram';
+  static const shareOpportunity = 'share.opportunity';
+  static const sharePattern = 'share.pattern';
+  static const shareProgramCompleted = 'share.program_completed';
+  static const shareReflect = 'share.reflect';
+  static const shareReflectionDay = 'share.reflection_day';
+  static const shareShadow = 'share.shadow';
+  static const shareShadowLight = 'share.shadow_light';
+  static const shareShareCosmicEnergyStory = 'share.share_cosmic_energy_story';
+  static const shareShareError = 'share.share_error';
+  static const shareShareOnInstagram = 'share.share_on_instagram';
+  static const shareShareOnInstagramDialog = 'share.share_on_instagram_dialog';
+  static const shareShareText = 'share.share_text';
+  static const shareStrength = 'share.strength';
+  static const shareSuccessShared = 'share.success_shared';
+  static const shareTakeScreenshotAndShare = 'share.take_screenshot_and_share';
+  static const shareTapXToExit = 'share.tap_x_to_exit';
+  static const shareTextCopiedSuccess = 'share.text_copied_success';
+  static const shareTodaysAction = 'share.todays_action';
+  static const shareTodaysCosmicEnergy = 'share.todays_cosmic_energy';
+  static const shareTodaysMessage = 'share.todays_message';
+  static const shareTodaysNumber = 'share.todays_number';
+  static const shareTodaysVoice = 'share.todays_voice';
+  static const sharedEcosystemsSeeExample = 'shared.ecosystems.see_example';
+  static const sharedEcosystemsStartWithTemplate =
+      'shared.ecosystems.start_with_template';
+  static const sharedGlassSliverAppBarBack = 'shared.glass_sliver_app_bar.back';
+  static const sharedGlassSliverAppBarBack1 =
+      'shared.glass_sliver_app_bar.back_1';
+  static const sharedMainShellHome = 'shared.main_shell.home';
+  static const sharedMainShellInsights = 'shared.main_shell.insights';
+  static const sharedMainShellJournal = 'shared.main_shell.journal';
+  static const sharedMainShellNotes = 'shared.main_shell.notes';
+  static const sharedMainShellProfile = 'shared.main_shell.profile';
+  static const sharedPrivateToggleCancel = 'shared.private_toggle.cancel';
+  static const sharedPrivateToggleProtectedWithPinFaceId =
+      'shared.private_toggle.protected_with_pin_face_id';
+  static const sharedPrivateToggleSaveToVault =
+      'shared.private_toggle.save_to_vault';
+  static const sharedPrivateToggleSetUp = 'shared.private_toggle.set_up';
+  static const sharedPrivateToggleSetUpVaultPin =
+      'shared.private_toggle.set_up_vault_pin';
+  static const sharedPrivateToggleYouNeedToCreateA4digitPinToProte =
+      'shared.private_toggle.you_need_to_create_a_4digit_pin_to_prote';
+  static const sharedShareShare = 'shared.share.share';
+  static const sharedShareInsightButtonShareThisInsight =
+      'shared.share_insight_button.share_this_insight';
+  static const sharedToolEcosystemFooterRelatedTools =
+      'shared.tool_ecosystem_footer.related_tools';
+  static const sharingCategoryLabel = 'sharing.category_label';
+  static const sharingDayOfCycle = 'sharing.day_of_cycle';
+  static const sharingHashtagsChallengeComplete =
+      'sharing.hashtags_challenge_complete';
+  static const sharingHashtagsJournaling = 'sharing.hashtags_journaling';
+  static const sharingHashtagsSelfReflection =
+      'sharing.hashtags_self_reflection';
+  static const sharingMadeWith = 'sharing.made_with';
+  static const sharingOfTotal = 'sharing.of_total';
+  static const sharingPreviewCard = 'sharing.preview_card';
+  static const sharingShareCardText = 'sharing.share_card_text';
+  static const sharingShareChallengeText = 'sharing.share_challenge_text';
+  static const sharingShareGalleryBack = 'sharing.share_gallery.back';
+  static const sharingShareGalleryBackToGallery =
+      'sharing.share_gallery.back_to_gallery';
+  static const sharingShareGalleryCheckOutMyInnercyclesCardInnercycle =
+      'sharing.share_gallery.check_out_my_innercycles_card_innercycle';
+  static const sharingShareGalleryCopiedToClipboard =
+      'sharing.share_gallery.copied_to_clipboard';
+  static const sharingShareGalleryCopy = 'sharing.share_gallery.copy';
+  static const sharingShareGalleryShare = 'sharing.share_gallery.share';
+  static const sharingShareGalleryShareCards =
+      'sharing.share_gallery.share_cards';
+  static const sharingShareGallerySharedSuccessfully =
+      'sharing.share_gallery.shared_successfully';
+  static const sharingTryInnercycles = 'sharing.try_innercycles';
+  static const sleepSleepAnySleepNotesOptional =
+      'sleep.sleep.any_sleep_notes_optional';
+  static const sleepSleepAvg = 'sleep.sleep.avg';
+  static const sleepSleepBest = 'sleep.sleep.best';
+  static const sleepSleepHowDidYouSleepLastNight =
+      'sleep.sleep.how_did_you_sleep_last_night';
+  static const sleepSleepNights = 'sleep.sleep.nights';
+  static const sleepSleepSleepQuality = 'sleep.sleep.sleep_quality';
+  static const sleepSleepSleepQuality1 = 'sleep.sleep.sleep_quality_1';
+  static const sleepSleepSleepThisWeek = 'sleep.sleep.sleep_this_week';
+  static const sleepSleepDetailAverage = 'sleep.sleep_detail.average';
+  static const sleepSleepDetailBest = 'sleep.sleep_detail.best';
+  static const sleepSleepDetailLast7Days = 'sleep.sleep_detail.last_7_days';
+  static const sleepSleepDetailLogYourSleepQualityInYourDailyJou =
+      'sleep.sleep_detail.log_your_sleep_quality_in_your_daily_jou';
+  static const sleepSleepDetailNights = 'sleep.sleep_detail.nights';
+  static const sleepSleepDetailRecentNights =
+      'sleep.sleep_detail.recent_nights';
+  static const sleepSleepDetailRetry = 'sleep.sleep_detail.retry';
+  static const sleepSleepDetailSleepQuality =
+      'sleep.sleep_detail.sleep_quality';
+  static const sleepSleepDetailSleepTips = 'sleep.sleep_detail.sleep_tips';
+  static const sleepSleepDetailWriteJournalEntry =
+      'sleep.sleep_detail.write_journal_entry';
+  static const sleepSleepDetailYourSleepStoryIsWaitingToBegin =
+      'sleep.sleep_detail.your_sleep_story_is_waiting_to_begin';
+  static const sleepSleepTrendsBest = 'sleep.sleep_trends.best';
+  static const sleepSleepTrendsFair = 'sleep.sleep_trends.fair';
+  static const sleepSleepTrendsGood = 'sleep.sleep_trends.good';
+  static const sleepSleepTrendsGreat = 'sleep.sleep_trends.great';
+  static const sleepSleepTrendsLast14Nights =
+      'sleep.sleep_trends.last_14_nights';
+  static const sleepSleepTrendsLogYourFirstNightsSleepToSeeTrend =
+      'sleep.sleep_trends.log_your_first_nights_sleep_to_see_trend';
+  static const sleepSleepTrendsNights = 'sleep.sleep_trends.nights';
+  static const sleepSleepTrendsNoSleepDataYet =
+      'sleep.sleep_trends.no_sleep_data_yet';
+  static const sleepSleepTrendsNotes = 'sleep.sleep_trends.notes';
+  static const sleepSleepTrendsOkay = 'sleep.sleep_trends.okay';
+  static const sleepSleepTrendsPoor = 'sleep.sleep_trends.poor';
+  static const sleepSleepTrendsQualityDistribution =
+      'sleep.sleep_trends.quality_distribution';
+  static const sleepSleepTrendsRetry = 'sleep.sleep_trends.retry';
+  static const sleepSleepTrendsSleepTrends = 'sleep.sleep_trends.sleep_trends';
+  static const sleepSleepTrendsSleepTrends1 =
+      'sleep.sleep_trends.sleep_trends_1';
+  static const sleepSleepTrendsWeekAvg = 'sleep.sleep_trends.week_avg';
+  static const sleepSleepTrendsYourSleepQualityHasDippedRecently =
+      'sleep.sleep_trends.your_sleep_quality_has_dipped_recently';
+  static const sleepSleepTrendsYourSleepQualityIsImproving =
+      'sleep.sleep_trends.your_sleep_quality_is_improving';
+  static const sleepSleepTrendsYourSleepQualityIsStable =
+      'sleep.sleep_trends.your_sleep_quality_is_stable';
+  static const streakChallengeCelebrationChallengeCompleted =
+      'streak.challenge_celebration.challenge_completed';
+  static const streakChallengeCelebrationContinue =
+      'streak.challenge_celebration.continue';
+  static const streakChallengeCelebrationShare =
+      'streak.challenge_celebration.share';
+  static const streakChallengeCelebrationYouShowedRealCommitment =
+      'streak.challenge_celebration.you_showed_real_commitment';
+  static const streakMilestoneCelebrationLabel =
+      'streak.milestone.celebration_label';
+  static const streakMilestoneTitle14 = 'streak.milestone.title_14';
+  static const streakMilestoneTitle180 = 'streak.milestone.title_180';
+  static const streakMilestoneTitle3 = 'streak.milestone.title_3';
+  static const streakMilestoneTitle30 = 'streak.milestone.title_30';
+  static const streakMilestoneTitle365 = 'streak.milestone.title_365';
+  static const streakMilestoneTitle60 = 'streak.milestone.title_60';
+  static const streakMilestoneTitle7 = 'streak.milestone.title_7';
+  static const streakMilestoneTitle90 = 'streak.milestone.title_90';
+  static const streakMilestoneTitleDefault = 'streak.milestone.title_default';
+  static const streakMilestoneCelebrationDayStreak =
+      'streak.milestone_celebration.day_streak';
+  static const streakMilestoneCelebrationKeepGoing =
+      'streak.milestone_celebration.keep_going';
+  static const streakMilestoneCelebrationShare =
+      'streak.milestone_celebration.share';
+  static const streakMilestoneCelebrationUnlockDeeperInsightsWithPremium =
+      'streak.milestone_celebration.unlock_deeper_insights_with_premium';
+  static const streakMilestoneDaysShort = 'streak.milestone_days_short';
+  static const streakStreak14dayChain = 'streak.streak.14day_chain';
+  static const streakStreakDays = 'streak.streak.days';
+  static const streakStreakKeepGoing = 'streak.streak.keep_going';
+  static const streakStreakMilestoneReached = 'streak.streak.milestone_reached';
+  static const streakStreakReflectionStreak = 'streak.streak.reflection_streak';
+  static const streakStreakShareAchievement = 'streak.streak.share_achievement';
+  static const streakStreakShareStreak = 'streak.streak.share_streak';
+  static const streakStreakShareYourStreak = 'streak.streak.share_your_streak';
+  static const streakStreakRecoveryAccessStreakFreeze =
+      'streak.streak_recovery.access_streak_freeze';
+  static const streakStreakRecoveryLearnMore =
+      'streak.streak_recovery.learn_more';
+  static const streakStreakRecoveryOneEntryToStartANewOne =
+      'streak.streak_recovery.one_entry_to_start_a_new_one';
+  static const streakStreakRecoveryPremiumStreakFreezesCouldHaveSaved =
+      'streak.streak_recovery.premium_streak_freezes_could_have_saved';
+  static const streakStreakRecoveryStartANewStreak =
+      'streak.streak_recovery.start_a_new_streak';
+  static const streakStreakStatsDayStreak = 'streak.streak_stats.day_streak';
+  static const streakStreakStatsLogTodaysEntry =
+      'streak.streak_stats.log_todays_entry';
+  static const streakStreakStatsLongest = 'streak.streak_stats.longest';
+  static const streakStreakStatsMilestones = 'streak.streak_stats.milestones';
+  static const streakStreakStatsMilestones1 =
+      'streak.streak_stats.milestones_1';
+  static const streakStreakStatsPremium3FreezesPerWeek =
+      'streak.streak_stats.premium_3_freezes_per_week';
+  static const streakStreakStatsRetry = 'streak.streak_stats.retry';
+  static const streakStreakStatsShareYourStreak =
+      'streak.streak_stats.share_your_streak';
+  static const streakStreakStatsStreakEngine =
+      'streak.streak_stats.streak_engine';
+  static const streakStreakStatsStreakFreeze =
+      'streak.streak_stats.streak_freeze';
+  static const streakStreakStatsThisWeek = 'streak.streak_stats.this_week';
+  static const streakStreakStatsTotalEntries =
+      'streak.streak_stats.total_entries';
+  static const streakStreakStatsUseFreeze = 'streak.streak_stats.use_freeze';
+  static const tabsAdvice = 'tabs.advice';
+  static const tabsAnalysis = 'tabs.analysis';
+  static const tabsArchetype = 'tabs.archetype';
+  static const tabsAspects = 'tabs.aspects';
+  static const tabsDaily = 'tabs.daily';
+  static const tabsDirections = 'tabs.directions';
+  static const tabsExplore = 'tabs.explore';
+  static const tabsGeneral = 'tabs.general';
+  static const tabsHome = 'tabs.home';
+  static const tabsHouses = 'tabs.houses';
+  static const tabsMainAsteroids = 'tabs.main_asteroids';
+  static const tabsMeditation = 'tabs.meditation';
+  static const tabsMonthly = 'tabs.monthly';
+  static const tabsOffice = 'tabs.office';
+  static const tabsQuestions = 'tabs.questions';
+  static const tabsSecondary = 'tabs.secondary';
+  static const tabsWeekly = 'tabs.weekly';
+  static const tabsYearly = 'tabs.yearly';
+  static const timingActive = 'timing.active';
+  static const timingAspectDefaultChallenging =
+      'timing.aspect_default_challenging';
+  static const timingAspectDefaultHarmonious =
+      'timing.aspect_default_harmonious';
+  static const timingBestTimeAfternoon = 'timing.best_time_afternoon';
+  static const timingBestTimeAfternoon1418 = 'timing.best_time_afternoon_14_18';
+  static const timingBestTimeAllDay = 'timing.best_time_all_day';
+  static const timingBestTimeBusinessHours = 'timing.best_time_business_hours';
+  static const timingBestTimeEarlyMorning = 'timing.best_time_early_morning';
+  static const timingBestTimeEarlyMorning0609 =
+      'timing.best_time_early_morning_06_09';
+  static const timingBestTimeEarlyMorning0810 =
+      'timing.best_time_early_morning_08_10';
+  static const timingBestTimeEvening1821 = 'timing.best_time_evening_18_21';
+  static const timingBestTimeEveningHours = 'timing.best_time_evening_hours';
+  static const timingBestTimeFlexible = 'timing.best_time_flexible';
+  static const timingBestTimeLateNight = 'timing.best_time_late_night';
+  static const timingBestTimeMorning0710 = 'timing.best_time_morning_07_10';
+  static const timingBestTimeMorning0912 = 'timing.best_time_morning_09_12';
+  static const timingBestTimeMorning1012 = 'timing.best_time_morning_10_12';
+  static const timingBestTimeNight2023 = 'timing.best_time_night_20_23';
+  static const timingBestTimeNoon1114 = 'timing.best_time_noon_11_14';
+  static const timingBestTimeNoonHours = 'timing.best_time_noon_hours';
+  static const timingCategoryAll = 'timing.category_all';
+  static const timingCategoryCareer = 'timing.category_career';
+  static const timingCategoryCreative = 'timing.category_creative';
+  static const timingCategoryHealth = 'timing.category_health';
+  static const timingCategoryLove = 'timing.category_love';
+  static const timingCategoryMoney = 'timing.category_money';
+  static const timingCategoryTravel = 'timing.category_travel';
+  static const timingClearSkyDesc = 'timing.clear_sky_desc';
+  static const timingClearSkyTitle = 'timing.clear_sky_title';
+  static const timingCurrentConditions = 'timing.current_conditions';
+  static const timingDailyAspects = 'timing.daily_aspects';
+  static const timingDirections = 'timing.directions';
+  static const timingEmotional = 'timing.emotional';
+  static const timingEndingSoon = 'timing.ending_soon';
+  static const timingEnergyHours = 'timing.energy_hours';
+  static const timingGoodTimes = 'timing.good_times';
+  static const timingHour = 'timing.hour';
+  static const timingIntellectual = 'timing.intellectual';
+  static const timingIntuitive = 'timing.intuitive';
+  static const timingKadimContent = 'timing.kadim_content';
+  static const timingKadimTitle = 'timing.kadim_title';
+  static const timingLuckyColor = 'timing.lucky_color';
+  static const timingLuckyDirection = 'timing.lucky_direction';
+  static const timingLuckyElements = 'timing.lucky_elements';
+  static const timingLuckyFlower = 'timing.lucky_flower';
+  static const timingLuckyHour = 'timing.lucky_hour';
+  static const timingLuckyNumbers = 'timing.lucky_numbers';
+  static const timingLuckyStone = 'timing.lucky_stone';
+  static const timingNext7Days = 'timing.next_7_days';
+  static const timingNone = 'timing.none';
+  static const timingNow = 'timing.now';
+  static const timingPhysical = 'timing.physical';
+  static const timingRecCareerActivity = 'timing.rec_career_activity';
+  static const timingRecCareerDescDefault = 'timing.rec_career_desc_default';
+  static const timingRecCareerDescVoc = 'timing.rec_career_desc_voc';
+  static const timingRecCreativeActivity = 'timing.rec_creative_activity';
+  static const timingRecCreativeDescDefault =
+      'timing.rec_creative_desc_default';
+  static const timingRecHealthActivity = 'timing.rec_health_activity';
+  static const timingRecHealthDescDefault = 'timing.rec_health_desc_default';
+  static const timingRecLoveActivity = 'timing.rec_love_activity';
+  static const timingRecLoveDescDefault = 'timing.rec_love_desc_default';
+  static const timingRecLoveDescVoc = 'timing.rec_love_desc_voc';
+  static const timingRecMoneyActivity = 'timing.rec_money_activity';
+  static const timingRecMoneyDescDefault = 'timing.rec_money_desc_default';
+  static const timingRecMoneyDescVoc = 'timing.rec_money_desc_voc';
+  static const timingRecTravelActivity = 'timing.rec_travel_activity';
+  static const timingRecTravelDescDefault = 'timing.rec_travel_desc_default';
+  static const timingScoreChallenging = 'timing.score_challenging';
+  static const timingScoreExcellent = 'timing.score_excellent';
+  static const timingScoreGood = 'timing.score_good';
+  static const timingScoreModerate = 'timing.score_moderate';
+  static const timingSubtitle = 'timing.subtitle';
+  static const timingTipDoResearch = 'timing.tip_do_research';
+  static const timingTipExpressFeelings = 'timing.tip_express_feelings';
+  static const timingTipInspirationPeak = 'timing.tip_inspiration_peak';
+  static const timingTipInvestmentTime = 'timing.tip_investment_time';
+  static const timingTipJumpIntoAdventure = 'timing.tip_jump_into_adventure';
+  static const timingTipRest = 'timing.tip_rest';
+  static const timingTipSave = 'timing.tip_save';
+  static const timingTipStartNewRoutines = 'timing.tip_start_new_routines';
+  static const timingTipStayLocal = 'timing.tip_stay_local';
+  static const timingTipTakeInitiative = 'timing.tip_take_initiative';
+  static const timingTipWaitPatiently = 'timing.tip_wait_patiently';
+  static const timingTipWatchAndLearn = 'timing.tip_watch_and_learn';
+  static const timingToday = 'timing.today';
+  static const timingTodaysEnergy = 'timing.todays_energy';
+  static const timingTomorrow = 'timing.tomorrow';
+  static const timingWellnessRhythmBalanced = 'timing.wellness_rhythm_balanced';
+  static const timingWellnessRhythmCritical = 'timing.wellness_rhythm_critical';
+  static const timingWellnessRhythmCycle = 'timing.wellness_rhythm_cycle';
+  static const timingWellnessRhythmHigh = 'timing.wellness_rhythm_high';
+  static const timingWellnessRhythmLow = 'timing.wellness_rhythm_low';
+  static const todayAnniversaryLabel = 'today.anniversary_label';
+  static const todayDailyPulseDecisions = 'today.daily_pulse.decisions';
+  static const todayDailyPulseDetails = 'today.daily_pulse.details';
+  static const todayDailyPulseEachEntryBuildsYourPatternLibraryS =
+      'today.daily_pulse.each_entry_builds_your_pattern_library_s';
+  static const todayDailyPulseEmotions = 'today.daily_pulse.emotions';
+  static const todayDailyPulseEnergy = 'today.daily_pulse.energy';
+  static const todayDailyPulseFocus = 'today.daily_pulse.focus';
+  static const todayDailyPulseFocusPulse = 'today.daily_pulse.focus_pulse';
+  static const todayDailyPulseSocial = 'today.daily_pulse.social';
+  static const todayDailyPulseTryForArea = 'today.daily_pulse.try_for_area';
+  static const todayDailyPulseViewDetails = 'today.daily_pulse.view_details';
+  static const todayHeroJournalDailyReflection =
+      'today.hero_journal.daily_reflection';
+  static const todayHeroJournalShareThisQuestion =
+      'today.hero_journal.share_this_question';
+  static const todayHeroJournalShareThisQuestion1 =
+      'today.hero_journal.share_this_question_1';
+  static const todayHeroJournalStartJournaling =
+      'today.hero_journal.start_journaling';
+  static const todayHeroJournalStartJournaling1 =
+      'today.hero_journal.start_journaling_1';
+  static const todayHeroJournalStartWriting =
+      'today.hero_journal.start_writing';
+  static const todayHeroJournalStartWritingJournalEntry =
+      'today.hero_journal.start_writing_journal_entry';
+  static const todayHomeHeaderGoodAfternoon =
+      'today.home_header.good_afternoon';
+  static const todayHomeHeaderGoodEvening = 'today.home_header.good_evening';
+  static const todayHomeHeaderGoodMorning = 'today.home_header.good_morning';
+  static const todayHomeHeaderProfileSettings =
+      'today.home_header.profile_settings';
+  static const todayHomeHeaderSearch = 'today.home_header.search';
+  static const todayMoodStatsEntriesLabel = 'today.mood_stats.entries_label';
+  static const todayMoodStatsMoodCount = 'today.mood_stats.mood_count';
+  static const todayMoodStatsMoodGood = 'today.mood_stats.mood_good';
+  static const todayMoodStatsMoodGreat = 'today.mood_stats.mood_great';
+  static const todayMoodStatsMoodLow = 'today.mood_stats.mood_low';
+  static const todayMoodStatsMoodMeh = 'today.mood_stats.mood_meh';
+  static const todayMoodStatsMoodOkay = 'today.mood_stats.mood_okay';
+  static const todayMoodStatsStreakLabel = 'today.mood_stats.streak_label';
+  static const todayMoodStatsStripCheckIn = 'today.mood_stats_strip.check_in';
+  static const todayOnThisDayViewMemoriesFromThisDay =
+      'today.on_this_day.view_memories_from_this_day';
+  static const todayPromotionalStack50OffNewUserOffer =
+      'today.promotional_stack.50_off_new_user_offer';
+  static const todayPromotionalStackAddEntriesForYourMostMeaningfulDay =
+      'today.promotional_stack.add_entries_for_your_most_meaningful_day';
+  static const todayPromotionalStackAddRetrospectiveEntries =
+      'today.promotional_stack.add_retrospective_entries';
+  static const todayPromotionalStackClaim = 'today.promotional_stack.claim';
+  static const todayPromotionalStackEnjoyingInnercycles =
+      'today.promotional_stack.enjoying_innercycles';
+  static const todayPromotionalStackInviteEarnPremium =
+      'today.promotional_stack.invite_earn_premium';
+  static const todayPromotionalStackLimitedTimeOffer =
+      'today.promotional_stack.limited_time_offer';
+  static const todayPromotionalStackNote = 'today.promotional_stack.note';
+  static const todayPromotionalStackNow = 'today.promotional_stack.now';
+  static const todayPromotionalStackSeeAll = 'today.promotional_stack.see_all';
+  static const todayPromotionalStackSeeYourMonthAtAGlanceShareIt =
+      'today.promotional_stack.see_your_month_at_a_glance_share_it';
+  static const todayPromotionalStackSeeYourYearInPatterns =
+      'today.promotional_stack.see_your_year_in_patterns';
+  static const todayPromotionalStackShareItWithAFriendWhoWouldLoveIt =
+      'today.promotional_stack.share_it_with_a_friend_who_would_love_it';
+  static const todayPromotionalStackShareWeeklyInsights =
+      'today.promotional_stack.share_weekly_insights';
+  static const todayPromotionalStackShareYourWeeksInsights =
+      'today.promotional_stack.share_your_weeks_insights';
+  static const todayPromotionalStackUpcomingReminders =
+      'today.promotional_stack.upcoming_reminders';
+  static const todayPromotionalStackViewMonthlyWrapped =
+      'today.promotional_stack.view_monthly_wrapped';
+  static const todayPromotionalStackViewUpcomingReminders =
+      'today.promotional_stack.view_upcoming_reminders';
+  static const todayPromotionalStackViewYearWrapped =
+      'today.promotional_stack.view_year_wrapped';
+  static const todayPromotionalStackYourLatestPatternCardIsReady =
+      'today.promotional_stack.your_latest_pattern_card_is_ready';
+  static const todayPromotionalStackYourStoryDidntStartToday =
+      'today.promotional_stack.your_story_didnt_start_today';
+  static const todayRecentEntriesDecisions = 'today.recent_entries.decisions';
+  static const todayRecentEntriesEmotions = 'today.recent_entries.emotions';
+  static const todayRecentEntriesEnergy = 'today.recent_entries.energy';
+  static const todayRecentEntriesFocus = 'today.recent_entries.focus';
+  static const todayRecentEntriesRecentEntries =
+      'today.recent_entries.recent_entries';
+  static const todayRecentEntriesSeeAll = 'today.recent_entries.see_all';
+  static const todayRecentEntriesSeeAllEntries =
+      'today.recent_entries.see_all_entries';
+  static const todayRecentEntriesSocial = 'today.recent_entries.social';
+  static const todayRecentLifeEventsAnyBigMomentsThisWeek =
+      'today.recent_life_events.any_big_moments_this_week';
+  static const todayRecentLifeEventsRecentLifeEvents =
+      'today.recent_life_events.recent_life_events';
+  static const todayRecentLifeEventsRecordALifeEvent =
+      'today.recent_life_events.record_a_life_event';
+  static const todayRecentLifeEventsRecordALifeEvent1 =
+      'today.recent_life_events.record_a_life_event_1';
+  static const todayRecentLifeEventsSeeAll = 'today.recent_life_events.see_all';
+  static const todayRecentLifeEventsSeeAllLifeEvents =
+      'today.recent_life_events.see_all_life_events';
+  static const todaySocialProofMilestone1 = 'today.social_proof.milestone_1';
+  static const todaySocialProofMilestone100 =
+      'today.social_proof.milestone_100';
+  static const todaySocialProofMilestone14 = 'today.social_proof.milestone_14';
+  static const todaySocialProofMilestone3 = 'today.social_proof.milestone_3';
+  static const todaySocialProofMilestone30 = 'today.social_proof.milestone_30';
+  static const todaySocialProofMilestone50 = 'today.social_proof.milestone_50';
+  static const todaySocialProofMilestone7 = 'today.social_proof.milestone_7';
+  static const todayTodayBirthdayU1f382BirthdayToday =
+      'today.today_birthday.u1f382_birthday_today';
+  static const todayTodayBirthdayViewBirthdayAgenda =
+      'today.today_birthday.view_birthday_agenda';
+  static const todayTodayFeed1Month = 'today.today_feed.1_month';
+  static const todayTodayFeed1Year = 'today.today_feed.1_year';
+  static const todayTodayFeed3Months = 'today.today_feed.3_months';
+  static const todayTodayFeed6Months = 'today.today_feed.6_months';
+  static const todayTodayFeedContinue = 'today.today_feed.continue';
+  static const todayTodayFeedMaybeLater = 'today.today_feed.maybe_later';
+  static const todayTodayFeedWelcomeBack = 'today.today_feed.welcome_back';
+  static const todayTodayFeedWriteAnEntry = 'today.today_feed.write_an_entry';
+  static const todayWeeklyFocusProgressWeek =
+      'today.weekly_focus_progress.week';
+  static const toolsToolCatalogAddToFavorites =
+      'tools.tool_catalog.add_to_favorites';
+  static const toolsToolCatalogClearSearch = 'tools.tool_catalog.clear_search';
+  static const toolsToolCatalogNoToolsFound =
+      'tools.tool_catalog.no_tools_found';
+  static const toolsToolCatalogRemoveFromFavorites =
+      'tools.tool_catalog.remove_from_favorites';
+  static const toolsToolCatalogSearchByNameOrCategory =
+      'tools.tool_catalog.search_by_name_or_category';
+  static const toolsToolCatalogTools = 'tools.tool_catalog.tools';
+  static const tooltipsBirthdayReflection = 'tooltips.birthday_reflection';
+  static const tooltipsMoonCalendar = 'tooltips.moon_calendar';
+  static const tooltipsPersonalProfile = 'tooltips.personal_profile';
+  static const vaultVaultCancel = 'vault.vault.cancel';
+  static const vaultVaultCancel1 = 'vault.vault.cancel_1';
+  static const vaultVaultChangePin = 'vault.vault.change_pin';
+  static const vaultVaultDelete = 'vault.vault.delete';
+  static const vaultVaultDeletePhoto = 'vault.vault.delete_photo';
+  static const vaultVaultDisableFaceId = 'vault.vault.disable_face_id';
+  static const vaultVaultEnableFaceId = 'vault.vault.enable_face_id';
+  static const vaultVaultMarkJournalsOrNotesAsPrivateOrAdd =
+      'vault.vault.mark_journals_or_notes_as_private_or_add';
+  static const vaultVaultPrivateJournals = 'vault.vault.private_journals';
+  static const vaultVaultPrivateNotes = 'vault.vault.private_notes';
+  static const vaultVaultPrivatePhotos = 'vault.vault.private_photos';
+  static const vaultVaultPrivateVault = 'vault.vault.private_vault';
+  static const vaultVaultThisPhotoWillBePermanentlyDeletedF =
+      'vault.vault.this_photo_will_be_permanently_deleted_f';
+  static const vaultVaultUntitled = 'vault.vault.untitled';
+  static const vaultVaultVaultSettings = 'vault.vault.vault_settings';
+  static const vaultVaultVaultSettings1 = 'vault.vault.vault_settings_1';
+  static const vaultVaultYourVaultIsEmpty = 'vault.vault.your_vault_is_empty';
+  static const vaultVaultPinBack = 'vault.vault_pin.back';
+  static const vaultVaultPinChooseA4digitPinForYourVault =
+      'vault.vault_pin.choose_a_4digit_pin_for_your_vault';
+  static const vaultVaultPinChooseANew4digitPin =
+      'vault.vault_pin.choose_a_new_4digit_pin';
+  static const vaultVaultPinConfirmPin = 'vault.vault_pin.confirm_pin';
+  static const vaultVaultPinCreatePin = 'vault.vault_pin.create_pin';
+  static const vaultVaultPinEnable = 'vault.vault_pin.enable';
+  static const vaultVaultPinEnableFaceId = 'vault.vault_pin.enable_face_id';
+  static const vaultVaultPinEnterPin = 'vault.vault_pin.enter_pin';
+  static const vaultVaultPinEnterTheSamePinAgain =
+      'vault.vault_pin.enter_the_same_pin_again';
+  static const vaultVaultPinEnterYourVaultPin =
+      'vault.vault_pin.enter_your_vault_pin';
+  static const vaultVaultPinNewPin = 'vault.vault_pin.new_pin';
+  static const vaultVaultPinNotNow = 'vault.vault_pin.not_now';
+  static const vaultVaultPinThatPinDidntMatchTryAgain =
+      'vault.vault_pin.that_pin_didnt_match_try_again';
+  static const vaultVaultPinThoseDontMatchNoWorriesTryAgain =
+      'vault.vault_pin.those_dont_match_no_worries_try_again';
+  static const vaultVaultPinUseFaceIdToQuicklyAccessYourVault =
+      'vault.vault_pin.use_face_id_to_quickly_access_your_vault';
+  static const voiceInputErrorGeneric = 'voice_input.error_generic';
+  static const voiceInputErrorStart = 'voice_input.error_start';
+  static const voiceInputListening = 'voice_input.listening';
+  static const voiceInputNotAvailable = 'voice_input.not_available';
+  static const voiceInputPermissionRequired = 'voice_input.permission_required';
+  static const voiceInputStop = 'voice_input.stop';
+  static const voiceInputTapToSpeak = 'voice_input.tap_to_speak';
+  static const wellnessWellnessDetailCouldNotLoadYourLocalDataIsUnaffe =
+      'wellness.wellness_detail.could_not_load_your_local_data_is_unaffe';
+  static const wellnessWellnessDetailDeclining =
+      'wellness.wellness_detail.declining';
+  static const wellnessWellnessDetailGetStarted =
+      'wellness.wellness_detail.get_started';
+  static const wellnessWellnessDetailGettingStarted =
+      'wellness.wellness_detail.getting_started';
+  static const wellnessWellnessDetailGoodBalance =
+      'wellness.wellness_detail.good_balance';
+  static const wellnessWellnessDetailGratitudeItems15 =
+      'wellness.wellness_detail.gratitude_items_15';
+  static const wellnessWellnessDetailGratitudePractice =
+      'wellness.wellness_detail.gratitude_practice';
+  static const wellnessWellnessDetailHowYourScoreWorks =
+      'wellness.wellness_detail.how_your_score_works';
+  static const wellnessWellnessDetailImproving =
+      'wellness.wellness_detail.improving';
+  static const wellnessWellnessDetailJournalRating =
+      'wellness.wellness_detail.journal_rating';
+  static const wellnessWellnessDetailJournalRating40OfScore =
+      'wellness.wellness_detail.journal_rating_40_of_score';
+  static const wellnessWellnessDetailLogACycleEntryGratitudeOrSleepTo =
+      'wellness.wellness_detail.log_a_cycle_entry_gratitude_or_sleep_to';
+  static const wellnessWellnessDetailOutOf100 =
+      'wellness.wellness_detail.out_of_100';
+  static const wellnessWellnessDetailRetry = 'wellness.wellness_detail.retry';
+  static const wellnessWellnessDetailRitualCompletion =
+      'wellness.wellness_detail.ritual_completion';
+  static const wellnessWellnessDetailRitualCompletion15 =
+      'wellness.wellness_detail.ritual_completion_15';
+  static const wellnessWellnessDetailRoomToGrow =
+      'wellness.wellness_detail.room_to_grow';
+  static const wellnessWellnessDetailScoreBreakdown =
+      'wellness.wellness_detail.score_breakdown';
+  static const wellnessWellnessDetailSleepQuality =
+      'wellness.wellness_detail.sleep_quality';
+  static const wellnessWellnessDetailSleepQuality15 =
+      'wellness.wellness_detail.sleep_quality_15';
+  static const wellnessWellnessDetailStable = 'wellness.wellness_detail.stable';
+  static const wellnessWellnessDetailStreakConsistency =
+      'wellness.wellness_detail.streak_consistency';
+  static const wellnessWellnessDetailStreakConsistency15 =
+      'wellness.wellness_detail.streak_consistency_15';
+  static const wellnessWellnessDetailThriving =
+      'wellness.wellness_detail.thriving';
+  static const wellnessWellnessDetailWeeklyTrend =
+      'wellness.wellness_detail.weekly_trend';
+  static const wellnessWellnessDetailWellnessScore =
+      'wellness.wellness_detail.wellness_score';
+  static const wellnessWellnessDetailWriteJournalEntry =
+      'wellness.wellness_detail.write_journal_entry';
+  static const wellnessWellnessDetailYourWellnessScoreIsBuilding =
+      'wellness.wellness_detail.your_wellness_score_is_building';
+  static const whatsNewTitle = 'whats_new.title';
+  static const whatsNewWhatsNewGotIt = 'whats_new.whats_new.got_it';
+  static const whatsNewWhatsNewLatestFeaturesAndImprovements =
+      'whats_new.whats_new.latest_features_and_improvements';
+  static const widgetsAppErrorBackToHome = 'widgets.app_error.back_to_home';
+  static const widgetsAppErrorReloadPage = 'widgets.app_error.reload_page';
+  static const widgetsAppErrorSubtitle = 'widgets.app_error.subtitle';
+  static const widgetsAppErrorTitle = 'widgets.app_error.title';
+  static const widgetsBirthDatePickerDay = 'widgets.birth_date_picker.day';
+  static const widgetsBirthDatePickerMonth = 'widgets.birth_date_picker.month';
+  static const widgetsBirthDatePickerYear = 'widgets.birth_date_picker.year';
+  static const widgetsContentDisclaimerCardInsight =
+      'widgets.content_disclaimer.card_insight';
+  static const widgetsContentDisclaimerCompatibility =
+      'widgets.content_disclaimer.compatibility';
+  static const widgetsContentDisclaimerDreams =
+      'widgets.content_disclaimer.dreams';
+  static const widgetsContentDisclaimerGeneral =
+      'widgets.content_disclaimer.general';
+  static const widgetsContentDisclaimerHealth =
+      'widgets.content_disclaimer.health';
+  static const widgetsContentDisclaimerInsight =
+      'widgets.content_disclaimer.insight';
+  static const widgetsContentDisclaimerNumberPatterns =
+      'widgets.content_disclaimer.number_patterns';
+  static const widgetsContentDisclaimerReflection =
+      'widgets.content_disclaimer.reflection';
+  static const widgetsContentDisclaimerSelfAwareness =
+      'widgets.content_disclaimer.self_awareness';
+  static const widgetsDreamPromptCardDiscoverSubconscious =
+      'widgets.dream_prompt_card.discover_subconscious';
+  static const widgetsDreamPromptCardDreamJournal =
+      'widgets.dream_prompt_card.dream_journal';
+  static const widgetsDreamPromptCardDreamRecorded =
+      'widgets.dream_prompt_card.dream_recorded';
+  static const widgetsDreamPromptCardQuickPromptsFlying =
+      'widgets.dream_prompt_card.quick_prompts.flying';
+  static const widgetsDreamPromptCardQuickPromptsRunning =
+      'widgets.dream_prompt_card.quick_prompts.running';
+  static const widgetsDreamPromptCardQuickPromptsSnake =
+      'widgets.dream_prompt_card.quick_prompts.snake';
+  static const widgetsDreamPromptCardQuickPromptsWater =
+      'widgets.dream_prompt_card.quick_prompts.water';
+  static const widgetsDreamPromptCardSaveDream =
+      'widgets.dream_prompt_card.save_dream';
+  static const widgetsDreamPromptCardSaveDreamsDiscoverPatterns =
+      'widgets.dream_prompt_card.save_dreams_discover_patterns';
+  static const widgetsDreamPromptCardTapToReview =
+      'widgets.dream_prompt_card.tap_to_review';
+  static const widgetsDreamPromptCardTellMyDream =
+      'widgets.dream_prompt_card.tell_my_dream';
+  static const widgetsDreamPromptCardTimePromptsAfternoon =
+      'widgets.dream_prompt_card.time_prompts.afternoon';
+  static const widgetsDreamPromptCardTimePromptsEvening =
+      'widgets.dream_prompt_card.time_prompts.evening';
+  static const widgetsDreamPromptCardTimePromptsMorning =
+      'widgets.dream_prompt_card.time_prompts.morning';
+  static const widgetsDreamPromptCardViewDreamInterpretation =
+      'widgets.dream_prompt_card.view_dream_interpretation';
+  static const widgetsDreamShareCardDreamsInterpreted =
+      'widgets.dream_share_card.dreams_interpreted';
+  static const widgetsDreamShareCardFontsContemplative =
+      'widgets.dream_share_card.fonts.contemplative';
+  static const widgetsDreamShareCardFontsElegant =
+      'widgets.dream_share_card.fonts.elegant';
+  static const widgetsDreamShareCardFontsHandwritten =
+      'widgets.dream_share_card.fonts.handwritten';
+  static const widgetsDreamShareCardFontsModern =
+      'widgets.dream_share_card.fonts.modern';
+  static const widgetsDreamShareCardFooterArchetypeDiscovery =
+      'widgets.dream_share_card.footer.archetype_discovery';
+  static const widgetsDreamShareCardFooterDailyDreamMessage =
+      'widgets.dream_share_card.footer.daily_dream_message';
+  static const widgetsDreamShareCardFooterDreamInterpretation =
+      'widgets.dream_share_card.footer.dream_interpretation';
+  static const widgetsDreamShareCardFooterMoonPhaseWisdom =
+      'widgets.dream_share_card.footer.moon_phase_wisdom';
+  static const widgetsDreamShareCardFooterPersonalInsight =
+      'widgets.dream_share_card.footer.personal_insight';
+  static const widgetsDreamShareCardFooterSymbolInsight =
+      'widgets.dream_share_card.footer.symbol_insight';
+  static const widgetsDreamShareCardFooterWeeklySummary =
+      'widgets.dream_share_card.footer.weekly_summary';
+  static const widgetsDreamShareCardMoonPhaseEnergy =
+      'widgets.dream_share_card.moon_phase_energy';
+  static const widgetsDreamShareCardTemplatesArchetypeDiscovery =
+      'widgets.dream_share_card.templates.archetypeDiscovery';
+  static const widgetsDreamShareCardTemplatesDailyMessage =
+      'widgets.dream_share_card.templates.dailyMessage';
+  static const widgetsDreamShareCardTemplatesDreamQuote =
+      'widgets.dream_share_card.templates.dreamQuote';
+  static const widgetsDreamShareCardTemplatesMoonPhase =
+      'widgets.dream_share_card.templates.moonPhase';
+  static const widgetsDreamShareCardTemplatesPersonalInsight =
+      'widgets.dream_share_card.templates.personalInsight';
+  static const widgetsDreamShareCardTemplatesSymbolInsight =
+      'widgets.dream_share_card.templates.symbolInsight';
+  static const widgetsDreamShareCardTemplatesWeeklySummary =
+      'widgets.dream_share_card.templates.weeklySummary';
+  static const widgetsDreamShareCardThemesAuroraDescription =
+      'widgets.dream_share_card.themes.aurora.description';
+  static const widgetsDreamShareCardThemesAuroraLabel =
+      'widgets.dream_share_card.themes.aurora.label';
+  static const widgetsDreamShareCardThemesContemplativeDescription =
+      'widgets.dream_share_card.themes.contemplative.description';
+  static const widgetsDreamShareCardThemesContemplativeLabel =
+      'widgets.dream_share_card.themes.contemplative.label';
+  static const widgetsDreamShareCardThemesCosmicDescription =
+      'widgets.dream_share_card.themes.cosmic.description';
+  static const widgetsDreamShareCardThemesCosmicLabel =
+      'widgets.dream_share_card.themes.cosmic.label';
+  static const widgetsDreamShareCardThemesGoldenDescription =
+      'widgets.dream_share_card.themes.golden.description';
+  static const widgetsDreamShareCardThemesGoldenLabel =
+      'widgets.dream_share_card.themes.golden.label';
+  static const widgetsDreamShareCardThemesMinimalDescription =
+      'widgets.dream_share_card.themes.minimal.description';
+  static const widgetsDreamShareCardThemesMinimalLabel =
+      'widgets.dream_share_card.themes.minimal.label';
+  static const widgetsDreamShareCardThemesMoonlitDescription =
+      'widgets.dream_share_card.themes.moonlit.description';
+  static const widgetsDreamShareCardThemesMoonlitLabel =
+      'widgets.dream_share_card.themes.moonlit.label';
+  static const widgetsDreamsErrorTryAgain = 'widgets.dreams.error_try_again';
+  static const widgetsDreamsExamplePromptsLabel =
+      'widgets.dreams.example_prompts_label';
+  static const widgetsDreamsInputPlaceholder =
+      'widgets.dreams.input_placeholder';
+  static const widgetsDreamsInterpretationFailed =
+      'widgets.dreams.interpretation_failed';
+  static const widgetsDreamsInterpretationLabel =
+      'widgets.dreams.interpretation_label';
+  static const widgetsDreamsInterpretationSubtitle =
+      'widgets.dreams.interpretation_subtitle';
+  static const widgetsDreamsInterpretationTitle =
+      'widgets.dreams.interpretation_title';
+  static const widgetsDreamsInterpretationsAnimalBasicMeaning =
+      'widgets.dreams.interpretations.animal.basic_meaning';
+  static const widgetsDreamsInterpretationsAnimalBasicMeaningLabel =
+      'widgets.dreams.interpretations.animal.basic_meaning_label';
+  static const widgetsDreamsInterpretationsAnimalCommonSymbols =
+      'widgets.dreams.interpretations.animal.common_symbols';
+  static const widgetsDreamsInterpretationsAnimalCommonSymbolsLabel =
+      'widgets.dreams.interpretations.animal.common_symbols_label';
+  static const widgetsDreamsInterpretationsAnimalCosmicMessage =
+      'widgets.dreams.interpretations.animal.cosmic_message';
+  static const widgetsDreamsInterpretationsAnimalCosmicMessageLabel =
+      'widgets.dreams.interpretations.animal.cosmic_message_label';
+  static const widgetsDreamsInterpretationsAnimalPractice =
+      'widgets.dreams.interpretations.animal.practice';
+  static const widgetsDreamsInterpretationsAnimalPracticeLabel =
+      'widgets.dreams.interpretations.animal.practice_label';
+  static const widgetsDreamsInterpretationsAnimalPsychological =
+      'widgets.dreams.interpretations.animal.psychological';
+  static const widgetsDreamsInterpretationsAnimalPsychologicalLabel =
+      'widgets.dreams.interpretations.animal.psychological_label';
+  static const widgetsDreamsInterpretationsAnimalSpecialInterpretation =
+      'widgets.dreams.interpretations.animal.special_interpretation';
+  static const widgetsDreamsInterpretationsAnimalTitle =
+      'widgets.dreams.interpretations.animal.title';
+  static const widgetsDreamsInterpretationsChaseBasicMeaning =
+      'widgets.dreams.interpretations.chase.basic_meaning';
+  static const widgetsDreamsInterpretationsChaseBasicMeaningLabel =
+      'widgets.dreams.interpretations.chase.basic_meaning_label';
+  static const widgetsDreamsInterpretationsChaseChaser =
+      'widgets.dreams.interpretations.chase.chaser';
+  static const widgetsDreamsInterpretationsChaseChaserLabel =
+      'widgets.dreams.interpretations.chase.chaser_label';
+  static const widgetsDreamsInterpretationsChaseCosmicMessage =
+      'widgets.dreams.interpretations.chase.cosmic_message';
+  static const widgetsDreamsInterpretationsChaseCosmicMessageLabel =
+      'widgets.dreams.interpretations.chase.cosmic_message_label';
+  static const widgetsDreamsInterpretationsChasePractice =
+      'widgets.dreams.interpretations.chase.practice';
+  static const widgetsDreamsInterpretationsChasePracticeLabel =
+      'widgets.dreams.interpretations.chase.practice_label';
+  static const widgetsDreamsInterpretationsChasePsychological =
+      'widgets.dreams.interpretations.chase.psychological';
+  static const widgetsDreamsInterpretationsChasePsychologicalLabel =
+      'widgets.dreams.interpretations.chase.psychological_label';
+  static const widgetsDreamsInterpretationsChaseSpecialInterpretation =
+      'widgets.dreams.interpretations.chase.special_interpretation';
+  static const widgetsDreamsInterpretationsChaseTitle =
+      'widgets.dreams.interpretations.chase.title';
+  static const widgetsDreamsInterpretationsDeathCosmicMessage =
+      'widgets.dreams.interpretations.death.cosmic_message';
+  static const widgetsDreamsInterpretationsDeathCosmicMessageLabel =
+      'widgets.dreams.interpretations.death.cosmic_message_label';
+  static const widgetsDreamsInterpretationsDeathNotScary =
+      'widgets.dreams.interpretations.death.not_scary';
+  static const widgetsDreamsInterpretationsDeathNotScaryLabel =
+      'widgets.dreams.interpretations.death.not_scary_label';
+  static const widgetsDreamsInterpretationsDeathPractice =
+      'widgets.dreams.interpretations.death.practice';
+  static const widgetsDreamsInterpretationsDeathPracticeLabel =
+      'widgets.dreams.interpretations.death.practice_label';
+  static const widgetsDreamsInterpretationsDeathPsychological =
+      'widgets.dreams.interpretations.death.psychological';
+  static const widgetsDreamsInterpretationsDeathPsychologicalLabel =
+      'widgets.dreams.interpretations.death.psychological_label';
+  static const widgetsDreamsInterpretationsDeathSpecialInterpretation =
+      'widgets.dreams.interpretations.death.special_interpretation';
+  static const widgetsDreamsInterpretationsDeathTitle =
+      'widgets.dreams.interpretations.death.title';
+  static const widgetsDreamsInterpretationsDeathTransformation =
+      'widgets.dreams.interpretations.death.transformation';
+  static const widgetsDreamsInterpretationsDeathTransformationLabel =
+      'widgets.dreams.interpretations.death.transformation_label';
+  static const widgetsDreamsInterpretationsElementMessagesAirFlying =
+      'widgets.dreams.interpretations.element_messages.air_flying';
+  static const widgetsDreamsInterpretationsElementMessagesAirGeneric =
+      'widgets.dreams.interpretations.element_messages.air_generic';
+  static const widgetsDreamsInterpretationsElementMessagesAirLove =
+      'widgets.dreams.interpretations.element_messages.air_love';
+  static const widgetsDreamsInterpretationsElementMessagesAirMoney =
+      'widgets.dreams.interpretations.element_messages.air_money';
+  static const widgetsDreamsInterpretationsElementMessagesEarthFlying =
+      'widgets.dreams.interpretations.element_messages.earth_flying';
+  static const widgetsDreamsInterpretationsElementMessagesEarthGeneric =
+      'widgets.dreams.interpretations.element_messages.earth_generic';
+  static const widgetsDreamsInterpretationsElementMessagesEarthLove =
+      'widgets.dreams.interpretations.element_messages.earth_love';
+  static const widgetsDreamsInterpretationsElementMessagesEarthMoney =
+      'widgets.dreams.interpretations.element_messages.earth_money';
+  static const widgetsDreamsInterpretationsElementMessagesFireFlying =
+      'widgets.dreams.interpretations.element_messages.fire_flying';
+  static const widgetsDreamsInterpretationsElementMessagesFireGeneric =
+      'widgets.dreams.interpretations.element_messages.fire_generic';
+  static const widgetsDreamsInterpretationsElementMessagesFireLove =
+      'widgets.dreams.interpretations.element_messages.fire_love';
+  static const widgetsDreamsInterpretationsElementMessagesFireMoney =
+      'widgets.dreams.interpretations.element_messages.fire_money';
+  static const widgetsDreamsInterpretationsElementMessagesWaterFlying =
+      'widgets.dreams.interpretations.element_messages.water_flying';
+  static const widgetsDreamsInterpretationsElementMessagesWaterGeneric =
+      'widgets.dreams.interpretations.element_messages.water_generic';
+  static const widgetsDreamsInterpretationsElementMessagesWaterLove =
+      'widgets.dreams.interpretations.element_messages.water_love';
+  static const widgetsDreamsInterpretationsElementMessagesWaterMoney =
+      'widgets.dreams.interpretations.element_messages.water_money';
+  static const widgetsDreamsInterpretationsFallingAttention =
+      'widgets.dreams.interpretations.falling.attention';
+  static const widgetsDreamsInterpretationsFallingAttentionLabel =
+      'widgets.dreams.interpretations.falling.attention_label';
+  static const widgetsDreamsInterpretationsFallingBasicMeaning =
+      'widgets.dreams.interpretations.falling.basic_meaning';
+  static const widgetsDreamsInterpretationsFallingBasicMeaningLabel =
+      'widgets.dreams.interpretations.falling.basic_meaning_label';
+  static const widgetsDreamsInterpretationsFallingCosmicMessage =
+      'widgets.dreams.interpretations.falling.cosmic_message';
+  static const widgetsDreamsInterpretationsFallingCosmicMessageLabel =
+      'widgets.dreams.interpretations.falling.cosmic_message_label';
+  static const widgetsDreamsInterpretationsFallingPractice =
+      'widgets.dreams.interpretations.falling.practice';
+  static const widgetsDreamsInterpretationsFallingPracticeLabel =
+      'widgets.dreams.interpretations.falling.practice_label';
+  static const widgetsDreamsInterpretationsFallingPsychological =
+      'widgets.dreams.interpretations.falling.psychological';
+  static const widgetsDreamsInterpretationsFallingPsychologicalLabel =
+      'widgets.dreams.interpretations.falling.psychological_label';
+  static const widgetsDreamsInterpretationsFallingSpecialInterpretation =
+      'widgets.dreams.interpretations.falling.special_interpretation';
+  static const widgetsDreamsInterpretationsFallingTitle =
+      'widgets.dreams.interpretations.falling.title';
+  static const widgetsDreamsInterpretationsFlyingBasicMeaning =
+      'widgets.dreams.interpretations.flying.basic_meaning';
+  static const widgetsDreamsInterpretationsFlyingBasicMeaningLabel =
+      'widgets.dreams.interpretations.flying.basic_meaning_label';
+  static const widgetsDreamsInterpretationsFlyingCosmicMessage =
+      'widgets.dreams.interpretations.flying.cosmic_message';
+  static const widgetsDreamsInterpretationsFlyingCosmicMessageLabel =
+      'widgets.dreams.interpretations.flying.cosmic_message_label';
+  static const widgetsDreamsInterpretationsFlyingFlightStyle =
+      'widgets.dreams.interpretations.flying.flight_style';
+  static const widgetsDreamsInterpretationsFlyingFlightStyleLabel =
+      'widgets.dreams.interpretations.flying.flight_style_label';
+  static const widgetsDreamsInterpretationsFlyingPractice =
+      'widgets.dreams.interpretations.flying.practice';
+  static const widgetsDreamsInterpretationsFlyingPracticeLabel =
+      'widgets.dreams.interpretations.flying.practice_label';
+  static const widgetsDreamsInterpretationsFlyingPsychological =
+      'widgets.dreams.interpretations.flying.psychological';
+  static const widgetsDreamsInterpretationsFlyingPsychologicalLabel =
+      'widgets.dreams.interpretations.flying.psychological_label';
+  static const widgetsDreamsInterpretationsFlyingSpecialInterpretation =
+      'widgets.dreams.interpretations.flying.special_interpretation';
+  static const widgetsDreamsInterpretationsFlyingSpecialInterpretationLabel =
+      'widgets.dreams.interpretations.flying.special_interpretation_label';
+  static const widgetsDreamsInterpretationsFlyingTitle =
+      'widgets.dreams.interpretations.flying.title';
+  static const widgetsDreamsInterpretationsGenericAdviceLabel =
+      'widgets.dreams.interpretations.generic.advice_label';
+  static const widgetsDreamsInterpretationsGenericElementPerspective =
+      'widgets.dreams.interpretations.generic.element_perspective';
+  static const widgetsDreamsInterpretationsGenericElementPerspectiveLabel =
+      'widgets.dreams.interpretations.generic.element_perspective_label';
+  static const widgetsDreamsInterpretationsGenericEmotion =
+      'widgets.dreams.interpretations.generic.emotion';
+  static const widgetsDreamsInterpretationsGenericEmotionLabel =
+      'widgets.dreams.interpretations.generic.emotion_label';
+  static const widgetsDreamsInterpretationsGenericPractice =
+      'widgets.dreams.interpretations.generic.practice';
+  static const widgetsDreamsInterpretationsGenericPracticeLabel =
+      'widgets.dreams.interpretations.generic.practice_label';
+  static const widgetsDreamsInterpretationsGenericSubconscious =
+      'widgets.dreams.interpretations.generic.subconscious';
+  static const widgetsDreamsInterpretationsGenericSubconsciousLabel =
+      'widgets.dreams.interpretations.generic.subconscious_label';
+  static const widgetsDreamsInterpretationsGenericSymbolReading =
+      'widgets.dreams.interpretations.generic.symbol_reading';
+  static const widgetsDreamsInterpretationsGenericSymbolReadingLabel =
+      'widgets.dreams.interpretations.generic.symbol_reading_label';
+  static const widgetsDreamsInterpretationsGenericTitle =
+      'widgets.dreams.interpretations.generic.title';
+  static const widgetsDreamsInterpretationsHouseBasicMeaning =
+      'widgets.dreams.interpretations.house.basic_meaning';
+  static const widgetsDreamsInterpretationsHouseBasicMeaningLabel =
+      'widgets.dreams.interpretations.house.basic_meaning_label';
+  static const widgetsDreamsInterpretationsHouseCosmicMessage =
+      'widgets.dreams.interpretations.house.cosmic_message';
+  static const widgetsDreamsInterpretationsHouseCosmicMessageLabel =
+      'widgets.dreams.interpretations.house.cosmic_message_label';
+  static const widgetsDreamsInterpretationsHouseHouseStates =
+      'widgets.dreams.interpretations.house.house_states';
+  static const widgetsDreamsInterpretationsHouseHouseStatesLabel =
+      'widgets.dreams.interpretations.house.house_states_label';
+  static const widgetsDreamsInterpretationsHousePractice =
+      'widgets.dreams.interpretations.house.practice';
+  static const widgetsDreamsInterpretationsHousePracticeLabel =
+      'widgets.dreams.interpretations.house.practice_label';
+  static const widgetsDreamsInterpretationsHouseRoomMeanings =
+      'widgets.dreams.interpretations.house.room_meanings';
+  static const widgetsDreamsInterpretationsHouseRoomMeaningsLabel =
+      'widgets.dreams.interpretations.house.room_meanings_label';
+  static const widgetsDreamsInterpretationsHouseSpecialInterpretation =
+      'widgets.dreams.interpretations.house.special_interpretation';
+  static const widgetsDreamsInterpretationsHouseTitle =
+      'widgets.dreams.interpretations.house.title';
+  static const widgetsDreamsInterpretationsLoveBasicMeaning =
+      'widgets.dreams.interpretations.love.basic_meaning';
+  static const widgetsDreamsInterpretationsLoveBasicMeaningLabel =
+      'widgets.dreams.interpretations.love.basic_meaning_label';
+  static const widgetsDreamsInterpretationsLoveCosmicMessage =
+      'widgets.dreams.interpretations.love.cosmic_message';
+  static const widgetsDreamsInterpretationsLoveCosmicMessageLabel =
+      'widgets.dreams.interpretations.love.cosmic_message_label';
+  static const widgetsDreamsInterpretationsLoveDreamTypes =
+      'widgets.dreams.interpretations.love.dream_types';
+  static const widgetsDreamsInterpretationsLoveDreamTypesLabel =
+      'widgets.dreams.interpretations.love.dream_types_label';
+  static const widgetsDreamsInterpretationsLovePractice =
+      'widgets.dreams.interpretations.love.practice';
+  static const widgetsDreamsInterpretationsLovePracticeLabel =
+      'widgets.dreams.interpretations.love.practice_label';
+  static const widgetsDreamsInterpretationsLovePsychological =
+      'widgets.dreams.interpretations.love.psychological';
+  static const widgetsDreamsInterpretationsLovePsychologicalLabel =
+      'widgets.dreams.interpretations.love.psychological_label';
+  static const widgetsDreamsInterpretationsLoveScenarios =
+      'widgets.dreams.interpretations.love.scenarios';
+  static const widgetsDreamsInterpretationsLoveScenariosLabel =
+      'widgets.dreams.interpretations.love.scenarios_label';
+  static const widgetsDreamsInterpretationsLoveSpecialInterpretation =
+      'widgets.dreams.interpretations.love.special_interpretation';
+  static const widgetsDreamsInterpretationsLoveTitle =
+      'widgets.dreams.interpretations.love.title';
+  static const widgetsDreamsInterpretationsMoneyBasicMeaning =
+      'widgets.dreams.interpretations.money.basic_meaning';
+  static const widgetsDreamsInterpretationsMoneyBasicMeaningLabel =
+      'widgets.dreams.interpretations.money.basic_meaning_label';
+  static const widgetsDreamsInterpretationsMoneyCosmicMessage =
+      'widgets.dreams.interpretations.money.cosmic_message';
+  static const widgetsDreamsInterpretationsMoneyCosmicMessageLabel =
+      'widgets.dreams.interpretations.money.cosmic_message_label';
+  static const widgetsDreamsInterpretationsMoneyDreamTypes =
+      'widgets.dreams.interpretations.money.dream_types';
+  static const widgetsDreamsInterpretationsMoneyDreamTypesLabel =
+      'widgets.dreams.interpretations.money.dream_types_label';
+  static const widgetsDreamsInterpretationsMoneyPractice =
+      'widgets.dreams.interpretations.money.practice';
+  static const widgetsDreamsInterpretationsMoneyPracticeLabel =
+      'widgets.dreams.interpretations.money.practice_label';
+  static const widgetsDreamsInterpretationsMoneyPsychological =
+      'widgets.dreams.interpretations.money.psychological';
+  static const widgetsDreamsInterpretationsMoneyPsychologicalLabel =
+      'widgets.dreams.interpretations.money.psychological_label';
+  static const widgetsDreamsInterpretationsMoneySpecialInterpretation =
+      'widgets.dreams.interpretations.money.special_interpretation';
+  static const widgetsDreamsInterpretationsMoneySymbols =
+      'widgets.dreams.interpretations.money.symbols';
+  static const widgetsDreamsInterpretationsMoneySymbolsLabel =
+      'widgets.dreams.interpretations.money.symbols_label';
+  static const widgetsDreamsInterpretationsMoneyTitle =
+      'widgets.dreams.interpretations.money.title';
+  static const widgetsDreamsInterpretationsPersonalAdviceAchiever =
+      'widgets.dreams.interpretations.personal_advice.achiever';
+  static const widgetsDreamsInterpretationsPersonalAdviceAnalyst =
+      'widgets.dreams.interpretations.personal_advice.analyst';
+  static const widgetsDreamsInterpretationsPersonalAdviceBuilder =
+      'widgets.dreams.interpretations.personal_advice.builder';
+  static const widgetsDreamsInterpretationsPersonalAdviceCommunicator =
+      'widgets.dreams.interpretations.personal_advice.communicator';
+  static const widgetsDreamsInterpretationsPersonalAdviceDreamer =
+      'widgets.dreams.interpretations.personal_advice.dreamer';
+  static const widgetsDreamsInterpretationsPersonalAdviceExplorer =
+      'widgets.dreams.interpretations.personal_advice.explorer';
+  static const widgetsDreamsInterpretationsPersonalAdviceHarmonizer =
+      'widgets.dreams.interpretations.personal_advice.harmonizer';
+  static const widgetsDreamsInterpretationsPersonalAdviceNurturer =
+      'widgets.dreams.interpretations.personal_advice.nurturer';
+  static const widgetsDreamsInterpretationsPersonalAdvicePerformer =
+      'widgets.dreams.interpretations.personal_advice.performer';
+  static const widgetsDreamsInterpretationsPersonalAdvicePioneer =
+      'widgets.dreams.interpretations.personal_advice.pioneer';
+  static const widgetsDreamsInterpretationsPersonalAdviceTransformer =
+      'widgets.dreams.interpretations.personal_advice.transformer';
+  static const widgetsDreamsInterpretationsPersonalAdviceVisionary =
+      'widgets.dreams.interpretations.personal_advice.visionary';
+  static const widgetsDreamsInterpretationsSignPerspective =
+      'widgets.dreams.interpretations.sign_perspective';
+  static const widgetsDreamsInterpretationsWaterBasicMeaningLabel =
+      'widgets.dreams.interpretations.water.basic_meaning_label';
+  static const widgetsDreamsInterpretationsWaterBuilderBasicMeaning =
+      'widgets.dreams.interpretations.water.builder.basic_meaning';
+  static const widgetsDreamsInterpretationsWaterBuilderElementPerspective =
+      'widgets.dreams.interpretations.water.builder.element_perspective';
+  static const widgetsDreamsInterpretationsWaterBuilderPractice =
+      'widgets.dreams.interpretations.water.builder.practice';
+  static const widgetsDreamsInterpretationsWaterBuilderPsychological =
+      'widgets.dreams.interpretations.water.builder.psychological';
+  static const widgetsDreamsInterpretationsWaterDefaultBasicMeaning =
+      'widgets.dreams.interpretations.water.default.basic_meaning';
+  static const widgetsDreamsInterpretationsWaterDefaultElementPerspective =
+      'widgets.dreams.interpretations.water.default.element_perspective';
+  static const widgetsDreamsInterpretationsWaterDefaultPractice =
+      'widgets.dreams.interpretations.water.default.practice';
+  static const widgetsDreamsInterpretationsWaterDivider =
+      'widgets.dreams.interpretations.water.divider';
+  static const widgetsDreamsInterpretationsWaterDreamerBasicMeaning =
+      'widgets.dreams.interpretations.water.dreamer.basic_meaning';
+  static const widgetsDreamsInterpretationsWaterDreamerElementPerspective =
+      'widgets.dreams.interpretations.water.dreamer.element_perspective';
+  static const widgetsDreamsInterpretationsWaterDreamerPractice =
+      'widgets.dreams.interpretations.water.dreamer.practice';
+  static const widgetsDreamsInterpretationsWaterDreamerPsychological =
+      'widgets.dreams.interpretations.water.dreamer.psychological';
+  static const widgetsDreamsInterpretationsWaterElementPerspectiveLabel =
+      'widgets.dreams.interpretations.water.element_perspective_label';
+  static const widgetsDreamsInterpretationsWaterNurturerBasicMeaning =
+      'widgets.dreams.interpretations.water.nurturer.basic_meaning';
+  static const widgetsDreamsInterpretationsWaterNurturerElementPerspective =
+      'widgets.dreams.interpretations.water.nurturer.element_perspective';
+  static const widgetsDreamsInterpretationsWaterNurturerPractice =
+      'widgets.dreams.interpretations.water.nurturer.practice';
+  static const widgetsDreamsInterpretationsWaterNurturerPsychological =
+      'widgets.dreams.interpretations.water.nurturer.psychological';
+  static const widgetsDreamsInterpretationsWaterPioneerBasicMeaning =
+      'widgets.dreams.interpretations.water.pioneer.basic_meaning';
+  static const widgetsDreamsInterpretationsWaterPioneerElementPerspective =
+      'widgets.dreams.interpretations.water.pioneer.element_perspective';
+  static const widgetsDreamsInterpretationsWaterPioneerPractice =
+      'widgets.dreams.interpretations.water.pioneer.practice';
+  static const widgetsDreamsInterpretationsWaterPioneerPsychological =
+      'widgets.dreams.interpretations.water.pioneer.psychological';
+  static const widgetsDreamsInterpretationsWaterPracticeLabel =
+      'widgets.dreams.interpretations.water.practice_label';
+  static const widgetsDreamsInterpretationsWaterPsychologicalLabel =
+      'widgets.dreams.interpretations.water.psychological_label';
+  static const widgetsDreamsInterpretationsWaterTitle =
+      'widgets.dreams.interpretations.water.title';
+  static const widgetsDreamsInterpretationsWaterTransformerBasicMeaning =
+      'widgets.dreams.interpretations.water.transformer.basic_meaning';
+  static const widgetsDreamsInterpretationsWaterTransformerElementPerspective =
+      'widgets.dreams.interpretations.water.transformer.element_perspective';
+  static const widgetsDreamsInterpretationsWaterTransformerPractice =
+      'widgets.dreams.interpretations.water.transformer.practice';
+  static const widgetsDreamsInterpretationsWaterTransformerPsychological =
+      'widgets.dreams.interpretations.water.transformer.psychological';
+  static const widgetsDreamsPromptsActingForgot =
+      'widgets.dreams.prompts.acting_forgot';
+  static const widgetsDreamsPromptsAngelLight =
+      'widgets.dreams.prompts.angel_light';
+  static const widgetsDreamsPromptsBalloonFloating =
+      'widgets.dreams.prompts.balloon_floating';
+  static const widgetsDreamsPromptsBodyFrozen =
+      'widgets.dreams.prompts.body_frozen';
+  static const widgetsDreamsPromptsButterflyTransform =
+      'widgets.dreams.prompts.butterfly_transform';
+  static const widgetsDreamsPromptsCarBrakesFail =
+      'widgets.dreams.prompts.car_brakes_fail';
+  static const widgetsDreamsPromptsChildhoodHome =
+      'widgets.dreams.prompts.childhood_home';
+  static const widgetsDreamsPromptsCorridorDoors =
+      'widgets.dreams.prompts.corridor_doors';
+  static const widgetsDreamsPromptsDarknessEscape =
+      'widgets.dreams.prompts.darkness_escape';
+  static const widgetsDreamsPromptsDeathRebirth =
+      'widgets.dreams.prompts.death_rebirth';
+  static const widgetsDreamsPromptsDeathWatching =
+      'widgets.dreams.prompts.death_watching';
+  static const widgetsDreamsPromptsDeceasedRelative =
+      'widgets.dreams.prompts.deceased_relative';
+  static const widgetsDreamsPromptsEagleRiding =
+      'widgets.dreams.prompts.eagle_riding';
+  static const widgetsDreamsPromptsElevatorWrong =
+      'widgets.dreams.prompts.elevator_wrong';
+  static const widgetsDreamsPromptsEndlessRoad =
+      'widgets.dreams.prompts.endless_road';
+  static const widgetsDreamsPromptsExStranger =
+      'widgets.dreams.prompts.ex_stranger';
+  static const widgetsDreamsPromptsExamUnprepared =
+      'widgets.dreams.prompts.exam_unprepared';
+  static const widgetsDreamsPromptsFallingHigh =
+      'widgets.dreams.prompts.falling_high';
+  static const widgetsDreamsPromptsFireImmune =
+      'widgets.dreams.prompts.fire_immune';
+  static const widgetsDreamsPromptsFlyingFree =
+      'widgets.dreams.prompts.flying_free';
+  static const widgetsDreamsPromptsFuneralCrying =
+      'widgets.dreams.prompts.funeral_crying';
+  static const widgetsDreamsPromptsGhostInvisible =
+      'widgets.dreams.prompts.ghost_invisible';
+  static const widgetsDreamsPromptsGoldUncollectable =
+      'widgets.dreams.prompts.gold_uncollectable';
+  static const widgetsDreamsPromptsHairChange =
+      'widgets.dreams.prompts.hair_change';
+  static const widgetsDreamsPromptsIceWalking =
+      'widgets.dreams.prompts.ice_walking';
+  static const widgetsDreamsPromptsLakeDiving =
+      'widgets.dreams.prompts.lake_diving';
+  static const widgetsDreamsPromptsLightningPower =
+      'widgets.dreams.prompts.lightning_power';
+  static const widgetsDreamsPromptsLotteryLost =
+      'widgets.dreams.prompts.lottery_lost';
+  static const widgetsDreamsPromptsMirrorOther =
+      'widgets.dreams.prompts.mirror_other';
+  static const widgetsDreamsPromptsMoonMessage =
+      'widgets.dreams.prompts.moon_message';
+  static const widgetsDreamsPromptsPalaceLost =
+      'widgets.dreams.prompts.palace_lost';
+  static const widgetsDreamsPromptsParachuteFail =
+      'widgets.dreams.prompts.parachute_fail';
+  static const widgetsDreamsPromptsPlaneCalm =
+      'widgets.dreams.prompts.plane_calm';
+  static const widgetsDreamsPromptsPortalWorld =
+      'widgets.dreams.prompts.portal_world';
+  static const widgetsDreamsPromptsRaceStuck =
+      'widgets.dreams.prompts.race_stuck';
+  static const widgetsDreamsPromptsRainRunning =
+      'widgets.dreams.prompts.rain_running';
+  static const widgetsDreamsPromptsRunningStuck =
+      'widgets.dreams.prompts.running_stuck';
+  static const widgetsDreamsPromptsSecretRooms =
+      'widgets.dreams.prompts.secret_rooms';
+  static const widgetsDreamsPromptsSeeingFuture =
+      'widgets.dreams.prompts.seeing_future';
+  static const widgetsDreamsPromptsShadowFollower =
+      'widgets.dreams.prompts.shadow_follower';
+  static const widgetsDreamsPromptsSnakeApproaching =
+      'widgets.dreams.prompts.snake_approaching';
+  static const widgetsDreamsPromptsStageVoiceless =
+      'widgets.dreams.prompts.stage_voiceless';
+  static const widgetsDreamsPromptsStarsRising =
+      'widgets.dreams.prompts.stars_rising';
+  static const widgetsDreamsPromptsTalkingCat =
+      'widgets.dreams.prompts.talking_cat';
+  static const widgetsDreamsPromptsTeethFalling =
+      'widgets.dreams.prompts.teeth_falling';
+  static const widgetsDreamsPromptsTornadoCalm =
+      'widgets.dreams.prompts.tornado_calm';
+  static const widgetsDreamsPromptsTrainMissed =
+      'widgets.dreams.prompts.train_missed';
+  static const widgetsDreamsPromptsTreasureChest =
+      'widgets.dreams.prompts.treasure_chest';
+  static const widgetsDreamsPromptsUnknownBaby =
+      'widgets.dreams.prompts.unknown_baby';
+  static const widgetsDreamsPromptsWatchingSelf =
+      'widgets.dreams.prompts.watching_self';
+  static const widgetsDreamsPromptsWaterBreathing =
+      'widgets.dreams.prompts.water_breathing';
+  static const widgetsDreamsPromptsWaterfallPassage =
+      'widgets.dreams.prompts.waterfall_passage';
+  static const widgetsDreamsPromptsWeddingBlur =
+      'widgets.dreams.prompts.wedding_blur';
+  static const widgetsDreamsPromptsWolfPack =
+      'widgets.dreams.prompts.wolf_pack';
+  static const widgetsDreamsQuestionLabel = 'widgets.dreams.question_label';
+  static const widgetsDreamsQuickAnswersAddDetail =
+      'widgets.dreams.quick_answers.add_detail';
+  static const widgetsDreamsQuickAnswersAlarmInterrupted =
+      'widgets.dreams.quick_answers.alarm_interrupted';
+  static const widgetsDreamsQuickAnswersAngerFrustration =
+      'widgets.dreams.quick_answers.anger_frustration';
+  static const widgetsDreamsQuickAnswersBluePeaceful =
+      'widgets.dreams.quick_answers.blue_peaceful';
+  static const widgetsDreamsQuickAnswersBrightWhite =
+      'widgets.dreams.quick_answers.bright_white';
+  static const widgetsDreamsQuickAnswersCantRemember =
+      'widgets.dreams.quick_answers.cant_remember';
+  static const widgetsDreamsQuickAnswersCirclingAround =
+      'widgets.dreams.quick_answers.circling_around';
+  static const widgetsDreamsQuickAnswersColorfulVibrant =
+      'widgets.dreams.quick_answers.colorful_vibrant';
+  static const widgetsDreamsQuickAnswersCompletelyAlone =
+      'widgets.dreams.quick_answers.completely_alone';
+  static const widgetsDreamsQuickAnswersCuriositySurprise =
+      'widgets.dreams.quick_answers.curiosity_surprise';
+  static const widgetsDreamsQuickAnswersDarkBlack =
+      'widgets.dreams.quick_answers.dark_black';
+  static const widgetsDreamsQuickAnswersDarkUncertain =
+      'widgets.dreams.quick_answers.dark_uncertain';
+  static const widgetsDreamsQuickAnswersDontRemember =
+      'widgets.dreams.quick_answers.dont_remember';
+  static const widgetsDreamsQuickAnswersDreamEnded =
+      'widgets.dreams.quick_answers.dream_ended';
+  static const widgetsDreamsQuickAnswersDreamShifted =
+      'widgets.dreams.quick_answers.dream_shifted';
+  static const widgetsDreamsQuickAnswersFacelessPerson =
+      'widgets.dreams.quick_answers.faceless_person';
+  static const widgetsDreamsQuickAnswersFamilyMember =
+      'widgets.dreams.quick_answers.family_member';
+  static const widgetsDreamsQuickAnswersFearAnxiety =
+      'widgets.dreams.quick_answers.fear_anxiety';
+  static const widgetsDreamsQuickAnswersFoggyBlurry =
+      'widgets.dreams.quick_answers.foggy_blurry';
+  static const widgetsDreamsQuickAnswersFriendsPresent =
+      'widgets.dreams.quick_answers.friends_present';
+  static const widgetsDreamsQuickAnswersHappinessJoy =
+      'widgets.dreams.quick_answers.happiness_joy';
+  static const widgetsDreamsQuickAnswersHomeFamiliar =
+      'widgets.dreams.quick_answers.home_familiar';
+  static const widgetsDreamsQuickAnswersInnerVoice =
+      'widgets.dreams.quick_answers.inner_voice';
+  static const widgetsDreamsQuickAnswersInterpretNow =
+      'widgets.dreams.quick_answers.interpret_now';
+  static const widgetsDreamsQuickAnswersJustStanding =
+      'widgets.dreams.quick_answers.just_standing';
+  static const widgetsDreamsQuickAnswersMountainHigh =
+      'widgets.dreams.quick_answers.mountain_high';
+  static const widgetsDreamsQuickAnswersMovingFast =
+      'widgets.dreams.quick_answers.moving_fast';
+  static const widgetsDreamsQuickAnswersMusicMelodies =
+      'widgets.dreams.quick_answers.music_melodies';
+  static const widgetsDreamsQuickAnswersNatureForest =
+      'widgets.dreams.quick_answers.nature_forest';
+  static const widgetsDreamsQuickAnswersNoLeaving =
+      'widgets.dreams.quick_answers.no_leaving';
+  static const widgetsDreamsQuickAnswersNotSure =
+      'widgets.dreams.quick_answers.not_sure';
+  static const widgetsDreamsQuickAnswersPartnerSpouse =
+      'widgets.dreams.quick_answers.partner_spouse';
+  static const widgetsDreamsQuickAnswersPeaceTrust =
+      'widgets.dreams.quick_answers.peace_trust';
+  static const widgetsDreamsQuickAnswersRedWarm =
+      'widgets.dreams.quick_answers.red_warm';
+  static const widgetsDreamsQuickAnswersSadnessMelancholy =
+      'widgets.dreams.quick_answers.sadness_melancholy';
+  static const widgetsDreamsQuickAnswersScarySounds =
+      'widgets.dreams.quick_answers.scary_sounds';
+  static const widgetsDreamsQuickAnswersSilencePresent =
+      'widgets.dreams.quick_answers.silence_present';
+  static const widgetsDreamsQuickAnswersStrangeUnknown =
+      'widgets.dreams.quick_answers.strange_unknown';
+  static const widgetsDreamsQuickAnswersStrangersPresent =
+      'widgets.dreams.quick_answers.strangers_present';
+  static const widgetsDreamsQuickAnswersVoicesTalking =
+      'widgets.dreams.quick_answers.voices_talking';
+  static const widgetsDreamsQuickAnswersWantedContinue =
+      'widgets.dreams.quick_answers.wanted_continue';
+  static const widgetsDreamsQuickAnswersWaterSeaside =
+      'widgets.dreams.quick_answers.water_seaside';
+  static const widgetsDreamsQuickAnswersWokePeaceful =
+      'widgets.dreams.quick_answers.woke_peaceful';
+  static const widgetsDreamsQuickAnswersWokeScared =
+      'widgets.dreams.quick_answers.woke_scared';
+  static const widgetsDreamsQuickAnswersYesApproaching =
+      'widgets.dreams.quick_answers.yes_approaching';
+  static const widgetsDreamsShareAnother = 'widgets.dreams.share_another';
+  static const widgetsDreamsSymbolsCatMeaning =
+      'widgets.dreams.symbols.cat_meaning';
+  static const widgetsDreamsSymbolsCatName = 'widgets.dreams.symbols.cat_name';
+  static const widgetsDreamsSymbolsDeathMeaning =
+      'widgets.dreams.symbols.death_meaning';
+  static const widgetsDreamsSymbolsDeathName =
+      'widgets.dreams.symbols.death_name';
+  static const widgetsDreamsSymbolsDogMeaning =
+      'widgets.dreams.symbols.dog_meaning';
+  static const widgetsDreamsSymbolsDogName = 'widgets.dreams.symbols.dog_name';
+  static const widgetsDreamsSymbolsFireMeaning =
+      'widgets.dreams.symbols.fire_meaning';
+  static const widgetsDreamsSymbolsFireName =
+      'widgets.dreams.symbols.fire_name';
+  static const widgetsDreamsSymbolsFlyingMeaning =
+      'widgets.dreams.symbols.flying_meaning';
+  static const widgetsDreamsSymbolsFlyingName =
+      'widgets.dreams.symbols.flying_name';
+  static const widgetsDreamsSymbolsHouseMeaning =
+      'widgets.dreams.symbols.house_meaning';
+  static const widgetsDreamsSymbolsHouseName =
+      'widgets.dreams.symbols.house_name';
+  static const widgetsDreamsSymbolsLoveMeaning =
+      'widgets.dreams.symbols.love_meaning';
+  static const widgetsDreamsSymbolsLoveName =
+      'widgets.dreams.symbols.love_name';
+  static const widgetsDreamsSymbolsMoneyMeaning =
+      'widgets.dreams.symbols.money_meaning';
+  static const widgetsDreamsSymbolsMoneyName =
+      'widgets.dreams.symbols.money_name';
+  static const widgetsDreamsSymbolsMoonMeaning =
+      'widgets.dreams.symbols.moon_meaning';
+  static const widgetsDreamsSymbolsMoonName =
+      'widgets.dreams.symbols.moon_name';
+  static const widgetsDreamsSymbolsSnakeMeaning =
+      'widgets.dreams.symbols.snake_meaning';
+  static const widgetsDreamsSymbolsSnakeName =
+      'widgets.dreams.symbols.snake_name';
+  static const widgetsDreamsSymbolsSunMeaning =
+      'widgets.dreams.symbols.sun_meaning';
+  static const widgetsDreamsSymbolsSunName = 'widgets.dreams.symbols.sun_name';
+  static const widgetsDreamsSymbolsWaterMeaning =
+      'widgets.dreams.symbols.water_meaning';
+  static const widgetsDreamsSymbolsWaterName =
+      'widgets.dreams.symbols.water_name';
+  static const widgetsDreamsSymbolsGuideTitle =
+      'widgets.dreams.symbols_guide_title';
+  static const widgetsDreamsSymbolsTooltip = 'widgets.dreams.symbols_tooltip';
+  static const widgetsDreamsTapOrWriteHint = 'widgets.dreams.tap_or_write_hint';
+  static const widgetsDreamsWelcomeMessage = 'widgets.dreams.welcome_message';
+  static const widgetsEnergyBarCareer = 'widgets.energy_bar.career';
+  static const widgetsEnergyBarDailyEnergy = 'widgets.energy_bar.daily_energy';
+  static const widgetsEnergyBarHealth = 'widgets.energy_bar.health';
+  static const widgetsEnergyBarLevelGood = 'widgets.energy_bar.level_good';
+  static const widgetsEnergyBarLevelHigh = 'widgets.energy_bar.level_high';
+  static const widgetsEnergyBarLevelLow = 'widgets.energy_bar.level_low';
+  static const widgetsEnergyBarLevelMedium = 'widgets.energy_bar.level_medium';
+  static const widgetsEnergyBarLove = 'widgets.energy_bar.love';
+  static const widgetsLockedLayerPreviewMoreContent =
+      'widgets.locked_layer_preview.more_content';
+  static const widgetsLockedLayerPreviewProBadge =
+      'widgets.locked_layer_preview.pro_badge';
+  static const widgetsLockedLayerPreviewUnlockDefault =
+      'widgets.locked_layer_preview.unlock_default';
+  static const widgetsMoodSelectorFeelingTemplate =
+      'widgets.mood_selector.feeling_template';
+  static const widgetsMoodSelectorHowDoYouFeel =
+      'widgets.mood_selector.how_do_you_feel';
+  static const widgetsMoodSelectorMoodPersonalizes =
+      'widgets.mood_selector.mood_personalizes';
+  static const widgetsMoodSelectorMoodsAnxious =
+      'widgets.mood_selector.moods.anxious';
+  static const widgetsMoodSelectorMoodsCalm =
+      'widgets.mood_selector.moods.calm';
+  static const widgetsMoodSelectorMoodsConfused =
+      'widgets.mood_selector.moods.confused';
+  static const widgetsMoodSelectorMoodsExcited =
+      'widgets.mood_selector.moods.excited';
+  static const widgetsMoodSelectorMoodsHappy =
+      'widgets.mood_selector.moods.happy';
+  static const widgetsMoodSelectorMoodsSad = 'widgets.mood_selector.moods.sad';
+  static const widgetsMoodSelectorMoodsThoughtful =
+      'widgets.mood_selector.moods.thoughtful';
+  static const widgetsMoodSelectorMoodsTired =
+      'widgets.mood_selector.moods.tired';
+  static const widgetsMoodSelectorSkip = 'widgets.mood_selector.skip';
+  static const yearReviewEntriesThisYear = 'year_review.entries_this_year';
+  static const yearReviewMyYearSummary = 'year_review.my_year_summary';
+  static const yearReviewWrapped5MoreCardsWithDeeperInsightsAwait =
+      'year_review.wrapped.5_more_cards_with_deeper_insights_await';
+  static const yearReviewWrappedBreakthroughMoments =
+      'year_review.wrapped.breakthrough_moments';
+  static const yearReviewWrappedBreakthroughs =
+      'year_review.wrapped.breakthroughs';
+  static const yearReviewWrappedClose = 'year_review.wrapped.close';
+  static const yearReviewWrappedConsistentlyHighMoodAverage =
+      'year_review.wrapped.consistently_high_mood_average';
+  static const yearReviewWrappedDays = 'year_review.wrapped.days';
+  static const yearReviewWrappedEntries = 'year_review.wrapped.entries';
+  static const yearReviewWrappedEveryEntryYouWroteBroughtYouCloser =
+      'year_review.wrapped.every_entry_you_wrote_brought_you_closer';
+  static const yearReviewWrappedEveryJourneyHasItsRhythm =
+      'year_review.wrapped.every_journey_has_its_rhythm';
+  static const yearReviewWrappedExploredMultipleFocusAreas =
+      'year_review.wrapped.explored_multiple_focus_areas';
+  static const yearReviewWrappedFocusAreaMap =
+      'year_review.wrapped.focus_area_map';
+  static const yearReviewWrappedGrowthScore =
+      'year_review.wrapped.growth_score';
+  static const yearReviewWrappedJournaledEverySingleDay =
+      'year_review.wrapped.journaled_every_single_day';
+  static const yearReviewWrappedKeepJournalingToDiscoverPatterns =
+      'year_review.wrapped.keep_journaling_to_discover_patterns';
+  static const yearReviewWrappedKeepJournalingToUnlockYourWrapped =
+      'year_review.wrapped.keep_journaling_to_unlock_your_wrapped';
+  static const yearReviewWrappedKeepJournalingYourStoryIsBuilding =
+      'year_review.wrapped.keep_journaling_your_story_is_building';
+  static const yearReviewWrappedMomentsWhereYourMoodLiftedAndAPos =
+      'year_review.wrapped.moments_where_your_mood_lifted_and_a_pos';
+  static const yearReviewWrappedMostIntenseWeek =
+      'year_review.wrapped.most_intense_week';
+  static const yearReviewWrappedNotEnoughEntriesForYourWrappedYet =
+      'year_review.wrapped.not_enough_entries_for_your_wrapped_yet';
+  static const yearReviewWrappedRemarkableGrowthThisYear =
+      'year_review.wrapped.remarkable_growth_this_year';
+  static const yearReviewWrappedSeeYouNextYear =
+      'year_review.wrapped.see_you_next_year';
+  static const yearReviewWrappedShareYourWrapped =
+      'year_review.wrapped.share_your_wrapped';
+  static const yearReviewWrappedSteadyAndConsistentProgress =
+      'year_review.wrapped.steady_and_consistent_progress';
+  static const yearReviewWrappedSwipeToExplore =
+      'year_review.wrapped.swipe_to_explore';
+  static const yearReviewWrappedThisWeekHadTheWidestRangeOfEmotio =
+      'year_review.wrapped.this_week_had_the_widest_range_of_emotio';
+  static const yearReviewWrappedThroughoutTheYear =
+      'year_review.wrapped.throughout_the_year';
+  static const yearReviewWrappedUnlockYourFullWrapped =
+      'year_review.wrapped.unlock_your_full_wrapped';
+  static const yearReviewWrappedWriteAnEntry =
+      'year_review.wrapped.write_an_entry';
+  static const yearReviewWrappedYourEmotionalArc =
+      'year_review.wrapped.your_emotional_arc';
+  static const yearReviewWrappedYourTopPatterns =
+      'year_review.wrapped.your_top_patterns';
+  static const yearReviewWrappedYourYearInPatterns =
+      'year_review.wrapped.your_year_in_patterns';
+  static const yearReviewYearReviewAvgMood = 'year_review.year_review.avg_mood';
+  static const yearReviewYearReviewBasedOnYourMoodImprovementTrend =
+      'year_review.year_review.based_on_your_mood_improvement_trend';
+  static const yearReviewYearReviewBestStreak =
+      'year_review.year_review.best_streak';
+  static const yearReviewYearReviewCouldNotLoadYourLocalDataIsUnaffe =
+      'year_review.year_review.could_not_load_your_local_data_is_unaffe';
+  static const yearReviewYearReviewCouldNotLoadYourLocalDataIsUnaffe1 =
+      'year_review.year_review.could_not_load_your_local_data_is_unaffe_1';
+  static const yearReviewYearReviewDays = 'year_review.year_review.days';
+  static const yearReviewYearReviewEntries = 'year_review.year_review.entries';
+  static const yearReviewYearReviewFocusAreas =
+      'year_review.year_review.focus_areas';
+  static const yearReviewYearReviewGrowthScore =
+      'year_review.year_review.growth_score';
+  static const yearReviewYearReviewHighlights =
+      'year_review.year_review.highlights';
+  static const yearReviewYearReviewKeepRecordingToActivateYourAnnualS =
+      'year_review.year_review.keep_recording_to_activate_your_annual_s';
+  static const yearReviewYearReviewMonthlyAverageMood15 =
+      'year_review.year_review.monthly_average_mood_15';
+  static const yearReviewYearReviewMoodTrajectory =
+      'year_review.year_review.mood_trajectory';
+  static const yearReviewYearReviewNotEnoughEntriesForThisYear =
+      'year_review.year_review.not_enough_entries_for_this_year';
+  static const yearReviewYearReviewRetry = 'year_review.year_review.retry';
+  static const yearReviewYearReviewRetry1 = 'year_review.year_review.retry_1';
+  static const yearReviewYearReviewRoomToGrow =
+      'year_review.year_review.room_to_grow';
+  static const yearReviewYearReviewShareSummary =
+      'year_review.year_review.share_summary';
+  static const yearReviewYearReviewStartJournaling =
+      'year_review.year_review.start_journaling';
+  static const yearReviewYearReviewSteadyProgress =
+      'year_review.year_review.steady_progress';
+  static const yearReviewYearReviewStrongGrowth =
+      'year_review.year_review.strong_growth';
+  static const yearReviewYearReviewTimeSpentPerArea =
+      'year_review.year_review.time_spent_per_area';
+  static const yearReviewYearReviewYearSynthesis =
+      'year_review.year_review.year_synthesis';
+  static const yearReviewYearReviewYouJournaledEverySingleDay =
+      'year_review.year_review.you_journaled_every_single_day';
+  static const yearReviewYearReviewYouNeedAtLeast7JournalEntriesToG =
+      'year_review.year_review.you_need_at_least_7_journal_entries_to_g';
+  static const yearReviewYearReviewYourYearSynthesisIsReady =
+      'year_review.year_review.your_year_synthesis_is_ready';
+}
@@ -5,6 +5,8 @@ import 'package:flutter/services.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../providers/app_providers.dart';
 
+export 'l10n_keys.g.dart';
+
 /// Provider for L10n wrapper with current language
 /// Usage: final l10n = ref.watch(l10nServiceProvider);
 ///        final text = l10n.get('key');
@@ -51,6 +53,12 @@ class L10nService {
   L10nService._();
 
   static final Map<AppLanguage, Map<String, dynamic>> _translations = {};
+
+  /// Every value of a loaded language, objects included, by full dotted key
+  static final Map<AppLanguage, Map<String, dynamic>> _lookup = {};
+
+  /// Feature shards loaded so far, for languages without the full catalog
+  static final Map<AppLanguage, Set<String>> _shards = {};
   static final Set<String> _missingKeys = {};
   static bool _initialized = false;
   static AppLanguage? _currentLanguage;
@@ -81,7 +89,7 @@ class L10nService {
     }
 
     // Already loaded this language
-    if (_translations.containsKey(language)) {
+    if (_isComplete(language)) {
       _currentLanguage = language;
       _initialized = true;
       return;
@@ -94,6 +102,8 @@ class L10nService {
       final decoded = json.decode(jsonString);
       if (decoded is Map<String, dynamic>) {
         _translations[language] = decoded;
+        _lookup[language] = _buildLookup(decoded);
+        _shards.remove(language);
         _currentLanguage = language;
         _initialized = true;
 
@@ -109,6 +119,52 @@ class L10nService {
     }
   }
 
+  /// Load only some feature shards of a language, e.g. `journal` for the
+  /// `journal.*` keys (listed in assets/l10n/shards/manifest.json)
+  ///
+  /// Decodes a few KB instead of the whole catalog when a screen needs
+  /// only its own features. Other keys stay missing until [init] loads
+  /// the full catalog; a language that is fully loaded is left as is.
+  ///
+  /// The shards are not committed or bundled yet: the first caller should
+  /// generate them with scripts/gen_l10n_shards.py as a build step and
+  /// list assets/l10n/shards/<lang>/ in pubspec.yaml.
+  static Future<void> loadShards(
+    AppLanguage language,
+    Iterable<String> features,
+  ) async {
+    if (!supportedLanguages.contains(language)) {
+      throw UnsupportedLanguageException(language);
+    }
+    if (_isComplete(language)) return;
+
+    final loaded = _shards.putIfAbsent(language, () => {});
+    final translations = _translations.putIfAbsent(language, () => {});
+    final lookup = _lookup.putIfAbsent(language, () => {});
+    for (final feature in features) {
+      if (loaded.contains(feature)) continue;
+      try {
+        final jsonString = await rootBundle.loadString(
+          'assets/l10n/shards/${language.name}/$feature.json',
+        );
+        final decoded = json.decode(jsonString);
+        if (decoded is! Map<String, dynamic>) {
+          throw LocaleLoadException(language, 'Invalid JSON structure');
+        }
+        translations.addAll(decoded);
+        lookup.addAll(_buildLookup(decoded));
+        loaded.add(feature);
+      } catch (e) {
+        if (e is LocaleLoadException) rethrow;
+        throw LocaleLoadException(language, e);
+      }
+    }
+  }
+
+  /// Whether the full catalog of a language is loaded, not just shards
+  static bool _isComplete(AppLanguage language) =>
+      _translations.containsKey(language) && !_shards.containsKey(language);
+
   /// Preload all supported languages (optional optimization)
   static Future<void> preloadAll() async {
     for (final lang in supportedLanguages) {
@@ -137,7 +193,7 @@ class L10nService {
       return '[$key]';
     }
 
-    final value = _resolveKey(key, _translations[language]!);
+    final value = _resolveKey(key, language);
 
     if (value == null) {
       _logMissingKeyForAIRepair(key, language, 'KEY_NOT_FOUND');
@@ -174,7 +230,7 @@ class L10nService {
       return [];
     }
 
-    final value = _resolveKeyRaw(key, _translations[language]!);
+    final value = _resolveKeyRaw(key, language);
 
     if (value is List) {
       return value.map((e) => e.toString()).toList();
@@ -192,7 +248,7 @@ class L10nService {
       return {};
     }
 
-    final value = _resolveKeyRaw(key, _translations[language]!);
+    final value = _resolveKeyRaw(key, language);
 
     if (value is Map) {
       return value.map((k, v) => MapEntry(k.toString(), v.toString()));
@@ -213,7 +269,7 @@ class L10nService {
       return [];
     }
 
-    final value = _resolveKeyRaw(key, _translations[language]!);
+    final value = _resolveKeyRaw(key, language);
 
     if (value is List) {
       return value.map((item) {
@@ -229,22 +285,33 @@ class L10nService {
   }
 
   /// Resolve nested keys like "screens.home.greeting_morning"
-  static String? _resolveKey(String key, Map<String, dynamic> translations) {
-    final value = _resolveKeyRaw(key, translations);
+  static String? _resolveKey(String key, AppLanguage language) {
+    final value = _resolveKeyRaw(key, language);
     return value is String ? value : null;
   }
 
   /// Resolve nested keys and return raw value (for lists, maps, etc.)
-  static dynamic _resolveKeyRaw(String key, Map<String, dynamic> translations) {
-    final parts = key.split('.');
-    dynamic current = translations;
+  /// One hash probe into the lookup built when the language was loaded
+  static dynamic _resolveKeyRaw(String key, AppLanguage language) {
+    return _lookup[language]?[key];
+  }
 
-    for (final part in parts) {
-      if (current is! Map<String, dynamic>) return null;
-      current = current[part];
+  /// Index every value of a decoded catalog by its full dotted key,
+  /// nested objects included so getMap() keeps working
+  static Map<String, dynamic> _buildLookup(Map<String, dynamic> translations) {
+    final lookup = <String, dynamic>{};
+
+    void visit(Map<String, dynamic> node, String prefix) {
+      for (final entry in node.entries) {
+        final key = prefix.isEmpty ? entry.key : '$prefix.${entry.key}';
+        final value = entry.value;
+        lookup[key] = value;
+        if (value is Map<String, dynamic>) visit(value, key);
+      }
     }
 
-    return current;
+    visit(translations, '');
+    return lookup;
   }
 
   /// Log missing key for AI auto-repair system
@@ -289,7 +356,7 @@ class L10nService {
   /// Check if a key exists for a language (for testing)
   static bool hasKey(String key, AppLanguage language) {
     if (!_translations.containsKey(language)) return false;
-    return _resolveKey(key, _translations[language]!) != null;
+    return _resolveKey(key, language) != null;
   }
 
   /// Check if a language is loaded
@@ -340,12 +407,16 @@ class L10nService {
   /// Reload a specific language (useful for hot reload during development)
   static Future<void> reload(AppLanguage language) async {
     _translations.remove(language);
+    _lookup.remove(language);
+    _shards.remove(language);
     await init(language);
   }
 
   /// Clear all loaded translations (for testing)
   static void clearAll() {
     _translations.clear();
+    _lookup.clear();
+    _shards.clear();
     _missingKeys.clear();
     _initialized = false;
     _currentLanguage = null;
@@ -254,18 +254,18 @@ class NotificationService {
     final language = _language;
     final message =
         personalizedMessage ??
-        (L10nService.get('data.services.notification.take_a_moment_to_reflect_on_your_day', language));
+        (L10nService.get(L10nKeys.dataServicesNotificationTakeAMomentToReflectOnYourDay, language));
 
     await _notifications.zonedSchedule(
       id: dailyReflectionId,
-      title: L10nService.get('data.services.notification._your_daily_reflection', language),
+      title: L10nService.get(L10nKeys.dataServicesNotificationYourDailyReflection, language),
       body: message,
       scheduledDate: _nextInstanceOfTime(hour, minute),
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'daily_reflection',
-          L10nService.get('data.services.notification.daily_reflection', language),
-          channelDescription: L10nService.get('data.services.notification.daily_journal_reflection_reminders', language),
+          L10nService.get(L10nKeys.dataServicesNotificationDailyReflection, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationDailyJournalReflectionReminders, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -333,22 +333,22 @@ class NotificationService {
             ? 'Great day? Capture what made it special before it fades.'
             : 'Güzel bir gün mü? Özel kılan şeyleri kaybetmeden kaydet.';
       } else {
-        body = L10nService.get('data.services.notification.how_was_your_day_take_a_moment_to_journa', language);
+        body = L10nService.get(L10nKeys.dataServicesNotificationHowWasYourDayTakeAMomentToJourna, language);
       }
     } catch (_) {
-      body = L10nService.get('data.services.notification.how_was_your_day_take_a_moment_to_journa', language);
+      body = L10nService.get(L10nKeys.dataServicesNotificationHowWasYourDayTakeAMomentToJourna, language);
     }
 
     await _notifications.zonedSchedule(
       id: eveningReflectionId,
-      title: L10nService.get('data.services.notification.evening_reflection', language),
+      title: L10nService.get(L10nKeys.dataServicesNotificationEveningReflection, language),
       body: body,
       scheduledDate: _nextInstanceOfTime(hour, minute),
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'evening_reflection',
-          L10nService.get('data.services.notification.evening_reflection_1', language),
-          channelDescription: L10nService.get('data.services.notification.evening_journal_reflection_reminders', language),
+          L10nService.get(L10nKeys.dataServicesNotificationEveningReflection1, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationEveningJournalReflectionReminders, language),
           importance: Importance.defaultImportance,
           priority: Priority.defaultPriority,
           icon: '@mipmap/ic_launcher',
@@ -396,14 +396,14 @@ class NotificationService {
 
     await _notifications.zonedSchedule(
       id: journalPromptId,
-      title: L10nService.get('data.services.notification.todays_journal_prompt', language),
+      title: L10nService.get(L10nKeys.dataServicesNotificationTodaysJournalPrompt, language),
       body: body,
       scheduledDate: _nextInstanceOfTime(hour, minute),
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'journal_prompt',
-          L10nService.get('data.services.notification.journal_prompts', language),
-          channelDescription: L10nService.get('data.services.notification.daily_journaling_prompt_to_inspire_your', language),
+          L10nService.get(L10nKeys.dataServicesNotificationJournalPrompts, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationDailyJournalingPromptToInspireYour, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -477,8 +477,8 @@ class NotificationService {
           ? 'A quick entry tonight starts your journaling streak'
           : 'Bu akşam kısa bir giriş, yazma serini başlatır';
     } else {
-      title = L10nService.getWithParams('data.services.notification.streak_at_risk_title', language, params: {'streak': '$currentStreak'});
-      body = L10nService.get('data.services.notification.a_quick_checkin_keeps_your_momentum_goin', language);
+      title = L10nService.getWithParams(L10nKeys.dataServicesNotificationStreakAtRiskTitle, language, params: {'streak': '$currentStreak'});
+      body = L10nService.get(L10nKeys.dataServicesNotificationAQuickCheckinKeepsYourMomentumGoin, language);
     }
 
     await _notifications.zonedSchedule(
@@ -489,8 +489,8 @@ class NotificationService {
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'streak_risk',
-          L10nService.get('data.services.notification.streak_reminders', language),
-          channelDescription: L10nService.get('data.services.notification.alerts_when_your_journaling_streak_is_ab', language),
+          L10nService.get(L10nKeys.dataServicesNotificationStreakReminders, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationAlertsWhenYourJournalingStreakIsAb, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -534,14 +534,14 @@ class NotificationService {
 
     await _notifications.zonedSchedule(
       id: streakRecoveryId,
-      title: L10nService.get('data.services.notification.every_streak_starts_at_day_1', language),
-      body: L10nService.getWithParams('data.services.notification.streak_recovery_body', language, params: {'streak': '$lostStreak'}),
+      title: L10nService.get(L10nKeys.dataServicesNotificationEveryStreakStartsAtDay1, language),
+      body: L10nService.getWithParams(L10nKeys.dataServicesNotificationStreakRecoveryBody, language, params: {'streak': '$lostStreak'}),
       scheduledDate: tomorrow,
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'streak_recovery',
-          L10nService.get('data.services.notification.streak_recovery', language),
-          channelDescription: L10nService.get('data.services.notification.encouragement_to_start_a_new_streak', language),
+          L10nService.get(L10nKeys.dataServicesNotificationStreakRecovery, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationEncouragementToStartANewStreak, language),
           importance: Importance.defaultImportance,
           priority: Priority.defaultPriority,
           icon: '@mipmap/ic_launcher',
@@ -580,13 +580,13 @@ class NotificationService {
     await _notifications.zonedSchedule(
       id: onThisDayId,
       title: L10nService.getWithParams(yearsAgo == 1 ? 'data.services.notification.on_this_day_title_singular' : 'data.services.notification.on_this_day_title_plural', language, params: {'years': '$yearsAgo'}),
-      body: L10nService.get('data.services.notification.see_what_you_wrote_on_this_day_your_past', language),
+      body: L10nService.get(L10nKeys.dataServicesNotificationSeeWhatYouWroteOnThisDayYourPast, language),
       scheduledDate: scheduledTime,
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'on_this_day',
-          L10nService.get('data.services.notification.on_this_day', language),
-          channelDescription: L10nService.get('data.services.notification.memories_from_past_journal_entries', language),
+          L10nService.get(L10nKeys.dataServicesNotificationOnThisDay, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationMemoriesFromPastJournalEntries, language),
           importance: Importance.defaultImportance,
           priority: Priority.defaultPriority,
           icon: '@mipmap/ic_launcher',
@@ -617,14 +617,14 @@ class NotificationService {
     String body;
 
     if (totalReferrals >= 10) {
-      title = L10nService.get('data.services.notification.u1f48e_lifetime_premium_unlocked', language);
-      body = L10nService.get('data.services.notification.10_friends_joined_youve_earned_lifetime', language);
+      title = L10nService.get(L10nKeys.dataServicesNotificationU1f48eLifetimePremiumUnlocked, language);
+      body = L10nService.get(L10nKeys.dataServicesNotification10FriendsJoinedYouveEarnedLifetime, language);
     } else if (totalReferrals >= 3) {
-      title = L10nService.get('data.services.notification.u2b50_1_month_free_premium', language);
-      body = L10nService.getWithParams('data.services.notification.referral_body_month', language, params: {'count': '$totalReferrals'});
+      title = L10nService.get(L10nKeys.dataServicesNotificationU2b501MonthFreePremium, language);
+      body = L10nService.getWithParams(L10nKeys.dataServicesNotificationReferralBodyMonth, language, params: {'count': '$totalReferrals'});
     } else {
-      title = L10nService.get('data.services.notification.u1f381_referral_reward_7_days_premium', language);
-      body = L10nService.get('data.services.notification.a_friend_joined_with_your_code_you_both', language);
+      title = L10nService.get(L10nKeys.dataServicesNotificationU1f381ReferralReward7DaysPremium, language);
+      body = L10nService.get(L10nKeys.dataServicesNotificationAFriendJoinedWithYourCodeYouBoth, language);
     }
 
     await _notifications.show(
@@ -634,8 +634,8 @@ class NotificationService {
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'referral_rewards',
-          L10nService.get('data.services.notification.referral_rewards', language),
-          channelDescription: L10nService.get('data.services.notification.notifications_when_friends_join_with_you', language),
+          L10nService.get(L10nKeys.dataServicesNotificationReferralRewards, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationNotificationsWhenFriendsJoinWithYou, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -659,14 +659,14 @@ class NotificationService {
     final language = _language;
     await _notifications.zonedSchedule(
       id: moonCycleId,
-      title: L10nService.get('data.services.notification.moon_cycle_awareness', language),
-      body: L10nService.get('data.services.notification.a_new_moon_phase_is_here_a_good_time_for', language),
+      title: L10nService.get(L10nKeys.dataServicesNotificationMoonCycleAwareness, language),
+      body: L10nService.get(L10nKeys.dataServicesNotificationANewMoonPhaseIsHereAGoodTimeFor, language),
       scheduledDate: _nextInstanceOfTime(20, 0),
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'moon_cycle',
-          L10nService.get('data.services.notification.moon_cycle_awareness_1', language),
-          channelDescription: L10nService.get('data.services.notification.moon_cycle_mindfulness_reminders', language),
+          L10nService.get(L10nKeys.dataServicesNotificationMoonCycleAwareness1, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationMoonCycleMindfulnessReminders, language),
           importance: Importance.defaultImportance,
           priority: Priority.defaultPriority,
           icon: '@mipmap/ic_launcher',
@@ -687,14 +687,14 @@ class NotificationService {
     final language = _language;
     await _notifications.show(
       id: newMoonId,
-      title: L10nService.get('data.services.notification._new_moon', language),
+      title: L10nService.get(L10nKeys.dataServicesNotificationNewMoon, language),
       body: message ??
-          (L10nService.get('data.services.notification.a_time_for_new_beginnings_and_setting_in', language)),
+          (L10nService.get(L10nKeys.dataServicesNotificationATimeForNewBeginningsAndSettingIn, language)),
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'moon_cycle',
-          L10nService.get('data.services.notification.moon_cycle_awareness_2', language),
-          channelDescription: L10nService.get('data.services.notification.moon_cycle_mindfulness_reminders_1', language),
+          L10nService.get(L10nKeys.dataServicesNotificationMoonCycleAwareness2, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationMoonCycleMindfulnessReminders1, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -716,14 +716,14 @@ class NotificationService {
     final language = _language;
     await _notifications.show(
       id: fullMoonId,
-      title: L10nService.get('data.services.notification._full_moon', language),
+      title: L10nService.get(L10nKeys.dataServicesNotificationFullMoon, language),
       body: message ??
-          (L10nService.get('data.services.notification.a_time_for_reflection_and_gratitude', language)),
+          (L10nService.get(L10nKeys.dataServicesNotificationATimeForReflectionAndGratitude, language)),
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'moon_cycle',
-          L10nService.get('data.services.notification.moon_cycle_awareness_3', language),
-          channelDescription: L10nService.get('data.services.notification.moon_cycle_mindfulness_reminders_2', language),
+          L10nService.get(L10nKeys.dataServicesNotificationMoonCycleAwareness3, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationMoonCycleMindfulnessReminders2, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -775,7 +775,7 @@ class NotificationService {
     _language = await _readLanguage();
     final language = _language;
 
-    final title = L10nService.get('data.services.notification.note_reminder', language);
+    final title = L10nService.get(L10nKeys.dataServicesNotificationNoteReminder, language);
     final body = message ?? noteTitle;
 
     final scheduledTz = tz.TZDateTime.from(scheduledAt, tz.local);
@@ -804,8 +804,8 @@ class NotificationService {
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'note_reminders',
-          L10nService.get('data.services.notification.note_reminders', language),
-          channelDescription: L10nService.get('data.services.notification.reminders_for_your_personal_notes', language),
+          L10nService.get(L10nKeys.dataServicesNotificationNoteReminders, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationRemindersForYourPersonalNotes, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -876,14 +876,14 @@ class NotificationService {
 
     await _notifications.zonedSchedule(
       id: notifId,
-      title: L10nService.getWithParams('data.services.notification.birthday_today_title', language, params: {'name': contact.name}),
-      body: L10nService.getWithParams('data.services.notification.birthday_today_body', language, params: {'name': contact.name}),
+      title: L10nService.getWithParams(L10nKeys.dataServicesNotificationBirthdayTodayTitle, language, params: {'name': contact.name}),
+      body: L10nService.getWithParams(L10nKeys.dataServicesNotificationBirthdayTodayBody, language, params: {'name': contact.name}),
       scheduledDate: scheduledTz,
       notificationDetails: NotificationDetails(
         android: AndroidNotificationDetails(
           'birthday_reminders',
-          L10nService.get('data.services.notification.birthday_reminders', language),
-          channelDescription: L10nService.get('data.services.notification.birthday_reminder_notifications', language),
+          L10nService.get(L10nKeys.dataServicesNotificationBirthdayReminders, language),
+          channelDescription: L10nService.get(L10nKeys.dataServicesNotificationBirthdayReminderNotifications, language),
           importance: Importance.high,
           priority: Priority.high,
           icon: '@mipmap/ic_launcher',
@@ -908,14 +908,14 @@ class NotificationService {
         final dayBeforeTz = tz.TZDateTime.from(dayBefore, tz.local);
         await _notifications.zonedSchedule(
           id: dayBeforeId,
-          title: L10nService.getWithParams('data.services.notification.birthday_tomorrow_title', language, params: {'name': contact.name}),
-          body: L10nService.getWithParams('data.services.notification.birthday_tomorrow_body', language, params: {'name': contact.name}),
+          title: L10nService.getWithParams(L10nKeys.dataServicesNotificationBirthdayTomorrowTitle, language, params: {'name': contact.name}),
+          body: L10nService.getWithParams(L10nKeys.dataServicesNotificationBirthdayTomorrowBody, language, params: {'name': contact.name}),
           scheduledDate: dayBeforeTz,
           notificationDetails: NotificationDetails(
             android: AndroidNotificationDetails(
               'birthday_reminders',
-              L10nService.get('data.services.notification.birthday_reminders_1', language),
-              channelDescription: L10nService.get('data.services.notification.birthday_reminder_notifications_1', language),
+              L10nService.get(L10nKeys.dataServicesNotificationBirthdayReminders1, language),
+              channelDescription: L10nService.get(L10nKeys.dataServicesNotificationBirthdayReminderNotifications1, language),
               importance: Importance.defaultImportance,
               priority: Priority.defaultPriority,
               icon: '@mipmap/ic_launcher',
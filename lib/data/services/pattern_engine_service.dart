@@ -277,10 +277,10 @@ class PatternEngineService {
       final last3 = entries.sublist(entries.length - 3);
       final r3 = last3.map((e) => e.overallRating).toList();
       if (r3[0] < r3[1] && r3[1] < r3[2]) {
-        return L10nService.get('data.services.pattern_engine.your_recent_entries_show_an_upward_trend', language);
+        return L10nService.get(L10nKeys.dataServicesPatternEngineYourRecentEntriesShowAnUpwardTrend, language);
       }
       if (r3[0] > r3[1] && r3[1] > r3[2]) {
-        return L10nService.get('data.services.pattern_engine.your_last_few_entries_show_a_dip_a_good', language);
+        return L10nService.get(L10nKeys.dataServicesPatternEngineYourLastFewEntriesShowADipAGood, language);
       }
     }
 
@@ -299,15 +299,15 @@ class PatternEngineService {
   static String _areaName(FocusArea area, AppLanguage language) {
     switch (area) {
       case FocusArea.energy:
-        return L10nService.get('data.services.pattern_engine.energy', language);
+        return L10nService.get(L10nKeys.dataServicesPatternEngineEnergy, language);
       case FocusArea.focus:
-        return L10nService.get('data.services.pattern_engine.focus', language);
+        return L10nService.get(L10nKeys.dataServicesPatternEngineFocus, language);
       case FocusArea.emotions:
-        return L10nService.get('data.services.pattern_engine.emotions', language);
+        return L10nService.get(L10nKeys.dataServicesPatternEngineEmotions, language);
       case FocusArea.decisions:
-        return L10nService.get('data.services.pattern_engine.decisions', language);
+        return L10nService.get(L10nKeys.dataServicesPatternEngineDecisions, language);
       case FocusArea.social:
-        return L10nService.get('data.services.pattern_engine.social', language);
+        return L10nService.get(L10nKeys.dataServicesPatternEngineSocial, language);
     }
   }
 
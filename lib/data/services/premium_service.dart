@@ -553,22 +553,22 @@ class PremiumNotifier extends Notifier<PremiumState> {
       String errorMessage;
       switch (e) {
         case PurchasesErrorCode.purchaseCancelledError:
-          errorMessage = L10nService.get('data.services.premium.purchase_cancelled', language);
+          errorMessage = L10nService.get(L10nKeys.dataServicesPremiumPurchaseCancelled, language);
           break;
         case PurchasesErrorCode.purchaseNotAllowedError:
-          errorMessage = L10nService.get('data.services.premium.purchases_are_not_allowed_on_this_device', language);
+          errorMessage = L10nService.get(L10nKeys.dataServicesPremiumPurchasesAreNotAllowedOnThisDevice, language);
           break;
         case PurchasesErrorCode.purchaseInvalidError:
-          errorMessage = L10nService.get('data.services.premium.this_purchase_couldnt_be_completed', language);
+          errorMessage = L10nService.get(L10nKeys.dataServicesPremiumThisPurchaseCouldntBeCompleted, language);
           break;
         case PurchasesErrorCode.productNotAvailableForPurchaseError:
-          errorMessage = L10nService.get('data.services.premium.this_product_is_not_available_right_now', language);
+          errorMessage = L10nService.get(L10nKeys.dataServicesPremiumThisProductIsNotAvailableRightNow, language);
           break;
         case PurchasesErrorCode.networkError:
-          errorMessage = L10nService.get('data.services.premium.could_not_connect_your_local_data_is_una', language);
+          errorMessage = L10nService.get(L10nKeys.dataServicesPremiumCouldNotConnectYourLocalDataIsUna, language);
           break;
         default:
-          errorMessage = L10nService.get('data.services.premium.something_went_wrong_your_account_was_no', language);
+          errorMessage = L10nService.get(L10nKeys.dataServicesPremiumSomethingWentWrongYourAccountWasNo, language);
       }
 
       state = state.copyWith(isLoading: false, errorMessage: errorMessage);
@@ -624,7 +624,7 @@ class PremiumNotifier extends Notifier<PremiumState> {
       if (!state.isPremium) {
         final language = StorageService.loadLanguage();
         state = state.copyWith(
-          errorMessage: L10nService.get('data.services.premium.no_purchases_found_to_restore', language),
+          errorMessage: L10nService.get(L10nKeys.dataServicesPremiumNoPurchasesFoundToRestore, language),
         );
       }
 
@@ -636,7 +636,7 @@ class PremiumNotifier extends Notifier<PremiumState> {
       final language = StorageService.loadLanguage();
       state = state.copyWith(
         isLoading: false,
-        errorMessage: L10nService.get('data.services.premium.couldnt_restore_purchases_please_try_aga', language),
+        errorMessage: L10nService.get(L10nKeys.dataServicesPremiumCouldntRestorePurchasesPleaseTryAga, language),
       );
       return false;
     }
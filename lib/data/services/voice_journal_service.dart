@@ -57,7 +57,7 @@ class VoiceJournalService {
     } catch (e) {
       _isInitialized = false;
       _errorController.add(
-        L10nService.get('data.services.voice_journal.failed_to_initialize_voice_input', language),
+        L10nService.get(L10nKeys.dataServicesVoiceJournalFailedToInitializeVoiceInput, language),
       );
     }
   }
@@ -93,7 +93,7 @@ class VoiceJournalService {
     final language = AppLanguage.fromIsEn(_isEn);
     if (!_isInitialized) {
       _errorController.add(
-        L10nService.get('data.services.voice_journal.voice_input_is_not_available_on_this_dev', language),
+        L10nService.get(L10nKeys.dataServicesVoiceJournalVoiceInputIsNotAvailableOnThisDev, language),
       );
       return false;
     }
@@ -120,7 +120,7 @@ class VoiceJournalService {
       return true;
     } catch (e) {
       _errorController.add(
-        L10nService.get('data.services.voice_journal.could_not_start_listening', language),
+        L10nService.get(L10nKeys.dataServicesVoiceJournalCouldNotStartListening, language),
       );
       return false;
     }
@@ -135,7 +135,7 @@ class VoiceJournalService {
       await _speech.stop();
     } catch (e) {
       _errorController.add(
-        L10nService.get('data.services.voice_journal.error_stopping_voice_input', language),
+        L10nService.get(L10nKeys.dataServicesVoiceJournalErrorStoppingVoiceInput, language),
       );
     } finally {
       _isListening = false;
@@ -57,10 +57,10 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
     final lang = ref.read(languageProvider);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('admin.logout', lang),
-      message: L10nService.get('admin.logout_confirm', lang),
-      cancelLabel: L10nService.get('admin.cancel', lang),
-      confirmLabel: L10nService.get('admin.logout', lang),
+      title: L10nService.get(L10nKeys.adminLogout, lang),
+      message: L10nService.get(L10nKeys.adminLogoutConfirm, lang),
+      cancelLabel: L10nService.get(L10nKeys.adminCancel, lang),
+      confirmLabel: L10nService.get(L10nKeys.adminLogout, lang),
       isDestructive: true,
       onConfirm: () => HapticFeedback.heavyImpact(),
     );
@@ -145,7 +145,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 Text(
-                  L10nService.get('admin.dashboard_title', lang),
+                  L10nService.get(L10nKeys.adminDashboardTitle, lang),
                   style: Theme.of(context).textTheme.titleLarge?.copyWith(
                     color: AppColors.starGold,
                     fontWeight: FontWeight.bold,
@@ -154,7 +154,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
                 if (session != null)
                   Text(
                     L10nService.get(
-                      'admin.session_expires',
+                      L10nKeys.adminSessionExpires,
                       lang,
                     ).replaceAll('{hours}', '${session.remainingTime.inHours}'),
                     style: Theme.of(context).textTheme.bodySmall?.copyWith(
@@ -174,12 +174,12 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
                   ? AppColors.textSecondary
                   : AppColors.lightTextSecondary,
             ),
-            tooltip: L10nService.get('admin.refresh_data', lang),
+            tooltip: L10nService.get(L10nKeys.adminRefreshData, lang),
           ),
           IconButton(
             onPressed: _handleLogout,
             icon: const Icon(Icons.logout, color: AppColors.error),
-            tooltip: L10nService.get('admin.logout', lang),
+            tooltip: L10nService.get(L10nKeys.adminLogout, lang),
           ),
         ],
       ),
@@ -218,28 +218,28 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
             context,
             isDark,
             0,
-            L10nService.get('admin.overview', lang),
+            L10nService.get(L10nKeys.adminOverview, lang),
             Icons.dashboard,
           ),
           _buildNavChip(
             context,
             isDark,
             1,
-            L10nService.get('admin.growth', lang),
+            L10nService.get(L10nKeys.adminGrowth, lang),
             Icons.trending_up,
           ),
           _buildNavChip(
             context,
             isDark,
             2,
-            L10nService.get('admin.events', lang),
+            L10nService.get(L10nKeys.adminEvents, lang),
             Icons.analytics,
           ),
           _buildNavChip(
             context,
             isDark,
             3,
-            L10nService.get('admin.notes', lang),
+            L10nService.get(L10nKeys.adminNotes, lang),
             Icons.note_alt,
           ),
         ],
@@ -343,28 +343,28 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
                     context,
                     isDark,
                     0,
-                    L10nService.get('admin.overview', lang),
+                    L10nService.get(L10nKeys.adminOverview, lang),
                     Icons.dashboard,
                   ),
                   _buildSidebarItem(
                     context,
                     isDark,
                     1,
-                    L10nService.get('admin.growth', lang),
+                    L10nService.get(L10nKeys.adminGrowth, lang),
                     Icons.trending_up,
                   ),
                   _buildSidebarItem(
                     context,
                     isDark,
                     2,
-                    L10nService.get('admin.events', lang),
+                    L10nService.get(L10nKeys.adminEvents, lang),
                     Icons.analytics,
                   ),
                   _buildSidebarItem(
                     context,
                     isDark,
                     3,
-                    L10nService.get('admin.notes', lang),
+                    L10nService.get(L10nKeys.adminNotes, lang),
                     Icons.note_alt,
                   ),
                 ],
@@ -438,7 +438,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.key_metrics', lang),
+            L10nService.get(L10nKeys.adminKeyMetrics, lang),
             Icons.analytics,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -447,7 +447,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.usage_overview', lang),
+            L10nService.get(L10nKeys.adminUsageOverview, lang),
             Icons.pie_chart,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -456,7 +456,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.quick_actions', lang),
+            L10nService.get(L10nKeys.adminQuickActions, lang),
             Icons.flash_on,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -499,7 +499,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
       physics: const NeverScrollableScrollPhysics(),
       children: [
         _KpiCard(
-          title: L10nService.get('admin.d1_return', lang),
+          title: L10nService.get(L10nKeys.adminD1Return, lang),
           value: '${metrics.d1Return.toStringAsFixed(1)}%',
           change: metrics.d1Change,
           icon: Icons.replay,
@@ -507,7 +507,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           isDark: isDark,
         ),
         _KpiCard(
-          title: L10nService.get('admin.d7_return', lang),
+          title: L10nService.get(L10nKeys.adminD7Return, lang),
           value: '${metrics.d7Return.toStringAsFixed(1)}%',
           change: metrics.d7Change,
           icon: Icons.calendar_today,
@@ -515,7 +515,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           isDark: isDark,
         ),
         _KpiCard(
-          title: L10nService.get('admin.avg_session', lang),
+          title: L10nService.get(L10nKeys.adminAvgSession, lang),
           value: metrics.avgSessionDepth.toStringAsFixed(1),
           change: metrics.sessionChange,
           icon: Icons.layers,
@@ -523,7 +523,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           isDark: isDark,
         ),
         _KpiCard(
-          title: L10nService.get('admin.reco_ctr', lang),
+          title: L10nService.get(L10nKeys.adminRecoCtr, lang),
           value: '${metrics.recoCtr.toStringAsFixed(1)}%',
           change: metrics.ctrChange,
           icon: Icons.touch_app,
@@ -546,7 +546,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           Text(
-            L10nService.get('admin.tool_usage_distribution', lang),
+            L10nService.get(L10nKeys.adminToolUsageDistribution, lang),
             style: Theme.of(context).textTheme.titleSmall?.copyWith(
               color: isDark
                   ? AppColors.textPrimary
@@ -649,29 +649,29 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
         _buildActionButton(
           context,
           isDark,
-          L10nService.get('admin.export_data', lang),
+          L10nService.get(L10nKeys.adminExportData, lang),
           Icons.download,
           () =>
-              _showSnackbar(L10nService.get('admin.export_coming_soon', lang)),
+              _showSnackbar(L10nService.get(L10nKeys.adminExportComingSoon, lang)),
         ),
         _buildActionButton(
           context,
           isDark,
-          L10nService.get('admin.clear_cache', lang),
+          L10nService.get(L10nKeys.adminClearCache, lang),
           Icons.cleaning_services,
-          () => _showSnackbar(L10nService.get('admin.cache_cleared', lang)),
+          () => _showSnackbar(L10nService.get(L10nKeys.adminCacheCleared, lang)),
         ),
         _buildActionButton(
           context,
           isDark,
-          L10nService.get('admin.send_test_push', lang),
+          L10nService.get(L10nKeys.adminSendTestPush, lang),
           Icons.notifications_active,
-          () => _showSnackbar(L10nService.get('admin.test_push_sent', lang)),
+          () => _showSnackbar(L10nService.get(L10nKeys.adminTestPushSent, lang)),
         ),
         _buildActionButton(
           context,
           isDark,
-          L10nService.get('admin.view_logs', lang),
+          L10nService.get(L10nKeys.adminViewLogs, lang),
           Icons.article,
           () => setState(() => _selectedIndex = 2),
         ),
@@ -749,7 +749,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.retention_trends', lang),
+            L10nService.get(L10nKeys.adminRetentionTrends, lang),
             Icons.trending_up,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -758,7 +758,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.growth_tasks', lang),
+            L10nService.get(L10nKeys.adminGrowthTasks, lang),
             Icons.task_alt,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -793,7 +793,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
             mainAxisAlignment: MainAxisAlignment.spaceBetween,
             children: [
               Text(
-                L10nService.get('admin.retention_over_time', lang),
+                L10nService.get(L10nKeys.adminRetentionOverTime, lang),
                 style: Theme.of(context).textTheme.titleSmall?.copyWith(
                   color: isDark
                       ? AppColors.textPrimary
@@ -849,7 +849,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
     if (data.isEmpty) {
       return Center(
         child: Text(
-          L10nService.get('admin.no_data_available', lang),
+          L10nService.get(L10nKeys.adminNoDataAvailable, lang),
           style: TextStyle(
             color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
           ),
@@ -961,7 +961,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.event_log', lang),
+            L10nService.get(L10nKeys.adminEventLog, lang),
             Icons.list_alt,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -997,14 +997,14 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
                 Expanded(
                   flex: 2,
                   child: Text(
-                    L10nService.get('admin.event', lang),
+                    L10nService.get(L10nKeys.adminEvent, lang),
                     style: _headerStyle(context, isDark),
                   ),
                 ),
                 Expanded(
                   flex: 1,
                   child: Text(
-                    L10nService.get('admin.count', lang),
+                    L10nService.get(L10nKeys.adminCount, lang),
                     style: _headerStyle(context, isDark),
                     textAlign: TextAlign.center,
                   ),
@@ -1012,7 +1012,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
                 Expanded(
                   flex: 2,
                   child: Text(
-                    L10nService.get('admin.last_fired', lang),
+                    L10nService.get(L10nKeys.adminLastFired, lang),
                     style: _headerStyle(context, isDark),
                     textAlign: TextAlign.end,
                   ),
@@ -1126,21 +1126,21 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
     final diff = now.difference(time);
     final lang = ref.read(languageProvider);
 
-    if (diff.inMinutes < 1) return L10nService.get('admin.just_now', lang);
+    if (diff.inMinutes < 1) return L10nService.get(L10nKeys.adminJustNow, lang);
     if (diff.inMinutes < 60) {
       return L10nService.get(
-        'admin.minutes_ago',
+        L10nKeys.adminMinutesAgo,
         lang,
       ).replaceAll('{count}', '${diff.inMinutes}');
     }
     if (diff.inHours < 24) {
       return L10nService.get(
-        'admin.hours_ago',
+        L10nKeys.adminHoursAgo,
         lang,
       ).replaceAll('{count}', '${diff.inHours}');
     }
     return L10nService.get(
-      'admin.days_ago',
+      L10nKeys.adminDaysAgo,
       lang,
     ).replaceAll('{count}', '${diff.inDays}');
   }
@@ -1159,7 +1159,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.snapshots', lang),
+            L10nService.get(L10nKeys.adminSnapshots, lang),
             Icons.camera_alt,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -1168,7 +1168,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           _buildSectionTitle(
             context,
             isDark,
-            L10nService.get('admin.admin_notes', lang),
+            L10nService.get(L10nKeys.adminAdminNotes, lang),
             Icons.sticky_note_2,
           ),
           const SizedBox(height: AppConstants.spacingMd),
@@ -1203,7 +1203,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
                         ),
                         const SizedBox(height: 8),
                         Text(
-                          L10nService.get('admin.no_snapshots_yet', lang),
+                          L10nService.get(L10nKeys.adminNoSnapshotsYet, lang),
                           style: TextStyle(
                             color: isDark
                                 ? AppColors.textMuted
@@ -1361,7 +1361,7 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
           TextField(
             maxLines: 5,
             decoration: InputDecoration(
-              hintText: L10nService.get('admin.add_notes_hint', lang),
+              hintText: L10nService.get(L10nKeys.adminAddNotesHint, lang),
               hintStyle: TextStyle(
                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
               ),
@@ -1380,10 +1380,10 @@ class _AdminDashboardScreenState extends ConsumerState<AdminDashboardScreen>
               TextButton.icon(
                 onPressed: () {
                   HapticFeedback.mediumImpact();
-                  _showSnackbar(L10nService.get('admin.note_saved', lang));
+                  _showSnackbar(L10nService.get(L10nKeys.adminNoteSaved, lang));
                 },
                 icon: const Icon(Icons.save, size: 18),
-                label: Text(L10nService.get('admin.save_note', lang)),
+                label: Text(L10nService.get(L10nKeys.adminSaveNote, lang)),
                 style: TextButton.styleFrom(
                   foregroundColor: AppColors.starGold,
                 ),
@@ -58,7 +58,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
     if (pin.isEmpty) {
       setState(
         () => _error = L10nService.get(
-          'screens.admin_login.pin_required',
+          L10nKeys.screensAdminLoginPinRequired,
           ref.read(languageProvider),
         ),
       );
@@ -130,7 +130,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
     return Row(
       children: [
         IconButton(
-          tooltip: L10nService.get('common.back', language),
+          tooltip: L10nService.get(L10nKeys.commonBack, language),
           onPressed: () => context.pop(),
           icon: Icon(
             Icons.chevron_left,
@@ -141,7 +141,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
         const SizedBox(width: AppConstants.spacingSm),
         Flexible(
           child: GradientText(
-            L10nService.get('screens.admin_login.title', language),
+            L10nService.get(L10nKeys.screensAdminLoginTitle, language),
             variant: GradientTextVariant.gold,
             style: Theme.of(context).textTheme.headlineMedium,
             overflow: TextOverflow.ellipsis,
@@ -188,10 +188,10 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
           Text(
             isLocked
                 ? L10nService.get(
-                    'screens.admin_login.account_locked',
+                    L10nKeys.screensAdminLoginAccountLocked,
                     language,
                   )
-                : L10nService.get('screens.admin_login.enter_pin', language),
+                : L10nService.get(L10nKeys.screensAdminLoginEnterPin, language),
             style: Theme.of(context).textTheme.titleLarge?.copyWith(
               color: isDark
                   ? AppColors.textPrimary
@@ -205,11 +205,11 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
           Text(
             isLocked
                 ? L10nService.get(
-                    'screens.admin_login.too_many_attempts',
+                    L10nKeys.screensAdminLoginTooManyAttempts,
                     language,
                   )
                 : L10nService.get(
-                    'screens.admin_login.secure_access_required',
+                    L10nKeys.screensAdminLoginSecureAccessRequired,
                     language,
                   ),
             style: Theme.of(context).textTheme.bodyMedium?.copyWith(
@@ -303,7 +303,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
                     const SizedBox(width: 6),
                     Text(
                       L10nService.get(
-                        'screens.admin_login.attempts_remaining',
+                        L10nKeys.screensAdminLoginAttemptsRemaining,
                         language,
                       ).replaceAll('{count}', '$remainingAttempts'),
                       style: Theme.of(context).textTheme.bodySmall?.copyWith(
@@ -369,7 +369,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
                           const SizedBox(width: 8),
                           Text(
                             L10nService.get(
-                              'screens.admin_login.access_dashboard',
+                              L10nKeys.screensAdminLoginAccessDashboard,
                               language,
                             ),
                             style: Theme.of(context).textTheme.titleMedium
@@ -411,7 +411,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
         ),
         const SizedBox(height: AppConstants.spacingMd),
         Text(
-          L10nService.get('screens.admin_login.wait_before_retry', language),
+          L10nService.get(L10nKeys.screensAdminLoginWaitBeforeRetry, language),
           style: Theme.of(context).textTheme.bodyMedium?.copyWith(
             color: isDark
                 ? AppColors.textSecondary
@@ -440,7 +440,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
               const SizedBox(width: 8),
               Text(
                 L10nService.get(
-                  'screens.admin_login.security_features',
+                  L10nKeys.screensAdminLoginSecurityFeatures,
                   language,
                 ),
                 style: Theme.of(context).textTheme.titleSmall?.copyWith(
@@ -458,7 +458,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
             isDark,
             Icons.lock_clock,
             L10nService.get(
-              'screens.admin_login.rate_limiting',
+              L10nKeys.screensAdminLoginRateLimiting,
               language,
             ).replaceAll('{count}', '${AdminAuthService.maxAttempts}'),
           ),
@@ -467,7 +467,7 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
             isDark,
             Icons.timer,
             L10nService.get(
-              'screens.admin_login.lockout_duration',
+              L10nKeys.screensAdminLoginLockoutDuration,
               language,
             ).replaceAll(
               '{minutes}',
@@ -478,13 +478,13 @@ class _AdminLoginScreenState extends ConsumerState<AdminLoginScreen> {
             context,
             isDark,
             Icons.vpn_key,
-            L10nService.get('screens.admin_login.secure_session', language),
+            L10nService.get(L10nKeys.screensAdminLoginSecureSession, language),
           ),
           _buildSecurityItem(
             context,
             isDark,
             Icons.no_encryption_gmailerrorred,
-            L10nService.get('screens.admin_login.pin_not_stored', language),
+            L10nService.get(L10nKeys.screensAdminLoginPinNotStored, language),
           ),
         ],
       ),
@@ -83,7 +83,7 @@ class _AffirmationLibraryScreenState
                       color: AppColors.starGold,
                     ),
                     label: Text(
-                      L10nService.get('affirmation.affirmation_library.retry', language),
+                      L10nService.get(L10nKeys.affirmationAffirmationLibraryRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -126,7 +126,7 @@ class _AffirmationLibraryScreenState
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('affirmation.affirmation_library.affirmations', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.affirmationAffirmationLibraryAffirmations, language)),
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
             sliver: SliverList(
@@ -175,7 +175,7 @@ class _AffirmationLibraryScreenState
                           ),
                           const SizedBox(height: 12),
                           Text(
-                            L10nService.get('affirmation.affirmation_library.no_favorites_yet', language),
+                            L10nService.get(L10nKeys.affirmationAffirmationLibraryNoFavoritesYet, language),
                             style: AppTypography.decorativeScript(
                               fontSize: 14,
                               color: isDark
@@ -215,7 +215,7 @@ class _AffirmationLibraryScreenState
           Icon(Icons.auto_awesome, size: 28, color: AppColors.starGold),
           const SizedBox(height: AppConstants.spacingMd),
           GradientText(
-            L10nService.get('affirmation.todays_affirmation', language),
+            L10nService.get(L10nKeys.affirmationTodaysAffirmation, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 13,
@@ -265,7 +265,7 @@ class _AffirmationLibraryScreenState
         children: [
           // All chip
           _FilterChip(
-            label: L10nService.get('affirmation.affirmation_library.all', language),
+            label: L10nService.get(L10nKeys.affirmationAffirmationLibraryAll, language),
             isSelected: _selectedCategory == null && !_showFavoritesOnly,
             isDark: isDark,
             isEn: isEn,
@@ -278,7 +278,7 @@ class _AffirmationLibraryScreenState
 
           // Favorites chip
           _FilterChip(
-            label: L10nService.get('affirmation.affirmation_library.favorites', language),
+            label: L10nService.get(L10nKeys.affirmationAffirmationLibraryFavorites, language),
             isSelected: _showFavoritesOnly,
             isDark: isDark,
             isEn: isEn,
@@ -334,7 +334,7 @@ class _FilterChip extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
       button: true,
-      label: L10nService.getWithParams('affirmation.library.filter_label', language, params: {'label': label}),
+      label: L10nService.getWithParams(L10nKeys.affirmationLibraryFilterLabel, language, params: {'label': label}),
       child: GestureDetector(
         onTap: onTap,
         child: Container(
@@ -433,7 +433,7 @@ class _AffirmationTile extends StatelessWidget {
         HapticService.buttonPress();
         ScaffoldMessenger.of(context).showSnackBar(
           SnackBar(
-            content: Text(L10nService.get('affirmation.affirmation_library.affirmation_copied', language)),
+            content: Text(L10nService.get(L10nKeys.affirmationAffirmationLibraryAffirmationCopied, language)),
             duration: const Duration(seconds: 1),
             backgroundColor: AppColors.success,
           ),
@@ -482,8 +482,8 @@ class _AffirmationTile extends StatelessWidget {
           Semantics(
             button: true,
             label: isFavorite
-                ? (L10nService.get('affirmation.affirmation_library.remove_from_favorites', language))
-                : (L10nService.get('affirmation.affirmation_library.add_to_favorites', language)),
+                ? (L10nService.get(L10nKeys.affirmationAffirmationLibraryRemoveFromFavorites, language))
+                : (L10nService.get(L10nKeys.affirmationAffirmationLibraryAddToFavorites, language)),
             child: GestureDetector(
               behavior: HitTestBehavior.opaque,
               onTap: onToggleFavorite,
@@ -43,7 +43,7 @@ class _AppLockScreenState extends ConsumerState<AppLockScreen> {
     final isEn = StorageService.loadLanguage() == AppLanguage.en;
     final language = AppLanguage.fromIsEn(isEn);
     final success = await service.authenticateWithBiometrics(
-      reason: L10nService.get('app_lock.app_lock.unlock_innercycles', language),
+      reason: L10nService.get(L10nKeys.appLockAppLockUnlockInnercycles, language),
     );
     if (success && mounted) {
       context.go(Routes.today);
@@ -105,7 +105,7 @@ class _AppLockScreenState extends ConsumerState<AppLockScreen> {
               const SizedBox(height: 16),
 
               Text(
-                L10nService.get('app_lock.app_lock.enter_pin', language),
+                L10nService.get(L10nKeys.appLockAppLockEnterPin, language),
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 20,
                   color: isDark
@@ -118,7 +118,7 @@ class _AppLockScreenState extends ConsumerState<AppLockScreen> {
 
               if (_showError)
                 Text(
-                  L10nService.get('app_lock.app_lock.incorrect_pin', language),
+                  L10nService.get(L10nKeys.appLockAppLockIncorrectPin, language),
                   style: AppTypography.subtitle(
                     color: AppColors.error,
                     fontSize: 14,
@@ -235,7 +235,7 @@ class _AppLockScreenState extends ConsumerState<AppLockScreen> {
   Widget _buildDeleteButton(bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
-      label: L10nService.get('app_lock.app_lock.delete', language),
+      label: L10nService.get(L10nKeys.appLockAppLockDelete, language),
       button: true,
       child: GestureDetector(
         onTap: _onDelete,
@@ -259,7 +259,7 @@ class _AppLockScreenState extends ConsumerState<AppLockScreen> {
   Widget _buildBioButton(bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
-      label: L10nService.get('app_lock.app_lock.unlock_with_biometrics', language),
+      label: L10nService.get(L10nKeys.appLockAppLockUnlockWithBiometrics, language),
       button: true,
       child: GestureDetector(
         onTap: () {
@@ -54,7 +54,7 @@ class ArchetypeScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('archetype.archetype.your_archetype', language),
+                  title: L10nService.get(L10nKeys.archetypeArchetypeYourArchetype, language),
                 ),
                 SliverPadding(
                   padding: const EdgeInsets.all(16),
@@ -69,7 +69,7 @@ class ArchetypeScreen extends ConsumerWidget {
                           children: [
                             const SizedBox(height: 40),
                             Text(
-                              L10nService.get('archetype.archetype.could_not_load_your_local_data_is_unaffe', language),
+                              L10nService.get(L10nKeys.archetypeArchetypeCouldNotLoadYourLocalDataIsUnaffe, language),
                               textAlign: TextAlign.center,
                               style: AppTypography.decorativeScript(
                                 fontSize: 14,
@@ -83,7 +83,7 @@ class ArchetypeScreen extends ConsumerWidget {
                               onPressed: () => ref.invalidate(archetypeServiceProvider),
                               icon: Icon(Icons.refresh_rounded, size: 16, color: AppColors.starGold),
                               label: Text(
-                                L10nService.get('archetype.archetype.retry', language),
+                                L10nService.get(L10nKeys.archetypeArchetypeRetry, language),
                                 style: AppTypography.elegantAccent(
                                   fontSize: 13, fontWeight: FontWeight.w600, color: AppColors.starGold,
                                 ),
@@ -105,7 +105,7 @@ class ArchetypeScreen extends ConsumerWidget {
                               children: [
                                 const SizedBox(height: 40),
                                 Text(
-                                  L10nService.get('archetype.archetype.could_not_load_your_local_data_is_unaffe_1', language),
+                                  L10nService.get(L10nKeys.archetypeArchetypeCouldNotLoadYourLocalDataIsUnaffe1, language),
                                   textAlign: TextAlign.center,
                                   style: AppTypography.decorativeScript(
                                     fontSize: 14,
@@ -119,7 +119,7 @@ class ArchetypeScreen extends ConsumerWidget {
                                   onPressed: () => ref.invalidate(journalServiceProvider),
                                   icon: Icon(Icons.refresh_rounded, size: 16, color: AppColors.starGold),
                                   label: Text(
-                                    L10nService.get('archetype.archetype.retry_1', language),
+                                    L10nService.get(L10nKeys.archetypeArchetypeRetry1, language),
                                     style: AppTypography.elegantAccent(
                                       fontSize: 13, fontWeight: FontWeight.w600, color: AppColors.starGold,
                                     ),
@@ -267,7 +267,7 @@ class _DominantArchetypeCard extends StatelessWidget {
               borderRadius: BorderRadius.circular(12),
             ),
             child: Text(
-              L10nService.getWithParams('archetype.alignment_pct', language, params: {'pct': confidencePct}),
+              L10nService.getWithParams(L10nKeys.archetypeAlignmentPct, language, params: {'pct': confidencePct}),
               style: AppTypography.elegantAccent(
                 fontSize: 12,
                 fontWeight: FontWeight.w600,
@@ -326,7 +326,7 @@ class _StrengthsShadowSection extends StatelessWidget {
               Icon(Icons.auto_awesome, size: 18, color: AppColors.starGold),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('archetype.archetype.strengths', language),
+                L10nService.get(L10nKeys.archetypeArchetypeStrengths, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.elegantAccent(
                   fontSize: 16,
@@ -356,7 +356,7 @@ class _StrengthsShadowSection extends StatelessWidget {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('archetype.archetype.shadow_side', language),
+                L10nService.get(L10nKeys.archetypeArchetypeShadowSide, language),
                 variant: GradientTextVariant.amethyst,
                 style: AppTypography.elegantAccent(
                   fontSize: 16,
@@ -443,7 +443,7 @@ class _GrowthTipCard extends StatelessWidget {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('archetype.archetype.growth_insight', language),
+                L10nService.get(L10nKeys.archetypeArchetypeGrowthInsight, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.elegantAccent(
                   fontSize: 16,
@@ -502,7 +502,7 @@ class _EvolutionTimeline extends StatelessWidget {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('archetype.archetype.evolution_timeline', language),
+                L10nService.get(L10nKeys.archetypeArchetypeEvolutionTimeline, language),
                 variant: GradientTextVariant.aurora,
                 style: AppTypography.elegantAccent(
                   fontSize: 16,
@@ -645,7 +645,7 @@ class _BreakdownChart extends StatelessWidget {
               ),
               const SizedBox(width: 8),
               Text(
-                L10nService.get('archetype.archetype.full_archetype_breakdown', language),
+                L10nService.get(L10nKeys.archetypeArchetypeFullArchetypeBreakdown, language),
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 16,
                   fontWeight: FontWeight.w600,
@@ -844,10 +844,10 @@ class _EmptyState extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.psychology_outlined,
-      title: L10nService.get('archetype.archetype.your_archetype_is_waiting_to_emerge', language),
-      description: L10nService.get('archetype.archetype.add_at_least_3_entries_to_surface_your_d', language),
+      title: L10nService.get(L10nKeys.archetypeArchetypeYourArchetypeIsWaitingToEmerge, language),
+      description: L10nService.get(L10nKeys.archetypeArchetypeAddAtLeast3EntriesToSurfaceYourD, language),
       gradientVariant: GradientTextVariant.amethyst,
-      ctaLabel: L10nService.get('archetype.archetype.write_first_entry', language),
+      ctaLabel: L10nService.get(L10nKeys.archetypeArchetypeWriteFirstEntry, language),
       onCtaPressed: () => context.push(Routes.journal),
     );
   }
@@ -872,7 +872,7 @@ class _ShareArchetypeButton extends StatelessWidget {
   Widget build(BuildContext context) {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientButton(
-      label: L10nService.get('archetype.archetype.share_your_archetype', language),
+      label: L10nService.get(L10nKeys.archetypeArchetypeShareYourArchetype, language),
       icon: Icons.share_rounded,
       expanded: true,
       gradient: const LinearGradient(
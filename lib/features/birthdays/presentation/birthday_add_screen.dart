@@ -112,8 +112,8 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
                 slivers: [
                   GlassSliverAppBar(
                     title: _isEditing
-                        ? (L10nService.get('birthdays.birthday_add.edit_birthday', language))
-                        : (L10nService.get('birthdays.birthday_add.add_birthday', language)),
+                        ? (L10nService.get(L10nKeys.birthdaysBirthdayAddEditBirthday, language))
+                        : (L10nService.get(L10nKeys.birthdaysBirthdayAddAddBirthday, language)),
                   ),
                   SliverPadding(
                     padding: const EdgeInsets.all(16),
@@ -149,10 +149,10 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
     final language = ref.read(languageProvider);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('birthdays.birthday_add.discard_changes', language),
-      message: L10nService.get('birthdays.birthday_add.you_have_unsaved_changes_are_you_sure_yo', language),
-      cancelLabel: L10nService.get('birthdays.birthday_add.cancel', language),
-      confirmLabel: L10nService.get('birthdays.birthday_add.discard', language),
+      title: L10nService.get(L10nKeys.birthdaysBirthdayAddDiscardChanges, language),
+      message: L10nService.get(L10nKeys.birthdaysBirthdayAddYouHaveUnsavedChangesAreYouSureYo, language),
+      cancelLabel: L10nService.get(L10nKeys.birthdaysBirthdayAddCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.birthdaysBirthdayAddDiscard, language),
       isDestructive: true,
     );
     if (confirmed == true && mounted) {
@@ -169,7 +169,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
     return Center(
       child: Semantics(
         button: true,
-        label: L10nService.get('birthdays.birthday_add.change_photo', language),
+        label: L10nService.get(L10nKeys.birthdaysBirthdayAddChangePhoto, language),
         child: GestureDetector(
           onTap: _pickImage,
           child: Column(
@@ -181,7 +181,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
             ),
             const SizedBox(height: 8),
             Text(
-              L10nService.get('birthdays.birthday_add.tap_to_change_photo', language),
+              L10nService.get(L10nKeys.birthdaysBirthdayAddTapToChangePhoto, language),
               style: AppTypography.elegantAccent(
                 fontSize: 12,
                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -225,7 +225,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('birthdays.birthday_add.name', language),
+          L10nService.get(L10nKeys.birthdaysBirthdayAddName, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(fontSize: 14, letterSpacing: 1.5),
         ),
@@ -240,7 +240,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
             color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
           ),
           decoration: InputDecoration(
-            hintText: L10nService.get('birthdays.birthday_add.friends_name', language),
+            hintText: L10nService.get(L10nKeys.birthdaysBirthdayAddFriendsName, language),
             hintStyle: AppTypography.subtitle(
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
             ),
@@ -278,7 +278,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('birthdays.birthday_add.birthday', language),
+          L10nService.get(L10nKeys.birthdaysBirthdayAddBirthday, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(fontSize: 14, letterSpacing: 1.5),
         ),
@@ -385,7 +385,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
                           : AppColors.lightTextPrimary,
                     ),
                     hint: Text(
-                      L10nService.get('birthdays.birthday_add.year_optional', language),
+                      L10nService.get(L10nKeys.birthdaysBirthdayAddYearOptional, language),
                       style: AppTypography.subtitle(
                         color: isDark
                             ? AppColors.textMuted
@@ -396,7 +396,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
                       DropdownMenuItem<int?>(
                         value: null,
                         child: Text(
-                          L10nService.get('birthdays.birthday_add.not_specified', language),
+                          L10nService.get(L10nKeys.birthdaysBirthdayAddNotSpecified, language),
                           style: AppTypography.subtitle(
                             color: isDark
                                 ? AppColors.textMuted
@@ -452,7 +452,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('birthdays.birthday_add.relationship', language),
+          L10nService.get(L10nKeys.birthdaysBirthdayAddRelationship, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(fontSize: 14, letterSpacing: 1.5),
         ),
@@ -530,7 +530,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('birthdays.birthday_add.note_optional', language),
+          L10nService.get(L10nKeys.birthdaysBirthdayAddNoteOptional, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(fontSize: 14, letterSpacing: 1.5),
         ),
@@ -545,7 +545,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
             color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
           ),
           decoration: InputDecoration(
-            hintText: L10nService.get('birthdays.birthday_add.gift_ideas_memories', language),
+            hintText: L10nService.get(L10nKeys.birthdaysBirthdayAddGiftIdeasMemories, language),
             hintStyle: AppTypography.subtitle(
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
             ),
@@ -574,14 +574,14 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('birthdays.birthday_add.reminders', language),
+          L10nService.get(L10nKeys.birthdaysBirthdayAddReminders, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(fontSize: 14, letterSpacing: 1.5),
         ),
         const SizedBox(height: 10),
         _toggleRow(
           isDark,
-          label: L10nService.get('birthdays.birthday_add.birthday_notification', language),
+          label: L10nService.get(L10nKeys.birthdaysBirthdayAddBirthdayNotification, language),
           value: _notificationsEnabled,
           onChanged: (v) => setState(() {
             _notificationsEnabled = v;
@@ -591,7 +591,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
         const SizedBox(height: 8),
         _toggleRow(
           isDark,
-          label: L10nService.get('birthdays.birthday_add.day_before_reminder', language),
+          label: L10nService.get(L10nKeys.birthdaysBirthdayAddDayBeforeReminder, language),
           value: _dayBeforeReminder,
           onChanged: (v) => setState(() {
             _dayBeforeReminder = v;
@@ -667,8 +667,8 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
               ? const CupertinoActivityIndicator(radius: 10)
               : Text(
                   _isEditing
-                      ? (L10nService.get('birthdays.birthday_add.update_contact', language))
-                      : (L10nService.get('birthdays.birthday_add.save_contact', language)),
+                      ? (L10nService.get(L10nKeys.birthdaysBirthdayAddUpdateContact, language))
+                      : (L10nService.get(L10nKeys.birthdaysBirthdayAddSaveContact, language)),
                   style: AppTypography.modernAccent(
                     fontSize: 16,
                     fontWeight: FontWeight.w700,
@@ -691,7 +691,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(
           content: Text(
-            L10nService.get('birthdays.birthday_add.name_required', language),
+            L10nService.get(L10nKeys.birthdaysBirthdayAddNameRequired, language),
           ),
         ),
       );
@@ -758,7 +758,7 @@ class _BirthdayAddScreenState extends ConsumerState<BirthdayAddScreen> {
         ScaffoldMessenger.of(context).showSnackBar(
           SnackBar(
             content: Text(
-              L10nService.get('birthdays.birthday_add.couldnt_save_this_contact_please_try_aga', language),
+              L10nService.get(L10nKeys.birthdaysBirthdayAddCouldntSaveThisContactPleaseTryAga, language),
             ),
           ),
         );
@@ -61,7 +61,7 @@ class _BirthdayAgendaScreenState extends ConsumerState<BirthdayAgendaScreen> {
         ),
         child: FloatingActionButton(
           onPressed: () => context.push(Routes.birthdayAdd),
-          tooltip: L10nService.get('birthdays.birthday_agenda.add_birthday', language),
+          tooltip: L10nService.get(L10nKeys.birthdaysBirthdayAgendaAddBirthday, language),
           backgroundColor: Colors.transparent,
           elevation: 0,
           child: const Icon(
@@ -87,7 +87,7 @@ class _BirthdayAgendaScreenState extends ConsumerState<BirthdayAgendaScreen> {
               mainAxisSize: MainAxisSize.min,
               children: [
                 Text(
-                  L10nService.get('birthdays.birthday_agenda.couldnt_load_your_birthdays', language),
+                  L10nService.get(L10nKeys.birthdaysBirthdayAgendaCouldntLoadYourBirthdays, language),
                   textAlign: TextAlign.center,
                   style: AppTypography.subtitle(
                     color: isDark
@@ -102,7 +102,7 @@ class _BirthdayAgendaScreenState extends ConsumerState<BirthdayAgendaScreen> {
                   icon: Icon(Icons.refresh_rounded,
                       size: 16, color: AppColors.starGold),
                   label: Text(
-                    L10nService.get('birthdays.birthday_agenda.retry', language),
+                    L10nService.get(L10nKeys.birthdaysBirthdayAgendaRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -144,7 +144,7 @@ class _BirthdayAgendaScreenState extends ConsumerState<BirthdayAgendaScreen> {
           ),
           slivers: [
             GlassSliverAppBar(
-              title: L10nService.get('birthdays.birthday_agenda.birthday_agenda', language),
+              title: L10nService.get(L10nKeys.birthdaysBirthdayAgendaBirthdayAgenda, language),
             ),
             SliverPadding(
               padding: const EdgeInsets.all(16),
@@ -259,7 +259,7 @@ class _BirthdayAgendaScreenState extends ConsumerState<BirthdayAgendaScreen> {
                   // 5. Upcoming birthdays
                   if (upcoming.isNotEmpty) ...[
                     GradientText(
-                      L10nService.get('birthdays.birthday_agenda.upcoming_birthdays', language),
+                      L10nService.get(L10nKeys.birthdaysBirthdayAgendaUpcomingBirthdays, language),
                       variant: GradientTextVariant.gold,
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 16,
@@ -330,7 +330,7 @@ class _TodayBanner extends StatelessWidget {
               const AppSymbol.card('\u{1F382}'),
               const SizedBox(width: 10),
               GradientText(
-                L10nService.get('birthdays.birthday_agenda.todays_birthdays', language),
+                L10nService.get(L10nKeys.birthdaysBirthdayAgendaTodaysBirthdays, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 18,
@@ -429,7 +429,7 @@ class _MonthNav extends StatelessWidget {
                 ? AppColors.textSecondary
                 : AppColors.lightTextSecondary,
           ),
-          tooltip: L10nService.get('birthdays.birthday_agenda.previous_month', language),
+          tooltip: L10nService.get(L10nKeys.birthdaysBirthdayAgendaPreviousMonth, language),
           onPressed: onPrevious,
         ),
         GestureDetector(
@@ -448,7 +448,7 @@ class _MonthNav extends StatelessWidget {
                 Padding(
                   padding: const EdgeInsets.only(top: 2),
                   child: Text(
-                    L10nService.get('birthdays.birthday_agenda.tap_for_today', language),
+                    L10nService.get(L10nKeys.birthdaysBirthdayAgendaTapForToday, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 10,
                       color: AppColors.starGold.withValues(alpha: 0.6),
@@ -465,7 +465,7 @@ class _MonthNav extends StatelessWidget {
                 ? AppColors.textSecondary
                 : AppColors.lightTextSecondary,
           ),
-          tooltip: L10nService.get('birthdays.birthday_agenda.next_month', language),
+          tooltip: L10nService.get(L10nKeys.birthdaysBirthdayAgendaNextMonth, language),
           onPressed: onNext,
         ),
       ],
@@ -679,7 +679,7 @@ class _SelectedDayDetail extends StatelessWidget {
         padding: const EdgeInsets.all(20),
         child: Center(
           child: Text(
-            L10nService.get('birthdays.birthday_agenda.no_birthdays_on_this_day', language),
+            L10nService.get(L10nKeys.birthdaysBirthdayAgendaNoBirthdaysOnThisDay, language),
             style: AppTypography.subtitle(
               fontSize: 14,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -727,7 +727,7 @@ class _SelectedDayDetail extends StatelessWidget {
                         const SizedBox(height: 2),
                         Text(
                           '${contact.relationship.emoji} ${contact.relationship.localizedName(language)}'
-                          '${contact.age != null ? ' \u{2022} ${contact.age} ${L10nService.get('common.years', language)}' : ''}',
+                          '${contact.age != null ? ' \u{2022} ${contact.age} ${L10nService.get(L10nKeys.commonYears, language)}' : ''}',
                           maxLines: 1,
                           overflow: TextOverflow.ellipsis,
                           style: AppTypography.elegantAccent(
@@ -842,8 +842,8 @@ class _UpcomingCard extends StatelessWidget {
                 ),
                 child: Text(
                   isToday
-                      ? (L10nService.get('birthdays.birthday_agenda.today', language))
-                      : '$days ${L10nService.get('birthdays.birthday_agenda.days', language)}',
+                      ? (L10nService.get(L10nKeys.birthdaysBirthdayAgendaToday, language))
+                      : '$days ${L10nService.get(L10nKeys.birthdaysBirthdayAgendaDays, language)}',
                   style: AppTypography.elegantAccent(
                     fontSize: 12,
                     letterSpacing: 0.5,
@@ -887,7 +887,7 @@ class _EmptyState extends StatelessWidget {
           const AppSymbol.hero('\u{1F382}'),
           const SizedBox(height: 16),
           GradientText(
-            L10nService.get('birthdays.birthday_agenda.never_miss_a_birthday', language),
+            L10nService.get(L10nKeys.birthdaysBirthdayAgendaNeverMissABirthday, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 20,
@@ -896,7 +896,7 @@ class _EmptyState extends StatelessWidget {
           ),
           const SizedBox(height: 8),
           Text(
-            L10nService.get('birthdays.birthday_agenda.add_your_friends_and_family_to_get_remin', language),
+            L10nService.get(L10nKeys.birthdaysBirthdayAgendaAddYourFriendsAndFamilyToGetRemin, language),
             textAlign: TextAlign.center,
             style: AppTypography.decorativeScript(
               fontSize: 14,
@@ -969,7 +969,7 @@ class _ActionButtons extends StatelessWidget {
                 ),
                 const SizedBox(width: 8),
                 Text(
-                  L10nService.get('birthdays.birthday_agenda.import_from_facebook', language),
+                  L10nService.get(L10nKeys.birthdaysBirthdayAgendaImportFromFacebook, language),
                   style: AppTypography.modernAccent(
                     fontSize: 15,
                     fontWeight: FontWeight.w700,
@@ -1006,7 +1006,7 @@ class _ActionButtons extends StatelessWidget {
                 ),
                 const SizedBox(width: 8),
                 Text(
-                  L10nService.get('birthdays.birthday_agenda.add_manually', language),
+                  L10nService.get(L10nKeys.birthdaysBirthdayAgendaAddManually, language),
                   style: AppTypography.modernAccent(
                     fontSize: 15,
                     fontWeight: FontWeight.w600,
@@ -48,7 +48,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
               mainAxisSize: MainAxisSize.min,
               children: [
                 Text(
-                  L10nService.get('birthdays.birthday_detail.couldnt_load_this_contact', language),
+                  L10nService.get(L10nKeys.birthdaysBirthdayDetailCouldntLoadThisContact, language),
                   style: AppTypography.subtitle(
                     color: isDark
                         ? AppColors.textSecondary
@@ -65,7 +65,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                     color: AppColors.starGold,
                   ),
                   label: Text(
-                    L10nService.get('birthdays.birthday_detail.retry', language),
+                    L10nService.get(L10nKeys.birthdaysBirthdayDetailRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -81,7 +81,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
             if (contact == null) {
               return Center(
                 child: Text(
-                  L10nService.get('birthdays.birthday_detail.contact_not_found', language),
+                  L10nService.get(L10nKeys.birthdaysBirthdayDetailContactNotFound, language),
                   style: AppTypography.subtitle(
                     color: isDark
                         ? AppColors.textMuted
@@ -119,7 +119,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
             title: contact.name,
             actions: [
               IconButton(
-                tooltip: L10nService.get('birthdays.birthday_detail.share_birthday', language),
+                tooltip: L10nService.get(L10nKeys.birthdaysBirthdayDetailShareBirthday, language),
                 icon: Icon(
                   Icons.share_rounded,
                   color: AppColors.starGold,
@@ -136,7 +136,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                 },
               ),
               IconButton(
-                tooltip: L10nService.get('birthdays.birthday_detail.edit_birthday', language),
+                tooltip: L10nService.get(L10nKeys.birthdaysBirthdayDetailEditBirthday, language),
                 icon: Icon(
                   Icons.edit_rounded,
                   color: isDark
@@ -255,7 +255,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         GradientText(
-                          L10nService.get('birthdays.birthday_detail.note', language),
+                          L10nService.get(L10nKeys.birthdaysBirthdayDetailNote, language),
                           variant: GradientTextVariant.gold,
                           style: AppTypography.displayFont.copyWith(
                             fontSize: 14,
@@ -264,7 +264,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                         ),
                         const SizedBox(height: 8),
                         Semantics(
-                          label: L10nService.get('birthdays.birthday_detail.long_press_to_copy_note', language),
+                          label: L10nService.get(L10nKeys.birthdaysBirthdayDetailLongPressToCopyNote, language),
                           child: GestureDetector(
                           onLongPress: () {
                             final language = AppLanguage.fromIsEn(isEn);
@@ -274,7 +274,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                             HapticService.buttonPress();
                             ScaffoldMessenger.of(context).showSnackBar(
                               SnackBar(
-                                content: Text(L10nService.get('birthdays.birthday_detail.birthday_note_copied', language)),
+                                content: Text(L10nService.get(L10nKeys.birthdaysBirthdayDetailBirthdayNoteCopied, language)),
                                 duration: const Duration(seconds: 1),
                                 backgroundColor: AppColors.success,
                               ),
@@ -305,7 +305,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                     crossAxisAlignment: CrossAxisAlignment.start,
                     children: [
                       GradientText(
-                        L10nService.get('birthdays.birthday_detail.reminders', language),
+                        L10nService.get(L10nKeys.birthdaysBirthdayDetailReminders, language),
                         variant: GradientTextVariant.gold,
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 14,
@@ -316,7 +316,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                       _toggleRow(
                         isDark,
                         icon: Icons.cake_rounded,
-                        label: L10nService.get('birthdays.birthday_detail.birthday_notification', language),
+                        label: L10nService.get(L10nKeys.birthdaysBirthdayDetailBirthdayNotification, language),
                         value: contact.notificationsEnabled,
                         onChanged: (v) => _updateNotificationSetting(
                           ref,
@@ -328,7 +328,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                       _toggleRow(
                         isDark,
                         icon: Icons.notifications_active_rounded,
-                        label: L10nService.get('birthdays.birthday_detail.day_before', language),
+                        label: L10nService.get(L10nKeys.birthdaysBirthdayDetailDayBefore, language),
                         value: contact.dayBeforeReminder,
                         onChanged: (v) => _updateNotificationSetting(
                           ref,
@@ -354,7 +354,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
                       size: 18,
                     ),
                     label: Text(
-                      L10nService.get('birthdays.birthday_detail.delete_contact', language),
+                      L10nService.get(L10nKeys.birthdaysBirthdayDetailDeleteContact, language),
                       style: AppTypography.modernAccent(
                         color: AppColors.error,
                         fontWeight: FontWeight.w500,
@@ -388,7 +388,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
           const SizedBox(height: 12),
           if (isToday) ...[
             GradientText(
-              L10nService.get('birthdays.birthday_detail.happy_birthday', language),
+              L10nService.get(L10nKeys.birthdaysBirthdayDetailHappyBirthday, language),
               variant: GradientTextVariant.gold,
               style: AppTypography.displayFont.copyWith(
                 fontSize: 22,
@@ -407,7 +407,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
               ),
             ),
             Text(
-              L10nService.get('birthdays.birthday_detail.days_left', language),
+              L10nService.get(L10nKeys.birthdaysBirthdayDetailDaysLeft, language),
               style: AppTypography.decorativeScript(
                 fontSize: 16,
                 color: isDark
@@ -493,12 +493,12 @@ class BirthdayDetailScreen extends ConsumerWidget {
     final language = AppLanguage.fromIsEn(isEn);
     GlassDialog.confirm(
       context,
-      title: L10nService.get('birthdays.birthday_detail.delete_contact_1', language),
+      title: L10nService.get(L10nKeys.birthdaysBirthdayDetailDeleteContact1, language),
       message: isEn
           ? 'Are you sure you want to delete ${contact.name}?'
           : '${contact.name} ki\u{015F}isini silmek istedi\u{011F}inizden emin misiniz?',
-      cancelLabel: L10nService.get('birthdays.birthday_detail.cancel', language),
-      confirmLabel: L10nService.get('birthdays.birthday_detail.delete', language),
+      cancelLabel: L10nService.get(L10nKeys.birthdaysBirthdayDetailCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.birthdaysBirthdayDetailDelete, language),
       isDestructive: true,
       onConfirm: () async {
         final language = AppLanguage.fromIsEn(isEn);
@@ -513,7 +513,7 @@ class BirthdayDetailScreen extends ConsumerWidget {
             ScaffoldMessenger.of(context).showSnackBar(
               SnackBar(
                 content: Text(
-                  L10nService.get('birthdays.birthday_detail.couldnt_delete_this_contact_please_try_a', language),
+                  L10nService.get(L10nKeys.birthdaysBirthdayDetailCouldntDeleteThisContactPleaseTryA, language),
                 ),
               ),
             );
@@ -56,7 +56,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
             ),
             slivers: [
               GlassSliverAppBar(
-                title: L10nService.get('birthdays.birthday_import.import_birthdays', language),
+                title: L10nService.get(L10nKeys.birthdaysBirthdayImportImportBirthdays, language),
               ),
               SliverPadding(
                 padding: const EdgeInsets.all(16),
@@ -115,7 +115,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
             crossAxisAlignment: CrossAxisAlignment.start,
             children: [
               GradientText(
-                L10nService.get('birthdays.birthday_import.how_to_export_from_facebook', language),
+                L10nService.get(L10nKeys.birthdaysBirthdayImportHowToExportFromFacebook, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 16,
@@ -199,7 +199,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
                         ),
                         const SizedBox(width: 8),
                         Text(
-                          L10nService.get('birthdays.birthday_import.select_json_file', language),
+                          L10nService.get(L10nKeys.birthdaysBirthdayImportSelectJsonFile, language),
                           style: AppTypography.modernAccent(
                             fontSize: 16,
                             fontWeight: FontWeight.w700,
@@ -240,7 +240,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
         ScaffoldMessenger.of(context).showSnackBar(
           SnackBar(
             content: Text(
-              L10nService.get('birthdays.birthday_import.no_birthdays_found_in_this_file_try_a_di', language),
+              L10nService.get(L10nKeys.birthdaysBirthdayImportNoBirthdaysFoundInThisFileTryADi, language),
             ),
           ),
         );
@@ -260,7 +260,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
         ScaffoldMessenger.of(context).showSnackBar(
           SnackBar(
             content: Text(
-              L10nService.get('birthdays.birthday_import.couldnt_read_this_file_make_sure_its_a_v', language),
+              L10nService.get(L10nKeys.birthdaysBirthdayImportCouldntReadThisFileMakeSureItsAV, language),
             ),
           ),
         );
@@ -310,8 +310,8 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
               },
               child: Text(
                 _selectedIndices.length == _parsedContacts.length
-                    ? (L10nService.get('birthdays.birthday_import.deselect_all', language))
-                    : (L10nService.get('birthdays.birthday_import.select_all', language)),
+                    ? (L10nService.get(L10nKeys.birthdaysBirthdayImportDeselectAll, language))
+                    : (L10nService.get(L10nKeys.birthdaysBirthdayImportSelectAll, language)),
                 style: AppTypography.modernAccent(
                   color: AppColors.starGold,
                   fontWeight: FontWeight.w600,
@@ -481,7 +481,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
         ScaffoldMessenger.of(context).showSnackBar(
           SnackBar(
             content: Text(
-              L10nService.get('birthdays.birthday_import.birthday_import_failed_please_check_your', language),
+              L10nService.get(L10nKeys.birthdaysBirthdayImportBirthdayImportFailedPleaseCheckYour, language),
             ),
           ),
         );
@@ -504,7 +504,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
               const AppSymbol.hero('\u{1F389}'),
               const SizedBox(height: 16),
               GradientText(
-                L10nService.get('birthdays.birthday_import.import_complete', language),
+                L10nService.get(L10nKeys.birthdaysBirthdayImportImportComplete, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 20,
@@ -542,7 +542,7 @@ class _BirthdayImportScreenState extends ConsumerState<BirthdayImportScreen> {
                     borderRadius: BorderRadius.circular(12),
                   ),
                   child: Text(
-                    L10nService.get('birthdays.birthday_import.view_birthdays', language),
+                    L10nService.get(L10nKeys.birthdaysBirthdayImportViewBirthdays, language),
                     style: AppTypography.modernAccent(
                       fontSize: 15,
                       fontWeight: FontWeight.w600,
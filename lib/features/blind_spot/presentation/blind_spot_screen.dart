@@ -48,7 +48,7 @@ class BlindSpotScreen extends ConsumerWidget {
                 mainAxisSize: MainAxisSize.min,
                 children: [
                   Text(
-                    L10nService.get('blind_spot.blind_spot.could_not_load_your_local_data_is_unaffe', language),
+                    L10nService.get(L10nKeys.blindSpotBlindSpotCouldNotLoadYourLocalDataIsUnaffe, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.subtitle(
                       color: isDark
@@ -62,7 +62,7 @@ class BlindSpotScreen extends ConsumerWidget {
                         ref.invalidate(blindSpotServiceProvider),
                     icon: Icon(Icons.refresh_rounded, size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('blind_spot.blind_spot.retry', language),
+                      L10nService.get(L10nKeys.blindSpotBlindSpotRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13, fontWeight: FontWeight.w600, color: AppColors.starGold,
                       ),
@@ -78,7 +78,7 @@ class BlindSpotScreen extends ConsumerWidget {
                   mainAxisSize: MainAxisSize.min,
                   children: [
                     Text(
-                      L10nService.get('blind_spot.blind_spot.could_not_load_your_local_data_is_unaffe_1', language),
+                      L10nService.get(L10nKeys.blindSpotBlindSpotCouldNotLoadYourLocalDataIsUnaffe1, language),
                       textAlign: TextAlign.center,
                       style: AppTypography.subtitle(
                         color: isDark
@@ -92,7 +92,7 @@ class BlindSpotScreen extends ConsumerWidget {
                           ref.invalidate(journalServiceProvider),
                       icon: Icon(Icons.refresh_rounded, size: 16, color: AppColors.starGold),
                       label: Text(
-                        L10nService.get('blind_spot.blind_spot.retry_1', language),
+                        L10nService.get(L10nKeys.blindSpotBlindSpotRetry1, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13, fontWeight: FontWeight.w600, color: AppColors.starGold,
                         ),
@@ -201,7 +201,7 @@ class _BlindSpotBodyState extends State<_BlindSpotBody> {
           ),
           slivers: [
             GlassSliverAppBar(
-              title: L10nService.get('blind_spot.blind_spot.what_your_journal_reveals', (language)),
+              title: L10nService.get(L10nKeys.blindSpotBlindSpotWhatYourJournalReveals, (language)),
             ),
             SliverToBoxAdapter(
               child: Padding(
@@ -313,7 +313,7 @@ class _NotEnoughData extends StatelessWidget {
           ),
           const SizedBox(height: 20),
           Text(
-            L10nService.get('blind_spot.blind_spot.a_little_more_journaling_to_go', language),
+            L10nService.get(L10nKeys.blindSpotBlindSpotALittleMoreJournalingToGo, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 22,
               fontWeight: FontWeight.w600,
@@ -365,7 +365,7 @@ class _NotEnoughData extends StatelessWidget {
                 ),
                 const SizedBox(width: 8),
                 Text(
-                  L10nService.getWithParams('blind_spot.entry_count_progress', language, params: {'count': '$entryCount'}),
+                  L10nService.getWithParams(L10nKeys.blindSpotEntryCountProgress, language, params: {'count': '$entryCount'}),
                   style: AppTypography.modernAccent(
                     fontSize: 14,
                     fontWeight: FontWeight.w600,
@@ -423,7 +423,7 @@ class _OverallInsightCard extends StatelessWidget {
               const SizedBox(width: 12),
               Expanded(
                 child: GradientText(
-                  L10nService.get('blind_spot.blind_spot.your_overview', language),
+                  L10nService.get(L10nKeys.blindSpotBlindSpotYourOverview, language),
                   variant: GradientTextVariant.aurora,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 17,
@@ -510,7 +510,7 @@ class _BlindSpotsList extends StatelessWidget {
             const SizedBox(width: 12),
             Expanded(
               child: Text(
-                L10nService.get('blind_spot.blind_spot.no_blind_spots_detected_at_this_time_kee', language),
+                L10nService.get(L10nKeys.blindSpotBlindSpotNoBlindSpotsDetectedAtThisTimeKee, language),
                 style: AppTypography.decorativeScript(
                   fontSize: 14,
                   color: isDark
@@ -528,7 +528,7 @@ class _BlindSpotsList extends StatelessWidget {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('blind_spot.blind_spot.blind_spots', language),
+          L10nService.get(L10nKeys.blindSpotBlindSpotBlindSpots, language),
           variant: GradientTextVariant.amethyst,
           style: AppTypography.displayFont.copyWith(
             fontSize: 16,
@@ -782,11 +782,11 @@ class _SeverityIndicator extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     switch (severity) {
       case BlindSpotSeverity.low:
-        return L10nService.get('blind_spot.blind_spot.subtle', language);
+        return L10nService.get(L10nKeys.blindSpotBlindSpotSubtle, language);
       case BlindSpotSeverity.medium:
-        return L10nService.get('blind_spot.blind_spot.notable', language);
+        return L10nService.get(L10nKeys.blindSpotBlindSpotNotable, language);
       case BlindSpotSeverity.high:
-        return L10nService.get('blind_spot.blind_spot.significant', language);
+        return L10nService.get(L10nKeys.blindSpotBlindSpotSignificant, language);
     }
   }
 }
@@ -835,7 +835,7 @@ class _GrowthSuggestionsCard extends StatelessWidget {
               ),
               const SizedBox(width: 12),
               GradientText(
-                L10nService.get('blind_spot.blind_spot.growth_suggestions', language),
+                L10nService.get(L10nKeys.blindSpotBlindSpotGrowthSuggestions, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 16,
@@ -912,7 +912,7 @@ class _ShareInsightsButton extends StatelessWidget {
   Widget build(BuildContext context) {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientButton(
-      label: L10nService.get('blind_spot.blind_spot.share_your_insights', language),
+      label: L10nService.get(L10nKeys.blindSpotBlindSpotShareYourInsights, language),
       icon: Icons.share_rounded,
       expanded: true,
       gradient: const LinearGradient(
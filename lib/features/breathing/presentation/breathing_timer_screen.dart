@@ -301,7 +301,7 @@ class _BreathingTimerScreenState extends ConsumerState<BreathingTimerScreen>
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('breathing.breathing_timer.guided_breathwork', language),
+                  title: L10nService.get(L10nKeys.breathingBreathingTimerGuidedBreathwork, language),
                 ),
                 SliverFillRemaining(
                   hasScrollBody: false,
@@ -367,7 +367,7 @@ class _BreathingTimerScreenState extends ConsumerState<BreathingTimerScreen>
                               ? (isEn
                                     ? '${currentPhase.labelEn()}, $_phaseCountdown seconds'
                                     : '${currentPhase.labelTr()}, $_phaseCountdown saniye')
-                              : (L10nService.get('breathing.breathing_timer.breathing_circle_tap_start_to_begin', language)),
+                              : (L10nService.get(L10nKeys.breathingBreathingTimerBreathingCircleTapStartToBegin, language)),
                           liveRegion: _isRunning,
                           child: AnimatedBuilder(
                             animation: _breathController,
@@ -485,7 +485,7 @@ class _BreathingTimerScreenState extends ConsumerState<BreathingTimerScreen>
                                   ),
                                   const SizedBox(width: 4),
                                   Text(
-                                    L10nService.get('breathing.breathing_timer.share_session', language),
+                                    L10nService.get(L10nKeys.breathingBreathingTimerShareSession, language),
                                     style: AppTypography.elegantAccent(
                                       fontSize: 12,
                                       color: AppColors.starGold.withValues(alpha: 0.7),
@@ -530,7 +530,7 @@ class _BreathingTimerScreenState extends ConsumerState<BreathingTimerScreen>
                                 ),
                                 child: Center(
                                   child: Text(
-                                    L10nService.get('breathing.breathing_timer.stop', language),
+                                    L10nService.get(L10nKeys.breathingBreathingTimerStop, language),
                                     style: AppTypography.modernAccent(
                                       fontSize: 18,
                                       fontWeight: FontWeight.w600,
@@ -543,7 +543,7 @@ class _BreathingTimerScreenState extends ConsumerState<BreathingTimerScreen>
                           )
                         else
                           GradientButton(
-                            label: L10nService.get('breathing.breathing_timer.start_breathing', language),
+                            label: L10nService.get(L10nKeys.breathingBreathingTimerStartBreathing, language),
                             onPressed: _start,
                             expanded: true,
                             gradient: LinearGradient(
@@ -100,7 +100,7 @@ class _CalendarHeatmapScreenState extends ConsumerState<CalendarHeatmapScreen> {
                   icon: Icon(Icons.refresh_rounded,
                       size: 16, color: AppColors.starGold),
                   label: Text(
-                    L10nService.get('calendar.calendar_heatmap.retry', language),
+                    L10nService.get(L10nKeys.calendarCalendarHeatmapRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -175,7 +175,7 @@ class _CalendarHeatmapScreenState extends ConsumerState<CalendarHeatmapScreen> {
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('calendar.calendar_heatmap.heatmap_timeline', language),
+            title: L10nService.get(L10nKeys.calendarCalendarHeatmapHeatmapTimeline, language),
           ),
           SliverPadding(
             padding: const EdgeInsets.all(16),
@@ -331,19 +331,19 @@ class _StatsRow extends StatelessWidget {
     return Row(
       children: [
         _StatPill(
-          label: L10nService.get('calendar.calendar_heatmap.total', language),
+          label: L10nService.get(L10nKeys.calendarCalendarHeatmapTotal, language),
           value: '$totalEntries',
           isDark: isDark,
         ),
         const SizedBox(width: 10),
         _StatPill(
-          label: L10nService.get('calendar.calendar_heatmap.this_month', language),
+          label: L10nService.get(L10nKeys.calendarCalendarHeatmapThisMonth, language),
           value: '$monthCount',
           isDark: isDark,
         ),
         const SizedBox(width: 10),
         _StatPill(
-          label: L10nService.get('calendar.calendar_heatmap.streak', language),
+          label: L10nService.get(L10nKeys.calendarCalendarHeatmapStreak, language),
           value: '$streak',
           isDark: isDark,
           accent: true,
@@ -467,7 +467,7 @@ class _MonthNavigator extends StatelessWidget {
       mainAxisAlignment: MainAxisAlignment.spaceBetween,
       children: [
         IconButton(
-          tooltip: L10nService.get('calendar.calendar_heatmap.previous_month', language),
+          tooltip: L10nService.get(L10nKeys.calendarCalendarHeatmapPreviousMonth, language),
           icon: Icon(
             Icons.chevron_left_rounded,
             color: isDark
@@ -485,7 +485,7 @@ class _MonthNavigator extends StatelessWidget {
           ),
         ),
         IconButton(
-          tooltip: L10nService.get('calendar.calendar_heatmap.next_month', language),
+          tooltip: L10nService.get(L10nKeys.calendarCalendarHeatmapNextMonth, language),
           icon: Icon(
             Icons.chevron_right_rounded,
             color: isCurrentMonth
@@ -605,8 +605,8 @@ class _CalendarGrid extends StatelessWidget {
                     child: Semantics(
                       label:
                           '${date.day}/${date.month}'
-                          '${hasJournal ? (L10nService.get('calendar.calendar_heatmap._has_entry', language)) : ''}'
-                          '${dayLifeEvents.isNotEmpty ? (L10nService.get('calendar.calendar_heatmap._life_event', language)) : ''}',
+                          '${hasJournal ? (L10nService.get(L10nKeys.calendarCalendarHeatmapHasEntry, language)) : ''}'
+                          '${dayLifeEvents.isNotEmpty ? (L10nService.get(L10nKeys.calendarCalendarHeatmapLifeEvent, language)) : ''}',
                       button: !isFuture,
                       child: GestureDetector(
                         onTap: isFuture ? null : () => onDayTap(dateKey),
@@ -766,7 +766,7 @@ class _Legend extends StatelessWidget {
           mainAxisAlignment: MainAxisAlignment.center,
           children: [
             Text(
-              L10nService.get('calendar.calendar_heatmap.less', language),
+              L10nService.get(L10nKeys.calendarCalendarHeatmapLess, language),
               style: AppTypography.elegantAccent(
                 fontSize: 10,
                 color: mutedColor,
@@ -786,7 +786,7 @@ class _Legend extends StatelessWidget {
             }),
             const SizedBox(width: 6),
             Text(
-              L10nService.get('calendar.calendar_heatmap.more', language),
+              L10nService.get(L10nKeys.calendarCalendarHeatmapMore, language),
               style: AppTypography.elegantAccent(
                 fontSize: 10,
                 color: mutedColor,
@@ -801,21 +801,21 @@ class _Legend extends StatelessWidget {
           children: [
             _legendDot(
               AppColors.auroraStart,
-              L10nService.get('calendar.calendar_heatmap.journal', language),
+              L10nService.get(L10nKeys.calendarCalendarHeatmapJournal, language),
               mutedColor,
               dotSize,
             ),
             const SizedBox(width: 14),
             _legendDot(
               AppColors.starGold,
-              L10nService.get('calendar.calendar_heatmap.positive', language),
+              L10nService.get(L10nKeys.calendarCalendarHeatmapPositive, language),
               mutedColor,
               dotSize,
             ),
             const SizedBox(width: 14),
             _legendDot(
               AppColors.amethyst,
-              L10nService.get('calendar.calendar_heatmap.challenging', language),
+              L10nService.get(L10nKeys.calendarCalendarHeatmapChallenging, language),
               mutedColor,
               dotSize,
             ),
@@ -1019,7 +1019,7 @@ class _DayDetail extends StatelessWidget {
                 mainAxisAlignment: MainAxisAlignment.end,
                 children: [
                   Text(
-                    L10nService.get('calendar.calendar_heatmap.view_entry', language),
+                    L10nService.get(L10nKeys.calendarCalendarHeatmapViewEntry, language),
                     style: AppTypography.subtitle(
                       fontSize: 11,
                       color: AppColors.auroraStart,
@@ -1061,7 +1061,7 @@ class _DayDetail extends StatelessWidget {
             Icon(Icons.add_rounded, size: 16, color: AppColors.auroraStart),
             const SizedBox(width: 6),
             Text(
-              L10nService.get('calendar.calendar_heatmap.log_this_day', language),
+              L10nService.get(L10nKeys.calendarCalendarHeatmapLogThisDay, language),
               style: AppTypography.elegantAccent(
                 fontSize: 12,
                 color: AppColors.auroraStart,
@@ -1164,7 +1164,7 @@ class _DayDetail extends StatelessWidget {
             ),
             const SizedBox(width: 6),
             Text(
-              L10nService.get('calendar.calendar_heatmap.add_life_event', language),
+              L10nService.get(L10nKeys.calendarCalendarHeatmapAddLifeEvent, language),
               style: AppTypography.elegantAccent(
                 fontSize: 12,
                 color: AppColors.starGold,
@@ -1245,7 +1245,7 @@ class _YearHeatmap extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            '$year ${L10nService.get('calendar.calendar_heatmap.overview', language)}',
+            '$year ${L10nService.get(L10nKeys.calendarCalendarHeatmapOverview, language)}',
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -1339,7 +1339,7 @@ class _PremiumYearOverlay extends ConsumerWidget {
           Icon(Icons.calendar_today, size: 32, color: AppColors.starGold),
           const SizedBox(height: 12),
           GradientText(
-            L10nService.get('calendar.calendar_heatmap.year_heatmap', language),
+            L10nService.get(L10nKeys.calendarCalendarHeatmapYearHeatmap, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -1348,7 +1348,7 @@ class _PremiumYearOverlay extends ConsumerWidget {
           ),
           const SizedBox(height: 4),
           Text(
-            L10nService.get('calendar.calendar_heatmap.see_your_full_year_at_a_glance_with_pro', language),
+            L10nService.get(L10nKeys.calendarCalendarHeatmapSeeYourFullYearAtAGlanceWithPro, language),
             textAlign: TextAlign.center,
             style: AppTypography.decorativeScript(
               fontSize: 13,
@@ -1378,7 +1378,7 @@ class _PremiumYearOverlay extends ConsumerWidget {
                 ],
               ),
               child: Text(
-                L10nService.get('calendar.calendar_heatmap.upgrade_to_pro', language),
+                L10nService.get(L10nKeys.calendarCalendarHeatmapUpgradeToPro, language),
                 style: AppTypography.modernAccent(
                   fontSize: 14,
                   fontWeight: FontWeight.w700,
@@ -83,7 +83,7 @@ class _ChallengeHubScreenState extends ConsumerState<ChallengeHubScreen> {
                   icon: Icon(Icons.refresh_rounded,
                       size: 16, color: AppColors.starGold),
                   label: Text(
-                    L10nService.get('challenges.challenge_hub.retry', language),
+                    L10nService.get(L10nKeys.challengesChallengeHubRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -128,7 +128,7 @@ class _ChallengeHubScreenState extends ConsumerState<ChallengeHubScreen> {
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('challenges.challenge_hub.challenges', language),
+            title: L10nService.get(L10nKeys.challengesChallengeHubChallenges, language),
             showBackButton: false,
           ),
           SliverPadding(
@@ -148,7 +148,7 @@ class _ChallengeHubScreenState extends ConsumerState<ChallengeHubScreen> {
                 // Active Challenges
                 if (activeChallenges.isNotEmpty) ...[
                   _SectionTitle(
-                    title: L10nService.get('challenges.challenge_hub.active_challenges', language),
+                    title: L10nService.get(L10nKeys.challengesChallengeHubActiveChallenges, language),
                     isDark: isDark,
                   ).animate().fadeIn(duration: 400.ms, delay: 100.ms),
                   const SizedBox(height: AppConstants.spacingMd),
@@ -176,7 +176,7 @@ class _ChallengeHubScreenState extends ConsumerState<ChallengeHubScreen> {
 
                 // Available Challenges
                 _SectionTitle(
-                  title: L10nService.get('challenges.challenge_hub.available_challenges', language),
+                  title: L10nService.get(L10nKeys.challengesChallengeHubAvailableChallenges, language),
                   isDark: isDark,
                 ).animate().fadeIn(duration: 400.ms, delay: 200.ms),
                 const SizedBox(height: AppConstants.spacingMd),
@@ -365,19 +365,19 @@ class _StatsBar extends StatelessWidget {
         children: [
           _StatItem(
             value: '$active',
-            label: L10nService.get('challenges.challenge_hub.active', language),
+            label: L10nService.get(L10nKeys.challengesChallengeHubActive, language),
             color: AppColors.auroraStart,
             isDark: isDark,
           ),
           _StatItem(
             value: '$completed',
-            label: L10nService.get('challenges.challenge_hub.completed', language),
+            label: L10nService.get(L10nKeys.challengesChallengeHubCompleted, language),
             color: AppColors.success,
             isDark: isDark,
           ),
           _StatItem(
             value: '$total',
-            label: L10nService.get('challenges.challenge_hub.total', language),
+            label: L10nService.get(L10nKeys.challengesChallengeHubTotal, language),
             color: AppColors.starGold,
             isDark: isDark,
           ),
@@ -603,7 +603,7 @@ class _AvailableChallengeCard extends StatelessWidget {
           ),
           const SizedBox(height: AppConstants.spacingMd),
           GradientOutlinedButton(
-            label: L10nService.get('challenges.challenge_hub.start', language),
+            label: L10nService.get(L10nKeys.challengesChallengeHubStart, language),
             variant: GradientTextVariant.aurora,
             expanded: true,
             fontSize: 13,
@@ -45,7 +45,7 @@ class ChallengeListScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('challenges.challenge_list.growth_challenges', language),
+                  title: L10nService.get(L10nKeys.challengesChallengeListGrowthChallenges, language),
                 ),
                 SliverPadding(
                   padding: const EdgeInsets.all(16),
@@ -79,7 +79,7 @@ class ChallengeListScreen extends ConsumerWidget {
                                   color: AppColors.starGold,
                                 ),
                                 label: Text(
-                                  L10nService.get('challenges.challenge_list.retry', language),
+                                  L10nService.get(L10nKeys.challengesChallengeListRetry, language),
                                   style: AppTypography.elegantAccent(
                                     fontSize: 13,
                                     fontWeight: FontWeight.w600,
@@ -126,7 +126,7 @@ class ChallengeListScreen extends ConsumerWidget {
                           // Active challenges
                           if (active.isNotEmpty) ...[
                             _SectionTitle(
-                              title: L10nService.get('challenges.challenge_list.in_progress', language),
+                              title: L10nService.get(L10nKeys.challengesChallengeListInProgress, language),
                               isDark: isDark,
                             ),
                             const SizedBox(height: 10),
@@ -161,7 +161,7 @@ class ChallengeListScreen extends ConsumerWidget {
 
                           // Available challenges
                           _SectionTitle(
-                            title: L10nService.get('challenges.challenge_list.available', language),
+                            title: L10nService.get(L10nKeys.challengesChallengeListAvailable, language),
                             isDark: isDark,
                           ),
                           const SizedBox(height: 10),
@@ -194,7 +194,7 @@ class ChallengeListScreen extends ConsumerWidget {
                           if (completed.isNotEmpty) ...[
                             const SizedBox(height: 20),
                             _SectionTitle(
-                              title: L10nService.get('challenges.challenge_list.completed', language),
+                              title: L10nService.get(L10nKeys.challengesChallengeListCompleted, language),
                               isDark: isDark,
                             ),
                             const SizedBox(height: 10),
@@ -257,19 +257,19 @@ class _StatsBar extends StatelessWidget {
         children: [
           _StatItem(
             value: '$active',
-            label: L10nService.get('challenges.challenge_list.active', language),
+            label: L10nService.get(L10nKeys.challengesChallengeListActive, language),
             color: AppColors.starGold,
             isDark: isDark,
           ),
           _StatItem(
             value: '$completed',
-            label: L10nService.get('challenges.challenge_list.completed_1', language),
+            label: L10nService.get(L10nKeys.challengesChallengeListCompleted1, language),
             color: AppColors.success,
             isDark: isDark,
           ),
           _StatItem(
             value: '$total',
-            label: L10nService.get('challenges.challenge_list.total', language),
+            label: L10nService.get(L10nKeys.challengesChallengeListTotal, language),
             color: AppColors.auroraStart,
             isDark: isDark,
           ),
@@ -469,7 +469,7 @@ class _ChallengeCard extends StatelessWidget {
             const SizedBox(width: 8),
             if (hasProgress && onIncrement != null)
               Semantics(
-                label: L10nService.get('challenges.challenge_list.increment_progress', language),
+                label: L10nService.get(L10nKeys.challengesChallengeListIncrementProgress, language),
                 button: true,
                 child: GestureDetector(
                   onTap: onIncrement,
@@ -497,7 +497,7 @@ class _ChallengeCard extends StatelessWidget {
               )
             else if (!isCompleted && !hasProgress && onStart != null)
               Semantics(
-                label: L10nService.get('challenges.challenge_list.start_challenge', language),
+                label: L10nService.get(L10nKeys.challengesChallengeListStartChallenge, language),
                 button: true,
                 child: GestureDetector(
                   onTap: onStart,
@@ -513,7 +513,7 @@ class _ChallengeCard extends StatelessWidget {
                         borderRadius: BorderRadius.circular(12),
                       ),
                       child: Text(
-                        L10nService.get('challenges.challenge_list.start', language),
+                        L10nService.get(L10nKeys.challengesChallengeListStart, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 12,
                           color: AppColors.auroraStart,
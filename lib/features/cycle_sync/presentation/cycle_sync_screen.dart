@@ -50,7 +50,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                 mainAxisSize: MainAxisSize.min,
                 children: [
                   Text(
-                    L10nService.get('cycle_sync.cycle_sync.couldnt_load_your_cycle_data', language),
+                    L10nService.get(L10nKeys.cycleSyncCycleSyncCouldntLoadYourCycleData, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.subtitle(
                       color: isDark
@@ -65,7 +65,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('cycle_sync.cycle_sync.retry', language),
+                      L10nService.get(L10nKeys.cycleSyncCycleSyncRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -84,7 +84,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                   ),
                   slivers: [
                     GlassSliverAppBar(
-                      title: L10nService.get('cycle_sync.cycle_sync.cycle_sync', language),
+                      title: L10nService.get(L10nKeys.cycleSyncCycleSyncCycleSync, language),
                     ),
                     SliverPadding(
                       padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -191,7 +191,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
             ),
             const SizedBox(height: AppConstants.spacingMd),
             GradientText(
-              L10nService.get('cycle_sync.cycle_sync.start_tracking_your_cycle', language),
+              L10nService.get(L10nKeys.cycleSyncCycleSyncStartTrackingYourCycle, language),
               variant: GradientTextVariant.aurora,
               textAlign: TextAlign.center,
               style: AppTypography.displayFont.copyWith(
@@ -201,7 +201,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
             ),
             const SizedBox(height: 8),
             Text(
-              L10nService.get('cycle_sync.cycle_sync.log_your_period_to_see_how_your_emotiona', language),
+              L10nService.get(L10nKeys.cycleSyncCycleSyncLogYourPeriodToSeeHowYourEmotiona, language),
               style: AppTypography.subtitle(
                 fontSize: 14,
                 color: isDark
@@ -255,7 +255,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                     mainAxisSize: MainAxisSize.min,
                     children: [
                       Text(
-                        L10nService.get('cycle_sync.cycle_sync.day', language),
+                        L10nService.get(L10nKeys.cycleSyncCycleSyncDay, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 12,
                           color: isDark
@@ -272,7 +272,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                         ),
                       ),
                       Text(
-                        L10nService.getWithParams('cycle_sync.of_cycle_length', language, params: {'count': '$cycleLength'}),
+                        L10nService.getWithParams(L10nKeys.cycleSyncOfCycleLength, language, params: {'count': '$cycleLength'}),
                         style: AppTypography.elegantAccent(
                           fontSize: 12,
                           color: isDark
@@ -344,7 +344,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('cycle_sync.cycle_sync.cycle_overview', language),
+            L10nService.get(L10nKeys.cycleSyncCycleSyncCycleOverview, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.modernAccent(
               fontSize: 15,
@@ -356,7 +356,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
           _buildInfoRow(
             context,
             Icons.calendar_today_rounded,
-            L10nService.get('cycle_sync.cycle_sync.cycle_length', language),
+            L10nService.get(L10nKeys.cycleSyncCycleSyncCycleLength, language),
             isEn
                 ? '${cycleService.getAverageCycleLength()} days'
                 : '${cycleService.getAverageCycleLength()} gün',
@@ -366,7 +366,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
           _buildInfoRow(
             context,
             Icons.water_drop_outlined,
-            L10nService.get('cycle_sync.cycle_sync.period_length', language),
+            L10nService.get(L10nKeys.cycleSyncCycleSyncPeriodLength, language),
             isEn
                 ? '${cycleService.getAveragePeriodLength()} days'
                 : '${cycleService.getAveragePeriodLength()} gün',
@@ -377,8 +377,8 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
             _buildInfoRow(
               context,
               Icons.schedule_rounded,
-              L10nService.get('cycle_sync.cycle_sync.next_period', language),
-              L10nService.getWithParams('cycle_sync.in_n_days', language, params: {'count': '$daysUntil'}),
+              L10nService.get(L10nKeys.cycleSyncCycleSyncNextPeriod, language),
+              L10nService.getWithParams(L10nKeys.cycleSyncInNDays, language, params: {'count': '$daysUntil'}),
               isDark,
             ),
           ],
@@ -387,7 +387,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
             _buildInfoRow(
               context,
               Icons.insights_rounded,
-              L10nService.get('cycle_sync.cycle_sync.cycles_logged', language),
+              L10nService.get(L10nKeys.cycleSyncCycleSyncCyclesLogged, language),
               '${cycleService.getAllLogs().length}',
               isDark,
             ),
@@ -596,7 +596,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                 const SizedBox(width: 12),
                 Expanded(
                   child: Text(
-                    L10nService.get('cycle_sync.cycle_sync.add_more_entries_to_surface_cycleemotion', language),
+                    L10nService.get(L10nKeys.cycleSyncCycleSyncAddMoreEntriesToSurfaceCycleemotion, language),
                     style: AppTypography.decorativeScript(
                       fontSize: 13,
                       color: isDark
@@ -629,7 +629,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                   ),
                   const SizedBox(width: 8),
                   GradientText(
-                    L10nService.get('cycle_sync.cycle_sync.cycle_insight', language),
+                    L10nService.get(L10nKeys.cycleSyncCycleSyncCycleInsight, language),
                     variant: GradientTextVariant.aurora,
                     style: AppTypography.displayFont.copyWith(
                       fontSize: 12,
@@ -678,7 +678,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('cycle_sync.cycle_sync.phase_timeline', language),
+            L10nService.get(L10nKeys.cycleSyncCycleSyncPhaseTimeline, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.modernAccent(
               fontSize: 15,
@@ -827,7 +827,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
   Widget _buildLogPeriodFab(BuildContext context, bool isEn) {
     final language = ref.read(languageProvider);
     return Semantics(
-      label: L10nService.get('cycle_sync.cycle_sync.log_period_start', language),
+      label: L10nService.get(L10nKeys.cycleSyncCycleSyncLogPeriodStart, language),
       button: true,
       child: FloatingActionButton.extended(
         onPressed: () => _showLogPeriodSheet(context, isEn),
@@ -835,7 +835,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
         foregroundColor: Colors.white,
         icon: const Icon(Icons.water_drop_rounded),
         label: Text(
-          L10nService.get('cycle_sync.cycle_sync.log_period', language),
+          L10nService.get(L10nKeys.cycleSyncCycleSyncLogPeriod, language),
           style: AppTypography.modernAccent(fontWeight: FontWeight.w600),
         ),
       ),
@@ -890,7 +890,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                   ),
                   const SizedBox(height: 24),
                   GradientText(
-                    L10nService.get('cycle_sync.cycle_sync.log_period_start_1', language),
+                    L10nService.get(L10nKeys.cycleSyncCycleSyncLogPeriodStart1, language),
                     variant: GradientTextVariant.aurora,
                     style: AppTypography.modernAccent(
                       fontSize: 16,
@@ -899,7 +899,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                   ),
                   const SizedBox(height: 8),
                   Text(
-                    L10nService.get('cycle_sync.cycle_sync.mark_today_as_the_start_of_your_period', language),
+                    L10nService.get(L10nKeys.cycleSyncCycleSyncMarkTodayAsTheStartOfYourPeriod, language),
                     style: AppTypography.subtitle(
                       color: isDark
                           ? AppColors.textSecondary
@@ -942,7 +942,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                         ],
                       ),
                       child: Text(
-                        L10nService.get('cycle_sync.cycle_sync.period_started_today', language),
+                        L10nService.get(L10nKeys.cycleSyncCycleSyncPeriodStartedToday, language),
                         textAlign: TextAlign.center,
                         style: AppTypography.modernAccent(
                           fontSize: 16,
@@ -956,7 +956,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                   TextButton(
                     onPressed: () => Navigator.pop(ctx),
                     child: Text(
-                      L10nService.get('cycle_sync.cycle_sync.cancel', language),
+                      L10nService.get(L10nKeys.cycleSyncCycleSyncCancel, language),
                       style: AppTypography.subtitle(
                         color: isDark
                             ? AppColors.textMuted
@@ -1014,7 +1014,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                   Icon(Icons.lock_outline, size: 28, color: AppColors.starGold),
                   const SizedBox(height: 8),
                   Text(
-                    L10nService.get('cycle_sync.cycle_sync.unlock_deeper_cycle_insights', language),
+                    L10nService.get(L10nKeys.cycleSyncCycleSyncUnlockDeeperCycleInsights, language),
                     style: AppTypography.modernAccent(
                       fontSize: 15,
                       fontWeight: FontWeight.w600,
@@ -1025,7 +1025,7 @@ class _CycleSyncScreenState extends ConsumerState<CycleSyncScreen> {
                   ),
                   const SizedBox(height: 12),
                   GradientButton.gold(
-                    label: L10nService.get('common.upgrade_to_pro', language),
+                    label: L10nService.get(L10nKeys.commonUpgradeToPro, language),
                     onPressed: () => showContextualPaywall(
                       context,
                       ref,
@@ -62,7 +62,7 @@ class _MonthlyWrappedScreenState extends ConsumerState<MonthlyWrappedScreen> {
                   Padding(
                     padding: const EdgeInsets.symmetric(horizontal: 32),
                     child: Text(
-                      L10nService.get('digest.monthly_wrapped.keep_journaling_to_build_your_monthly_st', language),
+                      L10nService.get(L10nKeys.digestMonthlyWrappedKeepJournalingToBuildYourMonthlySt, language),
                       textAlign: TextAlign.center,
                       style: AppTypography.subtitle(
                         color: isDark
@@ -78,7 +78,7 @@ class _MonthlyWrappedScreenState extends ConsumerState<MonthlyWrappedScreen> {
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('digest.monthly_wrapped.retry', language),
+                      L10nService.get(L10nKeys.digestMonthlyWrappedRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -106,7 +106,7 @@ class _MonthlyWrappedScreenState extends ConsumerState<MonthlyWrappedScreen> {
                         AppSymbol('\u{1F4CA}', size: AppSymbolSize.xl),
                         const SizedBox(height: 16),
                         Text(
-                          L10nService.get('digest.monthly_wrapped.keep_journaling_your_monthly_wrapped_wil', language),
+                          L10nService.get(L10nKeys.digestMonthlyWrappedKeepJournalingYourMonthlyWrappedWil, language),
                           textAlign: TextAlign.center,
                           style: AppTypography.decorativeScript(
                             fontSize: 16,
@@ -118,7 +118,7 @@ class _MonthlyWrappedScreenState extends ConsumerState<MonthlyWrappedScreen> {
                         const SizedBox(height: 24),
                         TextButton(
                           onPressed: () => Navigator.of(context).pop(),
-                          child: Text(L10nService.get('digest.monthly_wrapped.go_back', language)),
+                          child: Text(L10nService.get(L10nKeys.digestMonthlyWrappedGoBack, language)),
                         ),
                       ],
                     ),
@@ -131,7 +131,7 @@ class _MonthlyWrappedScreenState extends ConsumerState<MonthlyWrappedScreen> {
                   // Page indicator
                   Semantics(
                     label:
-                        '${L10nService.get('digest.monthly_wrapped.slide', language)} ${_currentPage + 1} / 5',
+                        '${L10nService.get(L10nKeys.digestMonthlyWrappedSlide, language)} ${_currentPage + 1} / 5',
                     child: Padding(
                       padding: const EdgeInsets.symmetric(
                         horizontal: 40,
@@ -172,7 +172,7 @@ class _MonthlyWrappedScreenState extends ConsumerState<MonthlyWrappedScreen> {
                               ? AppColors.textMuted
                               : AppColors.lightTextMuted,
                         ),
-                        tooltip: L10nService.get('digest.monthly_wrapped.close', language),
+                        tooltip: L10nService.get(L10nKeys.digestMonthlyWrappedClose, language),
                         onPressed: () => Navigator.of(context).pop(),
                       ),
                     ),
@@ -244,7 +244,7 @@ class _Slide2Focus extends StatelessWidget {
 
   String _areaName(FocusArea? area, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
-    if (area == null) return L10nService.get('digest.monthly_wrapped.balanced', language);
+    if (area == null) return L10nService.get(L10nKeys.digestMonthlyWrappedBalanced, language);
     return area.localizedName(language);
   }
 
@@ -256,7 +256,7 @@ class _Slide2Focus extends StatelessWidget {
       title: isEn
           ? 'You focused most on ${_areaName(data.dominantArea, true)}'
           : 'En çok ${_areaName(data.dominantArea, false)} odağındaydın',
-      subtitle: L10nService.get('digest.monthly_wrapped.this_area_drew_your_attention_more_than', language),
+      subtitle: L10nService.get(L10nKeys.digestMonthlyWrappedThisAreaDrewYourAttentionMoreThan, language),
       isDark: isDark,
     );
   }
@@ -305,7 +305,7 @@ class _Slide4Insight extends StatelessWidget {
     return _SlideBase(
       emoji: '\u{1F4A1}',
       title: data.personalInsight(language),
-      subtitle: L10nService.get('digest.monthly_wrapped.based_on_your_monthly_patterns', language),
+      subtitle: L10nService.get(L10nKeys.digestMonthlyWrappedBasedOnYourMonthlyPatterns, language),
       isDark: isDark,
     );
   }
@@ -338,7 +338,7 @@ class _Slide5Share extends StatelessWidget {
           ),
           const SizedBox(height: 24),
           GradientText(
-            L10nService.get('digest.monthly_wrapped.your_month_at_a_glance', language),
+            L10nService.get(L10nKeys.digestMonthlyWrappedYourMonthAtAGlance, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 24,
@@ -347,7 +347,7 @@ class _Slide5Share extends StatelessWidget {
           ).animate().fadeIn(delay: 200.ms, duration: 400.ms),
           const SizedBox(height: 32),
           GradientButton.gold(
-            label: L10nService.get('digest.monthly_wrapped.share_your_month', language),
+            label: L10nService.get(L10nKeys.digestMonthlyWrappedShareYourMonth, language),
             icon: Icons.share_rounded,
             onPressed: () {
               final template = ShareCardTemplates.monthlyWrapped;
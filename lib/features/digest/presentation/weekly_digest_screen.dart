@@ -78,7 +78,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
       final file = File('${tempDir.path}/innercycles_weekly_digest.png');
       await file.writeAsBytes(bytes);
 
-      final shareText = L10nService.get('digest.weekly_digest.my_weekly_debrief_from_innercycles_inner', language);
+      final shareText = L10nService.get(L10nKeys.digestWeeklyDigestMyWeeklyDebriefFromInnercyclesInner, language);
 
       await SharePlus.instance.share(
         ShareParams(files: [XFile(file.path)], text: shareText),
@@ -225,15 +225,15 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('digest.weekly_digest.weekly_debrief', language),
+            title: L10nService.get(L10nKeys.digestWeeklyDigestWeeklyDebrief, language),
           ),
           SliverFillRemaining(
             hasScrollBody: false,
             child: Center(
               child: PremiumEmptyState(
                 icon: Icons.calendar_view_week_outlined,
-                title: L10nService.get('digest.weekly_digest.no_entries_this_week_yet', language),
-                description: L10nService.get('digest.weekly_digest.start_journaling_to_see_your_weekly_dige', language),
+                title: L10nService.get(L10nKeys.digestWeeklyDigestNoEntriesThisWeekYet, language),
+                description: L10nService.get(L10nKeys.digestWeeklyDigestStartJournalingToSeeYourWeeklyDige, language),
                 gradientVariant: GradientTextVariant.gold,
               ),
             ),
@@ -261,17 +261,17 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('digest.weekly_digest.weekly_debrief_1', language),
+            title: L10nService.get(L10nKeys.digestWeeklyDigestWeeklyDebrief1, language),
             actions: [
               Semantics(
                 button: true,
-                label: L10nService.get('digest.weekly_digest.share_weekly_debrief', language),
+                label: L10nService.get(L10nKeys.digestWeeklyDigestShareWeeklyDebrief, language),
                 child: IconButton(
                   onPressed: _isSharing ? null : () => _shareDigest(isEn),
                   icon: _isSharing
                       ? const CupertinoActivityIndicator(radius: 10)
                       : const Icon(Icons.ios_share, color: AppColors.starGold),
-                  tooltip: L10nService.get('digest.weekly_digest.share', language),
+                  tooltip: L10nService.get(L10nKeys.digestWeeklyDigestShare, language),
                 ),
               ),
             ],
@@ -440,7 +440,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
             const SizedBox(width: 12),
             Expanded(
               child: Text(
-                L10nService.get('digest.weekly_digest.view_monthly_wrapped', language),
+                L10nService.get(L10nKeys.digestWeeklyDigestViewMonthlyWrapped, language),
                 style: AppTypography.modernAccent(
                   fontSize: 14,
                   fontWeight: FontWeight.w600,
@@ -475,7 +475,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
         '${dateFormat.format(data.weekStart)} - ${dateFormat.format(data.weekEnd)}';
 
     return Semantics(
-      label: L10nService.getWithParams('digest.week_of_range', language, params: {'range': range}),
+      label: L10nService.getWithParams(L10nKeys.digestWeekOfRange, language, params: {'range': range}),
       child: Container(
         width: double.infinity,
         padding: const EdgeInsets.all(AppConstants.spacingXl),
@@ -494,7 +494,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
         child: Column(
           children: [
             Text(
-              L10nService.get('digest.weekly_digest.week_of', language),
+              L10nService.get(L10nKeys.digestWeeklyDigestWeekOf, language),
               style: AppTypography.elegantAccent(
                 fontSize: 13,
                 fontWeight: FontWeight.w500,
@@ -538,7 +538,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
     IconData comparisonIcon;
 
     if (!hasComparison) {
-      comparisonText = L10nService.get('digest.weekly_digest.first_week_tracked', language);
+      comparisonText = L10nService.get(L10nKeys.digestWeeklyDigestFirstWeekTracked, language);
       comparisonColor = AppColors.starGold;
       comparisonIcon = Icons.star_outline;
     } else if (diff > 0) {
@@ -554,7 +554,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
       comparisonColor = AppColors.warning;
       comparisonIcon = Icons.arrow_downward;
     } else {
-      comparisonText = L10nService.get('digest.weekly_digest.same_as_last_week', language);
+      comparisonText = L10nService.get(L10nKeys.digestWeeklyDigestSameAsLastWeek, language);
       comparisonColor = AppColors.starGold;
       comparisonIcon = Icons.horizontal_rule;
     }
@@ -605,7 +605,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
                 crossAxisAlignment: CrossAxisAlignment.start,
                 children: [
                   GradientText(
-                    L10nService.get('digest.weekly_digest.entries_this_week', language),
+                    L10nService.get(L10nKeys.digestWeeklyDigestEntriesThisWeek, language),
                     variant: GradientTextVariant.gold,
                     style: AppTypography.elegantAccent(
                       fontSize: 15,
@@ -654,7 +654,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
         Expanded(
           child: _StatCard(
             value: data.avgMoodRating.toStringAsFixed(1),
-            label: L10nService.get('digest.weekly_digest.avg_rating', language),
+            label: L10nService.get(L10nKeys.digestWeeklyDigestAvgRating, language),
             sublabel: '/5',
             icon: Icons.mood,
             color: _moodColor(data.avgMoodRating),
@@ -666,8 +666,8 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
         Expanded(
           child: _StatCard(
             value: '${data.streakDays}',
-            label: L10nService.get('digest.weekly_digest.day_streak', language),
-            sublabel: L10nService.get('digest.weekly_digest.days', language),
+            label: L10nService.get(L10nKeys.digestWeeklyDigestDayStreak, language),
+            sublabel: L10nService.get(L10nKeys.digestWeeklyDigestDays, language),
             icon: Icons.local_fire_department,
             color: AppColors.streakOrange,
             isDark: isDark,
@@ -724,7 +724,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
                 crossAxisAlignment: CrossAxisAlignment.start,
                 children: [
                   Text(
-                    L10nService.get('digest.weekly_digest.top_focus_area', language),
+                    L10nService.get(L10nKeys.digestWeeklyDigestTopFocusArea, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w500,
@@ -818,7 +818,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
                   Row(
                     children: [
                       GradientText(
-                        L10nService.get('digest.weekly_digest.mood_trend', language),
+                        L10nService.get(L10nKeys.digestWeeklyDigestMoodTrend, language),
                         variant: GradientTextVariant.gold,
                         style: AppTypography.elegantAccent(
                           fontSize: 15,
@@ -914,7 +914,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
                 crossAxisAlignment: CrossAxisAlignment.start,
                 children: [
                   Text(
-                    L10nService.get('digest.weekly_digest.best_day', language),
+                    L10nService.get(L10nKeys.digestWeeklyDigestBestDay, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w500,
@@ -982,7 +982,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           Text(
-            L10nService.get('digest.weekly_digest.focus_area_breakdown', language),
+            L10nService.get(L10nKeys.digestWeeklyDigestFocusAreaBreakdown, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
               color: isDark
@@ -1114,7 +1114,7 @@ class _WeeklyDigestScreenState extends ConsumerState<WeeklyDigestScreen> {
             ),
             const SizedBox(height: 12),
             Text(
-              L10nService.get('digest.weekly_digest.weekly_insight', language),
+              L10nService.get(L10nKeys.digestWeeklyDigestWeeklyInsight, language),
               style: AppTypography.elegantAccent(
                 fontSize: 13,
                 fontWeight: FontWeight.w600,
@@ -92,7 +92,7 @@ class DisclaimerScreen extends ConsumerWidget {
 
                 // ── Title ──
                 GradientText(
-                  L10nService.get('disclaimer.disclaimer.welcome_to_innercycles', language),
+                  L10nService.get(L10nKeys.disclaimerDisclaimerWelcomeToInnercycles, language),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 30,
                     fontWeight: FontWeight.w600,
@@ -109,7 +109,7 @@ class DisclaimerScreen extends ConsumerWidget {
 
                 // ── Subtitle ──
                 Text(
-                  L10nService.get('disclaimer.disclaimer.a_private_space_for_reflection_not_predi', language),
+                  L10nService.get(L10nKeys.disclaimerDisclaimerAPrivateSpaceForReflectionNotPredi, language),
                   style: AppTypography.decorativeScript(
                     fontSize: 15,
                     color: textColor,
@@ -133,7 +133,7 @@ class DisclaimerScreen extends ConsumerWidget {
                         child: Text(
                           isEn
                               ? 'InnerCycles is a personal journaling tool for self-reflection and pattern awareness.'
-                              : L10nService.get('disclaimer.text_1', language),
+                              : L10nService.get(L10nKeys.disclaimerText1, language),
                           style: AppTypography.subtitle(
                             fontSize: 15,
                             color: textColor,
@@ -164,7 +164,7 @@ class DisclaimerScreen extends ConsumerWidget {
                         child: Text(
                           isEn
                               ? 'All insights are based solely on your own journal entries. This app does not make predictions about your future.'
-                              : L10nService.get('disclaimer.text_2', language),
+                              : L10nService.get(L10nKeys.disclaimerText2, language),
                           style: AppTypography.subtitle(
                             fontSize: 15,
                             color: textColor,
@@ -195,7 +195,7 @@ class DisclaimerScreen extends ConsumerWidget {
                         child: Text(
                           isEn
                               ? 'This is for personal reflection only. It is not medical, psychological, or professional advice.'
-                              : L10nService.get('disclaimer.text_3', language),
+                              : L10nService.get(L10nKeys.disclaimerText3, language),
                           style: AppTypography.subtitle(
                             fontSize: 15,
                             color: textColor,
@@ -214,7 +214,7 @@ class DisclaimerScreen extends ConsumerWidget {
 
                 // ── CTA Button ──
                 GradientButton.gold(
-                  label: L10nService.get('common.continue', language),
+                  label: L10nService.get(L10nKeys.commonContinue, language),
                   icon: Icons.arrow_forward,
                   width: double.infinity,
                   onPressed: () async {
@@ -249,7 +249,7 @@ class DisclaimerScreen extends ConsumerWidget {
                     ),
                     const SizedBox(width: 6),
                     Text(
-                      L10nService.get('disclaimer.disclaimer.your_data_stays_on_your_device', language),
+                      L10nService.get(L10nKeys.disclaimerDisclaimerYourDataStaysOnYourDevice, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
                         color: AppColors.textMuted,
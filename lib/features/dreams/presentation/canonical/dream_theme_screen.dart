@@ -661,7 +661,7 @@ class DreamThemeScreen extends ConsumerWidget {
         body: CosmicBackground(
           child: Center(
             child: Text(
-              L10nService.get('dreams.canonical.dream_theme.dream_theme_not_found', language),
+              L10nService.get(L10nKeys.dreamsCanonicalDreamThemeDreamThemeNotFound, language),
               style: AppTypography.subtitle(
                 color: isDark
                     ? AppColors.textMuted
@@ -698,7 +698,7 @@ class DreamThemeScreen extends ConsumerWidget {
                   // Back button
                   IconButton(
                     onPressed: () => context.pop(),
-                    tooltip: L10nService.get('common.back', language),
+                    tooltip: L10nService.get(L10nKeys.commonBack, language),
                     icon: Icon(
                       Icons.chevron_left,
                       color: isDark ? AppColors.textMuted : AppColors.textDark,
@@ -730,7 +730,7 @@ class DreamThemeScreen extends ConsumerWidget {
                       borderRadius: BorderRadius.circular(12),
                     ),
                     child: Text(
-                      L10nService.get('dreams.canonical.brand_tag', language),
+                      L10nService.get(L10nKeys.dreamsCanonicalBrandTag, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
                         color: color,
@@ -777,7 +777,7 @@ class DreamThemeScreen extends ConsumerWidget {
                   // Footer with disclaimer
                   PageFooterWithDisclaimer(
                     brandText: L10nService.get(
-                      'dreams.canonical.brand_footer',
+                      L10nKeys.dreamsCanonicalBrandFooter,
                       language,
                     ),
                     disclaimerText: DisclaimerTexts.dreams(language),
@@ -876,7 +876,7 @@ class DreamThemeScreen extends ConsumerWidget {
                   crossAxisAlignment: CrossAxisAlignment.start,
                   children: [
                     Text(
-                      L10nService.get('common.also_discover', language),
+                      L10nService.get(L10nKeys.commonAlsoDiscover, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 11,
                         color: isDark ? Colors.white38 : AppColors.textLight,
@@ -133,7 +133,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
     final day = date.day.toString().padLeft(2, '0');
     final month = date.month.toString().padLeft(2, '0');
     final year = date.year;
-    return L10nService.getWithParams('common.date_format.mdy', language, params: {'month': month, 'day': day, 'year': '$year'});
+    return L10nService.getWithParams(L10nKeys.commonDateFormatMdy, language, params: {'month': month, 'day': day, 'year': '$year'});
   }
 
   @override
@@ -158,7 +158,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
                 mainAxisSize: MainAxisSize.min,
                 children: [
                   Text(
-                    L10nService.get('dreams.dream_archive.failed_to_load_dreams', language),
+                    L10nService.get(L10nKeys.dreamsDreamArchiveFailedToLoadDreams, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.decorativeScript(
                       color: isDark
@@ -173,7 +173,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('dreams.dream_archive.retry', language),
+                      L10nService.get(L10nKeys.dreamsDreamArchiveRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -220,7 +220,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
                     ),
                     slivers: [
                       GlassSliverAppBar(
-                        title: L10nService.get('dreams.dream_archive.dream_archive', language),
+                        title: L10nService.get(L10nKeys.dreamsDreamArchiveDreamArchive, language),
                       ),
 
                       SliverToBoxAdapter(
@@ -253,7 +253,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
                             children: [
                               Expanded(
                                 child: _StatTile(
-                                  label: L10nService.get('dreams.dream_archive.total', language),
+                                  label: L10nService.get(L10nKeys.dreamsDreamArchiveTotal, language),
                                   value: '$totalDreams',
                                   isDark: isDark,
                                 ),
@@ -261,7 +261,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
                               const SizedBox(width: AppConstants.spacingSm),
                               Expanded(
                                 child: _StatTile(
-                                  label: L10nService.get('dreams.dream_archive.recurring', language),
+                                  label: L10nService.get(L10nKeys.dreamsDreamArchiveRecurring, language),
                                   value: '$recurringCount',
                                   isDark: isDark,
                                 ),
@@ -269,7 +269,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
                               const SizedBox(width: AppConstants.spacingSm),
                               Expanded(
                                 child: _StatTile(
-                                  label: L10nService.get('dreams.dream_archive.lucid', language),
+                                  label: L10nService.get(L10nKeys.dreamsDreamArchiveLucid, language),
                                   value: '$lucidCount',
                                   isDark: isDark,
                                 ),
@@ -413,10 +413,10 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
                                         confirmDismiss: (_) async {
                                           final confirmed = await GlassDialog.confirm(
                                             context,
-                                            title: L10nService.get('dreams.dream_archive.delete_dream', language),
-                                            message: L10nService.get('dreams.dream_archive.this_dream_entry_will_be_permanently_del', language),
-                                            confirmLabel: L10nService.get('dreams.dream_archive.delete', language),
-                                            cancelLabel: L10nService.get('dreams.dream_archive.cancel', language),
+                                            title: L10nService.get(L10nKeys.dreamsDreamArchiveDeleteDream, language),
+                                            message: L10nService.get(L10nKeys.dreamsDreamArchiveThisDreamEntryWillBePermanentlyDel, language),
+                                            confirmLabel: L10nService.get(L10nKeys.dreamsDreamArchiveDelete, language),
+                                            cancelLabel: L10nService.get(L10nKeys.dreamsDreamArchiveCancel, language),
                                             isDestructive: true,
                                           );
                                           if (confirmed == true) {
@@ -572,7 +572,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
           color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
         ),
         decoration: InputDecoration(
-          hintText: L10nService.get('dreams.dream_archive.search_by_symbol_or_theme', language),
+          hintText: L10nService.get(L10nKeys.dreamsDreamArchiveSearchBySymbolOrTheme, language),
           hintStyle: AppTypography.subtitle(
             color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
           ),
@@ -582,7 +582,7 @@ class _DreamArchiveScreenState extends ConsumerState<DreamArchiveScreen> {
           ),
           suffixIcon: _searchQuery.isNotEmpty
               ? IconButton(
-                  tooltip: L10nService.get('dreams.dream_archive.clear_search', language),
+                  tooltip: L10nService.get(L10nKeys.dreamsDreamArchiveClearSearch, language),
                   icon: Icon(
                     Icons.cancel,
                     color: isDark
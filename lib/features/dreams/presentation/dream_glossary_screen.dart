@@ -94,42 +94,42 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
   List<_CategoryItem> _buildCategories(AppLanguage language) => [
     _CategoryItem(
       null,
-      L10nService.get('screens.dream_glossary.categories.all', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesAll, language),
       '',
     ),
     _CategoryItem(
       SymbolCategory.hayvan,
-      L10nService.get('screens.dream_glossary.categories.animals', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesAnimals, language),
       '',
     ),
     _CategoryItem(
       SymbolCategory.dogaOlayi,
-      L10nService.get('screens.dream_glossary.categories.nature', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesNature, language),
       '',
     ),
     _CategoryItem(
       SymbolCategory.insan,
-      L10nService.get('screens.dream_glossary.categories.people', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesPeople, language),
       '',
     ),
     _CategoryItem(
       SymbolCategory.mekan,
-      L10nService.get('screens.dream_glossary.categories.places', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesPlaces, language),
       '',
     ),
     _CategoryItem(
       SymbolCategory.eylem,
-      L10nService.get('screens.dream_glossary.categories.actions', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesActions, language),
       '',
     ),
     _CategoryItem(
       SymbolCategory.nesne,
-      L10nService.get('screens.dream_glossary.categories.objects', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesObjects, language),
       '',
     ),
     _CategoryItem(
       SymbolCategory.soyut,
-      L10nService.get('screens.dream_glossary.categories.abstract', language),
+      L10nService.get(L10nKeys.screensDreamGlossaryCategoriesAbstract, language),
       '',
     ),
   ];
@@ -301,7 +301,7 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
         children: [
           IconButton(
             onPressed: () => context.pop(),
-            tooltip: L10nService.get('common.back', language),
+            tooltip: L10nService.get(L10nKeys.commonBack, language),
             icon: const Icon(Icons.chevron_left, color: AppColors.textPrimary),
           ),
           const SizedBox(width: 8),
@@ -324,7 +324,7 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 Text(
-                  L10nService.get('screens.dream_glossary.title', language),
+                  L10nService.get(L10nKeys.screensDreamGlossaryTitle, language),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 22,
                     color: AppColors.textPrimary,
@@ -333,7 +333,7 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
                 ),
                 Text(
                   L10nService.get(
-                    'screens.dream_glossary.symbol_count',
+                    L10nKeys.screensDreamGlossarySymbolCount,
                     language,
                   ).replaceAll(
                     '{count}',
@@ -352,7 +352,7 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
             onPressed: () => _showPersonalDictionary(language),
             icon: const Icon(Icons.bookmark, color: CosmicPalette.starGold),
             tooltip: L10nService.get(
-              'screens.dream_glossary.personal_dictionary',
+              L10nKeys.screensDreamGlossaryPersonalDictionary,
               language,
             ),
           ),
@@ -385,7 +385,7 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
           onChanged: _onSearchChanged,
           decoration: InputDecoration(
             hintText: L10nService.get(
-              'screens.dream_glossary.search_hint',
+              L10nKeys.screensDreamGlossarySearchHint,
               language,
             ),
             hintStyle: AppTypography.subtitle(
@@ -464,7 +464,7 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
             const AppSymbol.hero('\u{1F50D}'),
             const SizedBox(height: 16),
             Text(
-              L10nService.get('screens.dream_glossary.no_results', language),
+              L10nService.get(L10nKeys.screensDreamGlossaryNoResults, language),
               style: AppTypography.displayFont.copyWith(
                 fontSize: 16,
                 fontWeight: FontWeight.w600,
@@ -474,7 +474,7 @@ class _DreamGlossaryScreenState extends ConsumerState<DreamGlossaryScreen>
             const SizedBox(height: 8),
             Text(
               L10nService.get(
-                'screens.dream_glossary.try_different_search',
+                L10nKeys.screensDreamGlossaryTryDifferentSearch,
                 language,
               ),
               style: AppTypography.decorativeScript(
@@ -908,7 +908,7 @@ class _SymbolDetailSheet extends StatelessWidget {
                     _buildSection(
                       context,
                       title: L10nService.get(
-                        'screens.dream_glossary.sections.universal_meanings',
+                        L10nKeys.screensDreamGlossarySectionsUniversalMeanings,
                         language,
                       ),
                       emoji: '\u{1F30D}',
@@ -921,7 +921,7 @@ class _SymbolDetailSheet extends StatelessWidget {
                     _buildSection(
                       context,
                       title: L10nService.get(
-                        'screens.dream_glossary.sections.light_aspect',
+                        L10nKeys.screensDreamGlossarySectionsLightAspect,
                         language,
                       ),
                       emoji: '\u{2728}',
@@ -933,7 +933,7 @@ class _SymbolDetailSheet extends StatelessWidget {
                     _buildSection(
                       context,
                       title: L10nService.get(
-                        'screens.dream_glossary.sections.shadow_aspect',
+                        L10nKeys.screensDreamGlossarySectionsShadowAspect,
                         language,
                       ),
                       emoji: '\u{1F311}',
@@ -1044,7 +1044,7 @@ class _SymbolDetailSheet extends StatelessWidget {
               const SizedBox(width: 8),
               GradientText(
                 L10nService.get(
-                  'screens.dream_glossary.sections.cultural_interpretations',
+                  L10nKeys.screensDreamGlossarySectionsCulturalInterpretations,
                   language,
                 ),
                 variant: GradientTextVariant.aurora,
@@ -1061,7 +1061,7 @@ class _SymbolDetailSheet extends StatelessWidget {
           _buildInterpretationRow(
             context,
             label: L10nService.get(
-              'screens.dream_glossary.interpretation_labels.turkish',
+              L10nKeys.screensDreamGlossaryInterpretationLabelsTurkish,
               language,
             ),
             content: _getTurkishInterpretation(),
@@ -1072,7 +1072,7 @@ class _SymbolDetailSheet extends StatelessWidget {
           _buildInterpretationRow(
             context,
             label: L10nService.get(
-              'screens.dream_glossary.interpretation_labels.islamic',
+              L10nKeys.screensDreamGlossaryInterpretationLabelsIslamic,
               language,
             ),
             content: _getIslamicInterpretation(),
@@ -1083,7 +1083,7 @@ class _SymbolDetailSheet extends StatelessWidget {
           _buildInterpretationRow(
             context,
             label: L10nService.get(
-              'screens.dream_glossary.interpretation_labels.western',
+              L10nKeys.screensDreamGlossaryInterpretationLabelsWestern,
               language,
             ),
             content: _getWesternInterpretation(),
@@ -1116,7 +1116,7 @@ class _SymbolDetailSheet extends StatelessWidget {
               const SizedBox(width: 8),
               Text(
                 L10nService.get(
-                  'screens.dream_glossary.sections.psychological_interpretations',
+                  L10nKeys.screensDreamGlossarySectionsPsychologicalInterpretations,
                   language,
                 ),
                 style: AppTypography.elegantAccent(
@@ -1133,7 +1133,7 @@ class _SymbolDetailSheet extends StatelessWidget {
           _buildInterpretationRow(
             context,
             label: L10nService.get(
-              'screens.dream_glossary.interpretation_labels.jung',
+              L10nKeys.screensDreamGlossaryInterpretationLabelsJung,
               language,
             ),
             content: _getJungianInterpretation(),
@@ -1144,7 +1144,7 @@ class _SymbolDetailSheet extends StatelessWidget {
           _buildInterpretationRow(
             context,
             label: L10nService.get(
-              'screens.dream_glossary.interpretation_labels.freud',
+              L10nKeys.screensDreamGlossaryInterpretationLabelsFreud,
               language,
             ),
             content: _getFreudianInterpretation(),
@@ -1219,7 +1219,7 @@ class _SymbolDetailSheet extends StatelessWidget {
               const SizedBox(width: 8),
               Text(
                 L10nService.get(
-                  'screens.dream_glossary.sections.related_symbols',
+                  L10nKeys.screensDreamGlossarySectionsRelatedSymbols,
                   language,
                 ),
                 style: AppTypography.elegantAccent(
@@ -1286,11 +1286,11 @@ class _SymbolDetailSheet extends StatelessWidget {
 
     final dreamedLabel = hasDreamed
         ? L10nService.get(
-            'screens.dream_glossary.dreamed_button.in_journal',
+            L10nKeys.screensDreamGlossaryDreamedButtonInJournal,
             language,
           )
         : L10nService.get(
-            'screens.dream_glossary.dreamed_button.i_dreamed_this',
+            L10nKeys.screensDreamGlossaryDreamedButtonIDreamedThis,
             language,
           );
 
@@ -1329,11 +1329,11 @@ class _SymbolDetailSheet extends StatelessWidget {
               Text(
                 hasDreamed
                     ? L10nService.get(
-                        'screens.dream_glossary.dreamed_button.in_journal',
+                        L10nKeys.screensDreamGlossaryDreamedButtonInJournal,
                         language,
                       )
                     : L10nService.get(
-                        'screens.dream_glossary.dreamed_button.i_dreamed_this',
+                        L10nKeys.screensDreamGlossaryDreamedButtonIDreamedThis,
                         language,
                       ),
                 style: AppTypography.modernAccent(
@@ -1356,7 +1356,7 @@ class _SymbolDetailSheet extends StatelessWidget {
         ? symbol.universalMeanings.first
         : symbol.symbol;
     return L10nService.get(
-          'screens.dream_glossary.interpretation_templates.turkish',
+          L10nKeys.screensDreamGlossaryInterpretationTemplatesTurkish,
           language,
         )
         .replaceAll('{symbol}', symbol.symbolTr.toLowerCase())
@@ -1366,7 +1366,7 @@ class _SymbolDetailSheet extends StatelessWidget {
   String _getIslamicInterpretation() {
     // Generate context-aware Islamic interpretation
     return L10nService.get(
-      'screens.dream_glossary.interpretation_templates.islamic',
+      L10nKeys.screensDreamGlossaryInterpretationTemplatesIslamic,
       language,
     ).replaceAll('{symbol}', symbol.symbolTr.toLowerCase());
   }
@@ -1374,7 +1374,7 @@ class _SymbolDetailSheet extends StatelessWidget {
   String _getWesternInterpretation() {
     // Generate context-aware Western interpretation
     return L10nService.get(
-          'screens.dream_glossary.interpretation_templates.western',
+          L10nKeys.screensDreamGlossaryInterpretationTemplatesWestern,
           language,
         )
         .replaceAll('{symbol}', symbol.symbolTr.toLowerCase())
@@ -1390,7 +1390,7 @@ class _SymbolDetailSheet extends StatelessWidget {
   String _getJungianInterpretation() {
     final archetypes = symbol.archetypes.join(', ');
     return L10nService.get(
-          'screens.dream_glossary.interpretation_templates.jungian',
+          L10nKeys.screensDreamGlossaryInterpretationTemplatesJungian,
           language,
         )
         .replaceAll('{symbol}', symbol.symbolTr)
@@ -1400,7 +1400,7 @@ class _SymbolDetailSheet extends StatelessWidget {
 
   String _getFreudianInterpretation() {
     return L10nService.get(
-      'screens.dream_glossary.interpretation_templates.freudian',
+      L10nKeys.screensDreamGlossaryInterpretationTemplatesFreudian,
       language,
     ).replaceAll('{symbol}', symbol.symbolTr.toLowerCase());
   }
@@ -1480,7 +1480,7 @@ class _PersonalDictionarySheet extends StatelessWidget {
                         children: [
                           Text(
                             L10nService.get(
-                              'screens.dream_glossary.personal_dictionary_sheet.title',
+                              L10nKeys.screensDreamGlossaryPersonalDictionarySheetTitle,
                               language,
                             ),
                             style: AppTypography.displayFont.copyWith(
@@ -1491,7 +1491,7 @@ class _PersonalDictionarySheet extends StatelessWidget {
                           ),
                           Text(
                             L10nService.get(
-                              'screens.dream_glossary.personal_dictionary_sheet.symbol_count',
+                              L10nKeys.screensDreamGlossaryPersonalDictionarySheetSymbolCount,
                               language,
                             ).replaceAll('{count}', '${dreamedSymbols.length}'),
                             style: AppTypography.subtitle(
@@ -1547,7 +1547,7 @@ class _PersonalDictionarySheet extends StatelessWidget {
           const SizedBox(height: 16),
           Text(
             L10nService.get(
-              'screens.dream_glossary.personal_dictionary_sheet.no_symbols_yet',
+              L10nKeys.screensDreamGlossaryPersonalDictionarySheetNoSymbolsYet,
               language,
             ),
             style: Theme.of(
@@ -1557,7 +1557,7 @@ class _PersonalDictionarySheet extends StatelessWidget {
           const SizedBox(height: 8),
           Text(
             L10nService.get(
-              'screens.dream_glossary.personal_dictionary_sheet.add_symbols_hint',
+              L10nKeys.screensDreamGlossaryPersonalDictionarySheetAddSymbolsHint,
               language,
             ),
             textAlign: TextAlign.center,
@@ -1622,7 +1622,7 @@ class _PersonalDictionarySheet extends StatelessWidget {
                           const SizedBox(width: 4),
                           Text(
                             L10nService.get(
-                              'screens.dream_glossary.personal_dictionary_sheet.times_count',
+                              L10nKeys.screensDreamGlossaryPersonalDictionarySheetTimesCount,
                               language,
                             ).replaceAll('{count}', '${entry.count}'),
                             style: AppTypography.subtitle(
@@ -1664,30 +1664,30 @@ class _PersonalDictionarySheet extends StatelessWidget {
 
     if (diff.inDays == 0) {
       return L10nService.get(
-        'screens.dream_glossary.date_formats.today',
+        L10nKeys.screensDreamGlossaryDateFormatsToday,
         language,
       );
     }
     if (diff.inDays == 1) {
       return L10nService.get(
-        'screens.dream_glossary.date_formats.yesterday',
+        L10nKeys.screensDreamGlossaryDateFormatsYesterday,
         language,
       );
     }
     if (diff.inDays < 7) {
       return L10nService.get(
-        'screens.dream_glossary.date_formats.days_ago',
+        L10nKeys.screensDreamGlossaryDateFormatsDaysAgo,
         language,
       ).replaceAll('{count}', '${diff.inDays}');
     }
     if (diff.inDays < 30) {
       return L10nService.get(
-        'screens.dream_glossary.date_formats.weeks_ago',
+        L10nKeys.screensDreamGlossaryDateFormatsWeeksAgo,
         language,
       ).replaceAll('{count}', '${diff.inDays ~/ 7}');
     }
     return L10nService.get(
-      'screens.dream_glossary.date_formats.months_ago',
+      L10nKeys.screensDreamGlossaryDateFormatsMonthsAgo,
       language,
     ).replaceAll('{count}', '${diff.inDays ~/ 30}');
   }
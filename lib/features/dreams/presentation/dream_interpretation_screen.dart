@@ -61,7 +61,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🌊',
         'text': L10nService.get(
-          'widgets.dreams.prompts.water_breathing',
+          L10nKeys.widgetsDreamsPromptsWaterBreathing,
           language,
         ),
         'category': 'su',
@@ -69,20 +69,20 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🌧️',
         'text': L10nService.get(
-          'widgets.dreams.prompts.rain_running',
+          L10nKeys.widgetsDreamsPromptsRainRunning,
           language,
         ),
         'category': 'su',
       },
       {
         'emoji': '🏊',
-        'text': L10nService.get('widgets.dreams.prompts.lake_diving', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsLakeDiving, language),
         'category': 'su',
       },
       {
         'emoji': '🌈',
         'text': L10nService.get(
-          'widgets.dreams.prompts.waterfall_passage',
+          L10nKeys.widgetsDreamsPromptsWaterfallPassage,
           language,
         ),
         'category': 'su',
@@ -92,7 +92,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🐍',
         'text': L10nService.get(
-          'widgets.dreams.prompts.snake_approaching',
+          L10nKeys.widgetsDreamsPromptsSnakeApproaching,
           language,
         ),
         'category': 'hayvan',
@@ -100,40 +100,40 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🦅',
         'text': L10nService.get(
-          'widgets.dreams.prompts.eagle_riding',
+          L10nKeys.widgetsDreamsPromptsEagleRiding,
           language,
         ),
         'category': 'hayvan',
       },
       {
         'emoji': '🐺',
-        'text': L10nService.get('widgets.dreams.prompts.wolf_pack', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsWolfPack, language),
         'category': 'hayvan',
       },
       {
         'emoji': '🦋',
         'text': L10nService.get(
-          'widgets.dreams.prompts.butterfly_transform',
+          L10nKeys.widgetsDreamsPromptsButterflyTransform,
           language,
         ),
         'category': 'hayvan',
       },
       {
         'emoji': '🐱',
-        'text': L10nService.get('widgets.dreams.prompts.talking_cat', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsTalkingCat, language),
         'category': 'hayvan',
       },
 
       // Flying & Falling dreams
       {
         'emoji': '🦸',
-        'text': L10nService.get('widgets.dreams.prompts.flying_free', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsFlyingFree, language),
         'category': 'ucmak',
       },
       {
         'emoji': '⬇️',
         'text': L10nService.get(
-          'widgets.dreams.prompts.falling_high',
+          L10nKeys.widgetsDreamsPromptsFallingHigh,
           language,
         ),
         'category': 'dusmek',
@@ -141,7 +141,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🎈',
         'text': L10nService.get(
-          'widgets.dreams.prompts.balloon_floating',
+          L10nKeys.widgetsDreamsPromptsBalloonFloating,
           language,
         ),
         'category': 'ucmak',
@@ -149,7 +149,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🪂',
         'text': L10nService.get(
-          'widgets.dreams.prompts.parachute_fail',
+          L10nKeys.widgetsDreamsPromptsParachuteFail,
           language,
         ),
         'category': 'dusmek',
@@ -159,7 +159,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🏃',
         'text': L10nService.get(
-          'widgets.dreams.prompts.running_stuck',
+          L10nKeys.widgetsDreamsPromptsRunningStuck,
           language,
         ),
         'category': 'kovalanmak',
@@ -167,7 +167,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '👤',
         'text': L10nService.get(
-          'widgets.dreams.prompts.shadow_follower',
+          L10nKeys.widgetsDreamsPromptsShadowFollower,
           language,
         ),
         'category': 'kovalanmak',
@@ -175,7 +175,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🚪',
         'text': L10nService.get(
-          'widgets.dreams.prompts.corridor_doors',
+          L10nKeys.widgetsDreamsPromptsCorridorDoors,
           language,
         ),
         'category': 'kovalanmak',
@@ -183,7 +183,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🌑',
         'text': L10nService.get(
-          'widgets.dreams.prompts.darkness_escape',
+          L10nKeys.widgetsDreamsPromptsDarknessEscape,
           language,
         ),
         'category': 'kovalanmak',
@@ -193,7 +193,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🏠',
         'text': L10nService.get(
-          'widgets.dreams.prompts.secret_rooms',
+          L10nKeys.widgetsDreamsPromptsSecretRooms,
           language,
         ),
         'category': 'ev',
@@ -201,20 +201,20 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🏚️',
         'text': L10nService.get(
-          'widgets.dreams.prompts.childhood_home',
+          L10nKeys.widgetsDreamsPromptsChildhoodHome,
           language,
         ),
         'category': 'ev',
       },
       {
         'emoji': '🏰',
-        'text': L10nService.get('widgets.dreams.prompts.palace_lost', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsPalaceLost, language),
         'category': 'ev',
       },
       {
         'emoji': '🛗',
         'text': L10nService.get(
-          'widgets.dreams.prompts.elevator_wrong',
+          L10nKeys.widgetsDreamsPromptsElevatorWrong,
           language,
         ),
         'category': 'ev',
@@ -224,20 +224,20 @@ class _DreamInterpretationScreenState
       {
         'emoji': '👨‍👩‍👧',
         'text': L10nService.get(
-          'widgets.dreams.prompts.deceased_relative',
+          L10nKeys.widgetsDreamsPromptsDeceasedRelative,
           language,
         ),
         'category': 'insan',
       },
       {
         'emoji': '💔',
-        'text': L10nService.get('widgets.dreams.prompts.ex_stranger', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsExStranger, language),
         'category': 'insan',
       },
       {
         'emoji': '👶',
         'text': L10nService.get(
-          'widgets.dreams.prompts.unknown_baby',
+          L10nKeys.widgetsDreamsPromptsUnknownBaby,
           language,
         ),
         'category': 'bebek',
@@ -245,7 +245,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '👰',
         'text': L10nService.get(
-          'widgets.dreams.prompts.wedding_blur',
+          L10nKeys.widgetsDreamsPromptsWeddingBlur,
           language,
         ),
         'category': 'gelin',
@@ -253,7 +253,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '👯',
         'text': L10nService.get(
-          'widgets.dreams.prompts.watching_self',
+          L10nKeys.widgetsDreamsPromptsWatchingSelf,
           language,
         ),
         'category': 'insan',
@@ -263,40 +263,40 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🦷',
         'text': L10nService.get(
-          'widgets.dreams.prompts.teeth_falling',
+          L10nKeys.widgetsDreamsPromptsTeethFalling,
           language,
         ),
         'category': 'dis',
       },
       {
         'emoji': '💇',
-        'text': L10nService.get('widgets.dreams.prompts.hair_change', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsHairChange, language),
         'category': 'beden',
       },
       {
         'emoji': '👁️',
         'text': L10nService.get(
-          'widgets.dreams.prompts.mirror_other',
+          L10nKeys.widgetsDreamsPromptsMirrorOther,
           language,
         ),
         'category': 'beden',
       },
       {
         'emoji': '🫀',
-        'text': L10nService.get('widgets.dreams.prompts.body_frozen', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsBodyFrozen, language),
         'category': 'beden',
       },
 
       // Element dreams
       {
         'emoji': '🔥',
-        'text': L10nService.get('widgets.dreams.prompts.fire_immune', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsFireImmune, language),
         'category': 'ates',
       },
       {
         'emoji': '⚡',
         'text': L10nService.get(
-          'widgets.dreams.prompts.lightning_power',
+          L10nKeys.widgetsDreamsPromptsLightningPower,
           language,
         ),
         'category': 'element',
@@ -304,14 +304,14 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🌪️',
         'text': L10nService.get(
-          'widgets.dreams.prompts.tornado_calm',
+          L10nKeys.widgetsDreamsPromptsTornadoCalm,
           language,
         ),
         'category': 'element',
       },
       {
         'emoji': '❄️',
-        'text': L10nService.get('widgets.dreams.prompts.ice_walking', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsIceWalking, language),
         'category': 'element',
       },
 
@@ -319,7 +319,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '📝',
         'text': L10nService.get(
-          'widgets.dreams.prompts.exam_unprepared',
+          L10nKeys.widgetsDreamsPromptsExamUnprepared,
           language,
         ),
         'category': 'sinav',
@@ -327,20 +327,20 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🎤',
         'text': L10nService.get(
-          'widgets.dreams.prompts.stage_voiceless',
+          L10nKeys.widgetsDreamsPromptsStageVoiceless,
           language,
         ),
         'category': 'sinav',
       },
       {
         'emoji': '🏃‍♂️',
-        'text': L10nService.get('widgets.dreams.prompts.race_stuck', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsRaceStuck, language),
         'category': 'sinav',
       },
       {
         'emoji': '🎭',
         'text': L10nService.get(
-          'widgets.dreams.prompts.acting_forgot',
+          L10nKeys.widgetsDreamsPromptsActingForgot,
           language,
         ),
         'category': 'sinav',
@@ -350,7 +350,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '💀',
         'text': L10nService.get(
-          'widgets.dreams.prompts.death_watching',
+          L10nKeys.widgetsDreamsPromptsDeathWatching,
           language,
         ),
         'category': 'olum',
@@ -358,7 +358,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '⚰️',
         'text': L10nService.get(
-          'widgets.dreams.prompts.funeral_crying',
+          L10nKeys.widgetsDreamsPromptsFuneralCrying,
           language,
         ),
         'category': 'olum',
@@ -366,7 +366,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🔄',
         'text': L10nService.get(
-          'widgets.dreams.prompts.death_rebirth',
+          L10nKeys.widgetsDreamsPromptsDeathRebirth,
           language,
         ),
         'category': 'olum',
@@ -374,7 +374,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '👻',
         'text': L10nService.get(
-          'widgets.dreams.prompts.ghost_invisible',
+          L10nKeys.widgetsDreamsPromptsGhostInvisible,
           language,
         ),
         'category': 'olum',
@@ -384,7 +384,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '💰',
         'text': L10nService.get(
-          'widgets.dreams.prompts.gold_uncollectable',
+          L10nKeys.widgetsDreamsPromptsGoldUncollectable,
           language,
         ),
         'category': 'para',
@@ -392,7 +392,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🏆',
         'text': L10nService.get(
-          'widgets.dreams.prompts.lottery_lost',
+          L10nKeys.widgetsDreamsPromptsLotteryLost,
           language,
         ),
         'category': 'para',
@@ -400,7 +400,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '💎',
         'text': L10nService.get(
-          'widgets.dreams.prompts.treasure_chest',
+          L10nKeys.widgetsDreamsPromptsTreasureChest,
           language,
         ),
         'category': 'para',
@@ -410,20 +410,20 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🚗',
         'text': L10nService.get(
-          'widgets.dreams.prompts.car_brakes_fail',
+          L10nKeys.widgetsDreamsPromptsCarBrakesFail,
           language,
         ),
         'category': 'araba',
       },
       {
         'emoji': '✈️',
-        'text': L10nService.get('widgets.dreams.prompts.plane_calm', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsPlaneCalm, language),
         'category': 'yolculuk',
       },
       {
         'emoji': '🚂',
         'text': L10nService.get(
-          'widgets.dreams.prompts.train_missed',
+          L10nKeys.widgetsDreamsPromptsTrainMissed,
           language,
         ),
         'category': 'yolculuk',
@@ -431,7 +431,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🛤️',
         'text': L10nService.get(
-          'widgets.dreams.prompts.endless_road',
+          L10nKeys.widgetsDreamsPromptsEndlessRoad,
           language,
         ),
         'category': 'yolculuk',
@@ -441,20 +441,20 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🔮',
         'text': L10nService.get(
-          'widgets.dreams.prompts.seeing_future',
+          L10nKeys.widgetsDreamsPromptsSeeingFuture,
           language,
         ),
         'category': 'sezgisel',
       },
       {
         'emoji': '👼',
-        'text': L10nService.get('widgets.dreams.prompts.angel_light', language),
+        'text': L10nService.get(L10nKeys.widgetsDreamsPromptsAngelLight, language),
         'category': 'sezgisel',
       },
       {
         'emoji': '🌙',
         'text': L10nService.get(
-          'widgets.dreams.prompts.moon_message',
+          L10nKeys.widgetsDreamsPromptsMoonMessage,
           language,
         ),
         'category': 'sezgisel',
@@ -462,7 +462,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '⭐',
         'text': L10nService.get(
-          'widgets.dreams.prompts.stars_rising',
+          L10nKeys.widgetsDreamsPromptsStarsRising,
           language,
         ),
         'category': 'sezgisel',
@@ -470,7 +470,7 @@ class _DreamInterpretationScreenState
       {
         'emoji': '🪬',
         'text': L10nService.get(
-          'widgets.dreams.prompts.portal_world',
+          L10nKeys.widgetsDreamsPromptsPortalWorld,
           language,
         ),
         'category': 'sezgisel',
@@ -529,7 +529,7 @@ class _DreamInterpretationScreenState
     final archetypeName = sign.localizedName(language);
 
     final welcomeText = L10nService.get(
-      'widgets.dreams.welcome_message',
+      L10nKeys.widgetsDreamsWelcomeMessage,
       language,
     ).replaceAll('{archetypeName}', archetypeName);
 
@@ -908,7 +908,7 @@ class _DreamInterpretationScreenState
     }
 
     final signPerspective = L10nService.getWithParams(
-      'widgets.dreams.interpretations.sign_perspective',
+      L10nKeys.widgetsDreamsInterpretationsSignPerspective,
       language,
       params: {'archetype': sign.localizedName(language)},
     );
@@ -955,29 +955,29 @@ class _DreamInterpretationScreenState
 
     if (signKey != null) {
       final title = L10nService.getWithParams(
-        'widgets.dreams.interpretations.water.title',
+        L10nKeys.widgetsDreamsInterpretationsWaterTitle,
         language,
         params: {'archetype': archetypeName},
       );
       final divider = L10nService.get(
-        'widgets.dreams.interpretations.water.divider',
+        L10nKeys.widgetsDreamsInterpretationsWaterDivider,
         language,
       );
       final basicLabel = L10nService.get(
-        'widgets.dreams.interpretations.water.basic_meaning_label',
+        L10nKeys.widgetsDreamsInterpretationsWaterBasicMeaningLabel,
         language,
       );
       final elementLabel = L10nService.getWithParams(
-        'widgets.dreams.interpretations.water.element_perspective_label',
+        L10nKeys.widgetsDreamsInterpretationsWaterElementPerspectiveLabel,
         language,
         params: {'element': elementName.toUpperCase()},
       );
       final psychLabel = L10nService.get(
-        'widgets.dreams.interpretations.water.psychological_label',
+        L10nKeys.widgetsDreamsInterpretationsWaterPsychologicalLabel,
         language,
       );
       final practiceLabel = L10nService.get(
-        'widgets.dreams.interpretations.water.practice_label',
+        L10nKeys.widgetsDreamsInterpretationsWaterPracticeLabel,
         language,
       );
 
@@ -1016,39 +1016,39 @@ $practice''';
 
     // Default interpretation for other signs
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.water.title',
+      L10nKeys.widgetsDreamsInterpretationsWaterTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final divider = L10nService.get(
-      'widgets.dreams.interpretations.water.divider',
+      L10nKeys.widgetsDreamsInterpretationsWaterDivider,
       language,
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.water.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsWaterBasicMeaningLabel,
       language,
     );
     final elementLabel = L10nService.getWithParams(
-      'widgets.dreams.interpretations.water.element_perspective_label',
+      L10nKeys.widgetsDreamsInterpretationsWaterElementPerspectiveLabel,
       language,
       params: {'element': elementName.toUpperCase()},
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.water.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsWaterPracticeLabel,
       language,
     );
 
     final basicMeaning = L10nService.getWithParams(
-      'widgets.dreams.interpretations.water.default.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsWaterDefaultBasicMeaning,
       language,
       params: {'element': elementName},
     );
     final elementPerspective = L10nService.get(
-      'widgets.dreams.interpretations.water.default.element_perspective',
+      L10nKeys.widgetsDreamsInterpretationsWaterDefaultElementPerspective,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.water.default.practice',
+      L10nKeys.widgetsDreamsInterpretationsWaterDefaultPractice,
       language,
     );
 
@@ -1076,57 +1076,57 @@ $practice''';
     );
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.flying.title',
+      L10nKeys.widgetsDreamsInterpretationsFlyingTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.flying.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsFlyingBasicMeaningLabel,
       language,
     );
     final basicMeaning = L10nService.get(
-      'widgets.dreams.interpretations.flying.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsFlyingBasicMeaning,
       language,
     );
     final specialLabel = L10nService.getWithParams(
-      'widgets.dreams.interpretations.flying.special_interpretation_label',
+      L10nKeys.widgetsDreamsInterpretationsFlyingSpecialInterpretationLabel,
       language,
       params: {'archetype': archetypeName},
     );
     final specialInterpretation = L10nService.get(
-      'widgets.dreams.interpretations.flying.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsFlyingSpecialInterpretation,
       language,
     );
     final psychLabel = L10nService.get(
-      'widgets.dreams.interpretations.flying.psychological_label',
+      L10nKeys.widgetsDreamsInterpretationsFlyingPsychologicalLabel,
       language,
     );
     final psychological = L10nService.get(
-      'widgets.dreams.interpretations.flying.psychological',
+      L10nKeys.widgetsDreamsInterpretationsFlyingPsychological,
       language,
     );
     final flightStyleLabel = L10nService.get(
-      'widgets.dreams.interpretations.flying.flight_style_label',
+      L10nKeys.widgetsDreamsInterpretationsFlyingFlightStyleLabel,
       language,
     );
     final flightStyle = L10nService.get(
-      'widgets.dreams.interpretations.flying.flight_style',
+      L10nKeys.widgetsDreamsInterpretationsFlyingFlightStyle,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.flying.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsFlyingPracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.flying.practice',
+      L10nKeys.widgetsDreamsInterpretationsFlyingPractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.flying.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsFlyingCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.getWithParams(
-      'widgets.dreams.interpretations.flying.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsFlyingCosmicMessage,
       language,
       params: {'element': elementName, 'element_message': elementMessage},
     );
@@ -1172,52 +1172,52 @@ $cosmicMessage''';
     final elementName = sign.element.localizedName(language);
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.falling.title',
+      L10nKeys.widgetsDreamsInterpretationsFallingTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.falling.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsFallingBasicMeaningLabel,
       language,
     );
     final basicMeaning = L10nService.get(
-      'widgets.dreams.interpretations.falling.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsFallingBasicMeaning,
       language,
     );
     final specialInterpretation = L10nService.get(
-      'widgets.dreams.interpretations.falling.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsFallingSpecialInterpretation,
       language,
     );
     final psychLabel = L10nService.get(
-      'widgets.dreams.interpretations.falling.psychological_label',
+      L10nKeys.widgetsDreamsInterpretationsFallingPsychologicalLabel,
       language,
     );
     final psychological = L10nService.get(
-      'widgets.dreams.interpretations.falling.psychological',
+      L10nKeys.widgetsDreamsInterpretationsFallingPsychological,
       language,
     );
     final attentionLabel = L10nService.get(
-      'widgets.dreams.interpretations.falling.attention_label',
+      L10nKeys.widgetsDreamsInterpretationsFallingAttentionLabel,
       language,
     );
     final attention = L10nService.get(
-      'widgets.dreams.interpretations.falling.attention',
+      L10nKeys.widgetsDreamsInterpretationsFallingAttention,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.falling.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsFallingPracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.falling.practice',
+      L10nKeys.widgetsDreamsInterpretationsFallingPractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.falling.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsFallingCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.getWithParams(
-      'widgets.dreams.interpretations.falling.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsFallingCosmicMessage,
       language,
       params: {'element': elementName},
     );
@@ -1249,52 +1249,52 @@ $cosmicMessage''';
     final archetypeName = sign.localizedName(language).toUpperCase();
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.death.title',
+      L10nKeys.widgetsDreamsInterpretationsDeathTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final notScaryLabel = L10nService.get(
-      'widgets.dreams.interpretations.death.not_scary_label',
+      L10nKeys.widgetsDreamsInterpretationsDeathNotScaryLabel,
       language,
     );
     final notScary = L10nService.get(
-      'widgets.dreams.interpretations.death.not_scary',
+      L10nKeys.widgetsDreamsInterpretationsDeathNotScary,
       language,
     );
     final specialInterpretation = L10nService.get(
-      'widgets.dreams.interpretations.death.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsDeathSpecialInterpretation,
       language,
     );
     final psychLabel = L10nService.get(
-      'widgets.dreams.interpretations.death.psychological_label',
+      L10nKeys.widgetsDreamsInterpretationsDeathPsychologicalLabel,
       language,
     );
     final psychological = L10nService.get(
-      'widgets.dreams.interpretations.death.psychological',
+      L10nKeys.widgetsDreamsInterpretationsDeathPsychological,
       language,
     );
     final transformLabel = L10nService.get(
-      'widgets.dreams.interpretations.death.transformation_label',
+      L10nKeys.widgetsDreamsInterpretationsDeathTransformationLabel,
       language,
     );
     final transformation = L10nService.get(
-      'widgets.dreams.interpretations.death.transformation',
+      L10nKeys.widgetsDreamsInterpretationsDeathTransformation,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.death.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsDeathPracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.death.practice',
+      L10nKeys.widgetsDreamsInterpretationsDeathPractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.death.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsDeathCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.getWithParams(
-      'widgets.dreams.interpretations.death.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsDeathCosmicMessage,
       language,
       params: {'archetype': sign.localizedName(language)},
     );
@@ -1327,53 +1327,53 @@ $cosmicMessage''';
     final elementName = sign.element.localizedName(language);
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.chase.title',
+      L10nKeys.widgetsDreamsInterpretationsChaseTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.chase.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsChaseBasicMeaningLabel,
       language,
     );
     final basicMeaning = L10nService.get(
-      'widgets.dreams.interpretations.chase.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsChaseBasicMeaning,
       language,
     );
     final specialInterpretation = L10nService.getWithParams(
-      'widgets.dreams.interpretations.chase.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsChaseSpecialInterpretation,
       language,
       params: {'element': elementName},
     );
     final psychLabel = L10nService.get(
-      'widgets.dreams.interpretations.chase.psychological_label',
+      L10nKeys.widgetsDreamsInterpretationsChasePsychologicalLabel,
       language,
     );
     final psychological = L10nService.get(
-      'widgets.dreams.interpretations.chase.psychological',
+      L10nKeys.widgetsDreamsInterpretationsChasePsychological,
       language,
     );
     final chaserLabel = L10nService.get(
-      'widgets.dreams.interpretations.chase.chaser_label',
+      L10nKeys.widgetsDreamsInterpretationsChaseChaserLabel,
       language,
     );
     final chaser = L10nService.get(
-      'widgets.dreams.interpretations.chase.chaser',
+      L10nKeys.widgetsDreamsInterpretationsChaseChaser,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.chase.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsChasePracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.chase.practice',
+      L10nKeys.widgetsDreamsInterpretationsChasePractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.chase.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsChaseCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.get(
-      'widgets.dreams.interpretations.chase.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsChaseCosmicMessage,
       language,
     );
 
@@ -1405,52 +1405,52 @@ $cosmicMessage''';
     final elementName = sign.element.localizedName(language);
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.animal.title',
+      L10nKeys.widgetsDreamsInterpretationsAnimalTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.animal.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsAnimalBasicMeaningLabel,
       language,
     );
     final basicMeaning = L10nService.get(
-      'widgets.dreams.interpretations.animal.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsAnimalBasicMeaning,
       language,
     );
     final specialInterpretation = L10nService.get(
-      'widgets.dreams.interpretations.animal.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsAnimalSpecialInterpretation,
       language,
     );
     final symbolsLabel = L10nService.get(
-      'widgets.dreams.interpretations.animal.common_symbols_label',
+      L10nKeys.widgetsDreamsInterpretationsAnimalCommonSymbolsLabel,
       language,
     );
     final symbols = L10nService.get(
-      'widgets.dreams.interpretations.animal.common_symbols',
+      L10nKeys.widgetsDreamsInterpretationsAnimalCommonSymbols,
       language,
     );
     final psychLabel = L10nService.get(
-      'widgets.dreams.interpretations.animal.psychological_label',
+      L10nKeys.widgetsDreamsInterpretationsAnimalPsychologicalLabel,
       language,
     );
     final psychological = L10nService.get(
-      'widgets.dreams.interpretations.animal.psychological',
+      L10nKeys.widgetsDreamsInterpretationsAnimalPsychological,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.animal.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsAnimalPracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.animal.practice',
+      L10nKeys.widgetsDreamsInterpretationsAnimalPractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.animal.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsAnimalCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.getWithParams(
-      'widgets.dreams.interpretations.animal.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsAnimalCosmicMessage,
       language,
       params: {'element': elementName},
     );
@@ -1483,53 +1483,53 @@ $cosmicMessage''';
     final elementName = sign.element.localizedName(language);
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.house.title',
+      L10nKeys.widgetsDreamsInterpretationsHouseTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.house.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsHouseBasicMeaningLabel,
       language,
     );
     final basicMeaning = L10nService.get(
-      'widgets.dreams.interpretations.house.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsHouseBasicMeaning,
       language,
     );
     final specialInterpretation = L10nService.getWithParams(
-      'widgets.dreams.interpretations.house.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsHouseSpecialInterpretation,
       language,
       params: {'element': elementName},
     );
     final roomLabel = L10nService.get(
-      'widgets.dreams.interpretations.house.room_meanings_label',
+      L10nKeys.widgetsDreamsInterpretationsHouseRoomMeaningsLabel,
       language,
     );
     final roomMeanings = L10nService.get(
-      'widgets.dreams.interpretations.house.room_meanings',
+      L10nKeys.widgetsDreamsInterpretationsHouseRoomMeanings,
       language,
     );
     final statesLabel = L10nService.get(
-      'widgets.dreams.interpretations.house.house_states_label',
+      L10nKeys.widgetsDreamsInterpretationsHouseHouseStatesLabel,
       language,
     );
     final houseStates = L10nService.get(
-      'widgets.dreams.interpretations.house.house_states',
+      L10nKeys.widgetsDreamsInterpretationsHouseHouseStates,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.house.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsHousePracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.house.practice',
+      L10nKeys.widgetsDreamsInterpretationsHousePractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.house.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsHouseCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.get(
-      'widgets.dreams.interpretations.house.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsHouseCosmicMessage,
       language,
     );
 
@@ -1566,60 +1566,60 @@ $cosmicMessage''';
     );
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.love.title',
+      L10nKeys.widgetsDreamsInterpretationsLoveTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.love.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsLoveBasicMeaningLabel,
       language,
     );
     final basicMeaning = L10nService.get(
-      'widgets.dreams.interpretations.love.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsLoveBasicMeaning,
       language,
     );
     final specialInterpretation = L10nService.get(
-      'widgets.dreams.interpretations.love.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsLoveSpecialInterpretation,
       language,
     );
     final typesLabel = L10nService.get(
-      'widgets.dreams.interpretations.love.dream_types_label',
+      L10nKeys.widgetsDreamsInterpretationsLoveDreamTypesLabel,
       language,
     );
     final types = L10nService.get(
-      'widgets.dreams.interpretations.love.dream_types',
+      L10nKeys.widgetsDreamsInterpretationsLoveDreamTypes,
       language,
     );
     final scenariosLabel = L10nService.get(
-      'widgets.dreams.interpretations.love.scenarios_label',
+      L10nKeys.widgetsDreamsInterpretationsLoveScenariosLabel,
       language,
     );
     final scenarios = L10nService.get(
-      'widgets.dreams.interpretations.love.scenarios',
+      L10nKeys.widgetsDreamsInterpretationsLoveScenarios,
       language,
     );
     final psychLabel = L10nService.get(
-      'widgets.dreams.interpretations.love.psychological_label',
+      L10nKeys.widgetsDreamsInterpretationsLovePsychologicalLabel,
       language,
     );
     final psychological = L10nService.get(
-      'widgets.dreams.interpretations.love.psychological',
+      L10nKeys.widgetsDreamsInterpretationsLovePsychological,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.love.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsLovePracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.love.practice',
+      L10nKeys.widgetsDreamsInterpretationsLovePractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.love.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsLoveCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.getWithParams(
-      'widgets.dreams.interpretations.love.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsLoveCosmicMessage,
       language,
       params: {'element': elementName, 'element_message': elementMessage},
     );
@@ -1660,60 +1660,60 @@ $cosmicMessage''';
     );
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.money.title',
+      L10nKeys.widgetsDreamsInterpretationsMoneyTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final basicLabel = L10nService.get(
-      'widgets.dreams.interpretations.money.basic_meaning_label',
+      L10nKeys.widgetsDreamsInterpretationsMoneyBasicMeaningLabel,
       language,
     );
     final basicMeaning = L10nService.get(
-      'widgets.dreams.interpretations.money.basic_meaning',
+      L10nKeys.widgetsDreamsInterpretationsMoneyBasicMeaning,
       language,
     );
     final specialInterpretation = L10nService.get(
-      'widgets.dreams.interpretations.money.special_interpretation',
+      L10nKeys.widgetsDreamsInterpretationsMoneySpecialInterpretation,
       language,
     );
     final typesLabel = L10nService.get(
-      'widgets.dreams.interpretations.money.dream_types_label',
+      L10nKeys.widgetsDreamsInterpretationsMoneyDreamTypesLabel,
       language,
     );
     final types = L10nService.get(
-      'widgets.dreams.interpretations.money.dream_types',
+      L10nKeys.widgetsDreamsInterpretationsMoneyDreamTypes,
       language,
     );
     final symbolsLabel = L10nService.get(
-      'widgets.dreams.interpretations.money.symbols_label',
+      L10nKeys.widgetsDreamsInterpretationsMoneySymbolsLabel,
       language,
     );
     final symbols = L10nService.get(
-      'widgets.dreams.interpretations.money.symbols',
+      L10nKeys.widgetsDreamsInterpretationsMoneySymbols,
       language,
     );
     final psychLabel = L10nService.get(
-      'widgets.dreams.interpretations.money.psychological_label',
+      L10nKeys.widgetsDreamsInterpretationsMoneyPsychologicalLabel,
       language,
     );
     final psychological = L10nService.get(
-      'widgets.dreams.interpretations.money.psychological',
+      L10nKeys.widgetsDreamsInterpretationsMoneyPsychological,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.money.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsMoneyPracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.money.practice',
+      L10nKeys.widgetsDreamsInterpretationsMoneyPractice,
       language,
     );
     final cosmicLabel = L10nService.get(
-      'widgets.dreams.interpretations.money.cosmic_message_label',
+      L10nKeys.widgetsDreamsInterpretationsMoneyCosmicMessageLabel,
       language,
     );
     final cosmicMessage = L10nService.getWithParams(
-      'widgets.dreams.interpretations.money.cosmic_message',
+      L10nKeys.widgetsDreamsInterpretationsMoneyCosmicMessage,
       language,
       params: {'element': elementName, 'element_message': elementMessage},
     );
@@ -1757,54 +1757,54 @@ $cosmicMessage''';
     );
 
     final title = L10nService.getWithParams(
-      'widgets.dreams.interpretations.generic.title',
+      L10nKeys.widgetsDreamsInterpretationsGenericTitle,
       language,
       params: {'archetype': archetypeName},
     );
     final subconLabel = L10nService.get(
-      'widgets.dreams.interpretations.generic.subconscious_label',
+      L10nKeys.widgetsDreamsInterpretationsGenericSubconsciousLabel,
       language,
     );
     final subconscious = L10nService.get(
-      'widgets.dreams.interpretations.generic.subconscious',
+      L10nKeys.widgetsDreamsInterpretationsGenericSubconscious,
       language,
     );
     final elementLabel = L10nService.getWithParams(
-      'widgets.dreams.interpretations.generic.element_perspective_label',
+      L10nKeys.widgetsDreamsInterpretationsGenericElementPerspectiveLabel,
       language,
       params: {'element': elementName.toUpperCase()},
     );
     final elementPerspective = L10nService.getWithParams(
-      'widgets.dreams.interpretations.generic.element_perspective',
+      L10nKeys.widgetsDreamsInterpretationsGenericElementPerspective,
       language,
       params: {'element': elementName, 'element_message': elementMessage},
     );
     final emotionLabel = L10nService.get(
-      'widgets.dreams.interpretations.generic.emotion_label',
+      L10nKeys.widgetsDreamsInterpretationsGenericEmotionLabel,
       language,
     );
     final emotion = L10nService.get(
-      'widgets.dreams.interpretations.generic.emotion',
+      L10nKeys.widgetsDreamsInterpretationsGenericEmotion,
       language,
     );
     final symbolLabel = L10nService.get(
-      'widgets.dreams.interpretations.generic.symbol_reading_label',
+      L10nKeys.widgetsDreamsInterpretationsGenericSymbolReadingLabel,
       language,
     );
     final symbolReading = L10nService.get(
-      'widgets.dreams.interpretations.generic.symbol_reading',
+      L10nKeys.widgetsDreamsInterpretationsGenericSymbolReading,
       language,
     );
     final practiceLabel = L10nService.get(
-      'widgets.dreams.interpretations.generic.practice_label',
+      L10nKeys.widgetsDreamsInterpretationsGenericPracticeLabel,
       language,
     );
     final practice = L10nService.get(
-      'widgets.dreams.interpretations.generic.practice',
+      L10nKeys.widgetsDreamsInterpretationsGenericPractice,
       language,
     );
     final adviceLabel = L10nService.getWithParams(
-      'widgets.dreams.interpretations.generic.advice_label',
+      L10nKeys.widgetsDreamsInterpretationsGenericAdviceLabel,
       language,
       params: {'archetype': archetypeName},
     );
@@ -1871,10 +1871,10 @@ ${_getPersonalAdvice(sign)}''';
     final language = ref.read(languageProvider);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('dreams.dream_interpretation.leave_conversation', language),
-      message: L10nService.get('dreams.dream_interpretation.you_have_an_active_dream_session_are_you', language),
-      cancelLabel: L10nService.get('dreams.dream_interpretation.cancel', language),
-      confirmLabel: L10nService.get('dreams.dream_interpretation.discard', language),
+      title: L10nService.get(L10nKeys.dreamsDreamInterpretationLeaveConversation, language),
+      message: L10nService.get(L10nKeys.dreamsDreamInterpretationYouHaveAnActiveDreamSessionAreYou, language),
+      cancelLabel: L10nService.get(L10nKeys.dreamsDreamInterpretationCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.dreamsDreamInterpretationDiscard, language),
       isDestructive: true,
     );
     if (confirmed == true && mounted) {
@@ -1933,7 +1933,7 @@ ${_getPersonalAdvice(sign)}''';
                 context.pop();
               }
             },
-            tooltip: L10nService.get('common.back', ref.read(languageProvider)),
+            tooltip: L10nService.get(L10nKeys.commonBack, ref.read(languageProvider)),
             icon: Icon(
               Icons.chevron_left,
               color: isDark
@@ -1983,7 +1983,7 @@ ${_getPersonalAdvice(sign)}''';
               children: [
                 Text(
                   L10nService.get(
-                    'dreams.interpretation_title',
+                    L10nKeys.dreamsInterpretationTitle,
                     ref.watch(languageProvider),
                   ),
                   style: AppTypography.displayFont.copyWith(
@@ -1996,7 +1996,7 @@ ${_getPersonalAdvice(sign)}''';
                 ),
                 Text(
                   L10nService.get(
-                    'dreams.interpretation_subtitle',
+                    L10nKeys.dreamsInterpretationSubtitle,
                     ref.watch(languageProvider),
                   ),
                   style: AppTypography.subtitle(
@@ -2034,7 +2034,7 @@ ${_getPersonalAdvice(sign)}''';
                 size: 20,
               ),
               tooltip: L10nService.get(
-                'dreams.symbols_found',
+                L10nKeys.dreamsSymbolsFound,
                 ref.watch(languageProvider),
               ),
             ),
@@ -2043,7 +2043,7 @@ ${_getPersonalAdvice(sign)}''';
             onPressed: () => _showDreamSymbolsSheet(context),
             icon: const Icon(Icons.auto_stories, color: AppColors.starGold),
             tooltip: L10nService.get(
-              'dreams.symbols_found',
+              L10nKeys.dreamsSymbolsFound,
               ref.watch(languageProvider),
             ),
           ),
@@ -2095,7 +2095,7 @@ ${_getPersonalAdvice(sign)}''';
                 const SizedBox(width: 8),
                 Text(
                   L10nService.get(
-                    'dreams.example_prompts_label',
+                    L10nKeys.dreamsExamplePromptsLabel,
                     ref.read(languageProvider),
                   ),
                   style: AppTypography.elegantAccent(
@@ -2175,7 +2175,7 @@ ${_getPersonalAdvice(sign)}''';
           Center(
             child: Text(
               L10nService.get(
-                'widgets.dreams.tap_or_write_hint',
+                L10nKeys.widgetsDreamsTapOrWriteHint,
                 ref.read(languageProvider),
               ),
               style: AppTypography.decorativeScript(
@@ -2255,7 +2255,7 @@ ${_getPersonalAdvice(sign)}''';
                             const SizedBox(width: 6),
                             Text(
                               L10nService.get(
-                                'widgets.dreams.interpretation_label',
+                                L10nKeys.widgetsDreamsInterpretationLabel,
                                 language,
                               ),
                               style: AppTypography.elegantAccent(
@@ -2280,7 +2280,7 @@ ${_getPersonalAdvice(sign)}''';
                             const SizedBox(width: 4),
                             Text(
                               L10nService.get(
-                                'widgets.dreams.question_label',
+                                L10nKeys.widgetsDreamsQuestionLabel,
                                 language,
                               ),
                               style: AppTypography.elegantAccent(
@@ -2319,7 +2319,7 @@ ${_getPersonalAdvice(sign)}''';
                           alignment: Alignment.centerRight,
                           child: Semantics(
                             button: true,
-                            label: L10nService.get('dreams.dream_interpretation.copy', language),
+                            label: L10nService.get(L10nKeys.dreamsDreamInterpretationCopy, language),
                             child: GestureDetector(
                               behavior: HitTestBehavior.opaque,
                               onTap: () {
@@ -2327,7 +2327,7 @@ ${_getPersonalAdvice(sign)}''';
                                 HapticService.buttonPress();
                                 ScaffoldMessenger.of(context).showSnackBar(
                                   SnackBar(
-                                    content: Text(L10nService.get('dreams.dream_interpretation.copied', language)),
+                                    content: Text(L10nService.get(L10nKeys.dreamsDreamInterpretationCopied, language)),
                                     duration: const Duration(seconds: 1),
                                     backgroundColor: AppColors.success,
                                   ),
@@ -2417,7 +2417,7 @@ ${_getPersonalAdvice(sign)}''';
                   crossAxisAlignment: CrossAxisAlignment.start,
                   children: [
                     Text(
-                      L10nService.get('dreams.dream_interpretation.psychological_perspectivennyour', language),
+                      L10nService.get(L10nKeys.dreamsDreamInterpretationPsychologicalPerspectivennyour, language),
                       style: AppTypography.decorativeScript(
                         fontSize: 13,
                         color: isDark
@@ -2479,7 +2479,7 @@ ${_getPersonalAdvice(sign)}''';
                     ),
                     const SizedBox(height: 4),
                     Text(
-                      L10nService.get('dreams.dream_interpretation.see_your_dream_through_every_lens', language),
+                      L10nService.get(L10nKeys.dreamsDreamInterpretationSeeYourDreamThroughEveryLens, language),
                       textAlign: TextAlign.center,
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
@@ -2490,7 +2490,7 @@ ${_getPersonalAdvice(sign)}''';
                     ),
                     const SizedBox(height: 12),
                     Semantics(
-                      label: L10nService.get('dreams.dream_interpretation.access_all_perspectives', language),
+                      label: L10nService.get(L10nKeys.dreamsDreamInterpretationAccessAllPerspectives, language),
                       button: true,
                       child: GestureDetector(
                         onTap: () => showContextualPaywall(
@@ -2522,7 +2522,7 @@ ${_getPersonalAdvice(sign)}''';
                             ],
                           ),
                           child: Text(
-                            L10nService.get('dreams.dream_interpretation.access_all_perspectives_1', language),
+                            L10nService.get(L10nKeys.dreamsDreamInterpretationAccessAllPerspectives1, language),
                             style: AppTypography.modernAccent(
                               fontSize: 13,
                               fontWeight: FontWeight.bold,
@@ -2634,7 +2634,7 @@ ${_getPersonalAdvice(sign)}''';
                       textInputAction: TextInputAction.send,
                       decoration: InputDecoration(
                         hintText: L10nService.get(
-                          'dreams.input_placeholder',
+                          L10nKeys.dreamsInputPlaceholder,
                           ref.read(languageProvider),
                         ),
                         hintStyle: AppTypography.subtitle(
@@ -2657,7 +2657,7 @@ ${_getPersonalAdvice(sign)}''';
               ),
               const SizedBox(width: 10),
               Semantics(
-                label: L10nService.get('dreams.dream_interpretation.send_message', language),
+                label: L10nService.get(L10nKeys.dreamsDreamInterpretationSendMessage, language),
                 button: true,
                 child:
                     GestureDetector(
@@ -2780,97 +2780,97 @@ class _DreamSymbolsSheet extends ConsumerWidget {
     final symbols = [
       {
         'emoji': '\u{1F40D}',
-        'name': L10nService.get('widgets.dreams.symbols.snake_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsSnakeName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.snake_meaning',
+          L10nKeys.widgetsDreamsSymbolsSnakeMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F30A}',
-        'name': L10nService.get('widgets.dreams.symbols.water_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsWaterName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.water_meaning',
+          L10nKeys.widgetsDreamsSymbolsWaterMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F525}',
-        'name': L10nService.get('widgets.dreams.symbols.fire_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsFireName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.fire_meaning',
+          L10nKeys.widgetsDreamsSymbolsFireMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F3E0}',
-        'name': L10nService.get('widgets.dreams.symbols.house_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsHouseName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.house_meaning',
+          L10nKeys.widgetsDreamsSymbolsHouseMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{2708}',
-        'name': L10nService.get('widgets.dreams.symbols.flying_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsFlyingName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.flying_meaning',
+          L10nKeys.widgetsDreamsSymbolsFlyingMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F319}',
-        'name': L10nService.get('widgets.dreams.symbols.moon_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsMoonName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.moon_meaning',
+          L10nKeys.widgetsDreamsSymbolsMoonMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{2600}',
-        'name': L10nService.get('widgets.dreams.symbols.sun_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsSunName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.sun_meaning',
+          L10nKeys.widgetsDreamsSymbolsSunMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F480}',
-        'name': L10nService.get('widgets.dreams.symbols.death_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsDeathName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.death_meaning',
+          L10nKeys.widgetsDreamsSymbolsDeathMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F436}',
-        'name': L10nService.get('widgets.dreams.symbols.dog_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsDogName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.dog_meaning',
+          L10nKeys.widgetsDreamsSymbolsDogMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F431}',
-        'name': L10nService.get('widgets.dreams.symbols.cat_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsCatName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.cat_meaning',
+          L10nKeys.widgetsDreamsSymbolsCatMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{1F4B0}',
-        'name': L10nService.get('widgets.dreams.symbols.money_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsMoneyName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.money_meaning',
+          L10nKeys.widgetsDreamsSymbolsMoneyMeaning,
           language,
         ),
       },
       {
         'emoji': '\u{2764}',
-        'name': L10nService.get('widgets.dreams.symbols.love_name', language),
+        'name': L10nService.get(L10nKeys.widgetsDreamsSymbolsLoveName, language),
         'meaning': L10nService.get(
-          'widgets.dreams.symbols.love_meaning',
+          L10nKeys.widgetsDreamsSymbolsLoveMeaning,
           language,
         ),
       },
@@ -2930,7 +2930,7 @@ class _DreamSymbolsSheet extends ConsumerWidget {
                     const SizedBox(width: 12),
                     GradientText(
                       L10nService.get(
-                        'widgets.dreams.symbols_guide_title',
+                        L10nKeys.widgetsDreamsSymbolsGuideTitle,
                         language,
                       ),
                       variant: GradientTextVariant.amethyst,
@@ -53,7 +53,7 @@ class EnergyMapScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('energy.energy_map.energy_profile', language),
+                  title: L10nService.get(L10nKeys.energyEnergyMapEnergyProfile, language),
                 ),
                 SliverToBoxAdapter(
                   child: Padding(
@@ -81,7 +81,7 @@ class EnergyMapScreen extends ConsumerWidget {
                           children: [
                             const SizedBox(height: 40),
                             Text(
-                              L10nService.get('energy.energy_map.could_not_load_your_local_data_is_unaffe', language),
+                              L10nService.get(L10nKeys.energyEnergyMapCouldNotLoadYourLocalDataIsUnaffe, language),
                               textAlign: TextAlign.center,
                               style: AppTypography.subtitle(
                                 fontSize: 14,
@@ -100,7 +100,7 @@ class EnergyMapScreen extends ConsumerWidget {
                                 color: AppColors.starGold,
                               ),
                               label: Text(
-                                L10nService.get('energy.energy_map.retry', language),
+                                L10nService.get(L10nKeys.energyEnergyMapRetry, language),
                                 style: AppTypography.elegantAccent(
                                   fontSize: 13,
                                   fontWeight: FontWeight.w600,
@@ -178,7 +178,7 @@ class _SummaryHeader extends StatelessWidget {
       child: Row(
         children: [
           _StatChip(
-            label: L10nService.get('energy.energy_map.average', language),
+            label: L10nService.get(L10nKeys.energyEnergyMapAverage, language),
             value: data.overallAverage > 0
                 ? data.overallAverage.toStringAsFixed(1)
                 : '-',
@@ -187,14 +187,14 @@ class _SummaryHeader extends StatelessWidget {
           ),
           const SizedBox(width: 12),
           _StatChip(
-            label: L10nService.get('energy.energy_map.best_day', language),
+            label: L10nService.get(L10nKeys.energyEnergyMapBestDay, language),
             value: _dayLabel(data.bestDay, isEn),
             color: AppColors.success,
             isDark: isDark,
           ),
           const SizedBox(width: 12),
           _StatChip(
-            label: L10nService.get('energy.energy_map.strongest', language),
+            label: L10nService.get(L10nKeys.energyEnergyMapStrongest, language),
             value: data.strongestArea != null
                 ? (isEn
                       ? data.strongestArea!.displayNameEn
@@ -287,7 +287,7 @@ class _HeatmapGrid extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('energy.energy_map.energy_by_day_area', language),
+            L10nService.get(L10nKeys.energyEnergyMapEnergyByDayArea, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -367,7 +367,7 @@ class _HeatmapGrid extends StatelessWidget {
             mainAxisAlignment: MainAxisAlignment.end,
             children: [
               Text(
-                L10nService.get('energy.energy_map.low', language),
+                L10nService.get(L10nKeys.energyEnergyMapLow, language),
                 style: AppTypography.subtitle(
                   fontSize: 10,
                   color: isDark
@@ -390,7 +390,7 @@ class _HeatmapGrid extends StatelessWidget {
               ),
               const SizedBox(width: 4),
               Text(
-                L10nService.get('energy.energy_map.high', language),
+                L10nService.get(L10nKeys.energyEnergyMapHigh, language),
                 style: AppTypography.subtitle(
                   fontSize: 10,
                   color: isDark
@@ -465,7 +465,7 @@ class _DailyChart extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('energy.energy_map.last_28_days', language),
+            L10nService.get(L10nKeys.energyEnergyMapLast28Days, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -507,7 +507,7 @@ class _DailyChart extends StatelessWidget {
             mainAxisAlignment: MainAxisAlignment.spaceBetween,
             children: [
               Text(
-                L10nService.get('energy.energy_map.4_weeks_ago', language),
+                L10nService.get(L10nKeys.energyEnergyMap4WeeksAgo, language),
                 style: AppTypography.subtitle(
                   fontSize: 10,
                   color: isDark
@@ -516,7 +516,7 @@ class _DailyChart extends StatelessWidget {
                 ),
               ),
               Text(
-                L10nService.get('energy.energy_map.today', language),
+                L10nService.get(L10nKeys.energyEnergyMapToday, language),
                 style: AppTypography.subtitle(
                   fontSize: 10,
                   color: isDark
@@ -600,7 +600,7 @@ class _InsightTips extends StatelessWidget {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('energy.energy_map.observations', language),
+                L10nService.get(L10nKeys.energyEnergyMapObservations, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 14,
@@ -685,10 +685,10 @@ class _EmptyState extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.grid_view_rounded,
-      title: L10nService.get('energy.energy_map.your_energy_map_is_taking_shape', language),
-      description: L10nService.get('energy.energy_map.add_at_least_5_entries_to_see_your_energ', language),
+      title: L10nService.get(L10nKeys.energyEnergyMapYourEnergyMapIsTakingShape, language),
+      description: L10nService.get(L10nKeys.energyEnergyMapAddAtLeast5EntriesToSeeYourEnerg, language),
       gradientVariant: GradientTextVariant.aurora,
-      ctaLabel: L10nService.get('energy.energy_map.write_first_entry', language),
+      ctaLabel: L10nService.get(L10nKeys.energyEnergyMapWriteFirstEntry, language),
       onCtaPressed: () => context.push(Routes.journal),
     );
   }
@@ -64,7 +64,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('export.export.export_data', language),
+                  title: L10nService.get(L10nKeys.exportExportExportData, language),
                 ),
                 SliverPadding(
                   padding: const EdgeInsets.all(20),
@@ -119,7 +119,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
                               mainAxisSize: MainAxisSize.min,
                               children: [
                                 Text(
-                                  L10nService.get('export.export.could_not_load_your_local_data_is_unaffe', language),
+                                  L10nService.get(L10nKeys.exportExportCouldNotLoadYourLocalDataIsUnaffe, language),
                                   textAlign: TextAlign.center,
                                   style: AppTypography.subtitle(
                                     color: isDark
@@ -133,7 +133,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
                                       ref.invalidate(exportServiceProvider),
                                   icon: Icon(Icons.refresh_rounded, size: 16, color: AppColors.starGold),
                                   label: Text(
-                                    L10nService.get('export.export.retry', language),
+                                    L10nService.get(L10nKeys.exportExportRetry, language),
                                     style: AppTypography.elegantAccent(
                                       fontSize: 13, fontWeight: FontWeight.w600, color: AppColors.starGold,
                                     ),
@@ -148,7 +148,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
 
                       // Format selector
                       Text(
-                        L10nService.get('export.export.export_format', language),
+                        L10nService.get(L10nKeys.exportExportExportFormat, language),
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 18,
                           fontWeight: FontWeight.w600,
@@ -161,8 +161,8 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
 
                       _FormatOption(
                         format: ExportFormat.text,
-                        title: L10nService.get('export.export.plain_text', language),
-                        subtitle: L10nService.get('export.export.humanreadable_format', language),
+                        title: L10nService.get(L10nKeys.exportExportPlainText, language),
+                        subtitle: L10nService.get(L10nKeys.exportExportHumanreadableFormat, language),
                         icon: Icons.text_snippet_outlined,
                         isSelected: _selectedFormat == ExportFormat.text,
                         isLocked: false,
@@ -175,7 +175,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
                       _FormatOption(
                         format: ExportFormat.csv,
                         title: 'CSV',
-                        subtitle: L10nService.get('export.export.spreadsheet_compatible', language),
+                        subtitle: L10nService.get(L10nKeys.exportExportSpreadsheetCompatible, language),
                         icon: Icons.table_chart_outlined,
                         isSelected: _selectedFormat == ExportFormat.csv,
                         isLocked: !isPremium,
@@ -197,7 +197,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
                       _FormatOption(
                         format: ExportFormat.json,
                         title: 'JSON',
-                        subtitle: L10nService.get('export.export.developerfriendly_format', language),
+                        subtitle: L10nService.get(L10nKeys.exportExportDeveloperfriendlyFormat, language),
                         icon: Icons.data_object_outlined,
                         isSelected: _selectedFormat == ExportFormat.json,
                         isLocked: !isPremium,
@@ -244,7 +244,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
 
                       // Export button
                       GradientButton.gold(
-                        label: L10nService.get('export.export.export_share', language),
+                        label: L10nService.get(L10nKeys.exportExportExportShare, language),
                         icon: Icons.file_download_outlined,
                         onPressed: _isExporting
                             ? null
@@ -257,7 +257,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
 
                       // Copy to clipboard button
                       GradientOutlinedButton(
-                        label: L10nService.get('export.export.copy_to_clipboard', language),
+                        label: L10nService.get(L10nKeys.exportExportCopyToClipboard, language),
                         icon: Icons.copy_outlined,
                         variant: GradientTextVariant.aurora,
                         expanded: true,
@@ -391,7 +391,7 @@ class _ExportScreenState extends ConsumerState<ExportScreen> {
     if (mounted) {
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(
-          content: Text(L10nService.get('export.export.export_data_copied_to_clipboard', language)),
+          content: Text(L10nService.get(L10nKeys.exportExportExportDataCopiedToClipboard, language)),
           backgroundColor: AppColors.success,
           behavior: SnackBarBehavior.floating,
           shape: RoundedRectangleBorder(
@@ -429,8 +429,8 @@ class _InfoCard extends StatelessWidget {
           Expanded(
             child: Text(
               isPremium
-                  ? (L10nService.get('export.export.export_your_full_journal_history_in_any', language))
-                  : (L10nService.get('export.export.free_last_7_days_as_text_upgrade_for_ful', language)),
+                  ? (L10nService.get(L10nKeys.exportExportExportYourFullJournalHistoryInAny, language))
+                  : (L10nService.get(L10nKeys.exportExportFreeLast7DaysAsTextUpgradeForFul, language)),
               style: AppTypography.decorativeScript(
                 fontSize: 13,
                 color: isDark
@@ -479,7 +479,7 @@ class _EntryCountCard extends StatelessWidget {
                 ),
               ),
               Text(
-                L10nService.get('export.export.total_entries', language),
+                L10nService.get(L10nKeys.exportExportTotalEntries, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 11,
                   color: isDark
@@ -500,7 +500,7 @@ class _EntryCountCard extends StatelessWidget {
                 ),
               ),
               Text(
-                L10nService.get('export.export.will_export', language),
+                L10nService.get(L10nKeys.exportExportWillExport, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 11,
                   color: isDark
@@ -603,7 +603,7 @@ class _LockedEntriesCta extends StatelessWidget {
                   borderRadius: BorderRadius.circular(16),
                 ),
                 child: Text(
-                  L10nService.get('export.export.access', language),
+                  L10nService.get(L10nKeys.exportExportAccess, language),
                   style: AppTypography.modernAccent(
                     fontSize: 12,
                     fontWeight: FontWeight.bold,
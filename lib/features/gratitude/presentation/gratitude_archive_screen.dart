@@ -73,7 +73,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
                       color: AppColors.starGold,
                     ),
                     label: Text(
-                      L10nService.get('gratitude.gratitude_archive.retry', language),
+                      L10nService.get(L10nKeys.gratitudeGratitudeArchiveRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -113,7 +113,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
         keyboardDismissBehavior: ScrollViewKeyboardDismissBehavior.onDrag,
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('gratitude.gratitude_archive.gratitude_archive', language),
+            title: L10nService.get(L10nKeys.gratitudeGratitudeArchiveGratitudeArchive, language),
           ),
           SliverFillRemaining(
             hasScrollBody: false,
@@ -158,7 +158,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
         keyboardDismissBehavior: ScrollViewKeyboardDismissBehavior.onDrag,
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('gratitude.gratitude_archive.gratitude_archive_1', language),
+            title: L10nService.get(L10nKeys.gratitudeGratitudeArchiveGratitudeArchive1, language),
           ),
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -256,7 +256,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
       children: [
         Expanded(
           child: _StatTile(
-            label: L10nService.get('gratitude.gratitude_archive.total_days', language),
+            label: L10nService.get(L10nKeys.gratitudeGratitudeArchiveTotalDays, language),
             value: '$total',
             isDark: isDark,
           ),
@@ -264,7 +264,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('gratitude.gratitude_archive.this_week', language),
+            label: L10nService.get(L10nKeys.gratitudeGratitudeArchiveThisWeek, language),
             value: '${summary.daysWithGratitude}',
             isDark: isDark,
           ),
@@ -272,7 +272,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('gratitude.gratitude_archive.week_items', language),
+            label: L10nService.get(L10nKeys.gratitudeGratitudeArchiveWeekItems, language),
             value: '${summary.totalItems}',
             isDark: isDark,
           ),
@@ -300,7 +300,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           Text(
-            L10nService.get('gratitude.gratitude_archive.recurring_themes', language),
+            L10nService.get(L10nKeys.gratitudeGratitudeArchiveRecurringThemes, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
               color: isDark
@@ -405,7 +405,7 @@ class _GratitudeArchiveScreenState extends ConsumerState<GratitudeArchiveScreen>
           ),
           const Spacer(),
           Text(
-            L10nService.getWithParams('gratitude.archive.entry_count', language, params: {'count': '$count'}),
+            L10nService.getWithParams(L10nKeys.gratitudeArchiveEntryCount, language, params: {'count': '$count'}),
             style: AppTypography.elegantAccent(
               fontSize: 12,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -85,7 +85,7 @@ class _GratitudeScreenState extends ConsumerState<GratitudeScreen> {
                 keyboardDismissBehavior: ScrollViewKeyboardDismissBehavior.onDrag,
                 slivers: [
                   GlassSliverAppBar(
-                    title: L10nService.get('gratitude.gratitude.gratitude_journal', language),
+                    title: L10nService.get(L10nKeys.gratitudeGratitudeGratitudeJournal, language),
                   ),
                   SliverPadding(
                     padding: const EdgeInsets.all(16),
@@ -116,7 +116,7 @@ class _GratitudeScreenState extends ConsumerState<GratitudeScreen> {
                                   icon: Icon(Icons.refresh_rounded,
                                       size: 16, color: AppColors.starGold),
                                   label: Text(
-                                    L10nService.get('gratitude.gratitude.retry', language),
+                                    L10nService.get(L10nKeys.gratitudeGratitudeRetry, language),
                                     style: AppTypography.elegantAccent(
                                       fontSize: 13,
                                       fontWeight: FontWeight.w600,
@@ -215,7 +215,7 @@ class _GratitudeScreenState extends ConsumerState<GratitudeScreen> {
                             // History
                             if (allEntries.isNotEmpty) ...[
                               GradientText(
-                                L10nService.get('gratitude.gratitude.history', language),
+                                L10nService.get(L10nKeys.gratitudeGratitudeHistory, language),
                                 variant: GradientTextVariant.gold,
                                 style: AppTypography.displayFont.copyWith(
                                   fontSize: 18,
@@ -277,19 +277,19 @@ class _WeeklyStats extends StatelessWidget {
         children: [
           _Stat(
             value: '${summary.daysWithGratitude}',
-            label: L10nService.get('gratitude.gratitude.days', language),
+            label: L10nService.get(L10nKeys.gratitudeGratitudeDays, language),
             color: AppColors.starGold,
             isDark: isDark,
           ),
           _Stat(
             value: '${summary.totalItems}',
-            label: L10nService.get('gratitude.gratitude.items', language),
+            label: L10nService.get(L10nKeys.gratitudeGratitudeItems, language),
             color: AppColors.success,
             isDark: isDark,
           ),
           _Stat(
             value: '${summary.topThemes.length}',
-            label: L10nService.get('gratitude.gratitude.themes', language),
+            label: L10nService.get(L10nKeys.gratitudeGratitudeThemes, language),
             color: AppColors.auroraStart,
             isDark: isDark,
           ),
@@ -408,7 +408,7 @@ class _TodaySectionState extends State<_TodaySection> {
               Icon(Icons.favorite_outline, size: 18, color: AppColors.starGold),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('gratitude.todays_gratitude', language),
+                L10nService.get(L10nKeys.gratitudeTodaysGratitude, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 17,
@@ -514,8 +514,8 @@ class _TodaySectionState extends State<_TodaySection> {
           const SizedBox(height: 4),
           GradientButton.gold(
             label: widget.hasEntry
-                ? (L10nService.get('gratitude.gratitude.update', language))
-                : (L10nService.get('gratitude.gratitude.save_gratitude', language)),
+                ? (L10nService.get(L10nKeys.gratitudeGratitudeUpdate, language))
+                : (L10nService.get(L10nKeys.gratitudeGratitudeSaveGratitude, language)),
             onPressed: widget.onSave,
             expanded: true,
           ),
@@ -547,7 +547,7 @@ class _ThemeCloud extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('gratitude.gratitude.this_weeks_themes', language),
+            L10nService.get(L10nKeys.gratitudeGratitudeThisWeeksThemes, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -121,7 +121,7 @@ class _GratitudeSectionState extends ConsumerState<GratitudeSection> {
                           crossAxisAlignment: CrossAxisAlignment.start,
                           children: [
                             GradientText(
-                              L10nService.get('gratitude.gratitude.gratitude', language),
+                              L10nService.get(L10nKeys.gratitudeGratitudeGratitude, language),
                               variant: GradientTextVariant.gold,
                               style: AppTypography.displayFont.copyWith(
                                 fontSize: 15,
@@ -129,7 +129,7 @@ class _GratitudeSectionState extends ConsumerState<GratitudeSection> {
                               ),
                             ),
                             Text(
-                              L10nService.get('gratitude.gratitude.what_went_well_today', language),
+                              L10nService.get(L10nKeys.gratitudeGratitudeWhatWentWellToday, language),
                               style: AppTypography.decorativeScript(
                                 fontSize: 12,
                                 color: isDark
@@ -207,7 +207,7 @@ class _GratitudeSectionState extends ConsumerState<GratitudeSection> {
                             : AppColors.lightTextPrimary,
                       ),
                       decoration: InputDecoration(
-                        hintText: L10nService.get('gratitude.gratitude.im_grateful_for', language),
+                        hintText: L10nService.get(L10nKeys.gratitudeGratitudeImGratefulFor, language),
                         hintStyle: AppTypography.subtitle(
                           fontSize: 14,
                           color: isDark
@@ -237,7 +237,7 @@ class _GratitudeSectionState extends ConsumerState<GratitudeSection> {
               },
               icon: Icon(Icons.add, size: 18, color: AppColors.success),
               label: Text(
-                L10nService.get('gratitude.gratitude.add_another', language),
+                L10nService.get(L10nKeys.gratitudeGratitudeAddAnother, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 13,
                   color: AppColors.success,
@@ -259,7 +259,7 @@ class _GratitudeSectionState extends ConsumerState<GratitudeSection> {
                   const SizedBox(width: 8),
                   Expanded(
                     child: Text(
-                      L10nService.get('gratitude.gratitude.premium_add_up_to_3_gratitude_items_them', language),
+                      L10nService.get(L10nKeys.gratitudeGratitudePremiumAddUpTo3GratitudeItemsThem, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
                         color: AppColors.starGold,
@@ -339,7 +339,7 @@ class _GratitudeSummaryContent extends StatelessWidget {
               Icon(Icons.favorite_rounded, size: 18, color: AppColors.success),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('gratitude.gratitude.this_weeks_gratitude', language),
+                L10nService.get(L10nKeys.gratitudeGratitudeThisWeeksGratitude, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 14,
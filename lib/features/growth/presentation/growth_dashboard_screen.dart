@@ -104,7 +104,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
                       icon: Icon(Icons.refresh_rounded,
                           size: 16, color: AppColors.starGold),
                       label: Text(
-                        L10nService.get('growth.growth_dashboard.retry', language),
+                        L10nService.get(L10nKeys.growthGrowthDashboardRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -176,7 +176,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('growth.growth_dashboard.your_growth', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.growthGrowthDashboardYourGrowth, language)),
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
             sliver: SliverList(
@@ -401,7 +401,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
                         ),
                         const SizedBox(height: 4),
                         Text(
-                          L10nService.get('growth.growth_dashboard.growth_score', language),
+                          L10nService.get(L10nKeys.growthGrowthDashboardGrowthScore, language),
                           style: AppTypography.elegantAccent(
                             fontSize: 13,
                             color: Colors.white.withValues(alpha: 0.85),
@@ -434,13 +434,13 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
   String _getScoreMessage(int score, bool isEn) {
     final language = ref.read(languageProvider);
     if (score >= 80) {
-      return L10nService.get('growth.growth_dashboard.outstanding_you_are_deeply_committed_to', language);
+      return L10nService.get(L10nKeys.growthGrowthDashboardOutstandingYouAreDeeplyCommittedTo, language);
     } else if (score >= 60) {
-      return L10nService.get('growth.growth_dashboard.great_progress_keep_building_your_habits', language);
+      return L10nService.get(L10nKeys.growthGrowthDashboardGreatProgressKeepBuildingYourHabits, language);
     } else if (score >= 30) {
-      return L10nService.get('growth.growth_dashboard.good_start_every_entry_brings_you_closer', language);
+      return L10nService.get(L10nKeys.growthGrowthDashboardGoodStartEveryEntryBringsYouCloser, language);
     } else {
-      return L10nService.get('growth.growth_dashboard.begin_your_progress_one_entry_at_a_time', language);
+      return L10nService.get(L10nKeys.growthGrowthDashboardBeginYourProgressOneEntryAtATime, language);
     }
   }
 
@@ -482,7 +482,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
               ),
               const SizedBox(width: 8),
               Text(
-                L10nService.get('growth.growth_dashboard.days', language),
+                L10nService.get(L10nKeys.growthGrowthDashboardDays, language),
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 20,
                   fontWeight: FontWeight.w600,
@@ -496,7 +496,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
           const SizedBox(height: 8),
           // Longest streak
           Text(
-            L10nService.getWithParams('growth.best_streak_days', language, params: {'count': '$longestStreak'}),
+            L10nService.getWithParams(L10nKeys.growthBestStreakDays, language, params: {'count': '$longestStreak'}),
             style: AppTypography.elegantAccent(
               fontSize: 14,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -609,7 +609,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('growth.growth_dashboard.milestones', language),
+          L10nService.get(L10nKeys.growthGrowthDashboardMilestones, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.modernAccent(
             fontSize: 15,
@@ -765,13 +765,13 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
     return [
       _Milestone(
         icon: Icons.edit_note,
-        title: L10nService.get('growth.growth_dashboard.first_entry', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardFirstEntry, language),
         unlocked: entries.isNotEmpty,
-        progressHint: L10nService.get('growth.growth_dashboard.1_entry_to_activate', language),
+        progressHint: L10nService.get(L10nKeys.growthGrowthDashboard1EntryToActivate, language),
       ),
       _Milestone(
         icon: Icons.local_fire_department,
-        title: L10nService.get('growth.growth_dashboard.7day_observer', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboard7dayObserver, language),
         unlocked: maxStreak >= 7,
         progressHint: maxStreak < 7
             ? isEn
@@ -781,7 +781,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       ),
       _Milestone(
         icon: Icons.auto_graph,
-        title: L10nService.get('growth.growth_dashboard.pattern_seeker', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardPatternSeeker, language),
         unlocked: entries.length >= 7,
         progressHint: entries.length < 7
             ? isEn
@@ -791,7 +791,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       ),
       _Milestone(
         icon: Icons.nights_stay,
-        title: L10nService.get('growth.growth_dashboard.dream_logger', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardDreamLogger, language),
         unlocked: dreamCount >= 3,
         progressHint: dreamCount < 3
             ? isEn
@@ -801,7 +801,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       ),
       _Milestone(
         icon: Icons.emoji_events,
-        title: L10nService.get('growth.growth_dashboard.challenge_completer', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardChallengeCompleter, language),
         unlocked: completedChallenges >= 3,
         progressHint: completedChallenges < 3
             ? isEn
@@ -811,7 +811,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       ),
       _Milestone(
         icon: Icons.favorite,
-        title: L10nService.get('growth.growth_dashboard.gratitude_streak', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardGratitudeStreak, language),
         unlocked: gratitudeCount >= 7,
         progressHint: gratitudeCount < 7
             ? isEn
@@ -821,7 +821,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       ),
       _Milestone(
         icon: Icons.emoji_events,
-        title: L10nService.get('growth.growth_dashboard.30day_streak', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboard30dayStreak, language),
         unlocked: maxStreak >= 30,
         progressHint: maxStreak < 30
             ? isEn
@@ -831,7 +831,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       ),
       _Milestone(
         icon: Icons.psychology,
-        title: L10nService.get('growth.growth_dashboard.self_aware', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardSelfAware, language),
         unlocked: focusAreasCoveredThisMonth >= 5,
         progressHint: focusAreasCoveredThisMonth < 5
             ? isEn
@@ -841,9 +841,9 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       ),
       _Milestone(
         icon: Icons.share,
-        title: L10nService.get('growth.growth_dashboard.story_teller', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardStoryTeller, language),
         unlocked: false,
-        progressHint: L10nService.get('growth.growth_dashboard.share_your_progress', language),
+        progressHint: L10nService.get(L10nKeys.growthGrowthDashboardShareYourProgress, language),
       ),
     ];
   }
@@ -857,37 +857,37 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
     final tools = [
       _GrowthTool(
         icon: Icons.fingerprint_outlined,
-        title: L10nService.get('growth.growth_dashboard.your_archetype', language),
-        subtitle: L10nService.get('growth.growth_dashboard.emotional_profile', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardYourArchetype, language),
+        subtitle: L10nService.get(L10nKeys.growthGrowthDashboardEmotionalProfile, language),
         route: Routes.archetype,
         color: AppColors.amethyst,
       ),
       _GrowthTool(
         icon: Icons.visibility_off_outlined,
-        title: L10nService.get('growth.growth_dashboard.blind_spots', language),
-        subtitle: L10nService.get('growth.growth_dashboard.hidden_patterns', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardBlindSpots, language),
+        subtitle: L10nService.get(L10nKeys.growthGrowthDashboardHiddenPatterns, language),
         route: Routes.blindSpot,
         color: AppColors.brandPink,
       ),
       // compatibility/relationship reflection removed (killed feature)
       _GrowthTool(
         icon: Icons.military_tech_outlined,
-        title: L10nService.get('growth.growth_dashboard.milestones_1', language),
-        subtitle: L10nService.get('growth.growth_dashboard.achievements', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardMilestones1, language),
+        subtitle: L10nService.get(L10nKeys.growthGrowthDashboardAchievements, language),
         route: Routes.milestones,
         color: AppColors.starGold,
       ),
       _GrowthTool(
         icon: Icons.lightbulb_outline_rounded,
-        title: L10nService.get('growth.growth_dashboard.microhabits', language),
-        subtitle: L10nService.get('growth.growth_dashboard.56_habits_to_try', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardMicrohabits, language),
+        subtitle: L10nService.get(L10nKeys.growthGrowthDashboard56HabitsToTry, language),
         route: Routes.habitSuggestions,
         color: AppColors.success,
       ),
       _GrowthTool(
         icon: Icons.psychology_alt_outlined,
-        title: L10nService.get('growth.growth_dashboard.insights', language),
-        subtitle: L10nService.get('growth.growth_dashboard.36_modules', language),
+        title: L10nService.get(L10nKeys.growthGrowthDashboardInsights, language),
+        subtitle: L10nService.get(L10nKeys.growthGrowthDashboard36Modules, language),
         route: Routes.insightsDiscovery,
         color: AppColors.auroraEnd,
       ),
@@ -897,7 +897,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('growth.growth_dashboard.explore_growth_tools', language),
+          L10nService.get(L10nKeys.growthGrowthDashboardExploreGrowthTools, language),
           variant: GradientTextVariant.aurora,
           style: AppTypography.modernAccent(
             fontSize: 15,
@@ -1032,7 +1032,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('growth.growth_dashboard.this_month', language),
+            L10nService.get(L10nKeys.growthGrowthDashboardThisMonth, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.modernAccent(
               fontSize: 15,
@@ -1043,7 +1043,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
           const SizedBox(height: AppConstants.spacingLg),
           _buildSummaryRow(
             icon: Icons.edit_note,
-            label: L10nService.get('growth.growth_dashboard.entries_this_month', language),
+            label: L10nService.get(L10nKeys.growthGrowthDashboardEntriesThisMonth, language),
             value: '${monthEntries.length}',
             color: AppColors.auroraStart,
             isDark: isDark,
@@ -1051,27 +1051,27 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
           const SizedBox(height: AppConstants.spacingMd),
           _buildSummaryRow(
             icon: Icons.category,
-            label: L10nService.get('growth.growth_dashboard.most_tracked_area', language),
+            label: L10nService.get(L10nKeys.growthGrowthDashboardMostTrackedArea, language),
             value: mostTracked != null
                 ? (mostTracked.localizedName(language))
-                : (L10nService.get('growth.growth_dashboard.none_yet', language)),
+                : (L10nService.get(L10nKeys.growthGrowthDashboardNoneYet, language)),
             color: AppColors.starGold,
             isDark: isDark,
           ),
           const SizedBox(height: AppConstants.spacingMd),
           _buildSummaryRow(
             icon: Icons.sentiment_satisfied_alt,
-            label: L10nService.get('growth.growth_dashboard.average_mood', language),
+            label: L10nService.get(L10nKeys.growthGrowthDashboardAverageMood, language),
             value: monthEntries.isNotEmpty
                 ? '${avgRating.toStringAsFixed(1)} / 5'
-                : (L10nService.get('growth.growth_dashboard.na', language)),
+                : (L10nService.get(L10nKeys.growthGrowthDashboardNa, language)),
             color: AppColors.success,
             isDark: isDark,
           ),
           const SizedBox(height: AppConstants.spacingMd),
           _buildSummaryRow(
             icon: Icons.nights_stay,
-            label: L10nService.get('growth.growth_dashboard.dreams_logged', language),
+            label: L10nService.get(L10nKeys.growthGrowthDashboardDreamsLogged, language),
             value: '$dreamCount',
             color: AppColors.amethyst,
             isDark: isDark,
@@ -1079,7 +1079,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
           const SizedBox(height: AppConstants.spacingMd),
           _buildSummaryRow(
             icon: Icons.emoji_events,
-            label: L10nService.get('growth.growth_dashboard.challenges_completed', language),
+            label: L10nService.get(L10nKeys.growthGrowthDashboardChallengesCompleted, language),
             value: '$completedChallenges',
             color: AppColors.celestialGold,
             isDark: isDark,
@@ -1087,7 +1087,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
           const SizedBox(height: AppConstants.spacingMd),
           _buildSummaryRow(
             icon: Icons.favorite,
-            label: L10nService.get('growth.growth_dashboard.gratitude_entries', language),
+            label: L10nService.get(L10nKeys.growthGrowthDashboardGratitudeEntries, language),
             value: '$gratitudeCount',
             color: AppColors.softCoral,
             isDark: isDark,
@@ -1145,7 +1145,7 @@ class _GrowthDashboardScreenState extends ConsumerState<GrowthDashboardScreen> {
   ) {
     final language = ref.read(languageProvider);
     return GradientButton.gold(
-      label: L10nService.get('growth.growth_dashboard.share_your_progress_1', language),
+      label: L10nService.get(L10nKeys.growthGrowthDashboardShareYourProgress1, language),
       icon: Icons.share,
       onPressed: () => _shareProgress(score, streak, totalEntries, isEn),
       expanded: true,
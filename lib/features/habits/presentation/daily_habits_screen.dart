@@ -78,7 +78,7 @@ class _DailyHabitsScreenState extends ConsumerState<DailyHabitsScreen> {
                   icon: Icon(Icons.refresh_rounded,
                       size: 16, color: AppColors.starGold),
                   label: Text(
-                    L10nService.get('habits.daily_habits.retry', language),
+                    L10nService.get(L10nKeys.habitsDailyHabitsRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -113,7 +113,7 @@ class _DailyHabitsScreenState extends ConsumerState<DailyHabitsScreen> {
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('habits.daily_habits.routine_tracker', language),
+            title: L10nService.get(L10nKeys.habitsDailyHabitsRoutineTracker, language),
           ),
           SliverPadding(
             padding: const EdgeInsets.all(16),
@@ -188,7 +188,7 @@ class _DailyHabitsScreenState extends ConsumerState<DailyHabitsScreen> {
                   // Browse more habits link
                   Center(
                     child: Semantics(
-                      label: L10nService.get('habits.daily_habits.browse_all_habits', language),
+                      label: L10nService.get(L10nKeys.habitsDailyHabitsBrowseAllHabits, language),
                       button: true,
                       child: GestureDetector(
                         onTap: () => context.push(Routes.habitSuggestions),
@@ -197,7 +197,7 @@ class _DailyHabitsScreenState extends ConsumerState<DailyHabitsScreen> {
                           constraints: const BoxConstraints(minHeight: 44),
                           child: Center(
                             child: Text(
-                              L10nService.get('habits.daily_habits.browse_all_habits_1', language),
+                              L10nService.get(L10nKeys.habitsDailyHabitsBrowseAllHabits1, language),
                               style: AppTypography.elegantAccent(
                                 fontSize: 14,
                                 color: AppColors.auroraStart,
@@ -547,7 +547,7 @@ class _ProgressHeader extends StatelessWidget {
         children: [
           allDone
               ? Text(
-                  L10nService.get('habits.daily_habits.all_done_for_today', language),
+                  L10nService.get(L10nKeys.habitsDailyHabitsAllDoneForToday, language),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 16,
                     fontWeight: FontWeight.w600,
@@ -555,7 +555,7 @@ class _ProgressHeader extends StatelessWidget {
                   ),
                 )
               : GradientText(
-                  L10nService.get('habits.daily_habits.todays_progress', language),
+                  L10nService.get(L10nKeys.habitsDailyHabitsTodaysProgress, language),
                   variant: GradientTextVariant.gold,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 16,
@@ -643,8 +643,8 @@ class _HabitCheckCard extends StatelessWidget {
               // Check circle
               Semantics(
                 label: isChecked
-                    ? (L10nService.get('habits.daily_habits.mark_incomplete', language))
-                    : (L10nService.get('habits.daily_habits.mark_complete', language)),
+                    ? (L10nService.get(L10nKeys.habitsDailyHabitsMarkIncomplete, language))
+                    : (L10nService.get(L10nKeys.habitsDailyHabitsMarkComplete, language)),
                 button: true,
                 child: GestureDetector(
                   onTap: onToggle,
@@ -708,7 +708,7 @@ class _HabitCheckCard extends StatelessWidget {
                     ),
                     const SizedBox(height: 2),
                     Text(
-                      '${HabitSuggestionService.categoryEmoji(habit.category)} ${habit.durationMinutes} ${L10nService.get('habits.daily_habits.min', language)}',
+                      '${HabitSuggestionService.categoryEmoji(habit.category)} ${habit.durationMinutes} ${L10nService.get(L10nKeys.habitsDailyHabitsMin, language)}',
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
                         color: isDark
@@ -827,10 +827,10 @@ class _EmptyState extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.playlist_add_check_rounded,
-      title: L10nService.get('habits.daily_habits.your_habit_routine_starts_here', language),
-      description: L10nService.get('habits.daily_habits.browse_the_habit_library_and_adopt_habit', language),
+      title: L10nService.get(L10nKeys.habitsDailyHabitsYourHabitRoutineStartsHere, language),
+      description: L10nService.get(L10nKeys.habitsDailyHabitsBrowseTheHabitLibraryAndAdoptHabit, language),
       gradientVariant: GradientTextVariant.gold,
-      ctaLabel: L10nService.get('habits.daily_habits.browse_habits', language),
+      ctaLabel: L10nService.get(L10nKeys.habitsDailyHabitsBrowseHabits, language),
       onCtaPressed: () => context.push(Routes.habitSuggestions),
     );
   }
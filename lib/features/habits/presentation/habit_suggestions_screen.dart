@@ -84,7 +84,7 @@ class _HabitSuggestionsScreenState
                   icon: Icon(Icons.refresh_rounded,
                       size: 16, color: AppColors.starGold),
                   label: Text(
-                    L10nService.get('habits.habit_suggestions.retry', language),
+                    L10nService.get(L10nKeys.habitsHabitSuggestionsRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -128,14 +128,14 @@ class _HabitSuggestionsScreenState
         slivers: [
           // ═══ APP BAR ═══
           GlassSliverAppBar(
-            title: L10nService.get('habits.habit_suggestions.microhabits', language),
+            title: L10nService.get(L10nKeys.habitsHabitSuggestionsMicrohabits, language),
             largeTitleMode: true,
             actions: [
               // Bookmark filter toggle
               IconButton(
                 tooltip: _showBookmarksOnly
-                    ? (L10nService.get('habits.habit_suggestions.show_all_habits', language))
-                    : (L10nService.get('habits.habit_suggestions.show_bookmarks', language)),
+                    ? (L10nService.get(L10nKeys.habitsHabitSuggestionsShowAllHabits, language))
+                    : (L10nService.get(L10nKeys.habitsHabitSuggestionsShowBookmarks, language)),
                 icon: Icon(
                   _showBookmarksOnly
                       ? Icons.bookmark_rounded
@@ -196,7 +196,7 @@ class _HabitSuggestionsScreenState
                 child: Row(
                   children: [
                     _CategoryChip(
-                      label: L10nService.get('habits.habit_suggestions.all', language),
+                      label: L10nService.get(L10nKeys.habitsHabitSuggestionsAll, language),
                       emoji: '✨',
                       isSelected:
                           _selectedCategory == null && !_showBookmarksOnly,
@@ -246,7 +246,7 @@ class _HabitSuggestionsScreenState
                 padding: const EdgeInsets.all(40),
                 child: Center(
                   child: Text(
-                    L10nService.get('habits.habit_suggestions.your_bookmark_list_is_ready_for_habits', language),
+                    L10nService.get(L10nKeys.habitsHabitSuggestionsYourBookmarkListIsReadyForHabits, language),
                     style: AppTypography.subtitle(
                       color: isDark
                           ? AppColors.textMuted
@@ -400,7 +400,7 @@ class _DailySpotlightCard extends StatelessWidget {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         GradientText(
-                          L10nService.get('habits.habit_suggestions.todays_habit', language),
+                          L10nService.get(L10nKeys.habitsHabitSuggestionsTodaysHabit, language),
                           variant: GradientTextVariant.aurora,
                           style: AppTypography.displayFont.copyWith(
                             fontSize: 12,
@@ -435,8 +435,8 @@ class _DailySpotlightCard extends StatelessWidget {
                       ),
                       child: Text(
                         isAdopted
-                            ? (L10nService.get('habits.habit_suggestions.adopted', language))
-                            : (L10nService.get('habits.habit_suggestions.tried', language)),
+                            ? (L10nService.get(L10nKeys.habitsHabitSuggestionsAdopted, language))
+                            : (L10nService.get(L10nKeys.habitsHabitSuggestionsTried, language)),
                         style: AppTypography.modernAccent(
                           fontSize: 10,
                           fontWeight: FontWeight.w600,
@@ -512,7 +512,7 @@ class _DailySpotlightCard extends StatelessWidget {
                         ),
                         const SizedBox(width: 4),
                         Text(
-                          '${habit.durationMinutes} ${L10nService.get('habits.habit_suggestions.min', language)}',
+                          '${habit.durationMinutes} ${L10nService.get(L10nKeys.habitsHabitSuggestionsMin, language)}',
                           style: AppTypography.subtitle(
                             fontSize: 10,
                             color: isDark
@@ -526,7 +526,7 @@ class _DailySpotlightCard extends StatelessWidget {
                   const Spacer(),
                   if (!isTried)
                     Semantics(
-                      label: L10nService.get('habits.habit_suggestions.try_this_habit', language),
+                      label: L10nService.get(L10nKeys.habitsHabitSuggestionsTryThisHabit, language),
                       button: true,
                       child: GestureDetector(
                         onTap: () async {
@@ -549,7 +549,7 @@ class _DailySpotlightCard extends StatelessWidget {
                             ),
                           ),
                           child: Text(
-                            L10nService.get('habits.habit_suggestions.try_it', language),
+                            L10nService.get(L10nKeys.habitsHabitSuggestionsTryIt, language),
                             style: AppTypography.modernAccent(
                               fontSize: 12,
                               fontWeight: FontWeight.w600,
@@ -601,7 +601,7 @@ class _ProgressBar extends StatelessWidget {
           Row(
             children: [
               Text(
-                L10nService.get('habits.habit_suggestions.habits_explored', language),
+                L10nService.get(L10nKeys.habitsHabitSuggestionsHabitsExplored, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 13,
                   color: isDark
@@ -845,7 +845,7 @@ class _HabitCard extends StatelessWidget {
                         ),
                         const SizedBox(width: 3),
                         Text(
-                          '${habit.durationMinutes} ${L10nService.get('habits.habit_suggestions.min_1', language)}',
+                          '${habit.durationMinutes} ${L10nService.get(L10nKeys.habitsHabitSuggestionsMin1, language)}',
                           style: AppTypography.subtitle(
                             fontSize: 11,
                             color: isDark
@@ -878,8 +878,8 @@ class _HabitCard extends StatelessWidget {
                           const SizedBox(width: 3),
                           Text(
                             isAdopted
-                                ? (L10nService.get('habits.habit_suggestions.adopted_1', language))
-                                : (L10nService.get('habits.habit_suggestions.tried_1', language)),
+                                ? (L10nService.get(L10nKeys.habitsHabitSuggestionsAdopted1, language))
+                                : (L10nService.get(L10nKeys.habitsHabitSuggestionsTried1, language)),
                             style: AppTypography.subtitle(
                               fontSize: 11,
                               color: isAdopted
@@ -1044,7 +1044,7 @@ class _HabitDetailSheetState extends State<_HabitDetailSheet> {
                                 ),
                               ),
                               Text(
-                                '${habit.durationMinutes} ${L10nService.get('habits.habit_suggestions.minutes', language)}',
+                                '${habit.durationMinutes} ${L10nService.get(L10nKeys.habitsHabitSuggestionsMinutes, language)}',
                                 style: AppTypography.subtitle(
                                   fontSize: 11,
                                   color: isDark
@@ -1058,8 +1058,8 @@ class _HabitDetailSheetState extends State<_HabitDetailSheet> {
                         // Bookmark button
                         IconButton(
                           tooltip: _isBookmarked
-                              ? (L10nService.get('habits.habit_suggestions.remove_bookmark', language))
-                              : (L10nService.get('habits.habit_suggestions.bookmark', language)),
+                              ? (L10nService.get(L10nKeys.habitsHabitSuggestionsRemoveBookmark, language))
+                              : (L10nService.get(L10nKeys.habitsHabitSuggestionsBookmark, language)),
                           icon: Icon(
                             _isBookmarked
                                 ? Icons.bookmark_rounded
@@ -1118,8 +1118,8 @@ class _HabitDetailSheetState extends State<_HabitDetailSheet> {
                         Expanded(
                           child: _ActionButton(
                             label: _isTried
-                                ? (L10nService.get('habits.habit_suggestions.tried_2', language))
-                                : (L10nService.get('habits.habit_suggestions.mark_as_tried', language)),
+                                ? (L10nService.get(L10nKeys.habitsHabitSuggestionsTried2, language))
+                                : (L10nService.get(L10nKeys.habitsHabitSuggestionsMarkAsTried, language)),
                             icon: _isTried
                                 ? Icons.check_rounded
                                 : Icons.touch_app_rounded,
@@ -1141,8 +1141,8 @@ class _HabitDetailSheetState extends State<_HabitDetailSheet> {
                         Expanded(
                           child: _ActionButton(
                             label: _isAdopted
-                                ? (L10nService.get('habits.habit_suggestions.adopted_2', language))
-                                : (L10nService.get('habits.habit_suggestions.adopt_this_habit', language)),
+                                ? (L10nService.get(L10nKeys.habitsHabitSuggestionsAdopted2, language))
+                                : (L10nService.get(L10nKeys.habitsHabitSuggestionsAdoptThisHabit, language)),
                             icon: _isAdopted
                                 ? Icons.check_circle_rounded
                                 : Icons.favorite_border_rounded,
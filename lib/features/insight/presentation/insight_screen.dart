@@ -71,14 +71,14 @@ class _InsightScreenState extends ConsumerState<InsightScreen>
     final userProfile = ref.read(userProfileProvider);
     final language = ref.read(languageProvider);
     final userName =
-        userProfile?.name ?? L10nService.get('insight.default_user', language);
+        userProfile?.name ?? L10nService.get(L10nKeys.insightDefaultUser, language);
 
     final greeting = L10nService.get(
-      'insight.greeting',
+      L10nKeys.insightGreeting,
       language,
     ).replaceAll('{name}', userName);
-    final intro = L10nService.get('insight.intro', language);
-    final disclaimer = L10nService.get('insight.disclaimer', language);
+    final intro = L10nService.get(L10nKeys.insightIntro, language);
+    final disclaimer = L10nService.get(L10nKeys.insightDisclaimer, language);
 
     setState(() {
       _messages.add(
@@ -167,7 +167,7 @@ class _InsightScreenState extends ConsumerState<InsightScreen>
         backgroundColor: Colors.transparent,
         elevation: 0,
         leading: IconButton(
-          tooltip: L10nService.get('common.back', language),
+          tooltip: L10nService.get(L10nKeys.commonBack, language),
           icon: Icon(
             Icons.chevron_left,
             size: 28,
@@ -176,7 +176,7 @@ class _InsightScreenState extends ConsumerState<InsightScreen>
           onPressed: () => context.pop(),
         ),
         title: Text(
-          L10nService.get('insight.title', language),
+          L10nService.get(L10nKeys.insightTitle, language),
           style: AppTypography.displayFont.copyWith(
             color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
             fontWeight: FontWeight.w600,
@@ -400,7 +400,7 @@ class _InsightScreenState extends ConsumerState<InsightScreen>
                   color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
                 ),
                 decoration: InputDecoration(
-                  hintText: L10nService.get('insight.input_hint', language),
+                  hintText: L10nService.get(L10nKeys.insightInputHint, language),
                   hintStyle: AppTypography.elegantAccent(
                     fontSize: 14,
                     fontWeight: FontWeight.w400,
@@ -420,7 +420,7 @@ class _InsightScreenState extends ConsumerState<InsightScreen>
           ),
           const SizedBox(width: 12),
           Semantics(
-            label: L10nService.get('insight.send_message', language),
+            label: L10nService.get(L10nKeys.insightSendMessage, language),
             button: true,
             child: GestureDetector(
               onTap: _sendMessage,
@@ -74,7 +74,7 @@ class _InsightsDiscoveryScreenState
                 mainAxisSize: MainAxisSize.min,
                 children: [
                   Text(
-                    L10nService.get('insight.insights_discovery.could_not_load_your_local_data_is_unaffe', language),
+                    L10nService.get(L10nKeys.insightInsightsDiscoveryCouldNotLoadYourLocalDataIsUnaffe, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.decorativeScript(
                       fontSize: 14,
@@ -90,7 +90,7 @@ class _InsightsDiscoveryScreenState
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('insight.insights_discovery.retry', language),
+                      L10nService.get(L10nKeys.insightInsightsDiscoveryRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -126,13 +126,13 @@ class _InsightsDiscoveryScreenState
         slivers: [
           // App Bar
           GlassSliverAppBar(
-            title: L10nService.get('insight.insights_discovery.discover_insights', language),
+            title: L10nService.get(L10nKeys.insightInsightsDiscoveryDiscoverInsights, language),
             actions: [
               // Bookmark filter toggle
               IconButton(
                 tooltip: _showBookmarksOnly
-                    ? (L10nService.get('insight.insights_discovery.show_all_insights', language))
-                    : (L10nService.get('insight.insights_discovery.show_bookmarks', language)),
+                    ? (L10nService.get(L10nKeys.insightInsightsDiscoveryShowAllInsights, language))
+                    : (L10nService.get(L10nKeys.insightInsightsDiscoveryShowBookmarks, language)),
                 icon: Icon(
                   _showBookmarksOnly
                       ? Icons.bookmark_rounded
@@ -182,7 +182,7 @@ class _InsightsDiscoveryScreenState
                 padding: const EdgeInsets.all(40),
                 child: Center(
                   child: Text(
-                    L10nService.get('insight.insights_discovery.no_insights_found', language),
+                    L10nService.get(L10nKeys.insightInsightsDiscoveryNoInsightsFound, language),
                     style: AppTypography.decorativeScript(
                       fontSize: 14,
                       color: isDark
@@ -249,7 +249,7 @@ class _InsightsDiscoveryScreenState
           mainAxisAlignment: MainAxisAlignment.spaceBetween,
           children: [
             Text(
-              L10nService.get('insight.insights_discovery.reading_progress', language),
+              L10nService.get(L10nKeys.insightInsightsDiscoveryReadingProgress, language),
               style: AppTypography.elegantAccent(
                 fontSize: 11,
                 fontWeight: FontWeight.w600,
@@ -325,7 +325,7 @@ class _InsightsDiscoveryScreenState
                   const SizedBox(width: 10),
                   Expanded(
                     child: GradientText(
-                      L10nService.get('insight.insights_discovery.todays_insight', language),
+                      L10nService.get(L10nKeys.insightInsightsDiscoveryTodaysInsight, language),
                       variant: GradientTextVariant.gold,
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 13,
@@ -363,7 +363,7 @@ class _InsightsDiscoveryScreenState
                 children: [
                   _buildCategoryPill(module.category, isDark, isEn),
                   Text(
-                    L10nService.get('insight.insights_discovery.tap_to_read', language),
+                    L10nService.get(L10nKeys.insightInsightsDiscoveryTapToRead, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 11,
                       fontWeight: FontWeight.w500,
@@ -393,7 +393,7 @@ class _InsightsDiscoveryScreenState
       child: Row(
         children: [
           _buildChip(
-            label: L10nService.get('insight.insights_discovery.all', language),
+            label: L10nService.get(L10nKeys.insightInsightsDiscoveryAll, language),
             isSelected: _selectedCategory == null,
             isDark: isDark,
             onTap: () => setState(() => _selectedCategory = null),
@@ -526,8 +526,8 @@ class _InsightsDiscoveryScreenState
                   Semantics(
                     button: true,
                     label: isBookmarked
-                        ? (L10nService.get('insight.insights_discovery.remove_bookmark', language))
-                        : (L10nService.get('insight.insights_discovery.add_bookmark', language)),
+                        ? (L10nService.get(L10nKeys.insightInsightsDiscoveryRemoveBookmark, language))
+                        : (L10nService.get(L10nKeys.insightInsightsDiscoveryAddBookmark, language)),
                     child: GestureDetector(
                       onTap: () async {
                         HapticFeedback.lightImpact();
@@ -709,7 +709,7 @@ class _InsightsDiscoveryScreenState
                             ),
                             const SizedBox(width: 6),
                             GradientText(
-                              L10nService.get('insight.insights_discovery.why_this_matters', language),
+                              L10nService.get(L10nKeys.insightInsightsDiscoveryWhyThisMatters, language),
                               variant: GradientTextVariant.gold,
                               style: AppTypography.elegantAccent(
                                 fontSize: 13,
@@ -780,7 +780,7 @@ class _InsightsDiscoveryScreenState
                   if (module.relatedModuleIds.isNotEmpty) ...[
                     const SizedBox(height: 24),
                     GradientText(
-                      L10nService.get('insight.insights_discovery.related_insights', language),
+                      L10nService.get(L10nKeys.insightInsightsDiscoveryRelatedInsights, language),
                       variant: GradientTextVariant.gold,
                       style: AppTypography.elegantAccent(
                         fontSize: 14,
@@ -86,29 +86,29 @@ class InsightResponseService {
   }
 
   String _getFallingDreamResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.dream_falling', language);
+    return L10nService.get(L10nKeys.insightResponsesDreamFalling, language);
   }
 
   String _getWaterDreamResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.dream_water', language);
+    return L10nService.get(L10nKeys.insightResponsesDreamWater, language);
   }
 
   String _getFlyingDreamResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.dream_flying', language);
+    return L10nService.get(L10nKeys.insightResponsesDreamFlying, language);
   }
 
   String _getChaseDreamResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.dream_chase', language);
+    return L10nService.get(L10nKeys.insightResponsesDreamChase, language);
   }
 
   String _getTeethDreamResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.dream_teeth', language);
+    return L10nService.get(L10nKeys.insightResponsesDreamTeeth, language);
   }
 
   String _getGeneralDreamResponse(AppLanguage language) {
     final responses = [
-      L10nService.get('insight.responses.dream_general_1', language),
-      L10nService.get('insight.responses.dream_general_2', language),
+      L10nService.get(L10nKeys.insightResponsesDreamGeneral1, language),
+      L10nService.get(L10nKeys.insightResponsesDreamGeneral2, language),
     ];
     return responses[_random.nextInt(responses.length)];
   }
@@ -119,8 +119,8 @@ class InsightResponseService {
 
   String _getPatternAwarenessResponse(String message, AppLanguage language) {
     final responses = [
-      L10nService.get('insight.responses.pattern_1', language),
-      L10nService.get('insight.responses.pattern_2', language),
+      L10nService.get(L10nKeys.insightResponsesPattern1, language),
+      L10nService.get(L10nKeys.insightResponsesPattern2, language),
     ];
     return responses[_random.nextInt(responses.length)];
   }
@@ -178,23 +178,23 @@ class InsightResponseService {
   }
 
   String _getAnxietyResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.emotion_anxiety', language);
+    return L10nService.get(L10nKeys.insightResponsesEmotionAnxiety, language);
   }
 
   String _getSadnessResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.emotion_sadness', language);
+    return L10nService.get(L10nKeys.insightResponsesEmotionSadness, language);
   }
 
   String _getAngerResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.emotion_anger', language);
+    return L10nService.get(L10nKeys.insightResponsesEmotionAnger, language);
   }
 
   String _getOverwhelmedResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.emotion_overwhelmed', language);
+    return L10nService.get(L10nKeys.insightResponsesEmotionOverwhelmed, language);
   }
 
   String _getGeneralEmotionResponse(AppLanguage language) {
-    return L10nService.get('insight.responses.emotion_general', language);
+    return L10nService.get(L10nKeys.insightResponsesEmotionGeneral, language);
   }
 
   // ═══════════════════════════════════════════════════════════════════════════
@@ -203,8 +203,8 @@ class InsightResponseService {
 
   String _getDecisionSupportResponse(String message, AppLanguage language) {
     final responses = [
-      L10nService.get('insight.responses.decision_1', language),
-      L10nService.get('insight.responses.decision_2', language),
+      L10nService.get(L10nKeys.insightResponsesDecision1, language),
+      L10nService.get(L10nKeys.insightResponsesDecision2, language),
     ];
     return responses[_random.nextInt(responses.length)];
   }
@@ -215,8 +215,8 @@ class InsightResponseService {
 
   String _getRelationshipResponse(String message, AppLanguage language) {
     final responses = [
-      L10nService.get('insight.responses.relationship_1', language),
-      L10nService.get('insight.responses.relationship_2', language),
+      L10nService.get(L10nKeys.insightResponsesRelationship1, language),
+      L10nService.get(L10nKeys.insightResponsesRelationship2, language),
     ];
     return responses[_random.nextInt(responses.length)];
   }
@@ -227,8 +227,8 @@ class InsightResponseService {
 
   String _getSelfDiscoveryResponse(String message, AppLanguage language) {
     final responses = [
-      L10nService.get('insight.responses.self_discovery_1', language),
-      L10nService.get('insight.responses.self_discovery_2', language),
+      L10nService.get(L10nKeys.insightResponsesSelfDiscovery1, language),
+      L10nService.get(L10nKeys.insightResponsesSelfDiscovery2, language),
     ];
     return responses[_random.nextInt(responses.length)];
   }
@@ -239,8 +239,8 @@ class InsightResponseService {
 
   String _getGeneralResponse(String message, AppLanguage language) {
     final responses = [
-      L10nService.get('insight.responses.general_1', language),
-      L10nService.get('insight.responses.general_2', language),
+      L10nService.get(L10nKeys.insightResponsesGeneral1, language),
+      L10nService.get(L10nKeys.insightResponsesGeneral2, language),
     ];
     return responses[_random.nextInt(responses.length)];
   }
@@ -200,7 +200,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
       final file = File('${tempDir.path}/innercycles_annual_report.png');
       await file.writeAsBytes(bytes);
 
-      final shareText = L10nService.get('journal.annual_report.my_year_in_review_with_innercycles_inner', language);
+      final shareText = L10nService.get(L10nKeys.journalAnnualReportMyYearInReviewWithInnercyclesInner, language);
 
       await SharePlus.instance.share(
         ShareParams(files: [XFile(file.path)], text: shareText),
@@ -248,13 +248,13 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
   String _motivationalMessage(_AnnualReportData data, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     if (data.totalEntries >= 200) {
-      return L10nService.get('journal.annual_report.an_extraordinary_year_of_selfreflection', language);
+      return L10nService.get(L10nKeys.journalAnnualReportAnExtraordinaryYearOfSelfreflection, language);
     } else if (data.totalEntries >= 100) {
-      return L10nService.get('journal.annual_report.you_showed_up_consistently_for_yourself', language);
+      return L10nService.get(L10nKeys.journalAnnualReportYouShowedUpConsistentlyForYourself, language);
     } else if (data.totalEntries >= 30) {
-      return L10nService.get('journal.annual_report.every_entry_you_wrote_was_a_step_toward', language);
+      return L10nService.get(L10nKeys.journalAnnualReportEveryEntryYouWroteWasAStepToward, language);
     } else {
-      return L10nService.get('journal.annual_report.you_began_building_selfawareness_this_ye', language);
+      return L10nService.get(L10nKeys.journalAnnualReportYouBeganBuildingSelfawarenessThisYe, language);
     }
   }
 
@@ -279,7 +279,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
               mainAxisSize: MainAxisSize.min,
               children: [
                 Text(
-                  L10nService.get('journal.annual_report.couldnt_load_your_annual_report', language),
+                  L10nService.get(L10nKeys.journalAnnualReportCouldntLoadYourAnnualReport, language),
                   style: AppTypography.subtitle(
                     color: isDark
                         ? AppColors.textSecondary
@@ -296,7 +296,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
                     color: AppColors.starGold,
                   ),
                   label: Text(
-                    L10nService.get('journal.annual_report.retry', language),
+                    L10nService.get(L10nKeys.journalAnnualReportRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -338,7 +338,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('journal.annual_report.year_synthesis', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.journalAnnualReportYearSynthesis, language)),
           SliverFillRemaining(
             hasScrollBody: false,
             child: Center(
@@ -347,9 +347,9 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
                 title: isEn
                     ? 'Start journaling to unlock your $year story'
                     : '$year hikayeni açmak için yazmaya başla',
-                description: L10nService.get('journal.annual_report.your_yearinreview_will_come_alive_with_e', language),
+                description: L10nService.get(L10nKeys.journalAnnualReportYourYearinreviewWillComeAliveWithE, language),
                 gradientVariant: GradientTextVariant.gold,
-                ctaLabel: L10nService.get('journal.annual_report.write_first_entry', language),
+                ctaLabel: L10nService.get(L10nKeys.journalAnnualReportWriteFirstEntry, language),
                 onCtaPressed: () => context.push(Routes.journal),
               ),
             ),
@@ -377,14 +377,14 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('journal.annual_report.year_synthesis_1', language),
+            title: L10nService.get(L10nKeys.journalAnnualReportYearSynthesis1, language),
             actions: [
               IconButton(
                 onPressed: _isSharing ? null : () => _shareReport(isEn),
                 icon: _isSharing
                     ? const CupertinoActivityIndicator(radius: 10)
                     : const Icon(Icons.ios_share, color: AppColors.starGold),
-                tooltip: L10nService.get('journal.annual_report.share', language),
+                tooltip: L10nService.get(L10nKeys.journalAnnualReportShare, language),
               ),
             ],
           ),
@@ -518,7 +518,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
           ),
           const SizedBox(height: 8),
           GradientText(
-            L10nService.get('journal.annual_report.your_year_synthesis', language),
+            L10nService.get(L10nKeys.journalAnnualReportYourYearSynthesis, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.elegantAccent(
               fontSize: 16,
@@ -532,14 +532,14 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
             children: [
               _StatBadge(
                 value: '${report.totalEntries}',
-                label: L10nService.get('journal.annual_report.entries', language),
+                label: L10nService.get(L10nKeys.journalAnnualReportEntries, language),
                 color: AppColors.starGold,
                 isDark: isDark,
               ),
               const SizedBox(width: 16),
               _StatBadge(
                 value: report.overallAverageRating.toStringAsFixed(1),
-                label: L10nService.get('journal.annual_report.avg_rating', language),
+                label: L10nService.get(L10nKeys.journalAnnualReportAvgRating, language),
                 color: AppColors.auroraStart,
                 isDark: isDark,
               ),
@@ -576,7 +576,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('journal.annual_report.top_focus_areas', language),
+                L10nService.get(L10nKeys.journalAnnualReportTopFocusAreas, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
@@ -704,7 +704,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('journal.annual_report.average_rating_by_month', language),
+                L10nService.get(L10nKeys.journalAnnualReportAverageRatingByMonth, language),
                 variant: GradientTextVariant.aurora,
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
@@ -836,7 +836,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 Text(
-                  L10nService.get('journal.annual_report.longest_streak', language),
+                  L10nService.get(L10nKeys.journalAnnualReportLongestStreak, language),
                   style: AppTypography.elegantAccent(
                     fontSize: 13,
                     fontWeight: FontWeight.w500,
@@ -908,7 +908,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 Text(
-                  L10nService.get('journal.annual_report.most_active_month', language),
+                  L10nService.get(L10nKeys.journalAnnualReportMostActiveMonth, language),
                   style: AppTypography.elegantAccent(
                     fontSize: 13,
                     fontWeight: FontWeight.w500,
@@ -928,7 +928,7 @@ class _AnnualReportScreenState extends ConsumerState<AnnualReportScreen> {
                 ),
                 const SizedBox(height: 2),
                 Text(
-                  L10nService.getWithParams('journal.annual_report.entries_recorded', language, params: {'count': '$count'}),
+                  L10nService.getWithParams(L10nKeys.journalAnnualReportEntriesRecorded, language, params: {'count': '$count'}),
                   style: AppTypography.elegantAccent(
                     fontSize: 12,
                     color: isDark
@@ -113,7 +113,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
                           color: AppColors.starGold,
                         ),
                         label: Text(
-                          L10nService.get('journal.archive.retry', language),
+                          L10nService.get(L10nKeys.journalArchiveRetry, language),
                           style: AppTypography.elegantAccent(
                             fontSize: 13,
                             fontWeight: FontWeight.w600,
@@ -171,7 +171,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
                     keyboardDismissBehavior: ScrollViewKeyboardDismissBehavior.onDrag,
                     slivers: [
                       GlassSliverAppBar(
-                        title: L10nService.get('journal.archive.archive', language),
+                        title: L10nService.get(L10nKeys.journalArchiveArchive, language),
                         actions: [
                           GestureDetector(
                             onTap: () => setState(() => _showCalendarView = !_showCalendarView),
@@ -275,9 +275,9 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
                           hasScrollBody: false,
                           child: PremiumEmptyState(
                             icon: Icons.book_outlined,
-                            title: L10nService.get('journal.archive.your_journal_is_a_blank_page_ready_when', language),
-                            description: L10nService.get('journal.archive.your_journal_entries_will_appear_here_as', language),
-                            ctaLabel: L10nService.get('journal.archive.write_first_entry', language),
+                            title: L10nService.get(L10nKeys.journalArchiveYourJournalIsABlankPageReadyWhen, language),
+                            description: L10nService.get(L10nKeys.journalArchiveYourJournalEntriesWillAppearHereAs, language),
+                            ctaLabel: L10nService.get(L10nKeys.journalArchiveWriteFirstEntry, language),
                             onCtaPressed: () => context.push(Routes.journal),
                           ),
                         )
@@ -305,10 +305,10 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
                                 confirmDismiss: (_) async {
                                   final confirmed = await GlassDialog.confirm(
                                     context,
-                                    title: L10nService.get('journal.archive.delete_entry', language),
-                                    message: L10nService.get('journal.archive.this_journal_entry_will_be_permanently_d', language),
-                                    confirmLabel: L10nService.get('journal.archive.delete', language),
-                                    cancelLabel: L10nService.get('journal.archive.cancel', language),
+                                    title: L10nService.get(L10nKeys.journalArchiveDeleteEntry, language),
+                                    message: L10nService.get(L10nKeys.journalArchiveThisJournalEntryWillBePermanentlyD, language),
+                                    confirmLabel: L10nService.get(L10nKeys.journalArchiveDelete, language),
+                                    cancelLabel: L10nService.get(L10nKeys.journalArchiveCancel, language),
                                     isDestructive: true,
                                   );
                                   if (confirmed == true) {
@@ -493,7 +493,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
           color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
         ),
         decoration: InputDecoration(
-          hintText: L10nService.get('journal.archive.search_by_date_mood_or_text', language),
+          hintText: L10nService.get(L10nKeys.journalArchiveSearchByDateMoodOrText, language),
           hintStyle: AppTypography.subtitle(
             color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
           ),
@@ -503,7 +503,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
           ),
           suffixIcon: _searchQuery.isNotEmpty
               ? IconButton(
-                  tooltip: L10nService.get('journal.archive.clear_search', language),
+                  tooltip: L10nService.get(L10nKeys.journalArchiveClearSearch, language),
                   icon: Icon(
                     Icons.cancel,
                     color: isDark
@@ -535,7 +535,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
       child: Row(
         children: [
           _buildChip(
-            L10nService.get('journal.archive.all', language),
+            L10nService.get(L10nKeys.journalArchiveAll, language),
             _filterArea == null && !_showOnlyFavorites,
             () => setState(() { _filterArea = null; _showOnlyFavorites = false; }),
             isDark,
@@ -694,7 +694,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
       padding: const EdgeInsets.only(right: 8),
       child: Semantics(
         button: true,
-        label: L10nService.getWithParams('journal.archive.filter_label', language, params: {'label': label}),
+        label: L10nService.getWithParams(L10nKeys.journalArchiveFilterLabel, language, params: {'label': label}),
         child: GestureDetector(
           onTap: () {
             HapticService.selectionTap();
@@ -749,7 +749,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
       padding: const EdgeInsets.only(bottom: AppConstants.spacingMd),
       child: Semantics(
         button: true,
-        label: L10nService.getWithParams('journal.archive.entry_semantics_label', language, params: {'area': areaLabel, 'date': dateStr}),
+        label: L10nService.getWithParams(L10nKeys.journalArchiveEntrySemanticsLabel, language, params: {'area': areaLabel, 'date': dateStr}),
         child: GestureDetector(
           onTap: () {
             HapticFeedback.lightImpact();
@@ -828,7 +828,7 @@ class _ArchiveScreenState extends ConsumerState<ArchiveScreen> {
                           () {
                             final language = AppLanguage.fromIsEn(isEn);
                             final words = entry.note!.trim().split(RegExp(r'\s+')).where((w) => w.isNotEmpty).length;
-                            return L10nService.getWithParams('journal.archive.word_count', language, params: {'count': '$words'});
+                            return L10nService.getWithParams(L10nKeys.journalArchiveWordCount, language, params: {'count': '$words'});
                           }(),
                           style: AppTypography.elegantAccent(
                             fontSize: 11,
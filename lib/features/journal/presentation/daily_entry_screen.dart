@@ -273,10 +273,10 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
     final language = ref.read(languageProvider);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('journal.daily_entry.discard_changes', language),
-      message: L10nService.get('journal.daily_entry.you_have_unsaved_changes_are_you_sure_yo', language),
-      cancelLabel: L10nService.get('journal.daily_entry.cancel', language),
-      confirmLabel: L10nService.get('journal.daily_entry.discard', language),
+      title: L10nService.get(L10nKeys.journalDailyEntryDiscardChanges, language),
+      message: L10nService.get(L10nKeys.journalDailyEntryYouHaveUnsavedChangesAreYouSureYo, language),
+      cancelLabel: L10nService.get(L10nKeys.journalDailyEntryCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.journalDailyEntryDiscard, language),
       isDestructive: true,
     );
     if (confirmed == true && mounted) {
@@ -311,7 +311,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                 ),
                 slivers: [
                   GlassSliverAppBar(
-                    title: L10nService.get('journal.daily_entry.log_your_day', language),
+                    title: L10nService.get(L10nKeys.journalDailyEntryLogYourDay, language),
                   ),
                   SliverPadding(
                     padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -364,7 +364,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                         _buildSectionLabel(
                           context,
                           isDark,
-                          L10nService.get('journal.daily_entry.focus_area', language),
+                          L10nService.get(L10nKeys.journalDailyEntryFocusArea, language),
                         ),
                         const SizedBox(height: AppConstants.spacingMd),
                         _buildFocusAreaSelector(isDark, isEn),
@@ -375,7 +375,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                         _buildSectionLabel(
                           context,
                           isDark,
-                          L10nService.get('journal.daily_entry.overall_rating', language),
+                          L10nService.get(L10nKeys.journalDailyEntryOverallRating, language),
                         ),
                         const SizedBox(height: AppConstants.spacingMd),
                         _buildRatingSlider(isDark, isEn, _overallRating, (v) {
@@ -395,7 +395,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                         _buildSectionLabel(
                           context,
                           isDark,
-                          L10nService.get('journal.daily_entry.notes_optional', language),
+                          L10nService.get(L10nKeys.journalDailyEntryNotesOptional, language),
                         ),
                         const SizedBox(height: AppConstants.spacingMd),
                         _CyclePhasePromptHint(isEn: isEn, isDark: isDark),
@@ -406,7 +406,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                         _buildSectionLabel(
                           context,
                           isDark,
-                          L10nService.get('journal.daily_entry.tags_optional', language),
+                          L10nService.get(L10nKeys.journalDailyEntryTagsOptional, language),
                         ),
                         const SizedBox(height: AppConstants.spacingMd),
                         _buildTagSection(isDark, isEn),
@@ -417,7 +417,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                           _buildSectionLabel(
                             context,
                             isDark,
-                            L10nService.get('journal.daily_entry.photo_optional', language),
+                            L10nService.get(L10nKeys.journalDailyEntryPhotoOptional, language),
                           ),
                           const SizedBox(height: AppConstants.spacingMd),
                           _buildPhotoPicker(isDark, isEn),
@@ -720,7 +720,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
               final isActive = rating == value;
               return Semantics(
                 button: true,
-                label: '${L10nService.get('journal.daily_entry.rating', language)} $rating',
+                label: '${L10nService.get(L10nKeys.journalDailyEntryRating, language)} $rating',
                 selected: isActive,
                 child: GestureDetector(
                   onTap: () {
@@ -800,7 +800,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
         child: ExpansionTile(
           tilePadding: EdgeInsets.zero,
           title: Text(
-            L10nService.get('journal.daily_entry.details_optional', language),
+            L10nService.get(L10nKeys.journalDailyEntryDetailsOptional, language),
             style: AppTypography.elegantAccent(
               fontSize: 14,
               fontWeight: FontWeight.w600,
@@ -819,7 +819,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
     return Column(
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
-        _buildSectionLabel(context, isDark, L10nService.get('journal.daily_entry.details', language)),
+        _buildSectionLabel(context, isDark, L10nService.get(L10nKeys.journalDailyEntryDetails, language)),
         const SizedBox(height: AppConstants.spacingMd),
         _buildSubRatings(isDark, isEn),
       ],
@@ -1014,7 +1014,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                 child: Row(
                   children: [
                     VoiceInputButton(
-                      localeId: L10nService.get('journal.daily_entry.en_us', language),
+                      localeId: L10nService.get(L10nKeys.journalDailyEntryEnUs, language),
                       size: 40,
                       onListeningStateChanged: (listening) {
                         if (listening) {
@@ -1046,7 +1046,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     ),
                     const SizedBox(width: AppConstants.spacingSm),
                     Text(
-                      L10nService.get('journal.daily_entry.tap_to_speak', language),
+                      L10nService.get(L10nKeys.journalDailyEntryTapToSpeak, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
                         color: isDark
@@ -1070,7 +1070,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     child: Text(
                       () {
                         final words = _noteController.text.trim().split(RegExp(r'\s+')).where((w) => w.isNotEmpty).length;
-                        return L10nService.getWithParams('journal.daily_entry.word_count', language, params: {'count': '$words'});
+                        return L10nService.getWithParams(L10nKeys.journalDailyEntryWordCount, language, params: {'count': '$words'});
                       }(),
                       style: AppTypography.elegantAccent(
                         fontSize: 11,
@@ -1184,7 +1184,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     color: isDark ? Colors.white : Colors.black87,
                   ),
                   decoration: InputDecoration(
-                    hintText: L10nService.get('journal.daily_entry.eg_work_personal', language),
+                    hintText: L10nService.get(L10nKeys.journalDailyEntryEgWorkPersonal, language),
                     hintStyle: AppTypography.subtitle(
                       color: isDark
                           ? AppColors.textMuted
@@ -1264,7 +1264,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                 fit: BoxFit.cover,
                 cacheWidth: 800,
                 cacheHeight: 360,
-                semanticLabel: L10nService.get('journal.daily_entry.journal_photo', language),
+                semanticLabel: L10nService.get(L10nKeys.journalDailyEntryJournalPhoto, language),
                 errorBuilder: (_, _, _) => const SizedBox.shrink(),
               ),
             ),
@@ -1280,7 +1280,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     color: AppColors.auroraStart,
                   ),
                   label: Text(
-                    L10nService.get('journal.daily_entry.change', language),
+                    L10nService.get(L10nKeys.journalDailyEntryChange, language),
                     style: AppTypography.modernAccent(
                       color: AppColors.auroraStart,
                       fontSize: 13,
@@ -1303,7 +1303,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                         : AppColors.lightTextMuted,
                   ),
                   label: Text(
-                    L10nService.get('journal.daily_entry.remove', language),
+                    L10nService.get(L10nKeys.journalDailyEntryRemove, language),
                     style: AppTypography.subtitle(
                       fontSize: 13,
                       color: isDark
@@ -1320,7 +1320,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
     }
 
     return Semantics(
-      label: L10nService.get('journal.daily_entry.add_a_photo', language),
+      label: L10nService.get(L10nKeys.journalDailyEntryAddAPhoto, language),
       button: true,
       child: GestureDetector(
         onTap: () {
@@ -1341,7 +1341,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
               ),
               const SizedBox(width: AppConstants.spacingSm),
               Text(
-                L10nService.get('journal.daily_entry.add_a_photo_1', language),
+                L10nService.get(L10nKeys.journalDailyEntryAddAPhoto1, language),
                 style: AppTypography.subtitle(
                   fontSize: 14,
                   color: isDark
@@ -1402,7 +1402,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
   Widget _buildSaveButton(bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
-      label: L10nService.get('journal.daily_entry.save_entry', language),
+      label: L10nService.get(L10nKeys.journalDailyEntrySaveEntry, language),
       button: true,
       enabled: !_isSaving,
       child: GestureDetector(
@@ -1449,7 +1449,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     ),
                     const SizedBox(width: 8),
                     Text(
-                      L10nService.get('journal.daily_entry.save_entry_1', language),
+                      L10nService.get(L10nKeys.journalDailyEntrySaveEntry1, language),
                       style: AppTypography.modernAccent(
                         fontSize: 17,
                         fontWeight: FontWeight.w700,
@@ -1608,7 +1608,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
         ScaffoldMessenger.of(context).showSnackBar(
           SnackBar(
             content: Text(
-              L10nService.get('journal.daily_entry.save_error', ref.read(languageProvider)),
+              L10nService.get(L10nKeys.journalDailyEntrySaveError, ref.read(languageProvider)),
             ),
             backgroundColor: AppColors.error,
             behavior: SnackBarBehavior.floating,
@@ -1729,7 +1729,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
       await widgetService.updateDailyReflection(
         moodEmoji: moodEmoji,
         moodLabel: moodLabel,
-        dailyPrompt: L10nService.get('journal.daily_entry.how_did_your_day_feel', language),
+        dailyPrompt: L10nService.get(L10nKeys.journalDailyEntryHowDidYourDayFeel, language),
         focusArea: _selectedArea.localizedName(language),
         streakDays: streak,
         moodRating: _overallRating,
@@ -1739,13 +1739,13 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
         currentMood: moodLabel,
         moodEmoji: moodEmoji,
         energyLevel: (_overallRating * 20).clamp(0, 100),
-        advice: L10nService.get('journal.daily_entry.keep_journaling_to_reveal_your_patterns', language),
+        advice: L10nService.get(L10nKeys.journalDailyEntryKeepJournalingToRevealYourPatterns, language),
       );
 
       await widgetService.updateLockScreen(
         moodEmoji: moodEmoji,
         accentEmoji: _focusAreaEmoji(_selectedArea),
-        shortMessage: L10nService.getWithParams('journal.daily_entry.day_streak', language, params: {'count': '$streak'}),
+        shortMessage: L10nService.getWithParams(L10nKeys.journalDailyEntryDayStreak, language, params: {'count': '$streak'}),
         energyLevel: _overallRating,
       );
     } catch (e) {
@@ -1806,7 +1806,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     .shimmer(delay: 500.ms, duration: 1200.ms),
                 const SizedBox(height: 16),
                 GradientText(
-                  L10nService.get('journal.daily_entry.your_journey_begins', language),
+                  L10nService.get(L10nKeys.journalDailyEntryYourJourneyBegins, language),
                   variant: GradientTextVariant.gold,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 24,
@@ -1815,7 +1815,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                 ).animate().fadeIn(delay: 200.ms, duration: 400.ms),
                 const SizedBox(height: 12),
                 Text(
-                  L10nService.get('journal.daily_entry.you_just_wrote_your_first_reflectionneve', language),
+                  L10nService.get(L10nKeys.journalDailyEntryYouJustWroteYourFirstReflectionneve, language),
                   style: AppTypography.decorativeScript(
                     fontSize: 16,
                     color: isDark
@@ -1834,10 +1834,10 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                         final language = AppLanguage.fromIsEn(isEn);
                         HapticFeedback.lightImpact();
                         final lang = language;
-                        final text = '${L10nService.get('journal.daily_entry.first_entry_share', lang)} '
-                            '\u{1F31F}\n\n${L10nService.get('journal.daily_entry.first_entry_subtitle', lang)}\n\n'
+                        final text = '${L10nService.get(L10nKeys.journalDailyEntryFirstEntryShare, lang)} '
+                            '\u{1F31F}\n\n${L10nService.get(L10nKeys.journalDailyEntryFirstEntrySubtitle, lang)}\n\n'
                             '${AppConstants.appStoreUrl}\n'
-                            '${L10nService.get('journal.daily_entry.first_entry_hashtags', lang)}';
+                            '${L10nService.get(L10nKeys.journalDailyEntryFirstEntryHashtags, lang)}';
                         SharePlus.instance.share(ShareParams(text: text));
                       },
                       child: Container(
@@ -1861,7 +1861,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     // Continue button
                     Expanded(
                       child: GradientButton.gold(
-                        label: L10nService.get('journal.daily_entry.continue', language),
+                        label: L10nService.get(L10nKeys.journalDailyEntryContinue, language),
                         onPressed: () => Navigator.of(ctx).pop(),
                         expanded: true,
                       ),
@@ -1913,10 +1913,10 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                 : '\u{1F4D6}'; // open book
 
     final lang = language;
-    final title = L10nService.getWithParams('journal.daily_entry.milestone_title', lang, params: {'count': '$count'});
+    final title = L10nService.getWithParams(L10nKeys.journalDailyEntryMilestoneTitle, lang, params: {'count': '$count'});
     final message = count >= 100
-        ? L10nService.get('journal.daily_entry.milestone_message_100', lang)
-        : L10nService.get('journal.daily_entry.milestone_message', lang);
+        ? L10nService.get(L10nKeys.journalDailyEntryMilestoneMessage100, lang)
+        : L10nService.get(L10nKeys.journalDailyEntryMilestoneMessage, lang);
 
     await showDialog(
       context: context,
@@ -2070,7 +2070,7 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
                     const SizedBox(width: 16),
                     Expanded(
                       child: GradientButton.gold(
-                        label: L10nService.get('journal.daily_entry.continue_1', language),
+                        label: L10nService.get(L10nKeys.journalDailyEntryContinue1, language),
                         onPressed: () => Navigator.of(ctx).pop(),
                         expanded: true,
                       ),
@@ -2195,10 +2195,10 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(
           content: Text(
-            L10nService.get('journal.daily_entry.loving_innercycles_invite_a_friend_you_b', language),
+            L10nService.get(L10nKeys.journalDailyEntryLovingInnercyclesInviteAFriendYouB, language),
           ),
           action: SnackBarAction(
-            label: L10nService.get('journal.daily_entry.invite', language),
+            label: L10nService.get(L10nKeys.journalDailyEntryInvite, language),
             textColor: AppColors.starGold,
             onPressed: () {
               if (mounted) context.push(Routes.referralProgram);
@@ -2243,11 +2243,11 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(
           content: Text(
-            L10nService.getWithParams('journal.daily_entry.streak_nudge', language, params: {'streak': '$streak'}),
+            L10nService.getWithParams(L10nKeys.journalDailyEntryStreakNudge, language, params: {'streak': '$streak'}),
           ),
           behavior: SnackBarBehavior.floating,
           action: SnackBarAction(
-            label: L10nService.get('journal.daily_entry.share', language),
+            label: L10nService.get(L10nKeys.journalDailyEntryShare, language),
             onPressed: () {
               if (!mounted) return;
               ShareCardSheet.show(
@@ -2290,17 +2290,17 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
     final language = AppLanguage.fromIsEn(isEn);
     switch (rating) {
       case 1:
-        return L10nService.get('journal.daily_entry.difficult', language);
+        return L10nService.get(L10nKeys.journalDailyEntryDifficult, language);
       case 2:
-        return L10nService.get('journal.daily_entry.low', language);
+        return L10nService.get(L10nKeys.journalDailyEntryLow, language);
       case 3:
-        return L10nService.get('journal.daily_entry.neutral', language);
+        return L10nService.get(L10nKeys.journalDailyEntryNeutral, language);
       case 4:
-        return L10nService.get('journal.daily_entry.good', language);
+        return L10nService.get(L10nKeys.journalDailyEntryGood, language);
       case 5:
-        return L10nService.get('journal.daily_entry.great', language);
+        return L10nService.get(L10nKeys.journalDailyEntryGreat, language);
       default:
-        return L10nService.get('journal.daily_entry.neutral_1', language);
+        return L10nService.get(L10nKeys.journalDailyEntryNeutral1, language);
     }
   }
 
@@ -2341,8 +2341,8 @@ class _DailyEntryScreenState extends ConsumerState<DailyEntryScreen> {
     final selected = DateTime(date.year, date.month, date.day);
     final diff = today.difference(selected).inDays;
 
-    if (diff == 0) return L10nService.get('journal.daily_entry.today', language);
-    if (diff == 1) return L10nService.get('journal.daily_entry.yesterday', language);
+    if (diff == 0) return L10nService.get(L10nKeys.journalDailyEntryToday, language);
+    if (diff == 1) return L10nService.get(L10nKeys.journalDailyEntryYesterday, language);
 
     final days = L10nService.getList('journal.daily_entry.day_names', language);
     return days[date.weekday - 1];
@@ -181,7 +181,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                 mainAxisSize: MainAxisSize.min,
                 children: [
                   Text(
-                    L10nService.get('journal.emotional_cycle.unable_to_load_data', language),
+                    L10nService.get(L10nKeys.journalEmotionalCycleUnableToLoadData, language),
                     style: AppTypography.decorativeScript(
                       fontSize: 15,
                       color: isDark
@@ -199,7 +199,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                       color: AppColors.starGold,
                     ),
                     label: Text(
-                      L10nService.get('journal.emotional_cycle.retry', language),
+                      L10nService.get(L10nKeys.journalEmotionalCycleRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -257,7 +257,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('journal.emotional_cycle.your_inner_cycles', language),
+            title: L10nService.get(L10nKeys.journalEmotionalCycleYourInnerCycles, language),
           ),
           SliverFillRemaining(
             hasScrollBody: false,
@@ -326,7 +326,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                     ),
                     const SizedBox(height: 24),
                     Text(
-                      L10nService.get('journal.emotional_cycle.your_cycles_are_forming', language),
+                      L10nService.get(L10nKeys.journalEmotionalCycleYourCyclesAreForming, language),
                       style: AppTypography.modernAccent(
                         fontSize: 24,
                         color: isDark
@@ -405,7 +405,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                         ),
                         icon: const Icon(Icons.edit_note, size: 20),
                         label: Text(
-                          L10nService.get('journal.emotional_cycle.start_journaling', language),
+                          L10nService.get(L10nKeys.journalEmotionalCycleStartJournaling, language),
                           style: AppTypography.modernAccent(
                             fontSize: 16,
                             fontWeight: FontWeight.w600,
@@ -451,7 +451,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('journal.emotional_cycle.your_inner_cycles_1', language),
+            title: L10nService.get(L10nKeys.journalEmotionalCycleYourInnerCycles1, language),
             largeTitleMode: true,
           ),
           SliverToBoxAdapter(
@@ -541,7 +541,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
 
                 // SUMMARY CARDS
                 GradientText(
-                  L10nService.get('journal.emotional_cycle.your_dimensions', language),
+                  L10nService.get(L10nKeys.journalEmotionalCycleYourDimensions, language),
                   variant: GradientTextVariant.aurora,
                   style: AppTypography.elegantAccent(
                     fontSize: 16,
@@ -581,7 +581,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                 // INSIGHTS
                 if (analysis.insights.isNotEmpty) ...[
                   Text(
-                    L10nService.get('journal.emotional_cycle.cycle_insights', language),
+                    L10nService.get(L10nKeys.journalEmotionalCycleCycleInsights, language),
                     style: AppTypography.displayFont.copyWith(
                       fontSize: 18,
                       color: isDark
@@ -681,7 +681,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
               const Icon(Icons.waves, color: AppColors.auroraStart, size: 20),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.getWithParams('journal.emotional_cycle.last_n_days', language, params: {'count': '$displayDays'}),
+                L10nService.getWithParams(L10nKeys.journalEmotionalCycleLastNDays, language, params: {'count': '$displayDays'}),
                 variant: GradientTextVariant.aurora,
                 style: AppTypography.modernAccent(
                   fontSize: 15,
@@ -708,7 +708,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                     ),
                     const SizedBox(height: 12),
                     Text(
-                      L10nService.get('journal.emotional_cycle.start_journaling_to_see_your_cycles', language),
+                      L10nService.get(L10nKeys.journalEmotionalCycleStartJournalingToSeeYourCycles, language),
                       style: AppTypography.decorativeScript(
                         fontSize: 14,
                         color: isDark
@@ -748,7 +748,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                 mainAxisAlignment: MainAxisAlignment.spaceBetween,
                 children: [
                   Text(
-                    L10nService.getWithParams('journal.emotional_cycle.days_ago', language, params: {'count': '$displayDays'}),
+                    L10nService.getWithParams(L10nKeys.journalEmotionalCycleDaysAgo, language, params: {'count': '$displayDays'}),
                     style: AppTypography.elegantAccent(
                       fontSize: 10,
                       color: isDark
@@ -758,7 +758,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                     ),
                   ),
                   Text(
-                    L10nService.get('journal.emotional_cycle.today', language),
+                    L10nService.get(L10nKeys.journalEmotionalCycleToday, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 10,
                       color: isDark
@@ -838,7 +838,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
             padding: const EdgeInsets.only(right: AppConstants.spacingSm),
             child: Semantics(
               label:
-                  '$label ${isVisible ? L10nService.get('common.accessibility.visible', language) : L10nService.get('common.accessibility.hidden', language)}',
+                  '$label ${isVisible ? L10nService.get(L10nKeys.commonAccessibilityVisible, language) : L10nService.get(L10nKeys.commonAccessibilityHidden, language)}',
               toggled: isVisible,
               button: true,
               child: GestureDetector(
@@ -1003,7 +1003,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
         Row(
           children: [
             Text(
-              L10nService.get('journal.emotional_cycle.shift_outlook', language),
+              L10nService.get(L10nKeys.journalEmotionalCycleShiftOutlook, language),
               style: AppTypography.displayFont.copyWith(
                 fontSize: 18,
                 color: isDark
@@ -1046,7 +1046,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
         else
           Semantics(
             button: true,
-            label: L10nService.get('journal.emotional_cycle.access_shift_outlook', language),
+            label: L10nService.get(L10nKeys.journalEmotionalCycleAccessShiftOutlook, language),
             child: GestureDetector(
               onTap: () {
                 HapticFeedback.lightImpact();
@@ -1070,7 +1070,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                     const SizedBox(width: 12),
                     Expanded(
                       child: Text(
-                        L10nService.get('journal.emotional_cycle.access_shift_outlook_to_see_when_your_em', language),
+                        L10nService.get(L10nKeys.journalEmotionalCycleAccessShiftOutlookToSeeWhenYourEm, language),
                         style: AppTypography.decorativeScript(
                           fontSize: 13,
                           color: isDark
@@ -1136,7 +1136,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
         ],
       ),
       child: Semantics(
-        label: L10nService.get('journal.emotional_cycle.share_my_inner_cycles', language),
+        label: L10nService.get(L10nKeys.journalEmotionalCycleShareMyInnerCycles, language),
         button: true,
         child: Material(
           color: Colors.transparent,
@@ -1154,7 +1154,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
                   const Icon(Icons.share, color: Colors.white, size: 20),
                   const SizedBox(width: 10),
                   Text(
-                    L10nService.get('journal.emotional_cycle.share_my_inner_cycles_1', language),
+                    L10nService.get(L10nKeys.journalEmotionalCycleShareMyInnerCycles1, language),
                     style: AppTypography.modernAccent(
                       color: Colors.white,
                       fontSize: 16,
@@ -1189,7 +1189,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
           const Icon(Icons.lock_outline, color: AppColors.starGold, size: 36),
           const SizedBox(height: AppConstants.spacingMd),
           Text(
-            L10nService.get('journal.emotional_cycle.access_full_30day_view', language),
+            L10nService.get(L10nKeys.journalEmotionalCycleAccessFull30dayView, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 18,
               color: AppColors.starGold,
@@ -1211,7 +1211,7 @@ class _EmotionalCycleScreenState extends ConsumerState<EmotionalCycleScreen>
           ),
           const SizedBox(height: AppConstants.spacingLg),
           GradientOutlinedButton(
-            label: L10nService.get('journal.emotional_cycle.go_pro', language),
+            label: L10nService.get(L10nKeys.journalEmotionalCycleGoPro, language),
             variant: GradientTextVariant.gold,
             expanded: true,
             fontSize: 16,
@@ -65,7 +65,7 @@ class EntryDetailScreen extends ConsumerWidget {
                         color: AppColors.starGold,
                       ),
                       label: Text(
-                        L10nService.get('journal.entry_detail.retry', language),
+                        L10nService.get(L10nKeys.journalEntryDetailRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -82,7 +82,7 @@ class EntryDetailScreen extends ConsumerWidget {
               if (entry == null) {
                 return Center(
                   child: Text(
-                    L10nService.get('journal.entry_detail.entry_not_found', language),
+                    L10nService.get(L10nKeys.journalEntryDetailEntryNotFound, language),
                     style: AppTypography.subtitle(
                       color: isDark
                           ? AppColors.textPrimary
@@ -123,7 +123,7 @@ class EntryDetailScreen extends ConsumerWidget {
             title: dateStr,
             actions: [
               IconButton(
-                tooltip: L10nService.get('journal.entry_detail.share_entry', language),
+                tooltip: L10nService.get(L10nKeys.journalEntryDetailShareEntry, language),
                 onPressed: () {
                   HapticService.buttonPress();
                   final stars = '★' * entry.overallRating +
@@ -144,7 +144,7 @@ class EntryDetailScreen extends ConsumerWidget {
               ),
               IconButton(
                 onPressed: () => _confirmDelete(context, ref, entry.id, isEn),
-                tooltip: L10nService.get('journal.entry_detail.delete_entry', language),
+                tooltip: L10nService.get(L10nKeys.journalEntryDetailDeleteEntry, language),
                 icon: Icon(Icons.delete_outline, color: AppColors.error),
               ),
             ],
@@ -351,7 +351,7 @@ class EntryDetailScreen extends ConsumerWidget {
           width: double.infinity,
           fit: BoxFit.cover,
           cacheWidth: 800,
-          semanticLabel: L10nService.get('journal.entry_detail.journal_entry_photo', language),
+          semanticLabel: L10nService.get(L10nKeys.journalEntryDetailJournalEntryPhoto, language),
           errorBuilder: (_, _, _) => const SizedBox.shrink(),
         ),
       ),
@@ -374,7 +374,7 @@ class EntryDetailScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            (L10nService.get('journal.entry_detail.notes', language)).toUpperCase(),
+            (L10nService.get(L10nKeys.journalEntryDetailNotes, language)).toUpperCase(),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 14,
@@ -390,7 +390,7 @@ class EntryDetailScreen extends ConsumerWidget {
               HapticService.buttonPress();
               ScaffoldMessenger.of(context).showSnackBar(
                 SnackBar(
-                  content: Text(L10nService.get('journal.entry_detail.entry_copied_to_clipboard', language)),
+                  content: Text(L10nService.get(L10nKeys.journalEntryDetailEntryCopiedToClipboard, language)),
                   duration: const Duration(seconds: 1),
                   backgroundColor: AppColors.success,
                 ),
@@ -421,10 +421,10 @@ class EntryDetailScreen extends ConsumerWidget {
     final language = AppLanguage.fromIsEn(isEn);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('journal.entry_detail.delete_entry_1', language),
-      message: L10nService.get('journal.entry_detail.this_journal_entry_will_be_permanently_d', language),
-      cancelLabel: L10nService.get('journal.entry_detail.cancel', language),
-      confirmLabel: L10nService.get('journal.entry_detail.delete', language),
+      title: L10nService.get(L10nKeys.journalEntryDetailDeleteEntry1, language),
+      message: L10nService.get(L10nKeys.journalEntryDetailThisJournalEntryWillBePermanentlyD, language),
+      cancelLabel: L10nService.get(L10nKeys.journalEntryDetailCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.journalEntryDetailDelete, language),
       isDestructive: true,
     );
     if (confirmed != true) return;
@@ -122,7 +122,7 @@ class _MonthlyReflectionScreenState
                         color: AppColors.starGold,
                       ),
                       label: Text(
-                        L10nService.get('journal.monthly_reflection.retry', language),
+                        L10nService.get(L10nKeys.journalMonthlyReflectionRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -147,7 +147,7 @@ class _MonthlyReflectionScreenState
                   ),
                   slivers: [
                     GlassSliverAppBar(
-                      title: L10nService.get('journal.monthly_reflection.monthly_reflection', language),
+                      title: L10nService.get(L10nKeys.journalMonthlyReflectionMonthlyReflection, language),
                       actions: [
                         if (summary.totalEntries > 0)
                           IconButton(
@@ -171,7 +171,7 @@ class _MonthlyReflectionScreenState
                               color: AppColors.starGold,
                               size: 20,
                             ),
-                            tooltip: L10nService.get('journal.monthly_reflection.share_monthly_summary', language),
+                            tooltip: L10nService.get(L10nKeys.journalMonthlyReflectionShareMonthlySummary, language),
                           ),
                       ],
                     ),
@@ -296,7 +296,7 @@ class _MonthlyReflectionScreenState
                     ),
                     const SizedBox(height: 8),
                     GradientText(
-                      L10nService.get('journal.monthly_reflection.access_your_full_monthly_report', language),
+                      L10nService.get(L10nKeys.journalMonthlyReflectionAccessYourFullMonthlyReport, language),
                       variant: GradientTextVariant.gold,
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 14,
@@ -305,7 +305,7 @@ class _MonthlyReflectionScreenState
                     ),
                     const SizedBox(height: 12),
                     GradientButton.gold(
-                      label: L10nService.get('journal.monthly_reflection.see_full_report', language),
+                      label: L10nService.get(L10nKeys.journalMonthlyReflectionSeeFullReport, language),
                       onPressed: () => showContextualPaywall(
                         context,
                         ref,
@@ -372,7 +372,7 @@ class _MonthlyReflectionScreenState
                 }
               });
             },
-            tooltip: L10nService.get('journal.monthly_reflection.previous_month', language),
+            tooltip: L10nService.get(L10nKeys.journalMonthlyReflectionPreviousMonth, language),
             icon: Icon(
               Icons.chevron_left,
               color: isDark
@@ -405,7 +405,7 @@ class _MonthlyReflectionScreenState
                 });
               }
             },
-            tooltip: L10nService.get('journal.monthly_reflection.next_month', language),
+            tooltip: L10nService.get(L10nKeys.journalMonthlyReflectionNextMonth, language),
             icon: Icon(
               Icons.chevron_right,
               color: isDark
@@ -463,7 +463,7 @@ class _MonthlyReflectionScreenState
                 ),
                 const SizedBox(height: 12),
                 Text(
-                  L10nService.get('journal.monthly_reflection.this_month_is_waiting_for_your_first_ref', language),
+                  L10nService.get(L10nKeys.journalMonthlyReflectionThisMonthIsWaitingForYourFirstRef, language),
                   style: AppTypography.decorativeScript(
                     fontSize: 14,
                     color: isDark
@@ -476,7 +476,7 @@ class _MonthlyReflectionScreenState
                   onTap: () => context.push(Routes.journal),
                   behavior: HitTestBehavior.opaque,
                   child: Text(
-                    L10nService.get('journal.monthly_reflection.write_your_first_entry', language),
+                    L10nService.get(L10nKeys.journalMonthlyReflectionWriteYourFirstEntry, language),
                     style: AppTypography.modernAccent(
                       fontSize: 14,
                       fontWeight: FontWeight.w600,
@@ -492,7 +492,7 @@ class _MonthlyReflectionScreenState
             _buildHighlight(
               context,
               isDark,
-              L10nService.get('journal.monthly_reflection.strongest_area', language),
+              L10nService.get(L10nKeys.journalMonthlyReflectionStrongestArea, language),
               summary.strongestArea?.localizedName(language) ?? '',
               Icons.star,
               AppColors.success,
@@ -504,7 +504,7 @@ class _MonthlyReflectionScreenState
             _buildHighlight(
               context,
               isDark,
-              L10nService.get('journal.monthly_reflection.needs_attention', language),
+              L10nService.get(L10nKeys.journalMonthlyReflectionNeedsAttention, language),
               summary.weakestArea?.localizedName(language) ?? '',
               Icons.info_outline,
               AppColors.warning,
@@ -514,7 +514,7 @@ class _MonthlyReflectionScreenState
           _buildHighlight(
             context,
             isDark,
-            L10nService.get('journal.monthly_reflection.current_streak', language),
+            L10nService.get(L10nKeys.journalMonthlyReflectionCurrentStreak, language),
             isEn
                 ? '${summary.currentStreak} days'
                 : '${summary.currentStreak} gün',
@@ -609,7 +609,7 @@ class _MonthlyReflectionScreenState
           ),
           const SizedBox(height: 16),
           Text(
-            L10nService.get('journal.monthly_reflection.weekly_prompts', language),
+            L10nService.get(L10nKeys.journalMonthlyReflectionWeeklyPrompts, language),
             style: AppTypography.elegantAccent(
               fontSize: 12,
               fontWeight: FontWeight.w600,
@@ -626,7 +626,7 @@ class _MonthlyReflectionScreenState
                 crossAxisAlignment: CrossAxisAlignment.start,
                 children: [
                   Text(
-                    '${L10nService.get('common.week_abbr', language)}${i + 1}',
+                    '${L10nService.get(L10nKeys.commonWeekAbbr, language)}${i + 1}',
                     style: AppTypography.modernAccent(
                       fontSize: 11,
                       fontWeight: FontWeight.w700,
@@ -694,7 +694,7 @@ class _MonthlyReflectionScreenState
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('journal.monthly_reflection.area_breakdown', language),
+            L10nService.get(L10nKeys.journalMonthlyReflectionAreaBreakdown, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 14,
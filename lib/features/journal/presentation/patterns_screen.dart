@@ -77,7 +77,7 @@ class PatternsScreen extends ConsumerWidget {
                         color: AppColors.starGold,
                       ),
                       label: Text(
-                        L10nService.get('journal.patterns.retry', language),
+                        L10nService.get(L10nKeys.journalPatternsRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -222,7 +222,7 @@ class PatternsScreen extends ConsumerWidget {
                             ),
                             const SizedBox(height: 28),
                             GradientText(
-                              L10nService.get('journal.patterns.patterns_unlock_after_7_entries', language),
+                              L10nService.get(L10nKeys.journalPatternsPatternsUnlockAfter7Entries, language),
                               variant: GradientTextVariant.gold,
                               textAlign: TextAlign.center,
                               style: AppTypography.modernAccent(
@@ -283,7 +283,7 @@ class PatternsScreen extends ConsumerWidget {
                             const SizedBox(height: 24),
                             // CTA to journal
                             GradientButton.gold(
-                              label: L10nService.get('journal.patterns.write_entry', language),
+                              label: L10nService.get(L10nKeys.journalPatternsWriteEntry, language),
                               icon: Icons.edit_note_outlined,
                               onPressed: () => context.push(Routes.journal),
                               expanded: true,
@@ -553,7 +553,7 @@ class PatternsScreen extends ConsumerWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
       button: true,
-      label: L10nService.get('journal.patterns.see_full_analysis', language),
+      label: L10nService.get(L10nKeys.journalPatternsSeeFullAnalysis, language),
       child: GestureDetector(
         onTap: () {
           showContextualPaywall(
@@ -621,7 +621,7 @@ class PatternsScreen extends ConsumerWidget {
                         ),
                         const SizedBox(width: 8),
                         Text(
-                          L10nService.get('journal.patterns.see_full_analysis_1', language),
+                          L10nService.get(L10nKeys.journalPatternsSeeFullAnalysis1, language),
                           style: AppTypography.modernAccent(
                             color: Colors.black,
                             fontWeight: FontWeight.bold,
@@ -642,7 +642,7 @@ class PatternsScreen extends ConsumerWidget {
 
   GlassSliverAppBar _buildAppBar(BuildContext context, bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
-    return GlassSliverAppBar(title: L10nService.get('journal.patterns.your_patterns', language));
+    return GlassSliverAppBar(title: L10nService.get(L10nKeys.journalPatternsYourPatterns, language));
   }
 
   Widget _buildCycleArcs(
@@ -663,7 +663,7 @@ class PatternsScreen extends ConsumerWidget {
         border: Border.all(color: AppColors.starGold.withValues(alpha: 0.2)),
       ),
       child: Semantics(
-        label: L10nService.get('journal.patterns.focus_area_cycle_averages_chart', language),
+        label: L10nService.get(L10nKeys.journalPatternsFocusAreaCycleAveragesChart, language),
         image: true,
         child: CustomPaint(
           size: const Size(double.infinity, 170),
@@ -700,7 +700,7 @@ class PatternsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('journal.patterns.this_week_vs_last_week', language),
+            L10nService.get(L10nKeys.journalPatternsThisWeekVsLastWeek, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 14,
@@ -805,7 +805,7 @@ class PatternsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('journal.patterns.trends', language),
+            L10nService.get(L10nKeys.journalPatternsTrends, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 14,
@@ -867,7 +867,7 @@ class PatternsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('journal.patterns.connections', language),
+            L10nService.get(L10nKeys.journalPatternsConnections, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.elegantAccent(
               fontSize: 14,
@@ -924,7 +924,7 @@ class PatternsScreen extends ConsumerWidget {
               Icon(Icons.insights, color: AppColors.auroraStart, size: 20),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('journal.patterns.crossdimension_insights', language),
+                L10nService.get(L10nKeys.journalPatternsCrossdimensionInsights, language),
                 variant: GradientTextVariant.aurora,
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
@@ -1032,7 +1032,7 @@ class PatternsScreen extends ConsumerWidget {
           const SizedBox(height: AppConstants.spacingSm),
           // Disclaimer
           Text(
-            L10nService.get('journal.patterns.based_on_your_personal_journal_entries_n', language),
+            L10nService.get(L10nKeys.journalPatternsBasedOnYourPersonalJournalEntriesN, language),
             style: AppTypography.decorativeScript(
               fontSize: 11,
               color: isDark
@@ -1068,7 +1068,7 @@ class PatternsScreen extends ConsumerWidget {
               Icon(Icons.favorite_border_rounded, color: accentColor, size: 20),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('journal.patterns.gratitude_mood', language),
+                L10nService.get(L10nKeys.journalPatternsGratitudeMood, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
@@ -1084,7 +1084,7 @@ class PatternsScreen extends ConsumerWidget {
               Expanded(
                 child: _buildMoodAverageColumn(
                   context,
-                  label: L10nService.get('journal.patterns.gratitude_days', language),
+                  label: L10nService.get(L10nKeys.journalPatternsGratitudeDays, language),
                   average: comparison.moodWithGratitude,
                   days: comparison.daysWithGratitude,
                   color: accentColor,
@@ -1102,7 +1102,7 @@ class PatternsScreen extends ConsumerWidget {
               Expanded(
                 child: _buildMoodAverageColumn(
                   context,
-                  label: L10nService.get('journal.patterns.other_days', language),
+                  label: L10nService.get(L10nKeys.journalPatternsOtherDays, language),
                   average: comparison.moodWithoutGratitude,
                   days: comparison.daysWithoutGratitude,
                   color: isDark
@@ -1162,7 +1162,7 @@ class PatternsScreen extends ConsumerWidget {
           textAlign: TextAlign.center,
         ),
         Text(
-          L10nService.getWithParams('journal.patterns.n_days', language, params: {'count': '$days'}),
+          L10nService.getWithParams(L10nKeys.journalPatternsNDays, language, params: {'count': '$days'}),
           style: AppTypography.subtitle(
             fontSize: 11,
             color: isDark
@@ -111,7 +111,7 @@ class CycleSummaryCard extends StatelessWidget {
                   _buildStatChip(
                     context,
                     icon: Icons.waves,
-                    label: '~${summary.cycleLengthDays}${L10nService.get('common.unit.days_abbr', language)}',
+                    label: '~${summary.cycleLengthDays}${L10nService.get(L10nKeys.commonUnitDaysAbbr, language)}',
                     color: color,
                   ),
 
@@ -135,7 +135,7 @@ class CycleSummaryCard extends StatelessWidget {
             Row(
               children: [
                 Text(
-                  L10nService.get('journal.cycle_summary.current_avg', language),
+                  L10nService.get(L10nKeys.journalCycleSummaryCurrentAvg, language),
                   style: AppTypography.elegantAccent(
                     fontSize: 11,
                     color: isDark
@@ -78,7 +78,7 @@ class _CycleWaveChartState extends State<CycleWaveChart> {
         });
       },
       child: Semantics(
-        label: L10nService.get('journal.cycle_wave_painter.emotional_cycle_wave_chart', language),
+        label: L10nService.get(L10nKeys.journalCycleWavePainterEmotionalCycleWaveChart, language),
         image: true,
         child: RepaintBoundary(
           child: CustomPaint(
@@ -40,7 +40,7 @@ class PatternLoopAnalyzer extends StatelessWidget {
       children: [
         // Section header
         Text(
-          L10nService.get('journal.pattern_loop_analyzer.pattern_loops', language),
+          L10nService.get(L10nKeys.journalPatternLoopAnalyzerPatternLoops, language),
           style: AppTypography.displayFont.copyWith(
             fontSize: 18,
             color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
@@ -49,7 +49,7 @@ class PatternLoopAnalyzer extends StatelessWidget {
         ),
         const SizedBox(height: 4),
         Text(
-          L10nService.get('journal.pattern_loop_analyzer.behavioral_patterns_detected_in_your_ent', language),
+          L10nService.get(L10nKeys.journalPatternLoopAnalyzerBehavioralPatternsDetectedInYourEnt, language),
           style: AppTypography.decorativeScript(
             fontSize: 13,
             color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -93,7 +93,7 @@ class PatternLoopAnalyzer extends StatelessWidget {
           const SizedBox(width: 12),
           Expanded(
             child: Text(
-              L10nService.get('journal.pattern_loop_analyzer.keep_journaling_to_discover_your_behavio', language),
+              L10nService.get(L10nKeys.journalPatternLoopAnalyzerKeepJournalingToDiscoverYourBehavio, language),
               style: AppTypography.decorativeScript(
                 fontSize: 14,
                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -127,7 +127,7 @@ class PatternLoopAnalyzer extends StatelessWidget {
         children: [
           if (positive > 0)
             _buildBreakdownChip(
-              L10nService.get('journal.pattern_loop_analyzer.positive', language),
+              L10nService.get(L10nKeys.journalPatternLoopAnalyzerPositive, language),
               positive,
               AppColors.success,
             ),
@@ -135,14 +135,14 @@ class PatternLoopAnalyzer extends StatelessWidget {
             const SizedBox(width: 8),
           if (negative > 0)
             _buildBreakdownChip(
-              L10nService.get('journal.pattern_loop_analyzer.negative', language),
+              L10nService.get(L10nKeys.journalPatternLoopAnalyzerNegative, language),
               negative,
               AppColors.warning,
             ),
           if (negative > 0 && neutral > 0) const SizedBox(width: 8),
           if (neutral > 0)
             _buildBreakdownChip(
-              L10nService.get('journal.pattern_loop_analyzer.neutral', language),
+              L10nService.get(L10nKeys.journalPatternLoopAnalyzerNeutral, language),
               neutral,
               AppColors.textMuted,
             ),
@@ -378,7 +378,7 @@ class _PatternLoopCardState extends State<_PatternLoopCard> {
           Row(
             children: [
               Text(
-                L10nService.get('journal.pattern_loop_analyzer.strength', language),
+                L10nService.get(L10nKeys.journalPatternLoopAnalyzerStrength, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 11,
                   color: widget.isDark
@@ -92,7 +92,7 @@ class _PhaseRingState extends State<PhaseRing>
             children: [
               // Background ring
               Semantics(
-                label: L10nService.get('journal.phase_ring.emotional_phase_ring', language),
+                label: L10nService.get(L10nKeys.journalPhaseRingEmotionalPhaseRing, language),
                 image: true,
                 child: RepaintBoundary(
                   child: CustomPaint(
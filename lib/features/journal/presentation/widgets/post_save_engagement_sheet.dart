@@ -155,7 +155,7 @@ class PostSaveEngagementSheet extends ConsumerWidget {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         GradientText(
-                          L10nService.get('journal.post_save_engagement.saved', language),
+                          L10nService.get(L10nKeys.journalPostSaveEngagementSaved, language),
                           variant: GradientTextVariant.gold,
                           style: AppTypography.elegantAccent(
                             fontSize: 20,
@@ -313,7 +313,7 @@ class PostSaveEngagementSheet extends ConsumerWidget {
               Align(
                 alignment: Alignment.centerLeft,
                 child: Text(
-                  L10nService.get('journal.post_save_engagement.what_else_would_you_like_to_capture', language),
+                  L10nService.get(L10nKeys.journalPostSaveEngagementWhatElseWouldYouLikeToCapture, language),
                   style: AppTypography.subtitle(
                     fontSize: 14,
                     color: isDark
@@ -360,7 +360,7 @@ class PostSaveEngagementSheet extends ConsumerWidget {
                 child: Padding(
                   padding: const EdgeInsets.symmetric(vertical: 8),
                   child: Text(
-                  L10nService.get('journal.post_save_engagement.back_to_home', language),
+                  L10nService.get(L10nKeys.journalPostSaveEngagementBackToHome, language),
                   style: AppTypography.subtitle(
                     fontSize: 14,
                     color: isDark
@@ -384,24 +384,24 @@ class PostSaveEngagementSheet extends ConsumerWidget {
     // Always suggest mood check-in (quick action)
     suggestions.add(_Suggestion(
       icon: Icons.mood_rounded,
-      title: L10nService.get('journal.post_save_engagement.log_your_mood', language),
-      subtitle: L10nService.get('journal.post_save_engagement.quick_1tap_checkin', language),
+      title: L10nService.get(L10nKeys.journalPostSaveEngagementLogYourMood, language),
+      subtitle: L10nService.get(L10nKeys.journalPostSaveEngagementQuick1tapCheckin, language),
       route: Routes.today,
     ));
 
     // Dream journal
     suggestions.add(_Suggestion(
       icon: Icons.nightlight_round,
-      title: L10nService.get('journal.post_save_engagement.record_a_dream', language),
-      subtitle: L10nService.get('journal.post_save_engagement.capture_it_before_it_fades', language),
+      title: L10nService.get(L10nKeys.journalPostSaveEngagementRecordADream, language),
+      subtitle: L10nService.get(L10nKeys.journalPostSaveEngagementCaptureItBeforeItFades, language),
       route: Routes.dreamInterpretation,
     ));
 
     // Notes to self
     suggestions.add(_Suggestion(
       icon: Icons.sticky_note_2_outlined,
-      title: L10nService.get('journal.post_save_engagement.write_a_note_to_yourself', language),
-      subtitle: L10nService.get('journal.post_save_engagement.thoughts_reminders_ideas', language),
+      title: L10nService.get(L10nKeys.journalPostSaveEngagementWriteANoteToYourself, language),
+      subtitle: L10nService.get(L10nKeys.journalPostSaveEngagementThoughtsRemindersIdeas, language),
       route: Routes.noteCreate,
     ));
 
@@ -409,7 +409,7 @@ class PostSaveEngagementSheet extends ConsumerWidget {
     if (entryCount >= 5) {
       suggestions.add(_Suggestion(
         icon: Icons.insights_rounded,
-        title: L10nService.get('journal.post_save_engagement.explore_your_patterns', language),
+        title: L10nService.get(L10nKeys.journalPostSaveEngagementExploreYourPatterns, language),
         subtitle: isEn
             ? '$entryCount entries analyzed'
             : '$entryCount kay\u0131t analiz edildi',
@@ -421,8 +421,8 @@ class PostSaveEngagementSheet extends ConsumerWidget {
     if (entryCount >= 10) {
       suggestions.add(_Suggestion(
         icon: Icons.card_giftcard_rounded,
-        title: L10nService.get('journal.post_save_engagement.invite_a_friend', language),
-        subtitle: L10nService.get('journal.post_save_engagement.you_both_get_7_days_premium_free', language),
+        title: L10nService.get(L10nKeys.journalPostSaveEngagementInviteAFriend, language),
+        subtitle: L10nService.get(L10nKeys.journalPostSaveEngagementYouBothGet7DaysPremiumFree, language),
         route: Routes.referralProgram,
       ));
     }
@@ -446,8 +446,8 @@ class PostSaveEngagementSheet extends ConsumerWidget {
     // Gratitude
     suggestions.add(_Suggestion(
       icon: Icons.volunteer_activism_rounded,
-      title: L10nService.get('journal.post_save_engagement.gratitude_journal', language),
-      subtitle: L10nService.get('journal.post_save_engagement.end_your_day_with_gratitude', language),
+      title: L10nService.get(L10nKeys.journalPostSaveEngagementGratitudeJournal, language),
+      subtitle: L10nService.get(L10nKeys.journalPostSaveEngagementEndYourDayWithGratitude, language),
       route: Routes.gratitudeJournal,
     ));
 
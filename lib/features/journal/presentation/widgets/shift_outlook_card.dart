@@ -65,7 +65,7 @@ class ShiftOutlookCard extends StatelessWidget {
                   crossAxisAlignment: CrossAxisAlignment.start,
                   children: [
                     Text(
-                      L10nService.get('journal.shift_outlook.shift_outlook', language),
+                      L10nService.get(L10nKeys.journalShiftOutlookShiftOutlook, language),
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 16,
                         color: isDark
@@ -75,7 +75,7 @@ class ShiftOutlookCard extends StatelessWidget {
                       ),
                     ),
                     Text(
-                      '${window.confidence.label(language)} ${L10nService.get('journal.shift_outlook.confidence', language)}',
+                      '${window.confidence.label(language)} ${L10nService.get(L10nKeys.journalShiftOutlookConfidence, language)}',
                       style: AppTypography.elegantAccent(
                         fontSize: 11,
                         color: _confidenceColor(window.confidence),
@@ -98,7 +98,7 @@ class ShiftOutlookCard extends StatelessWidget {
                   border: Border.all(color: phaseColor.withValues(alpha: 0.3)),
                 ),
                 child: Text(
-                  '~${window.estimatedDaysUntilShift}${L10nService.get('common.unit.days_abbr', language)}',
+                  '~${window.estimatedDaysUntilShift}${L10nService.get(L10nKeys.commonUnitDaysAbbr, language)}',
                   style: AppTypography.modernAccent(
                     fontSize: 13,
                     fontWeight: FontWeight.w700,
@@ -167,7 +167,7 @@ class ShiftOutlookCard extends StatelessWidget {
           if (outlook.activeSignals.isNotEmpty) ...[
             const SizedBox(height: AppConstants.spacingMd),
             Text(
-              L10nService.get('journal.shift_outlook.supporting_signals', language),
+              L10nService.get(L10nKeys.journalShiftOutlookSupportingSignals, language),
               style: AppTypography.modernAccent(
                 fontSize: 12,
                 fontWeight: FontWeight.w600,
@@ -288,7 +288,7 @@ class ShiftOutlookCard extends StatelessWidget {
           const SizedBox(width: 12),
           Expanded(
             child: Text(
-              L10nService.get('journal.shift_outlook.not_enough_data_for_shift_outlook_yet', language),
+              L10nService.get(L10nKeys.journalShiftOutlookNotEnoughDataForShiftOutlookYet, language),
               style: AppTypography.decorativeScript(
                 fontSize: 14,
                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
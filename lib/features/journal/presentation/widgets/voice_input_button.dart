@@ -145,12 +145,12 @@ class _VoiceInputButtonState extends ConsumerState<VoiceInputButton> {
 
   String _getUnavailableMessage() {
     final language = ref.read(languageProvider);
-    return L10nService.get('journal.voice_input_button.voice_input_is_not_available_on_this_dev', language);
+    return L10nService.get(L10nKeys.journalVoiceInputButtonVoiceInputIsNotAvailableOnThisDev, language);
   }
 
   String _getPermissionMessage() {
     final language = ref.read(languageProvider);
-    return L10nService.get('journal.voice_input_button.microphone_permission_is_required_for_vo', language);
+    return L10nService.get(L10nKeys.journalVoiceInputButtonMicrophonePermissionIsRequiredForVo, language);
   }
 
   void _showError(String message) {
@@ -192,7 +192,7 @@ class _VoiceInputButtonState extends ConsumerState<VoiceInputButton> {
     return GestureDetector(
       onTap: _toggleListening,
       child: Semantics(
-        label: L10nService.get('journal.voice_input_button.voice_input_premium', language),
+        label: L10nService.get(L10nKeys.journalVoiceInputButtonVoiceInputPremium, language),
         button: true,
         child: SizedBox(
           width: widget.size,
@@ -258,8 +258,8 @@ class _VoiceInputButtonState extends ConsumerState<VoiceInputButton> {
       onTap: _isAvailable ? _toggleListening : null,
       child: Semantics(
         label: _isListening
-            ? (L10nService.get('journal.voice_input_button.stop_voice_input', language))
-            : (L10nService.get('journal.voice_input_button.start_voice_input', language)),
+            ? (L10nService.get(L10nKeys.journalVoiceInputButtonStopVoiceInput, language))
+            : (L10nService.get(L10nKeys.journalVoiceInputButtonStartVoiceInput, language)),
         button: true,
         child: AnimatedContainer(
           duration: const Duration(milliseconds: 200),
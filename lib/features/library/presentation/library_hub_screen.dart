@@ -111,7 +111,7 @@ class LibraryHubScreen extends ConsumerWidget {
             ),
             slivers: [
               GlassSliverAppBar(
-                title: L10nService.get('library.library_hub.library', language),
+                title: L10nService.get(L10nKeys.libraryLibraryHubLibrary, language),
                 showBackButton: false,
               ),
               SliverPadding(
@@ -120,7 +120,7 @@ class LibraryHubScreen extends ConsumerWidget {
                   delegate: SliverChildListDelegate([
                     // Header text
                     Text(
-                      L10nService.get('library.library_hub.your_personal_data_vault', language),
+                      L10nService.get(L10nKeys.libraryLibraryHubYourPersonalDataVault, language),
                       style: AppTypography.subtitle(
                         fontSize: 14,
                         color: isDark
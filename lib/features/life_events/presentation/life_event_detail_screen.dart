@@ -48,7 +48,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
               mainAxisSize: MainAxisSize.min,
               children: [
                 Text(
-                  L10nService.get('life_events.life_event_detail.couldnt_load_this_event', language),
+                  L10nService.get(L10nKeys.lifeEventsLifeEventDetailCouldntLoadThisEvent, language),
                   style: AppTypography.subtitle(
                     color: isDark
                         ? AppColors.textSecondary
@@ -64,7 +64,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                     color: AppColors.starGold,
                   ),
                   label: Text(
-                    L10nService.get('life_events.life_event_detail.retry', language),
+                    L10nService.get(L10nKeys.lifeEventsLifeEventDetailRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -80,7 +80,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
             if (event == null) {
               return Center(
                 child: Text(
-                  L10nService.get('life_events.life_event_detail.event_not_found', language),
+                  L10nService.get(L10nKeys.lifeEventsLifeEventDetailEventNotFound, language),
                   style: AppTypography.subtitle(
                     color: isDark
                         ? AppColors.textMuted
@@ -127,10 +127,10 @@ class LifeEventDetailScreen extends ConsumerWidget {
         ),
         slivers: [
           GlassSliverAppBar(
-            title: L10nService.get('life_events.life_event_detail.life_event', language),
+            title: L10nService.get(L10nKeys.lifeEventsLifeEventDetailLifeEvent, language),
             actions: [
               IconButton(
-                tooltip: L10nService.get('life_events.life_event_detail.share_event', language),
+                tooltip: L10nService.get(L10nKeys.lifeEventsLifeEventDetailShareEvent, language),
                 icon: Icon(
                   Icons.share_rounded,
                   color: AppColors.starGold,
@@ -149,7 +149,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                 },
               ),
               IconButton(
-                tooltip: L10nService.get('life_events.life_event_detail.edit_event', language),
+                tooltip: L10nService.get(L10nKeys.lifeEventsLifeEventDetailEditEvent, language),
                 icon: Icon(
                   Icons.edit_rounded,
                   color: isDark
@@ -164,7 +164,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                 },
               ),
               IconButton(
-                tooltip: L10nService.get('life_events.life_event_detail.delete_event', language),
+                tooltip: L10nService.get(L10nKeys.lifeEventsLifeEventDetailDeleteEvent, language),
                 icon: Icon(
                   Icons.delete_outline_rounded,
                   color: AppColors.error,
@@ -186,7 +186,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                       height: 200,
                       width: double.infinity,
                       fit: BoxFit.cover,
-                      semanticLabel: L10nService.get('life_events.life_event_detail.event_photo', language),
+                      semanticLabel: L10nService.get(L10nKeys.lifeEventsLifeEventDetailEventPhoto, language),
                       errorBuilder: (_, _, _) => const SizedBox.shrink(),
                     ),
                   ).animate().fadeIn(duration: 400.ms),
@@ -242,7 +242,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                     Expanded(
                       child: _infoCard(
                         icon: Icons.calendar_today_rounded,
-                        label: L10nService.get('life_events.life_event_detail.date', language),
+                        label: L10nService.get(L10nKeys.lifeEventsLifeEventDetailDate, language),
                         value: formatted,
                         isDark: isDark,
                       ),
@@ -251,7 +251,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                     Expanded(
                       child: _infoCard(
                         icon: Icons.speed_rounded,
-                        label: L10nService.get('life_events.life_event_detail.intensity', language),
+                        label: L10nService.get(L10nKeys.lifeEventsLifeEventDetailIntensity, language),
                         value:
                             intensityLabels[(event.intensity - 1).clamp(0, 4)],
                         isDark: isDark,
@@ -271,7 +271,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         GradientText(
-                          L10nService.get('life_events.life_event_detail.emotions', language),
+                          L10nService.get(L10nKeys.lifeEventsLifeEventDetailEmotions, language),
                           variant: GradientTextVariant.amethyst,
                           style: AppTypography.elegantAccent(
                             fontSize: 13,
@@ -321,7 +321,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         GradientText(
-                          L10nService.get('life_events.life_event_detail.reflection', language),
+                          L10nService.get(L10nKeys.lifeEventsLifeEventDetailReflection, language),
                           variant: GradientTextVariant.amethyst,
                           style: AppTypography.elegantAccent(
                             fontSize: 13,
@@ -336,7 +336,7 @@ class LifeEventDetailScreen extends ConsumerWidget {
                             HapticService.buttonPress();
                             ScaffoldMessenger.of(context).showSnackBar(
                               SnackBar(
-                                content: Text(L10nService.get('life_events.life_event_detail.event_copied_to_clipboard', language)),
+                                content: Text(L10nService.get(L10nKeys.lifeEventsLifeEventDetailEventCopiedToClipboard, language)),
                                 duration: const Duration(seconds: 1),
                                 backgroundColor: AppColors.success,
                               ),
@@ -419,10 +419,10 @@ class LifeEventDetailScreen extends ConsumerWidget {
     final language = AppLanguage.fromIsEn(isEn);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('life_events.life_event_detail.delete_event_1', language),
-      message: L10nService.get('life_events.life_event_detail.this_life_event_will_be_permanently_dele', language),
-      cancelLabel: L10nService.get('life_events.life_event_detail.cancel', language),
-      confirmLabel: L10nService.get('life_events.life_event_detail.delete', language),
+      title: L10nService.get(L10nKeys.lifeEventsLifeEventDetailDeleteEvent1, language),
+      message: L10nService.get(L10nKeys.lifeEventsLifeEventDetailThisLifeEventWillBePermanentlyDele, language),
+      cancelLabel: L10nService.get(L10nKeys.lifeEventsLifeEventDetailCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.lifeEventsLifeEventDetailDelete, language),
       isDestructive: true,
     );
     if (confirmed != true) return;
@@ -125,8 +125,8 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
                 slivers: [
                   GlassSliverAppBar(
                     title: _isEditing
-                        ? (L10nService.get('life_events.life_event.edit_life_event', language))
-                        : (L10nService.get('life_events.life_event.new_life_event', language)),
+                        ? (L10nService.get(L10nKeys.lifeEventsLifeEventEditLifeEvent, language))
+                        : (L10nService.get(L10nKeys.lifeEventsLifeEventNewLifeEvent, language)),
                   ),
                   SliverPadding(
                     padding: const EdgeInsets.all(16),
@@ -182,10 +182,10 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
     final language = ref.read(languageProvider);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('life_events.life_event.discard_changes', language),
-      message: L10nService.get('life_events.life_event.you_have_unsaved_changes_are_you_sure_yo', language),
-      cancelLabel: L10nService.get('life_events.life_event.cancel', language),
-      confirmLabel: L10nService.get('life_events.life_event.discard', language),
+      title: L10nService.get(L10nKeys.lifeEventsLifeEventDiscardChanges, language),
+      message: L10nService.get(L10nKeys.lifeEventsLifeEventYouHaveUnsavedChangesAreYouSureYo, language),
+      cancelLabel: L10nService.get(L10nKeys.lifeEventsLifeEventCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.lifeEventsLifeEventDiscard, language),
       isDestructive: true,
     );
     if (confirmed == true && mounted) {
@@ -203,7 +203,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('life_events.life_event.event_type', language),
+          L10nService.get(L10nKeys.lifeEventsLifeEventEventType, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 14,
@@ -292,7 +292,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('life_events.life_event.select_event', language),
+          L10nService.get(L10nKeys.lifeEventsLifeEventSelectEvent, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 14,
@@ -382,7 +382,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('life_events.life_event.event_title', language),
+          L10nService.get(L10nKeys.lifeEventsLifeEventEventTitle, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 14,
@@ -399,7 +399,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
             fontSize: 15,
           ),
           decoration: InputDecoration(
-            hintText: L10nService.get('life_events.life_event.describe_your_life_event', language),
+            hintText: L10nService.get(L10nKeys.lifeEventsLifeEventDescribeYourLifeEvent, language),
             hintStyle: AppTypography.subtitle(
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
             ),
@@ -527,7 +527,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
         Row(
           children: [
             GradientText(
-              L10nService.get('life_events.life_event.emotion_tags', language),
+              L10nService.get(L10nKeys.lifeEventsLifeEventEmotionTags, language),
               variant: GradientTextVariant.amethyst,
               style: AppTypography.displayFont.copyWith(
                 fontSize: 14,
@@ -617,7 +617,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
         Row(
           children: [
             GradientText(
-              L10nService.get('life_events.life_event.intensity', language),
+              L10nService.get(L10nKeys.lifeEventsLifeEventIntensity, language),
               variant: GradientTextVariant.gold,
               style: AppTypography.displayFont.copyWith(
                 fontSize: 14,
@@ -670,7 +670,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('life_events.life_event.reflection', language),
+          L10nService.get(L10nKeys.lifeEventsLifeEventReflection, language),
           variant: GradientTextVariant.amethyst,
           style: AppTypography.elegantAccent(
             fontSize: 14,
@@ -688,7 +688,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
             fontSize: 14,
           ),
           decoration: InputDecoration(
-            hintText: L10nService.get('life_events.life_event.how_did_this_event_shape_you', language),
+            hintText: L10nService.get(L10nKeys.lifeEventsLifeEventHowDidThisEventShapeYou, language),
             hintStyle: AppTypography.subtitle(
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
             ),
@@ -720,7 +720,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('life_events.life_event.photo_optional', language),
+          L10nService.get(L10nKeys.lifeEventsLifeEventPhotoOptional, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 14,
@@ -738,7 +738,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
               height: 160,
               width: double.infinity,
               fit: BoxFit.cover,
-              semanticLabel: L10nService.get('life_events.life_event.event_photo', language),
+              semanticLabel: L10nService.get(L10nKeys.lifeEventsLifeEventEventPhoto, language),
               errorBuilder: (_, _, _) => const SizedBox.shrink(),
             ),
           ),
@@ -749,7 +749,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
             child: Padding(
               padding: const EdgeInsets.symmetric(vertical: 4),
               child: Text(
-                L10nService.get('life_events.life_event.remove_photo', language),
+                L10nService.get(L10nKeys.lifeEventsLifeEventRemovePhoto, language),
                 style: AppTypography.modernAccent(
                   fontSize: 12,
                   color: AppColors.error,
@@ -786,7 +786,7 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
                   ),
                   const SizedBox(height: 6),
                   Text(
-                    L10nService.get('life_events.life_event.add_a_photo', language),
+                    L10nService.get(L10nKeys.lifeEventsLifeEventAddAPhoto, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 12,
                       color: isDark
@@ -850,8 +850,8 @@ class _LifeEventScreenState extends ConsumerState<LifeEventScreen> {
               ? const CupertinoActivityIndicator(radius: 10)
               : Text(
                   _isEditing
-                      ? (L10nService.get('life_events.life_event.update_event', language))
-                      : (L10nService.get('life_events.life_event.save_event', language)),
+                      ? (L10nService.get(L10nKeys.lifeEventsLifeEventUpdateEvent, language))
+                      : (L10nService.get(L10nKeys.lifeEventsLifeEventSaveEvent, language)),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 16,
                     fontWeight: FontWeight.w700,
@@ -57,7 +57,7 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
               mainAxisSize: MainAxisSize.min,
               children: [
                 Text(
-                  L10nService.get('life_events.life_timeline.couldnt_load_your_timeline', language),
+                  L10nService.get(L10nKeys.lifeEventsLifeTimelineCouldntLoadYourTimeline, language),
                   style: AppTypography.subtitle(
                     color: isDark
                         ? AppColors.textSecondary
@@ -73,7 +73,7 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
                     color: AppColors.starGold,
                   ),
                   label: Text(
-                    L10nService.get('life_events.life_timeline.retry', language),
+                    L10nService.get(L10nKeys.lifeEventsLifeTimelineRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -135,7 +135,7 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
           ),
           slivers: [
             GlassSliverAppBar(
-              title: L10nService.get('life_events.life_timeline.life_timeline', language),
+              title: L10nService.get(L10nKeys.lifeEventsLifeTimelineLifeTimeline, language),
             ),
             SliverPadding(
               padding: const EdgeInsets.all(16),
@@ -185,18 +185,18 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
     final language = AppLanguage.fromIsEn(isEn);
     return Row(
       children: [
-        _filterChip(null, L10nService.get('life_events.life_timeline.all', language), AppColors.auroraStart, isDark),
+        _filterChip(null, L10nService.get(L10nKeys.lifeEventsLifeTimelineAll, language), AppColors.auroraStart, isDark),
         const SizedBox(width: 8),
         _filterChip(
           LifeEventType.positive,
-          L10nService.get('life_events.life_timeline.positive', language),
+          L10nService.get(L10nKeys.lifeEventsLifeTimelinePositive, language),
           AppColors.starGold,
           isDark,
         ),
         const SizedBox(width: 8),
         _filterChip(
           LifeEventType.challenging,
-          L10nService.get('life_events.life_timeline.challenging', language),
+          L10nService.get(L10nKeys.lifeEventsLifeTimelineChallenging, language),
           AppColors.amethyst,
           isDark,
         ),
@@ -397,7 +397,7 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
                       cacheWidth: 120,
                       cacheHeight: 120,
                       fit: BoxFit.cover,
-                      semanticLabel: L10nService.get('life_events.life_timeline.event_photo', language),
+                      semanticLabel: L10nService.get(L10nKeys.lifeEventsLifeTimelineEventPhoto, language),
                       errorBuilder: (_, _, _) => const SizedBox.shrink(),
                     ),
                   ),
@@ -421,10 +421,10 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.auto_awesome_rounded,
-      title: L10nService.get('life_events.life_timeline.your_timeline_awaits_its_first_chapter', language),
-      description: L10nService.get('life_events.life_timeline.start_recording_the_moments_that_shape_y', language),
+      title: L10nService.get(L10nKeys.lifeEventsLifeTimelineYourTimelineAwaitsItsFirstChapter, language),
+      description: L10nService.get(L10nKeys.lifeEventsLifeTimelineStartRecordingTheMomentsThatShapeY, language),
       gradientVariant: GradientTextVariant.gold,
-      ctaLabel: L10nService.get('life_events.life_timeline.add_life_event', language),
+      ctaLabel: L10nService.get(L10nKeys.lifeEventsLifeTimelineAddLifeEvent, language),
       onCtaPressed: () => context.push(Routes.lifeEventNew),
     );
   }
@@ -446,7 +446,7 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
             ),
             const SizedBox(height: 8),
             GradientText(
-              L10nService.get('life_events.life_timeline.unlock_your_full_timeline_with_pro', language),
+              L10nService.get(L10nKeys.lifeEventsLifeTimelineUnlockYourFullTimelineWithPro, language),
               variant: GradientTextVariant.gold,
               textAlign: TextAlign.center,
               style: AppTypography.displayFont.copyWith(
@@ -456,7 +456,7 @@ class _LifeTimelineScreenState extends ConsumerState<LifeTimelineScreen> {
             ),
             const SizedBox(height: 12),
             GradientButton.gold(
-              label: L10nService.get('life_events.life_timeline.upgrade_to_pro', language),
+              label: L10nService.get(L10nKeys.lifeEventsLifeTimelineUpgradeToPro, language),
               onPressed: () => showContextualPaywall(
                 context,
                 ref,
@@ -480,7 +480,7 @@ class _AnimatedFAB extends StatelessWidget {
   Widget build(BuildContext context) {
     final language = AppLanguage.fromIsEn(isEn);
     return Tooltip(
-          message: L10nService.get('life_events.life_timeline.add_life_event_1', language),
+          message: L10nService.get(L10nKeys.lifeEventsLifeTimelineAddLifeEvent1, language),
           child: GestureDetector(
             onTap: onPressed,
             child: Container(
@@ -505,7 +505,7 @@ class _AnimatedFAB extends StatelessWidget {
                   Icon(Icons.add_rounded, size: 20, color: AppColors.deepSpace),
                   const SizedBox(width: 8),
                   Text(
-                    L10nService.get('life_events.life_timeline.new_event', language),
+                    L10nService.get(L10nKeys.lifeEventsLifeTimelineNewEvent, language),
                     style: AppTypography.displayFont.copyWith(
                       fontSize: 15,
                       fontWeight: FontWeight.w600,
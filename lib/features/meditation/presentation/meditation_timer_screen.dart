@@ -161,7 +161,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
     ScaffoldMessenger.of(context).showSnackBar(
       SnackBar(
         content: Text(
-          L10nService.get('meditation.meditation_timer.session_complete_well_done', language),
+          L10nService.get(L10nKeys.meditationMeditationTimerSessionCompleteWellDone, language),
         ),
         backgroundColor: AppColors.success,
         duration: const Duration(seconds: 3),
@@ -200,7 +200,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                 parent: AlwaysScrollableScrollPhysics(),
               ),
               slivers: [
-                GlassSliverAppBar(title: L10nService.get('meditation.meditation_timer.meditation', language)),
+                GlassSliverAppBar(title: L10nService.get(L10nKeys.meditationMeditationTimerMeditation, language)),
                 SliverFillRemaining(
                   hasScrollBody: false,
                   child: Padding(
@@ -210,7 +210,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                         // Duration selector
                         if (!hasStarted) ...[
                           GradientText(
-                            L10nService.get('meditation.meditation_timer.choose_duration', language),
+                            L10nService.get(L10nKeys.meditationMeditationTimerChooseDuration, language),
                             variant: GradientTextVariant.aurora,
                             style: AppTypography.displayFont.copyWith(
                               fontSize: 18,
@@ -227,7 +227,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                                   horizontal: 6,
                                 ),
                                 child: Semantics(
-                                  label: L10nService.getWithParams('meditation.timer.n_minutes', language, params: {'count': '$m'}),
+                                  label: L10nService.getWithParams(L10nKeys.meditationTimerNMinutes, language, params: {'count': '$m'}),
                                   button: true,
                                   selected: isSelected,
                                   child: GestureDetector(
@@ -386,8 +386,8 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                                             ),
                                             Text(
                                               _isRunning
-                                                  ? (L10nService.get('meditation.meditation_timer.be_present', language))
-                                                  : (L10nService.get('meditation.meditation_timer.paused', language)),
+                                                  ? (L10nService.get(L10nKeys.meditationMeditationTimerBePresent, language))
+                                                  : (L10nService.get(L10nKeys.meditationMeditationTimerPaused, language)),
                                               style:
                                                   AppTypography.decorativeScript(
                                                     fontSize: 14,
@@ -405,7 +405,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                                             ),
                                             const SizedBox(height: 8),
                                             Text(
-                                              '$_selectedMinutes ${L10nService.get('meditation.meditation_timer.min', language)}',
+                                              '$_selectedMinutes ${L10nService.get(L10nKeys.meditationMeditationTimerMin, language)}',
                                               style: AppTypography.modernAccent(
                                                 fontSize: 18,
                                                 fontWeight: FontWeight.w600,
@@ -431,7 +431,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                         // Motivational text
                         if (_isRunning)
                           Text(
-                            L10nService.get('meditation.meditation_timer.focus_on_your_breath', language),
+                            L10nService.get(L10nKeys.meditationMeditationTimerFocusOnYourBreath, language),
                             style: AppTypography.decorativeScript(
                               fontSize: 16,
                               color: isDark
@@ -445,7 +445,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                         // Controls
                         if (!hasStarted)
                           GradientButton(
-                            label: L10nService.get('meditation.meditation_timer.begin_meditation', language),
+                            label: L10nService.get(L10nKeys.meditationMeditationTimerBeginMeditation, language),
                             onPressed: _start,
                             expanded: true,
                             gradient: const LinearGradient(
@@ -462,7 +462,7 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                                 child: SizedBox(
                                   height: 56,
                                   child: GradientOutlinedButton(
-                                    label: L10nService.get('meditation.meditation_timer.reset', language),
+                                    label: L10nService.get(L10nKeys.meditationMeditationTimerReset, language),
                                     variant: GradientTextVariant.aurora,
                                     expanded: true,
                                     fontSize: 16,
@@ -475,8 +475,8 @@ class _MeditationTimerScreenState extends ConsumerState<MeditationTimerScreen>
                               Expanded(
                                 child: GradientButton(
                                   label: _isRunning
-                                      ? (L10nService.get('meditation.meditation_timer.pause', language))
-                                      : (L10nService.get('meditation.meditation_timer.resume', language)),
+                                      ? (L10nService.get(L10nKeys.meditationMeditationTimerPause, language))
+                                      : (L10nService.get(L10nKeys.meditationMeditationTimerResume, language)),
                                   onPressed: _isRunning ? _pause : _resume,
                                   expanded: true,
                                   gradient: LinearGradient(
@@ -57,7 +57,7 @@ class _MemoriesScreenState extends ConsumerState<MemoriesScreen> {
                 mainAxisSize: MainAxisSize.min,
                 children: [
                   Text(
-                    L10nService.get('memories.memories.couldnt_load_your_memories', language),
+                    L10nService.get(L10nKeys.memoriesMemoriesCouldntLoadYourMemories, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.decorativeScript(
                       fontSize: 14,
@@ -73,7 +73,7 @@ class _MemoriesScreenState extends ConsumerState<MemoriesScreen> {
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('memories.memories.retry', language),
+                      L10nService.get(L10nKeys.memoriesMemoriesRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -137,7 +137,7 @@ class _MemoriesScreenState extends ConsumerState<MemoriesScreen> {
                     parent: AlwaysScrollableScrollPhysics(),
                   ),
                   slivers: [
-                    GlassSliverAppBar(title: L10nService.get('memories.memories.memories', language)),
+                    GlassSliverAppBar(title: L10nService.get(L10nKeys.memoriesMemoriesMemories, language)),
                     // Stats header
                     SliverToBoxAdapter(
                       child: Padding(
@@ -208,7 +208,7 @@ class _MemoriesScreenState extends ConsumerState<MemoriesScreen> {
                             bottom: AppConstants.spacingMd,
                           ),
                           child: GradientText(
-                            L10nService.get('memories.memories.on_this_day', language),
+                            L10nService.get(L10nKeys.memoriesMemoriesOnThisDay, language),
                             variant: GradientTextVariant.gold,
                             style: AppTypography.displayFont.copyWith(
                               fontSize: 17,
@@ -274,10 +274,10 @@ class _MemoriesScreenState extends ConsumerState<MemoriesScreen> {
                       SliverToBoxAdapter(
                         child: PremiumEmptyState(
                           icon: Icons.auto_stories_rounded,
-                          title: L10nService.get('memories.memories.this_month_is_a_blank_canvas', language),
-                          description: L10nService.get('memories.memories.your_memories_from_this_period_will_appe', language),
+                          title: L10nService.get(L10nKeys.memoriesMemoriesThisMonthIsABlankCanvas, language),
+                          description: L10nService.get(L10nKeys.memoriesMemoriesYourMemoriesFromThisPeriodWillAppe, language),
                           gradientVariant: GradientTextVariant.gold,
-                          ctaLabel: L10nService.get('memories.memories.write_an_entry', language),
+                          ctaLabel: L10nService.get(L10nKeys.memoriesMemoriesWriteAnEntry, language),
                           onCtaPressed: () => context.push(Routes.journal),
                         ),
                       )
@@ -317,7 +317,7 @@ class _MemoriesScreenState extends ConsumerState<MemoriesScreen> {
     final language = AppLanguage.fromIsEn(isEn);
     return CustomScrollView(
       slivers: [
-        GlassSliverAppBar(title: L10nService.get('memories.memories.memories_1', language)),
+        GlassSliverAppBar(title: L10nService.get(L10nKeys.memoriesMemoriesMemories1, language)),
         SliverFillRemaining(
           hasScrollBody: false,
           child: ToolEmptyState(
@@ -385,19 +385,19 @@ class _MemoriesStatsHeader extends StatelessWidget {
         children: [
           _MiniStat(
             value: '$totalEntries',
-            label: L10nService.get('memories.memories.entries', language),
+            label: L10nService.get(L10nKeys.memoriesMemoriesEntries, language),
             color: AppColors.auroraStart,
             isDark: isDark,
           ),
           _MiniStat(
             value: '$photoEntries',
-            label: L10nService.get('memories.memories.photos', language),
+            label: L10nService.get(L10nKeys.memoriesMemoriesPhotos, language),
             color: AppColors.starGold,
             isDark: isDark,
           ),
           _MiniStat(
             value: firstDate,
-            label: L10nService.get('memories.memories.since', language),
+            label: L10nService.get(L10nKeys.memoriesMemoriesSince, language),
             color: AppColors.success,
             isDark: isDark,
             isSmallValue: true,
@@ -496,7 +496,7 @@ class _OnThisDayCard extends StatelessWidget {
                   File(entry.imagePath!),
                   fit: BoxFit.cover,
                   cacheWidth: 400,
-                  semanticLabel: L10nService.get('memories.memories.memory_photo', language),
+                  semanticLabel: L10nService.get(L10nKeys.memoriesMemoriesMemoryPhoto, language),
                   errorBuilder: (_, _, _) => _placeholderIcon(),
                 ),
               )
@@ -697,7 +697,7 @@ class _MemoryCard extends StatelessWidget {
                   File(entry.imagePath!),
                   fit: BoxFit.cover,
                   cacheWidth: 800,
-                  semanticLabel: L10nService.get('memories.memories.memory_photo_1', language),
+                  semanticLabel: L10nService.get(L10nKeys.memoriesMemoriesMemoryPhoto1, language),
                   errorBuilder: (_, _, _) => Container(
                     color: isDark
                         ? AppColors.surfaceDark
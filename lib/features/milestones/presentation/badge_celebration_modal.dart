@@ -295,7 +295,7 @@ class _BadgeCelebrationModalState extends State<BadgeCelebrationModal>
                             children: [
                               Expanded(
                                 child: GradientOutlinedButton(
-                                  label: L10nService.get('milestones.badge_celebration.share', language),
+                                  label: L10nService.get(L10nKeys.milestonesBadgeCelebrationShare, language),
                                   icon: Icons.share_rounded,
                                   variant: GradientTextVariant.gold,
                                   expanded: true,
@@ -311,7 +311,7 @@ class _BadgeCelebrationModalState extends State<BadgeCelebrationModal>
                               const SizedBox(width: 12),
                               Expanded(
                                 child: GradientButton.gold(
-                                  label: L10nService.get('milestones.badge_celebration.keep_going', language),
+                                  label: L10nService.get(L10nKeys.milestonesBadgeCelebrationKeepGoing, language),
                                   onPressed: () =>
                                       Navigator.of(context).pop(),
                                   expanded: true,
@@ -64,7 +64,7 @@ class MilestoneScreen extends ConsumerWidget {
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('milestones.milestone.retry', language),
+                      L10nService.get(L10nKeys.milestonesMilestoneRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -124,7 +124,7 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('milestones.milestone.milestones', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.milestonesMilestoneMilestones, language)),
 
           // ── Progress Card ─────────────────────────────────────────────
           SliverToBoxAdapter(
@@ -275,7 +275,7 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
                 crossAxisAlignment: CrossAxisAlignment.start,
                 children: [
                   GradientText(
-                    L10nService.get('milestones.milestone.milestones_earned', language),
+                    L10nService.get(L10nKeys.milestonesMilestoneMilestonesEarned, language),
                     variant: GradientTextVariant.gold,
                     style: AppTypography.displayFont.copyWith(
                       fontSize: 17,
@@ -313,10 +313,10 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
     final language = AppLanguage.fromIsEn(isEn);
     final remaining = total - earned;
     if (earned == 0) {
-      return L10nService.get('milestones.milestone.start_tracking', language);
+      return L10nService.get(L10nKeys.milestonesMilestoneStartTracking, language);
     }
     if (earned >= total) {
-      return L10nService.get('milestones.milestone.you_earned_them_all', language);
+      return L10nService.get(L10nKeys.milestonesMilestoneYouEarnedThemAll, language);
     }
     return isEn
         ? '$remaining more to discover'
@@ -338,7 +338,7 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
           final language = AppLanguage.fromIsEn(isEn);
           final selected = _selectedCategory == cat;
           final label = cat == null
-              ? (L10nService.get('milestones.milestone.all', language))
+              ? (L10nService.get(L10nKeys.milestonesMilestoneAll, language))
               : (cat.displayName(language));
 
           return Padding(
@@ -348,7 +348,7 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
                   ? (isEn
                         ? '$label filter, selected'
                         : '$label filtresi, seçili')
-                  : (L10nService.getWithParams('milestones.filter_label', language, params: {'label': label})),
+                  : (L10nService.getWithParams(L10nKeys.milestonesFilterLabel, language, params: {'label': label})),
               button: true,
               selected: selected,
               child: FilterChip(
@@ -523,17 +523,17 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
     final language = AppLanguage.fromIsEn(isEn);
     switch (category) {
       case MilestoneCategory.streak:
-        return L10nService.get('milestones.milestone.keep_logging', language);
+        return L10nService.get(L10nKeys.milestonesMilestoneKeepLogging, language);
       case MilestoneCategory.entries:
-        return L10nService.get('milestones.milestone.write_more', language);
+        return L10nService.get(L10nKeys.milestonesMilestoneWriteMore, language);
       case MilestoneCategory.exploration:
-        return L10nService.get('milestones.milestone.try_new_features', language);
+        return L10nService.get(L10nKeys.milestonesMilestoneTryNewFeatures, language);
       case MilestoneCategory.depth:
-        return L10nService.get('milestones.milestone.go_deeper', language);
+        return L10nService.get(L10nKeys.milestonesMilestoneGoDeeper, language);
       case MilestoneCategory.social:
-        return L10nService.get('milestones.milestone.share_connect', language);
+        return L10nService.get(L10nKeys.milestonesMilestoneShareConnect, language);
       case MilestoneCategory.growth:
-        return L10nService.get('milestones.milestone.keep_growing', language);
+        return L10nService.get(L10nKeys.milestonesMilestoneKeepGrowing, language);
     }
   }
 
@@ -693,7 +693,7 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
                     // Close button
                     Semantics(
                       button: true,
-                      label: L10nService.get('milestones.milestone.close_dialog', language),
+                      label: L10nService.get(L10nKeys.milestonesMilestoneCloseDialog, language),
                       child: SizedBox(
                         width: double.infinity,
                         height: 44,
@@ -708,7 +708,7 @@ class _MilestoneBodyState extends State<_MilestoneBody> {
                             ),
                           ),
                           child: Text(
-                            L10nService.get('milestones.milestone.done', language),
+                            L10nService.get(L10nKeys.milestonesMilestoneDone, language),
                             style: AppTypography.modernAccent(
                               fontSize: 15,
                               fontWeight: FontWeight.w600,
@@ -68,7 +68,7 @@ class _EmotionalVocabularyScreenState
                       keyboardDismissBehavior: ScrollViewKeyboardDismissBehavior.onDrag,
                       slivers: [
                         GlassSliverAppBar(
-                          title: L10nService.get('mood.emotional_vocabulary.emotional_vocabulary', language),
+                          title: L10nService.get(L10nKeys.moodEmotionalVocabularyEmotionalVocabulary, language),
                         ),
                         SliverPadding(
                           padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -130,7 +130,7 @@ class _EmotionalVocabularyScreenState
                                           height: AppConstants.spacingMd,
                                         ),
                                         Text(
-                                          L10nService.get('mood.emotional_vocabulary.no_emotions_found', language),
+                                          L10nService.get(L10nKeys.moodEmotionalVocabularyNoEmotionsFound, language),
                                           style: AppTypography.decorativeScript(
                                             fontSize: 15,
                                             color: isDark
@@ -163,7 +163,7 @@ class _EmotionalVocabularyScreenState
       child: Row(
         children: [
           _FamilyChip(
-            label: L10nService.get('mood.emotional_vocabulary.all', language),
+            label: L10nService.get(L10nKeys.moodEmotionalVocabularyAll, language),
             emoji: '🎭',
             isSelected: _selectedFamily == null,
             isDark: isDark,
@@ -208,7 +208,7 @@ class _EmotionalVocabularyScreenState
           color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
         ),
         decoration: InputDecoration(
-          hintText: L10nService.get('mood.emotional_vocabulary.find_a_feeling', language),
+          hintText: L10nService.get(L10nKeys.moodEmotionalVocabularyFindAFeeling, language),
           hintStyle: AppTypography.subtitle(
             color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
           ),
@@ -218,7 +218,7 @@ class _EmotionalVocabularyScreenState
           ),
           suffixIcon: _searchQuery.isNotEmpty
               ? IconButton(
-                  tooltip: L10nService.get('mood.emotional_vocabulary.clear_search', language),
+                  tooltip: L10nService.get(L10nKeys.moodEmotionalVocabularyClearSearch, language),
                   icon: Icon(
                     Icons.cancel,
                     color: isDark
@@ -448,7 +448,7 @@ class _EmotionCardState extends State<_EmotionCard> {
                           crossAxisAlignment: CrossAxisAlignment.start,
                           children: [
                             Text(
-                              L10nService.get('mood.emotional_vocabulary.body_sensation', language),
+                              L10nService.get(L10nKeys.moodEmotionalVocabularyBodySensation, language),
                               style: AppTypography.elegantAccent(
                                 fontSize: 11,
                                 color: AppColors.auroraStart,
@@ -162,7 +162,7 @@ class _CheckinViewState extends State<_CheckinView> {
       child: Column(
         children: [
           Text(
-            L10nService.get('mood.mood_checkin.whats_present_for_you_right_now', language),
+            L10nService.get(L10nKeys.moodMoodCheckinWhatsPresentForYouRightNow, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 15,
               fontWeight: FontWeight.w600,
@@ -265,7 +265,7 @@ class _LoggedView extends StatelessWidget {
                   crossAxisAlignment: CrossAxisAlignment.start,
                   children: [
                     Text(
-                      L10nService.get('mood.mood_checkin.todays_mood', language),
+                      L10nService.get(L10nKeys.moodMoodCheckinTodaysMood, language),
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 14,
                         fontWeight: FontWeight.w600,
@@ -354,15 +354,15 @@ class _LoggedView extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     switch (mood) {
       case 1:
-        return L10nService.get('mood.mood_checkin.struggling', language);
+        return L10nService.get(L10nKeys.moodMoodCheckinStruggling, language);
       case 2:
-        return L10nService.get('mood.mood_checkin.low', language);
+        return L10nService.get(L10nKeys.moodMoodCheckinLow, language);
       case 3:
-        return L10nService.get('mood.mood_checkin.okay', language);
+        return L10nService.get(L10nKeys.moodMoodCheckinOkay, language);
       case 4:
-        return L10nService.get('mood.mood_checkin.good', language);
+        return L10nService.get(L10nKeys.moodMoodCheckinGood, language);
       case 5:
-        return L10nService.get('mood.mood_checkin.great', language);
+        return L10nService.get(L10nKeys.moodMoodCheckinGreat, language);
       default:
         return '';
     }
@@ -498,7 +498,7 @@ class _ThankYouViewState extends ConsumerState<_ThankYouView> {
               const SizedBox(width: 14),
               Expanded(
                 child: Text(
-                  L10nService.get('mood.mood_checkin.mood_logged_get_more_specific', language),
+                  L10nService.get(L10nKeys.moodMoodCheckinMoodLoggedGetMoreSpecific, language),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 14,
                     fontWeight: FontWeight.w600,
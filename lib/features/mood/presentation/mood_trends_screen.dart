@@ -79,7 +79,7 @@ class MoodTrendsScreen extends ConsumerWidget {
                       icon: Icon(Icons.refresh_rounded,
                           size: 16, color: AppColors.starGold),
                       label: Text(
-                        L10nService.get('mood.mood_trends.retry', language),
+                        L10nService.get(L10nKeys.moodMoodTrendsRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -119,7 +119,7 @@ class MoodTrendsScreen extends ConsumerWidget {
           ),
           slivers: [
             GlassSliverAppBar(
-              title: L10nService.get('mood.mood_trends.signal_dashboard', language),
+              title: L10nService.get(L10nKeys.moodMoodTrendsSignalDashboard, language),
             ),
             SliverFillRemaining(
               hasScrollBody: false,
@@ -166,7 +166,7 @@ class MoodTrendsScreen extends ConsumerWidget {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('mood.mood_trends.signal_dashboard_1', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.moodMoodTrendsSignalDashboard1, language)),
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
             sliver: SliverList(
@@ -315,7 +315,7 @@ class MoodTrendsScreen extends ConsumerWidget {
                       ),
                       const SizedBox(height: 2),
                       GradientText(
-                        L10nService.get('mood.mood_trends.your_data_has_more_to_show', language),
+                        L10nService.get(L10nKeys.moodMoodTrendsYourDataHasMoreToShow, language),
                         variant: GradientTextVariant.gold,
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 13,
@@ -324,7 +324,7 @@ class MoodTrendsScreen extends ConsumerWidget {
                       ),
                       const SizedBox(height: 4),
                       GradientButton.gold(
-                        label: L10nService.get('mood.mood_trends.upgrade_to_pro', language),
+                        label: L10nService.get(L10nKeys.moodMoodTrendsUpgradeToPro, language),
                         onPressed: () => showContextualPaywall(
                           context,
                           ref,
@@ -489,7 +489,7 @@ class MoodTrendsScreen extends ConsumerWidget {
       children: [
         Expanded(
           child: _StatTile(
-            label: L10nService.get('mood.mood_trends.7day_avg', language),
+            label: L10nService.get(L10nKeys.moodMoodTrends7dayAvg, language),
             value: avg7 > 0 ? avg7.toStringAsFixed(1) : '-',
             isDark: isDark,
           ),
@@ -497,7 +497,7 @@ class MoodTrendsScreen extends ConsumerWidget {
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('mood.mood_trends.30day_avg', language),
+            label: L10nService.get(L10nKeys.moodMoodTrends30dayAvg, language),
             value: isPremium
                 ? (avg30 > 0 ? avg30.toStringAsFixed(1) : '-')
                 : 'PRO',
@@ -508,7 +508,7 @@ class MoodTrendsScreen extends ConsumerWidget {
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('mood.mood_trends.total_logs', language),
+            label: L10nService.get(L10nKeys.moodMoodTrendsTotalLogs, language),
             value: '$total',
             isDark: isDark,
           ),
@@ -539,7 +539,7 @@ class MoodTrendsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('mood.mood_trends.this_week', language),
+            L10nService.get(L10nKeys.moodMoodTrendsThisWeek, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -760,7 +760,7 @@ class MoodTrendsScreen extends ConsumerWidget {
             ),
             const SizedBox(width: 4),
             Text(
-              L10nService.get('mood.mood_trends.share_week', language),
+              L10nService.get(L10nKeys.moodMoodTrendsShareWeek, language),
               style: AppTypography.elegantAccent(
                 fontSize: 12,
                 color: AppColors.starGold.withValues(alpha: 0.7),
@@ -782,11 +782,11 @@ class MoodTrendsScreen extends ConsumerWidget {
   ) {
     final language = AppLanguage.fromIsEn(isEn);
     final labels = [
-      (1, '😔', L10nService.get('mood.mood_trends.struggling', language)),
-      (2, '😐', L10nService.get('mood.mood_trends.low', language)),
-      (3, '🙂', L10nService.get('mood.mood_trends.okay', language)),
-      (4, '😊', L10nService.get('mood.mood_trends.good', language)),
-      (5, '🤩', L10nService.get('mood.mood_trends.great', language)),
+      (1, '😔', L10nService.get(L10nKeys.moodMoodTrendsStruggling, language)),
+      (2, '😐', L10nService.get(L10nKeys.moodMoodTrendsLow, language)),
+      (3, '🙂', L10nService.get(L10nKeys.moodMoodTrendsOkay, language)),
+      (4, '😊', L10nService.get(L10nKeys.moodMoodTrendsGood, language)),
+      (5, '🤩', L10nService.get(L10nKeys.moodMoodTrendsGreat, language)),
     ];
 
     return GlassPanel(
@@ -797,7 +797,7 @@ class MoodTrendsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('mood.mood_trends.last_30_days', language),
+            L10nService.get(L10nKeys.moodMoodTrendsLast30Days, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -887,7 +887,7 @@ class MoodTrendsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('mood.mood_trends.recent_checkins', language),
+            L10nService.get(L10nKeys.moodMoodTrendsRecentCheckins, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -1140,7 +1140,7 @@ class MoodTrendsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('mood.mood_trends.go_deeper', language),
+            L10nService.get(L10nKeys.moodMoodTrendsGoDeeper, language),
             variant: GradientTextVariant.amethyst,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -1360,7 +1360,7 @@ class _EmptyStateMoodCheckin extends StatelessWidget {
         const SizedBox(height: 20),
 
         GradientText(
-          L10nService.get('mood.mood_trends.start_your_first_checkin', language),
+          L10nService.get(L10nKeys.moodMoodTrendsStartYourFirstCheckin, language),
           variant: GradientTextVariant.amethyst,
           textAlign: TextAlign.center,
           style: AppTypography.displayFont.copyWith(
@@ -1372,7 +1372,7 @@ class _EmptyStateMoodCheckin extends StatelessWidget {
         const SizedBox(height: 8),
 
         Text(
-          L10nService.get('mood.mood_trends.tap_how_you_feel_your_dashboard_lights_u', language),
+          L10nService.get(L10nKeys.moodMoodTrendsTapHowYouFeelYourDashboardLightsU, language),
           textAlign: TextAlign.center,
           style: AppTypography.decorativeScript(
             fontSize: 14,
@@ -1393,7 +1393,7 @@ class _EmptyStateMoodCheckin extends StatelessWidget {
           child: Column(
             children: [
               Text(
-                L10nService.get('mood.mood_trends.how_are_you_feeling_right_now', language),
+                L10nService.get(L10nKeys.moodMoodTrendsHowAreYouFeelingRightNow, language),
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 15,
                   fontWeight: FontWeight.w600,
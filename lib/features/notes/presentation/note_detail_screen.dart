@@ -274,11 +274,11 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
               mainAxisAlignment: MainAxisAlignment.spaceBetween,
               children: [
                 CupertinoButton(
-                  child: Text(L10nService.get('notes.note_detail.cancel', language)),
+                  child: Text(L10nService.get(L10nKeys.notesNoteDetailCancel, language)),
                   onPressed: () => Navigator.pop(ctx),
                 ),
                 CupertinoButton(
-                  child: Text(L10nService.get('notes.note_detail.save_note', language)),
+                  child: Text(L10nService.get(L10nKeys.notesNoteDetailSaveNote, language)),
                   onPressed: () => Navigator.pop(ctx),
                 ),
               ],
@@ -355,7 +355,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                   mainAxisSize: MainAxisSize.min,
                   children: [
                     Text(
-                      L10nService.get('notes.note_detail.couldnt_load_this_note', language),
+                      L10nService.get(L10nKeys.notesNoteDetailCouldntLoadThisNote, language),
                       textAlign: TextAlign.center,
                       style: AppTypography.decorativeScript(
                         color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -368,7 +368,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                       icon: Icon(Icons.refresh_rounded,
                           size: 16, color: AppColors.starGold),
                       label: Text(
-                        L10nService.get('notes.note_detail.retry', language),
+                        L10nService.get(L10nKeys.notesNoteDetailRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -391,8 +391,8 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                     slivers: [
                       GlassSliverAppBar(
                         title: _isCreateMode
-                            ? (L10nService.get('notes.note_detail.new_note', language))
-                            : (L10nService.get('notes.note_detail.edit_note', language)),
+                            ? (L10nService.get(L10nKeys.notesNoteDetailNewNote, language))
+                            : (L10nService.get(L10nKeys.notesNoteDetailEditNote, language)),
                         useGradientTitle: true,
                         gradientVariant: GradientTextVariant.gold,
                         actions: [
@@ -415,7 +415,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                 borderRadius: BorderRadius.circular(10),
                               ),
                               child: Text(
-                                L10nService.get('notes.note_detail.save_note_1', language),
+                                L10nService.get(L10nKeys.notesNoteDetailSaveNote1, language),
                                 style: AppTypography.displayFont.copyWith(
                                   fontSize: 14,
                                   fontWeight: FontWeight.w600,
@@ -452,7 +452,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                             : AppColors.lightTextPrimary,
                                       ),
                                       decoration: InputDecoration(
-                                        hintText: L10nService.get('notes.note_detail.give_this_note_a_title', language),
+                                        hintText: L10nService.get(L10nKeys.notesNoteDetailGiveThisNoteATitle, language),
                                         hintStyle: AppTypography.displayFont
                                             .copyWith(
                                               fontSize: 26,
@@ -525,7 +525,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                   height: 1.6,
                                 ),
                                 decoration: InputDecoration(
-                                  hintText: L10nService.get('notes.note_detail.write_your_thoughts', language),
+                                  hintText: L10nService.get(L10nKeys.notesNoteDetailWriteYourThoughts, language),
                                   hintStyle: AppTypography.subtitle(
                                     fontSize: 16,
                                     color: isDark
@@ -573,7 +573,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                         ),
                                         const SizedBox(width: 8),
                                         Text(
-                                          L10nService.get('notes.note_detail.tags', language),
+                                          L10nService.get(L10nKeys.notesNoteDetailTags, language),
                                           style: AppTypography.elegantAccent(
                                             fontSize: 14,
                                             color: isDark
@@ -615,7 +615,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                                   : AppColors.lightTextPrimary,
                                             ),
                                             decoration: InputDecoration(
-                                              hintText: L10nService.get('notes.note_detail.eg_ideas_personal', language),
+                                              hintText: L10nService.get(L10nKeys.notesNoteDetailEgIdeasPersonal, language),
                                               hintStyle: AppTypography.subtitle(
                                                 color: isDark
                                                     ? AppColors.textMuted
@@ -693,7 +693,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                       ),
                                       const SizedBox(width: 8),
                                       Text(
-                                        L10nService.get('notes.note_detail.mood_when_created', language),
+                                        L10nService.get(L10nKeys.notesNoteDetailMoodWhenCreated, language),
                                         style: AppTypography.elegantAccent(
                                           fontSize: 12,
                                           color: isDark
@@ -728,7 +728,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                             ),
                                             const SizedBox(width: 8),
                                             Text(
-                                              L10nService.get('notes.note_detail.remind_me', language),
+                                              L10nService.get(L10nKeys.notesNoteDetailRemindMe, language),
                                               style:
                                                   AppTypography.elegantAccent(
                                                     fontSize: 14,
@@ -770,7 +770,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                                 ),
                                                 const SizedBox(width: 4),
                                                 Text(
-                                                  L10nService.get('notes.note_detail.add', language),
+                                                  L10nService.get(L10nKeys.notesNoteDetailAdd, language),
                                                   style:
                                                       AppTypography.elegantAccent(
                                                         fontSize: 12,
@@ -830,7 +830,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                                         ),
                                                   ),
                                                   Text(
-                                                    L10nService.get('notes.note_detail.will_be_set_when_you_save', language),
+                                                    L10nService.get(L10nKeys.notesNoteDetailWillBeSetWhenYouSave, language),
                                                     style:
                                                         AppTypography.elegantAccent(
                                                           fontSize: 11,
@@ -887,7 +887,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                             _hasPendingReminder)) ...[
                                       const SizedBox(height: 10),
                                       Text(
-                                        L10nService.get('notes.note_detail.set_a_date_time_to_get_notified_about_th', language),
+                                        L10nService.get(L10nKeys.notesNoteDetailSetADateTimeToGetNotifiedAboutTh, language),
                                         style: AppTypography.elegantAccent(
                                           fontSize: 12,
                                           color: isDark
@@ -1004,7 +1004,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                                 ),
                                                 const SizedBox(width: 8),
                                                 Text(
-                                                  L10nService.get('notes.note_detail.share', language),
+                                                  L10nService.get(L10nKeys.notesNoteDetailShare, language),
                                                   style: AppTypography.subtitle(
                                                     fontSize: 14,
                                                     color: AppColors.starGold,
@@ -1021,10 +1021,10 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                         final confirmed =
                                             await GlassDialog.confirm(
                                               context,
-                                              title: L10nService.get('notes.note_detail.delete_note', language),
-                                              message: L10nService.get('notes.note_detail.this_note_will_be_permanently_deleted', language),
-                                              cancelLabel: L10nService.get('notes.note_detail.cancel_1', language),
-                                              confirmLabel: L10nService.get('notes.note_detail.delete', language),
+                                              title: L10nService.get(L10nKeys.notesNoteDetailDeleteNote, language),
+                                              message: L10nService.get(L10nKeys.notesNoteDetailThisNoteWillBePermanentlyDeleted, language),
+                                              cancelLabel: L10nService.get(L10nKeys.notesNoteDetailCancel1, language),
+                                              confirmLabel: L10nService.get(L10nKeys.notesNoteDetailDelete, language),
                                               isDestructive: true,
                                             );
                                         if (confirmed == true) _delete(service);
@@ -1052,7 +1052,7 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
                                             ),
                                             const SizedBox(width: 8),
                                             Text(
-                                              L10nService.get('notes.note_detail.delete_note_1', language),
+                                              L10nService.get(L10nKeys.notesNoteDetailDeleteNote1, language),
                                               style: AppTypography.subtitle(
                                                 fontSize: 14,
                                                 color: AppColors.error,
@@ -1086,10 +1086,10 @@ class _NoteDetailScreenState extends ConsumerState<NoteDetailScreen> {
     final language = ref.read(languageProvider);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('notes.note_detail.discard_changes', language),
-      message: L10nService.get('notes.note_detail.you_have_unsaved_changes_are_you_sure_yo', language),
-      cancelLabel: L10nService.get('notes.note_detail.cancel_2', language),
-      confirmLabel: L10nService.get('notes.note_detail.discard', language),
+      title: L10nService.get(L10nKeys.notesNoteDetailDiscardChanges, language),
+      message: L10nService.get(L10nKeys.notesNoteDetailYouHaveUnsavedChangesAreYouSureYo, language),
+      cancelLabel: L10nService.get(L10nKeys.notesNoteDetailCancel2, language),
+      confirmLabel: L10nService.get(L10nKeys.notesNoteDetailDiscard, language),
       isDestructive: true,
     );
     if (confirmed == true && mounted) {
@@ -1322,7 +1322,7 @@ class _ReminderForm extends StatelessWidget {
                   Text(
                     reminderDate != null
                         ? _formatDate(reminderDate!, isEn)
-                        : (L10nService.get('notes.note_detail.pick_date_time', language)),
+                        : (L10nService.get(L10nKeys.notesNoteDetailPickDateTime, language)),
                     style: AppTypography.subtitle(
                       fontSize: 14,
                       color: reminderDate != null
@@ -1339,7 +1339,7 @@ class _ReminderForm extends StatelessWidget {
 
           // Frequency chips
           Text(
-            L10nService.get('notes.note_detail.frequency', language),
+            L10nService.get(L10nKeys.notesNoteDetailFrequency, language),
             style: AppTypography.elegantAccent(
               fontSize: 12,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -1399,7 +1399,7 @@ class _ReminderForm extends StatelessWidget {
               color: isDark ? Colors.white : AppColors.lightTextPrimary,
             ),
             decoration: InputDecoration(
-              hintText: L10nService.get('notes.note_detail.custom_message_optional', language),
+              hintText: L10nService.get(L10nKeys.notesNoteDetailCustomMessageOptional, language),
               hintStyle: AppTypography.subtitle(
                 color: isDark
                     ? AppColors.textMuted
@@ -1445,7 +1445,7 @@ class _ReminderForm extends StatelessWidget {
                 ),
                 alignment: Alignment.center,
                 child: Text(
-                  L10nService.get('notes.note_detail.set_reminder', language),
+                  L10nService.get(L10nKeys.notesNoteDetailSetReminder, language),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 14,
                     fontWeight: FontWeight.w600,
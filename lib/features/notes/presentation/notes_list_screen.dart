@@ -117,7 +117,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                 mainAxisSize: MainAxisSize.min,
                 children: [
                   Text(
-                    L10nService.get('notes.notes_list.couldnt_load_your_notes', language),
+                    L10nService.get(L10nKeys.notesNotesListCouldntLoadYourNotes, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.decorativeScript(
                       color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -130,7 +130,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('notes.notes_list.retry', language),
+                      L10nService.get(L10nKeys.notesNotesListRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -171,7 +171,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                   ),
                   slivers: [
                     GlassSliverAppBar(
-                      title: L10nService.get('notes.notes_list.notes', language),
+                      title: L10nService.get(L10nKeys.notesNotesListNotes, language),
                       showBackButton: false,
                     ),
 
@@ -222,7 +222,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                               color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
                             ),
                             decoration: InputDecoration(
-                              hintText: L10nService.get('notes.notes_list.search_notes', language),
+                              hintText: L10nService.get(L10nKeys.notesNotesListSearchNotes, language),
                               hintStyle: AppTypography.subtitle(
                                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
                               ),
@@ -244,7 +244,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                                             ? AppColors.textMuted
                                             : AppColors.lightTextMuted,
                                       ),
-                                      tooltip: L10nService.get('notes.notes_list.clear_search', language),
+                                      tooltip: L10nService.get(L10nKeys.notesNotesListClearSearch, language),
                                       onPressed: _clearSearch,
                                     )
                                   : null,
@@ -275,7 +275,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                               scrollDirection: Axis.horizontal,
                               children: [
                                 _TagChip(
-                                  label: L10nService.get('notes.notes_list.all', language),
+                                  label: L10nService.get(L10nKeys.notesNotesListAll, language),
                                   isSelected: _selectedTag == null,
                                   isDark: isDark,
                                   onTap: () =>
@@ -330,7 +330,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                         child: _SectionHeader(
                           icon: CupertinoIcons.pin_fill,
                           iconColor: AppColors.starGold,
-                          label: L10nService.get('notes.notes_list.pinned', language),
+                          label: L10nService.get(L10nKeys.notesNotesListPinned, language),
                           isDark: isDark,
                         ).animate().fadeIn(duration: 300.ms, delay: 120.ms),
                       ),
@@ -371,7 +371,7 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
                             _SectionHeader(
                               icon: CupertinoIcons.clock,
                               iconColor: AppColors.auroraStart,
-                              label: L10nService.get('notes.notes_list.recent', language),
+                              label: L10nService.get(L10nKeys.notesNotesListRecent, language),
                               isDark: isDark,
                             ).animate().fadeIn(
                               duration: 300.ms,
@@ -438,10 +438,10 @@ class _NotesListScreenState extends ConsumerState<NotesListScreen> {
 
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('notes.notes_list.delete_note', language),
-      message: L10nService.get('notes.notes_list.this_note_will_be_permanently_deleted', language),
-      cancelLabel: L10nService.get('notes.notes_list.cancel', language),
-      confirmLabel: L10nService.get('notes.notes_list.delete', language),
+      title: L10nService.get(L10nKeys.notesNotesListDeleteNote, language),
+      message: L10nService.get(L10nKeys.notesNotesListThisNoteWillBePermanentlyDeleted, language),
+      cancelLabel: L10nService.get(L10nKeys.notesNotesListCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.notesNotesListDelete, language),
       isDestructive: true,
     );
 
@@ -486,7 +486,7 @@ class _NotesStatsBar extends StatelessWidget {
           _StatPill(
             icon: CupertinoIcons.doc_text,
             value: '$total',
-            label: L10nService.get('notes.notes_list.notes_1', language),
+            label: L10nService.get(L10nKeys.notesNotesListNotes1, language),
             isDark: isDark,
           ),
           const SizedBox(width: 10),
@@ -494,7 +494,7 @@ class _NotesStatsBar extends StatelessWidget {
             _StatPill(
               icon: CupertinoIcons.pin_fill,
               value: '$pinnedCount',
-              label: L10nService.get('notes.notes_list.pinned_1', language),
+              label: L10nService.get(L10nKeys.notesNotesListPinned1, language),
               isDark: isDark,
               accentColor: AppColors.starGold,
             ),
@@ -504,7 +504,7 @@ class _NotesStatsBar extends StatelessWidget {
             _StatPill(
               icon: CupertinoIcons.tag,
               value: '$tagCount',
-              label: L10nService.get('notes.notes_list.tags', language),
+              label: L10nService.get(L10nKeys.notesNotesListTags, language),
               isDark: isDark,
               accentColor: AppColors.amethyst,
             ),
@@ -616,8 +616,8 @@ class _EmptyState extends StatelessWidget {
       // Filtered empty
       return PremiumEmptyState(
         icon: CupertinoIcons.search,
-        title: L10nService.get('notes.notes_list.no_notes_matched_your_search', language),
-        description: L10nService.get('notes.notes_list.try_a_different_search_term', language),
+        title: L10nService.get(L10nKeys.notesNotesListNoNotesMatchedYourSearch, language),
+        description: L10nService.get(L10nKeys.notesNotesListTryADifferentSearchTerm, language),
         gradientVariant: GradientTextVariant.aurora,
       );
     }
@@ -667,7 +667,7 @@ class _EmptyState extends StatelessWidget {
             ),
             const SizedBox(height: 20),
             Text(
-              L10nService.get('notes.notes_list.capture_your_thoughts', language),
+              L10nService.get(L10nKeys.notesNotesListCaptureYourThoughts, language),
               style: AppTypography.displayFont.copyWith(
                 fontSize: 24,
                 fontWeight: FontWeight.w600,
@@ -679,7 +679,7 @@ class _EmptyState extends StatelessWidget {
             ),
             const SizedBox(height: 10),
             Text(
-              L10nService.get('notes.notes_list.quick_notes_reminders_ideas_neverything', language),
+              L10nService.get(L10nKeys.notesNotesListQuickNotesRemindersIdeasNeverything, language),
               style: AppTypography.decorativeScript(
                 fontSize: 14,
                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -717,7 +717,7 @@ class _EmptyState extends StatelessWidget {
                         ),
                         const SizedBox(width: 8),
                         Text(
-                          L10nService.get('notes.notes_list.write_your_first_note', language),
+                          L10nService.get(L10nKeys.notesNotesListWriteYourFirstNote, language),
                           style: AppTypography.displayFont.copyWith(
                             fontSize: 15,
                             fontWeight: FontWeight.w600,
@@ -809,7 +809,7 @@ class _NoteCard extends StatelessWidget {
                     Expanded(
                       child: Text(
                         note.title.isEmpty
-                            ? (L10nService.get('notes.notes_list.untitled', language))
+                            ? (L10nService.get(L10nKeys.notesNotesListUntitled, language))
                             : note.title,
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 15,
@@ -921,16 +921,16 @@ class _NoteCard extends StatelessWidget {
     final now = DateTime.now();
     final diff = now.difference(dt);
     if (diff.inMinutes < 1) {
-      return L10nService.get('notes.notes_list.now', language);
+      return L10nService.get(L10nKeys.notesNotesListNow, language);
     }
     if (diff.inMinutes < 60) {
-      return L10nService.getWithParams('common.time.minutes_short', language, params: {'count': '${diff.inMinutes}'});
+      return L10nService.getWithParams(L10nKeys.commonTimeMinutesShort, language, params: {'count': '${diff.inMinutes}'});
     }
     if (diff.inHours < 24) {
-      return L10nService.getWithParams('common.time.hours_short', language, params: {'count': '${diff.inHours}'});
+      return L10nService.getWithParams(L10nKeys.commonTimeHoursShort, language, params: {'count': '${diff.inHours}'});
     }
     if (diff.inDays < 7) {
-      return L10nService.getWithParams('common.time.days_short', language, params: {'count': '${diff.inDays}'});
+      return L10nService.getWithParams(L10nKeys.commonTimeDaysShort, language, params: {'count': '${diff.inDays}'});
     }
     final months = isEn
         ? CommonStrings.monthsShortEn
@@ -1039,7 +1039,7 @@ class _AnimatedFAB extends StatelessWidget {
                 const Icon(CupertinoIcons.plus, size: 20, color: Colors.white),
                 const SizedBox(width: 8),
                 Text(
-                  L10nService.get('notes.notes_list.new_note', language),
+                  L10nService.get(L10nKeys.notesNotesListNewNote, language),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 15,
                     fontWeight: FontWeight.w600,
@@ -299,7 +299,7 @@ class _ArchetypeQuizScreenState extends ConsumerState<ArchetypeQuizScreen> {
             child: TextButton(
               onPressed: _skipQuiz,
               child: Text(
-                L10nService.get('onboarding.archetype_quiz.skip', language),
+                L10nService.get(L10nKeys.onboardingArchetypeQuizSkip, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
                   color: AppColors.textMuted.withValues(alpha: 0.7),
@@ -393,7 +393,7 @@ class _ArchetypeQuizScreenState extends ConsumerState<ArchetypeQuizScreen> {
             const CosmicLoadingIndicator(),
             const SizedBox(height: 12),
             Text(
-              L10nService.get('onboarding.archetype_quiz.discovering_your_archetype', language),
+              L10nService.get(L10nKeys.onboardingArchetypeQuizDiscoveringYourArchetype, language),
               style: AppTypography.subtitle(
                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
               ),
@@ -421,7 +421,7 @@ class _ArchetypeQuizScreenState extends ConsumerState<ArchetypeQuizScreen> {
 
           // Title
           Text(
-            L10nService.get('onboarding.archetype_quiz.your_inner_archetype', language),
+            L10nService.get(L10nKeys.onboardingArchetypeQuizYourInnerArchetype, language),
             style: AppTypography.elegantAccent(
               fontSize: 14,
               color: AppColors.starGold,
@@ -475,7 +475,7 @@ class _ArchetypeQuizScreenState extends ConsumerState<ArchetypeQuizScreen> {
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 GradientText(
-                  L10nService.get('onboarding.archetype_quiz.your_strengths', language),
+                  L10nService.get(L10nKeys.onboardingArchetypeQuizYourStrengths, language),
                   variant: GradientTextVariant.gold,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 14,
@@ -531,7 +531,7 @@ class _ArchetypeQuizScreenState extends ConsumerState<ArchetypeQuizScreen> {
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 GradientText(
-                  L10nService.get('onboarding.archetype_quiz.growth_tip', language),
+                  L10nService.get(L10nKeys.onboardingArchetypeQuizGrowthTip, language),
                   variant: GradientTextVariant.amethyst,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 14,
@@ -559,7 +559,7 @@ class _ArchetypeQuizScreenState extends ConsumerState<ArchetypeQuizScreen> {
 
           // Continue button
           GradientButton.gold(
-            label: L10nService.get('onboarding.archetype_quiz.get_started', language),
+            label: L10nService.get(L10nKeys.onboardingArchetypeQuizGetStarted, language),
             onPressed: _goHome,
             expanded: true,
           ).glassEntrance(
@@ -572,7 +572,7 @@ class _ArchetypeQuizScreenState extends ConsumerState<ArchetypeQuizScreen> {
           TextButton(
             onPressed: _goHome,
             child: Text(
-              L10nService.get('onboarding.archetype_quiz.skip_for_now', language),
+              L10nService.get(L10nKeys.onboardingArchetypeQuizSkipForNow, language),
               style: AppTypography.elegantAccent(
                 fontSize: 14,
                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -219,7 +219,7 @@ class _OnboardingScreenState extends ConsumerState<OnboardingScreen> {
                       onPressed: _previousPage,
                       icon: const Icon(Icons.arrow_back_ios_rounded, size: 20),
                       color: AppColors.textMuted,
-                      tooltip: L10nService.get('common.back', language),
+                      tooltip: L10nService.get(L10nKeys.commonBack, language),
                     ),
                   ),
                 ),
@@ -328,13 +328,13 @@ class _OnboardingScreenState extends ConsumerState<OnboardingScreen> {
     String buttonLabel;
     IconData buttonIcon;
     if (isLastPage) {
-      buttonLabel = L10nService.get('common.start_journey', language);
+      buttonLabel = L10nService.get(L10nKeys.commonStartJourney, language);
       buttonIcon = Icons.auto_awesome;
     } else if (isLastValueProp) {
-      buttonLabel = L10nService.get('onboarding.onboarding.get_started', language);
+      buttonLabel = L10nService.get(L10nKeys.onboardingOnboardingGetStarted, language);
       buttonIcon = Icons.arrow_forward;
     } else {
-      buttonLabel = L10nService.get('common.continue', language);
+      buttonLabel = L10nService.get(L10nKeys.commonContinue, language);
       buttonIcon = Icons.arrow_forward;
     }
 
@@ -412,7 +412,7 @@ class _OnboardingScreenState extends ConsumerState<OnboardingScreen> {
             GestureDetector(
               onTap: _nextPage,
               child: Text(
-                L10nService.get('onboarding.onboarding.skip_for_now', language),
+                L10nService.get(L10nKeys.onboardingOnboardingSkipForNow, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
                   color: AppColors.textMuted,
@@ -505,7 +505,7 @@ class _IdentityPageState extends State<_IdentityPage>
     );
     final greeting = cosmicGreetings.isNotEmpty
         ? cosmicGreetings[DateTime.now().millisecond % cosmicGreetings.length]
-        : L10nService.get('greetings.cosmic_welcome', widget.language);
+        : L10nService.get(L10nKeys.greetingsCosmicWelcome, widget.language);
 
     showGeneralDialog(
       context: context,
@@ -565,7 +565,7 @@ class _IdentityPageState extends State<_IdentityPage>
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(
           content: Text(
-            '${L10nService.get('auth.apple_connection_failed', widget.language)}: $e',
+            '${L10nService.get(L10nKeys.authAppleConnectionFailed, widget.language)}: $e',
           ),
           backgroundColor: AppColors.error,
           behavior: SnackBarBehavior.floating,
@@ -620,7 +620,7 @@ class _IdentityPageState extends State<_IdentityPage>
             ),
             const SizedBox(height: 16),
             GradientText(
-              L10nService.get('app.name', widget.language),
+              L10nService.get(L10nKeys.appName, widget.language),
               style: AppTypography.displayFont.copyWith(
                 fontSize: 40,
                 fontWeight: FontWeight.w300,
@@ -658,7 +658,7 @@ class _IdentityPageState extends State<_IdentityPage>
 
           // App name
           GradientText(
-            L10nService.get('app.name', widget.language),
+            L10nService.get(L10nKeys.appName, widget.language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 48,
               fontWeight: FontWeight.w300,
@@ -671,7 +671,7 @@ class _IdentityPageState extends State<_IdentityPage>
 
           // Tagline
           Text(
-            L10nService.get('onboarding.start_cosmic_journey', widget.language),
+            L10nService.get(L10nKeys.onboardingStartCosmicJourney, widget.language),
             style: AppTypography.decorativeScript(
               fontSize: 18,
               color: AppColors.textSecondary,
@@ -713,7 +713,7 @@ class _IdentityPageState extends State<_IdentityPage>
 
           // Terms text
           Text(
-            L10nService.get('onboarding.by_continuing', widget.language),
+            L10nService.get(L10nKeys.onboardingByContinuing, widget.language),
             style: AppTypography.subtitle(
               fontSize: 14,
               color: AppColors.textMuted.withValues(alpha: 0.59),
@@ -805,9 +805,9 @@ class _IdentityPageState extends State<_IdentityPage>
               const SizedBox(width: 12),
               Text(
                 _isAppleLoading
-                    ? L10nService.get('onboarding.connecting', widget.language)
+                    ? L10nService.get(L10nKeys.onboardingConnecting, widget.language)
                     : L10nService.get(
-                        'onboarding.connect_with_apple',
+                        L10nKeys.onboardingConnectWithApple,
                         widget.language,
                       ),
                 style: AppTypography.modernAccent(
@@ -888,7 +888,7 @@ class _FirstCyclePage extends StatelessWidget {
 
           // Title
           GradientText(
-            L10nService.get('onboarding.onboarding.pick_your_starting_signal', language),
+            L10nService.get(L10nKeys.onboardingOnboardingPickYourStartingSignal, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 28,
               fontWeight: FontWeight.w600,
@@ -900,7 +900,7 @@ class _FirstCyclePage extends StatelessWidget {
           const SizedBox(height: 8),
 
           Text(
-            L10nService.get('onboarding.onboarding.theres_no_wrong_answer_follow_your_curio', language),
+            L10nService.get(L10nKeys.onboardingOnboardingTheresNoWrongAnswerFollowYourCurio, language),
             style: AppTypography.decorativeScript(
               fontSize: 19,
               color: AppColors.textMuted,
@@ -1031,7 +1031,7 @@ class _FirstCyclePage extends StatelessWidget {
                 const SizedBox(width: 8),
                 Expanded(
                   child: Text(
-                    L10nService.get('onboarding.onboarding.all_signals_unlock_as_you_journal', language),
+                    L10nService.get(L10nKeys.onboardingOnboardingAllSignalsUnlockAsYouJournal, language),
                     style: AppTypography.subtitle(
                       fontSize: 14,
                       color: AppColors.textMuted,
@@ -1110,7 +1110,7 @@ class _FirstMoodPage extends StatelessWidget {
           const SizedBox(height: 20),
 
           GradientText(
-            L10nService.get('onboarding.onboarding.how_are_you_feeling_right_now', language),
+            L10nService.get(L10nKeys.onboardingOnboardingHowAreYouFeelingRightNow, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 26,
               fontWeight: FontWeight.w600,
@@ -1123,7 +1123,7 @@ class _FirstMoodPage extends StatelessWidget {
           const SizedBox(height: 8),
 
           Text(
-            L10nService.get('onboarding.onboarding.your_first_checkin_this_powers_your_mood', language),
+            L10nService.get(L10nKeys.onboardingOnboardingYourFirstCheckinThisPowersYourMood, language),
             style: AppTypography.decorativeScript(
               fontSize: 15,
               color: AppColors.textMuted,
@@ -1217,7 +1217,7 @@ class _FirstMoodPage extends StatelessWidget {
                 const SizedBox(width: 8),
                 Expanded(
                   child: Text(
-                    L10nService.get('onboarding.onboarding.check_in_daily_to_see_patterns_emerge', language),
+                    L10nService.get(L10nKeys.onboardingOnboardingCheckInDailyToSeePatternsEmerge, language),
                     style: AppTypography.subtitle(
                       fontSize: 14,
                       color: AppColors.textMuted,
@@ -1916,7 +1916,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
           const SizedBox(height: 20),
 
           GradientText(
-            L10nService.get('onboarding.onboarding.youre_all_set', language),
+            L10nService.get(L10nKeys.onboardingOnboardingYoureAllSet, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 30,
               fontWeight: FontWeight.w600,
@@ -1928,7 +1928,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
           const SizedBox(height: 12),
 
           Text(
-            L10nService.get('onboarding.onboarding.one_last_thing_stay_on_track_with_gentle', language),
+            L10nService.get(L10nKeys.onboardingOnboardingOneLastThingStayOnTrackWithGentle, language),
             style: AppTypography.decorativeScript(
               fontSize: 16,
               color: AppColors.textSecondary,
@@ -1974,7 +1974,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         Text(
-                          L10nService.get('onboarding.onboarding.daily_reflection_reminder', language),
+                          L10nService.get(L10nKeys.onboardingOnboardingDailyReflectionReminder, language),
                           style: AppTypography.elegantAccent(
                             fontSize: 15,
                             fontWeight: FontWeight.w600,
@@ -1984,7 +1984,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                         ),
                         const SizedBox(height: 2),
                         Text(
-                          L10nService.get('onboarding.onboarding.a_gentle_nudge_at_900_am', language),
+                          L10nService.get(L10nKeys.onboardingOnboardingAGentleNudgeAt900Am, language),
                           style: AppTypography.decorativeScript(
                             fontSize: 15,
                             color: AppColors.textMuted,
@@ -1995,7 +1995,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                   ),
                   Semantics(
                     button: true,
-                    label: L10nService.get('onboarding.onboarding.enable_notifications', language),
+                    label: L10nService.get(L10nKeys.onboardingOnboardingEnableNotifications, language),
                     child: GestureDetector(
                       onTap: notificationsRequested
                           ? null
@@ -2059,7 +2059,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 Text(
-                  L10nService.get('onboarding.onboarding.whats_included', language),
+                  L10nService.get(L10nKeys.onboardingOnboardingWhatsIncluded, language),
                   style: AppTypography.elegantAccent(
                     fontSize: 16,
                     fontWeight: FontWeight.w600,
@@ -2070,19 +2070,19 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                 const SizedBox(height: 14),
                 _FeatureRow(
                   icon: Icons.edit_note,
-                  text: L10nService.get('onboarding.onboarding.daily_reflection_journal', language),
+                  text: L10nService.get(L10nKeys.onboardingOnboardingDailyReflectionJournal, language),
                 ),
                 _FeatureRow(
                   icon: Icons.nights_stay,
-                  text: L10nService.get('onboarding.onboarding.dream_journal', language),
+                  text: L10nService.get(L10nKeys.onboardingOnboardingDreamJournal, language),
                 ),
                 _FeatureRow(
                   icon: Icons.auto_graph,
-                  text: L10nService.get('onboarding.onboarding.pattern_recognition', language),
+                  text: L10nService.get(L10nKeys.onboardingOnboardingPatternRecognition, language),
                 ),
                 _FeatureRow(
                   icon: Icons.library_books,
-                  text: L10nService.get('onboarding.onboarding.symbol_glossary', language),
+                  text: L10nService.get(L10nKeys.onboardingOnboardingSymbolGlossary, language),
                 ),
               ],
             ),
@@ -2103,7 +2103,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                 ),
                 const SizedBox(width: 6),
                 Text(
-                  L10nService.get('onboarding.onboarding.have_an_invite_code', language),
+                  L10nService.get(L10nKeys.onboardingOnboardingHaveAnInviteCode, language),
                   style: AppTypography.subtitle(
                     fontSize: 14,
                     color: AppColors.starGold.withValues(alpha: 0.8),
@@ -2134,7 +2134,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                 child: Column(
                   children: [
                     Text(
-                      L10nService.get('onboarding.onboarding.enter_your_friends_code_for_7_days_free', language),
+                      L10nService.get(L10nKeys.onboardingOnboardingEnterYourFriendsCodeFor7DaysFree, language),
                       style: AppTypography.subtitle(
                         fontSize: 13,
                         color: AppColors.textSecondary,
@@ -2155,7 +2155,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                           letterSpacing: 4,
                         ),
                         decoration: InputDecoration(
-                          hintText: L10nService.get('onboarding.onboarding.abcd1234', language),
+                          hintText: L10nService.get(L10nKeys.onboardingOnboardingAbcd1234, language),
                           hintStyle: AppTypography.subtitle(
                             fontSize: 18,
                             color: AppColors.textMuted.withValues(alpha: 0.3),
@@ -2213,7 +2213,7 @@ class _PermissionStartPageState extends State<_PermissionStartPage> {
                 const SizedBox(width: 8),
                 Expanded(
                   child: Text(
-                    L10nService.get('disclaimer.reflection_only', widget.language),
+                    L10nService.get(L10nKeys.disclaimerReflectionOnly, widget.language),
                     style: AppTypography.subtitle(
                       fontSize: 13,
                       color: AppColors.textMuted,
@@ -2328,7 +2328,7 @@ class _WelcomePage extends StatelessWidget {
 
           // Tagline
           Text(
-            L10nService.get('onboarding.onboarding.your_story_your_patterns_your_clarity', language),
+            L10nService.get(L10nKeys.onboardingOnboardingYourStoryYourPatternsYourClarity, language),
             style: AppTypography.decorativeScript(
               fontSize: 16,
               color: AppColors.textSecondary,
@@ -2382,7 +2382,7 @@ class _WelcomePage extends StatelessWidget {
                 const SizedBox(width: 6),
                 Flexible(
                   child: Text(
-                    L10nService.get('onboarding.onboarding.private_secure_your_journal_stays_on_you', language),
+                    L10nService.get(L10nKeys.onboardingOnboardingPrivateSecureYourJournalStaysOnYou, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       color: AppColors.textMuted,
@@ -2431,7 +2431,7 @@ class _WelcomePage extends StatelessWidget {
             Padding(
               padding: const EdgeInsets.symmetric(horizontal: 24),
               child: Text(
-                L10nService.get('onboarding.onboarding.kvkk_consent', language),
+                L10nService.get(L10nKeys.onboardingOnboardingKvkkConsent, language),
                 textAlign: TextAlign.center,
                 style: AppTypography.elegantAccent(
                   fontSize: 11,
@@ -2443,7 +2443,7 @@ class _WelcomePage extends StatelessWidget {
             GestureDetector(
               onTap: () => launchUrl(Uri.parse('https://umutnull-woltemade.github.io/innercycles/privacy.html')),
               child: Text(
-                L10nService.get('onboarding.onboarding.privacy_policy_link', language),
+                L10nService.get(L10nKeys.onboardingOnboardingPrivacyPolicyLink, language),
                 textAlign: TextAlign.center,
                 style: AppTypography.elegantAccent(
                   fontSize: 11,
@@ -2564,7 +2564,7 @@ class _NameInput extends StatelessWidget {
         fontSize: 16,
       ),
       decoration: InputDecoration(
-        hintText: L10nService.get('input.your_name', language),
+        hintText: L10nService.get(L10nKeys.inputYourName, language),
         hintStyle: AppTypography.subtitle(
           color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
           fontSize: 15,
@@ -2771,7 +2771,7 @@ class _CosmicWelcomeOverlayState extends State<_CosmicWelcomeOverlay>
 
                           Text(
                             L10nService.get(
-                              'onboarding.tap_to_continue',
+                              L10nKeys.onboardingTapToContinue,
                               widget.language,
                             ),
                             style: AppTypography.elegantAccent(
@@ -327,7 +327,7 @@ class _ContextualPaywallSheetState
 
                   // Risk reversal
                   Text(
-                    L10nService.get('premium.contextual_paywall.cancel_anytime_your_entries_are_always_y', language),
+                    L10nService.get(L10nKeys.premiumContextualPaywallCancelAnytimeYourEntriesAreAlwaysY, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.decorativeScript(
                       color: Colors.white.withValues(alpha: 0.55),
@@ -351,7 +351,7 @@ class _ContextualPaywallSheetState
                       Navigator.pop(context, false);
                     },
                     child: Text(
-                      L10nService.get('premium.contextual_paywall.not_now', language),
+                      L10nService.get(L10nKeys.premiumContextualPaywallNotNow, language),
                       style: AppTypography.elegantAccent(
                         color: Colors.white.withValues(alpha: 0.7),
                         fontSize: 13,
@@ -378,10 +378,10 @@ class _ContextualPaywallSheetState
     final monthlyLabel =
         experiment?.monthlyPriceLabel ??
         dynamicMonthly ??
-        L10nService.get('premium.pricing.monthly', language);
+        L10nService.get(L10nKeys.premiumPricingMonthly, language);
     final yearlyLabel =
         experiment?.yearlyMonthlyEquivalent ??
-        L10nService.get('premium.pricing.yearly_monthly', language);
+        L10nService.get(L10nKeys.premiumPricingYearlyMonthly, language);
 
     return Row(
       mainAxisAlignment: MainAxisAlignment.center,
@@ -470,7 +470,7 @@ class _ContextualPaywallSheetState
         const SizedBox(width: 6),
         Flexible(
           child: Text(
-            L10nService.get('premium.contextual_paywall.surface_patterns_from_your_entries_with', language),
+            L10nService.get(L10nKeys.premiumContextualPaywallSurfacePatternsFromYourEntriesWith, language),
             style: AppTypography.decorativeScript(
               color: Colors.white.withValues(alpha: 0.5),
               fontSize: 12,
@@ -505,7 +505,7 @@ class _ContextualPaywallSheetState
       items.add(
         _ValueItem(
           Icons.edit_note_outlined,
-          L10nService.getWithParams('premium.entry_count', language, params: {'count': '$entryCount'}),
+          L10nService.getWithParams(L10nKeys.premiumEntryCount, language, params: {'count': '$entryCount'}),
         ),
       );
     }
@@ -513,7 +513,7 @@ class _ContextualPaywallSheetState
       items.add(
         _ValueItem(
           Icons.local_fire_department_outlined,
-          L10nService.getWithParams('premium.day_streak', language, params: {'count': '$streakDays'}),
+          L10nService.getWithParams(L10nKeys.premiumDayStreak, language, params: {'count': '$streakDays'}),
         ),
       );
     }
@@ -521,7 +521,7 @@ class _ContextualPaywallSheetState
       items.add(
         _ValueItem(
           Icons.nights_stay_outlined,
-          L10nService.getWithParams('premium.dream_count', language, params: {'count': '$dreamCount'}),
+          L10nService.getWithParams(L10nKeys.premiumDreamCount, language, params: {'count': '$dreamCount'}),
         ),
       );
     }
@@ -536,7 +536,7 @@ class _ContextualPaywallSheetState
       child: Column(
         children: [
           Text(
-            L10nService.get('premium.contextual_paywall.your_investment_so_far', language),
+            L10nService.get(L10nKeys.premiumContextualPaywallYourInvestmentSoFar, language),
             style: AppTypography.elegantAccent(
               fontSize: 11,
               letterSpacing: 1.0,
@@ -583,23 +583,23 @@ class _ContextualPaywallSheetState
         return _PaywallConfig(
           icon: Icons.psychology_outlined,
           accentColor: AppColors.starGold,
-          headline: L10nService.get('premium.contextual_paywall.your_data_has_more_to_show', language),
-          subtitle: L10nService.get('premium.contextual_paywall.your_entries_hold_patterns_you_cant_see', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallYourDataHasMoreToShow, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallYourEntriesHoldPatternsYouCantSee, language),
           detail: widget.entryCount != null
               ? (isEn
                     ? '${widget.entryCount} entries analyzed'
                     : '${widget.entryCount} kayıt analiz edildi')
               : null,
-          cta: L10nService.get('premium.contextual_paywall.discover_my_patterns', language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallDiscoverMyPatterns, language),
         );
 
       case PaywallContext.dreams:
         return _PaywallConfig(
           icon: Icons.nightlight_round,
           accentColor: AppColors.mediumSlateBlue,
-          headline: L10nService.get('premium.contextual_paywall.your_dream_has_more_to_say', language),
-          subtitle: L10nService.get('premium.contextual_paywall.4_more_interpretation_perspectives_avail', language),
-          cta: L10nService.get('premium.contextual_paywall.access_all_perspectives', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallYourDreamHasMoreToSay, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywall4MoreInterpretationPerspectivesAvail, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallAccessAllPerspectives, language),
         );
 
       case PaywallContext.streakFreeze:
@@ -609,13 +609,13 @@ class _ContextualPaywallSheetState
           headline: isEn
               ? "Don't lose what you've built"
               : 'İnşa ettiğini kaybetme',
-          subtitle: L10nService.get('premium.contextual_paywall.freeze_your_streak_and_pick_up_where_you', language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallFreezeYourStreakAndPickUpWhereYou, language),
           detail: widget.streakDays != null
               ? (isEn
                     ? '${widget.streakDays}-day streak at risk'
                     : '${widget.streakDays} günlük seri risk altında')
               : null,
-          cta: L10nService.get('premium.contextual_paywall.protect_my_streak', language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallProtectMyStreak, language),
         );
 
       case PaywallContext.monthlyReport:
@@ -625,73 +625,73 @@ class _ContextualPaywallSheetState
           headline: isEn
               ? "You've done the work. See the growth."
               : 'Emeği verdin. Büyümeyi gör.',
-          subtitle: L10nService.get('premium.contextual_paywall.your_monthly_reflection_report_distills', language),
-          cta: L10nService.get('premium.contextual_paywall.view_my_report', language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallYourMonthlyReflectionReportDistills, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallViewMyReport, language),
         );
 
       case PaywallContext.export:
         return _PaywallConfig(
           icon: Icons.download_rounded,
           accentColor: AppColors.exportGreen,
-          headline: L10nService.get('premium.contextual_paywall.your_data_belongs_to_you', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallYourDataBelongsToYou, language),
           subtitle: isEn
               ? 'Export your complete journal history in any format. All ${widget.entryCount ?? ''} entries, yours to keep.'
               : 'Tüm günlük geçmişini istediğin formatta dışa aktar. ${widget.entryCount ?? ''} kayıt, senin.',
-          cta: L10nService.get('premium.contextual_paywall.export_everything', language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallExportEverything, language),
         );
 
       case PaywallContext.adRemoval:
         return _PaywallConfig(
           icon: Icons.visibility_off,
           accentColor: AppColors.amethyst,
-          headline: L10nService.get('premium.contextual_paywall.your_reflection_space_uninterrupted', language),
-          subtitle: L10nService.get('premium.contextual_paywall.remove_all_ads_and_focus_on_what_matters', language),
-          cta: L10nService.get('premium.contextual_paywall.go_adfree', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallYourReflectionSpaceUninterrupted, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallRemoveAllAdsAndFocusOnWhatMatters, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallGoAdfree, language),
         );
 
       case PaywallContext.programs:
         return _PaywallConfig(
           icon: Icons.school_rounded,
           accentColor: AppColors.greenAccent,
-          headline: L10nService.get('premium.contextual_paywall.go_deeper_with_guided_growth', language),
-          subtitle: L10nService.get('premium.contextual_paywall.structured_multiday_sequences_designed_t', language),
-          cta: L10nService.get('premium.contextual_paywall.start_program', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallGoDeeperWithGuidedGrowth, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallStructuredMultidaySequencesDesignedT, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallStartProgram, language),
         );
 
       case PaywallContext.challenges:
         return _PaywallConfig(
           icon: Icons.emoji_events_rounded,
           accentColor: AppColors.celestialGold,
-          headline: L10nService.get('premium.contextual_paywall.push_your_limits', language),
-          subtitle: L10nService.get('premium.contextual_paywall.pro_growth_challenges_that_elevate_your', language),
-          cta: L10nService.get('premium.contextual_paywall.accept_challenge', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallPushYourLimits, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallProGrowthChallengesThatElevateYour, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallAcceptChallenge, language),
         );
 
       case PaywallContext.cycleSync:
         return _PaywallConfig(
           icon: Icons.favorite_rounded,
           accentColor: AppColors.amethyst,
-          headline: L10nService.get('premium.contextual_paywall.understand_your_cycle_patterns', language),
-          subtitle: L10nService.get('premium.contextual_paywall.see_how_your_emotional_patterns_align_wi', language),
-          cta: L10nService.get('premium.contextual_paywall.access_cycle_insights', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallUnderstandYourCyclePatterns, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallSeeHowYourEmotionalPatternsAlignWi, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallAccessCycleInsights, language),
         );
 
       case PaywallContext.shadowWork:
         return _PaywallConfig(
           icon: Icons.psychology_rounded,
           accentColor: AppColors.amethyst,
-          headline: L10nService.get('premium.contextual_paywall.explore_your_hidden_patterns', language),
-          subtitle: L10nService.get('premium.contextual_paywall.guided_shadow_work_helps_you_understand', language),
-          cta: L10nService.get('premium.contextual_paywall.access_shadow_work', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallExploreYourHiddenPatterns, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallGuidedShadowWorkHelpsYouUnderstand, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallAccessShadowWork, language),
         );
 
       case PaywallContext.general:
         return _PaywallConfig(
           icon: Icons.psychology_outlined,
           accentColor: AppColors.starGold,
-          headline: L10nService.get('premium.contextual_paywall.your_data_has_more_to_show_1', language),
-          subtitle: L10nService.get('premium.contextual_paywall.no_ai_no_cloud_just_your_words_revealing', language),
-          cta: L10nService.get('premium.contextual_paywall.discover_my_patterns_1', language),
+          headline: L10nService.get(L10nKeys.premiumContextualPaywallYourDataHasMoreToShow1, language),
+          subtitle: L10nService.get(L10nKeys.premiumContextualPaywallNoAiNoCloudJustYourWordsRevealing, language),
+          cta: L10nService.get(L10nKeys.premiumContextualPaywallDiscoverMyPatterns1, language),
         );
     }
   }
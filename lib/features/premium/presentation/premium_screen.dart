@@ -141,7 +141,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
         Row(
           children: [
             IconButton(
-              tooltip: L10nService.get('premium.back_to_app', language),
+              tooltip: L10nService.get(L10nKeys.premiumBackToApp, language),
               onPressed: () => Navigator.of(context).pop(),
               icon: const Icon(Icons.close, color: AppColors.textPrimary),
             ),
@@ -149,7 +149,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
           ],
         ),
         Text(
-          L10nService.get('app.name', language),
+          L10nService.get(L10nKeys.appName, language),
           style: AppTypography.elegantAccent(
             fontSize: 12,
             fontWeight: FontWeight.w600,
@@ -161,7 +161,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
 
         // New headline
         Text(
-          L10nService.get('premium.paywall.title', language),
+          L10nService.get(L10nKeys.premiumPaywallTitle, language),
           textAlign: TextAlign.center,
           style: AppTypography.displayFont.copyWith(
             fontSize: 28,
@@ -175,7 +175,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
 
         // New subtitle
         Text(
-          L10nService.get('premium.paywall.subtitle', language),
+          L10nService.get(L10nKeys.premiumPaywallSubtitle, language),
           textAlign: TextAlign.center,
           style: AppTypography.decorativeScript(
             fontSize: 16,
@@ -236,7 +236,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                   const SizedBox(width: 8),
                   Flexible(
                     child: Text(
-                      L10nService.get('premium.premium.50_off_new_user_special', language),
+                      L10nService.get(L10nKeys.premiumPremium50OffNewUserSpecial, language),
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 16,
                         fontWeight: FontWeight.w700,
@@ -252,7 +252,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                 mainAxisAlignment: MainAxisAlignment.center,
                 children: [
                   Text(
-                    L10nService.get('premium.premium.offer_expires_in', language),
+                    L10nService.get(L10nKeys.premiumPremiumOfferExpiresIn, language),
                     style: AppTypography.subtitle(
                       fontSize: 13,
                       color: AppColors.textSecondary,
@@ -344,7 +344,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           Text(
-            L10nService.get('premium.cosmic_powers', language),
+            L10nService.get(L10nKeys.premiumCosmicPowers, language),
             style: AppTypography.elegantAccent(
               fontSize: 18,
               fontWeight: FontWeight.w700,
@@ -369,81 +369,81 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
     final rows = [
       _ComparisonRow(
         feature: L10nService.get(
-          'premium.comparison.feature_journal',
+          L10nKeys.premiumComparisonFeatureJournal,
           language,
         ),
         free: L10nService.get(
-          'premium.comparison.feature_journal_free',
+          L10nKeys.premiumComparisonFeatureJournalFree,
           language,
         ),
         pro: L10nService.get(
-          'premium.comparison.feature_journal_pro',
+          L10nKeys.premiumComparisonFeatureJournalPro,
           language,
         ),
       ),
       _ComparisonRow(
-        feature: L10nService.get('premium.comparison.feature_dreams', language),
+        feature: L10nService.get(L10nKeys.premiumComparisonFeatureDreams, language),
         free: L10nService.get(
-          'premium.comparison.feature_dreams_free',
+          L10nKeys.premiumComparisonFeatureDreamsFree,
           language,
         ),
-        pro: L10nService.get('premium.comparison.feature_dreams_pro', language),
+        pro: L10nService.get(L10nKeys.premiumComparisonFeatureDreamsPro, language),
         isHighlight: true,
       ),
       _ComparisonRow(
         feature: L10nService.get(
-          'premium.comparison.feature_patterns',
+          L10nKeys.premiumComparisonFeaturePatterns,
           language,
         ),
         free: L10nService.get(
-          'premium.comparison.feature_patterns_free',
+          L10nKeys.premiumComparisonFeaturePatternsFree,
           language,
         ),
         pro: L10nService.get(
-          'premium.comparison.feature_patterns_pro',
+          L10nKeys.premiumComparisonFeaturePatternsPro,
           language,
         ),
         isHighlight: true,
       ),
       _ComparisonRow(
         feature: L10nService.get(
-          'premium.comparison.feature_reports',
+          L10nKeys.premiumComparisonFeatureReports,
           language,
         ),
         free: L10nService.get(
-          'premium.comparison.feature_reports_free',
+          L10nKeys.premiumComparisonFeatureReportsFree,
           language,
         ),
         pro: L10nService.get(
-          'premium.comparison.feature_reports_pro',
+          L10nKeys.premiumComparisonFeatureReportsPro,
           language,
         ),
         isHighlight: true,
       ),
       _ComparisonRow(
-        feature: L10nService.get('premium.comparison.feature_export', language),
+        feature: L10nService.get(L10nKeys.premiumComparisonFeatureExport, language),
         free: L10nService.get(
-          'premium.comparison.feature_export_free',
+          L10nKeys.premiumComparisonFeatureExportFree,
           language,
         ),
-        pro: L10nService.get('premium.comparison.feature_export_pro', language),
+        pro: L10nService.get(L10nKeys.premiumComparisonFeatureExportPro, language),
       ),
       _ComparisonRow(
-        feature: L10nService.get('premium.comparison.feature_ads', language),
-        free: L10nService.get('premium.comparison.feature_ads_free', language),
-        pro: L10nService.get('premium.comparison.feature_ads_pro', language),
+        feature: L10nService.get(L10nKeys.premiumComparisonFeatureAds, language),
+        free: L10nService.get(L10nKeys.premiumComparisonFeatureAdsFree, language),
+        pro: L10nService.get(L10nKeys.premiumComparisonFeatureAdsPro, language),
       ),
       _ComparisonRow(
         feature: L10nService.get(
-          'premium.comparison.feature_programs',
+          L10nKeys.premiumComparisonFeaturePrograms,
           language,
         ),
         free: L10nService.get(
-          'premium.comparison.feature_programs_free',
+          L10nKeys.premiumComparisonFeatureProgramsFree,
           language,
         ),
         pro: L10nService.get(
-          'premium.comparison.feature_programs_pro',
+          L10nKeys.premiumComparisonFeatureProgramsPro,
           language,
         ),
       ),
@@ -456,7 +456,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
       child: Column(
         children: [
           Text(
-            L10nService.get('premium.comparison.title', language),
+            L10nService.get(L10nKeys.premiumComparisonTitle, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 20,
               color: AppColors.textPrimary,
@@ -472,7 +472,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
               Expanded(
                 flex: 2,
                 child: Text(
-                  L10nService.get('premium.tiers.free.name', language),
+                  L10nService.get(L10nKeys.premiumTiersFreeName, language),
                   textAlign: TextAlign.center,
                   style: AppTypography.elegantAccent(
                     fontSize: 11,
@@ -677,7 +677,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
           ],
         ),
         child: Semantics(
-          label: L10nService.get('premium.paywall.continue_pro', language),
+          label: L10nService.get(L10nKeys.premiumPaywallContinuePro, language),
           button: true,
           child: Material(
             color: Colors.transparent,
@@ -703,7 +703,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                           children: [
                             Text(
                               L10nService.get(
-                                'premium.paywall.continue_pro',
+                                L10nKeys.premiumPaywallContinuePro,
                                 language,
                               ),
                               style: AppTypography.modernAccent(
@@ -743,7 +743,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
   Widget _buildRiskReversal(BuildContext context) {
     final language = ref.watch(languageProvider);
     return Text(
-      L10nService.get('premium.risk_reversal', language),
+      L10nService.get(L10nKeys.premiumRiskReversal, language),
       textAlign: TextAlign.center,
       style: AppTypography.subtitle(fontSize: 12, color: AppColors.textSecondary),
     );
@@ -790,7 +790,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
               ],
             ),
             child: Semantics(
-              label: L10nService.get('premium.paywall.continue_pro', language),
+              label: L10nService.get(L10nKeys.premiumPaywallContinuePro, language),
               button: true,
               child: Material(
                 color: Colors.transparent,
@@ -824,7 +824,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                               fit: BoxFit.scaleDown,
                               child: Text(
                                 L10nService.get(
-                                  'premium.paywall.continue_pro',
+                                  L10nKeys.premiumPaywallContinuePro,
                                   language,
                                 ),
                                 style: AppTypography.modernAccent(
@@ -859,8 +859,8 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
     // Use experiment variant price if available, else fall back to l10n
     final monthlyLabel =
         experiment?.monthlyPriceLabel ??
-        L10nService.get('premium.price_monthly_crossed', language);
-    final anchorText = L10nService.get('premium.price_anchor', language);
+        L10nService.get(L10nKeys.premiumPriceMonthlyCrossed, language);
+    final anchorText = L10nService.get(L10nKeys.premiumPriceAnchor, language);
     final anchorSuffix = anchorText.contains('—')
         ? anchorText.split('—').last.trim()
         : anchorText;
@@ -933,7 +933,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                   children: [
                     IconButton(
                       onPressed: () => Navigator.of(context).pop(),
-                      tooltip: L10nService.get('common.close', ref.read(languageProvider)),
+                      tooltip: L10nService.get(L10nKeys.commonClose, ref.read(languageProvider)),
                       icon: const Icon(
                         Icons.close,
                         color: AppColors.textPrimary,
@@ -1004,7 +1004,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
       child: Column(
         children: [
           Text(
-            L10nService.get('premium.cosmic_powers_active', language),
+            L10nService.get(L10nKeys.premiumCosmicPowersActive, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 24,
               color: AppColors.starGold,
@@ -1014,7 +1014,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
           const SizedBox(height: AppConstants.spacingMd),
           if (premiumState.expiryDate != null)
             Text(
-              '${L10nService.get('common.next', language)}: ${_formatDate(premiumState.expiryDate!)}',
+              '${L10nService.get(L10nKeys.commonNext, language)}: ${_formatDate(premiumState.expiryDate!)}',
               style: AppTypography.subtitle(
                 fontSize: 14,
                 color: AppColors.textSecondary,
@@ -1030,7 +1030,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
     return Padding(
       padding: const EdgeInsets.symmetric(horizontal: 16),
       child: GradientOutlinedButton(
-        label: L10nService.get('premium.manage_subscription', language),
+        label: L10nService.get(L10nKeys.premiumManageSubscription, language),
         icon: Icons.settings,
         variant: GradientTextVariant.gold,
         expanded: true,
@@ -1094,7 +1094,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
   Widget _buildRestoreButton(BuildContext context, PremiumState premiumState) {
     final language = ref.watch(languageProvider);
     return Semantics(
-      label: L10nService.get('premium.premium.restore_purchases', language),
+      label: L10nService.get(L10nKeys.premiumPremiumRestorePurchases, language),
       button: true,
       child: TextButton(
       onPressed: premiumState.isLoading
@@ -1109,11 +1109,11 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                     content: Text(
                       restored
                           ? L10nService.get(
-                              'premium.purchases_restored',
+                              L10nKeys.premiumPurchasesRestored,
                               language,
                             )
                           : L10nService.get(
-                              'premium.no_purchases_found',
+                              L10nKeys.premiumNoPurchasesFound,
                               language,
                             ),
                     ),
@@ -1127,7 +1127,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
       child: FittedBox(
         fit: BoxFit.scaleDown,
         child: Text(
-          L10nService.get('premium.restore_purchases', language),
+          L10nService.get(L10nKeys.premiumRestorePurchases, language),
           style: AppTypography.elegantAccent(
             color: AppColors.textSecondary,
           ).copyWith(decoration: TextDecoration.underline),
@@ -1145,7 +1145,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
       child: Column(
         children: [
           Text(
-            L10nService.get('premium.terms_text', language),
+            L10nService.get(L10nKeys.premiumTermsText, language),
             textAlign: TextAlign.center,
             style: AppTypography.subtitle(
               fontSize: 11,
@@ -1157,7 +1157,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
             mainAxisAlignment: MainAxisAlignment.center,
             children: [
               Semantics(
-                label: L10nService.get('premium.premium.privacy_policy', language),
+                label: L10nService.get(L10nKeys.premiumPremiumPrivacyPolicy, language),
                 link: true,
                 child: GestureDetector(
                   onTap: () =>
@@ -1169,7 +1169,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                         isEn
                             ? 'Privacy Policy'
                             : L10nService.get(
-                                'settings.privacy_policy',
+                                L10nKeys.settingsPrivacyPolicy,
                                 language,
                               ),
                         style:
@@ -1196,7 +1196,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                 ),
               ),
               Semantics(
-                label: L10nService.get('premium.premium.terms_of_service', language),
+                label: L10nService.get(L10nKeys.premiumPremiumTermsOfService, language),
                 link: true,
                 child: GestureDetector(
                   onTap: () =>
@@ -1208,7 +1208,7 @@ class _PremiumScreenState extends ConsumerState<PremiumScreen> {
                         isEn
                             ? 'Terms of Service'
                             : L10nService.get(
-                                'settings.terms_of_service',
+                                L10nKeys.settingsTermsOfService,
                                 language,
                               ),
                         style:
@@ -1329,7 +1329,7 @@ class _PlanCard extends StatelessWidget {
               ? AppColors.starGold.withValues(alpha: 0.2)
               : null,
           child: Semantics(
-            label: '${tier.localizedDisplayName(language)}${isSelected ? ' ${L10nService.get('common.selected', language)}' : ''}',
+            label: '${tier.localizedDisplayName(language)}${isSelected ? ' ${L10nService.get(L10nKeys.commonSelected, language)}' : ''}',
             button: true,
             selected: isSelected,
             child: Material(
@@ -1443,7 +1443,7 @@ class _BestValueBadge extends ConsumerWidget {
         borderRadius: BorderRadius.circular(12),
       ),
       child: Text(
-        L10nService.get('premium.best_value', language),
+        L10nService.get(L10nKeys.premiumBestValue, language),
         style: AppTypography.elegantAccent(
           fontSize: 11,
           fontWeight: FontWeight.w700,
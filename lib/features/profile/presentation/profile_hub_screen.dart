@@ -93,7 +93,7 @@ class ProfileHubScreen extends ConsumerWidget {
         .round()
         .clamp(0, 100);
 
-    final name = profile?.name ?? (L10nService.get('profile.profile_hub.explorer', language));
+    final name = profile?.name ?? (L10nService.get(L10nKeys.profileProfileHubExplorer, language));
 
     return Scaffold(
       body: CosmicBackground(
@@ -107,7 +107,7 @@ class ProfileHubScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('profile.profile_hub.profile', language),
+                  title: L10nService.get(L10nKeys.profileProfileHubProfile, language),
                   showBackButton: false,
                   largeTitleMode: true,
                 ),
@@ -121,7 +121,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
     return Row(
       children: [
         IconButton(
-          tooltip: L10nService.get('common.back', language),
+          tooltip: L10nService.get(L10nKeys.commonBack, language),
           onPressed: () {
             if (_hasChanges) {
               _showDiscardDialog(context, language);
@@ -137,7 +137,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
         ),
         const SizedBox(width: AppConstants.spacingSm),
         GradientText(
-          L10nService.get('navigation.profile', language),
+          L10nService.get(L10nKeys.navigationProfile, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.displayFont.copyWith(
             fontSize: 24,
@@ -149,7 +149,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
           TextButton(
             onPressed: _saveProfile,
             child: Text(
-              L10nService.get('common.save', language),
+              L10nService.get(L10nKeys.commonSave, language),
               style: AppTypography.modernAccent(
                 color: AppColors.auroraStart,
                 fontWeight: FontWeight.bold,
@@ -266,7 +266,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
               Icon(Icons.edit_outlined, color: AppColors.starGold, size: 20),
               const SizedBox(width: AppConstants.spacingSm),
               GradientText(
-                L10nService.get('profile.edit_info', language),
+                L10nService.get(L10nKeys.profileEditInfo, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 18,
@@ -281,8 +281,8 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
           _buildTextField(
             context,
             controller: _nameController,
-            label: L10nService.get('input.name', language),
-            hint: L10nService.get('input.your_name', language),
+            label: L10nService.get(L10nKeys.inputName, language),
+            hint: L10nService.get(L10nKeys.inputYourName, language),
             icon: Icons.person_outline,
             isDark: isDark,
             onChanged: (value) => setState(() => _hasChanges = true),
@@ -292,10 +292,10 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
           // Birth date
           _buildInfoField(
             context,
-            label: L10nService.get('input.birth_date', language),
+            label: L10nService.get(L10nKeys.inputBirthDate, language),
             value: _selectedDate != null
                 ? '${_selectedDate!.day}/${_selectedDate!.month}/${_selectedDate!.year}'
-                : L10nService.get('input.select_time', language),
+                : L10nService.get(L10nKeys.inputSelectTime, language),
             icon: Icons.calendar_today_outlined,
             isDark: isDark,
             onTap: () => _selectDate(context),
@@ -305,10 +305,10 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
           // Birth time
           _buildInfoField(
             context,
-            label: L10nService.get('input.birth_time', language),
+            label: L10nService.get(L10nKeys.inputBirthTime, language),
             value: _selectedTime != null
                 ? '${_selectedTime!.hour.toString().padLeft(2, '0')}:${_selectedTime!.minute.toString().padLeft(2, '0')}'
-                : L10nService.get('input.select_time', language),
+                : L10nService.get(L10nKeys.inputSelectTime, language),
             icon: Icons.access_time_outlined,
             isDark: isDark,
             onTap: () => _selectTime(context),
@@ -318,9 +318,9 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
           // Birth place
           _buildInfoField(
             context,
-            label: L10nService.get('input.birth_place', language),
+            label: L10nService.get(L10nKeys.inputBirthPlace, language),
             value:
-                _selectedCity ?? L10nService.get('input.select_city', language),
+                _selectedCity ?? L10nService.get(L10nKeys.inputSelectCity, language),
             icon: Icons.location_on_outlined,
             isDark: isDark,
             onTap: () => _selectCity(context, language),
@@ -474,7 +474,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
               Icon(Icons.auto_awesome, color: AppColors.starGold, size: 20),
               const SizedBox(width: AppConstants.spacingSm),
               GradientText(
-                L10nService.get('profile.profile.your_progress', language),
+                L10nService.get(L10nKeys.profileProfileYourProgress, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 18,
@@ -485,7 +485,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
           ),
           const SizedBox(height: AppConstants.spacingMd),
           Text(
-            L10nService.get('profile.profile.explore_your_patterns_track_your_growth', language),
+            L10nService.get(L10nKeys.profileProfileExploreYourPatternsTrackYourGrowth, language),
             style: AppTypography.subtitle(
               fontSize: 12,
               color: isDark
@@ -497,7 +497,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
           const SizedBox(height: AppConstants.spacingLg),
           // Navigate to Signal Dashboard (CORE Insights)
           GradientOutlinedButton(
-            label: L10nService.get('profile.profile.view_insights', language),
+            label: L10nService.get(L10nKeys.profileProfileViewInsights, language),
             icon: Icons.insights,
             variant: GradientTextVariant.aurora,
             expanded: true,
@@ -612,7 +612,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
                           TextButton(
                             onPressed: () => Navigator.pop(context),
                             child: Text(
-                              L10nService.get('common.cancel', language),
+                              L10nService.get(L10nKeys.commonCancel, language),
                               style: AppTypography.modernAccent(
                                 color: isDark
                                     ? AppColors.textMuted
@@ -621,7 +621,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
                             ),
                           ),
                           GradientText(
-                            L10nService.get('input.select_city', language),
+                            L10nService.get(L10nKeys.inputSelectCity, language),
                             variant: GradientTextVariant.aurora,
                             style: AppTypography.displayFont.copyWith(
                               fontSize: 18,
@@ -640,7 +640,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
                         ),
                         decoration: InputDecoration(
                           hintText: L10nService.get(
-                            'input.search_city',
+                            L10nKeys.inputSearchCity,
                             language,
                           ),
                           hintStyle: AppTypography.subtitle(
@@ -674,7 +674,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
                         children: [
                           FilterChip(
                             label: Text(
-                              L10nService.get('input.turkey_kktc', language),
+                              L10nService.get(L10nKeys.inputTurkeyKktc, language),
                               style: AppTypography.modernAccent(
                                 fontSize: 13,
                                 color: showTurkeyOnly
@@ -706,7 +706,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
                           ),
                           FilterChip(
                             label: Text(
-                              L10nService.get('input.whole_world', language),
+                              L10nService.get(L10nKeys.inputWholeWorld, language),
                               style: AppTypography.modernAccent(
                                 fontSize: 13,
                                 color: !showTurkeyOnly
@@ -823,7 +823,7 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
     ScaffoldMessenger.of(context).showSnackBar(
       SnackBar(
         content: Text(
-          L10nService.get('profile.profile_saved', ref.read(languageProvider)),
+          L10nService.get(L10nKeys.profileProfileSaved, ref.read(languageProvider)),
         ),
         backgroundColor: AppColors.success,
         behavior: SnackBarBehavior.floating,
@@ -837,10 +837,10 @@ class _ProfileScreenState extends ConsumerState<ProfileScreen> {
   void _showDiscardDialog(BuildContext context, AppLanguage language) async {
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('profile.discard_changes_title', language),
-      message: L10nService.get('profile.discard_changes_message', language),
-      cancelLabel: L10nService.get('common.cancel', language),
-      confirmLabel: L10nService.get('common.delete', language),
+      title: L10nService.get(L10nKeys.profileDiscardChangesTitle, language),
+      message: L10nService.get(L10nKeys.profileDiscardChangesMessage, language),
+      cancelLabel: L10nService.get(L10nKeys.commonCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.commonDelete, language),
       isDestructive: true,
     );
     if (confirmed == true && context.mounted) {
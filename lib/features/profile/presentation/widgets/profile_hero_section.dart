@@ -254,7 +254,7 @@ class _ProfileHeroSectionState extends State<ProfileHeroSection>
                   Positioned(
                     bottom: 4,
                     child: Text(
-                      L10nService.get('profile.profile_hero.growth_score', language),
+                      L10nService.get(L10nKeys.profileProfileHeroGrowthScore, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
                         fontWeight: FontWeight.w600,
@@ -55,7 +55,7 @@ class ProfileRateSection extends StatelessWidget {
               crossAxisAlignment: CrossAxisAlignment.start,
               children: [
                 GradientText(
-                  L10nService.get('profile.profile_rate.enjoying_innercycles', language),
+                  L10nService.get(L10nKeys.profileProfileRateEnjoyingInnercycles, language),
                   variant: GradientTextVariant.gold,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 15,
@@ -64,7 +64,7 @@ class ProfileRateSection extends StatelessWidget {
                 ),
                 const SizedBox(height: 2),
                 Text(
-                  L10nService.get('profile.profile_rate.a_quick_rating_helps_us_grow', language),
+                  L10nService.get(L10nKeys.profileProfileRateAQuickRatingHelpsUsGrow, language),
                   style: AppTypography.subtitle(
                     fontSize: 13,
                     color: isDark
@@ -106,7 +106,7 @@ class ProfileRateSection extends StatelessWidget {
                 ],
               ),
               child: Text(
-                L10nService.get('profile.profile_rate.rate', language),
+                L10nService.get(L10nKeys.profileProfileRateRate, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
                   fontWeight: FontWeight.w700,
@@ -30,7 +30,7 @@ class ProfileReferralSection extends ConsumerWidget {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('profile.profile_referral.invite_earn', language),
+          L10nService.get(L10nKeys.profileProfileReferralInviteEarn, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 17,
@@ -41,7 +41,7 @@ class ProfileReferralSection extends ConsumerWidget {
         const SizedBox(height: AppConstants.spacingMd),
         Semantics(
           button: true,
-          label: L10nService.get('profile.profile_referral.open_referral_program', language),
+          label: L10nService.get(L10nKeys.profileProfileReferralOpenReferralProgram, language),
           child: GestureDetector(
             onTap: () => context.push(Routes.referralProgram),
             behavior: HitTestBehavior.opaque,
@@ -57,7 +57,7 @@ class ProfileReferralSection extends ConsumerWidget {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         Text(
-                          L10nService.get('profile.profile_referral.invite_friends_get_premium', language),
+                          L10nService.get(L10nKeys.profileProfileReferralInviteFriendsGetPremium, language),
                           style: AppTypography.subtitle(
                             fontSize: 14,
                             color: isDark
@@ -76,7 +76,7 @@ class ProfileReferralSection extends ConsumerWidget {
                                   ? (isEn
                                       ? '$count friend${count == 1 ? '' : 's'} invited'
                                       : '$count arkadaş davet edildi')
-                                  : (L10nService.get('profile.profile_referral.7_days_free_for_each_friend', language)),
+                                  : (L10nService.get(L10nKeys.profileProfileReferral7DaysFreeForEachFriend, language)),
                               style: AppTypography.subtitle(
                                 fontSize: 12,
                                 color: isDark
@@ -34,7 +34,7 @@ class ProfileSettingsSection extends StatelessWidget {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('profile.profile_settings.settings', language),
+          L10nService.get(L10nKeys.profileProfileSettingsSettings, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 17,
@@ -59,7 +59,7 @@ class ProfileSettingsSection extends StatelessWidget {
                     child: Column(
                       children: [
                         GradientText(
-                          L10nService.get('profile.profile_settings.unlock_full_potential', language),
+                          L10nService.get(L10nKeys.profileProfileSettingsUnlockFullPotential, language),
                           variant: GradientTextVariant.gold,
                           style: AppTypography.displayFont.copyWith(
                             fontSize: 16,
@@ -68,7 +68,7 @@ class ProfileSettingsSection extends StatelessWidget {
                         ),
                         const SizedBox(height: AppConstants.spacingMd),
                         GradientButton.gold(
-                          label: L10nService.get('profile.profile_settings.go_premium', language),
+                          label: L10nService.get(L10nKeys.profileProfileSettingsGoPremium, language),
                           expanded: true,
                           onPressed: () => context.push(Routes.premium),
                         ),
@@ -82,28 +82,28 @@ class ProfileSettingsSection extends StatelessWidget {
               // Setting rows
               _SettingRow(
                 emoji: '\u{1F514}',
-                label: L10nService.get('profile.profile_settings.notifications', language),
+                label: L10nService.get(L10nKeys.profileProfileSettingsNotifications, language),
                 isDark: isDark,
                 onTap: () => context.push(Routes.notifications),
               ),
               _buildDivider(),
               _SettingRow(
                 emoji: '\u{2699}\u{FE0F}',
-                label: L10nService.get('profile.profile_settings.settings_1', language),
+                label: L10nService.get(L10nKeys.profileProfileSettingsSettings1, language),
                 isDark: isDark,
                 onTap: () => context.push(Routes.settings),
               ),
               _buildDivider(),
               _SettingRow(
                 emoji: '\u{1F4E4}',
-                label: L10nService.get('profile.profile_settings.export_data', language),
+                label: L10nService.get(L10nKeys.profileProfileSettingsExportData, language),
                 isDark: isDark,
                 onTap: () => context.push(Routes.exportData),
               ),
               _buildDivider(),
               _SettingRow(
                 emoji: '\u{1F464}',
-                label: L10nService.get('profile.profile_settings.edit_profile', language),
+                label: L10nService.get(L10nKeys.profileProfileSettingsEditProfile, language),
                 isDark: isDark,
                 onTap: () => context.push(Routes.profile),
               ),
@@ -46,13 +46,13 @@ class ProfileStatsDashboard extends StatelessWidget {
       _StatColumn(
         emoji: '\u{1F525}',
         value: '$streak',
-        label: L10nService.get('profile.profile_stats_dashboard.streak', language),
+        label: L10nService.get(L10nKeys.profileProfileStatsDashboardStreak, language),
         color: AppColors.streakOrange,
       ),
       _StatColumn(
         emoji: '\u{1F4D3}',
         value: '$entries',
-        label: L10nService.get('profile.profile_stats_dashboard.entries', language),
+        label: L10nService.get(L10nKeys.profileProfileStatsDashboardEntries, language),
         color: AppColors.auroraStart,
       ),
       _StatColumn(
@@ -60,13 +60,13 @@ class ProfileStatsDashboard extends StatelessWidget {
         value: totalWords >= 1000
             ? '${(totalWords / 1000).toStringAsFixed(1)}K'
             : '$totalWords',
-        label: L10nService.get('profile.profile_stats_dashboard.words', language),
+        label: L10nService.get(L10nKeys.profileProfileStatsDashboardWords, language),
         color: AppColors.starGold,
       ),
       _StatColumn(
         emoji: '\u{1F3C6}',
         value: '$challenges',
-        label: L10nService.get('profile.profile_stats_dashboard.done', language),
+        label: L10nService.get(L10nKeys.profileProfileStatsDashboardDone, language),
         color: AppColors.amethyst,
       ),
     ];
@@ -80,7 +80,7 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
       children: [
         // Section header
         GradientText(
-          L10nService.get('profile.profile_tools_grid.tools', language),
+          L10nService.get(L10nKeys.profileProfileToolsGridTools, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 17,
@@ -135,7 +135,7 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('profile.profile_tools_grid.suggested_for_you', language),
+          L10nService.get(L10nKeys.profileProfileToolsGridSuggestedForYou, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 15,
@@ -244,7 +244,7 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
               : AppColors.lightTextPrimary,
         ),
         decoration: InputDecoration(
-          hintText: L10nService.get('profile.profile_tools_grid.search_by_name_or_category', language),
+          hintText: L10nService.get(L10nKeys.profileProfileToolsGridSearchByNameOrCategory, language),
           hintStyle: AppTypography.subtitle(
             color: widget.isDark
                 ? AppColors.textMuted
@@ -259,7 +259,7 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
           ),
           suffixIcon: _searchController.text.isNotEmpty
               ? IconButton(
-                  tooltip: L10nService.get('profile.profile_tools_grid.clear_search', language),
+                  tooltip: L10nService.get(L10nKeys.profileProfileToolsGridClearSearch, language),
                   onPressed: () {
                     _searchController.clear();
                     setState(() => _searchQuery = '');
@@ -296,7 +296,7 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
       child: Row(
         children: [
           _buildChip(
-            L10nService.get('profile.profile_tools_grid.all', language),
+            L10nService.get(L10nKeys.profileProfileToolsGridAll, language),
             isActive: isAll,
             onTap: () => setState(() {
               _selectedCategory = null;
@@ -305,7 +305,7 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
           ),
           const SizedBox(width: AppConstants.spacingSm),
           _buildChip(
-            L10nService.get('profile.profile_tools_grid.favorites_u2b50', language),
+            L10nService.get(L10nKeys.profileProfileToolsGridFavoritesU2b50, language),
             isActive: _isFavoritesFilter,
             onTap: () => setState(() {
               _isFavoritesFilter = true;
@@ -463,8 +463,8 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
           const SizedBox(height: AppConstants.spacingLg),
           Text(
             _isFavoritesFilter
-                ? (L10nService.get('profile.profile_tools_grid.no_favorites_yet', language))
-                : (L10nService.get('profile.profile_tools_grid.no_tools_found', language)),
+                ? (L10nService.get(L10nKeys.profileProfileToolsGridNoFavoritesYet, language))
+                : (L10nService.get(L10nKeys.profileProfileToolsGridNoToolsFound, language)),
             style: AppTypography.displayFont.copyWith(
               fontSize: 18,
               fontWeight: FontWeight.w600,
@@ -493,17 +493,17 @@ class _ProfileToolsGridState extends ConsumerState<ProfileToolsGrid> {
   String _categoryLabel(ToolCategory category, AppLanguage language) {
     switch (category) {
       case ToolCategory.journal:
-        return L10nService.get('profile.profile_tools_grid.journal', language);
+        return L10nService.get(L10nKeys.profileProfileToolsGridJournal, language);
       case ToolCategory.analysis:
-        return L10nService.get('profile.profile_tools_grid.analysis', language);
+        return L10nService.get(L10nKeys.profileProfileToolsGridAnalysis, language);
       case ToolCategory.discovery:
-        return L10nService.get('profile.profile_tools_grid.discovery', language);
+        return L10nService.get(L10nKeys.profileProfileToolsGridDiscovery, language);
       case ToolCategory.support:
-        return L10nService.get('profile.profile_tools_grid.support', language);
+        return L10nService.get(L10nKeys.profileProfileToolsGridSupport, language);
       case ToolCategory.reference:
-        return L10nService.get('profile.profile_tools_grid.reference', language);
+        return L10nService.get(L10nKeys.profileProfileToolsGridReference, language);
       case ToolCategory.data:
-        return L10nService.get('profile.profile_tools_grid.data', language);
+        return L10nService.get(L10nKeys.profileProfileToolsGridData, language);
     }
   }
 }
@@ -648,8 +648,8 @@ class _ProfileToolCard extends StatelessWidget {
                             Semantics(
                               button: true,
                               label: isFavorite
-                                  ? (L10nService.get('profile.profile_tools_grid.remove_from_favorites', language))
-                                  : (L10nService.get('profile.profile_tools_grid.add_to_favorites', language)),
+                                  ? (L10nService.get(L10nKeys.profileProfileToolsGridRemoveFromFavorites, language))
+                                  : (L10nService.get(L10nKeys.profileProfileToolsGridAddToFavorites, language)),
                               child: GestureDetector(
                                 onTap: onFavoriteToggle,
                                 behavior: HitTestBehavior.opaque,
@@ -30,7 +30,7 @@ class ProfileVaultSection extends ConsumerWidget {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('profile.profile_vault.vault_security', language),
+          L10nService.get(L10nKeys.profileProfileVaultVaultSecurity, language),
           variant: GradientTextVariant.amethyst,
           style: AppTypography.elegantAccent(
             fontSize: 17,
@@ -47,7 +47,7 @@ class ProfileVaultSection extends ConsumerWidget {
               // Private Vault
               _VaultRow(
                 emoji: '\u{1F510}',
-                label: L10nService.get('profile.profile_vault.private_vault', language),
+                label: L10nService.get(L10nKeys.profileProfileVaultPrivateVault, language),
                 isDark: isDark,
                 onTap: () => _navigateToVault(context, ref),
               ),
@@ -70,7 +70,7 @@ class ProfileVaultSection extends ConsumerWidget {
               // App Lock
               _VaultRow(
                 emoji: '\u{1F512}',
-                label: L10nService.get('profile.profile_vault.app_lock', language),
+                label: L10nService.get(L10nKeys.profileProfileVaultAppLock, language),
                 isDark: isDark,
                 onTap: () => context.push(Routes.appLock),
               ),
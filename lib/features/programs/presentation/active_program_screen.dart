@@ -73,7 +73,7 @@ class _ActiveProgramScreenState extends ConsumerState<ActiveProgramScreen> {
                       icon: Icon(Icons.refresh_rounded,
                           size: 16, color: AppColors.starGold),
                       label: Text(
-                        L10nService.get('programs.active_program.retry', language),
+                        L10nService.get(L10nKeys.programsActiveProgramRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -192,7 +192,7 @@ class _ActiveProgramScreenState extends ConsumerState<ActiveProgramScreen> {
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(
           content: Text(
-            L10nService.getWithParams('programs.day_complete', language, params: {'day': '$dayNumber'}),
+            L10nService.getWithParams(L10nKeys.programsDayComplete, language, params: {'day': '$dayNumber'}),
           ),
           backgroundColor: AppColors.success,
           behavior: SnackBarBehavior.floating,
@@ -249,13 +249,13 @@ class _ProgramHeader extends StatelessWidget {
             mainAxisAlignment: MainAxisAlignment.center,
             children: [
               _MiniStat(
-                label: L10nService.get('programs.active_program.duration', language),
-                value: '${program.durationDays} ${L10nService.get('programs.active_program.days', language)}',
+                label: L10nService.get(L10nKeys.programsActiveProgramDuration, language),
+                value: '${program.durationDays} ${L10nService.get(L10nKeys.programsActiveProgramDays, language)}',
                 isDark: isDark,
               ),
               const SizedBox(width: 24),
               _MiniStat(
-                label: L10nService.get('programs.active_program.completed', language),
+                label: L10nService.get(L10nKeys.programsActiveProgramCompleted, language),
                 value: '$completed / ${program.durationDays}',
                 isDark: isDark,
               ),
@@ -407,7 +407,7 @@ class _TodayPromptCard extends StatelessWidget {
                   borderRadius: BorderRadius.circular(8),
                 ),
                 child: Text(
-                  '${L10nService.get('programs.active_program.day', language)} ${day.dayNumber}',
+                  '${L10nService.get(L10nKeys.programsActiveProgramDay, language)} ${day.dayNumber}',
                   style: AppTypography.elegantAccent(
                     fontSize: 12,
                     fontWeight: FontWeight.w700,
@@ -476,7 +476,7 @@ class _ReflectionInput extends StatelessWidget {
           color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
         ),
         decoration: InputDecoration(
-          hintText: L10nService.get('programs.active_program.write_your_reflection_here_optional', language),
+          hintText: L10nService.get(L10nKeys.programsActiveProgramWriteYourReflectionHereOptional, language),
           hintStyle: AppTypography.subtitle(
             color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
           ),
@@ -513,8 +513,8 @@ class _CompleteButton extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientButton(
       label: isAlreadyDone
-          ? (L10nService.get('programs.active_program.completed_1', language))
-          : (L10nService.get('programs.active_program.complete_today', language)),
+          ? (L10nService.get(L10nKeys.programsActiveProgramCompleted1, language))
+          : (L10nService.get(L10nKeys.programsActiveProgramCompleteToday, language)),
       onPressed: isAlreadyDone ? null : onComplete,
       expanded: true,
       gradient: LinearGradient(
@@ -556,7 +556,7 @@ class _CompletedBanner extends StatelessWidget {
               ),
               const SizedBox(height: 12),
               GradientText(
-                L10nService.get('programs.active_program.program_completed', language),
+                L10nService.get(L10nKeys.programsActiveProgramProgramCompleted, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 18,
@@ -565,7 +565,7 @@ class _CompletedBanner extends StatelessWidget {
               ),
               const SizedBox(height: 4),
               Text(
-                L10nService.get('programs.active_program.you_have_finished_this_guided_program_we', language),
+                L10nService.get(L10nKeys.programsActiveProgramYouHaveFinishedThisGuidedProgramWe, language),
                 textAlign: TextAlign.center,
                 style: AppTypography.decorativeScript(
                   fontSize: 14,
@@ -605,7 +605,7 @@ class _NotStartedBanner extends StatelessWidget {
         borderRadius: BorderRadius.circular(16),
       ),
       child: Text(
-        L10nService.get('programs.active_program.this_program_hasnt_been_started_yet', language),
+        L10nService.get(L10nKeys.programsActiveProgramThisProgramHasntBeenStartedYet, language),
         textAlign: TextAlign.center,
         style: AppTypography.decorativeScript(
           fontSize: 14,
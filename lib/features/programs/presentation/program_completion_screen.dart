@@ -75,7 +75,7 @@ class ProgramCompletionScreen extends ConsumerWidget {
 
                 // Congratulations heading in gold
                 GradientText(
-                  L10nService.get('programs.program_completion.congratulations', language),
+                  L10nService.get(L10nKeys.programsProgramCompletionCongratulations, language),
                   variant: GradientTextVariant.gold,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 32,
@@ -123,7 +123,7 @@ class ProgramCompletionScreen extends ConsumerWidget {
 
                       // Certificate title
                       GradientText(
-                        L10nService.get('programs.program_completion.certificate_of_completion', language),
+                        L10nService.get(L10nKeys.programsProgramCompletionCertificateOfCompletion, language),
                         variant: GradientTextVariant.gold,
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 18,
@@ -156,9 +156,9 @@ class ProgramCompletionScreen extends ConsumerWidget {
                       // Duration completed
                       _CertificateRow(
                         icon: Icons.calendar_today_rounded,
-                        label: L10nService.get('programs.program_completion.duration', language),
+                        label: L10nService.get(L10nKeys.programsProgramCompletionDuration, language),
                         value:
-                            '$durationDays ${L10nService.get('programs.program_completion.days_of_reflection', language)}',
+                            '$durationDays ${L10nService.get(L10nKeys.programsProgramCompletionDaysOfReflection, language)}',
                         isDark: isDark,
                       ),
                       const SizedBox(height: AppConstants.spacingMd),
@@ -166,7 +166,7 @@ class ProgramCompletionScreen extends ConsumerWidget {
                       // Days completed count
                       _CertificateRow(
                         icon: Icons.check_circle_rounded,
-                        label: L10nService.get('programs.program_completion.days_completed', language),
+                        label: L10nService.get(L10nKeys.programsProgramCompletionDaysCompleted, language),
                         value: '$completedDays / $durationDays',
                         isDark: isDark,
                       ),
@@ -175,7 +175,7 @@ class ProgramCompletionScreen extends ConsumerWidget {
                       // Date of completion
                       _CertificateRow(
                         icon: Icons.today_rounded,
-                        label: L10nService.get('programs.program_completion.completed_on', language),
+                        label: L10nService.get(L10nKeys.programsProgramCompletionCompletedOn, language),
                         value: _formatDate(DateTime.now(), isEn),
                         isDark: isDark,
                       ),
@@ -191,7 +191,7 @@ class ProgramCompletionScreen extends ConsumerWidget {
 
                       // Motivational note
                       Text(
-                        L10nService.get('programs.program_completion.every_day_of_reflection_is_a_step_toward', language),
+                        L10nService.get(L10nKeys.programsProgramCompletionEveryDayOfReflectionIsAStepToward, language),
                         textAlign: TextAlign.center,
                         style: AppTypography.decorativeScript(
                           fontSize: 13,
@@ -211,7 +211,7 @@ class ProgramCompletionScreen extends ConsumerWidget {
 
                 // Start Another Program button
                 GradientButton.gold(
-                  label: L10nService.get('programs.program_completion.start_another_program', language),
+                  label: L10nService.get(L10nKeys.programsProgramCompletionStartAnotherProgram, language),
                   onPressed: () => context.pushReplacement(Routes.programs),
                   expanded: true,
                 ),
@@ -219,7 +219,7 @@ class ProgramCompletionScreen extends ConsumerWidget {
 
                 // Back to Home button
                 GradientOutlinedButton(
-                  label: L10nService.get('programs.program_completion.back_to_home', language),
+                  label: L10nService.get(L10nKeys.programsProgramCompletionBackToHome, language),
                   variant: GradientTextVariant.aurora,
                   expanded: true,
                   fontSize: 16,
@@ -47,7 +47,7 @@ class ProgramListScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('programs.program_list.guided_programs', language),
+                  title: L10nService.get(L10nKeys.programsProgramListGuidedPrograms, language),
                 ),
                 SliverPadding(
                   padding: const EdgeInsets.all(16),
@@ -62,7 +62,7 @@ class ProgramListScreen extends ConsumerWidget {
                           children: [
                             const SizedBox(height: 40),
                             Text(
-                              L10nService.get('programs.program_list.could_not_load_your_local_data_is_unaffe', language),
+                              L10nService.get(L10nKeys.programsProgramListCouldNotLoadYourLocalDataIsUnaffe, language),
                               textAlign: TextAlign.center,
                               style: AppTypography.subtitle(
                                 color: isDark
@@ -80,7 +80,7 @@ class ProgramListScreen extends ConsumerWidget {
                                 color: AppColors.starGold,
                               ),
                               label: Text(
-                                L10nService.get('programs.program_list.retry', language),
+                                L10nService.get(L10nKeys.programsProgramListRetry, language),
                                 style: AppTypography.elegantAccent(
                                   fontSize: 13,
                                   fontWeight: FontWeight.w600,
@@ -98,7 +98,7 @@ class ProgramListScreen extends ConsumerWidget {
                         delegate: SliverChildListDelegate([
                           // Intro text
                           Text(
-                            L10nService.get('programs.program_list.structured_reflection_journeys_to_deepen', language),
+                            L10nService.get(L10nKeys.programsProgramListStructuredReflectionJourneysToDeepen, language),
                             style: AppTypography.decorativeScript(
                               fontSize: 14,
                               color: isDark
@@ -111,7 +111,7 @@ class ProgramListScreen extends ConsumerWidget {
                           // Active programs section
                           if (service.activeProgramCount > 0) ...[
                             GradientText(
-                              L10nService.get('programs.program_list.in_progress', language),
+                              L10nService.get(L10nKeys.programsProgramListInProgress, language),
                               variant: GradientTextVariant.aurora,
                               style: AppTypography.displayFont.copyWith(
                                 fontSize: 16,
@@ -143,7 +143,7 @@ class ProgramListScreen extends ConsumerWidget {
 
                           // All programs
                           GradientText(
-                            L10nService.get('programs.program_list.all_programs', language),
+                            L10nService.get(L10nKeys.programsProgramListAllPrograms, language),
                             variant: GradientTextVariant.gold,
                             style: AppTypography.displayFont.copyWith(
                               fontSize: 16,
@@ -377,7 +377,7 @@ class _ProgramCard extends StatelessWidget {
                                 borderRadius: BorderRadius.circular(8),
                               ),
                               child: Text(
-                                L10nService.get('programs.program_list.free', language),
+                                L10nService.get(L10nKeys.programsProgramListFree, language),
                                 style: AppTypography.elegantAccent(
                                   fontSize: 10,
                                   fontWeight: FontWeight.w700,
@@ -430,7 +430,7 @@ class _ProgramCard extends StatelessWidget {
                       ] else if (!isCompleted && !isLocked) ...[
                         const SizedBox(height: 4),
                         Text(
-                          '${program.durationDays} ${L10nService.get('programs.program_list.days', language)}',
+                          '${program.durationDays} ${L10nService.get(L10nKeys.programsProgramListDays, language)}',
                           style: AppTypography.elegantAccent(
                             fontSize: 11,
                             color: AppColors.auroraStart,
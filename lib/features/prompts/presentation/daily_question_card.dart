@@ -49,7 +49,7 @@ class DailyQuestionCard extends ConsumerWidget {
 
         return Semantics(
           label:
-              '${L10nService.get('prompts.daily_question.question_of_the_day', language)}: $questionText',
+              '${L10nService.get(L10nKeys.promptsDailyQuestionQuestionOfTheDay, language)}: $questionText',
           child: Padding(
             padding: const EdgeInsets.fromLTRB(20, 0, 20, 20),
             child: PremiumCard(
@@ -96,7 +96,7 @@ class DailyQuestionCard extends ConsumerWidget {
                       Text(
                         isAI
                             ? (isEn ? 'PERSONALIZED FOR YOU' : 'SENİN İÇİN KİŞİSELLEŞTİRİLDİ')
-                            : L10nService.get('prompts.daily_question.question_of_the_day_1', language),
+                            : L10nService.get(L10nKeys.promptsDailyQuestionQuestionOfTheDay1, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 10,
                           color: AppColors.amethyst.withValues(alpha: 0.6),
@@ -111,7 +111,7 @@ class DailyQuestionCard extends ConsumerWidget {
                     children: [
                       Expanded(
                         child: GradientOutlinedButton(
-                          label: L10nService.get('prompts.daily_question.write', language),
+                          label: L10nService.get(L10nKeys.promptsDailyQuestionWrite, language),
                           icon: Icons.edit_note_rounded,
                           variant: GradientTextVariant.aurora,
                           fontSize: 13,
@@ -132,7 +132,7 @@ class DailyQuestionCard extends ConsumerWidget {
                       const SizedBox(width: 10),
                       Expanded(
                         child: GradientOutlinedButton(
-                          label: L10nService.get('prompts.daily_question.share', language),
+                          label: L10nService.get(L10nKeys.promptsDailyQuestionShare, language),
                           icon: Icons.share_rounded,
                           variant: GradientTextVariant.amethyst,
                           fontSize: 13,
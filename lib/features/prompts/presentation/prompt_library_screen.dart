@@ -63,7 +63,7 @@ class PromptLibraryScreen extends ConsumerWidget {
                   icon: Icon(Icons.refresh_rounded,
                       size: 16, color: AppColors.starGold),
                   label: Text(
-                    L10nService.get('prompts.prompt_library.retry', language),
+                    L10nService.get(L10nKeys.promptsPromptLibraryRetry, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -134,7 +134,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
           ),
           slivers: [
             GlassSliverAppBar(
-              title: L10nService.get('prompts.prompt_library.prompt_library', language),
+              title: L10nService.get(L10nKeys.promptsPromptLibraryPromptLibrary, language),
             ),
             SliverToBoxAdapter(
               child: Padding(
@@ -225,7 +225,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
             mainAxisAlignment: MainAxisAlignment.spaceBetween,
             children: [
               GradientText(
-                L10nService.get('prompts.prompt_library.your_progress', language),
+                L10nService.get(L10nKeys.promptsPromptLibraryYourProgress, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 16,
@@ -288,7 +288,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
                   borderRadius: BorderRadius.circular(20),
                 ),
                 child: Text(
-                  L10nService.get('prompts.todays_prompt', language),
+                  L10nService.get(L10nKeys.promptsTodaysPrompt, language),
                   style: AppTypography.elegantAccent(
                     fontSize: 12,
                     color: AppColors.starGold,
@@ -326,7 +326,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
           ),
           const SizedBox(height: 14),
           GradientButton.gold(
-            label: L10nService.get('prompts.prompt_library.start_writing', language),
+            label: L10nService.get(L10nKeys.promptsPromptLibraryStartWriting, language),
             onPressed: () {
               HapticFeedback.mediumImpact();
               service.markCompleted(prompt.id);
@@ -353,7 +353,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         children: [
-          _buildChip(null, L10nService.get('prompts.prompt_library.all', language)),
+          _buildChip(null, L10nService.get(L10nKeys.promptsPromptLibraryAll, language)),
           ...PromptCategory.values.map(
             (cat) => _buildChip(cat, _categoryLabel(cat)),
           ),
@@ -593,7 +593,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
                           ),
                           const SizedBox(width: 4),
                           Text(
-                            L10nService.get('prompts.prompt_library.completed', language),
+                            L10nService.get(L10nKeys.promptsPromptLibraryCompleted, language),
                             style: AppTypography.elegantAccent(
                               fontSize: 12,
                               color: AppColors.success,
@@ -625,7 +625,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
                     // Skip button
                     Expanded(
                       child: GradientOutlinedButton(
-                        label: L10nService.get('prompts.prompt_library.skip', language),
+                        label: L10nService.get(L10nKeys.promptsPromptLibrarySkip, language),
                         variant: GradientTextVariant.aurora,
                         expanded: true,
                         fontSize: 15,
@@ -646,7 +646,7 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
                     Expanded(
                       flex: 2,
                       child: GradientButton.gold(
-                        label: L10nService.get('prompts.prompt_library.start_writing_1', language),
+                        label: L10nService.get(L10nKeys.promptsPromptLibraryStartWriting1, language),
                         onPressed: () {
                           HapticFeedback.mediumImpact();
                           service.markCompleted(prompt.id);
@@ -677,13 +677,13 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
     switch (depth) {
       case PromptDepth.surface:
         color = AppColors.success;
-        label = L10nService.get('prompts.prompt_library.light', language);
+        label = L10nService.get(L10nKeys.promptsPromptLibraryLight, language);
       case PromptDepth.medium:
         color = AppColors.warning;
-        label = L10nService.get('prompts.prompt_library.medium', language);
+        label = L10nService.get(L10nKeys.promptsPromptLibraryMedium, language);
       case PromptDepth.deep:
         color = AppColors.amethyst;
-        label = L10nService.get('prompts.prompt_library.deep', language);
+        label = L10nService.get(L10nKeys.promptsPromptLibraryDeep, language);
     }
 
     return Container(
@@ -707,21 +707,21 @@ class _PromptLibraryContentState extends State<_PromptLibraryContent> {
     final language = AppLanguage.fromIsEn(isEn);
     switch (category) {
       case PromptCategory.selfDiscovery:
-        return L10nService.get('prompts.prompt_library.cycle_awareness', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryCycleAwareness, language);
       case PromptCategory.relationships:
-        return L10nService.get('prompts.prompt_library.relationships', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryRelationships, language);
       case PromptCategory.gratitude:
-        return L10nService.get('prompts.prompt_library.gratitude', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryGratitude, language);
       case PromptCategory.emotions:
-        return L10nService.get('prompts.prompt_library.emotions', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryEmotions, language);
       case PromptCategory.goals:
-        return L10nService.get('prompts.prompt_library.goals', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryGoals, language);
       case PromptCategory.recovery:
-        return L10nService.get('prompts.prompt_library.recovery', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryRecovery, language);
       case PromptCategory.creativity:
-        return L10nService.get('prompts.prompt_library.creativity', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryCreativity, language);
       case PromptCategory.mindfulness:
-        return L10nService.get('prompts.prompt_library.mindfulness', language);
+        return L10nService.get(L10nKeys.promptsPromptLibraryMindfulness, language);
     }
   }
 }
@@ -194,7 +194,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
       child: Row(
         children: [
           IconButton(
-            tooltip: L10nService.get('quiz.attachment_quiz.back', language),
+            tooltip: L10nService.get(L10nKeys.quizAttachmentQuizBack, language),
             onPressed: () {
               if (_currentPage > 0) {
                 _pageController.previousPage(
@@ -215,7 +215,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
           ),
           Expanded(
             child: Text(
-              L10nService.get('quiz.attachment_quiz.attachment_style', language),
+              L10nService.get(L10nKeys.quizAttachmentQuizAttachmentStyle, language),
               textAlign: TextAlign.center,
               style: AppTypography.displayFont.copyWith(
                 fontSize: 22,
@@ -450,7 +450,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
         ),
         slivers: [
           // App bar
-          GlassSliverAppBar(title: L10nService.get('quiz.attachment_quiz.your_reflection', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.quizAttachmentQuizYourReflection, language)),
 
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -471,7 +471,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
                 // Strengths
                 _buildListSection(
                   context,
-                  title: L10nService.get('quiz.attachment_quiz.your_strengths', language),
+                  title: L10nService.get(L10nKeys.quizAttachmentQuizYourStrengths, language),
                   items: style.localizedStrengths(language),
                   icon: Icons.star_rounded,
                   color: AppColors.starGold,
@@ -482,7 +482,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
                 // Growth areas
                 _buildListSection(
                   context,
-                  title: L10nService.get('quiz.attachment_quiz.growth_areas', language),
+                  title: L10nService.get(L10nKeys.quizAttachmentQuizGrowthAreas, language),
                   items: style.localizedGrowthAreas(language),
                   icon: Icons.spa_rounded,
                   color: AppColors.amethyst,
@@ -626,7 +626,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         Text(
-          L10nService.get('quiz.attachment_quiz.full_breakdown', language),
+          L10nService.get(L10nKeys.quizAttachmentQuizFullBreakdown, language),
           style: AppTypography.displayFont.copyWith(
             fontSize: 18,
             color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
@@ -785,7 +785,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
   Widget _buildShareButton(BuildContext context, bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientButton(
-      label: L10nService.get('quiz.attachment_quiz.share_your_result', language),
+      label: L10nService.get(L10nKeys.quizAttachmentQuizShareYourResult, language),
       icon: Icons.share_rounded,
       onPressed: () {
         if (_result == null) return;
@@ -806,7 +806,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
   Widget _buildGoDeeperButton(BuildContext context, bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientOutlinedButton(
-      label: L10nService.get('quiz.attachment_quiz.go_deeper_premium', language),
+      label: L10nService.get(L10nKeys.quizAttachmentQuizGoDeeperPremium, language),
       icon: Icons.auto_awesome,
       variant: GradientTextVariant.gold,
       expanded: true,
@@ -831,7 +831,7 @@ class _AttachmentQuizScreenState extends ConsumerState<AttachmentQuizScreen> {
       child: TextButton(
         onPressed: _restartQuiz,
         child: Text(
-          L10nService.get('quiz.attachment_quiz.retake_quiz', language),
+          L10nService.get(L10nKeys.quizAttachmentQuizRetakeQuiz, language),
           style: AppTypography.elegantAccent(
             fontSize: 15,
             color: AppColors.textSecondary,
@@ -209,7 +209,7 @@ class _GenericQuizScreenState extends ConsumerState<GenericQuizScreen> {
       child: Row(
         children: [
           IconButton(
-            tooltip: L10nService.get('quiz.generic_quiz.back', language),
+            tooltip: L10nService.get(L10nKeys.quizGenericQuizBack, language),
             onPressed: () {
               if (_currentPage > 0) {
                 _pageController.previousPage(
@@ -456,7 +456,7 @@ class _GenericQuizScreenState extends ConsumerState<GenericQuizScreen> {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('quiz.generic_quiz.your_result', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.quizGenericQuizYourResult, language)),
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
             sliver: SliverList(
@@ -490,7 +490,7 @@ class _GenericQuizScreenState extends ConsumerState<GenericQuizScreen> {
                 if (winningDim.strengthsEn.isNotEmpty) ...[
                   _buildListSection(
                     context,
-                    title: L10nService.get('quiz.generic_quiz.your_strengths', language),
+                    title: L10nService.get(L10nKeys.quizGenericQuizYourStrengths, language),
                     items: winningDim.localizedStrengths(language),
                     icon: Icons.star_rounded,
                     color: AppColors.starGold,
@@ -503,7 +503,7 @@ class _GenericQuizScreenState extends ConsumerState<GenericQuizScreen> {
                 if (winningDim.growthAreasEn.isNotEmpty) ...[
                   _buildListSection(
                     context,
-                    title: L10nService.get('quiz.generic_quiz.growth_areas', language),
+                    title: L10nService.get(L10nKeys.quizGenericQuizGrowthAreas, language),
                     items: winningDim.localizedGrowthAreas(language),
                     icon: Icons.spa_rounded,
                     color: AppColors.amethyst,
@@ -642,7 +642,7 @@ class _GenericQuizScreenState extends ConsumerState<GenericQuizScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         Text(
-          L10nService.get('quiz.generic_quiz.full_breakdown', language),
+          L10nService.get(L10nKeys.quizGenericQuizFullBreakdown, language),
           style: AppTypography.displayFont.copyWith(
             fontSize: 18,
             color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
@@ -802,7 +802,7 @@ class _GenericQuizScreenState extends ConsumerState<GenericQuizScreen> {
   Widget _buildRetakeButton(BuildContext context, bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientButton(
-      label: L10nService.get('quiz.generic_quiz.retake_quiz', language),
+      label: L10nService.get(L10nKeys.quizGenericQuizRetakeQuiz, language),
       icon: Icons.refresh_rounded,
       onPressed: _restartQuiz,
       expanded: true,
@@ -820,7 +820,7 @@ class _GenericQuizScreenState extends ConsumerState<GenericQuizScreen> {
       child: TextButton(
         onPressed: () => context.pushReplacement(Routes.quizHub),
         child: Text(
-          L10nService.get('quiz.generic_quiz.back_to_all_quizzes', language),
+          L10nService.get(L10nKeys.quizGenericQuizBackToAllQuizzes, language),
           style: AppTypography.elegantAccent(
             fontSize: 15,
             color: AppColors.textSecondary,
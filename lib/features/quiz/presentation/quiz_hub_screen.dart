@@ -46,7 +46,7 @@ class QuizHubScreen extends ConsumerWidget {
             ),
             slivers: [
               GlassSliverAppBar(
-                title: L10nService.get('quiz.quiz_hub.selfreflection_quizzes', language),
+                title: L10nService.get(L10nKeys.quizQuizHubSelfreflectionQuizzes, language),
               ),
               SliverPadding(
                 padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -54,7 +54,7 @@ class QuizHubScreen extends ConsumerWidget {
                   delegate: SliverChildListDelegate([
                     // Header description
                     Text(
-                          L10nService.get('quiz.quiz_hub.explore_different_aspects_of_yourself_th', language),
+                          L10nService.get(L10nKeys.quizQuizHubExploreDifferentAspectsOfYourselfTh, language),
                           style: AppTypography.decorativeScript(
                             fontSize: 15,
                             color: AppColors.textSecondary,
@@ -170,7 +170,7 @@ class _QuizCard extends StatelessWidget {
     return Semantics(
       button: true,
       label: quiz.localizedTitle(language),
-      hint: isCompleted ? (L10nService.get('quiz.quiz_hub.completed', language)) : null,
+      hint: isCompleted ? (L10nService.get(L10nKeys.quizQuizHubCompleted, language)) : null,
       child: GestureDetector(
         onTap: onTap,
         child: PremiumCard(
@@ -230,7 +230,7 @@ class _QuizCard extends StatelessWidget {
                               ),
                             ),
                             child: Text(
-                              L10nService.get('quiz.quiz_hub.completed_1', language),
+                              L10nService.get(L10nKeys.quizQuizHubCompleted1, language),
                               style: AppTypography.elegantAccent(
                                 fontSize: 11,
                                 color: AppColors.auroraStart,
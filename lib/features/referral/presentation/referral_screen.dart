@@ -64,15 +64,15 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
       _isApplying = false;
       switch (result) {
         case ReferralResult.success:
-          _applyMessage = L10nService.get('referral.referral.code_applied_you_earned_7_days_of_premiu', language);
+          _applyMessage = L10nService.get(L10nKeys.referralReferralCodeAppliedYouEarned7DaysOfPremiu, language);
           _codeController.clear();
           HapticService.featureUnlocked();
         case ReferralResult.ownCode:
-          _applyMessage = L10nService.get('referral.referral.you_cant_use_your_own_code', language);
+          _applyMessage = L10nService.get(L10nKeys.referralReferralYouCantUseYourOwnCode, language);
         case ReferralResult.alreadyUsed:
-          _applyMessage = L10nService.get('referral.referral.youve_already_used_a_referral_code', language);
+          _applyMessage = L10nService.get(L10nKeys.referralReferralYouveAlreadyUsedAReferralCode, language);
         case ReferralResult.invalidCode:
-          _applyMessage = L10nService.get('referral.referral.that_code_didnt_work_please_doublecheck', language);
+          _applyMessage = L10nService.get(L10nKeys.referralReferralThatCodeDidntWorkPleaseDoublecheck, language);
       }
     });
   }
@@ -94,7 +94,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
             ),
             slivers: [
               GlassSliverAppBar(
-                title: L10nService.get('referral.referral.invite_friends', language),
+                title: L10nService.get(L10nKeys.referralReferralInviteFriends, language),
               ),
               SliverPadding(
                 padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -160,7 +160,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
             .fadeIn(duration: 300.ms),
         const SizedBox(height: AppConstants.spacingMd),
         GradientText(
-          L10nService.get('referral.referral.give_7_days_get_7_days', language),
+          L10nService.get(L10nKeys.referralReferralGive7DaysGet7Days, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.displayFont.copyWith(
             fontSize: 24,
@@ -169,7 +169,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
         ).animate(delay: 100.ms).fadeIn(duration: 400.ms),
         const SizedBox(height: 8),
         Text(
-          L10nService.get('referral.referral.share_your_code_with_friends_when_they_j', language),
+          L10nService.get(L10nKeys.referralReferralShareYourCodeWithFriendsWhenTheyJ, language),
           textAlign: TextAlign.center,
           style: AppTypography.decorativeScript(
             fontSize: 14,
@@ -188,7 +188,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
       child: Column(
         children: [
           Text(
-            L10nService.get('referral.referral.your_invite_code', language),
+            L10nService.get(L10nKeys.referralReferralYourInviteCode, language),
             style: AppTypography.elegantAccent(
               fontSize: 12,
               letterSpacing: 2,
@@ -203,7 +203,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
               HapticFeedback.lightImpact();
               ScaffoldMessenger.of(context).showSnackBar(
                 SnackBar(
-                  content: Text(L10nService.get('referral.referral.referral_code_copied_share_it_with_a_fri', language)),
+                  content: Text(L10nService.get(L10nKeys.referralReferralReferralCodeCopiedShareItWithAFri, language)),
                   behavior: SnackBarBehavior.floating,
                   duration: const Duration(seconds: 2),
                   shape: RoundedRectangleBorder(
@@ -237,7 +237,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
           ),
           const SizedBox(height: 8),
           Text(
-            L10nService.get('referral.referral.tap_to_copy', language),
+            L10nService.get(L10nKeys.referralReferralTapToCopy, language),
             style: AppTypography.subtitle(
               fontSize: 11,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -255,7 +255,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
   Widget _buildShareButton(ReferralService service, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientButton.gold(
-      label: L10nService.get('referral.referral.share_invite_link', language),
+      label: L10nService.get(L10nKeys.referralReferralShareInviteLink, language),
       icon: Icons.share_rounded,
       expanded: true,
       onPressed: () {
@@ -277,19 +277,19 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
         children: [
           _StatCell(
             value: '${info.referralCount}',
-            label: L10nService.get('referral.referral.friends_invited', language),
+            label: L10nService.get(L10nKeys.referralReferralFriendsInvited, language),
             isDark: isDark,
           ),
           _divider(isDark),
           _StatCell(
             value: '${info.rewardDaysEarned}',
-            label: L10nService.get('referral.referral.days_earned', language),
+            label: L10nService.get(L10nKeys.referralReferralDaysEarned, language),
             isDark: isDark,
           ),
           _divider(isDark),
           _StatCell(
             value: info.hasActiveReward ? '${info.daysRemaining}d' : '—',
-            label: L10nService.get('referral.referral.days_left', language),
+            label: L10nService.get(L10nKeys.referralReferralDaysLeft, language),
             isDark: isDark,
           ),
         ],
@@ -314,7 +314,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('referral.referral.milestones', language),
+          L10nService.get(L10nKeys.referralReferralMilestones, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 15,
@@ -324,16 +324,16 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
         const SizedBox(height: AppConstants.spacingMd),
         _MilestoneRow(
           emoji: '\u{2B50}',
-          title: L10nService.get('referral.referral.3_friends', language),
-          subtitle: L10nService.get('referral.referral.1_month_free_premium', language),
+          title: L10nService.get(L10nKeys.referralReferral3Friends, language),
+          subtitle: L10nService.get(L10nKeys.referralReferral1MonthFreePremium, language),
           achieved: count >= 3,
           isDark: isDark,
         ),
         const SizedBox(height: 8),
         _MilestoneRow(
           emoji: '\u{1F48E}',
-          title: L10nService.get('referral.referral.10_friends', language),
-          subtitle: L10nService.get('referral.referral.lifetime_premium', language),
+          title: L10nService.get(L10nKeys.referralReferral10Friends, language),
+          subtitle: L10nService.get(L10nKeys.referralReferralLifetimePremium, language),
           achieved: count >= 10,
           isDark: isDark,
         ),
@@ -357,7 +357,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
             const SizedBox(width: 12),
             Expanded(
               child: Text(
-                L10nService.get('referral.referral.youve_already_used_a_referral_code_1', language),
+                L10nService.get(L10nKeys.referralReferralYouveAlreadyUsedAReferralCode1, language),
                 style: AppTypography.subtitle(
                   fontSize: 13,
                   color: isDark
@@ -375,7 +375,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('referral.referral.have_a_code', language),
+          L10nService.get(L10nKeys.referralReferralHaveACode, language),
           variant: GradientTextVariant.amethyst,
           style: AppTypography.elegantAccent(
             fontSize: 15,
@@ -402,7 +402,7 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
                 ),
                 decoration: InputDecoration(
                   counterText: '',
-                  hintText: L10nService.get('referral.referral.paste_your_referral_code', language),
+                  hintText: L10nService.get(L10nKeys.referralReferralPasteYourReferralCode, language),
                   hintStyle: AppTypography.subtitle(
                     fontSize: 18,
                     color: isDark
@@ -430,8 +430,8 @@ class _ReferralScreenState extends ConsumerState<ReferralScreen> {
               const SizedBox(height: 12),
               GradientButton.gold(
                 label: _isApplying
-                    ? (L10nService.get('referral.referral.applying', language))
-                    : (L10nService.get('referral.referral.apply_code', language)),
+                    ? (L10nService.get(L10nKeys.referralReferralApplying, language))
+                    : (L10nService.get(L10nKeys.referralReferralApplyCode, language)),
                 expanded: true,
                 onPressed:
                     _isApplying ? null : () => _applyCode(service, isEn),
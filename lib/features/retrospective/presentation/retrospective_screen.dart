@@ -182,7 +182,7 @@ class _StepIndicator extends StatelessWidget {
   Widget build(BuildContext context) {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
-      label: L10nService.getWithParams('retrospective.step_indicator', language, params: {'current': '${currentStep + 1}', 'total': '4'}),
+      label: L10nService.getWithParams(L10nKeys.retrospectiveStepIndicator, language, params: {'current': '${currentStep + 1}', 'total': '4'}),
       child: Padding(
         padding: const EdgeInsets.symmetric(horizontal: 40, vertical: 12),
         child: Row(
@@ -240,7 +240,7 @@ class _WelcomeStep extends StatelessWidget {
           ),
           const SizedBox(height: 32),
           GradientText(
-            L10nService.get('retrospective.retrospective.your_story_didnt_start_today', language),
+            L10nService.get(L10nKeys.retrospectiveRetrospectiveYourStoryDidntStartToday, language),
             variant: GradientTextVariant.aurora,
             textAlign: TextAlign.center,
             style: AppTypography.displayFont.copyWith(
@@ -250,7 +250,7 @@ class _WelcomeStep extends StatelessWidget {
           ).animate().fadeIn(delay: 200.ms, duration: 400.ms),
           const SizedBox(height: 16),
           Text(
-            L10nService.get('retrospective.retrospective.add_journal_entries_for_the_most_meaning', language),
+            L10nService.get(L10nKeys.retrospectiveRetrospectiveAddJournalEntriesForTheMostMeaning, language),
             textAlign: TextAlign.center,
             style: AppTypography.decorativeScript(
               fontSize: 16,
@@ -261,7 +261,7 @@ class _WelcomeStep extends StatelessWidget {
           ).animate().fadeIn(delay: 350.ms, duration: 400.ms),
           const SizedBox(height: 48),
           GradientButton.gold(
-            label: L10nService.get('retrospective.retrospective.lets_begin', language),
+            label: L10nService.get(L10nKeys.retrospectiveRetrospectiveLetsBegin, language),
             onPressed: () {
               HapticService.buttonPress();
               onContinue();
@@ -301,7 +301,7 @@ class _DaySelectionStep extends StatelessWidget {
         Padding(
           padding: const EdgeInsets.fromLTRB(20, 8, 20, 4),
           child: GradientText(
-            L10nService.get('retrospective.retrospective.choose_the_days_that_matter_to_you', language),
+            L10nService.get(L10nKeys.retrospectiveRetrospectiveChooseTheDaysThatMatterToYou, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 18,
@@ -337,7 +337,7 @@ class _DaySelectionStep extends StatelessWidget {
                       final selected = selectedPresets.contains(preset.key);
                       return Semantics(
                         label:
-                            '${preset.localizedName(language)}, ${selected ? (L10nService.get('retrospective.retrospective.selected', language)) : (L10nService.get('retrospective.retrospective.not_selected', language))}',
+                            '${preset.localizedName(language)}, ${selected ? (L10nService.get(L10nKeys.retrospectiveRetrospectiveSelected, language)) : (L10nService.get(L10nKeys.retrospectiveRetrospectiveNotSelected, language))}',
                         button: true,
                         selected: selected,
                         child: GestureDetector(
@@ -462,7 +462,7 @@ class _DateEntryStep extends StatelessWidget {
         Padding(
           padding: const EdgeInsets.fromLTRB(20, 8, 20, 4),
           child: GradientText(
-            L10nService.get('retrospective.retrospective.when_did_these_happen', language),
+            L10nService.get(L10nKeys.retrospectiveRetrospectiveWhenDidTheseHappen, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 18,
@@ -523,7 +523,7 @@ class _DateEntryStep extends StatelessWidget {
                             child: GradientOutlinedButton(
                               label: date != null
                                   ? '${date.day}.${date.month}.${date.year}'
-                                  : (L10nService.get('retrospective.retrospective.pick_a_date', language)),
+                                  : (L10nService.get(L10nKeys.retrospectiveRetrospectivePickADate, language)),
                               icon: Icons.calendar_today,
                               variant: GradientTextVariant.gold,
                               expanded: true,
@@ -608,7 +608,7 @@ class _SummaryStep extends StatelessWidget {
           ),
           const SizedBox(height: 32),
           GradientText(
-            L10nService.getWithParams('retrospective.memories_saved', language, params: {'count': '$savedCount'}),
+            L10nService.getWithParams(L10nKeys.retrospectiveMemoriesSaved, language, params: {'count': '$savedCount'}),
             variant: GradientTextVariant.aurora,
             textAlign: TextAlign.center,
             style: AppTypography.displayFont.copyWith(
@@ -618,7 +618,7 @@ class _SummaryStep extends StatelessWidget {
           ).animate().fadeIn(delay: 200.ms, duration: 400.ms),
           const SizedBox(height: 16),
           Text(
-            L10nService.get('retrospective.retrospective.your_past_is_now_part_of_your_journey_co', language),
+            L10nService.get(L10nKeys.retrospectiveRetrospectiveYourPastIsNowPartOfYourJourneyCo, language),
             textAlign: TextAlign.center,
             style: AppTypography.decorativeScript(
               fontSize: 16,
@@ -629,7 +629,7 @@ class _SummaryStep extends StatelessWidget {
           ).animate().fadeIn(delay: 350.ms, duration: 400.ms),
           const SizedBox(height: 48),
           GradientButton.gold(
-            label: L10nService.get('retrospective.retrospective.back_to_home', language),
+            label: L10nService.get(L10nKeys.retrospectiveRetrospectiveBackToHome, language),
             onPressed: () {
               HapticService.buttonPress();
               onDone();
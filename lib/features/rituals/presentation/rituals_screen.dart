@@ -58,7 +58,7 @@ class _RitualsScreenState extends ConsumerState<RitualsScreen> {
               ),
               keyboardDismissBehavior: ScrollViewKeyboardDismissBehavior.onDrag,
               slivers: [
-                GlassSliverAppBar(title: L10nService.get('rituals.rituals.my_rituals', language)),
+                GlassSliverAppBar(title: L10nService.get(L10nKeys.ritualsRitualsMyRituals, language)),
                 SliverPadding(
                   padding: const EdgeInsets.all(AppConstants.spacingLg),
                   sliver: stacksAsync.when(
@@ -88,7 +88,7 @@ class _RitualsScreenState extends ConsumerState<RitualsScreen> {
                                 icon: Icon(Icons.refresh_rounded,
                                     size: 16, color: AppColors.starGold),
                                 label: Text(
-                                  L10nService.get('rituals.rituals.retry', language),
+                                  L10nService.get(L10nKeys.ritualsRitualsRetry, language),
                                   style: AppTypography.elegantAccent(
                                     fontSize: 13,
                                     fontWeight: FontWeight.w600,
@@ -255,10 +255,10 @@ class _EmptyState extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.playlist_add_check_rounded,
-      title: L10nService.get('rituals.rituals.your_ritual_practice_starts_here', language),
-      description: L10nService.get('rituals.rituals.create_your_first_daily_ritual_to_start', language),
+      title: L10nService.get(L10nKeys.ritualsRitualsYourRitualPracticeStartsHere, language),
+      description: L10nService.get(L10nKeys.ritualsRitualsCreateYourFirstDailyRitualToStart, language),
       gradientVariant: GradientTextVariant.aurora,
-      ctaLabel: L10nService.get('rituals.rituals.create_ritual', language),
+      ctaLabel: L10nService.get(L10nKeys.ritualsRitualsCreateRitual, language),
       onCtaPressed: () => context.push(Routes.ritualCreate),
     );
   }
@@ -306,7 +306,7 @@ class _StackCard extends ConsumerWidget {
                         ),
                       ),
                       Text(
-                        '${stack.items.length} ${L10nService.get('rituals.rituals.items', language)}',
+                        '${stack.items.length} ${L10nService.get(L10nKeys.ritualsRitualsItems, language)}',
                         style: AppTypography.elegantAccent(
                           fontSize: 12,
                           color: isDark
@@ -318,7 +318,7 @@ class _StackCard extends ConsumerWidget {
                   ),
                 ),
                 IconButton(
-                  tooltip: L10nService.get('rituals.rituals.delete_ritual', language),
+                  tooltip: L10nService.get(L10nKeys.ritualsRitualsDeleteRitual, language),
                   onPressed: () => _confirmDelete(context, ref),
                   icon: Icon(
                     Icons.delete_outline,
@@ -366,12 +366,12 @@ class _StackCard extends ConsumerWidget {
     HapticFeedback.mediumImpact();
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('rituals.rituals.delete_ritual_1', language),
+      title: L10nService.get(L10nKeys.ritualsRitualsDeleteRitual1, language),
       message: isEn
           ? 'This will delete "${stack.name}" and all its completion history.'
           : '"${stack.name}" ve tüm tamamlama geçmişi silinecek.',
-      cancelLabel: L10nService.get('rituals.rituals.cancel', language),
-      confirmLabel: L10nService.get('rituals.rituals.delete', language),
+      cancelLabel: L10nService.get(L10nKeys.ritualsRitualsCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.ritualsRitualsDelete, language),
       isDestructive: true,
     );
 
@@ -397,7 +397,7 @@ class _AddButton extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return Center(
       child: GradientOutlinedButton(
-        label: L10nService.get('rituals.rituals.add_ritual', language),
+        label: L10nService.get(L10nKeys.ritualsRitualsAddRitual, language),
         icon: Icons.add,
         variant: GradientTextVariant.aurora,
         onPressed: () => context.push(Routes.ritualCreate),
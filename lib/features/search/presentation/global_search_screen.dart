@@ -192,7 +192,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
                                   : AppColors.lightTextPrimary,
                             ),
                             decoration: InputDecoration(
-                              hintText: L10nService.get('search.global_search.search_entries_notes_dreams', language),
+                              hintText: L10nService.get(L10nKeys.searchGlobalSearchSearchEntriesNotesDreams, language),
                               hintStyle: AppTypography.subtitle(
                                 color: isDark
                                     ? AppColors.textMuted
@@ -213,7 +213,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
                                             ? AppColors.textMuted
                                             : AppColors.lightTextMuted,
                                       ),
-                                      tooltip: L10nService.get('search.global_search.clear_search', language),
+                                      tooltip: L10nService.get(L10nKeys.searchGlobalSearchClearSearch, language),
                                       onPressed: () {
                                         _searchController.clear();
                                         setState(() {
@@ -240,7 +240,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
                       ),
                       const SizedBox(width: AppConstants.spacingSm),
                       IconButton(
-                        tooltip: L10nService.get('search.global_search.close_search', language),
+                        tooltip: L10nService.get(L10nKeys.searchGlobalSearchCloseSearch, language),
                         onPressed: () => Navigator.of(context).pop(),
                         icon: Icon(
                           Icons.close_rounded,
@@ -277,22 +277,22 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
     final tabs = [
       (
         _SearchTab.all,
-        L10nService.get('search.global_search.all', language),
+        L10nService.get(L10nKeys.searchGlobalSearchAll, language),
         _totalResults,
       ),
       (
         _SearchTab.journal,
-        L10nService.get('search.global_search.journal', language),
+        L10nService.get(L10nKeys.searchGlobalSearchJournal, language),
         _journalResults.length,
       ),
       (
         _SearchTab.notes,
-        L10nService.get('search.global_search.notes', language),
+        L10nService.get(L10nKeys.searchGlobalSearchNotes, language),
         _noteResults.length,
       ),
       (
         _SearchTab.dreams,
-        L10nService.get('search.global_search.dreams', language),
+        L10nService.get(L10nKeys.searchGlobalSearchDreams, language),
         _dreamResults.length,
       ),
     ];
@@ -362,7 +362,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
           if (_recentSearches.isNotEmpty) ...[
             const SizedBox(height: 24),
             GradientText(
-              L10nService.get('search.global_search.recent_searches', language),
+              L10nService.get(L10nKeys.searchGlobalSearchRecentSearches, language),
               variant: GradientTextVariant.gold,
               style: AppTypography.elegantAccent(
                 fontSize: 14,
@@ -407,7 +407,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
           // Quick actions
           const SizedBox(height: 24),
           GradientText(
-            L10nService.get('search.global_search.quick_actions', language),
+            L10nService.get(L10nKeys.searchGlobalSearchQuickActions, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.elegantAccent(
               fontSize: 14,
@@ -443,7 +443,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
             _journalResults.isNotEmpty) ...[
           _buildSectionHeader(
             isDark,
-            L10nService.get('search.global_search.journal_entries', language),
+            L10nService.get(L10nKeys.searchGlobalSearchJournalEntries, language),
             _journalResults.length,
             GradientTextVariant.gold,
           ),
@@ -468,7 +468,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
             _noteResults.isNotEmpty) ...[
           _buildSectionHeader(
             isDark,
-            L10nService.get('search.global_search.notes_1', language),
+            L10nService.get(L10nKeys.searchGlobalSearchNotes1, language),
             _noteResults.length,
             GradientTextVariant.amethyst,
           ),
@@ -493,7 +493,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
             _dreamResults.isNotEmpty) ...[
           _buildSectionHeader(
             isDark,
-            L10nService.get('search.global_search.dreams_1', language),
+            L10nService.get(L10nKeys.searchGlobalSearchDreams1, language),
             _dreamResults.length,
             GradientTextVariant.cosmic,
           ),
@@ -517,7 +517,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
         if (_activeTab == _SearchTab.all && _toolResults.isNotEmpty) ...[
           _buildSectionHeader(
             isDark,
-            L10nService.get('search.global_search.tools', language),
+            L10nService.get(L10nKeys.searchGlobalSearchTools, language),
             _toolResults.length,
             GradientTextVariant.aurora,
           ),
@@ -578,7 +578,7 @@ class _GlobalSearchScreenState extends ConsumerState<GlobalSearchScreen> {
           ),
           const SizedBox(height: AppConstants.spacingLg),
           Text(
-            L10nService.get('search.global_search.nothing_matched_try_different_words', language),
+            L10nService.get(L10nKeys.searchGlobalSearchNothingMatchedTryDifferentWords, language),
             style: AppTypography.subtitle(
               fontSize: 16,
               color: isDark
@@ -641,7 +641,7 @@ class _TagCloudSection extends ConsumerWidget {
       crossAxisAlignment: CrossAxisAlignment.start,
       children: [
         GradientText(
-          L10nService.get('search.global_search.tags', language),
+          L10nService.get(L10nKeys.searchGlobalSearchTags, language),
           variant: GradientTextVariant.gold,
           style: AppTypography.elegantAccent(
             fontSize: 14,
@@ -1059,7 +1059,7 @@ class _ToolResultTile extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
       label: tool.localizedName(language),
-      hint: L10nService.get('search.global_search.double_tap_to_open', language),
+      hint: L10nService.get(L10nKeys.searchGlobalSearchDoubleTapToOpen, language),
       button: true,
       child: GestureDetector(
         onTap: () {
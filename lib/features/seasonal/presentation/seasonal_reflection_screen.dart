@@ -43,7 +43,7 @@ class SeasonalReflectionScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('seasonal.seasonal_reflection.seasonal_reflections', language),
+                  title: L10nService.get(L10nKeys.seasonalSeasonalReflectionSeasonalReflections, language),
                 ),
                 SliverPadding(
                   padding: const EdgeInsets.all(16),
@@ -56,7 +56,7 @@ class SeasonalReflectionScreen extends ConsumerWidget {
                             const CosmicLoadingIndicator(),
                             const SizedBox(height: 12),
                             Text(
-                              L10nService.get('seasonal.seasonal_reflection.loading_reflections', language),
+                              L10nService.get(L10nKeys.seasonalSeasonalReflectionLoadingReflections, language),
                               style: AppTypography.subtitle(
                                 color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
                               ),
@@ -88,7 +88,7 @@ class SeasonalReflectionScreen extends ConsumerWidget {
                                 icon: Icon(Icons.refresh_rounded,
                                     size: 16, color: AppColors.starGold),
                                 label: Text(
-                                  L10nService.get('seasonal.seasonal_reflection.retry', language),
+                                  L10nService.get(L10nKeys.seasonalSeasonalReflectionRetry, language),
                                   style: AppTypography.elegantAccent(
                                     fontSize: 13,
                                     fontWeight: FontWeight.w600,
@@ -221,7 +221,7 @@ class _SeasonHeader extends StatelessWidget {
           ),
           const SizedBox(height: 8),
           Text(
-            '${(completion * 100).round()}% ${L10nService.get('seasonal.seasonal_reflection.complete', language)}',
+            '${(completion * 100).round()}% ${L10nService.get(L10nKeys.seasonalSeasonalReflectionComplete, language)}',
             style: AppTypography.modernAccent(
               fontSize: 12,
               fontWeight: FontWeight.w600,
@@ -337,7 +337,7 @@ class _PromptCard extends StatelessWidget {
               Align(
                 alignment: Alignment.centerRight,
                 child: GradientOutlinedButton(
-                  label: L10nService.get('seasonal.seasonal_reflection.mark_complete', language),
+                  label: L10nService.get(L10nKeys.seasonalSeasonalReflectionMarkComplete, language),
                   icon: Icons.check_rounded,
                   variant: GradientTextVariant.aurora,
                   fontSize: 13,
@@ -371,7 +371,7 @@ class _AllSeasonsRow extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           Text(
-            L10nService.get('seasonal.seasonal_reflection.all_seasons', language),
+            L10nService.get(L10nKeys.seasonalSeasonalReflectionAllSeasons, language),
             style: AppTypography.modernAccent(
               fontSize: 14,
               fontWeight: FontWeight.w600,
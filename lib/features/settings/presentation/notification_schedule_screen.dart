@@ -179,7 +179,7 @@ class _NotificationScheduleScreenState
                   ),
                   slivers: [
                     GlassSliverAppBar(
-                      title: L10nService.get('settings.notification_schedule.notifications', language),
+                      title: L10nService.get(L10nKeys.settingsNotificationScheduleNotifications, language),
                     ),
                     SliverPadding(
                       padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -305,7 +305,7 @@ class _NotificationScheduleScreenState
 
                           // Info text
                           Text(
-                            L10nService.get('settings.notification_schedule.notifications_help_you_build_a_consisten', language),
+                            L10nService.get(L10nKeys.settingsNotificationScheduleNotificationsHelpYouBuildAConsisten, language),
                             style: AppTypography.decorativeScript(
                               fontSize: 13,
                               color: isDark
@@ -342,7 +342,7 @@ class _NotificationScheduleScreenState
             ),
             const SizedBox(height: AppConstants.spacingMd),
             GradientText(
-              L10nService.get('settings.notification_schedule.notifications_are_disabled', language),
+              L10nService.get(L10nKeys.settingsNotificationScheduleNotificationsAreDisabled, language),
               variant: GradientTextVariant.gold,
               style: AppTypography.displayFont.copyWith(
                 fontSize: 18,
@@ -351,7 +351,7 @@ class _NotificationScheduleScreenState
             ),
             const SizedBox(height: AppConstants.spacingSm),
             Text(
-              L10nService.get('settings.notification_schedule.enable_notifications_to_receive_journali', language),
+              L10nService.get(L10nKeys.settingsNotificationScheduleEnableNotificationsToReceiveJournali, language),
               textAlign: TextAlign.center,
               style: AppTypography.decorativeScript(
                 fontSize: 13,
@@ -360,7 +360,7 @@ class _NotificationScheduleScreenState
             ),
             const SizedBox(height: AppConstants.spacingMd),
             GradientButton.gold(
-              label: L10nService.get('settings.notification_schedule.enable_notifications', language),
+              label: L10nService.get(L10nKeys.settingsNotificationScheduleEnableNotifications, language),
               onPressed: _requestPermission,
               expanded: true,
             ),
@@ -472,7 +472,7 @@ class _NotificationScheduleScreenState
             mainAxisAlignment: MainAxisAlignment.spaceBetween,
             children: [
               Text(
-                L10nService.get('settings.notification_schedule.reminder_time', language),
+                L10nService.get(L10nKeys.settingsNotificationScheduleReminderTime, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
                   color: isDark
@@ -529,7 +529,7 @@ class _NotificationScheduleScreenState
             mainAxisAlignment: MainAxisAlignment.spaceBetween,
             children: [
               Text(
-                L10nService.get('settings.notification_schedule.prompt_time', language),
+                L10nService.get(L10nKeys.settingsNotificationSchedulePromptTime, language),
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
                   color: isDark
@@ -135,7 +135,7 @@ class _NotificationSettingsSectionState
               ),
               const SizedBox(width: AppConstants.spacingSm),
               Text(
-                L10nService.get('common.notifications', language),
+                L10nService.get(L10nKeys.commonNotifications, language),
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 18,
                   fontWeight: FontWeight.w700,
@@ -156,10 +156,10 @@ class _NotificationSettingsSectionState
               context,
               isDark,
               icon: Icons.auto_awesome_outlined,
-              title: L10nService.get('notification_settings.daily_insight', language),
+              title: L10nService.get(L10nKeys.notificationSettingsDailyInsight, language),
               subtitle: _dailyInsightEnabled
-                  ? L10nService.getWithParams('notification_settings.reminder_at', language, params: {'time': '${_dailyHour.toString().padLeft(2, '0')}:${_dailyMinute.toString().padLeft(2, '0')}'})
-                  : L10nService.get('notification_settings.off', language),
+                  ? L10nService.getWithParams(L10nKeys.notificationSettingsReminderAt, language, params: {'time': '${_dailyHour.toString().padLeft(2, '0')}:${_dailyMinute.toString().padLeft(2, '0')}'})
+                  : L10nService.get(L10nKeys.notificationSettingsOff, language),
               value: _dailyInsightEnabled,
               onChanged: _toggleDailyInsight,
               onTap: _dailyInsightEnabled ? _selectDailyTime : null,
@@ -176,8 +176,8 @@ class _NotificationSettingsSectionState
               context,
               isDark,
               icon: Icons.spa_outlined,
-              title: L10nService.get('notification_settings.wellness_reminders', language),
-              subtitle: L10nService.get('notification_settings.wellness_subtitle', language),
+              title: L10nService.get(L10nKeys.notificationSettingsWellnessReminders, language),
+              subtitle: L10nService.get(L10nKeys.notificationSettingsWellnessSubtitle, language),
               value: _wellnessRemindersEnabled,
               onChanged: _toggleWellnessReminders,
             ),
@@ -206,7 +206,7 @@ class _NotificationSettingsSectionState
           const SizedBox(width: AppConstants.spacingSm),
           Expanded(
             child: Text(
-              L10nService.get('common.permission_required', language),
+              L10nService.get(L10nKeys.commonPermissionRequired, language),
               style: AppTypography.subtitle(
                 fontSize: 12,
                 color: isDark
@@ -218,7 +218,7 @@ class _NotificationSettingsSectionState
           TextButton(
             onPressed: _requestPermissions,
             child: Text(
-              L10nService.get('common.grant_permission', language),
+              L10nService.get(L10nKeys.commonGrantPermission, language),
               style: AppTypography.modernAccent(color: AppColors.starGold),
             ),
           ),
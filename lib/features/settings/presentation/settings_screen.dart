@@ -59,7 +59,7 @@ class SettingsScreen extends ConsumerWidget {
               keyboardDismissBehavior: ScrollViewKeyboardDismissBehavior.onDrag,
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('settings.title', language),
+                  title: L10nService.get(L10nKeys.settingsTitle, language),
                   largeTitleMode: true,
                 ),
                 SliverPadding(
@@ -71,7 +71,7 @@ class SettingsScreen extends ConsumerWidget {
                     delegate: SliverChildListDelegate([
                       // ═══ APPEARANCE SECTION ═══
                       _SectionHeader(
-                        title: L10nService.get('settings.theme_title', language)
+                        title: L10nService.get(L10nKeys.settingsThemeTitle, language)
                             .toUpperCase(),
                         isDark: isDark,
                       ),
@@ -197,7 +197,7 @@ class SettingsScreen extends ConsumerWidget {
 
                       // ═══ LANGUAGE SECTION ═══
                       _SectionHeader(
-                        title: L10nService.get('settings.language_title', language)
+                        title: L10nService.get(L10nKeys.settingsLanguageTitle, language)
                             .toUpperCase(),
                         isDark: isDark,
                       ),
@@ -301,7 +301,7 @@ class SettingsScreen extends ConsumerWidget {
                       // ═══ ACCOUNT SECTION ═══
                       _SectionHeader(
                         title: L10nService.get(
-                          'settings.account',
+                          L10nKeys.settingsAccount,
                           language,
                         ).toUpperCase(),
                         isDark: isDark,
@@ -314,7 +314,7 @@ class SettingsScreen extends ConsumerWidget {
                             _GroupedTile(
                               icon: Icons.account_circle_outlined,
                               title: L10nService.get(
-                                'settings.edit_profile',
+                                L10nKeys.settingsEditProfile,
                                 language,
                               ),
                               isDark: isDark,
@@ -350,7 +350,7 @@ class SettingsScreen extends ConsumerWidget {
                               child: _GroupedTile(
                                 icon: Icons.workspace_premium_outlined,
                                 title: L10nService.get(
-                                  'settings.premium',
+                                  L10nKeys.settingsPremium,
                                   language,
                                 ),
                                 isDark: isDark,
@@ -416,7 +416,7 @@ class SettingsScreen extends ConsumerWidget {
                               _GroupedTile(
                                 icon: Icons.credit_card_outlined,
                                 title: L10nService.get(
-                                  'settings.manage_subscription',
+                                  L10nKeys.settingsManageSubscription,
                                   language,
                                 ),
                                 isDark: isDark,
@@ -443,8 +443,8 @@ class SettingsScreen extends ConsumerWidget {
                                     SnackBar(
                                       content: Text(
                                         restored
-                                            ? L10nService.get('settings.purchases_restored', language)
-                                            : L10nService.get('settings.no_purchases_found', language),
+                                            ? L10nService.get(L10nKeys.settingsPurchasesRestored, language)
+                                            : L10nService.get(L10nKeys.settingsNoPurchasesFound, language),
                                       ),
                                       backgroundColor: restored
                                           ? AppColors.success
@@ -462,7 +462,7 @@ class SettingsScreen extends ConsumerWidget {
                             _GroupedTile(
                               icon: Icons.delete_outline,
                               title: L10nService.get(
-                                'settings.clear_data',
+                                L10nKeys.settingsClearData,
                                 language,
                               ),
                               isDark: isDark,
@@ -550,7 +550,7 @@ class SettingsScreen extends ConsumerWidget {
                       // ═══ NOTIFICATIONS SECTION ═══
                       _SectionHeader(
                         title: L10nService.get(
-                          'settings.notifications_title',
+                          L10nKeys.settingsNotificationsTitle,
                           language,
                         ).toUpperCase(),
                         isDark: isDark,
@@ -573,7 +573,7 @@ class SettingsScreen extends ConsumerWidget {
                       // ═══ ABOUT SECTION ═══
                       _SectionHeader(
                         title: L10nService.get(
-                          'settings.about',
+                          L10nKeys.settingsAbout,
                           language,
                         ).toUpperCase(),
                         isDark: isDark,
@@ -602,7 +602,7 @@ class SettingsScreen extends ConsumerWidget {
                             _GroupedTile(
                               icon: Icons.star_outline,
                               title: L10nService.get(
-                                'settings.rate_app',
+                                L10nKeys.settingsRateApp,
                                 language,
                               ),
                               isDark: isDark,
@@ -614,7 +614,7 @@ class SettingsScreen extends ConsumerWidget {
                             _GroupedTile(
                               icon: Icons.gavel_outlined,
                               title: L10nService.get(
-                                'settings.disclaimer',
+                                L10nKeys.settingsDisclaimer,
                                 language,
                               ),
                               isDark: isDark,
@@ -628,7 +628,7 @@ class SettingsScreen extends ConsumerWidget {
                             _GroupedTile(
                               icon: Icons.privacy_tip_outlined,
                               title: L10nService.get(
-                                'settings.privacy_policy',
+                                L10nKeys.settingsPrivacyPolicy,
                                 language,
                               ),
                               isDark: isDark,
@@ -640,7 +640,7 @@ class SettingsScreen extends ConsumerWidget {
                             _GroupedTile(
                               icon: Icons.description_outlined,
                               title: L10nService.get(
-                                'settings.terms_of_service',
+                                L10nKeys.settingsTermsOfService,
                                 language,
                               ),
                               isDark: isDark,
@@ -652,7 +652,7 @@ class SettingsScreen extends ConsumerWidget {
                             _GroupedTile(
                               icon: Icons.mail_outline,
                               title: L10nService.get(
-                                'settings.contact_support',
+                                L10nKeys.settingsContactSupport,
                                 language,
                               ),
                               isDark: isDark,
@@ -673,7 +673,7 @@ class SettingsScreen extends ConsumerWidget {
                       const SizedBox(height: 12),
                       Center(
                         child: Text(
-                          L10nService.get('settings.version', language),
+                          L10nService.get(L10nKeys.settingsVersion, language),
                           style: AppTypography.elegantAccent(
                             fontSize: 13,
                             color: isDark
@@ -691,7 +691,7 @@ class SettingsScreen extends ConsumerWidget {
                           noPadding: true,
                           child: _GroupedTile(
                             icon: Icons.admin_panel_settings,
-                            title: L10nService.get('settings.admin', language),
+                            title: L10nService.get(L10nKeys.settingsAdmin, language),
                             isDark: isDark,
                             onTap: () => context.push(Routes.adminLogin),
                             trailing: Container(
@@ -709,7 +709,7 @@ class SettingsScreen extends ConsumerWidget {
                                 borderRadius: BorderRadius.circular(6),
                               ),
                               child: Text(
-                                L10nService.get('settings.pin', language),
+                                L10nService.get(L10nKeys.settingsPin, language),
                                 style: AppTypography.modernAccent(
                                   fontSize: 11,
                                   fontWeight: FontWeight.bold,
@@ -739,10 +739,10 @@ class SettingsScreen extends ConsumerWidget {
   ) async {
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('settings.clear_data_confirm', language),
-      message: L10nService.get('settings.clear_data_warning', language),
-      cancelLabel: L10nService.get('common.cancel', language),
-      confirmLabel: L10nService.get('settings.delete', language),
+      title: L10nService.get(L10nKeys.settingsClearDataConfirm, language),
+      message: L10nService.get(L10nKeys.settingsClearDataWarning, language),
+      cancelLabel: L10nService.get(L10nKeys.commonCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.settingsDelete, language),
       isDestructive: true,
     );
     if (confirmed != true || !context.mounted) return;
@@ -769,10 +769,10 @@ class SettingsScreen extends ConsumerWidget {
   ) async {
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('settings.sign_out_title', language),
-      message: L10nService.get('settings.sign_out_message', language),
-      cancelLabel: L10nService.get('common.cancel', language),
-      confirmLabel: L10nService.get('settings.sign_out_confirm', language),
+      title: L10nService.get(L10nKeys.settingsSignOutTitle, language),
+      message: L10nService.get(L10nKeys.settingsSignOutMessage, language),
+      cancelLabel: L10nService.get(L10nKeys.commonCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.settingsSignOutConfirm, language),
       isDestructive: true,
     );
     if (confirmed != true || !context.mounted) return;
@@ -789,7 +789,7 @@ class SettingsScreen extends ConsumerWidget {
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(
           content: Text(
-            L10nService.get('settings.sign_out_success', language),
+            L10nService.get(L10nKeys.settingsSignOutSuccess, language),
           ),
           backgroundColor: AppColors.surfaceLight,
           behavior: SnackBarBehavior.floating,
@@ -808,10 +808,10 @@ class SettingsScreen extends ConsumerWidget {
   ) async {
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('settings.settings.delete_account', language),
-      message: L10nService.get('settings.settings.this_will_permanently_delete_your_accoun', language),
-      cancelLabel: L10nService.get('settings.settings.cancel', language),
-      confirmLabel: L10nService.get('settings.settings.delete_account_1', language),
+      title: L10nService.get(L10nKeys.settingsSettingsDeleteAccount, language),
+      message: L10nService.get(L10nKeys.settingsSettingsThisWillPermanentlyDeleteYourAccoun, language),
+      cancelLabel: L10nService.get(L10nKeys.settingsSettingsCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.settingsSettingsDeleteAccount1, language),
       isDestructive: true,
     );
     if (confirmed != true || !context.mounted) return;
@@ -819,10 +819,10 @@ class SettingsScreen extends ConsumerWidget {
     // Second confirmation
     final doubleConfirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('settings.settings.delete_your_account', language),
-      message: L10nService.get('settings.settings.all_your_cloud_data_will_be_permanently', language),
-      cancelLabel: L10nService.get('settings.settings.keep_account', language),
-      confirmLabel: L10nService.get('settings.settings.yes_delete', language),
+      title: L10nService.get(L10nKeys.settingsSettingsDeleteYourAccount, language),
+      message: L10nService.get(L10nKeys.settingsSettingsAllYourCloudDataWillBePermanently, language),
+      cancelLabel: L10nService.get(L10nKeys.settingsSettingsKeepAccount, language),
+      confirmLabel: L10nService.get(L10nKeys.settingsSettingsYesDelete, language),
       isDestructive: true,
     );
     if (doubleConfirmed != true || !context.mounted) return;
@@ -835,7 +835,7 @@ class SettingsScreen extends ConsumerWidget {
           ScaffoldMessenger.of(context).showSnackBar(
             SnackBar(
               content: Text(
-                L10nService.get('settings.no_active_session', language),
+                L10nService.get(L10nKeys.settingsNoActiveSession, language),
               ),
               backgroundColor: AppColors.error,
               behavior: SnackBarBehavior.floating,
@@ -855,7 +855,7 @@ class SettingsScreen extends ConsumerWidget {
           ScaffoldMessenger.of(context).showSnackBar(
             SnackBar(
               content: Text(
-                L10nService.get('settings.settings.no_internet_connection_please_try_again', language),
+                L10nService.get(L10nKeys.settingsSettingsNoInternetConnectionPleaseTryAgain, language),
               ),
               backgroundColor: AppColors.error,
               behavior: SnackBarBehavior.floating,
@@ -896,7 +896,7 @@ class SettingsScreen extends ConsumerWidget {
           ScaffoldMessenger.of(context).showSnackBar(
             SnackBar(
               content: Text(
-                L10nService.get('settings.account_deleted', language),
+                L10nService.get(L10nKeys.settingsAccountDeleted, language),
               ),
               backgroundColor: AppColors.surfaceLight,
               behavior: SnackBarBehavior.floating,
@@ -912,7 +912,7 @@ class SettingsScreen extends ConsumerWidget {
           ScaffoldMessenger.of(context).showSnackBar(
             SnackBar(
               content: Text(
-                L10nService.get('settings.settings.account_deletion_requested_you_have_been', language),
+                L10nService.get(L10nKeys.settingsSettingsAccountDeletionRequestedYouHaveBeen, language),
               ),
               backgroundColor: AppColors.error,
               behavior: SnackBarBehavior.floating,
@@ -929,7 +929,7 @@ class SettingsScreen extends ConsumerWidget {
         ScaffoldMessenger.of(context).showSnackBar(
           SnackBar(
             content: Text(
-              L10nService.get('settings.settings.something_went_wrong_please_contact_supp', language),
+              L10nService.get(L10nKeys.settingsSettingsSomethingWentWrongPleaseContactSupp, language),
             ),
             backgroundColor: AppColors.error,
             behavior: SnackBarBehavior.floating,
@@ -950,7 +950,7 @@ class SettingsScreen extends ConsumerWidget {
     showDialog(
       context: context,
       builder: (_) => GlassDialog(
-        title: L10nService.get('settings.disclaimer', language),
+        title: L10nService.get(L10nKeys.settingsDisclaimer, language),
         gradientVariant: GradientTextVariant.gold,
         contentWidget: SingleChildScrollView(
           child: Column(
@@ -958,7 +958,7 @@ class SettingsScreen extends ConsumerWidget {
             mainAxisSize: MainAxisSize.min,
             children: [
               Text(
-                L10nService.get('settings.disclaimer_content', language),
+                L10nService.get(L10nKeys.settingsDisclaimerContent, language),
                 style: AppTypography.decorativeScript(
                   color: isDark
                       ? AppColors.textSecondary
@@ -985,7 +985,7 @@ class SettingsScreen extends ConsumerWidget {
                     const SizedBox(width: 8),
                     Expanded(
                       child: Text(
-                        L10nService.get('settings.disclaimer_tip', language),
+                        L10nService.get(L10nKeys.settingsDisclaimerTip, language),
                         style: AppTypography.decorativeScript(
                           fontSize: 12,
                           color: isDark
@@ -1004,7 +1004,7 @@ class SettingsScreen extends ConsumerWidget {
           TextButton(
             onPressed: () => Navigator.pop(context),
             child: Text(
-              L10nService.get('settings.got_it', language),
+              L10nService.get(L10nKeys.settingsGotIt, language),
               style: AppTypography.modernAccent(
                 color: AppColors.starGold,
                 fontWeight: FontWeight.w600,
@@ -1132,23 +1132,23 @@ class _SyncStatusTile extends ConsumerWidget {
     switch (status) {
       case SyncStatus.syncing:
         icon = Icons.sync;
-        label = L10nService.get('settings.settings.syncing', language);
+        label = L10nService.get(L10nKeys.settingsSettingsSyncing, language);
         color = AppColors.auroraStart;
       case SyncStatus.synced:
         icon = Icons.cloud_done_outlined;
-        label = L10nService.get('settings.settings.synced', language);
+        label = L10nService.get(L10nKeys.settingsSettingsSynced, language);
         color = AppColors.success;
       case SyncStatus.error:
         icon = Icons.cloud_off_outlined;
-        label = L10nService.get('settings.settings.sync_error', language);
+        label = L10nService.get(L10nKeys.settingsSettingsSyncError, language);
         color = AppColors.error;
       case SyncStatus.offline:
         icon = Icons.cloud_off_outlined;
-        label = L10nService.get('settings.settings.offline', language);
+        label = L10nService.get(L10nKeys.settingsSettingsOffline, language);
         color = isDark ? AppColors.textMuted : AppColors.lightTextMuted;
       case SyncStatus.idle:
         icon = Icons.cloud_outlined;
-        label = L10nService.get('settings.settings.ready', language);
+        label = L10nService.get(L10nKeys.settingsSettingsReady, language);
         color = isDark ? AppColors.textMuted : AppColors.lightTextMuted;
     }
 
@@ -1408,7 +1408,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                         crossAxisAlignment: CrossAxisAlignment.start,
                         children: [
                           Text(
-                            L10nService.get('settings.settings.app_lock', language),
+                            L10nService.get(L10nKeys.settingsSettingsAppLock, language),
                             style: AppTypography.subtitle(
                               fontSize: 17,
                               color: widget.isDark
@@ -1417,7 +1417,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                             ),
                           ),
                           Text(
-                            L10nService.get('settings.settings.require_pin_or_biometrics_to_open', language),
+                            L10nService.get(L10nKeys.settingsSettingsRequirePinOrBiometricsToOpen, language),
                             style: AppTypography.elegantAccent(
                               fontSize: 13,
                               color: widget.isDark
@@ -1430,8 +1430,8 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                     ),
                     Semantics(
                       label: isEnabled
-                          ? L10nService.get('settings.app_lock_enabled', language)
-                          : L10nService.get('settings.app_lock_disabled', language),
+                          ? L10nService.get(L10nKeys.settingsAppLockEnabled, language)
+                          : L10nService.get(L10nKeys.settingsAppLockDisabled, language),
                       toggled: isEnabled,
                       child: CupertinoSwitch(
                         value: isEnabled,
@@ -1455,7 +1455,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
               if (isEnabled) ...[
                 _GroupedSeparator(isDark: widget.isDark),
                 Semantics(
-                  label: L10nService.get('settings.settings.change_pin', language),
+                  label: L10nService.get(L10nKeys.settingsSettingsChangePin, language),
                   button: true,
                   child: GestureDetector(
                     behavior: HitTestBehavior.opaque,
@@ -1477,7 +1477,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                           const SizedBox(width: 16),
                           Expanded(
                             child: Text(
-                              L10nService.get('settings.settings.change_pin_1', language),
+                              L10nService.get(L10nKeys.settingsSettingsChangePin1, language),
                               style: AppTypography.subtitle(
                                 fontSize: 17,
                                 color: widget.isDark
@@ -1516,7 +1516,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
     showDialog(
       context: context,
       builder: (ctx) => GlassDialog(
-        title: L10nService.get('settings.settings.set_4digit_pin', language),
+        title: L10nService.get(L10nKeys.settingsSettingsSet4digitPin, language),
         gradientVariant: GradientTextVariant.gold,
         contentWidget: Column(
           mainAxisSize: MainAxisSize.min,
@@ -1532,7 +1532,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                     : AppColors.lightTextPrimary,
               ),
               decoration: InputDecoration(
-                labelText: L10nService.get('settings.settings.4digit_pin', language),
+                labelText: L10nService.get(L10nKeys.settingsSettings4digitPin, language),
                 labelStyle: AppTypography.subtitle(
                   color: widget.isDark
                       ? AppColors.textMuted
@@ -1551,7 +1551,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                     : AppColors.lightTextPrimary,
               ),
               decoration: InputDecoration(
-                labelText: L10nService.get('settings.settings.reenter_pin', language),
+                labelText: L10nService.get(L10nKeys.settingsSettingsReenterPin, language),
                 labelStyle: AppTypography.subtitle(
                   color: widget.isDark
                       ? AppColors.textMuted
@@ -1565,7 +1565,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
           TextButton(
             onPressed: () => Navigator.pop(ctx),
             child: Text(
-              L10nService.get('settings.settings.cancel_1', language),
+              L10nService.get(L10nKeys.settingsSettingsCancel1, language),
               style: AppTypography.subtitle(
                 color: widget.isDark
                     ? AppColors.textMuted
@@ -1582,7 +1582,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                 ScaffoldMessenger.of(context).showSnackBar(
                   SnackBar(
                     content: Text(
-                      L10nService.get('settings.settings.pin_must_be_4_digits', language),
+                      L10nService.get(L10nKeys.settingsSettingsPinMustBe4Digits, language),
                     ),
                     backgroundColor: AppColors.warning,
                     behavior: SnackBarBehavior.floating,
@@ -1598,7 +1598,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
                 ScaffoldMessenger.of(context).showSnackBar(
                   SnackBar(
                     content: Text(
-                      L10nService.get('settings.settings.pins_do_not_match', language),
+                      L10nService.get(L10nKeys.settingsSettingsPinsDoNotMatch, language),
                     ),
                     backgroundColor: AppColors.warning,
                     behavior: SnackBarBehavior.floating,
@@ -1617,7 +1617,7 @@ class _AppLockSectionState extends ConsumerState<_AppLockSection> {
               if (ctx.mounted) Navigator.pop(ctx);
             },
             child: Text(
-              L10nService.get('settings.settings.save_changes', widget.language),
+              L10nService.get(L10nKeys.settingsSettingsSaveChanges, widget.language),
               style: AppTypography.modernAccent(
                 color: AppColors.starGold,
                 fontWeight: FontWeight.w600,
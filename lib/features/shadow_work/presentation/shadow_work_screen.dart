@@ -114,7 +114,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                   mainAxisSize: MainAxisSize.min,
                   children: [
                     Text(
-                      L10nService.get('shadow_work.shadow_work.couldnt_load_your_shadow_work', language),
+                      L10nService.get(L10nKeys.shadowWorkShadowWorkCouldntLoadYourShadowWork, language),
                       textAlign: TextAlign.center,
                       style: AppTypography.decorativeScript(
                         fontSize: 14,
@@ -130,7 +130,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                       icon: Icon(Icons.refresh_rounded,
                           size: 16, color: AppColors.starGold),
                       label: Text(
-                        L10nService.get('shadow_work.shadow_work.retry', language),
+                        L10nService.get(L10nKeys.shadowWorkShadowWorkRetry, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 13,
                           fontWeight: FontWeight.w600,
@@ -150,7 +150,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                     ),
                     slivers: [
                       GlassSliverAppBar(
-                        title: L10nService.get('shadow_work.shadow_work.shadow_work', language),
+                        title: L10nService.get(L10nKeys.shadowWorkShadowWorkShadowWork, language),
                       ),
                       SliverPadding(
                         padding: const EdgeInsets.all(AppConstants.spacingLg),
@@ -270,7 +270,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
           ),
           const SizedBox(height: AppConstants.spacingMd),
           GradientText(
-            L10nService.get('shadow_work.shadow_work.explore_your_inner_landscape', language),
+            L10nService.get(L10nKeys.shadowWorkShadowWorkExploreYourInnerLandscape, language),
             variant: GradientTextVariant.amethyst,
             textAlign: TextAlign.center,
             style: AppTypography.displayFont.copyWith(
@@ -280,7 +280,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
           ),
           const SizedBox(height: 8),
           Text(
-            L10nService.get('shadow_work.shadow_work.shadow_work_helps_you_understand_hidden', language),
+            L10nService.get(L10nKeys.shadowWorkShadowWorkShadowWorkHelpsYouUnderstandHidden, language),
             style: AppTypography.subtitle(
               fontSize: 14,
               color: isDark
@@ -298,19 +298,19 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                 _buildStatChip(
                   context,
                   '$totalEntries',
-                  L10nService.get('shadow_work.shadow_work.entries', language),
+                  L10nService.get(L10nKeys.shadowWorkShadowWorkEntries, language),
                   isDark,
                 ),
                 _buildStatChip(
                   context,
                   '$streak',
-                  L10nService.get('shadow_work.shadow_work.streak', language),
+                  L10nService.get(L10nKeys.shadowWorkShadowWorkStreak, language),
                   isDark,
                 ),
                 _buildStatChip(
                   context,
                   '$breakthroughs',
-                  L10nService.get('shadow_work.shadow_work.insights', language),
+                  L10nService.get(L10nKeys.shadowWorkShadowWorkInsights, language),
                   isDark,
                 ),
               ],
@@ -364,7 +364,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('shadow_work.shadow_work.choose_an_archetype', language),
+            L10nService.get(L10nKeys.shadowWorkShadowWorkChooseAnArchetype, language),
             variant: GradientTextVariant.amethyst,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -488,7 +488,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
               const SizedBox(width: 8),
               Expanded(
                 child: GradientText(
-                  L10nService.get('shadow_work.todays_prompt', language),
+                  L10nService.get(L10nKeys.shadowWorkTodaysPrompt, language),
                   variant: GradientTextVariant.amethyst,
                   style: AppTypography.elegantAccent(
                     fontSize: 14,
@@ -557,7 +557,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                     ),
                     const SizedBox(width: 8),
                     Text(
-                      L10nService.get('shadow_work.shadow_work.begin_writing', language),
+                      L10nService.get(L10nKeys.shadowWorkShadowWorkBeginWriting, language),
                       style: AppTypography.modernAccent(
                         fontSize: 15,
                         fontWeight: FontWeight.w700,
@@ -616,7 +616,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
               height: 1.6,
             ),
             decoration: InputDecoration(
-              hintText: L10nService.get('shadow_work.shadow_work.write_freely_without_judgment', language),
+              hintText: L10nService.get(L10nKeys.shadowWorkShadowWorkWriteFreelyWithoutJudgment, language),
               hintStyle: AppTypography.subtitle(
                 color: isDark
                     ? AppColors.textSecondary.withValues(alpha: 0.5)
@@ -646,7 +646,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
             ),
           ),
           Semantics(
-            label: L10nService.get('shadow_work.shadow_work.intensity_slider', language),
+            label: L10nService.get(L10nKeys.shadowWorkShadowWorkIntensitySlider, language),
             value: '$_intensity',
             child: SliderTheme(
               data: SliderTheme.of(context).copyWith(
@@ -675,7 +675,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
               setState(() => _breakthroughMoment = !_breakthroughMoment);
             },
             child: Semantics(
-              label: L10nService.get('shadow_work.shadow_work.breakthrough_moment_toggle', language),
+              label: L10nService.get(L10nKeys.shadowWorkShadowWorkBreakthroughMomentToggle, language),
               toggled: _breakthroughMoment,
               child: ConstrainedBox(
                 constraints: const BoxConstraints(minHeight: 44),
@@ -695,7 +695,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                     const SizedBox(width: 8),
                     Expanded(
                       child: Text(
-                        L10nService.get('shadow_work.shadow_work.this_was_a_breakthrough_moment', language),
+                        L10nService.get(L10nKeys.shadowWorkShadowWorkThisWasABreakthroughMoment, language),
                         style:
                             AppTypography.subtitle(
                               fontSize: 12,
@@ -749,7 +749,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                       ScaffoldMessenger.of(context).showSnackBar(
                         SnackBar(
                           content: Text(
-                            L10nService.get('shadow_work.shadow_work.shadow_work_entry_saved', language),
+                            L10nService.get(L10nKeys.shadowWorkShadowWorkShadowWorkEntrySaved, language),
                           ),
                           backgroundColor: AppColors.success,
                           behavior: SnackBarBehavior.floating,
@@ -791,7 +791,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                       ),
                       const SizedBox(width: 8),
                       Text(
-                        L10nService.get('shadow_work.shadow_work.save_entry', language),
+                        L10nService.get(L10nKeys.shadowWorkShadowWorkSaveEntry, language),
                         style: AppTypography.modernAccent(
                           fontSize: 15,
                           fontWeight: FontWeight.w700,
@@ -845,7 +845,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('shadow_work.shadow_work.your_shadow_map', language),
+                L10nService.get(L10nKeys.shadowWorkShadowWorkYourShadowMap, language),
                 variant: GradientTextVariant.amethyst,
                 style: AppTypography.modernAccent(
                   fontSize: 14,
@@ -966,7 +966,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('shadow_work.shadow_work.recent_entries', language),
+                L10nService.get(L10nKeys.shadowWorkShadowWorkRecentEntries, language),
                 variant: GradientTextVariant.amethyst,
                 style: AppTypography.modernAccent(
                   fontSize: 14,
@@ -980,10 +980,10 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
             final language = AppLanguage.fromIsEn(isEn);
             final daysAgo = DateTime.now().difference(entry.date).inDays;
             final dateLabel = daysAgo == 0
-                ? (L10nService.get('shadow_work.shadow_work.today', language))
+                ? (L10nService.get(L10nKeys.shadowWorkShadowWorkToday, language))
                 : daysAgo == 1
-                ? (L10nService.get('shadow_work.shadow_work.yesterday', language))
-                : (L10nService.getWithParams('shadow_work.days_ago', language, params: {'count': '$daysAgo'}));
+                ? (L10nService.get(L10nKeys.shadowWorkShadowWorkYesterday, language))
+                : (L10nService.getWithParams(L10nKeys.shadowWorkDaysAgo, language, params: {'count': '$daysAgo'}));
 
             return Padding(
               padding: const EdgeInsets.only(bottom: 12),
@@ -1018,7 +1018,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                             ),
                             if (entry.breakthroughMoment)
                               Semantics(
-                                label: L10nService.get('shadow_work.shadow_work.breakthrough_moment', language),
+                                label: L10nService.get(L10nKeys.shadowWorkShadowWorkBreakthroughMoment, language),
                                 child: Icon(
                                   Icons.lightbulb_rounded,
                                   size: 14,
@@ -1066,10 +1066,10 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
     final language = ref.read(languageProvider);
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('shadow_work.shadow_work.discard_changes', language),
-      message: L10nService.get('shadow_work.shadow_work.you_have_unsaved_text_are_you_sure_you_w', language),
-      cancelLabel: L10nService.get('shadow_work.shadow_work.cancel', language),
-      confirmLabel: L10nService.get('shadow_work.shadow_work.discard', language),
+      title: L10nService.get(L10nKeys.shadowWorkShadowWorkDiscardChanges, language),
+      message: L10nService.get(L10nKeys.shadowWorkShadowWorkYouHaveUnsavedTextAreYouSureYouW, language),
+      cancelLabel: L10nService.get(L10nKeys.shadowWorkShadowWorkCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.shadowWorkShadowWorkDiscard, language),
       isDestructive: true,
     );
     if (confirmed == true && mounted) {
@@ -1117,7 +1117,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                   Icon(Icons.lock_outline, size: 28, color: _shadowGold),
                   const SizedBox(height: 8),
                   GradientText(
-                    L10nService.get('shadow_work.shadow_work.unlock_your_shadow_map', language),
+                    L10nService.get(L10nKeys.shadowWorkShadowWorkUnlockYourShadowMap, language),
                     variant: GradientTextVariant.gold,
                     style: AppTypography.elegantAccent(
                       fontSize: 15,
@@ -1152,7 +1152,7 @@ class _ShadowWorkScreenState extends ConsumerState<ShadowWorkScreen> {
                         ],
                       ),
                       child: Text(
-                        L10nService.get('common.upgrade_to_pro', language),
+                        L10nService.get(L10nKeys.commonUpgradeToPro, language),
                         style: AppTypography.modernAccent(
                           fontSize: 14,
                           fontWeight: FontWeight.w700,
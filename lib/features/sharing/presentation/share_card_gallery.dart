@@ -114,12 +114,12 @@ class _ShareCardGalleryScreenState
 
     setState(() => _isSharing = true);
 
-    final shareText = L10nService.get('sharing.share_gallery.check_out_my_innercycles_card_innercycle', language);
+    final shareText = L10nService.get(L10nKeys.sharingShareGalleryCheckOutMyInnercyclesCardInnercycle, language);
 
     final result = await InstagramShareService.shareCosmicContent(
       boundary: boundary,
       shareText: shareText,
-      hashtags: L10nService.get('sharing.hashtags_journaling', language),
+      hashtags: L10nService.get(L10nKeys.sharingHashtagsJournaling, language),
       language: language,
     );
 
@@ -127,7 +127,7 @@ class _ShareCardGalleryScreenState
     setState(() => _isSharing = false);
 
     if (result.success) {
-      _showSnackBar(L10nService.get('sharing.share_gallery.shared_successfully', language));
+      _showSnackBar(L10nService.get(L10nKeys.sharingShareGallerySharedSuccessfully, language));
       // Trigger review prompt after successful share
       ReviewService.init().then((rs) =>
         rs.checkAndPromptReview(ReviewTrigger.shareCompleted));
@@ -145,7 +145,7 @@ class _ShareCardGalleryScreenState
         '\n\n- InnerCycles';
     await Clipboard.setData(ClipboardData(text: text));
     if (!mounted) return;
-    _showSnackBar(L10nService.get('sharing.share_gallery.copied_to_clipboard', language));
+    _showSnackBar(L10nService.get(L10nKeys.sharingShareGalleryCopiedToClipboard, language));
   }
 
   void _showSnackBar(String message) {
@@ -186,7 +186,7 @@ class _ShareCardGalleryScreenState
         backgroundColor: Colors.transparent,
         elevation: 0,
         title: Text(
-          L10nService.get('sharing.share_gallery.share_cards', language),
+          L10nService.get(L10nKeys.sharingShareGalleryShareCards, language),
           style: AppTypography.displayFont.copyWith(
             color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
             fontWeight: FontWeight.w600,
@@ -195,7 +195,7 @@ class _ShareCardGalleryScreenState
         ),
         centerTitle: true,
         leading: IconButton(
-          tooltip: L10nService.get('sharing.share_gallery.back', language),
+          tooltip: L10nService.get(L10nKeys.sharingShareGalleryBack, language),
           icon: Icon(
             Icons.chevron_left,
             size: 28,
@@ -251,7 +251,7 @@ class _ShareCardGalleryScreenState
           return Semantics(
             button: true,
             selected: isSelected,
-            label: L10nService.getWithParams('sharing.category_label', language, params: {'name': category.label(language)}),
+            label: L10nService.getWithParams(L10nKeys.sharingCategoryLabel, language, params: {'name': category.label(language)}),
             child: GestureDetector(
               onTap: () {
                 HapticFeedback.selectionClick();
@@ -343,7 +343,7 @@ class _ShareCardGalleryScreenState
 
         return Semantics(
           button: true,
-          label: L10nService.getWithParams('sharing.preview_card', language, params: {'name': template.title(language)}),
+          label: L10nService.getWithParams(L10nKeys.sharingPreviewCard, language, params: {'name': template.title(language)}),
           child: GestureDetector(
             onTap: () {
               HapticFeedback.lightImpact();
@@ -409,7 +409,7 @@ class _ShareCardGalleryScreenState
                     : AppColors.lightTextSecondary,
               ),
               label: Text(
-                L10nService.get('sharing.share_gallery.back_to_gallery', language),
+                L10nService.get(L10nKeys.sharingShareGalleryBackToGallery, language),
                 style: AppTypography.subtitle(
                   fontSize: 13,
                   color: isDark
@@ -475,7 +475,7 @@ class _ShareCardGalleryScreenState
             flex: 2,
             child: _ActionButton(
               icon: Icons.share_rounded,
-              label: L10nService.get('sharing.share_gallery.share', language),
+              label: L10nService.get(L10nKeys.sharingShareGalleryShare, language),
               isPrimary: true,
               isLoading: _isSharing,
               accentColor: accent,
@@ -489,7 +489,7 @@ class _ShareCardGalleryScreenState
           Expanded(
             child: _ActionButton(
               icon: Icons.copy_rounded,
-              label: L10nService.get('sharing.share_gallery.copy', language),
+              label: L10nService.get(L10nKeys.sharingShareGalleryCopy, language),
               isDark: isDark,
               onTap: () => _onCopy(language, cardData),
             ),
@@ -862,7 +862,7 @@ class _BottomWatermark extends StatelessWidget {
                             ),
                           ),
                           child: Text(
-                            L10nService.get('sharing.try_innercycles', language),
+                            L10nService.get(L10nKeys.sharingTryInnercycles, language),
                             style: AppTypography.elegantAccent(
                               fontSize: 11,
                               color: accent,
@@ -938,7 +938,7 @@ class _CyclePositionLayout extends StatelessWidget {
             border: Border.all(color: accent.withValues(alpha: 0.3)),
           ),
           child: Text(
-            data.detail ?? L10nService.getWithParams('sharing.day_of_cycle', language, params: {'day': '${cycleDay.toInt()}', 'length': '${cycleLength.toInt()}'}),
+            data.detail ?? L10nService.getWithParams(L10nKeys.sharingDayOfCycle, language, params: {'day': '${cycleDay.toInt()}', 'length': '${cycleLength.toInt()}'}),
             style: AppTypography.elegantAccent(
               fontSize: 12,
               color: accent,
@@ -1003,7 +1003,7 @@ class _CyclePositionLayout extends StatelessWidget {
                       ),
                       const SizedBox(height: 4),
                       Text(
-                        L10nService.getWithParams('sharing.of_total', language, params: {'total': '${cycleLength.toInt()}'}),
+                        L10nService.getWithParams(L10nKeys.sharingOfTotal, language, params: {'total': '${cycleLength.toInt()}'}),
                         style: AppTypography.subtitle(
                           fontSize: 14,
                           color: AppColors.textMuted,
@@ -47,7 +47,7 @@ class SleepDetailScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('sleep.sleep_detail.sleep_quality', language),
+                  title: L10nService.get(L10nKeys.sleepSleepDetailSleepQuality, language),
                   actions: [
                     sleepAsync.whenOrNull(
                       data: (service) {
@@ -96,7 +96,7 @@ class SleepDetailScreen extends ConsumerWidget {
                                 icon: Icon(Icons.refresh_rounded,
                                     size: 16, color: AppColors.starGold),
                                 label: Text(
-                                  L10nService.get('sleep.sleep_detail.retry', language),
+                                  L10nService.get(L10nKeys.sleepSleepDetailRetry, language),
                                   style: AppTypography.elegantAccent(
                                     fontSize: 13,
                                     fontWeight: FontWeight.w600,
@@ -151,7 +151,7 @@ class SleepDetailScreen extends ConsumerWidget {
                           // Recent entries
                           if (entries.isNotEmpty) ...[
                             GradientText(
-                              L10nService.get('sleep.sleep_detail.recent_nights', language),
+                              L10nService.get(L10nKeys.sleepSleepDetailRecentNights, language),
                               variant: GradientTextVariant.gold,
                               style: AppTypography.displayFont.copyWith(
                                 fontSize: 16,
@@ -235,19 +235,19 @@ class _SummaryCard extends StatelessWidget {
             value: summary.averageQuality > 0
                 ? summary.averageQuality.toStringAsFixed(1)
                 : '-',
-            label: L10nService.get('sleep.sleep_detail.average', language),
+            label: L10nService.get(L10nKeys.sleepSleepDetailAverage, language),
             color: _qualityColor(summary.averageQuality),
             isDark: isDark,
           ),
           _StatItem(
             value: '${summary.nightsLogged}',
-            label: L10nService.get('sleep.sleep_detail.nights', language),
+            label: L10nService.get(L10nKeys.sleepSleepDetailNights, language),
             color: AppColors.auroraStart,
             isDark: isDark,
           ),
           _StatItem(
             value: '${summary.bestNightQuality}/5',
-            label: L10nService.get('sleep.sleep_detail.best', language),
+            label: L10nService.get(L10nKeys.sleepSleepDetailBest, language),
             color: AppColors.success,
             isDark: isDark,
           ),
@@ -328,7 +328,7 @@ class _WeeklyChart extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('sleep.sleep_detail.last_7_days', language),
+            L10nService.get(L10nKeys.sleepSleepDetailLast7Days, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -505,7 +505,7 @@ class _SleepTips extends StatelessWidget {
               ),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('sleep.sleep_detail.sleep_tips', language),
+                L10nService.get(L10nKeys.sleepSleepDetailSleepTips, language),
                 variant: GradientTextVariant.gold,
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 14,
@@ -644,10 +644,10 @@ class _EmptyState extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.bedtime_outlined,
-      title: L10nService.get('sleep.sleep_detail.your_sleep_story_is_waiting_to_begin', language),
-      description: L10nService.get('sleep.sleep_detail.log_your_sleep_quality_in_your_daily_jou', language),
+      title: L10nService.get(L10nKeys.sleepSleepDetailYourSleepStoryIsWaitingToBegin, language),
+      description: L10nService.get(L10nKeys.sleepSleepDetailLogYourSleepQualityInYourDailyJou, language),
       gradientVariant: GradientTextVariant.amethyst,
-      ctaLabel: L10nService.get('sleep.sleep_detail.write_journal_entry', language),
+      ctaLabel: L10nService.get(L10nKeys.sleepSleepDetailWriteJournalEntry, language),
       onCtaPressed: () => context.push(Routes.journal),
     );
   }
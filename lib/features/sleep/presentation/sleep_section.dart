@@ -112,7 +112,7 @@ class _SleepSectionState extends ConsumerState<SleepSection> {
                     const SizedBox(width: 10),
                     Expanded(
                       child: GradientText(
-                        L10nService.get('sleep.sleep.sleep_quality', language),
+                        L10nService.get(L10nKeys.sleepSleepSleepQuality, language),
                         variant: GradientTextVariant.aurora,
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 15,
@@ -170,7 +170,7 @@ class _SleepSectionState extends ConsumerState<SleepSection> {
                 crossAxisAlignment: CrossAxisAlignment.start,
                 children: [
                   Text(
-                    L10nService.get('sleep.sleep.how_did_you_sleep_last_night', language),
+                    L10nService.get(L10nKeys.sleepSleepHowDidYouSleepLastNight, language),
                     style: AppTypography.decorativeScript(
                       fontSize: 13,
                       color: isDark
@@ -188,7 +188,7 @@ class _SleepSectionState extends ConsumerState<SleepSection> {
                       final isActive = quality == _selectedQuality;
                       return Semantics(
                         label:
-                            '${L10nService.get('sleep.sleep.sleep_quality_1', language)} $quality: ${_qualityLabel(quality, isEn)}',
+                            '${L10nService.get(L10nKeys.sleepSleepSleepQuality1, language)} $quality: ${_qualityLabel(quality, isEn)}',
                         button: true,
                         selected: isActive,
                         child: GestureDetector(
@@ -265,7 +265,7 @@ class _SleepSectionState extends ConsumerState<SleepSection> {
                             : AppColors.lightTextPrimary,
                       ),
                       decoration: InputDecoration(
-                        hintText: L10nService.get('sleep.sleep.any_sleep_notes_optional', language),
+                        hintText: L10nService.get(L10nKeys.sleepSleepAnySleepNotesOptional, language),
                         hintStyle: AppTypography.subtitle(
                           fontSize: 13,
                           color: isDark
@@ -373,7 +373,7 @@ class SleepSummaryCard extends ConsumerWidget {
                   ),
                   const SizedBox(width: 8),
                   GradientText(
-                    L10nService.get('sleep.sleep.sleep_this_week', language),
+                    L10nService.get(L10nKeys.sleepSleepSleepThisWeek, language),
                     variant: GradientTextVariant.aurora,
                     style: AppTypography.displayFont.copyWith(
                       fontSize: 14,
@@ -401,19 +401,19 @@ class SleepSummaryCard extends ConsumerWidget {
               Row(
                 children: [
                   _SleepStat(
-                    label: L10nService.get('sleep.sleep.avg', language),
+                    label: L10nService.get(L10nKeys.sleepSleepAvg, language),
                     value: summary.averageQuality.toStringAsFixed(1),
                     isDark: isDark,
                   ),
                   const SizedBox(width: 20),
                   _SleepStat(
-                    label: L10nService.get('sleep.sleep.nights', language),
+                    label: L10nService.get(L10nKeys.sleepSleepNights, language),
                     value: '${summary.nightsLogged}/7',
                     isDark: isDark,
                   ),
                   const SizedBox(width: 20),
                   _SleepStat(
-                    label: L10nService.get('sleep.sleep.best', language),
+                    label: L10nService.get(L10nKeys.sleepSleepBest, language),
                     value: '${summary.bestNightQuality}/5',
                     isDark: isDark,
                   ),
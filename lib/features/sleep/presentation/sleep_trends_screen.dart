@@ -53,7 +53,7 @@ class SleepTrendsScreen extends ConsumerWidget {
                     icon: Icon(Icons.refresh_rounded,
                         size: 16, color: AppColors.starGold),
                     label: Text(
-                      L10nService.get('sleep.sleep_trends.retry', language),
+                      L10nService.get(L10nKeys.sleepSleepTrendsRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -94,7 +94,7 @@ class SleepTrendsScreen extends ConsumerWidget {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('sleep.sleep_trends.sleep_trends', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.sleepSleepTrendsSleepTrends, language)),
           SliverFillRemaining(
             hasScrollBody: false,
             child: Center(
@@ -112,7 +112,7 @@ class SleepTrendsScreen extends ConsumerWidget {
                     ),
                     const SizedBox(height: 16),
                     GradientText(
-                      L10nService.get('sleep.sleep_trends.no_sleep_data_yet', language),
+                      L10nService.get(L10nKeys.sleepSleepTrendsNoSleepDataYet, language),
                       variant: GradientTextVariant.aurora,
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 18,
@@ -121,7 +121,7 @@ class SleepTrendsScreen extends ConsumerWidget {
                     ),
                     const SizedBox(height: 8),
                     Text(
-                      L10nService.get('sleep.sleep_trends.log_your_first_nights_sleep_to_see_trend', language),
+                      L10nService.get(L10nKeys.sleepSleepTrendsLogYourFirstNightsSleepToSeeTrend, language),
                       textAlign: TextAlign.center,
                       style: AppTypography.decorativeScript(
                         fontSize: 14,
@@ -160,7 +160,7 @@ class SleepTrendsScreen extends ConsumerWidget {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('sleep.sleep_trends.sleep_trends_1', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.sleepSleepTrendsSleepTrends1, language)),
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
             sliver: SliverList(
@@ -234,7 +234,7 @@ class SleepTrendsScreen extends ConsumerWidget {
       children: [
         Expanded(
           child: _StatTile(
-            label: L10nService.get('sleep.sleep_trends.week_avg', language),
+            label: L10nService.get(L10nKeys.sleepSleepTrendsWeekAvg, language),
             value: summary.averageQuality > 0
                 ? summary.averageQuality.toStringAsFixed(1)
                 : '-',
@@ -244,7 +244,7 @@ class SleepTrendsScreen extends ConsumerWidget {
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('sleep.sleep_trends.best', language),
+            label: L10nService.get(L10nKeys.sleepSleepTrendsBest, language),
             value: summary.bestNightQuality > 0
                 ? '${summary.bestNightQuality}/5'
                 : '-',
@@ -254,7 +254,7 @@ class SleepTrendsScreen extends ConsumerWidget {
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('sleep.sleep_trends.nights', language),
+            label: L10nService.get(L10nKeys.sleepSleepTrendsNights, language),
             value: '$total',
             isDark: isDark,
           ),
@@ -278,15 +278,15 @@ class SleepTrendsScreen extends ConsumerWidget {
       case 'improving':
         icon = Icons.trending_up;
         color = AppColors.auroraStart;
-        text = L10nService.get('sleep.sleep_trends.your_sleep_quality_is_improving', language);
+        text = L10nService.get(L10nKeys.sleepSleepTrendsYourSleepQualityIsImproving, language);
       case 'declining':
         icon = Icons.trending_down;
         color = AppColors.chartOrange;
-        text = L10nService.get('sleep.sleep_trends.your_sleep_quality_has_dipped_recently', language);
+        text = L10nService.get(L10nKeys.sleepSleepTrendsYourSleepQualityHasDippedRecently, language);
       default:
         icon = Icons.trending_flat;
         color = AppColors.starGold;
-        text = L10nService.get('sleep.sleep_trends.your_sleep_quality_is_stable', language);
+        text = L10nService.get(L10nKeys.sleepSleepTrendsYourSleepQualityIsStable, language);
     }
 
     return GlassPanel(
@@ -329,7 +329,7 @@ class SleepTrendsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('sleep.sleep_trends.last_14_nights', language),
+            L10nService.get(L10nKeys.sleepSleepTrendsLast14Nights, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -403,11 +403,11 @@ class SleepTrendsScreen extends ConsumerWidget {
   ) {
     final language = AppLanguage.fromIsEn(isEn);
     final labels = [
-      (1, L10nService.get('sleep.sleep_trends.poor', language)),
-      (2, L10nService.get('sleep.sleep_trends.fair', language)),
-      (3, L10nService.get('sleep.sleep_trends.okay', language)),
-      (4, L10nService.get('sleep.sleep_trends.good', language)),
-      (5, L10nService.get('sleep.sleep_trends.great', language)),
+      (1, L10nService.get(L10nKeys.sleepSleepTrendsPoor, language)),
+      (2, L10nService.get(L10nKeys.sleepSleepTrendsFair, language)),
+      (3, L10nService.get(L10nKeys.sleepSleepTrendsOkay, language)),
+      (4, L10nService.get(L10nKeys.sleepSleepTrendsGood, language)),
+      (5, L10nService.get(L10nKeys.sleepSleepTrendsGreat, language)),
     ];
     final total = distribution.values.fold(0, (a, b) => a + b);
 
@@ -419,7 +419,7 @@ class SleepTrendsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('sleep.sleep_trends.quality_distribution', language),
+            L10nService.get(L10nKeys.sleepSleepTrendsQualityDistribution, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -515,7 +515,7 @@ class SleepTrendsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('sleep.sleep_trends.notes', language),
+            L10nService.get(L10nKeys.sleepSleepTrendsNotes, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 14,
@@ -61,8 +61,8 @@ class _ChallengeCelebrationModalState extends State<ChallengeCelebrationModal> {
       final title = challenge.localizedTitle(language);
       final result = await InstagramShareService.shareCosmicContent(
         boundary: boundary,
-        shareText: L10nService.getWithParams('sharing.share_challenge_text', language, params: {'emoji': challenge.emoji, 'title': title, 'appStoreUrl': AppConstants.appStoreUrl}),
-        hashtags: L10nService.get('sharing.hashtags_challenge_complete', language),
+        shareText: L10nService.getWithParams(L10nKeys.sharingShareChallengeText, language, params: {'emoji': challenge.emoji, 'title': title, 'appStoreUrl': AppConstants.appStoreUrl}),
+        hashtags: L10nService.get(L10nKeys.sharingHashtagsChallengeComplete, language),
         language: language,
       );
       if (result.success) {
@@ -147,7 +147,7 @@ class _ChallengeCelebrationModalState extends State<ChallengeCelebrationModal> {
 
                   // Title
                   GradientText(
-                        L10nService.get('streak.challenge_celebration.challenge_completed', language),
+                        L10nService.get(L10nKeys.streakChallengeCelebrationChallengeCompleted, language),
                         variant: GradientTextVariant.gold,
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 20,
@@ -175,7 +175,7 @@ class _ChallengeCelebrationModalState extends State<ChallengeCelebrationModal> {
 
                   // Message
                   Text(
-                    L10nService.get('streak.challenge_celebration.you_showed_real_commitment', language),
+                    L10nService.get(L10nKeys.streakChallengeCelebrationYouShowedRealCommitment, language),
                     textAlign: TextAlign.center,
                     style: AppTypography.decorativeScript(
                       fontSize: 15,
@@ -218,7 +218,7 @@ class _ChallengeCelebrationModalState extends State<ChallengeCelebrationModal> {
                         children: [
                           Expanded(
                             child: GradientOutlinedButton(
-                              label: L10nService.get('streak.challenge_celebration.share', language),
+                              label: L10nService.get(L10nKeys.streakChallengeCelebrationShare, language),
                               icon: _isSharing ? null : Icons.share_rounded,
                               variant: GradientTextVariant.gold,
                               expanded: true,
@@ -234,7 +234,7 @@ class _ChallengeCelebrationModalState extends State<ChallengeCelebrationModal> {
                           const SizedBox(width: 12),
                           Expanded(
                             child: GradientButton.gold(
-                              label: L10nService.get('streak.challenge_celebration.continue', language),
+                              label: L10nService.get(L10nKeys.streakChallengeCelebrationContinue, language),
                               onPressed: () => Navigator.of(context).pop(),
                               expanded: true,
                             ),
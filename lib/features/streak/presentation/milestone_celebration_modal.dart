@@ -68,7 +68,7 @@ class _MilestoneCelebrationModalState extends State<MilestoneCelebrationModal> {
         headline: _title,
         subtitle: _message,
         statValue: '$streakDays',
-        statLabel: L10nService.get('streak.milestone_celebration.day_streak', language),
+        statLabel: L10nService.get(L10nKeys.streakMilestoneCelebrationDayStreak, language),
       ),
       language: language,
     );
@@ -102,23 +102,23 @@ class _MilestoneCelebrationModalState extends State<MilestoneCelebrationModal> {
     final lang = language;
     switch (streakDays) {
       case 3:
-        return L10nService.get('streak.milestone.title_3', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle3, lang);
       case 7:
-        return L10nService.get('streak.milestone.title_7', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle7, lang);
       case 14:
-        return L10nService.get('streak.milestone.title_14', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle14, lang);
       case 30:
-        return L10nService.get('streak.milestone.title_30', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle30, lang);
       case 60:
-        return L10nService.get('streak.milestone.title_60', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle60, lang);
       case 90:
-        return L10nService.get('streak.milestone.title_90', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle90, lang);
       case 180:
-        return L10nService.get('streak.milestone.title_180', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle180, lang);
       case 365:
-        return L10nService.get('streak.milestone.title_365', lang);
+        return L10nService.get(L10nKeys.streakMilestoneTitle365, lang);
       default:
-        return L10nService.getWithParams('streak.milestone.title_default', lang, params: {'count': '$streakDays'});
+        return L10nService.getWithParams(L10nKeys.streakMilestoneTitleDefault, lang, params: {'count': '$streakDays'});
     }
   }
 
@@ -132,7 +132,7 @@ class _MilestoneCelebrationModalState extends State<MilestoneCelebrationModal> {
     final isDark = Theme.of(context).brightness == Brightness.dark;
 
     return Semantics(
-      label: L10nService.getWithParams('streak.milestone.celebration_label', language, params: {'count': '$streakDays'}),
+      label: L10nService.getWithParams(L10nKeys.streakMilestoneCelebrationLabel, language, params: {'count': '$streakDays'}),
       child: Dialog(
         backgroundColor: Colors.transparent,
         elevation: 0,
@@ -301,7 +301,7 @@ class _MilestoneCelebrationModalState extends State<MilestoneCelebrationModal> {
                               const SizedBox(width: 8),
                               Expanded(
                                 child: Text(
-                                  L10nService.get('streak.milestone_celebration.unlock_deeper_insights_with_premium', language),
+                                  L10nService.get(L10nKeys.streakMilestoneCelebrationUnlockDeeperInsightsWithPremium, language),
                                   style: AppTypography.subtitle(
                                     fontSize: 12,
                                     color: isDark
@@ -323,7 +323,7 @@ class _MilestoneCelebrationModalState extends State<MilestoneCelebrationModal> {
                               // Share button
                               Expanded(
                                 child: GradientOutlinedButton(
-                                  label: L10nService.get('streak.milestone_celebration.share', language),
+                                  label: L10nService.get(L10nKeys.streakMilestoneCelebrationShare, language),
                                   icon: _isSharing ? null : Icons.share_rounded,
                                   variant: GradientTextVariant.gold,
                                   expanded: true,
@@ -340,7 +340,7 @@ class _MilestoneCelebrationModalState extends State<MilestoneCelebrationModal> {
                               // Keep Going button
                               Expanded(
                                 child: GradientButton.gold(
-                                  label: L10nService.get('streak.milestone_celebration.keep_going', language),
+                                  label: L10nService.get(L10nKeys.streakMilestoneCelebrationKeepGoing, language),
                                   onPressed: () => Navigator.of(context).pop(),
                                   expanded: true,
                                 ),
@@ -87,7 +87,7 @@ class _StreakCardContent extends StatelessWidget {
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: [
                         Text(
-                          L10nService.get('streak.streak.reflection_streak', language),
+                          L10nService.get(L10nKeys.streakStreakReflectionStreak, language),
                           style: AppTypography.displayFont.copyWith(
                             fontSize: 18,
                             fontWeight: FontWeight.bold,
@@ -175,7 +175,7 @@ class _StreakCardContent extends StatelessWidget {
                 Align(
                   alignment: Alignment.centerRight,
                   child: Semantics(
-                    label: L10nService.get('streak.streak.share_your_streak', language),
+                    label: L10nService.get(L10nKeys.streakStreakShareYourStreak, language),
                     button: true,
                     child: GestureDetector(
                     onTap: () {
@@ -196,7 +196,7 @@ class _StreakCardContent extends StatelessWidget {
                         ),
                         const SizedBox(width: 4),
                         Text(
-                          L10nService.get('streak.streak.share_streak', language),
+                          L10nService.get(L10nKeys.streakStreakShareStreak, language),
                           style: AppTypography.elegantAccent(
                             fontSize: 13,
                             color: AppColors.starGold.withValues(alpha: 0.7),
@@ -429,7 +429,7 @@ class _StreakChain extends ConsumerWidget {
           crossAxisAlignment: CrossAxisAlignment.start,
           children: [
             Text(
-              L10nService.get('streak.streak.14day_chain', language),
+              L10nService.get(L10nKeys.streakStreak14dayChain, language),
               style: AppTypography.elegantAccent(
                 fontSize: 14,
                 fontWeight: FontWeight.w600,
@@ -555,7 +555,7 @@ class StreakMilestoneCelebration {
     await showGeneralDialog(
       context: context,
       barrierDismissible: true,
-      barrierLabel: L10nService.get('common.dismiss', language),
+      barrierLabel: L10nService.get(L10nKeys.commonDismiss, language),
       barrierColor: Colors.black54,
       transitionDuration: const Duration(milliseconds: 400),
       transitionBuilder: (ctx, anim, secondAnim, child) {
@@ -623,7 +623,7 @@ class StreakMilestoneCelebration {
 
                   // Milestone number
                   Text(
-                        '$milestone ${L10nService.get('streak.streak.days', language)}',
+                        '$milestone ${L10nService.get(L10nKeys.streakStreakDays, language)}',
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 32,
                           fontWeight: FontWeight.w800,
@@ -637,7 +637,7 @@ class StreakMilestoneCelebration {
                   const SizedBox(height: 4),
 
                   Text(
-                    L10nService.get('streak.streak.milestone_reached', language),
+                    L10nService.get(L10nKeys.streakStreakMilestoneReached, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       fontWeight: FontWeight.w600,
@@ -679,7 +679,7 @@ class StreakMilestoneCelebration {
                         ),
                         const SizedBox(width: 6),
                         Text(
-                          L10nService.get('streak.streak.share_achievement', language),
+                          L10nService.get(L10nKeys.streakStreakShareAchievement, language),
                           style: AppTypography.elegantAccent(
                             fontSize: 15,
                             color: AppColors.starGold.withValues(alpha: 0.7),
@@ -692,7 +692,7 @@ class StreakMilestoneCelebration {
 
                   // CTA
                   GradientButton.gold(
-                    label: L10nService.get('streak.streak.keep_going', language),
+                    label: L10nService.get(L10nKeys.streakStreakKeepGoing, language),
                     onPressed: () => Navigator.pop(ctx),
                     expanded: true,
                   ).animate().fadeIn(delay: 600.ms, duration: 400.ms),
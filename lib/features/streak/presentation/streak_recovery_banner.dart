@@ -66,7 +66,7 @@ class StreakRecoveryBanner extends ConsumerWidget {
           children: [
             // Main comeback card
             Semantics(
-              label: L10nService.get('streak.streak_recovery.start_a_new_streak', language),
+              label: L10nService.get(L10nKeys.streakStreakRecoveryStartANewStreak, language),
               button: true,
               child: GestureDetector(
                 onTap: () {
@@ -200,7 +200,7 @@ class StreakRecoveryBanner extends ConsumerWidget {
             // Streak freeze upsell for non-premium users
             if (!isPremium)
               Semantics(
-                label: L10nService.get('streak.streak_recovery.access_streak_freeze', language),
+                label: L10nService.get(L10nKeys.streakStreakRecoveryAccessStreakFreeze, language),
                 button: true,
                 child: GestureDetector(
                   onTap: () => showContextualPaywall(
@@ -235,7 +235,7 @@ class StreakRecoveryBanner extends ConsumerWidget {
                         const SizedBox(width: 10),
                         Expanded(
                           child: Text(
-                            L10nService.get('streak.streak_recovery.premium_streak_freezes_could_have_saved', language),
+                            L10nService.get(L10nKeys.streakStreakRecoveryPremiumStreakFreezesCouldHaveSaved, language),
                             style: AppTypography.decorativeScript(
                               fontSize: 12,
                               color: AppColors.streakOrange,
@@ -243,7 +243,7 @@ class StreakRecoveryBanner extends ConsumerWidget {
                           ),
                         ),
                         Text(
-                          L10nService.get('streak.streak_recovery.learn_more', language),
+                          L10nService.get(L10nKeys.streakStreakRecoveryLearnMore, language),
                           style: AppTypography.elegantAccent(
                             fontSize: 11,
                             color: AppColors.streakOrange.withValues(
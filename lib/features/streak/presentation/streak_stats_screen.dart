@@ -62,7 +62,7 @@ class StreakStatsScreen extends ConsumerWidget {
                       color: AppColors.starGold,
                     ),
                     label: Text(
-                      L10nService.get('streak.streak_stats.retry', language),
+                      L10nService.get(L10nKeys.streakStreakStatsRetry, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 13,
                         fontWeight: FontWeight.w600,
@@ -110,7 +110,7 @@ class StreakStatsScreen extends ConsumerWidget {
           parent: AlwaysScrollableScrollPhysics(),
         ),
         slivers: [
-          GlassSliverAppBar(title: L10nService.get('streak.streak_stats.streak_engine', language)),
+          GlassSliverAppBar(title: L10nService.get(L10nKeys.streakStreakStatsStreakEngine, language)),
           SliverPadding(
             padding: const EdgeInsets.all(AppConstants.spacingLg),
             sliver: SliverList(
@@ -177,7 +177,7 @@ class StreakStatsScreen extends ConsumerWidget {
             ),
           ),
           Text(
-            L10nService.get('streak.streak_stats.day_streak', language),
+            L10nService.get(L10nKeys.streakStreakStatsDayStreak, language),
             style: AppTypography.modernAccent(
               fontSize: 16,
               fontWeight: FontWeight.w300,
@@ -241,7 +241,7 @@ class StreakStatsScreen extends ConsumerWidget {
                   ),
                   const SizedBox(width: 6),
                   Text(
-                    L10nService.get('streak.streak_stats.share_your_streak', language),
+                    L10nService.get(L10nKeys.streakStreakStatsShareYourStreak, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 13,
                       color: AppColors.starGold.withValues(alpha: 0.8),
@@ -268,7 +268,7 @@ class StreakStatsScreen extends ConsumerWidget {
       children: [
         Expanded(
           child: _StatTile(
-            label: L10nService.get('streak.streak_stats.longest', language),
+            label: L10nService.get(L10nKeys.streakStreakStatsLongest, language),
             value: '${stats.longestStreak}',
             icon: Icons.emoji_events_outlined,
             isDark: isDark,
@@ -277,7 +277,7 @@ class StreakStatsScreen extends ConsumerWidget {
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('streak.streak_stats.total_entries', language),
+            label: L10nService.get(L10nKeys.streakStreakStatsTotalEntries, language),
             value: '${stats.totalEntries}',
             icon: Icons.edit_note,
             isDark: isDark,
@@ -286,7 +286,7 @@ class StreakStatsScreen extends ConsumerWidget {
         const SizedBox(width: AppConstants.spacingMd),
         Expanded(
           child: _StatTile(
-            label: L10nService.get('streak.streak_stats.milestones', language),
+            label: L10nService.get(L10nKeys.streakStreakStatsMilestones, language),
             value: '${stats.celebratedMilestones.length}',
             icon: Icons.stars_outlined,
             isDark: isDark,
@@ -316,7 +316,7 @@ class StreakStatsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('streak.streak_stats.this_week', language),
+            L10nService.get(L10nKeys.streakStreakStatsThisWeek, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 14,
@@ -418,7 +418,7 @@ class StreakStatsScreen extends ConsumerWidget {
               Icon(Icons.ac_unit, color: AppColors.auroraStart, size: 20),
               const SizedBox(width: 8),
               GradientText(
-                L10nService.get('streak.streak_stats.streak_freeze', language),
+                L10nService.get(L10nKeys.streakStreakStatsStreakFreeze, language),
                 variant: GradientTextVariant.aurora,
                 style: AppTypography.elegantAccent(
                   fontSize: 14,
@@ -452,7 +452,7 @@ class StreakStatsScreen extends ConsumerWidget {
                     ref.invalidate(streakStatsProvider);
                   },
                   child: Text(
-                    L10nService.get('streak.streak_stats.use_freeze', language),
+                    L10nService.get(L10nKeys.streakStreakStatsUseFreeze, language),
                     style: AppTypography.modernAccent(
                       fontSize: 14,
                       color: AppColors.auroraStart,
@@ -464,7 +464,7 @@ class StreakStatsScreen extends ConsumerWidget {
           if (!isPremium) ...[
             const SizedBox(height: 8),
             Text(
-              L10nService.get('streak.streak_stats.premium_3_freezes_per_week', language),
+              L10nService.get(L10nKeys.streakStreakStatsPremium3FreezesPerWeek, language),
               style: AppTypography.decorativeScript(
                 fontSize: 12,
                 color: AppColors.starGold.withValues(alpha: 0.7),
@@ -491,7 +491,7 @@ class StreakStatsScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('streak.streak_stats.milestones_1', language),
+            L10nService.get(L10nKeys.streakStreakStatsMilestones1, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 14,
@@ -553,7 +553,7 @@ class StreakStatsScreen extends ConsumerWidget {
                   ),
                   const SizedBox(height: 4),
                   Text(
-                    L10nService.getWithParams('streak.milestone_days_short', language, params: {'count': '$milestone'}),
+                    L10nService.getWithParams(L10nKeys.streakMilestoneDaysShort, language, params: {'count': '$milestone'}),
                     style: AppTypography.elegantAccent(
                       fontSize: 10,
                       color: reached
@@ -577,7 +577,7 @@ class StreakStatsScreen extends ConsumerWidget {
   Widget _buildQuickAction(BuildContext context, bool isDark, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     return GradientOutlinedButton(
-      label: L10nService.get('streak.streak_stats.log_todays_entry', language),
+      label: L10nService.get(L10nKeys.streakStreakStatsLogTodaysEntry, language),
       icon: Icons.edit_note,
       variant: GradientTextVariant.gold,
       expanded: true,
@@ -157,7 +157,7 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
     showGeneralDialog(
       context: context,
       barrierDismissible: true,
-      barrierLabel: L10nService.get('common.dismiss', language),
+      barrierLabel: L10nService.get(L10nKeys.commonDismiss, language),
       barrierColor: Colors.black54,
       transitionDuration: const Duration(milliseconds: 300),
       transitionBuilder: (ctx, anim, _, child) =>
@@ -187,7 +187,7 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
                 ),
                 const SizedBox(height: 16),
                 Text(
-                  L10nService.get('today.today_feed.welcome_back', language),
+                  L10nService.get(L10nKeys.todayTodayFeedWelcomeBack, language),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 22,
                     fontWeight: FontWeight.w700,
@@ -224,7 +224,7 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
                     ),
                     child: Center(
                       child: Text(
-                        L10nService.get('today.today_feed.write_an_entry', language),
+                        L10nService.get(L10nKeys.todayTodayFeedWriteAnEntry, language),
                         style: AppTypography.modernAccent(
                           fontSize: 16,
                           fontWeight: FontWeight.w700,
@@ -238,7 +238,7 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
                 GestureDetector(
                   onTap: () => Navigator.pop(ctx),
                   child: Text(
-                    L10nService.get('today.today_feed.maybe_later', language),
+                    L10nService.get(L10nKeys.todayTodayFeedMaybeLater, language),
                     style: AppTypography.elegantAccent(
                       fontSize: 14,
                       color: isDark
@@ -285,12 +285,12 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
     final isDark = Theme.of(context).brightness == Brightness.dark;
 
     final label = milestone >= 365
-        ? (L10nService.get('today.today_feed.1_year', language))
+        ? (L10nService.get(L10nKeys.todayTodayFeed1Year, language))
         : milestone >= 180
-            ? (L10nService.get('today.today_feed.6_months', language))
+            ? (L10nService.get(L10nKeys.todayTodayFeed6Months, language))
             : milestone >= 90
-                ? (L10nService.get('today.today_feed.3_months', language))
-                : (L10nService.get('today.today_feed.1_month', language));
+                ? (L10nService.get(L10nKeys.todayTodayFeed3Months, language))
+                : (L10nService.get(L10nKeys.todayTodayFeed1Month, language));
 
     final emoji = milestone >= 365
         ? '\u{1F389}'
@@ -307,7 +307,7 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
     showGeneralDialog(
       context: context,
       barrierDismissible: true,
-      barrierLabel: L10nService.get('common.dismiss', language),
+      barrierLabel: L10nService.get(L10nKeys.commonDismiss, language),
       barrierColor: Colors.black54,
       transitionDuration: const Duration(milliseconds: 300),
       transitionBuilder: (ctx, anim, _, child) =>
@@ -338,7 +338,7 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
                 Text(emoji, style: const TextStyle(fontSize: 56)),
                 const SizedBox(height: 16),
                 Text(
-                  L10nService.getWithParams('today.anniversary_label', language, params: {'label': label}),
+                  L10nService.getWithParams(L10nKeys.todayAnniversaryLabel, language, params: {'label': label}),
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 24,
                     fontWeight: FontWeight.w700,
@@ -404,7 +404,7 @@ class _TodayFeedScreenState extends ConsumerState<TodayFeedScreen> {
                           ),
                           child: Center(
                             child: Text(
-                              L10nService.get('today.today_feed.continue', language),
+                              L10nService.get(L10nKeys.todayTodayFeedContinue, language),
                               style: AppTypography.modernAccent(
                                 fontSize: 16,
                                 fontWeight: FontWeight.w700,
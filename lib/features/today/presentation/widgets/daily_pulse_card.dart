@@ -133,7 +133,7 @@ class DailyPulseCard extends ConsumerWidget {
         Row(
           children: [
             GradientText(
-              L10nService.get('today.daily_pulse.focus_pulse', language),
+              L10nService.get(L10nKeys.todayDailyPulseFocusPulse, language),
               variant: GradientTextVariant.gold,
               style: AppTypography.displayFont.copyWith(
                 fontSize: 14,
@@ -144,7 +144,7 @@ class DailyPulseCard extends ConsumerWidget {
             const Spacer(),
             Semantics(
               button: true,
-              label: L10nService.get('today.daily_pulse.view_details', language),
+              label: L10nService.get(L10nKeys.todayDailyPulseViewDetails, language),
               child: GestureDetector(
                 onTap: () {
                   HapticService.selectionTap();
@@ -152,7 +152,7 @@ class DailyPulseCard extends ConsumerWidget {
                 },
                 behavior: HitTestBehavior.opaque,
                 child: Text(
-                  L10nService.get('today.daily_pulse.details', language),
+                  L10nService.get(L10nKeys.todayDailyPulseDetails, language),
                   style: AppTypography.subtitle(
                     fontSize: 13,
                     color: isDark
@@ -354,7 +354,7 @@ class DailyPulseCard extends ConsumerWidget {
             ),
             const SizedBox(width: 6),
             GradientText(
-              L10nService.getWithParams('today.daily_pulse.try_for_area', language, params: {'area': areaLabel}),
+              L10nService.getWithParams(L10nKeys.todayDailyPulseTryForArea, language, params: {'area': areaLabel}),
               variant: GradientTextVariant.amethyst,
               style: AppTypography.elegantAccent(
                 fontSize: 12,
@@ -387,7 +387,7 @@ class DailyPulseCard extends ConsumerWidget {
         final history = archetypeService.getArchetypeHistory();
         if (history.isEmpty) {
           icon = Icons.auto_awesome_outlined;
-          text = L10nService.get('today.daily_pulse.each_entry_builds_your_pattern_library_s', language);
+          text = L10nService.get(L10nKeys.todayDailyPulseEachEntryBuildsYourPatternLibraryS, language);
         } else {
           icon = Icons.psychology_outlined;
           final latestId = history.last.archetypeId;
@@ -464,15 +464,15 @@ class DailyPulseCard extends ConsumerWidget {
   String _areaLabel(FocusArea area) {
     switch (area) {
       case FocusArea.energy:
-        return L10nService.get('today.daily_pulse.energy', language);
+        return L10nService.get(L10nKeys.todayDailyPulseEnergy, language);
       case FocusArea.focus:
-        return L10nService.get('today.daily_pulse.focus', language);
+        return L10nService.get(L10nKeys.todayDailyPulseFocus, language);
       case FocusArea.emotions:
-        return L10nService.get('today.daily_pulse.emotions', language);
+        return L10nService.get(L10nKeys.todayDailyPulseEmotions, language);
       case FocusArea.decisions:
-        return L10nService.get('today.daily_pulse.decisions', language);
+        return L10nService.get(L10nKeys.todayDailyPulseDecisions, language);
       case FocusArea.social:
-        return L10nService.get('today.daily_pulse.social', language);
+        return L10nService.get(L10nKeys.todayDailyPulseSocial, language);
     }
   }
 
@@ -115,7 +115,7 @@ class HeroJournalCard extends ConsumerWidget {
                     ],
                     const SizedBox(height: 10),
                     Text(
-                      L10nService.get('today.hero_journal.daily_reflection', language),
+                      L10nService.get(L10nKeys.todayHeroJournalDailyReflection, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 12,
                         fontWeight: FontWeight.w600,
@@ -129,7 +129,7 @@ class HeroJournalCard extends ConsumerWidget {
                     // Gold CTA button
                     Semantics(
                       button: true,
-                      label: L10nService.get('today.hero_journal.start_writing_journal_entry', language),
+                      label: L10nService.get(L10nKeys.todayHeroJournalStartWritingJournalEntry, language),
                       child: TapScale(
                         onTap: () {
                           HapticService.buttonPress();
@@ -178,7 +178,7 @@ class HeroJournalCard extends ConsumerWidget {
                               ),
                               const SizedBox(width: 8),
                               Text(
-                                L10nService.get('today.hero_journal.start_writing', language),
+                                L10nService.get(L10nKeys.todayHeroJournalStartWriting, language),
                                 style: AppTypography.modernAccent(
                                   fontSize: 15,
                                   fontWeight: FontWeight.w700,
@@ -195,7 +195,7 @@ class HeroJournalCard extends ConsumerWidget {
                     // Voice quick-capture shortcut
                     Semantics(
                       button: true,
-                      label: L10nService.get('today.hero_journal.start_writing_journal_entry', language),
+                      label: L10nService.get(L10nKeys.todayHeroJournalStartWritingJournalEntry, language),
                       child: TapScale(
                         onTap: () {
                           HapticService.buttonPress();
@@ -237,7 +237,7 @@ class HeroJournalCard extends ConsumerWidget {
                     // Share link
                     Semantics(
                       button: true,
-                      label: L10nService.get('today.hero_journal.share_this_question', language),
+                      label: L10nService.get(L10nKeys.todayHeroJournalShareThisQuestion, language),
                       child: TapScale(
                         onTap: () {
                           HapticService.buttonPress();
@@ -268,7 +268,7 @@ class HeroJournalCard extends ConsumerWidget {
                               ),
                               const SizedBox(width: 4),
                               Text(
-                                L10nService.get('today.hero_journal.share_this_question_1', language),
+                                L10nService.get(L10nKeys.todayHeroJournalShareThisQuestion1, language),
                                 style: AppTypography.elegantAccent(
                                   fontSize: 14,
                                   color: isDark
@@ -295,7 +295,7 @@ class HeroJournalCard extends ConsumerWidget {
           padding: const EdgeInsets.symmetric(horizontal: 20),
           child: Semantics(
             button: true,
-            label: L10nService.get('today.hero_journal.start_journaling', language),
+            label: L10nService.get(L10nKeys.todayHeroJournalStartJournaling, language),
             child: GestureDetector(
               onTap: () {
                 HapticService.buttonPress();
@@ -332,7 +332,7 @@ class HeroJournalCard extends ConsumerWidget {
                     const SizedBox(width: 10),
                     Flexible(
                       child: Text(
-                        L10nService.get('today.hero_journal.start_journaling_1', language),
+                        L10nService.get(L10nKeys.todayHeroJournalStartJournaling1, language),
                         style: AppTypography.modernAccent(
                           fontSize: 16,
                           fontWeight: FontWeight.w700,
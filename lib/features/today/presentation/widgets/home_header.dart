@@ -34,9 +34,9 @@ class HomeHeader extends StatelessWidget {
 
   String _getGreeting() {
     final hour = DateTime.now().hour;
-    if (hour < 12) return L10nService.get('today.home_header.good_morning', language);
-    if (hour < 18) return L10nService.get('today.home_header.good_afternoon', language);
-    return L10nService.get('today.home_header.good_evening', language);
+    if (hour < 12) return L10nService.get(L10nKeys.todayHomeHeaderGoodMorning, language);
+    if (hour < 18) return L10nService.get(L10nKeys.todayHomeHeaderGoodAfternoon, language);
+    return L10nService.get(L10nKeys.todayHomeHeaderGoodEvening, language);
   }
 
   String _getFormattedDate() {
@@ -45,7 +45,7 @@ class HomeHeader extends StatelessWidget {
     final dayName = L10nService.get(dayKeys[now.weekday - 1], language);
     final months = CommonStrings.monthsShort(language);
     final monthName = months[now.month - 1];
-    return L10nService.getWithParams('common.date.format_en', language, params: {'day': dayName, 'month': monthName, 'date': '${now.day}'});
+    return L10nService.getWithParams(L10nKeys.commonDateFormatEn, language, params: {'day': dayName, 'month': monthName, 'date': '${now.day}'});
   }
 
   String _getInitials() {
@@ -189,7 +189,7 @@ class HomeHeader extends StatelessWidget {
               const SizedBox(width: 8),
               // Search icon
               Semantics(
-                label: L10nService.get('today.home_header.search', language),
+                label: L10nService.get(L10nKeys.todayHomeHeaderSearch, language),
                 button: true,
                 child: TapScale(
                   onTap: () {
@@ -221,7 +221,7 @@ class HomeHeader extends StatelessWidget {
               const SizedBox(width: 8),
               // Avatar circle -> Settings
               Semantics(
-                label: L10nService.get('today.home_header.profile_settings', language),
+                label: L10nService.get(L10nKeys.todayHomeHeaderProfileSettings, language),
                 button: true,
                 child: TapScale(
                   onTap: () {
@@ -46,7 +46,7 @@ class MoodStatsStrip extends ConsumerWidget {
         ? todaySignal.localizedName(language)
         : todayMood != null
             ? _moodLabel(todayMood.mood)
-            : (L10nService.get('today.mood_stats_strip.check_in', language));
+            : (L10nService.get(L10nKeys.todayMoodStatsStripCheckIn, language));
     final hasNoMood = todayMood == null;
 
     // Get last 7 days' mood emojis
@@ -101,7 +101,7 @@ class MoodStatsStrip extends ConsumerWidget {
                 child: _StripPill(
                   icon: Icons.local_fire_department_rounded,
                   iconColor: AppColors.streakOrange,
-                  label: L10nService.getWithParams('today.mood_stats.streak_label', language, params: {'count': '$streakCount'}),
+                  label: L10nService.getWithParams(L10nKeys.todayMoodStatsStreakLabel, language, params: {'count': '$streakCount'}),
                   isDark: isDark,
                   onTap: () {
                     HapticService.selectionTap();
@@ -115,7 +115,7 @@ class MoodStatsStrip extends ConsumerWidget {
                 child: _StripPill(
                   icon: Icons.auto_stories_rounded,
                   iconColor: AppColors.amethyst,
-                  label: L10nService.getWithParams('today.mood_stats.entries_label', language, params: {'count': '$entryCount'}),
+                  label: L10nService.getWithParams(L10nKeys.todayMoodStatsEntriesLabel, language, params: {'count': '$entryCount'}),
                   isDark: isDark,
                   onTap: () {
                     HapticService.selectionTap();
@@ -197,21 +197,21 @@ class MoodStatsStrip extends ConsumerWidget {
           data: (service) => service.getAllEntries().length,
         ) ??
         0;
-    return L10nService.getWithParams('today.mood_stats.mood_count', language, params: {'count': '$count'});
+    return L10nService.getWithParams(L10nKeys.todayMoodStatsMoodCount, language, params: {'count': '$count'});
   }
 
   String _moodLabel(int mood) {
     switch (mood) {
       case 1:
-        return L10nService.get('today.mood_stats.mood_low', language);
+        return L10nService.get(L10nKeys.todayMoodStatsMoodLow, language);
       case 2:
-        return L10nService.get('today.mood_stats.mood_meh', language);
+        return L10nService.get(L10nKeys.todayMoodStatsMoodMeh, language);
       case 3:
-        return L10nService.get('today.mood_stats.mood_okay', language);
+        return L10nService.get(L10nKeys.todayMoodStatsMoodOkay, language);
       case 4:
-        return L10nService.get('today.mood_stats.mood_good', language);
+        return L10nService.get(L10nKeys.todayMoodStatsMoodGood, language);
       case 5:
-        return L10nService.get('today.mood_stats.mood_great', language);
+        return L10nService.get(L10nKeys.todayMoodStatsMoodGreat, language);
       default:
         return '';
     }
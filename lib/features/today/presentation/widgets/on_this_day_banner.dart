@@ -135,7 +135,7 @@ class _OnThisDayBannerState extends ConsumerState<OnThisDayBanner> {
           padding: const EdgeInsets.symmetric(horizontal: 24, vertical: 8),
           child: Semantics(
             button: true,
-            label: L10nService.get('today.on_this_day.view_memories_from_this_day', language),
+            label: L10nService.get(L10nKeys.todayOnThisDayViewMemoriesFromThisDay, language),
             child: TapScale(
               onTap: () => context.push(Routes.memories),
               child: PremiumCard(
@@ -164,7 +164,7 @@ class _PromotionalBannerStackState
 
         Widget card = Semantics(
           button: true,
-          label: L10nService.get('today.promotional_stack.limited_time_offer', language),
+          label: L10nService.get(L10nKeys.todayPromotionalStackLimitedTimeOffer, language),
           child: TapScale(
             onTap: () {
               HapticService.buttonPress();
@@ -183,7 +183,7 @@ class _PromotionalBannerStackState
                       const SizedBox(width: 6),
                       Expanded(
                         child: GradientText(
-                          L10nService.get('today.promotional_stack.50_off_new_user_offer', language),
+                          L10nService.get(L10nKeys.todayPromotionalStack50OffNewUserOffer, language),
                           variant: GradientTextVariant.gold,
                           style: AppTypography.displayFont.copyWith(
                             fontSize: 15,
@@ -256,7 +256,7 @@ class _PromotionalBannerStackState
                       ),
                       const Spacer(),
                       GradientButton.gold(
-                        label: L10nService.get('today.promotional_stack.claim', language),
+                        label: L10nService.get(L10nKeys.todayPromotionalStackClaim, language),
                         onPressed: () => context.push(Routes.premium),
                       ),
                     ],
@@ -295,7 +295,7 @@ class _PromotionalBannerStackState
 
             return Semantics(
               button: true,
-              label: L10nService.get('today.promotional_stack.view_upcoming_reminders', language),
+              label: L10nService.get(L10nKeys.todayPromotionalStackViewUpcomingReminders, language),
               child: TapScale(
                 onTap: () => context.push(Routes.notesList),
                 child: PremiumCard(
@@ -311,7 +311,7 @@ class _PromotionalBannerStackState
                           const SizedBox(width: 6),
                           Flexible(
                             child: GradientText(
-                              L10nService.get('today.promotional_stack.upcoming_reminders', language),
+                              L10nService.get(L10nKeys.todayPromotionalStackUpcomingReminders, language),
                               variant: GradientTextVariant.gold,
                               maxLines: 1,
                               overflow: TextOverflow.ellipsis,
@@ -323,7 +323,7 @@ class _PromotionalBannerStackState
                           ),
                           const SizedBox(width: 8),
                           Text(
-                            L10nService.get('today.promotional_stack.see_all', language),
+                            L10nService.get(L10nKeys.todayPromotionalStackSeeAll, language),
                             style: AppTypography.elegantAccent(
                               fontSize: 13,
                               color: isDark
@@ -351,7 +351,7 @@ class _PromotionalBannerStackState
                               const SizedBox(width: 8),
                               Expanded(
                                 child: Text(
-                                  note?.title ?? (L10nService.get('today.promotional_stack.note', language)),
+                                  note?.title ?? (L10nService.get(L10nKeys.todayPromotionalStackNote, language)),
                                   style: AppTypography.subtitle(
                                     fontSize: 14,
                                     color: isDark
@@ -409,7 +409,7 @@ class _PromotionalBannerStackState
 
     return Semantics(
       button: true,
-      label: L10nService.get('today.promotional_stack.add_retrospective_entries', language),
+      label: L10nService.get(L10nKeys.todayPromotionalStackAddRetrospectiveEntries, language),
       child: TapScale(
         onTap: () {
           HapticService.buttonPress();
@@ -432,7 +432,7 @@ class _PromotionalBannerStackState
                   crossAxisAlignment: CrossAxisAlignment.start,
                   children: [
                     Text(
-                      L10nService.get('today.promotional_stack.add_entries_for_your_most_meaningful_day', language),
+                      L10nService.get(L10nKeys.todayPromotionalStackAddEntriesForYourMostMeaningfulDay, language),
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 16,
                         fontWeight: FontWeight.w600,
@@ -443,7 +443,7 @@ class _PromotionalBannerStackState
                     ),
                     const SizedBox(height: 2),
                     Text(
-                      L10nService.get('today.promotional_stack.your_story_didnt_start_today', language),
+                      L10nService.get(L10nKeys.todayPromotionalStackYourStoryDidntStartToday, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 14,
                         color: isDark
@@ -479,7 +479,7 @@ class _PromotionalBannerStackState
 
     return Semantics(
       button: true,
-      label: L10nService.get('today.promotional_stack.view_year_wrapped', language),
+      label: L10nService.get(L10nKeys.todayPromotionalStackViewYearWrapped, language),
       child: TapScale(
         onTap: () {
           HapticService.buttonPress();
@@ -509,7 +509,7 @@ class _PromotionalBannerStackState
                     ),
                     const SizedBox(height: 2),
                     Text(
-                      L10nService.get('today.promotional_stack.see_your_year_in_patterns', language),
+                      L10nService.get(L10nKeys.todayPromotionalStackSeeYourYearInPatterns, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 14,
                         color: isDark
@@ -549,7 +549,7 @@ class _PromotionalBannerStackState
 
     return Semantics(
       button: true,
-      label: L10nService.get('today.promotional_stack.view_monthly_wrapped', language),
+      label: L10nService.get(L10nKeys.todayPromotionalStackViewMonthlyWrapped, language),
       child: TapScale(
         onTap: () {
           HapticService.buttonPress();
@@ -579,7 +579,7 @@ class _PromotionalBannerStackState
                     ),
                     const SizedBox(height: 2),
                     Text(
-                      L10nService.get('today.promotional_stack.see_your_month_at_a_glance_share_it', language),
+                      L10nService.get(L10nKeys.todayPromotionalStackSeeYourMonthAtAGlanceShareIt, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 14,
                         color: isDark
@@ -646,7 +646,7 @@ class _PromotionalBannerStackState
 
     return Semantics(
       button: true,
-      label: L10nService.get('today.promotional_stack.share_weekly_insights', language),
+      label: L10nService.get(L10nKeys.todayPromotionalStackShareWeeklyInsights, language),
       child: TapScale(
         onTap: () {
           HapticService.buttonPress();
@@ -671,7 +671,7 @@ class _PromotionalBannerStackState
                   crossAxisAlignment: CrossAxisAlignment.start,
                   children: [
                     GradientText(
-                      L10nService.get('today.promotional_stack.your_latest_pattern_card_is_ready', language),
+                      L10nService.get(L10nKeys.todayPromotionalStackYourLatestPatternCardIsReady, language),
                       variant: GradientTextVariant.aurora,
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 16,
@@ -680,7 +680,7 @@ class _PromotionalBannerStackState
                     ),
                     const SizedBox(height: 2),
                     Text(
-                      L10nService.get('today.promotional_stack.share_your_weeks_insights', language),
+                      L10nService.get(L10nKeys.todayPromotionalStackShareYourWeeksInsights, language),
                       style: AppTypography.elegantAccent(
                         fontSize: 14,
                         color: isDark
@@ -940,7 +940,7 @@ class _PromotionalBannerStackState
               const SizedBox(width: 10),
               Expanded(
                 child: GradientText(
-                  L10nService.get('today.promotional_stack.enjoying_innercycles', language),
+                  L10nService.get(L10nKeys.todayPromotionalStackEnjoyingInnercycles, language),
                   variant: GradientTextVariant.gold,
                   style: AppTypography.displayFont.copyWith(
                     fontSize: 16,
@@ -964,7 +964,7 @@ class _PromotionalBannerStackState
           Padding(
             padding: const EdgeInsets.only(left: 32),
             child: Text(
-              L10nService.get('today.promotional_stack.share_it_with_a_friend_who_would_love_it', language),
+              L10nService.get(L10nKeys.todayPromotionalStackShareItWithAFriendWhoWouldLoveIt, language),
               style: AppTypography.elegantAccent(
                 fontSize: 14,
                 color: isDark
@@ -977,7 +977,7 @@ class _PromotionalBannerStackState
           Padding(
             padding: const EdgeInsets.only(left: 32),
             child: GradientButton.gold(
-              label: L10nService.get('today.promotional_stack.invite_earn_premium', language),
+              label: L10nService.get(L10nKeys.todayPromotionalStackInviteEarnPremium, language),
               icon: Icons.card_giftcard_rounded,
               onPressed: () {
                 HapticService.buttonPress();
@@ -994,14 +994,14 @@ class _PromotionalBannerStackState
 
     final now = DateTime.now();
     final diff = dt.difference(now);
-    if (diff.isNegative) return L10nService.get('today.promotional_stack.now', language);
+    if (diff.isNegative) return L10nService.get(L10nKeys.todayPromotionalStackNow, language);
     if (diff.inMinutes < 60) {
-      return L10nService.getWithParams('common.time.in_minutes', language, params: {'count': '${diff.inMinutes}'});
+      return L10nService.getWithParams(L10nKeys.commonTimeInMinutes, language, params: {'count': '${diff.inMinutes}'});
     }
     if (diff.inHours < 24) {
-      return L10nService.getWithParams('common.time.in_hours', language, params: {'count': '${diff.inHours}'});
+      return L10nService.getWithParams(L10nKeys.commonTimeInHours, language, params: {'count': '${diff.inHours}'});
     }
-    return L10nService.getWithParams('common.time.in_days', language, params: {'count': '${diff.inDays}'});
+    return L10nService.getWithParams(L10nKeys.commonTimeInDays, language, params: {'count': '${diff.inDays}'});
   }
 }
 
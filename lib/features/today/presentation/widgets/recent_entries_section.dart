@@ -102,7 +102,7 @@ class RecentEntriesSection extends ConsumerWidget {
                   mainAxisAlignment: MainAxisAlignment.spaceBetween,
                   children: [
                     GradientText(
-                      L10nService.get('today.recent_entries.recent_entries', language),
+                      L10nService.get(L10nKeys.todayRecentEntriesRecentEntries, language),
                       variant: GradientTextVariant.aurora,
                       style: AppTypography.displayFont.copyWith(
                         fontSize: 17,
@@ -111,7 +111,7 @@ class RecentEntriesSection extends ConsumerWidget {
                       ),
                     ),
                     Semantics(
-                      label: L10nService.get('today.recent_entries.see_all_entries', language),
+                      label: L10nService.get(L10nKeys.todayRecentEntriesSeeAllEntries, language),
                       button: true,
                       child: GestureDetector(
                         onTap: () {
@@ -124,7 +124,7 @@ class RecentEntriesSection extends ConsumerWidget {
                           child: Align(
                             alignment: Alignment.centerRight,
                             child: Text(
-                              L10nService.get('today.recent_entries.see_all', language),
+                              L10nService.get(L10nKeys.todayRecentEntriesSeeAll, language),
                               style: AppTypography.subtitle(
                                 fontSize: 14,
                                 color: isDark
@@ -315,15 +315,15 @@ class RecentEntriesSection extends ConsumerWidget {
   String _focusAreaLabel(FocusArea area) {
     switch (area) {
       case FocusArea.energy:
-        return L10nService.get('today.recent_entries.energy', language);
+        return L10nService.get(L10nKeys.todayRecentEntriesEnergy, language);
       case FocusArea.focus:
-        return L10nService.get('today.recent_entries.focus', language);
+        return L10nService.get(L10nKeys.todayRecentEntriesFocus, language);
       case FocusArea.emotions:
-        return L10nService.get('today.recent_entries.emotions', language);
+        return L10nService.get(L10nKeys.todayRecentEntriesEmotions, language);
       case FocusArea.decisions:
-        return L10nService.get('today.recent_entries.decisions', language);
+        return L10nService.get(L10nKeys.todayRecentEntriesDecisions, language);
       case FocusArea.social:
-        return L10nService.get('today.recent_entries.social', language);
+        return L10nService.get(L10nKeys.todayRecentEntriesSocial, language);
     }
   }
 }
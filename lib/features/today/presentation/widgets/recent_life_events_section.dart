@@ -56,7 +56,7 @@ class RecentLifeEventsSection extends ConsumerWidget {
                 children: [
                   Flexible(
                     child: GradientText(
-                      L10nService.get('today.recent_life_events.recent_life_events', language),
+                      L10nService.get(L10nKeys.todayRecentLifeEventsRecentLifeEvents, language),
                       variant: GradientTextVariant.amethyst,
                       maxLines: 1,
                       overflow: TextOverflow.ellipsis,
@@ -70,11 +70,11 @@ class RecentLifeEventsSection extends ConsumerWidget {
                   const SizedBox(width: 8),
                   Semantics(
                     button: true,
-                    label: L10nService.get('today.recent_life_events.see_all_life_events', language),
+                    label: L10nService.get(L10nKeys.todayRecentLifeEventsSeeAllLifeEvents, language),
                     child: GestureDetector(
                       onTap: () => context.push(Routes.lifeTimeline),
                       child: Text(
-                        L10nService.get('today.recent_life_events.see_all', language),
+                        L10nService.get(L10nKeys.todayRecentLifeEventsSeeAll, language),
                         style: AppTypography.subtitle(
                           fontSize: 14,
                           color: isDark
@@ -201,7 +201,7 @@ class RecentLifeEventsSection extends ConsumerWidget {
       padding: const EdgeInsets.fromLTRB(20, 0, 20, 16),
       child: Semantics(
         button: true,
-        label: L10nService.get('today.recent_life_events.record_a_life_event', language),
+        label: L10nService.get(L10nKeys.todayRecentLifeEventsRecordALifeEvent, language),
         child: TapScale(
           onTap: () {
             HapticService.buttonPress();
@@ -228,7 +228,7 @@ class RecentLifeEventsSection extends ConsumerWidget {
                     crossAxisAlignment: CrossAxisAlignment.start,
                     children: [
                       Text(
-                        L10nService.get('today.recent_life_events.any_big_moments_this_week', language),
+                        L10nService.get(L10nKeys.todayRecentLifeEventsAnyBigMomentsThisWeek, language),
                         style: AppTypography.displayFont.copyWith(
                           fontSize: 16,
                           fontWeight: FontWeight.w600,
@@ -238,7 +238,7 @@ class RecentLifeEventsSection extends ConsumerWidget {
                         ),
                       ),
                       Text(
-                        L10nService.get('today.recent_life_events.record_a_life_event_1', language),
+                        L10nService.get(L10nKeys.todayRecentLifeEventsRecordALifeEvent1, language),
                         style: AppTypography.elegantAccent(
                           fontSize: 14,
                           color: isDark
@@ -34,7 +34,7 @@ class TodayBirthdayBanner extends ConsumerWidget {
           padding: const EdgeInsets.symmetric(horizontal: 24),
           child: Semantics(
             button: true,
-            label: L10nService.get('today.today_birthday.view_birthday_agenda', language),
+            label: L10nService.get(L10nKeys.todayTodayBirthdayViewBirthdayAgenda, language),
             child: TapScale(
               onTap: () => context.push(Routes.birthdayAgenda),
               child: PremiumCard(
@@ -86,7 +86,7 @@ class TodayBirthdayBanner extends ConsumerWidget {
                           ),
                           const SizedBox(height: 2),
                           Text(
-                            L10nService.get('today.today_birthday.u1f382_birthday_today', language),
+                            L10nService.get(L10nKeys.todayTodayBirthdayU1f382BirthdayToday, language),
                             style: AppTypography.subtitle(
                               fontSize: 14,
                               color: AppColors.starGold,
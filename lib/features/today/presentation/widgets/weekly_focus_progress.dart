@@ -67,7 +67,7 @@ class WeeklyFocusProgress extends ConsumerWidget {
               Flexible(
                 flex: 0,
                 child: Text(
-                  L10nService.get('today.weekly_focus_progress.week', language),
+                  L10nService.get(L10nKeys.todayWeeklyFocusProgressWeek, language),
                   style: AppTypography.elegantAccent(
                     fontSize: 12,
                     color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -145,7 +145,7 @@ class _ToolCatalogScreenState extends ConsumerState<ToolCatalogScreen> {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('tools.tool_catalog.tools', language),
+                  title: L10nService.get(L10nKeys.toolsToolCatalogTools, language),
                   showBackButton: false,
                 ),
                 SliverPadding(
@@ -218,7 +218,7 @@ class _ToolCatalogScreenState extends ConsumerState<ToolCatalogScreen> {
           color: isDark ? AppColors.textPrimary : AppColors.lightTextPrimary,
         ),
         decoration: InputDecoration(
-          hintText: L10nService.get('tools.tool_catalog.search_by_name_or_category', language),
+          hintText: L10nService.get(L10nKeys.toolsToolCatalogSearchByNameOrCategory, language),
           hintStyle: AppTypography.subtitle(
             color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
           ),
@@ -229,7 +229,7 @@ class _ToolCatalogScreenState extends ConsumerState<ToolCatalogScreen> {
           ),
           suffixIcon: _searchController.text.isNotEmpty
               ? IconButton(
-                  tooltip: L10nService.get('tools.tool_catalog.clear_search', language),
+                  tooltip: L10nService.get(L10nKeys.toolsToolCatalogClearSearch, language),
                   onPressed: () {
                     _searchController.clear();
                     setState(() => _searchQuery = '');
@@ -268,7 +268,7 @@ class _ToolCatalogScreenState extends ConsumerState<ToolCatalogScreen> {
           ),
           const SizedBox(height: AppConstants.spacingLg),
           Text(
-            L10nService.get('tools.tool_catalog.no_tools_found', language),
+            L10nService.get(L10nKeys.toolsToolCatalogNoToolsFound, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 18,
               fontWeight: FontWeight.w600,
@@ -609,8 +609,8 @@ class _ToolCard extends ConsumerWidget {
                   Semantics(
                     button: true,
                     label: isFavorite
-                        ? (L10nService.get('tools.tool_catalog.remove_from_favorites', language))
-                        : (L10nService.get('tools.tool_catalog.add_to_favorites', language)),
+                        ? (L10nService.get(L10nKeys.toolsToolCatalogRemoveFromFavorites, language))
+                        : (L10nService.get(L10nKeys.toolsToolCatalogAddToFavorites, language)),
                     child: GestureDetector(
                       onTap: onFavoriteToggle,
                       behavior: HitTestBehavior.opaque,
@@ -139,7 +139,7 @@ class _VaultPinScreenState extends ConsumerState<VaultPinScreen> {
             _pin = '';
             _firstPin = '';
             _currentMode = _PinMode.setup;
-            _error = L10nService.get('vault.vault_pin.those_dont_match_no_worries_try_again', language);
+            _error = L10nService.get(L10nKeys.vaultVaultPinThoseDontMatchNoWorriesTryAgain, language);
           });
         }
         break;
@@ -167,7 +167,7 @@ class _VaultPinScreenState extends ConsumerState<VaultPinScreen> {
                   ? 'Too many attempts. Try again in ${minutes}m ${seconds}s'
                   : 'Çok fazla deneme. ${minutes}dk ${seconds}sn sonra tekrar deneyin';
             } else {
-              _error = '${L10nService.get('vault.vault_pin.that_pin_didnt_match_try_again', language)}'
+              _error = '${L10nService.get(L10nKeys.vaultVaultPinThatPinDidntMatchTryAgain, language)}'
                   ' ($attemptsLeft ${isEn ? 'left' : 'kaldı'})';
             }
           });
@@ -188,18 +188,18 @@ class _VaultPinScreenState extends ConsumerState<VaultPinScreen> {
     final result = await showCupertinoDialog<bool>(
       context: context,
       builder: (ctx) => CupertinoAlertDialog(
-        title: Text(L10nService.get('vault.vault_pin.enable_face_id', language)),
+        title: Text(L10nService.get(L10nKeys.vaultVaultPinEnableFaceId, language)),
         content: Text(
-          L10nService.get('vault.vault_pin.use_face_id_to_quickly_access_your_vault', language),
+          L10nService.get(L10nKeys.vaultVaultPinUseFaceIdToQuicklyAccessYourVault, language),
         ),
         actions: [
           CupertinoDialogAction(
-            child: Text(L10nService.get('vault.vault_pin.not_now', language)),
+            child: Text(L10nService.get(L10nKeys.vaultVaultPinNotNow, language)),
             onPressed: () => Navigator.pop(ctx, false),
           ),
           CupertinoDialogAction(
             isDefaultAction: true,
-            child: Text(L10nService.get('vault.vault_pin.enable', language)),
+            child: Text(L10nService.get(L10nKeys.vaultVaultPinEnable, language)),
             onPressed: () => Navigator.pop(ctx, true),
           ),
         ],
@@ -217,20 +217,20 @@ class _VaultPinScreenState extends ConsumerState<VaultPinScreen> {
     String subtitle;
     switch (_currentMode) {
       case _PinMode.setup:
-        title = L10nService.get('vault.vault_pin.create_pin', language);
-        subtitle = L10nService.get('vault.vault_pin.choose_a_4digit_pin_for_your_vault', language);
+        title = L10nService.get(L10nKeys.vaultVaultPinCreatePin, language);
+        subtitle = L10nService.get(L10nKeys.vaultVaultPinChooseA4digitPinForYourVault, language);
         break;
       case _PinMode.confirm:
-        title = L10nService.get('vault.vault_pin.confirm_pin', language);
-        subtitle = L10nService.get('vault.vault_pin.enter_the_same_pin_again', language);
+        title = L10nService.get(L10nKeys.vaultVaultPinConfirmPin, language);
+        subtitle = L10nService.get(L10nKeys.vaultVaultPinEnterTheSamePinAgain, language);
         break;
       case _PinMode.verify:
-        title = L10nService.get('vault.vault_pin.enter_pin', language);
-        subtitle = L10nService.get('vault.vault_pin.enter_your_vault_pin', language);
+        title = L10nService.get(L10nKeys.vaultVaultPinEnterPin, language);
+        subtitle = L10nService.get(L10nKeys.vaultVaultPinEnterYourVaultPin, language);
         break;
       case _PinMode.change:
-        title = L10nService.get('vault.vault_pin.new_pin', language);
-        subtitle = L10nService.get('vault.vault_pin.choose_a_new_4digit_pin', language);
+        title = L10nService.get(L10nKeys.vaultVaultPinNewPin, language);
+        subtitle = L10nService.get(L10nKeys.vaultVaultPinChooseANew4digitPin, language);
         break;
     }
 
@@ -249,7 +249,7 @@ class _VaultPinScreenState extends ConsumerState<VaultPinScreen> {
                       CupertinoIcons.chevron_back,
                       color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
                     ),
-                    tooltip: L10nService.get('vault.vault_pin.back', language),
+                    tooltip: L10nService.get(L10nKeys.vaultVaultPinBack, language),
                     onPressed: () => context.pop(),
                   ),
                 ),
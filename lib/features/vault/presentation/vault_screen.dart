@@ -53,13 +53,13 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
             ),
             slivers: [
               GlassSliverAppBar(
-                title: L10nService.get('vault.vault.private_vault', language),
+                title: L10nService.get(L10nKeys.vaultVaultPrivateVault, language),
                 useGradientTitle: true,
                 gradientVariant: GradientTextVariant.amethyst,
                 actions: [
                   Semantics(
                     button: true,
-                    label: L10nService.get('vault.vault.vault_settings', language),
+                    label: L10nService.get(L10nKeys.vaultVaultVaultSettings, language),
                     child: GestureDetector(
                       onTap: () => _showVaultSettings(isEn, isDark),
                       child: Padding(
@@ -213,7 +213,7 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
       if (journals.isNotEmpty) {
         items.add(
           _buildSectionHeader(
-            L10nService.get('vault.vault.private_journals', language),
+            L10nService.get(L10nKeys.vaultVaultPrivateJournals, language),
             '${journals.length}',
             isDark,
           ),
@@ -229,7 +229,7 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
       if (notes.isNotEmpty) {
         items.add(
           _buildSectionHeader(
-            L10nService.get('vault.vault.private_notes', language),
+            L10nService.get(L10nKeys.vaultVaultPrivateNotes, language),
             '${notes.length}',
             isDark,
           ),
@@ -245,7 +245,7 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
       if (photos.isNotEmpty) {
         items.add(
           _buildSectionHeader(
-            L10nService.get('vault.vault.private_photos', language),
+            L10nService.get(L10nKeys.vaultVaultPrivatePhotos, language),
             '${photos.length}',
             isDark,
           ),
@@ -281,7 +281,7 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
           ),
           const SizedBox(height: 20),
           Text(
-            L10nService.get('vault.vault.your_vault_is_empty', language),
+            L10nService.get(L10nKeys.vaultVaultYourVaultIsEmpty, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 20,
               fontWeight: FontWeight.w600,
@@ -290,7 +290,7 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
           ),
           const SizedBox(height: 8),
           Text(
-            L10nService.get('vault.vault.mark_journals_or_notes_as_private_or_add', language),
+            L10nService.get(L10nKeys.vaultVaultMarkJournalsOrNotesAsPrivateOrAdd, language),
             textAlign: TextAlign.center,
             style: AppTypography.subtitle(
               fontSize: 14,
@@ -460,7 +460,7 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
                     Text(
                       note.title.isNotEmpty
                           ? note.title
-                          : (L10nService.get('vault.vault.untitled', language)),
+                          : (L10nService.get(L10nKeys.vaultVaultUntitled, language)),
                       style: AppTypography.subtitle(
                         fontSize: 14,
                         color: isDark
@@ -555,10 +555,10 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
 
     final confirmed = await GlassDialog.confirm(
       context,
-      title: L10nService.get('vault.vault.delete_photo', language),
-      message: L10nService.get('vault.vault.this_photo_will_be_permanently_deleted_f', language),
-      cancelLabel: L10nService.get('vault.vault.cancel', language),
-      confirmLabel: L10nService.get('vault.vault.delete', language),
+      title: L10nService.get(L10nKeys.vaultVaultDeletePhoto, language),
+      message: L10nService.get(L10nKeys.vaultVaultThisPhotoWillBePermanentlyDeletedF, language),
+      cancelLabel: L10nService.get(L10nKeys.vaultVaultCancel, language),
+      confirmLabel: L10nService.get(L10nKeys.vaultVaultDelete, language),
       isDestructive: true,
     );
 
@@ -593,14 +593,14 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
     showCupertinoModalPopup(
       context: context,
       builder: (ctx) => CupertinoActionSheet(
-        title: Text(L10nService.get('vault.vault.vault_settings_1', language)),
+        title: Text(L10nService.get(L10nKeys.vaultVaultVaultSettings1, language)),
         actions: [
           CupertinoActionSheetAction(
             onPressed: () {
               Navigator.pop(ctx);
               context.push(Routes.vaultPin, extra: {'mode': 'change'});
             },
-            child: Text(L10nService.get('vault.vault.change_pin', language)),
+            child: Text(L10nService.get(L10nKeys.vaultVaultChangePin, language)),
           ),
           CupertinoActionSheetAction(
             onPressed: () async {
@@ -623,8 +623,8 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
                 final enabled = snap.data?.isBiometricEnabled ?? false;
                 return Text(
                   enabled
-                      ? (L10nService.get('vault.vault.disable_face_id', language))
-                      : (L10nService.get('vault.vault.enable_face_id', language)),
+                      ? (L10nService.get(L10nKeys.vaultVaultDisableFaceId, language))
+                      : (L10nService.get(L10nKeys.vaultVaultEnableFaceId, language)),
                 );
               },
             ),
@@ -632,7 +632,7 @@ class _VaultScreenState extends ConsumerState<VaultScreen> {
         ],
         cancelButton: CupertinoActionSheetAction(
           onPressed: () => Navigator.pop(ctx),
-          child: Text(L10nService.get('vault.vault.cancel_1', language)),
+          child: Text(L10nService.get(L10nKeys.vaultVaultCancel1, language)),
         ),
       ),
     );
@@ -44,7 +44,7 @@ class WellnessDetailScreen extends ConsumerWidget {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('wellness.wellness_detail.wellness_score', language),
+                  title: L10nService.get(L10nKeys.wellnessWellnessDetailWellnessScore, language),
                   actions: [
                     scoreAsync.whenOrNull(
                       data: (score) {
@@ -77,7 +77,7 @@ class WellnessDetailScreen extends ConsumerWidget {
                               mainAxisSize: MainAxisSize.min,
                               children: [
                                 Text(
-                                  L10nService.get('wellness.wellness_detail.could_not_load_your_local_data_is_unaffe', language),
+                                  L10nService.get(L10nKeys.wellnessWellnessDetailCouldNotLoadYourLocalDataIsUnaffe, language),
                                   textAlign: TextAlign.center,
                                   style: AppTypography.decorativeScript(
                                     fontSize: 14,
@@ -96,7 +96,7 @@ class WellnessDetailScreen extends ConsumerWidget {
                                     color: AppColors.starGold,
                                   ),
                                   label: Text(
-                                    L10nService.get('wellness.wellness_detail.retry', language),
+                                    L10nService.get(L10nKeys.wellnessWellnessDetailRetry, language),
                                     style: AppTypography.elegantAccent(
                                       fontSize: 13,
                                       fontWeight: FontWeight.w600,
@@ -198,10 +198,10 @@ class WellnessDetailScreen extends ConsumerWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.favorite_outline,
-      title: L10nService.get('wellness.wellness_detail.your_wellness_score_is_building', language),
-      description: L10nService.get('wellness.wellness_detail.log_a_cycle_entry_gratitude_or_sleep_to', language),
+      title: L10nService.get(L10nKeys.wellnessWellnessDetailYourWellnessScoreIsBuilding, language),
+      description: L10nService.get(L10nKeys.wellnessWellnessDetailLogACycleEntryGratitudeOrSleepTo, language),
       gradientVariant: GradientTextVariant.aurora,
-      ctaLabel: L10nService.get('wellness.wellness_detail.write_journal_entry', language),
+      ctaLabel: L10nService.get(L10nKeys.wellnessWellnessDetailWriteJournalEntry, language),
       onCtaPressed: () => context.push(Routes.journal),
     );
   }
@@ -215,7 +215,7 @@ class WellnessDetailScreen extends ConsumerWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('wellness.wellness_detail.how_your_score_works', language),
+            L10nService.get(L10nKeys.wellnessWellnessDetailHowYourScoreWorks, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 17,
@@ -225,27 +225,27 @@ class WellnessDetailScreen extends ConsumerWidget {
           const SizedBox(height: 10),
           _TipRow(
             icon: Icons.edit_note,
-            text: L10nService.get('wellness.wellness_detail.journal_rating_40_of_score', language),
+            text: L10nService.get(L10nKeys.wellnessWellnessDetailJournalRating40OfScore, language),
             isDark: isDark,
           ),
           _TipRow(
             icon: Icons.favorite_border,
-            text: L10nService.get('wellness.wellness_detail.gratitude_items_15', language),
+            text: L10nService.get(L10nKeys.wellnessWellnessDetailGratitudeItems15, language),
             isDark: isDark,
           ),
           _TipRow(
             icon: Icons.playlist_add_check,
-            text: L10nService.get('wellness.wellness_detail.ritual_completion_15', language),
+            text: L10nService.get(L10nKeys.wellnessWellnessDetailRitualCompletion15, language),
             isDark: isDark,
           ),
           _TipRow(
             icon: Icons.local_fire_department,
-            text: L10nService.get('wellness.wellness_detail.streak_consistency_15', language),
+            text: L10nService.get(L10nKeys.wellnessWellnessDetailStreakConsistency15, language),
             isDark: isDark,
           ),
           _TipRow(
             icon: Icons.bedtime_outlined,
-            text: L10nService.get('wellness.wellness_detail.sleep_quality_15', language),
+            text: L10nService.get(L10nKeys.wellnessWellnessDetailSleepQuality15, language),
             isDark: isDark,
           ),
         ],
@@ -319,7 +319,7 @@ class _ScoreHero extends StatelessWidget {
           ),
           const SizedBox(height: 4),
           Text(
-            L10nService.get('wellness.wellness_detail.out_of_100', language),
+            L10nService.get(L10nKeys.wellnessWellnessDetailOutOf100, language),
             style: AppTypography.elegantAccent(
               fontSize: 13,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -340,11 +340,11 @@ class _ScoreHero extends StatelessWidget {
 
   String _scoreLabel(int score, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
-    if (score >= 80) return L10nService.get('wellness.wellness_detail.thriving', language);
-    if (score >= 60) return L10nService.get('wellness.wellness_detail.good_balance', language);
-    if (score >= 40) return L10nService.get('wellness.wellness_detail.room_to_grow', language);
-    if (score >= 20) return L10nService.get('wellness.wellness_detail.getting_started', language);
-    return L10nService.get('wellness.wellness_detail.get_started', language);
+    if (score >= 80) return L10nService.get(L10nKeys.wellnessWellnessDetailThriving, language);
+    if (score >= 60) return L10nService.get(L10nKeys.wellnessWellnessDetailGoodBalance, language);
+    if (score >= 40) return L10nService.get(L10nKeys.wellnessWellnessDetailRoomToGrow, language);
+    if (score >= 20) return L10nService.get(L10nKeys.wellnessWellnessDetailGettingStarted, language);
+    return L10nService.get(L10nKeys.wellnessWellnessDetailGetStarted, language);
   }
 }
 
@@ -369,7 +369,7 @@ class _BreakdownDetail extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           Text(
-            L10nService.get('wellness.wellness_detail.score_breakdown', language),
+            L10nService.get(L10nKeys.wellnessWellnessDetailScoreBreakdown, language),
             style: AppTypography.displayFont.copyWith(
               fontSize: 17,
               fontWeight: FontWeight.w600,
@@ -471,15 +471,15 @@ class _BreakdownDetail extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     switch (category) {
       case 'journal':
-        return L10nService.get('wellness.wellness_detail.journal_rating', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailJournalRating, language);
       case 'gratitude':
-        return L10nService.get('wellness.wellness_detail.gratitude_practice', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailGratitudePractice, language);
       case 'rituals':
-        return L10nService.get('wellness.wellness_detail.ritual_completion', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailRitualCompletion, language);
       case 'streak':
-        return L10nService.get('wellness.wellness_detail.streak_consistency', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailStreakConsistency, language);
       case 'sleep':
-        return L10nService.get('wellness.wellness_detail.sleep_quality', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailSleepQuality, language);
       default:
         return category;
     }
@@ -519,7 +519,7 @@ class _WeeklyTrendChart extends StatelessWidget {
           Row(
             children: [
               Text(
-                L10nService.get('wellness.wellness_detail.weekly_trend', language),
+                L10nService.get(L10nKeys.wellnessWellnessDetailWeeklyTrend, language),
                 style: AppTypography.displayFont.copyWith(
                   fontSize: 17,
                   fontWeight: FontWeight.w600,
@@ -623,11 +623,11 @@ class _WeeklyTrendChart extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     switch (direction) {
       case 'up':
-        return L10nService.get('wellness.wellness_detail.improving', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailImproving, language);
       case 'down':
-        return L10nService.get('wellness.wellness_detail.declining', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailDeclining, language);
       default:
-        return L10nService.get('wellness.wellness_detail.stable', language);
+        return L10nService.get(L10nKeys.wellnessWellnessDetailStable, language);
     }
   }
 
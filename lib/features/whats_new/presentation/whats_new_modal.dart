@@ -219,7 +219,7 @@ class _WhatsNewSheet extends StatelessWidget {
 
               // ---- Header ----
               GradientText(
-                    L10nService.get('whats_new.title', language),
+                    L10nService.get(L10nKeys.whatsNewTitle, language),
                     variant: GradientTextVariant.aurora,
                     style: AppTypography.displayFont.copyWith(
                       fontSize: 24,
@@ -231,7 +231,7 @@ class _WhatsNewSheet extends StatelessWidget {
                   .slideY(begin: -0.2, duration: 400.ms, curve: Curves.easeOut),
               const SizedBox(height: 4),
               Text(
-                L10nService.get('whats_new.whats_new.latest_features_and_improvements', language),
+                L10nService.get(L10nKeys.whatsNewWhatsNewLatestFeaturesAndImprovements, language),
                 style: AppTypography.decorativeScript(
                   fontSize: 14,
                   color: subtextColor,
@@ -283,7 +283,7 @@ class _WhatsNewSheet extends StatelessWidget {
                                 ),
                               ),
                               child: Text(
-                                L10nService.get('whats_new.whats_new.got_it', language),
+                                L10nService.get(L10nKeys.whatsNewWhatsNewGotIt, language),
                                 style: AppTypography.subtitle(
                                   fontSize: 16,
                                   color: Colors.white,
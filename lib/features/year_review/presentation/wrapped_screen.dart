@@ -94,7 +94,7 @@ class _WrappedScreenState extends ConsumerState<WrappedScreen> {
                   Icon(Icons.auto_awesome, color: AppColors.starGold, size: 48),
                   const SizedBox(height: 16),
                   Text(
-                    L10nService.get('year_review.wrapped.not_enough_entries_for_your_wrapped_yet', language),
+                    L10nService.get(L10nKeys.yearReviewWrappedNotEnoughEntriesForYourWrappedYet, language),
                     style: AppTypography.subtitle(
                       color: AppColors.textSecondary,
                     ),
@@ -102,7 +102,7 @@ class _WrappedScreenState extends ConsumerState<WrappedScreen> {
                   ),
                   const SizedBox(height: 8),
                   Text(
-                    L10nService.get('year_review.wrapped.keep_journaling_your_story_is_building', language),
+                    L10nService.get(L10nKeys.yearReviewWrappedKeepJournalingYourStoryIsBuilding, language),
                     style: AppTypography.subtitle(
                       fontSize: 13,
                       color: AppColors.textMuted,
@@ -113,7 +113,7 @@ class _WrappedScreenState extends ConsumerState<WrappedScreen> {
                   GestureDetector(
                     onTap: () => context.push(Routes.journal),
                     child: Text(
-                      L10nService.get('year_review.wrapped.write_an_entry', language),
+                      L10nService.get(L10nKeys.yearReviewWrappedWriteAnEntry, language),
                       style: AppTypography.modernAccent(
                         fontSize: 14,
                         fontWeight: FontWeight.w600,
@@ -138,7 +138,7 @@ class _WrappedScreenState extends ConsumerState<WrappedScreen> {
                     ),
                     const SizedBox(height: 16),
                     Text(
-                      L10nService.get('year_review.wrapped.keep_journaling_to_unlock_your_wrapped', language),
+                      L10nService.get(L10nKeys.yearReviewWrappedKeepJournalingToUnlockYourWrapped, language),
                       style: AppTypography.subtitle(
                         color: AppColors.textSecondary,
                       ),
@@ -204,7 +204,7 @@ class _WrappedScreenState extends ConsumerState<WrappedScreen> {
                         color: AppColors.textSecondary,
                         size: 24,
                       ),
-                      tooltip: L10nService.get('year_review.wrapped.close', language),
+                      tooltip: L10nService.get(L10nKeys.yearReviewWrappedClose, language),
                       onPressed: () => Navigator.of(context).pop(),
                     ),
                   ),
@@ -420,7 +420,7 @@ class _IntroCard extends StatelessWidget {
           ).animate().scale(duration: 600.ms, curve: Curves.elasticOut),
           const SizedBox(height: 24),
           GradientText(
-                L10nService.get('year_review.wrapped.your_year_in_patterns', language),
+                L10nService.get(L10nKeys.yearReviewWrappedYourYearInPatterns, language),
                 variant: GradientTextVariant.cosmic,
                 textAlign: TextAlign.center,
                 style: AppTypography.displayFont.copyWith(
@@ -448,17 +448,17 @@ class _IntroCard extends StatelessWidget {
             children: [
               _MiniStatColumn(
                 value: '${data.totalEntries}',
-                label: L10nService.get('year_review.wrapped.entries', language),
+                label: L10nService.get(L10nKeys.yearReviewWrappedEntries, language),
               ),
               _MiniStatColumn(
                 value: '${data.totalJournalingDays}',
-                label: L10nService.get('year_review.wrapped.days', language),
+                label: L10nService.get(L10nKeys.yearReviewWrappedDays, language),
               ),
             ],
           ).animate().fadeIn(delay: 600.ms, duration: 500.ms),
           const Spacer(flex: 3),
           Text(
-                L10nService.get('year_review.wrapped.swipe_to_explore', language),
+                L10nService.get(L10nKeys.yearReviewWrappedSwipeToExplore, language),
                 style: AppTypography.subtitle(
                   fontSize: 13,
                   color: AppColors.textMuted,
@@ -505,7 +505,7 @@ class _EmotionalArcCard extends StatelessWidget {
         children: [
           const Spacer(flex: 2),
           GradientText(
-            L10nService.get('year_review.wrapped.your_emotional_arc', language),
+            L10nService.get(L10nKeys.yearReviewWrappedYourEmotionalArc, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.elegantAccent(
               fontSize: 16,
@@ -579,7 +579,7 @@ class _IntenseWeekCard extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     final weekStr = data.mostIntenseWeek != null
         ? _formatWeek(data.mostIntenseWeek!, isEn)
-        : (L10nService.get('year_review.wrapped.throughout_the_year', language));
+        : (L10nService.get(L10nKeys.yearReviewWrappedThroughoutTheYear, language));
 
     return _WrappedCardBase(
       gradientColors: [
@@ -592,7 +592,7 @@ class _IntenseWeekCard extends StatelessWidget {
         children: [
           const Spacer(flex: 2),
           GradientText(
-            L10nService.get('year_review.wrapped.most_intense_week', language),
+            L10nService.get(L10nKeys.yearReviewWrappedMostIntenseWeek, language),
             variant: GradientTextVariant.amethyst,
             style: AppTypography.elegantAccent(
               fontSize: 16,
@@ -624,7 +624,7 @@ class _IntenseWeekCard extends StatelessWidget {
           ).animate().fadeIn(delay: 400.ms, duration: 500.ms),
           const SizedBox(height: 12),
           Text(
-            L10nService.get('year_review.wrapped.this_week_had_the_widest_range_of_emotio', language),
+            L10nService.get(L10nKeys.yearReviewWrappedThisWeekHadTheWidestRangeOfEmotio, language),
             textAlign: TextAlign.center,
             style: AppTypography.decorativeScript(
               fontSize: 14,
@@ -678,7 +678,7 @@ class _FocusAreaCard extends StatelessWidget {
         children: [
           const Spacer(flex: 2),
           GradientText(
-            L10nService.get('year_review.wrapped.focus_area_map', language),
+            L10nService.get(L10nKeys.yearReviewWrappedFocusAreaMap, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 16,
@@ -804,7 +804,7 @@ class _GrowthScoreCard extends StatelessWidget {
         children: [
           const Spacer(flex: 2),
           GradientText(
-            L10nService.get('year_review.wrapped.growth_score', language),
+            L10nService.get(L10nKeys.yearReviewWrappedGrowthScore, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 16,
@@ -852,11 +852,11 @@ class _GrowthScoreCard extends StatelessWidget {
   String _growthLabel(int score, bool isEn) {
     final language = AppLanguage.fromIsEn(isEn);
     if (score >= 70) {
-      return L10nService.get('year_review.wrapped.remarkable_growth_this_year', language);
+      return L10nService.get(L10nKeys.yearReviewWrappedRemarkableGrowthThisYear, language);
     } else if (score >= 50) {
-      return L10nService.get('year_review.wrapped.steady_and_consistent_progress', language);
+      return L10nService.get(L10nKeys.yearReviewWrappedSteadyAndConsistentProgress, language);
     }
-    return L10nService.get('year_review.wrapped.every_journey_has_its_rhythm', language);
+    return L10nService.get(L10nKeys.yearReviewWrappedEveryJourneyHasItsRhythm, language);
   }
 }
 
@@ -889,7 +889,7 @@ class _BreakthroughCard extends StatelessWidget {
         children: [
           const Spacer(flex: 2),
           GradientText(
-            L10nService.get('year_review.wrapped.breakthrough_moments', language),
+            L10nService.get(L10nKeys.yearReviewWrappedBreakthroughMoments, language),
             variant: GradientTextVariant.amethyst,
             style: AppTypography.elegantAccent(
               fontSize: 16,
@@ -905,7 +905,7 @@ class _BreakthroughCard extends StatelessWidget {
           ).animate().fadeIn(delay: 300.ms, duration: 500.ms),
           const SizedBox(height: 8),
           Text(
-            L10nService.get('year_review.wrapped.breakthroughs', language),
+            L10nService.get(L10nKeys.yearReviewWrappedBreakthroughs, language),
             style: AppTypography.elegantAccent(
               fontSize: 14,
               fontWeight: FontWeight.w500,
@@ -916,7 +916,7 @@ class _BreakthroughCard extends StatelessWidget {
           Padding(
             padding: const EdgeInsets.symmetric(horizontal: 8),
             child: Text(
-              L10nService.get('year_review.wrapped.moments_where_your_mood_lifted_and_a_pos', language),
+              L10nService.get(L10nKeys.yearReviewWrappedMomentsWhereYourMoodLiftedAndAPos, language),
               textAlign: TextAlign.center,
               style: AppTypography.decorativeScript(
                 fontSize: 14,
@@ -962,7 +962,7 @@ class _TopPatternsCard extends StatelessWidget {
         children: [
           const Spacer(flex: 2),
           GradientText(
-            L10nService.get('year_review.wrapped.your_top_patterns', language),
+            L10nService.get(L10nKeys.yearReviewWrappedYourTopPatterns, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.elegantAccent(
               fontSize: 16,
@@ -973,7 +973,7 @@ class _TopPatternsCard extends StatelessWidget {
           const SizedBox(height: 28),
           if (patterns.isEmpty)
             Text(
-              L10nService.get('year_review.wrapped.keep_journaling_to_discover_patterns', language),
+              L10nService.get(L10nKeys.yearReviewWrappedKeepJournalingToDiscoverPatterns, language),
               style: AppTypography.decorativeScript(
                 fontSize: 14,
                 color: AppColors.textSecondary,
@@ -1067,15 +1067,15 @@ class _TopPatternsCard extends StatelessWidget {
             ? '$days-day journaling streak'
             : '$days günlük yazma serisi';
       case 'high_average':
-        return L10nService.get('year_review.wrapped.consistently_high_mood_average', language);
+        return L10nService.get(L10nKeys.yearReviewWrappedConsistentlyHighMoodAverage, language);
       case 'diverse_explorer':
-        return L10nService.get('year_review.wrapped.explored_multiple_focus_areas', language);
+        return L10nService.get(L10nKeys.yearReviewWrappedExploredMultipleFocusAreas, language);
       case 'daily_journaler':
-        return L10nService.get('year_review.wrapped.journaled_every_single_day', language);
+        return L10nService.get(L10nKeys.yearReviewWrappedJournaledEverySingleDay, language);
       case 'dedicated_journaler':
       case 'committed_journaler':
         final count = parts.length > 1 ? parts[1] : '';
-        return L10nService.getWithParams('year_review.entries_this_year', language, params: {'count': count});
+        return L10nService.getWithParams(L10nKeys.yearReviewEntriesThisYear, language, params: {'count': count});
       default:
         return raw;
     }
@@ -1118,7 +1118,7 @@ class _ClosingCard extends StatelessWidget {
         children: [
           const Spacer(flex: 2),
           GradientText(
-                L10nService.get('year_review.wrapped.see_you_next_year', language),
+                L10nService.get(L10nKeys.yearReviewWrappedSeeYouNextYear, language),
                 variant: GradientTextVariant.cosmic,
                 textAlign: TextAlign.center,
                 style: AppTypography.displayFont.copyWith(
@@ -1134,7 +1134,7 @@ class _ClosingCard extends StatelessWidget {
           Padding(
             padding: const EdgeInsets.symmetric(horizontal: 8),
             child: Text(
-              L10nService.get('year_review.wrapped.every_entry_you_wrote_brought_you_closer', language),
+              L10nService.get(L10nKeys.yearReviewWrappedEveryEntryYouWroteBroughtYouCloser, language),
               textAlign: TextAlign.center,
               style: AppTypography.decorativeScript(
                 fontSize: 15,
@@ -1145,7 +1145,7 @@ class _ClosingCard extends StatelessWidget {
           const Spacer(flex: 2),
           // Share button
           GradientButton.gold(
-                label: L10nService.get('year_review.wrapped.share_your_wrapped', language),
+                label: L10nService.get(L10nKeys.yearReviewWrappedShareYourWrapped, language),
                 icon: Icons.share_rounded,
                 onPressed: () {
                   HapticFeedback.selectionClick();
@@ -1209,7 +1209,7 @@ class _PremiumGateCard extends StatelessWidget {
           ),
           const SizedBox(height: 20),
           GradientText(
-            L10nService.get('year_review.wrapped.unlock_your_full_wrapped', language),
+            L10nService.get(L10nKeys.yearReviewWrappedUnlockYourFullWrapped, language),
             variant: GradientTextVariant.gold,
             textAlign: TextAlign.center,
             style: AppTypography.displayFont.copyWith(
@@ -1219,7 +1219,7 @@ class _PremiumGateCard extends StatelessWidget {
           ),
           const SizedBox(height: 12),
           Text(
-            L10nService.get('year_review.wrapped.5_more_cards_with_deeper_insights_await', language),
+            L10nService.get(L10nKeys.yearReviewWrapped5MoreCardsWithDeeperInsightsAwait, language),
             textAlign: TextAlign.center,
             style: AppTypography.decorativeScript(
               fontSize: 14,
@@ -105,7 +105,7 @@ class _YearReviewScreenState extends ConsumerState<YearReviewScreen> {
               ),
               slivers: [
                 GlassSliverAppBar(
-                  title: L10nService.get('year_review.year_review.year_synthesis', language),
+                  title: L10nService.get(L10nKeys.yearReviewYearReviewYearSynthesis, language),
                 ),
                 // Year selector
                 SliverToBoxAdapter(
@@ -118,7 +118,7 @@ class _YearReviewScreenState extends ConsumerState<YearReviewScreen> {
                           mainAxisSize: MainAxisSize.min,
                           children: [
                             Text(
-                              L10nService.get('year_review.year_review.could_not_load_your_local_data_is_unaffe', language),
+                              L10nService.get(L10nKeys.yearReviewYearReviewCouldNotLoadYourLocalDataIsUnaffe, language),
                               textAlign: TextAlign.center,
                               style: AppTypography.subtitle(
                                 color: isDark
@@ -136,7 +136,7 @@ class _YearReviewScreenState extends ConsumerState<YearReviewScreen> {
                                 color: AppColors.starGold,
                               ),
                               label: Text(
-                                L10nService.get('year_review.year_review.retry', language),
+                                L10nService.get(L10nKeys.yearReviewYearReviewRetry, language),
                                 style: AppTypography.elegantAccent(
                                   fontSize: 13,
                                   fontWeight: FontWeight.w600,
@@ -185,7 +185,7 @@ class _YearReviewScreenState extends ConsumerState<YearReviewScreen> {
                             mainAxisSize: MainAxisSize.min,
                             children: [
                               Text(
-                                L10nService.get('year_review.year_review.could_not_load_your_local_data_is_unaffe_1', language),
+                                L10nService.get(L10nKeys.yearReviewYearReviewCouldNotLoadYourLocalDataIsUnaffe1, language),
                                 textAlign: TextAlign.center,
                                 style: AppTypography.subtitle(
                                   color: isDark
@@ -203,7 +203,7 @@ class _YearReviewScreenState extends ConsumerState<YearReviewScreen> {
                                   color: AppColors.starGold,
                                 ),
                                 label: Text(
-                                  L10nService.get('year_review.year_review.retry_1', language),
+                                  L10nService.get(L10nKeys.yearReviewYearReviewRetry1, language),
                                   style: AppTypography.elegantAccent(
                                     fontSize: 13,
                                     fontWeight: FontWeight.w600,
@@ -388,8 +388,8 @@ class _EmptyState extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.auto_awesome,
-      title: L10nService.get('year_review.year_review.your_year_synthesis_is_ready', language),
-      description: L10nService.get('year_review.year_review.keep_recording_to_activate_your_annual_s', language),
+      title: L10nService.get(L10nKeys.yearReviewYearReviewYourYearSynthesisIsReady, language),
+      description: L10nService.get(L10nKeys.yearReviewYearReviewKeepRecordingToActivateYourAnnualS, language),
       gradientVariant: GradientTextVariant.gold,
     );
   }
@@ -406,10 +406,10 @@ class _NotEnoughData extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return PremiumEmptyState(
       icon: Icons.lock_outline,
-      title: L10nService.get('year_review.year_review.not_enough_entries_for_this_year', language),
-      description: L10nService.get('year_review.year_review.you_need_at_least_7_journal_entries_to_g', language),
+      title: L10nService.get(L10nKeys.yearReviewYearReviewNotEnoughEntriesForThisYear, language),
+      description: L10nService.get(L10nKeys.yearReviewYearReviewYouNeedAtLeast7JournalEntriesToG, language),
       gradientVariant: GradientTextVariant.gold,
-      ctaLabel: L10nService.get('year_review.year_review.start_journaling', language),
+      ctaLabel: L10nService.get(L10nKeys.yearReviewYearReviewStartJournaling, language),
       onCtaPressed: () => context.push(Routes.journal),
     );
   }
@@ -469,7 +469,7 @@ class _HeroCard extends StatelessWidget {
             children: [
               _StatColumn(
                 value: '${review.totalEntries}',
-                label: L10nService.get('year_review.year_review.entries', language),
+                label: L10nService.get(L10nKeys.yearReviewYearReviewEntries, language),
                 isDark: isDark,
               ),
               Container(
@@ -481,7 +481,7 @@ class _HeroCard extends StatelessWidget {
               ),
               _StatColumn(
                 value: '${review.totalJournalingDays}',
-                label: L10nService.get('year_review.year_review.days', language),
+                label: L10nService.get(L10nKeys.yearReviewYearReviewDays, language),
                 isDark: isDark,
               ),
               Container(
@@ -493,7 +493,7 @@ class _HeroCard extends StatelessWidget {
               ),
               _StatColumn(
                 value: review.averageMood.toStringAsFixed(1),
-                label: L10nService.get('year_review.year_review.avg_mood', language),
+                label: L10nService.get(L10nKeys.yearReviewYearReviewAvgMood, language),
                 isDark: isDark,
               ),
               Container(
@@ -505,7 +505,7 @@ class _HeroCard extends StatelessWidget {
               ),
               _StatColumn(
                 value: '${review.streakBest}',
-                label: L10nService.get('year_review.year_review.best_streak', language),
+                label: L10nService.get(L10nKeys.yearReviewYearReviewBestStreak, language),
                 isDark: isDark,
               ),
             ],
@@ -611,7 +611,7 @@ class _MoodJourneyCard extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('year_review.year_review.mood_trajectory', language),
+            L10nService.get(L10nKeys.yearReviewYearReviewMoodTrajectory, language),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -620,7 +620,7 @@ class _MoodJourneyCard extends StatelessWidget {
           ),
           const SizedBox(height: 4),
           Text(
-            L10nService.get('year_review.year_review.monthly_average_mood_15', language),
+            L10nService.get(L10nKeys.yearReviewYearReviewMonthlyAverageMood15, language),
             style: AppTypography.elegantAccent(
               fontSize: 13,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -745,7 +745,7 @@ class _FocusAreasCard extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('year_review.year_review.focus_areas', language),
+            L10nService.get(L10nKeys.yearReviewYearReviewFocusAreas, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -754,7 +754,7 @@ class _FocusAreasCard extends StatelessWidget {
           ),
           const SizedBox(height: 4),
           Text(
-            L10nService.get('year_review.year_review.time_spent_per_area', language),
+            L10nService.get(L10nKeys.yearReviewYearReviewTimeSpentPerArea, language),
             style: AppTypography.elegantAccent(
               fontSize: 13,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -839,10 +839,10 @@ class _GrowthScoreCard extends StatelessWidget {
     final language = AppLanguage.fromIsEn(isEn);
     final score = review.growthScore;
     final label = score >= 70
-        ? (L10nService.get('year_review.year_review.strong_growth', language))
+        ? (L10nService.get(L10nKeys.yearReviewYearReviewStrongGrowth, language))
         : score >= 50
-        ? (L10nService.get('year_review.year_review.steady_progress', language))
-        : (L10nService.get('year_review.year_review.room_to_grow', language));
+        ? (L10nService.get(L10nKeys.yearReviewYearReviewSteadyProgress, language))
+        : (L10nService.get(L10nKeys.yearReviewYearReviewRoomToGrow, language));
 
     return GlassPanel(
       elevation: GlassElevation.g2,
@@ -851,7 +851,7 @@ class _GrowthScoreCard extends StatelessWidget {
       child: Column(
         children: [
           GradientText(
-            L10nService.get('year_review.year_review.growth_score', language),
+            L10nService.get(L10nKeys.yearReviewYearReviewGrowthScore, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -860,7 +860,7 @@ class _GrowthScoreCard extends StatelessWidget {
           ),
           const SizedBox(height: 4),
           Text(
-            L10nService.get('year_review.year_review.based_on_your_mood_improvement_trend', language),
+            L10nService.get(L10nKeys.yearReviewYearReviewBasedOnYourMoodImprovementTrend, language),
             style: AppTypography.elegantAccent(
               fontSize: 13,
               color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -1017,7 +1017,7 @@ class _HighlightsCard extends StatelessWidget {
         crossAxisAlignment: CrossAxisAlignment.start,
         children: [
           GradientText(
-            L10nService.get('year_review.year_review.highlights', language),
+            L10nService.get(L10nKeys.yearReviewYearReviewHighlights, language),
             variant: GradientTextVariant.gold,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -1188,7 +1188,7 @@ class _HighlightsCard extends StatelessWidget {
           results.add(
             _Highlight(
               icon: Icons.star,
-              text: L10nService.get('year_review.year_review.you_journaled_every_single_day', language),
+              text: L10nService.get(L10nKeys.yearReviewYearReviewYouJournaledEverySingleDay, language),
               color: AppColors.starGold,
             ),
           );
@@ -1252,7 +1252,7 @@ class _ShareableSummaryCard extends StatelessWidget {
       child: Column(
         children: [
           GradientText(
-            L10nService.getWithParams('year_review.my_year_summary', language, params: {'year': '${review.year}'}),
+            L10nService.getWithParams(L10nKeys.yearReviewMyYearSummary, language, params: {'year': '${review.year}'}),
             variant: GradientTextVariant.aurora,
             style: AppTypography.displayFont.copyWith(
               fontSize: 16,
@@ -1290,7 +1290,7 @@ class _ShareableSummaryCard extends StatelessWidget {
           ),
           const SizedBox(height: 16),
           GradientOutlinedButton(
-            label: L10nService.get('year_review.year_review.share_summary', language),
+            label: L10nService.get(L10nKeys.yearReviewYearReviewShareSummary, language),
             icon: Icons.share,
             variant: GradientTextVariant.gold,
             expanded: true,
@@ -1245,7 +1245,7 @@ class _NotFoundScreen extends StatelessWidget {
             const Icon(Icons.explore_off, size: 64, color: Colors.white38),
             const SizedBox(height: 24),
             Text(
-              L10nService.get('error.page_not_found', language),
+              L10nService.get(L10nKeys.errorPageNotFound, language),
               style: Theme.of(
                 context,
               ).textTheme.headlineSmall?.copyWith(color: Colors.white),
@@ -1264,7 +1264,7 @@ class _NotFoundScreen extends StatelessWidget {
               onPressed: () => context.go(Routes.today),
               icon: const Icon(Icons.home, color: Colors.white70),
               label: Text(
-                L10nService.get('common.home', language),
+                L10nService.get(L10nKeys.commonHome, language),
                 style: AppTypography.elegantAccent(color: Colors.white70),
               ),
             ),
@@ -199,7 +199,7 @@ class AppErrorWidget extends StatelessWidget {
                 // Secondary action - reload page (web only)
                 if (kIsWeb)
                   Semantics(
-                    label: L10nService.get('error.reload_page', language),
+                    label: L10nService.get(L10nKeys.errorReloadPage, language),
                     button: true,
                     child: GestureDetector(
                       onTap: () {
@@ -33,18 +33,18 @@ class _BirthDatePickerState extends State<BirthDatePicker> {
   late FixedExtentScrollController _yearController;
 
   List<String> get _months => [
-    L10nService.get('months.january', widget.language),
-    L10nService.get('months.february', widget.language),
-    L10nService.get('months.march', widget.language),
-    L10nService.get('months.april', widget.language),
-    L10nService.get('months.may', widget.language),
-    L10nService.get('months.june', widget.language),
-    L10nService.get('months.july', widget.language),
-    L10nService.get('months.august', widget.language),
-    L10nService.get('months.september', widget.language),
-    L10nService.get('months.october', widget.language),
-    L10nService.get('months.november', widget.language),
-    L10nService.get('months.december', widget.language),
+    L10nService.get(L10nKeys.monthsJanuary, widget.language),
+    L10nService.get(L10nKeys.monthsFebruary, widget.language),
+    L10nService.get(L10nKeys.monthsMarch, widget.language),
+    L10nService.get(L10nKeys.monthsApril, widget.language),
+    L10nService.get(L10nKeys.monthsMay, widget.language),
+    L10nService.get(L10nKeys.monthsJune, widget.language),
+    L10nService.get(L10nKeys.monthsJuly, widget.language),
+    L10nService.get(L10nKeys.monthsAugust, widget.language),
+    L10nService.get(L10nKeys.monthsSeptember, widget.language),
+    L10nService.get(L10nKeys.monthsOctober, widget.language),
+    L10nService.get(L10nKeys.monthsNovember, widget.language),
+    L10nService.get(L10nKeys.monthsDecember, widget.language),
   ];
 
   @override
@@ -118,7 +118,7 @@ class _BirthDatePickerState extends State<BirthDatePicker> {
               },
               itemBuilder: (index) => '${index + 1}',
               label: L10nService.get(
-                'widgets.birth_date_picker.day',
+                L10nKeys.widgetsBirthDatePickerDay,
                 widget.language,
               ),
             ),
@@ -148,7 +148,7 @@ class _BirthDatePickerState extends State<BirthDatePicker> {
               },
               itemBuilder: (index) => _months[index],
               label: L10nService.get(
-                'widgets.birth_date_picker.month',
+                L10nKeys.widgetsBirthDatePickerMonth,
                 widget.language,
               ),
             ),
@@ -178,7 +178,7 @@ class _BirthDatePickerState extends State<BirthDatePicker> {
               },
               itemBuilder: (index) => '${now.year - index}',
               label: L10nService.get(
-                'widgets.birth_date_picker.year',
+                L10nKeys.widgetsBirthDatePickerYear,
                 widget.language,
               ),
             ),
@@ -203,7 +203,7 @@ class _BirthDatePickerState extends State<BirthDatePicker> {
           Expanded(
             child: _buildDropdown(
               label: L10nService.get(
-                'widgets.birth_date_picker.day',
+                L10nKeys.widgetsBirthDatePickerDay,
                 widget.language,
               ),
               value: _selectedDay,
@@ -223,7 +223,7 @@ class _BirthDatePickerState extends State<BirthDatePicker> {
             flex: 2,
             child: _buildDropdown(
               label: L10nService.get(
-                'widgets.birth_date_picker.month',
+                L10nKeys.widgetsBirthDatePickerMonth,
                 widget.language,
               ),
               value: _selectedMonth,
@@ -251,7 +251,7 @@ class _BirthDatePickerState extends State<BirthDatePicker> {
           Expanded(
             child: _buildDropdown(
               label: L10nService.get(
-                'widgets.birth_date_picker.year',
+                L10nKeys.widgetsBirthDatePickerYear,
                 widget.language,
               ),
               value: _selectedYear,
@@ -33,7 +33,7 @@ class ContentDisclaimer extends StatelessWidget {
 
     final text =
         customText ??
-        L10nService.get('widgets.content_disclaimer.general', language);
+        L10nService.get(L10nKeys.widgetsContentDisclaimerGeneral, language);
 
     if (compact) {
       return Padding(
@@ -95,29 +95,29 @@ class ContentDisclaimer extends StatelessWidget {
 /// Category-based disclaimer texts
 class DisclaimerTexts {
   static String general(AppLanguage language) =>
-      L10nService.get('widgets.content_disclaimer.general', language);
+      L10nService.get(L10nKeys.widgetsContentDisclaimerGeneral, language);
 
   static String dreams(AppLanguage language) =>
-      L10nService.get('widgets.content_disclaimer.dreams', language);
+      L10nService.get(L10nKeys.widgetsContentDisclaimerDreams, language);
 
   static String health(AppLanguage language) =>
-      L10nService.get('widgets.content_disclaimer.health', language);
+      L10nService.get(L10nKeys.widgetsContentDisclaimerHealth, language);
 
   static String wellness(AppLanguage language) =>
-      L10nService.get('widgets.content_disclaimer.general', language);
+      L10nService.get(L10nKeys.widgetsContentDisclaimerGeneral, language);
 
   static String compatibility(AppLanguage language) =>
-      L10nService.get('widgets.content_disclaimer.compatibility', language);
+      L10nService.get(L10nKeys.widgetsContentDisclaimerCompatibility, language);
 
   /// Apple-safe disclaimer for Insight assistant
   /// Emphasizes reflection, not prediction
   static String insight(AppLanguage language) =>
-      L10nService.get('widgets.content_disclaimer.insight', language);
+      L10nService.get(L10nKeys.widgetsContentDisclaimerInsight, language);
 
   /// Apple-safe reflection disclaimer
   /// Used in the unified Insight assistant
   static String reflection(AppLanguage language) =>
-      L10nService.get('widgets.content_disclaimer.reflection', language);
+      L10nService.get(L10nKeys.widgetsContentDisclaimerReflection, language);
 }
 
 /// Page footer with disclaimer
@@ -119,7 +119,7 @@ class ToolEmptyState extends StatelessWidget {
               const SizedBox(height: AppConstants.spacingXl),
               if (onStartTemplate != null)
                 GradientButton(
-                  label: L10nService.get('shared.ecosystems.start_with_template', language),
+                  label: L10nService.get(L10nKeys.sharedEcosystemsStartWithTemplate, language),
                   onPressed: onStartTemplate,
                   expanded: true,
                   gradient: const LinearGradient(
@@ -131,7 +131,7 @@ class ToolEmptyState extends StatelessWidget {
                 TextButton(
                   onPressed: onSeeExample,
                   child: Text(
-                    L10nService.get('shared.ecosystems.see_example', language),
+                    L10nService.get(L10nKeys.sharedEcosystemsSeeExample, language),
                     style: AppTypography.elegantAccent(
                       color: isDark
                           ? AppColors.textSecondary
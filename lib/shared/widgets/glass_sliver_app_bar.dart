@@ -160,10 +160,10 @@ class GlassSliverAppBar extends StatelessWidget {
     final isEn = StorageService.loadLanguage() == AppLanguage.en;
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
-      label: L10nService.get('shared.glass_sliver_app_bar.back', language),
+      label: L10nService.get(L10nKeys.sharedGlassSliverAppBarBack, language),
       button: true,
       child: IconButton(
-        tooltip: L10nService.get('shared.glass_sliver_app_bar.back_1', language),
+        tooltip: L10nService.get(L10nKeys.sharedGlassSliverAppBarBack1, language),
         onPressed: () => Navigator.of(context).pop(),
         icon: Icon(Icons.chevron_left, color: color, size: 28),
       ),
@@ -102,27 +102,27 @@ class _MainShellScreenState extends ConsumerState<MainShellScreen>
       _TabItem(
         icon: CupertinoIcons.house,
         activeIcon: CupertinoIcons.house_fill,
-        label: L10nService.get('shared.main_shell.home', language),
+        label: L10nService.get(L10nKeys.sharedMainShellHome, language),
       ),
       _TabItem(
         icon: CupertinoIcons.book,
         activeIcon: CupertinoIcons.book_fill,
-        label: L10nService.get('shared.main_shell.journal', language),
+        label: L10nService.get(L10nKeys.sharedMainShellJournal, language),
       ),
       _TabItem(
         icon: CupertinoIcons.chart_bar,
         activeIcon: CupertinoIcons.chart_bar_fill,
-        label: L10nService.get('shared.main_shell.insights', language),
+        label: L10nService.get(L10nKeys.sharedMainShellInsights, language),
       ),
       _TabItem(
         icon: CupertinoIcons.doc_text,
         activeIcon: CupertinoIcons.doc_text_fill,
-        label: L10nService.get('shared.main_shell.notes', language),
+        label: L10nService.get(L10nKeys.sharedMainShellNotes, language),
       ),
       _TabItem(
         icon: CupertinoIcons.person,
         activeIcon: CupertinoIcons.person_fill,
-        label: L10nService.get('shared.main_shell.profile', language),
+        label: L10nService.get(L10nKeys.sharedMainShellProfile, language),
       ),
     ];
 
@@ -39,18 +39,18 @@ class PrivateToggle extends ConsumerWidget {
         final shouldSetup = await showCupertinoDialog<bool>(
           context: context,
           builder: (ctx) => CupertinoAlertDialog(
-            title: Text(L10nService.get('shared.private_toggle.set_up_vault_pin', language)),
+            title: Text(L10nService.get(L10nKeys.sharedPrivateToggleSetUpVaultPin, language)),
             content: Text(
-              L10nService.get('shared.private_toggle.you_need_to_create_a_4digit_pin_to_prote', language),
+              L10nService.get(L10nKeys.sharedPrivateToggleYouNeedToCreateA4digitPinToProte, language),
             ),
             actions: [
               CupertinoDialogAction(
-                child: Text(L10nService.get('shared.private_toggle.cancel', language)),
+                child: Text(L10nService.get(L10nKeys.sharedPrivateToggleCancel, language)),
                 onPressed: () => Navigator.pop(ctx, false),
               ),
               CupertinoDialogAction(
                 isDefaultAction: true,
-                child: Text(L10nService.get('shared.private_toggle.set_up', language)),
+                child: Text(L10nService.get(L10nKeys.sharedPrivateToggleSetUp, language)),
                 onPressed: () => Navigator.pop(ctx, true),
               ),
             ],
@@ -71,7 +71,7 @@ class PrivateToggle extends ConsumerWidget {
     final language = AppLanguage.fromIsEn(isEn);
     return Semantics(
       toggled: isPrivate,
-      label: L10nService.get('shared.private_toggle.save_to_vault', language),
+      label: L10nService.get(L10nKeys.sharedPrivateToggleSaveToVault, language),
       child: GestureDetector(
       onTap: () => _handleToggle(context, ref, !isPrivate),
       child: AnimatedContainer(
@@ -105,7 +105,7 @@ class PrivateToggle extends ConsumerWidget {
                 crossAxisAlignment: CrossAxisAlignment.start,
                 children: [
                   Text(
-                    L10nService.get('shared.private_toggle.save_to_vault', language),
+                    L10nService.get(L10nKeys.sharedPrivateToggleSaveToVault, language),
                     style: AppTypography.subtitle(
                       fontSize: 14,
                       color: isPrivate
@@ -114,7 +114,7 @@ class PrivateToggle extends ConsumerWidget {
                     ).copyWith(fontWeight: isPrivate ? FontWeight.w600 : FontWeight.w400),
                   ),
                   Text(
-                    L10nService.get('shared.private_toggle.protected_with_pin_face_id', language),
+                    L10nService.get(L10nKeys.sharedPrivateToggleProtectedWithPinFaceId, language),
                     style: AppTypography.subtitle(
                       fontSize: 11,
                       color: isDark ? AppColors.textMuted : AppColors.lightTextMuted,
@@ -105,7 +105,7 @@ class _ShareCardSheetState extends ConsumerState<ShareCardSheet> {
       if (boundary == null) return;
 
       // Use AI caption if available, otherwise fall back to static template
-      final staticText = L10nService.getWithParams('sharing.share_card_text', language, params: {'headline': widget.data.headline, 'appStoreUrl': AppConstants.appStoreUrl});
+      final staticText = L10nService.getWithParams(L10nKeys.sharingShareCardText, language, params: {'headline': widget.data.headline, 'appStoreUrl': AppConstants.appStoreUrl});
       final shareText = _aiCaption != null
           ? '$_aiCaption\n\n${AppConstants.appStoreUrl}'
           : staticText;
@@ -113,7 +113,7 @@ class _ShareCardSheetState extends ConsumerState<ShareCardSheet> {
       await InstagramShareService.shareCosmicContent(
         boundary: boundary,
         shareText: shareText,
-        hashtags: L10nService.get('sharing.hashtags_self_reflection', language),
+        hashtags: L10nService.get(L10nKeys.sharingHashtagsSelfReflection, language),
         language: language,
       );
 
@@ -326,7 +326,7 @@ class _ShareCardSheetState extends ConsumerState<ShareCardSheet> {
 
                 // Share button
                 GradientButton(
-                  label: L10nService.get('shared.share.share', language),
+                  label: L10nService.get(L10nKeys.sharedShareShare, language),
                   icon: Icons.share_rounded,
                   onPressed: _isSharing ? null : _share,
                   isLoading: _isSharing,
@@ -30,7 +30,7 @@ class ShareInsightButton extends ConsumerWidget {
     final isDark = Theme.of(context).brightness == Brightness.dark;
 
     return Semantics(
-      label: L10nService.get('shared.share_insight_button.share_this_insight', language),
+      label: L10nService.get(L10nKeys.sharedShareInsightButtonShareThisInsight, language),
       button: true,
       child: GestureDetector(
         onTap: () {
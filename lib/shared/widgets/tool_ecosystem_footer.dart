@@ -67,7 +67,7 @@ class ToolEcosystemFooter extends ConsumerWidget {
         ),
         const SizedBox(height: AppConstants.spacingLg),
         Text(
-          L10nService.get('shared.tool_ecosystem_footer.related_tools', language),
+          L10nService.get(L10nKeys.sharedToolEcosystemFooterRelatedTools, language),
           style: AppTypography.displayFont.copyWith(
             fontSize: 15,
             fontWeight: FontWeight.w600,
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Linear-time Dart lexer for the isEn -> L10nService migrations.
+Finds `isEn ? <literal> : <literal>` ternaries in one pass over the text,
+with exact spans and decoded literal values.
+
+Unlike the ISEN_PATTERN regexes it understands raw strings (r'...'),
+triple-quoted strings, adjacent-literal concatenation ('a' 'b'), nested
+${...} interpolation, comments, and operator precedence around the
+ternary (so `widget.isEn ? ...`, `!isEn ? ...` and `... : 'b'.trim()`
+are never half-rewritten).
+
+Usage (benchmark against the regexes):
+  python3 scripts/dart_lexer.py [files...]
+"""
+
+import re
+import sys
+import time
+from collections import namedtuple
+
+# ═══════════════════════════════════════════════════════════════
+# TOKENS
+# ═══════════════════════════════════════════════════════════════
+
+CODE, STRING, PUNCT, IDENT, OP, OTHER = 'code', 'string', 'punct', 'ident', 'op', 'other'
+
+# Coarse tokens: string literals, braces, and maximal runs of code in
+# between. Comments are skipped. Only code runs that contain `isEn` are
+# split further (see _fine_tokens), which keeps the Python-level loop to
+# a few iterations per line instead of one per identifier.
+_COARSE = re.compile(
+    r"""[ \t\r\n\f\v]*(?:"""
+    r"""(?P<quote>'''|\"\"\"|'|")"""
+    r"""|(?P<comment>//[^\n]*)"""
+    r"""|(?P<block>/\*)"""
+    r"""|(?P<punct>[{}])"""
+    r"""|(?P<code>(?:[^'"/{}\s]|/(?![/*]))[^'"/{}]*(?:/(?![/*])[^'"/{}]*)*)"""
+    r""")"""
+)
+_FINE = re.compile(
+    r"""[ \t\r\n\f\v]*(?:"""
+    r"""(?P<ident>[A-Za-z_$][A-Za-z0-9_$]*)"""
+    r"""|(?P<number>[0-9][0-9A-Za-z_]*(?:\.[0-9][0-9A-Za-z_]*)?)"""
+    r"""|(?P<op>[?:.=!<>&|+\-*/%^~]+)"""
+    r"""|(?P<punct>[()\[\],;])"""
+    r"""|(?P<other>\S))"""
+)
+_BLOCK_COMMENT_EDGE = re.compile(r'/\*|\*/')
+_INTERP_IDENT = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_IDENT_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$')
+
+# Plain runs inside a literal body, per (quote, raw)
+_BODY = {
+    ("'", False): re.compile(r"[^'\\$\n]+"),
+    ('"', False): re.compile(r'[^"\\$\n]+'),
+    ("'''", False): re.compile(r"[^'\\$]+"),
+    ('"""', False): re.compile(r'[^"\\$]+'),
+    ("'", True): re.compile(r"[^'\n]+"),
+    ('"', True): re.compile(r'[^"\n]+'),
+    ("'''", True): re.compile(r"[^']+"),
+    ('"""', True): re.compile(r'[^"]+'),
+}
+# Whole body of a single-line literal with no escapes or interpolation,
+# the common case, matched in one step
+_PLAIN_BODY = {
+    "'": re.compile(r"[^'\\$\n]*'"),
+    '"': re.compile(r'[^"\\$\n]*"'),
+}
+_LEADING_BLANK_LINE = re.compile(r'[ \t]*\r?\n')
+
+_SIMPLE_ESCAPES = {
+    'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v',
+}
+
+# `source` is the interpolation as written (`$name` / `${expr}`)
+Interpolation = namedtuple('Interpolation', 'source')
+
+# kind, start, end and value: StringToken for strings, the text for
+# punct/fine tokens, None for code runs (slice the source instead)
+Token = namedtuple('Token', 'kind start end value')
+
+# One Dart literal: quote as written ('', "", ''', """), raw flag, body
+# parts (str runs and Interpolations) and the token lists of every
+# ${...} inside it, which are searched for ternaries as well.
+StringToken = namedtuple('StringToken', 'quote raw parts children terminated')
+
+
+class StringLiteral:
+    """One or more adjacent Dart literals, concatenated at compile time."""
+
+    __slots__ = ('start', 'end', 'parts', 'quotes')
+
+    def __init__(self, tokens):
+        self.start = tokens[0].start
+        self.end = tokens[-1].end
+        self.quotes = {t.value.quote for t in tokens}
+        parts = []
+        for t in tokens:
+            for part in t.value.parts:
+                if isinstance(part, str) and parts and isinstance(parts[-1], str):
+                    parts[-1] += part
+                else:
+                    parts.append(part)
+        self.parts = parts
+
+    @property
+    def interpolated(self):
+        return any(isinstance(p, Interpolation) for p in self.parts)
+
+    @property
+    def value(self):
+        """Decoded text; interpolations are kept as their source."""
+        return ''.join(p if isinstance(p, str) else p.source for p in self.parts)
+
+    def __repr__(self):
+        return f'StringLiteral({self.start}, {self.end}, {self.value!r})'
+
+
+# start/end span the whole conditional expression, condition included
+IsEnTernary = namedtuple('IsEnTernary', 'start end condition en tr')
+
+
+class _Lexer:
+    def __init__(self, text):
+        self.text = text
+        self.n = len(text)
+
+    def _skip_block_comment(self, pos):
+        """Position just past the (nested) block comment opened before `pos`."""
+        depth = 1
+        while depth:
+            m = _BLOCK_COMMENT_EDGE.search(self.text, pos)
+            if not m:
+                return self.n
+            depth += 1 if m.group() == '/*' else -1
+            pos = m.end()
+        return pos
+
+    def tokens(self, pos, closing):
+        """Coarse tokens from `pos` until EOF, or the `}` closing an interpolation.
+
+        Returns (tokens, end) where end is just past the closing brace.
+        """
+        text = self.text
+        tokens = []
+        depth = 0
+        while True:
+            m = _COARSE.match(text, pos)
+            if not m:
+                return tokens, self.n
+            kind = m.lastgroup
+            start = m.start(kind)
+            end = m.end()
+
+            if kind == 'quote':
+                tokens.append(self._string(start, end, m.group(kind), False))
+                pos = tokens[-1].end
+            elif kind == 'code':
+                # r'...' : the `r` ends the code run, glued to the quote
+                if (end < self.n and text[end] in '\'"' and text[end - 1] == 'r'
+                        and (end - 1 == start or text[end - 2] not in _IDENT_CHARS)):
+                    if end - 1 > start:
+                        tokens.append(Token(CODE, start, end - 1, None))
+                    q = _COARSE.match(text, end).group('quote')
+                    tokens.append(self._string(end - 1, end + len(q), q, True))
+                    pos = tokens[-1].end
+                else:
+                    tokens.append(Token(CODE, start, end, None))
+                    pos = end
+            elif kind == 'punct':
+                if m.group(kind) == '{':
+                    depth += 1
+                elif closing and depth == 0:
+                    return tokens, end
+                else:
+                    depth -= 1
+                tokens.append(Token(PUNCT, start, end, m.group(kind)))
+                pos = end
+            elif kind == 'block':
+                pos = self._skip_block_comment(end)
+            else:  # line comment
+                pos = end
+
+    def _string(self, start, pos, quote, raw):
+        text = self.text
+        if quote in _PLAIN_BODY:
+            m = _PLAIN_BODY[quote].match(text, pos)
+            if m:
+                body = text[pos:m.end() - 1]
+                parts = [body] if body else []
+                return Token(STRING, start, m.end(), StringToken(quote, raw, parts, [], True))
+
+        body = _BODY[(quote, raw)]
+        triple = len(quote) == 3
+        parts = []
+        children = []
+        chunk = []
+        terminated = False
+
+        while pos < self.n:
+            m = body.match(text, pos)
+            if m:
+                chunk.append(m.group())
+                pos = m.end()
+                if pos >= self.n:
+                    break
+
+            c = text[pos]
+            if c == quote[0]:
+                if not triple:
+                    pos += 1
+                    terminated = True
+                    break
+                if text.startswith(quote, pos):
+                    pos += 3
+                    terminated = True
+                    break
+                chunk.append(c)
+                pos += 1
+            elif c == '\n':
+                # single-line literal left open; stop at the line end
+                break
+            elif c == '\\':
+                decoded, pos = _decode_escape(text, pos)
+                chunk.append(decoded)
+            else:  # '$'
+                if text.startswith('${', pos):
+                    inner, end = self.tokens(pos + 2, True)
+                    children.append(inner)
+                else:
+                    m = _INTERP_IDENT.match(text, pos + 1)
+                    if not m:
+                        chunk.append('$')
+                        pos += 1
+                        continue
+                    end = m.end()
+                if chunk:
+                    parts.append(''.join(chunk))
+                    chunk = []
+                parts.append(Interpolation(text[pos:end]))
+                pos = end
+
+        if chunk:
+            parts.append(''.join(chunk))
+        if triple and parts and isinstance(parts[0], str):
+            # A first line of only whitespace is dropped from multiline literals
+            m = _LEADING_BLANK_LINE.match(parts[0])
+            if m:
+                parts[0] = parts[0][m.end():]
+                if not parts[0]:
+                    parts.pop(0)
+
+        return Token(STRING, start, pos, StringToken(quote, raw, parts, children, terminated))
+
+
+def _fine_tokens(text, start, end):
+    """Identifier/operator tokens of one code run (no strings or comments)."""
+    tokens = []
+    pos = start
+    while pos < end:
+        m = _FINE.match(text, pos, end)
+        if not m:
+            break
+        kind = m.lastgroup
+        if kind == 'number':
+            kind = OTHER
+        tokens.append(Token(kind, m.start(kind), m.end(), m.group(kind)))
+        pos = m.end()
+    return tokens
+
+
+def _decode_escape(text, pos):
+    """Decode the escape at text[pos] == '\\'; returns (text, new_pos)."""
+    if pos + 1 >= len(text):
+        return '\\', pos + 1
+    c = text[pos + 1]
+    if c in _SIMPLE_ESCAPES:
+        return _SIMPLE_ESCAPES[c], pos + 2
+    if c == 'x':
+        digits = text[pos + 2:pos + 4]
+        if len(digits) == 2 and _is_hex(digits):
+            return chr(int(digits, 16)), pos + 4
+    elif c == 'u':
+        if text.startswith('{', pos + 2):
+            close = text.find('}', pos + 3, pos + 10)
+            digits = text[pos + 3:close]
+            if close > 0 and digits and _is_hex(digits):
+                return chr(int(digits, 16)), close + 1
+        else:
+            digits = text[pos + 2:pos + 6]
+            if len(digits) == 4 and _is_hex(digits):
+                return chr(int(digits, 16)), pos + 6
+    return c, pos + 2
+
+
+def _is_hex(s):
+    return all(ch in '0123456789abcdefABCDEF' for ch in s)
+
+
+def tokenize(text):
+    """Top-level coarse tokens of `text` (interpolations nest in StringTokens)."""
+    tokens, _ = _Lexer(text).tokens(0, False)
+    return tokens
+
+
+# ═══════════════════════════════════════════════════════════════
+# TERNARIES
+# ═══════════════════════════════════════════════════════════════
+
+# Tokens after which `isEn` starts a whole conditional expression. Anything
+# else (`!`, `&&`, `==`, `+`, ...) would bind tighter than `?:`.
+_OPENERS = {'(', '[', '{', ',', ';', ':', '?', '=>', 'return', 'yield'}
+_NOT_ASSIGNMENT = {'==', '!=', '<=', '>=', '=>'}
+
+# First characters that may follow the else-literal without extending it
+_CLOSERS = set(')]},;:')
+
+
+def _opens_expression(tok):
+    if tok.value in _OPENERS:
+        return True
+    # any assignment: = += ??= ...
+    return tok.kind == OP and tok.value.endswith('=') and tok.value not in _NOT_ASSIGNMENT
+
+
+def _literal_run(tokens, i, quotes):
+    """Adjacent terminated literals starting at tokens[i]; returns (run, next_i)."""
+    run = []
+    while i < len(tokens) and tokens[i].kind == STRING:
+        s = tokens[i].value
+        if not s.terminated or s.quote[0] not in quotes:
+            return [], i
+        run.append(tokens[i])
+        i += 1
+    return run, i
+
+
+def _code_text(tokens, i, text):
+    if i < len(tokens) and tokens[i].kind == CODE:
+        return text[tokens[i].start:tokens[i].end].strip()
+    return None
+
+
+def _find_in(tokens, text, quotes, out):
+    for idx, tok in enumerate(tokens):
+        if tok.kind == STRING:
+            for child in tok.value.children:
+                _find_in(child, text, quotes, out)
+            continue
+        if tok.kind != CODE or text.find('isEn', tok.start, tok.end) < 0:
+            continue
+
+        # The code run must end in `isEn ?` (or `widget.isEn ?`) right
+        # before the first literal.
+        fine = _fine_tokens(text, tok.start, tok.end)
+        i = len(fine) - 2
+        if i < 0 or fine[i + 1].value != '?' or fine[i].value != 'isEn':
+            continue
+        j = i
+        while j >= 2 and fine[j - 1].value == '.' and fine[j - 2].kind == IDENT:
+            j -= 2
+        if j > 0:
+            if not _opens_expression(fine[j - 1]):
+                continue
+        elif idx > 0 and tokens[idx - 1].value != '{':
+            continue
+
+        en_run, k = _literal_run(tokens, idx + 1, quotes)
+        if not en_run or _code_text(tokens, k, text) != ':':
+            continue
+        tr_run, k = _literal_run(tokens, k + 1, quotes)
+        if not tr_run:
+            continue
+        if k < len(tokens):
+            follower = tokens[k].value if tokens[k].kind == PUNCT else _code_text(tokens, k, text)
+            if follower[:1] not in _CLOSERS:
+                continue
+
+        start = fine[j].start
+        out.append(IsEnTernary(
+            start,
+            tr_run[-1].end,
+            text[start:fine[i].end],
+            StringLiteral(en_run),
+            StringLiteral(tr_run),
+        ))
+
+
+def find_isen_ternaries(text, quotes="'\"", tokens=None):
+    """All isEn ternaries whose literals use `quotes`, in source order.
+
+    Pass `tokens` (tokenize(text)) when the caller has them already.
+    """
+    out = []
+    if 'isEn' not in text:
+        return out
+    _find_in(tokenize(text) if tokens is None else tokens, text, quotes, out)
+    out.sort(key=lambda t: t.start)
+    return out
+
+
+class TernaryMatcher:
+    """Lexer-backed stand-in for the ISEN_PATTERN regexes in migrate_engine.
+
+    `quotes` limits which literal quote characters a ternary may use.
+    `pattern` and `flags` mirror re.Pattern so the scan cache can
+    fingerprint either kind.
+    """
+
+    def __init__(self, quotes="'\""):
+        self.quotes = quotes
+        self.pattern = f'dart_lexer:{quotes}'
+        self.flags = 0
+
+    def find(self, text):
+        return find_isen_ternaries(text, self.quotes)
+
+
+# ═══════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════
+
+BENCH_FILES = [
+    'lib/data/content/quiz_content.dart',
+    'lib/data/cities/world_cities.dart',
+]
+
+
+def _best_of(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def benchmark(paths):
+    from migrate_engine import ISEN_PATTERN_ALL
+
+    print(f"{'file':<40} {'KB':>5} {'regex MB/s':>11} {'lexer MB/s':>11} "
+          f"{'tokenize MB/s':>14} {'regex':>6} {'lexer':>6}")
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        mb = len(text.encode('utf-8')) / 1e6
+        t_re, re_hits = _best_of(lambda: list(ISEN_PATTERN_ALL.finditer(text)))
+        t_lex, lex_hits = _best_of(lambda: find_isen_ternaries(text))
+        # Full tokenization, i.e. the cost when the file does mention isEn
+        t_tok, _ = _best_of(lambda: tokenize(text))
+        print(
+            f"{path[-40:]:<40} {mb * 1000:>5.0f} {mb / t_re:>11.1f} "
+            f"{mb / t_lex:>11.1f} {mb / t_tok:>14.1f} {len(re_hits):>6} {len(lex_hits):>6}"
+        )
+
+
+if __name__ == '__main__':
+    from pathlib import Path
+    root = Path(__file__).parent.parent
+    benchmark(sys.argv[1:] or [str(root / p) for p in BENCH_FILES])
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Generate lib/data/services/l10n_keys.g.dart from assets/l10n/en.json.
+
+Every catalog key becomes a `static const` on L10nKeys, named in
+lowerCamelCase after the dotted key (journal.daily_entry.word_count ->
+journalDailyEntryWordCount). Call sites can then write
+L10nService.get(L10nKeys.journalDailyEntryWordCount, ...) and a typo is
+a compile error instead of a `[key]` placeholder at runtime.
+
+The migrate scripts write call sites with these constants (unless run
+with --literal-keys) and regenerate the file in the same commit as the
+catalogs. Run this directly after editing en.json by hand, or with
+--check in CI. --call-sites also rewrites L10nService.get('key', ...)
+literals under lib/ to their constants.
+
+A key keeps the name the current file gives it, so regenerating never
+renames a constant call sites already use.
+
+Usage:
+  python3 scripts/gen_l10n_keys.py                # write the file
+  python3 scripts/gen_l10n_keys.py --check        # exit 1 if it is stale
+  python3 scripts/gen_l10n_keys.py --call-sites   # also rewrite key literals
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from pathlib import Path
+
+from dart_lexer import CODE, STRING, StringLiteral, tokenize
+from l10n_catalog import KeyIndex
+from migrate_txn import begin, journal_path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+KEYS_CLASS = 'L10nKeys'
+
+_DART_RESERVED = set(
+    'abstract as assert async await base break case catch class const continue '
+    'covariant default deferred do dynamic else enum export extends extension '
+    'external factory false final finally for function get hide if implements '
+    'import in interface is late library mixin new null of on operator part '
+    'required rethrow return sealed set show static super switch sync this '
+    'throw true try type typedef var void when while with yield'.split()
+)
+
+
+# One generated constant: name and the escaped key (see render)
+_CONSTANT = re.compile(r"static const ([A-Za-z0-9_$]+) =\s*'((?:[^'\\]|\\.)*)';")
+
+# Code right before a call's key argument
+_CALL = re.compile(r'L10nService\.(?:get|getWithParams)\(\s*\Z')
+
+
+def keys_path(project_root):
+    return Path(project_root) / 'lib' / 'data' / 'services' / 'l10n_keys.g.dart'
+
+
+def _camel(key):
+    parts = [p for p in re.split(r'[._]+', key) if p]
+    name = parts[0].lower() + ''.join(p[:1].upper() + p[1:] for p in parts[1:])
+    name = re.sub(r'[^A-Za-z0-9$]', '', name) or 'key'
+    if name[0].isdigit() or name in _DART_RESERVED:
+        name = f'k{name[:1].upper()}{name[1:]}'
+    return name
+
+
+def read_identifiers(path):
+    """Dotted key -> Dart identifier as generated in `path` ({} if missing)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    text = path.read_text(encoding='utf-8')
+    return {re.sub(r'\\(.)', r'\1', m.group(2)): m.group(1)
+            for m in _CONSTANT.finditer(text)}
+
+
+def key_identifiers(keys, current=None):
+    """Dotted key -> Dart identifier for every key, in sorted key order.
+
+    A key named in `current` (see read_identifiers) keeps that name. Other
+    keys get their lowerCamelCase name unless it is taken or clashes with
+    another new key; those get a suffix derived from the key itself. A
+    name therefore never moves to another key when keys are added.
+    """
+    current = current or {}
+    names = {key: current[key] for key in keys if key in current}
+    used = set(names.values())
+    by_name = {}
+    for key in keys:
+        if key not in names:
+            by_name.setdefault(_camel(key), []).append(key)
+    for name, group in by_name.items():
+        for key in group:
+            if len(group) > 1 or name in used:
+                names[key] = f"{name}${hashlib.sha1(key.encode()).hexdigest()[:6]}"
+            else:
+                names[key] = name
+    return dict(sorted(names.items()))
+
+
+def key_ref(key, names):
+    """`L10nKeys.x` for a key with a constant, else the quoted literal."""
+    name = names.get(key)
+    return f'{KEYS_CLASS}.{name}' if name else f"'{key}'"
+
+
+def _dart_string(s):
+    return "'" + s.replace('\\', '\\\\').replace("'", "\\'").replace('$', '\\$') + "'"
+
+
+def render(keys, current=None):
+    """Content of l10n_keys.g.dart for `keys`, laid out as `dart format` would.
+
+    `current` keeps existing names, as in key_identifiers.
+    """
+    lines = [
+        '// GENERATED by scripts/gen_l10n_keys.py from assets/l10n/en.json.',
+        '// Do not edit; rerun the script (the migrate scripts do it for you).',
+        '',
+        '/// Compile-time keys for L10nService, one per catalog entry.',
+        f'abstract final class {KEYS_CLASS} {{',
+    ]
+    for key, name in key_identifiers(keys, current).items():
+        line = f'  static const {name} = {_dart_string(key)};'
+        if len(line) <= 80:
+            lines.append(line)
+        else:
+            lines.append(f'  static const {name} =')
+            lines.append(f'      {_dart_string(key)};')
+    lines += ['}', '']
+    return '\n'.join(lines)
+
+
+def _find_call_sites(tokens, text, names, edits):
+    for i, tok in enumerate(tokens):
+        if tok.kind != STRING:
+            continue
+        for child in tok.value.children:
+            _find_call_sites(child, text, names, edits)
+        if i == 0 or tokens[i - 1].kind != CODE:
+            continue
+        if i + 1 < len(tokens) and tokens[i + 1].kind == STRING:
+            continue
+        if not _CALL.search(text, tokens[i - 1].start, tokens[i - 1].end):
+            continue
+        literal = StringLiteral([tok])
+        if not literal.interpolated and literal.value in names:
+            edits.append((tok.start, tok.end, f'{KEYS_CLASS}.{names[literal.value]}'))
+
+
+def constant_call_sites(text, names):
+    """(`text` with each `L10nService.get('key'` literal whose key has a
+    constant in `names` rewritten to `L10nKeys.name`, rewrite count).
+
+    Calls inside `${...}` count too; interpolated and concatenated
+    literals are left alone.
+    """
+    edits = []
+    _find_call_sites(tokenize(text), text, names, edits)
+    edits.sort()
+    parts, pos = [], 0
+    for start, end, ref in edits:
+        parts += [text[pos:start], ref]
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts), len(edits)
+
+
+def rewrite_call_sites(project_root, names):
+    """Rewrite key literals under lib/ to constants in one transaction;
+    returns (files, call sites) changed."""
+    skip = str(keys_path(project_root))
+    txn = begin(journal_path(project_root))
+    files = sites = 0
+    for root, _, filenames in os.walk(Path(project_root) / 'lib'):
+        if '_archived' in root:
+            continue
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            if not filename.endswith('.dart') or path == skip:
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            new, count = constant_call_sites(text, names)
+            if count:
+                txn.stage(path, new)
+                files += 1
+                sites += count
+    txn.commit()
+    return files, sites
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='exit 1 if the file is missing or stale')
+    parser.add_argument(
+        '--call-sites', action='store_true',
+        help="also rewrite L10nService.get('key', ...) literals under lib/ to L10nKeys constants",
+    )
+    args = parser.parse_args()
+    if args.check and args.call_sites:
+        parser.error('--call-sites writes to lib/; run it without --check')
+
+    en = PROJECT_ROOT / 'assets' / 'l10n' / 'en.json'
+    out = keys_path(PROJECT_ROOT)
+    with open(en, 'r', encoding='utf-8') as f:
+        keys = KeyIndex(f.read()).leaves
+    names = key_identifiers(keys, read_identifiers(out))
+    content = render(keys, names)
+
+    current = out.read_text(encoding='utf-8') if out.exists() else None
+    if args.check:
+        if current != content:
+            print(f"{out.relative_to(PROJECT_ROOT)} is stale; run scripts/gen_l10n_keys.py")
+            sys.exit(1)
+        return
+    if current != content:
+        out.write_text(content, encoding='utf-8')
+        print(f"Wrote {out.relative_to(PROJECT_ROOT)}")
+    if args.call_sites:
+        files, sites = rewrite_call_sites(PROJECT_ROOT, names)
+        print(f"Rewrote {sites} call sites in {files} files to {KEYS_CLASS} constants")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Split assets/l10n/<locale>.json into per-feature shards for lazy loading.
+
+Each top-level object of a catalog (`journal`, `today`, `premium`, ...,
+the first segment of the prefixes file_to_prefix() hands out) becomes
+assets/l10n/shards/<locale>/<feature>.json. That file holds the same
+subtree under the same top-level key, so L10nService.loadShards() can
+merge it without rewriting keys. assets/l10n/shards/manifest.json lists
+every shard with its key count, first and last key, and size per locale.
+
+The monolithic catalogs stay the source of truth, and the shards are
+build output: they are not committed (see .gitignore), and nothing
+keeps them in sync with the catalogs. Nothing calls loadShards() yet,
+so pubspec.yaml does not bundle them either. The caller that needs them
+should run this as a build step and register assets/l10n/shards/<locale>/
+in pubspec.yaml. Each run also removes the shards of features that are
+gone, in the same transaction as the writes (see migrate_txn).
+
+Usage:
+  python3 scripts/gen_l10n_shards.py
+"""
+
+import argparse
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+from l10n_catalog import LOCALES, KeyIndex
+from migrate_txn import begin, journal_path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+L10N_DIR = PROJECT_ROOT / 'assets' / 'l10n'
+MANIFEST_VERSION = 1
+
+
+def shards_dir(l10n_dir):
+    return Path(l10n_dir) / 'shards'
+
+
+def manifest_path(l10n_dir):
+    return shards_dir(l10n_dir) / 'manifest.json'
+
+
+def _render(data):
+    return json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+
+
+def render(texts):
+    """relative path -> content of every shard and the manifest, for
+    `texts` mapping locale -> catalog text."""
+    files = OrderedDict()
+    features = OrderedDict()
+    for loc, text in texts.items():
+        catalog = json.loads(text, object_pairs_hook=OrderedDict)
+        for feature, value in catalog.items():
+            content = _render({feature: value})
+            files[f'{loc}/{feature}.json'] = content
+            leaves = sorted(KeyIndex(content).leaves)
+            entry = features.setdefault(feature, {'keys': {}, 'first': None, 'last': None, 'bytes': {}})
+            entry['keys'][loc] = len(leaves)
+            entry['bytes'][loc] = len(content.encode('utf-8'))
+            if leaves:
+                entry['first'] = min(filter(None, (entry['first'], leaves[0])))
+                entry['last'] = max(filter(None, (entry['last'], leaves[-1])))
+
+    manifest = OrderedDict([
+        ('version', MANIFEST_VERSION),
+        ('locales', list(texts)),
+        ('shards', OrderedDict(sorted(features.items()))),
+    ])
+    files['manifest.json'] = _render(manifest)
+    return files
+
+
+def updates(l10n_dir, texts):
+    """([(path, old, new)] for shards that differ from `texts`, [stale paths]).
+
+    `old` is None for a shard that does not exist yet. Stale paths are
+    shard files of features no catalog has any more.
+    """
+    root = shards_dir(l10n_dir)
+    files = render(texts)
+    changed = []
+    for rel, content in files.items():
+        path = root / rel
+        old = path.read_text(encoding='utf-8') if path.exists() else None
+        if old != content:
+            changed.append((path, old, content))
+    stale = []
+    for loc in texts:
+        if (root / loc).is_dir():
+            stale.extend(sorted(p for p in (root / loc).glob('*.json')
+                                if f'{loc}/{p.name}' not in files))
+    return changed, stale
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    texts = OrderedDict()
+    for loc in LOCALES:
+        with open(L10N_DIR / f'{loc}.json', 'r', encoding='utf-8') as f:
+            texts[loc] = f.read()
+    changed, stale = updates(L10N_DIR, texts)
+
+    # New shards, the manifest and the deletions land together
+    txn = begin(journal_path(PROJECT_ROOT))
+    for path, _, content in changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        txn.stage(path, content)
+    for path in stale:
+        txn.remove(path)
+    txn.commit()
+    if changed or stale:
+        print(f"Updated {len(changed)} and removed {len(stale)} files in "
+              f"{shards_dir(L10N_DIR).relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == '__main__':
+    main()
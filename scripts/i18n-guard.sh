@@ -46,19 +46,18 @@ FOUND_VIOLATIONS=0
 
 echo -e "${BLUE}[1/4] Checking for hardcoded Turkish in Dart code...${NC}"
 
-# Common Turkish words/phrases that should use l10n
+# Common Turkish words/phrases (for the JSON check below)
 TR_MARKERS="günlük|haftalık|aylık|yıllık|bugün|yarın|şimdi|için|değil|veya|ama|fakat|çünkü|nasıl|neden|nereye|lütfen|teşekkür|merhaba|hoşgeldiniz|devam|iptal|kaydet|sil|düzenle|ekle|göster|gizle|seçin|yüklen"
 
-HARDCODED_TR=$(grep -rniE "('|\")\s*[^'\"]*($TR_MARKERS)[^'\"]*\s*('|\")" \
-  --include="*.dart" \
-  --exclude-dir=node_modules \
-  --exclude-dir=.git \
-  --exclude-dir=build \
-  --exclude-dir=.dart_tool \
-  --exclude="*_test.dart" \
-  --exclude="l10n_service.dart" \
-  --exclude="**/l10n/*.dart" \
-  "$TARGET_PATH" 2>/dev/null || true)
+# scripts/l10n_scan.py classifies every literal in one lexer pass. Language
+# ternaries (`isEn ? ...`, `!isEn ? ...`, `language == AppLanguage.en ? ...`),
+# `nameTr:`-style bilingual content and the files in
+# scripts/l10n_scan_allowlist.json or marked `// l10n-scan: ignore-file` are
+# not violations. Tests, build output and l10n/ directories are skipped.
+HARDCODED_TR=""
+if ! SCAN_OUT=$(python3 "$(dirname "$0")/l10n_scan.py" --list turkish "$TARGET_PATH" 2>&1); then
+  HARDCODED_TR="$SCAN_OUT"
+fi
 
 if [ -n "$HARDCODED_TR" ]; then
   echo -e "${RED}⚠️  HARDCODED TURKISH DETECTED:${NC}"
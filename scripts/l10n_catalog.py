@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Diff-minimal editing of the assets/l10n/*.json locale catalogs.
+
+The catalogs are kept in the layout json.dump(indent=2, ensure_ascii=False)
+produces: one member per line, nested objects indented by two spaces per
+level, and no raw newlines inside strings. That makes every object and
+member addressable with anchored substring searches, so new keys are
+spliced into the existing text without parsing or re-serialising the rest
+of the file. The result is byte-identical to loading the file into
+OrderedDicts, assigning the nested keys and dumping it again.
+
+LocaleSet holds all four catalogs L10nService ships (en, tr, de, fr) so a
+migration updates every locale in one pass and reports coverage deltas.
+Keys a locale only has as a copy of the English are recorded in its
+pending sidecar, assets/l10n/pending/<locale>.json, so later runs and
+l10n_check.py know they still need translating.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+
+def _dump(value, indent):
+    """`value` as json.dump(indent=2) renders it when nested at `indent`."""
+    text = json.dumps(value, ensure_ascii=False, indent=2)
+    return text.replace('\n', '\n' + ' ' * indent)
+
+
+def _member(key, value, indent):
+    return f"{' ' * indent}{json.dumps(key, ensure_ascii=False)}: {_dump(value, indent)}"
+
+
+class _TextObject:
+    """An object that already exists in the catalog text.
+
+    `start` is the offset of its `{`; `close` is the offset of the newline
+    before its closing brace (or of the `{` itself when it is `{}`).
+    """
+
+    __slots__ = ('start', 'close', 'indent', 'empty', 'children', 'added')
+
+    def __init__(self, start, close, indent, empty):
+        self.start = start
+        self.close = close
+        self.indent = indent
+        self.empty = empty
+        self.children = {}          # key -> _TextObject | (value_start, value_end) | None
+        self.added = OrderedDict()  # new members appended before the closing brace
+
+
+class CatalogText:
+    """A locale catalog edited in place; see the module docstring."""
+
+    def __init__(self, text):
+        self.text = text
+        self.changed = False
+        self._replaced = {}  # (value_start, value_end) -> (indent, new value)
+        if text.startswith('{\n  "') and text.endswith('\n}\n'):
+            self.root = _TextObject(0, len(text) - 3, 0, False)
+        elif text.strip() == '{}':
+            self.root = _TextObject(text.index('{'), text.index('{'), 0, True)
+        else:
+            # Not in canonical layout: normalise once via a full load/dump
+            data = json.loads(text, object_pairs_hook=OrderedDict)
+            self.text = json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+            self.changed = self.text != text
+            self.root = _TextObject(0, len(self.text) - 3, 0, False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read())
+
+    def save(self, path):
+        """Write the catalog if anything changed; returns whether it did."""
+        if not self.changed:
+            return False
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        return True
+
+    # ── lookup ────────────────────────────────────────────────────
+
+    def _child(self, obj, key):
+        """Existing child of a text object: _TextObject, value span or None."""
+        if key in obj.children:
+            return obj.children[key]
+
+        found = None
+        if not obj.empty:
+            text = self.text
+            indent = obj.indent + 2
+            anchor = f"\n{' ' * indent}{json.dumps(key, ensure_ascii=False)}: "
+            pos = text.find(anchor, obj.start, obj.close + 1)
+            if pos >= 0:
+                vstart = pos + len(anchor)
+                opener = text[vstart]
+                if opener in '{[' and text[vstart + 1] in '}]':
+                    vend = vstart + 2
+                elif opener in '{[':
+                    closer = '}' if opener == '{' else ']'
+                    vend = text.index(f"\n{' ' * indent}{closer}", vstart) + indent + 2
+                else:
+                    vend = text.index('\n', vstart)
+                    if text[vend - 1] == ',':
+                        vend -= 1
+                if opener == '{':
+                    empty = vend == vstart + 2
+                    close = vstart if empty else vend - indent - 2
+                    found = _TextObject(vstart, close, indent, empty)
+                else:
+                    found = (vstart, vend)
+
+        obj.children[key] = found
+        return found
+
+    def _get(self, node, key):
+        """Child of a text object or pending dict; (node, exists)."""
+        if isinstance(node, _TextObject):
+            if key in node.added:
+                return node.added[key], True
+            child = self._child(node, key)
+            if child is None:
+                return None, False
+            if isinstance(child, tuple):
+                return self._replaced[child][1] if child in self._replaced else child, True
+            return child, True
+        if isinstance(node, dict) and key in node:
+            return node[key], True
+        return None, False
+
+    def has(self, key):
+        """True if the dotted key exists (as any value) along a path of objects."""
+        node = self.root
+        for part in key.split('.'):
+            if not isinstance(node, (_TextObject, dict)):
+                return False
+            node, exists = self._get(node, part)
+            if not exists:
+                return False
+        return True
+
+    # ── editing ───────────────────────────────────────────────────
+
+    def _assign(self, node, key, value):
+        """node[key] = value, keeping the position of an existing member."""
+        if isinstance(node, dict):
+            node[key] = value
+            return
+        if key in node.added:
+            node.added[key] = value
+            return
+        child = self._child(node, key)
+        if child is None:
+            node.added[key] = value
+            return
+        span = child
+        if isinstance(child, _TextObject):
+            # The whole object is replaced; edits inside it are dropped on render
+            end = child.start + 2 if child.empty else child.close + child.indent + 2
+            span = (child.start, end)
+            node.children[key] = span
+        self._replaced[span] = (node.indent + 2, value)
+
+    def set(self, key, value):
+        """Assign a dotted key; non-object values on the path become objects."""
+        parts = key.split('.')
+        node = self.root
+        for part in parts[:-1]:
+            child, exists = self._get(node, part)
+            if not exists or not isinstance(child, (_TextObject, dict)):
+                child = OrderedDict()
+                self._assign(node, part, child)
+            node = child
+        self._assign(node, parts[-1], value)
+        self.changed = True
+
+    # ── output ────────────────────────────────────────────────────
+
+    def _edits(self):
+        edits = []
+        for (start, end), (indent, value) in self._replaced.items():
+            edits.append((start, end, _dump(value, indent)))
+
+        stack = [self.root]
+        while stack:
+            obj = stack.pop()
+            stack.extend(c for c in obj.children.values() if isinstance(c, _TextObject))
+            if not obj.added:
+                continue
+            indent = obj.indent + 2
+            members = ',\n'.join(_member(k, v, indent) for k, v in obj.added.items())
+            if obj.empty:
+                edits.append((obj.start, obj.start + 2,
+                              f"{{\n{members}\n{' ' * obj.indent}}}"))
+            else:
+                edits.append((obj.close, obj.close, ',\n' + members))
+
+        # Drop edits that fall inside a replaced value
+        edits.sort(key=lambda e: (e[0], -e[1]))
+        kept = []
+        for edit in edits:
+            if kept and edit[0] < kept[-1][1]:
+                continue
+            kept.append(edit)
+        return kept
+
+    def render(self):
+        parts = []
+        pos = 0
+        for start, end, replacement in self._edits():
+            parts.append(self.text[pos:start])
+            parts.append(replacement)
+            pos = end
+        parts.append(self.text[pos:])
+        return ''.join(parts)
+
+
+def prune(text, keys):
+    """`text` without the dotted `keys` and the objects they leave empty.
+
+    Unlike CatalogText edits this loads and dumps the whole catalog, which
+    is fine for a rare cleanup and yields the same canonical layout.
+    """
+    data = json.loads(text, object_pairs_hook=OrderedDict)
+
+    def walk(obj, prefix):
+        for k in list(obj):
+            path = prefix + k
+            if isinstance(obj[k], dict):
+                had_members = bool(obj[k])
+                walk(obj[k], path + '.')
+                if had_members and not obj[k]:
+                    del obj[k]
+            elif path in keys:
+                del obj[k]
+
+    walk(data, '')
+    return json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOCALE SET
+# ═══════════════════════════════════════════════════════════════
+
+# L10nService.supportedLanguages; `en` is the source of truth for keys
+LOCALES = ('en', 'tr', 'de', 'fr')
+
+# What a locale without its own text gets for a new key:
+#   en   - the English text, listed in the locale's pending sidecar
+#          (see pending_path) until translated
+#   skip - nothing; L10nService falls back to its `[key]` placeholder
+PENDING_POLICIES = ('en', 'skip')
+
+
+def pending_path(l10n_dir, loc):
+    """Sidecar listing the keys whose `loc` text is the pending copy of the
+    English, not a translation. It sits in a subdirectory pubspec.yaml
+    does not list, so it is not bundled with the app."""
+    return Path(l10n_dir) / 'pending' / f'{loc}.json'
+
+
+def load_pending(l10n_dir, indexes):
+    """locale -> set of keys still pending translation, for locale ->
+    KeyIndex. A key drops out once its text differs from en (someone
+    translated it) or it is gone."""
+    en = indexes['en'].leaves
+    pending = OrderedDict()
+    for loc, index in indexes.items():
+        path = pending_path(l10n_dir, loc)
+        keys = []
+        if loc != 'en' and path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                keys = json.load(f)
+        pending[loc] = {k for k in keys if k in index.leaves and index.leaves[k] == en.get(k)}
+    return pending
+
+
+def render_pending(keys):
+    return json.dumps(sorted(keys), ensure_ascii=False, indent=2) + '\n'
+
+
+class KeyConflictError(ValueError):
+    """A key would overwrite an object or nest under an existing value.
+
+    `conflicts` lists the (key, reason) pairs when a whole batch was
+    checked (see LocaleSet.conflicts).
+    """
+
+    def __init__(self, message, conflicts=()):
+        super().__init__(message)
+        self.conflicts = list(conflicts)
+
+
+class KeyIndex:
+    """Flat view of a catalog: dotted leaf keys and every object path.
+
+    Built with one json.loads(); existence, prefix and conflict checks
+    are then set lookups instead of walks through the nested dicts.
+    """
+
+    def __init__(self, text=None):
+        self.leaves = {}     # dotted key -> value (string, list, ...)
+        self.objects = set()  # dotted paths of objects, root excluded
+        if text is None:
+            return
+        stack = [('', json.loads(text))]
+        while stack:
+            prefix, obj = stack.pop()
+            for k, v in obj.items():
+                if isinstance(v, dict):
+                    self.objects.add(prefix + k)
+                    stack.append((f'{prefix}{k}.', v))
+                else:
+                    self.leaves[prefix + k] = v
+
+    def __contains__(self, key):
+        return key in self.leaves or key in self.objects
+
+    def __len__(self):
+        return len(self.leaves)
+
+    def has_prefix(self, prefix):
+        """True if `prefix` names an object (a subtree of keys)."""
+        return prefix in self.objects
+
+    def blocking_parent(self, key):
+        """The parent of `key` that is a value, or None. No other key
+        under that parent (`key_1`, ...) can be stored either."""
+        dot = key.find('.')
+        while dot >= 0:
+            if key[:dot] in self.leaves:
+                return key[:dot]
+            dot = key.find('.', dot + 1)
+        return None
+
+    def conflict(self, key):
+        """Why `key` cannot be stored as a value, or None if it can."""
+        if key in self.objects:
+            return 'is an existing object'
+        parent = self.blocking_parent(key)
+        if parent is not None:
+            return f"parent '{parent}' is an existing value"
+        return None
+
+    def add(self, key, value):
+        self.leaves[key] = value
+        dot = key.find('.')
+        while dot >= 0:
+            self.objects.add(key[:dot])
+            dot = key.find('.', dot + 1)
+
+
+class LocaleSet:
+    """Every locale catalog in one l10n directory, loaded once and saved together."""
+
+    def __init__(self, l10n_dir, pending='en'):
+        if pending not in PENDING_POLICIES:
+            raise ValueError(f'unknown pending-translation policy: {pending}')
+        self.l10n_dir = l10n_dir
+        self.pending_policy = pending
+        self.catalogs = OrderedDict(
+            (loc, CatalogText.load(l10n_dir / f'{loc}.json')) for loc in LOCALES
+        )
+        self.indexes = {loc: KeyIndex(c.text) for loc, c in self.catalogs.items()}
+        self.pending = {loc: [] for loc in LOCALES}  # pending keys added this run
+        self.untranslated = load_pending(l10n_dir, self.indexes)  # all pending keys
+        self.reserved = KeyIndex()  # keys claimed outside the catalogs (see reserve)
+        self._before = {loc: set(index.leaves) for loc, index in self.indexes.items()}
+        self._untranslated_before = {loc: set(keys) for loc, keys in self.untranslated.items()}
+
+    def conflicts(self, keys):
+        """(key, reason) for every key that cannot be written without
+        clobbering a translation or a subtree, in any locale or between
+        the keys themselves. Nothing is modified."""
+        keys = sorted(keys)
+        batch = set(keys)
+        found = []
+        for key in keys:
+            reasons = OrderedDict()
+            for loc, index in (*self.indexes.items(), ('l10n store', self.reserved)):
+                reason = index.conflict(key)
+                if reason:
+                    reasons.setdefault(reason, []).append(loc)
+            dot = key.find('.')
+            while dot >= 0:
+                if key[:dot] in batch:
+                    reasons.setdefault(f"parent '{key[:dot]}' is also a new key", [])
+                dot = key.find('.', dot + 1)
+            for reason, locs in reasons.items():
+                found.append((key, f"{reason} ({', '.join(locs)})" if locs else reason))
+        return found
+
+    def reserve(self, keys):
+        """Treat `keys` as taken though no catalog has them yet, e.g. keys
+        added in the l10n store and not exported."""
+        for key in keys:
+            self.reserved.add(key, None)
+
+    def taken(self, key):
+        """True if a new string cannot get `key`: some locale already has
+        it, or has an object or value in its way, or it is reserved. Set
+        lookups only."""
+        return any(key in index.leaves or index.conflict(key)
+                   for index in (*self.indexes.values(), self.reserved))
+
+    def blocking_parent(self, key):
+        """The parent of `key` that is a value in some locale (or reserved),
+        or None; see KeyIndex.blocking_parent."""
+        for index in (*self.indexes.values(), self.reserved):
+            parent = index.blocking_parent(key)
+            if parent is not None:
+                return parent
+        return None
+
+    def pairs(self):
+        """(en text, tr text) -> existing key, for reusing catalog strings.
+
+        When several keys hold the same pair, a `common.*` key wins, then
+        the first in sorted order.
+        """
+        en, tr = self.indexes['en'].leaves, self.indexes['tr'].leaves
+        pool = {}
+        for key in sorted(en, key=lambda k: (not k.startswith('common.'), k)):
+            en_text, tr_text = en[key], tr.get(key)
+            if isinstance(en_text, str) and isinstance(tr_text, str):
+                pool.setdefault((en_text, tr_text), key)
+        return pool
+
+    def add(self, key, texts):
+        """Add a key missing from en.json to every locale; False if en has it.
+
+        `texts` maps locale -> text and must include `en`. Locales it
+        provides are always written (as before for tr.json); the others
+        only get the pending text when they lack the key.
+        """
+        if key in self.indexes['en']:
+            return False
+        self.set(key, texts)
+        return True
+
+    def set(self, key, texts):
+        """Write `key` everywhere, overwriting the locales `texts` provides.
+
+        Raises KeyConflictError instead of replacing an object, or a value
+        on the key's path, in any locale.
+        """
+        for loc, index in self.indexes.items():
+            reason = index.conflict(key)
+            if reason:
+                raise KeyConflictError(f'{loc}.json: {key} {reason}')
+        for loc, catalog in self.catalogs.items():
+            index = self.indexes[loc]
+            if loc in texts:
+                catalog.set(key, texts[loc])
+                index.add(key, texts[loc])
+                self.untranslated[loc].discard(key)
+            elif self.pending_policy != 'skip' and key not in index:
+                catalog.set(key, texts[self.pending_policy])
+                index.add(key, texts[self.pending_policy])
+                self.pending[loc].append(key)
+                self.untranslated[loc].add(key)
+
+    def pending_files(self):
+        """[(path, old, new)] for the pending sidecars that changed; `old`
+        is None for a sidecar that does not exist yet."""
+        changed = []
+        for loc, keys in self.untranslated.items():
+            path = pending_path(self.l10n_dir, loc)
+            old = path.read_text(encoding='utf-8') if path.exists() else None
+            new = render_pending(keys)
+            if new != old and (old is not None or keys):
+                changed.append((path, old, new))
+        return changed
+
+    def save(self):
+        """Write the catalogs that changed, and their pending sidecars;
+        returns their locale codes."""
+        for path, _, new in self.pending_files():
+            os.makedirs(path.parent, exist_ok=True)
+            path.write_text(new, encoding='utf-8')
+        return [loc for loc, c in self.catalogs.items() if c.save(self.l10n_dir / f'{loc}.json')]
+
+    def coverage(self):
+        """locale -> (keys before, keys after, % of en translated before,
+        % of en translated after). Pending copies of the English do not
+        count as translated."""
+        en_before, en_after = self._before['en'], self.indexes['en'].leaves
+        result = OrderedDict()
+        for loc in LOCALES:
+            before, after = self._before[loc], self.indexes[loc].leaves
+            translated_before = (before & en_before) - self._untranslated_before[loc]
+            translated_after = (after.keys() & en_after.keys()) - self.untranslated[loc]
+            result[loc] = (
+                len(before),
+                len(after),
+                100.0 * len(translated_before) / max(len(en_before), 1),
+                100.0 * len(translated_after) / max(len(en_after), 1),
+            )
+        return result
+
+    def report(self):
+        """Per-locale coverage delta lines for the migration summary."""
+        lines = []
+        for loc, (before, after, pct_before, pct_after) in self.coverage().items():
+            line = (f"  {loc}.json: {before} -> {after} keys ({after - before:+d}), "
+                    f"translated {pct_before:.1f}% -> {pct_after:.1f}%")
+            if self.untranslated[loc]:
+                line += f", {len(self.untranslated[loc])} pending translation"
+                if self.pending[loc]:
+                    line += f" ({len(self.pending[loc])} new)"
+            lines.append(line)
+        return lines
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Key coverage and placeholder consistency of the assets/l10n catalogs.
+
+Each catalog is flattened once (one json.loads via KeyIndex). Missing
+and extra keys per locale are then set differences against en.json.
+The `{name}` placeholders of every en string are compared with the same
+key in tr, de and fr: getWithParams() only substitutes the names it is
+given, so a placeholder renamed or dropped in one locale leaves literal
+braces on screen there.
+
+Keys a migration filled with the English text are listed per locale in
+assets/l10n/pending/<locale>.json (see l10n_catalog.pending_path) and
+count as untranslated, not covered.
+
+As with i18n_coverage_check.dart, only the priority locales (tr) must
+have every key translated; the others are advisory. A placeholder
+mismatch fails the check in any locale. The whole run takes well under a second, so
+it fits a pre-commit hook:
+
+  python3 scripts/l10n_check.py || exit 1
+
+The migrate scripts run the same check on their in-memory catalogs.
+
+Usage:
+  python3 scripts/l10n_check.py             # summary, exit 1 on failure
+  python3 scripts/l10n_check.py --verbose   # list the keys
+  python3 scripts/l10n_check.py --strict    # every locale needs every key translated
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+from l10n_catalog import LOCALES, KeyIndex, load_pending
+
+PROJECT_ROOT = Path(__file__).parent.parent
+L10N_DIR = PROJECT_ROOT / 'assets' / 'l10n'
+
+# Missing keys block only for these, as in i18n_coverage_check.dart
+PRIORITY_LOCALES = ('tr',)
+
+# getWithParams() replaces `{name}` for each param name; names are Dart
+# identifiers, so `\u{1F382}` or a `{}` in prose is not a placeholder
+PLACEHOLDER = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+Mismatch = namedtuple('Mismatch', 'locale key expected found')
+
+
+def placeholders(value):
+    """Placeholder names in a catalog value (strings in lists included)."""
+    if isinstance(value, str):
+        return frozenset(PLACEHOLDER.findall(value)) if '{' in value else frozenset()
+    if isinstance(value, list):
+        return frozenset().union(*(placeholders(v) for v in value))
+    return frozenset()
+
+
+class CatalogCheck:
+    """Coverage and placeholder findings for locale -> KeyIndex.
+
+    `keys` limits the placeholder comparison (not coverage) to those en
+    keys, e.g. the ones a migration just added. `pending` (locale -> keys,
+    see load_pending) are present but untranslated.
+    """
+
+    def __init__(self, indexes, keys=None, pending=None):
+        en = indexes['en'].leaves
+        self.total = len(en)
+        self.missing = OrderedDict()
+        self.extra = OrderedDict()
+        self.pending = OrderedDict()
+        self.mismatches = []
+
+        scope = en if keys is None else [k for k in keys if k in en]
+        expected = {k: placeholders(en[k]) for k in scope}
+        for loc, index in indexes.items():
+            if loc == 'en':
+                continue
+            leaves = index.leaves
+            self.missing[loc] = sorted(en.keys() - leaves.keys())
+            self.extra[loc] = sorted(leaves.keys() - en.keys())
+            self.pending[loc] = sorted((pending or {}).get(loc, ()))
+            for key, names in expected.items():
+                value = leaves.get(key)
+                if value is None:
+                    continue
+                found = placeholders(value)
+                if found != names:
+                    self.mismatches.append(Mismatch(loc, key, names, found))
+
+    def failed(self, strict=False):
+        blocking = self.missing if strict else PRIORITY_LOCALES
+        return bool(self.mismatches) or any(
+            self.missing.get(loc) or self.extra.get(loc) or self.pending.get(loc)
+            for loc in blocking
+        )
+
+    def report(self, verbose=False, strict=False, limit=20):
+        """Summary lines; with `verbose`, up to `limit` keys per finding."""
+        def listing(items):
+            shown = [f"    - {item}" for item in items[:limit]]
+            if len(items) > limit:
+                shown.append(f"    ... and {len(items) - limit} more")
+            return shown if verbose else []
+
+        lines = []
+        for loc in self.missing:
+            missing, extra, pending = self.missing[loc], self.extra[loc], self.pending[loc]
+            count = self.total - len(missing) + len(extra)
+            if not missing and not extra and not pending:
+                lines.append(f"  {loc}.json: {count} keys (100% translated)")
+                continue
+            blocking = strict or loc in PRIORITY_LOCALES
+            pct = 100.0 * (self.total - len(missing) - len(pending)) / max(self.total, 1)
+            lines.append(f"  {loc}.json: {count} keys ({pct:.1f}% translated)"
+                         f"{' BLOCKING' if blocking else ' advisory'}")
+            if pending:
+                lines.append(f"    pending translation {len(pending)} keys (English text)")
+                lines += listing(pending)
+            if missing:
+                lines.append(f"    missing {len(missing)} keys")
+                lines += listing(missing)
+            if extra:
+                lines.append(f"    extra {len(extra)} keys (not in en.json)")
+                lines += listing(extra)
+
+        if self.mismatches:
+            lines.append(f"  {len(self.mismatches)} placeholder mismatches:")
+            for m in self.mismatches[:limit if not verbose else None]:
+                want = ', '.join(sorted(m.expected)) or '-'
+                got = ', '.join(sorted(m.found)) or '-'
+                lines.append(f"    {m.locale}.json {m.key}: en has {{{want}}}, {m.locale} has {{{got}}}")
+            if not verbose and len(self.mismatches) > limit:
+                lines.append(f"    ... and {len(self.mismatches) - limit} more (use --verbose)")
+        else:
+            lines.append("  Placeholders consistent across all locales")
+        return lines
+
+
+def load(l10n_dir=L10N_DIR):
+    """(locale -> KeyIndex, locale -> pending keys)."""
+    indexes = OrderedDict()
+    for loc in LOCALES:
+        with open(Path(l10n_dir) / f'{loc}.json', 'r', encoding='utf-8') as f:
+            indexes[loc] = KeyIndex(f.read())
+    return indexes, load_pending(l10n_dir, indexes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--verbose', '-v', action='store_true', help='list missing, extra and mismatched keys')
+    parser.add_argument('--strict', action='store_true',
+                        help='missing and pending keys block in every locale, not just tr')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    indexes, pending = load()
+    check = CatalogCheck(indexes, pending=pending)
+    ms = (time.perf_counter() - start) * 1000
+
+    print(f"l10n check: en.json has {check.total} keys ({ms:.0f} ms)")
+    print("\n".join(check.report(args.verbose, args.strict)))
+    if check.failed(args.strict):
+        print("FAILED")
+        sys.exit(1)
+    print("PASSED")
+
+
+if __name__ == '__main__':
+    main()
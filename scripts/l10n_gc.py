@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Find and remove locale keys that no Dart code references.
+
+Every .dart file under lib/ and test/ is tokenized once with dart_lexer,
+and each string literal (adjacent literals joined, interpolations
+included) is looked up as a whole in the catalogs' key index: one pass
+over the sources with a hash probe per literal, instead of a grep per
+key as in deadcode-cleanup.sh. A key counts as used if:
+
+  - a literal equals it: `L10nService.get('journal.title', ...)`, and
+    equally `getWithParams`, `getList`, `getMap`, `l10n.get`, `tr()` or
+    a key stored in a list or map for later;
+  - a literal names one of its parent objects, with or without a
+    trailing dot: `getMap('premium.features')`, `'dreams.symbols.' + id`;
+  - a literal with interpolation has the shape of a key template and
+    matches it: `'archetype.$id.name'` keeps every archetype.*.name;
+  - code refers to its L10nKeys constant (see gen_l10n_keys.py);
+  - it matches a glob in l10n_gc_allowlist.json, for keys built in
+    ways none of the above can see.
+
+Comments do not count, so a key used only in commented-out code is
+unused. --prune removes the unused keys, and any objects left empty,
+from all four catalogs in one transaction. It also updates the L10nKeys
+file when it exists, and removes the keys from an l10n store with
+unexported edits, as the migrate scripts do.
+
+Usage:
+  python3 scripts/l10n_gc.py                      # summary per feature
+  python3 scripts/l10n_gc.py --list               # ... and every unused key
+  python3 scripts/l10n_gc.py --prune --dry-run > gc.patch
+  python3 scripts/l10n_gc.py --prune
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+from dart_lexer import CODE, STRING, StringLiteral, tokenize
+from gen_l10n_keys import KEYS_CLASS, key_identifiers, keys_path, read_identifiers
+from gen_l10n_keys import render as render_keys
+from l10n_catalog import LOCALES, KeyIndex, prune
+from l10n_store import merge as merge_store
+from migrate_diff import unified_diff
+from migrate_txn import begin, journal_path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+L10N_DIR = PROJECT_ROOT / 'assets' / 'l10n'
+SOURCE_DIRS = ('lib', 'test')
+ALLOWLIST = Path(__file__).parent / 'l10n_gc_allowlist.json'
+
+# Literal text a key template may contain besides its interpolations
+_KEY_TEXT = re.compile(r'[A-Za-z0-9_.\-]*\Z')
+_CONSTANT_REF = re.compile(re.escape(KEYS_CLASS) + r'\.([A-Za-z_$][A-Za-z0-9_$]*)')
+
+
+# ═══════════════════════════════════════════════════════════════
+# REFERENCES
+# ═══════════════════════════════════════════════════════════════
+
+class References:
+    """What the Dart sources could be referring to, before resolution."""
+
+    def __init__(self):
+        self.literals = set()    # plain literal values
+        self.templates = {}      # regex source -> first `path:line` seen
+        self.constants = set()   # L10nKeys identifiers
+        self.files = 0
+
+    def add_literal(self, literal, where):
+        if not literal.interpolated:
+            self.literals.add(literal.value)
+            return
+        # Only literals shaped like `a.$b.c` are key templates; prose with
+        # a `$name` in it is not
+        text = ''.join(p for p in literal.parts if isinstance(p, str))
+        if '.' not in text or not _KEY_TEXT.match(text) or not re.search('[A-Za-z0-9]', text):
+            return
+        pattern = ''.join(re.escape(p) if isinstance(p, str) else '.+' for p in literal.parts)
+        self.templates.setdefault(pattern, where)
+
+    def scan(self, path, text):
+        self.files += 1
+        self._walk(tokenize(text), text, path)
+
+    def _walk(self, tokens, text, path):
+        run = []
+        for tok in tokens + [None]:
+            if tok is not None and tok.kind == STRING:
+                run.append(tok)
+                for child in tok.value.children:
+                    self._walk(child, text, path)
+                continue
+            if run:
+                line = text.count('\n', 0, run[0].start) + 1
+                self.add_literal(StringLiteral(run), f'{path}:{line}')
+                run = []
+            if tok is not None and tok.kind == CODE and KEYS_CLASS in text[tok.start:tok.end]:
+                self.constants.update(_CONSTANT_REF.findall(text, tok.start, tok.end))
+
+
+def source_files(project_root, dirs=SOURCE_DIRS):
+    """.dart files to scan; the generated L10nKeys file lists every key,
+    so it is left out and constant references are resolved instead."""
+    skip = str(keys_path(project_root))
+    paths = []
+    for name in dirs:
+        for root, _, files in os.walk(Path(project_root) / name):
+            if '_archived' in root:
+                continue
+            paths.extend(os.path.join(root, f) for f in files
+                         if f.endswith('.dart') and os.path.join(root, f) != skip)
+    return sorted(paths)
+
+
+def collect(project_root, dirs=SOURCE_DIRS):
+    refs = References()
+    for path in source_files(project_root, dirs):
+        with open(path, 'r', encoding='utf-8') as f:
+            refs.scan(os.path.relpath(path, project_root), f.read())
+    return refs
+
+
+def load_allowlist(path=ALLOWLIST):
+    if not Path(path).exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ═══════════════════════════════════════════════════════════════
+# RESOLUTION
+# ═══════════════════════════════════════════════════════════════
+
+def _ancestors(key):
+    dot = key.find('.')
+    while dot >= 0:
+        yield key[:dot]
+        dot = key.find('.', dot + 1)
+
+
+def resolve(keys, objects, refs, allowlist, current=None):
+    """key -> how it is referenced ('literal', 'object', 'constant',
+    'template', 'allowlist'), or None when nothing refers to it.
+
+    `current` holds the generated constant names (see read_identifiers).
+    """
+    literals = refs.literals
+    parents = {lit.rstrip('.') for lit in literals if lit.rstrip('.') in objects}
+    names = key_identifiers(keys, current)
+    # All templates, then all allowlist globs, as one alternation each
+    templates = re.compile('|'.join(f'(?:{t})' for t in refs.templates) or r'(?!)')
+    allowed = re.compile('|'.join(fnmatch.translate(g) for g in allowlist) or r'(?!)')
+
+    how = OrderedDict()
+    for key in sorted(keys):
+        if key in literals:
+            how[key] = 'literal'
+        elif any(p in parents for p in _ancestors(key)):
+            how[key] = 'object'
+        elif names[key] in refs.constants:
+            how[key] = 'constant'
+        elif templates.fullmatch(key):
+            how[key] = 'template'
+        elif allowed.match(key):
+            how[key] = 'allowlist'
+        else:
+            how[key] = None
+    return how
+
+
+# ═══════════════════════════════════════════════════════════════
+# PRUNE
+# ═══════════════════════════════════════════════════════════════
+
+def pruned_files(texts, unused, project_root):
+    """[(path, old, new)] for the catalogs and L10nKeys file without
+    `unused`."""
+    new_texts = OrderedDict((loc, prune(text, unused)) for loc, text in texts.items())
+    changed = [(L10N_DIR / f'{loc}.json', texts[loc], new_texts[loc])
+               for loc in texts if new_texts[loc] != texts[loc]]
+    keys_file = keys_path(project_root)
+    if keys_file.exists():
+        old = keys_file.read_text(encoding='utf-8')
+        new = render_keys(KeyIndex(new_texts['en']).leaves, read_identifiers(keys_file))
+        if new != old:
+            changed.append((keys_file, old, new))
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--list', action='store_true', help='print every unused key')
+    parser.add_argument('--prune', action='store_true', help='remove unused keys from every locale')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='with --prune, print a patch to stdout instead of writing')
+    parser.add_argument('--allowlist', type=Path, default=ALLOWLIST,
+                        help='JSON list of key globs to keep (default: %(default)s)')
+    args = parser.parse_args()
+    if args.dry_run and not args.prune:
+        parser.error('--dry-run needs --prune')
+    out = sys.stderr if args.dry_run else sys.stdout
+
+    texts = OrderedDict()
+    for loc in LOCALES:
+        with open(L10N_DIR / f'{loc}.json', 'r', encoding='utf-8') as f:
+            texts[loc] = f.read()
+    indexes = {loc: KeyIndex(text) for loc, text in texts.items()}
+    keys = set().union(*(index.leaves for index in indexes.values()))
+    objects = set().union(*(index.objects for index in indexes.values()))
+
+    refs = collect(PROJECT_ROOT)
+    how = resolve(keys, objects, refs, load_allowlist(args.allowlist),
+                  read_identifiers(keys_path(PROJECT_ROOT)))
+    unused = [k for k, h in how.items() if h is None]
+
+    print(f"Scanned {refs.files} Dart files: {len(refs.literals)} literals, "
+          f"{len(refs.templates)} key templates, {len(refs.constants)} {KEYS_CLASS} references", file=out)
+    kinds = Counter(h for h in how.values() if h)
+    print(f"{len(keys)} keys: " + ', '.join(f"{n} by {kind}" for kind, n in kinds.most_common())
+          + f", {len(unused)} unused", file=out)
+    by_feature = Counter(k.split('.', 1)[0] for k in unused)
+    for feature, n in by_feature.most_common():
+        print(f"  {feature}: {n}", file=out)
+    if args.list:
+        for key in unused:
+            print(f"    {key}", file=out)
+
+    if not args.prune or not unused:
+        return
+    changed = pruned_files(texts, set(unused), PROJECT_ROOT)
+    if args.dry_run:
+        for path, old, new in changed:
+            sys.stdout.write(unified_diff(old or '', new, os.path.relpath(path, PROJECT_ROOT),
+                                          created=old is None))
+        return
+
+    txn = begin(journal_path(PROJECT_ROOT))
+    for path, _, new in changed:
+        txn.stage(path, new)
+    txn.commit()
+    # A store with unexported edits drops the keys too (see l10n_store.merge)
+    catalogs = {L10N_DIR / f'{loc}.json': loc for loc in LOCALES}
+    merge_store({catalogs[path]: (old, new) for path, old, new in changed if path in catalogs})
+    print(f"Removed {len(unused)} keys from {'/'.join(LOCALES)}.json "
+          f"({len(changed)} files updated)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+SQLite index of localisation keys: where code uses each key, and where
+each catalog entry is defined.
+
+The index lives in scripts/.migrate_cache/l10n_index.sqlite:
+
+  refs      key, path, line, form for every key-shaped literal in lib/.
+            `form` is the accessor (L10nService.get, getWithParams,
+            l10n.get, tr, ...), `literal` for a key kept in a variable,
+            list or map, or `L10nKeys` for a constant. An interpolated key
+            (`'premium.tiers.$name.name'`) is stored as a glob
+            (premium.tiers.*.name) with dynamic = 1.
+  catalog   locale, key, line, value for every value and object in
+            assets/l10n/<locale>.json
+  files     stat and content hash of each indexed Dart file
+
+Every query first brings the index up to date. Files whose size and
+mtime are unchanged are skipped, as in the migrate scan cache. Others
+are re-hashed and re-tokenized only if their content changed. A catalog
+is reloaded when its hash changes, so a query after a small edit costs
+a few milliseconds.
+
+The migrate scripts update an existing index when they commit (see
+update()): they re-index the Dart files they rewrote and load the
+catalogs from the text and key index they already hold, so the first
+query after a migration has nothing left to do.
+
+Usage:
+  python3 scripts/l10n_index.py where journal.daily_entry.word_count
+  python3 scripts/l10n_index.py missing [--locale tr]
+  python3 scripts/l10n_index.py screen lib/features/journal/presentation/daily_entry_screen.dart
+  python3 scripts/l10n_index.py build      # rebuild from scratch
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import dart_lexer
+from dart_lexer import CODE, STRING, StringLiteral, tokenize
+from gen_l10n_keys import KEYS_CLASS, key_identifiers, keys_path, read_identifiers
+from l10n_catalog import LOCALES, KeyIndex
+
+PROJECT_ROOT = Path(__file__).parent.parent
+LIB_DIR = PROJECT_ROOT / 'lib'
+L10N_DIR = PROJECT_ROOT / 'assets' / 'l10n'
+DB_PATH = Path(__file__).parent / '.migrate_cache' / 'l10n_index.sqlite'
+
+SCHEMA = '''
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT);
+CREATE TABLE refs (key TEXT, path TEXT, line INTEGER, form TEXT, dynamic INTEGER);
+CREATE INDEX refs_key ON refs (key);
+CREATE INDEX refs_path ON refs (path);
+CREATE TABLE catalog (locale TEXT, key TEXT, line INTEGER, value TEXT,
+                      PRIMARY KEY (locale, key));
+CREATE TABLE constants (name TEXT PRIMARY KEY, key TEXT);
+CREATE VIEW uses AS
+  SELECT COALESCE(c.key, r.key) AS key, r.path, r.line, r.form, r.dynamic
+  FROM refs r LEFT JOIN constants c ON r.form = 'L10nKeys' AND c.name = r.key;
+'''
+
+_KEY = re.compile(r'[a-z0-9_]+(?:\.[A-Za-z0-9_]+)+\Z')
+_TEMPLATE_TEXT = re.compile(r'[A-Za-z0-9_.]*\Z')
+_ACCESSOR = re.compile(
+    r'(L10nService\.(?:get|getWithParams|getList|getMap|getMapList)'
+    r'|\bl10n\.(?:get|getWithParams|getList|getMap|getMapList)|\btr|\btrParams)\(\s*\Z'
+)
+_CONSTANT_REF = re.compile(re.escape(KEYS_CLASS) + r'\.([A-Za-z_$][A-Za-z0-9_$]*)')
+_MEMBER = re.compile(r'( *)"((?:[^"\\]|\\.)*)": (.*?),?\Z')
+
+
+def _fingerprint():
+    """Changes whenever this module or the lexer does; forces a rebuild."""
+    h = hashlib.sha1()
+    for module in (__file__, dart_lexer.__file__):
+        h.update(Path(module).read_bytes())
+    return h.hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════
+# EXTRACTION
+# ═══════════════════════════════════════════════════════════════
+
+def extract(text):
+    """(key or glob, line, form, dynamic) for each key reference in `text`."""
+    refs = []
+
+    def line(pos):
+        return text.count('\n', 0, pos) + 1
+
+    def walk(tokens):
+        run = []
+        before = ''
+        for tok in tokens + [None]:
+            if tok is not None and tok.kind == STRING:
+                run.append(tok)
+                for child in tok.value.children:
+                    walk(child)
+                continue
+            if run:
+                literal = StringLiteral(run)
+                call = _ACCESSOR.search(before)
+                form = call.group(1) if call else 'literal'
+                if not literal.interpolated:
+                    if _KEY.match(literal.value):
+                        refs.append((literal.value, line(literal.start), form, 0))
+                else:
+                    plain = ''.join(p for p in literal.parts if isinstance(p, str))
+                    if '.' in plain and _TEMPLATE_TEXT.match(plain) and re.search('[a-z]', plain):
+                        glob = ''.join(p if isinstance(p, str) else '*' for p in literal.parts)
+                        refs.append((glob, line(literal.start), form, 1))
+                run = []
+            if tok is None:
+                continue
+            if tok.kind == CODE:
+                code = text[tok.start:tok.end]
+                before = code[-60:]
+                if KEYS_CLASS in code:
+                    for m in _CONSTANT_REF.finditer(text, tok.start, tok.end):
+                        refs.append((m.group(1), line(m.start()), KEYS_CLASS, 0))
+            else:
+                before = tok.value or ''
+
+    walk(tokenize(text))
+    return refs
+
+
+def catalog_lines(text):
+    """Dotted key -> 1-based line of every member of a canonical catalog
+    (see l10n_catalog), objects included."""
+    lines = {}
+    stack = []      # (indent, key) of the open objects
+    skip_to = None  # closing line of a multi-line list value
+    for n, raw in enumerate(text.split('\n'), 1):
+        if skip_to is not None:
+            if raw.rstrip(',') == skip_to:
+                skip_to = None
+            continue
+        m = _MEMBER.match(raw)
+        if not m:
+            continue
+        indent, key, rest = len(m.group(1)), json.loads(f'"{m.group(2)}"'), m.group(3)
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        path = '.'.join([k for _, k in stack] + [key])
+        lines[path] = n
+        if rest == '{':
+            stack.append((indent, key))
+        elif rest == '[':
+            skip_to = ' ' * indent + ']'
+    return lines
+
+
+# ═══════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════
+
+def connect(db_path=DB_PATH, rebuild=False):
+    """Open the index, recreating it if it is missing, stale or `rebuild`."""
+    db_path = Path(db_path)
+    fingerprint = _fingerprint()
+    if db_path.exists() and not rebuild:
+        db = sqlite3.connect(db_path)
+        try:
+            row = db.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+        except sqlite3.DatabaseError:
+            row = None
+        if row and row[0] == fingerprint:
+            return db
+        db.close()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if db_path.exists():
+        db_path.unlink()
+    db = sqlite3.connect(db_path)
+    db.executescript(SCHEMA)
+    db.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+    db.commit()
+    return db
+
+
+def _dart_files(lib_dir):
+    skip = str(keys_path(PROJECT_ROOT))
+    for root, _, names in os.walk(lib_dir):
+        if '_archived' in root:
+            continue
+        for name in names:
+            path = os.path.join(root, name)
+            if name.endswith('.dart') and path != skip:
+                yield path
+
+
+def _is_indexed(path, lib_dir=LIB_DIR):
+    """Whether refresh() would index `path` (see _dart_files)."""
+    rel = os.path.relpath(path, lib_dir)
+    return (path.endswith('.dart') and not rel.startswith('..') and '_archived' not in rel
+            and path != str(keys_path(PROJECT_ROOT)))
+
+
+def _index_file(db, path, rel, entry=None):
+    """Re-index one Dart file unless its content still hashes to `entry`
+    (a `files` row); returns whether its refs were rebuilt."""
+    st = os.stat(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+    db.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)',
+               (rel, st.st_size, st.st_mtime_ns, digest))
+    if entry and entry[2] == digest:
+        return False
+    db.execute('DELETE FROM refs WHERE path = ?', (rel,))
+    db.executemany('INSERT INTO refs VALUES (?, ?, ?, ?, ?)',
+                   [(key, rel, line, form, dynamic)
+                    for key, line, form, dynamic in extract(data.decode('utf-8'))])
+    return True
+
+
+def _load_catalog(db, loc, text, index=None):
+    """Reload one catalog unless its hash is unchanged; returns whether it
+    was reloaded. `index` is its KeyIndex when the caller has one."""
+    digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    name = f'catalog:{loc}'
+    row = db.execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+    if row and row[0] == digest:
+        return False
+    index = index or KeyIndex(text)
+    lines = catalog_lines(text)
+    db.execute('DELETE FROM catalog WHERE locale = ?', (loc,))
+    db.executemany('INSERT INTO catalog VALUES (?, ?, ?, ?)', [
+        (loc, key, lines.get(key),
+         value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+        for key, value in index.leaves.items()
+    ] + [(loc, key, lines.get(key), None) for key in index.objects])
+    if loc == 'en':
+        db.execute('DELETE FROM constants')
+        current = read_identifiers(keys_path(PROJECT_ROOT))
+        db.executemany('INSERT INTO constants VALUES (?, ?)',
+                       [(name, key) for key, name in key_identifiers(index.leaves, current).items()])
+    db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (name, digest))
+    return True
+
+
+def refresh(db, project_root=PROJECT_ROOT, lib_dir=LIB_DIR, l10n_dir=L10N_DIR):
+    """Bring `db` up to date; returns (Dart files re-indexed, catalogs reloaded)."""
+    known = {path: (size, mtime, digest)
+             for path, size, mtime, digest in db.execute('SELECT * FROM files')}
+    seen = set()
+    reindexed = 0
+    with db:
+        for path in _dart_files(lib_dir):
+            rel = os.path.relpath(path, project_root)
+            seen.add(rel)
+            st = os.stat(path)
+            entry = known.get(rel)
+            if entry and entry[:2] == (st.st_size, st.st_mtime_ns):
+                continue
+            reindexed += _index_file(db, path, rel, entry)
+        for rel in known.keys() - seen:
+            db.execute('DELETE FROM files WHERE path = ?', (rel,))
+            db.execute('DELETE FROM refs WHERE path = ?', (rel,))
+
+        reloaded = 0
+        for loc in LOCALES:
+            with open(Path(l10n_dir) / f'{loc}.json', 'r', encoding='utf-8') as f:
+                reloaded += _load_catalog(db, loc, f.read())
+    return reindexed, reloaded
+
+
+def update(paths, catalogs, db_path=DB_PATH, project_root=PROJECT_ROOT):
+    """Index what a migration just committed, so the next query finds it
+    current. `paths` are the Dart files it rewrote, and `catalogs` maps
+    locale -> (new text, KeyIndex) for the catalogs it changed. A missing
+    or outdated index (see connect) is left for the next query to
+    rebuild. Returns whether the index was updated."""
+    db_path = Path(db_path)
+    if not db_path.exists() or not (paths or catalogs):
+        return False
+    db = sqlite3.connect(db_path)
+    try:
+        try:
+            row = db.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+        except sqlite3.DatabaseError:
+            row = None
+        if not row or row[0] != _fingerprint():
+            return False
+        with db:
+            for path in filter(_is_indexed, map(str, paths)):
+                _index_file(db, path, os.path.relpath(path, project_root))
+            for loc, (text, index) in catalogs.items():
+                _load_catalog(db, loc, text, index)
+        return True
+    finally:
+        db.close()
+
+
+# ═══════════════════════════════════════════════════════════════
+# QUERIES
+# ═══════════════════════════════════════════════════════════════
+
+def _ancestors(key):
+    dot = key.find('.')
+    while dot >= 0:
+        yield key[:dot]
+        dot = key.find('.', dot + 1)
+
+
+def where(db, key):
+    """Catalog definitions and code uses of `key`.
+
+    Returns (definitions, uses). A use is (path, line, form, via): via is
+    None for the key itself, else the parent object or glob that covers it.
+    """
+    definitions = db.execute(
+        'SELECT locale, line, value FROM catalog WHERE key = ? ORDER BY locale', (key,)
+    ).fetchall()
+    uses = [row + (None,) for row in db.execute(
+        'SELECT path, line, form FROM uses WHERE key = ? AND dynamic = 0', (key,))]
+    parents = list(_ancestors(key))
+    if parents:
+        marks = ','.join('?' * len(parents))
+        uses += db.execute(
+            f'SELECT path, line, form, key FROM refs WHERE dynamic = 0 AND key IN ({marks})',
+            parents).fetchall()
+    uses += db.execute(
+        'SELECT path, line, form, key FROM refs WHERE dynamic = 1 AND ? GLOB key', (key,)
+    ).fetchall()
+    return definitions, sorted(uses)
+
+
+def missing(db, locale='en'):
+    """(key, path, line, form) for keys passed to an accessor that the
+    `locale` catalog lacks, plus globs no catalog key matches."""
+    rows = db.execute('''
+        SELECT r.key, r.path, r.line, r.form FROM refs r
+        WHERE r.dynamic = 0 AND r.form NOT IN ('literal', ?)
+          AND NOT EXISTS (SELECT 1 FROM catalog c WHERE c.locale = ? AND c.key = r.key)
+        ORDER BY r.key, r.path, r.line
+    ''', (KEYS_CLASS, locale)).fetchall()
+    rows += db.execute('''
+        SELECT r.key, r.path, r.line, r.form FROM refs r
+        WHERE r.dynamic = 1 AND r.form != 'literal'
+          AND NOT EXISTS (SELECT 1 FROM catalog c WHERE c.locale = ? AND c.key GLOB r.key)
+        ORDER BY r.key, r.path, r.line
+    ''', (locale,)).fetchall()
+    return rows
+
+
+def screen(db, path):
+    """(line, key, form, en value) for each key a file uses. `path` may be
+    any unique suffix of the file's path."""
+    rel = os.path.relpath(os.path.abspath(path), PROJECT_ROOT) if os.path.exists(path) else path
+    paths = [p for (p,) in db.execute(
+        "SELECT path FROM files WHERE path = ? OR path GLOB '*/' || ?", (rel, rel))]
+    if len(paths) != 1:
+        return paths, []
+    rows = db.execute('''
+        SELECT u.line, u.key, u.form, c.value FROM uses u
+        LEFT JOIN catalog c ON c.locale = 'en' AND c.key = u.key
+        WHERE u.path = ? ORDER BY u.line
+    ''', (paths[0],)).fetchall()
+    return paths, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', type=Path, default=DB_PATH, help='index file (default: %(default)s)')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='rebuild the index from scratch')
+    p = sub.add_parser('where', help='where a key is defined and used')
+    p.add_argument('key')
+    p = sub.add_parser('missing', help='keys code asks for that a catalog lacks')
+    p.add_argument('--locale', choices=LOCALES, default='en')
+    p = sub.add_parser('screen', help='keys one Dart file uses')
+    p.add_argument('path')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = connect(args.db, rebuild=args.command == 'build')
+    reindexed, reloaded = refresh(db)
+    ms = (time.perf_counter() - start) * 1000
+    status = f"(index: {reindexed} files, {reloaded} catalogs updated in {ms:.0f} ms)"
+
+    if args.command == 'build':
+        files, refs = db.execute('SELECT (SELECT COUNT(*) FROM files), (SELECT COUNT(*) FROM refs)').fetchone()
+        print(f"Indexed {files} files, {refs} key references {status}")
+
+    elif args.command == 'where':
+        definitions, uses = where(db, args.key)
+        for loc, line, value in definitions:
+            shown = '(object)' if value is None else repr(value[:70])
+            print(f"  assets/l10n/{loc}.json:{line}: {shown}")
+        if not definitions:
+            print(f"  {args.key} is in no catalog")
+        for path, line, form, via in uses:
+            print(f"  {path}:{line}: {form}" + (f" (via {via})" if via else ''))
+        print(f"{len(uses)} uses {status}")
+        if not definitions and not uses:
+            sys.exit(1)
+
+    elif args.command == 'missing':
+        rows = missing(db, args.locale)
+        for key, path, line, form in rows:
+            print(f"  {key}  {path}:{line} ({form})")
+        print(f"{len({r[0] for r in rows})} keys missing from {args.locale}.json {status}")
+        if rows:
+            sys.exit(1)
+
+    elif args.command == 'screen':
+        paths, rows = screen(db, args.path)
+        if len(paths) != 1:
+            print(f"  {args.path} matches {len(paths)} indexed files" +
+                  (': ' + ', '.join(paths[:5]) if paths else ''))
+            sys.exit(1)
+        for line, key, form, value in rows:
+            shown = '(not in en.json)' if value is None else repr(value[:50])
+            print(f"  {line:>5}  {key}  {form}  {shown}")
+        print(f"{paths[0]}: {len(rows)} key references {status}")
+
+
+if __name__ == '__main__':
+    main()
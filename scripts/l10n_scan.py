@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Classify every string literal under lib/ in one pass: guard verdict plus
+migration worklist.
+
+Each file is tokenized once with dart_lexer (the tokenizer the migrate
+scripts use), and the same tokens feed find_isen_ternaries(). Every
+literal, with adjacent literals joined, then falls into one kind:
+
+  migrated  a catalog key, or the key argument of an L10nService call
+  isen      one side of an `isEn ? '...' : '...'` ternary (to migrate)
+  bilingual one side of another language ternary (`!isEn ? ...`,
+            `language == AppLanguage.en ? ...`); localized, but the
+            migrate scripts leave it for a hand edit
+  content   Turkish in a field, constant or getter that says so
+            (`nameTr:`, `'tr':`, `monthsFullTr = [...]`,
+            `get displayNameTr {...}`), or paired with English
+            (`('Cramps', 'Kramplar')`); the bilingual content models,
+            not L10nService strings
+  turkish   hardcoded Turkish: ı ğ ş İ Ğ Ş, a Turkish-only word, or
+            ü ö ç without letters only German or French would add
+  english   hardcoded English-looking UI text: words with spaces, or a
+            capitalised word
+  other     identifiers, paths, URLs, formats, log and debug messages
+
+This replaces the marker-word greps of i18n-guard.sh (check 1) and the
+line-regex i18n_hardcoded_scanner.dart, and finds the same ternaries as
+a migrate scan, so the tree is read once instead of three times.
+
+Files matching a glob in l10n_scan_allowlist.json, or with a
+`// l10n-scan: ignore-file` comment, are not scanned at all:
+
+  lib/data/cities/world_cities.dart   city names, not UI text
+  lib/data/content/dream_symbols_database.dart,
+  dream_advanced_content.dart,
+  dream_content_expanded.dart         the Turkish-only dream databases
+  scripts/i18n_hardcoded_scanner.dart the Dart scanner's word lists
+
+The dream databases hold about 1700 Turkish literals in plain fields
+(`universalMeanings: [...]`, `shadowAspect:`), with no Tr marker or
+English pair for the `content` kind to key on. They move to the
+content catalogs as a whole, not string by string, so each literal
+would only be noise until then. The cost is a blind spot: hardcoded
+UI text added to those files is not reported. Every run therefore
+names the allowlist in its summary. Drop a file from the list once its
+content has moved. A `// l10n-scan: ignore` comment skips the literals
+on its line. Tests, generated code, build output, _archived/ and l10n/
+directories are never scanned.
+
+The guard fails on hardcoded Turkish. Hardcoded English is advisory
+unless --strict is given, as in the Dart scanner. --worklist writes the
+files with ternaries left, one per line, for the next migration:
+
+  python3 scripts/l10n_scan.py --worklist /tmp/todo.txt
+  python3 scripts/migrate_v4.py --files-from /tmp/todo.txt
+
+Usage:
+  python3 scripts/l10n_scan.py [paths...]      # default: lib/
+  python3 scripts/l10n_scan.py --list turkish  # every literal of a kind
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+import time
+from bisect import bisect
+from collections import Counter, OrderedDict, namedtuple
+from pathlib import Path
+
+from dart_lexer import CODE, PUNCT, STRING, StringLiteral, find_isen_ternaries, tokenize
+from gen_l10n_keys import keys_path
+from l10n_catalog import KeyIndex
+
+PROJECT_ROOT = Path(__file__).parent.parent
+L10N_DIR = PROJECT_ROOT / 'assets' / 'l10n'
+
+KINDS = ('migrated', 'isen', 'bilingual', 'content', 'turkish', 'english', 'other')
+
+# Generated code, tests and the service itself hold keys or test strings,
+# not UI; the directories are build output or not shipped
+SKIP_FILES = ('.g.dart', '.freezed.dart', '_test.dart', 'l10n_service.dart')
+SKIP_DIRS = {'_archived', 'build', '.dart_tool', '.git', 'node_modules', 'l10n'}
+ALLOWLIST = Path(__file__).parent / 'l10n_scan_allowlist.json'
+IGNORE_FILE = '// l10n-scan: ignore-file'
+IGNORE_LINE = '// l10n-scan: ignore'
+
+_TURKISH_CHARS = re.compile('[ığşİĞŞ]')
+_SHARED_CHARS = re.compile('[üöçÜÖÇ]')
+_GERMAN_FRENCH_CHARS = re.compile('[äßéèàâêëîïôœùûÄÉÈÀ]')
+_TURKISH_WORDS = [
+    'için', 'değil', 'veya', 'ama', 'fakat', 'çünkü', 'nasıl', 'neden',
+    'nereye', 'lütfen', 'teşekkür', 'merhaba', 'hoşgeldiniz', 'devam',
+    'iptal', 'kaydet', 'düzenle', 'ekle', 'göster', 'gizle', 'seçin',
+    'günlük', 'haftalık', 'aylık', 'bugün', 'yarın', 'dün', 'şimdi',
+    'sonra', 'burç', 'keşfet', 'yorum', 'harita', 'uyum', 'paylaş',
+    'kozmik', 'rüya', 'kadim', 'bilgelik', 'evren', 'yıldız', 'güneş',
+    'doğum', 'aşk', 'ilişki', 'kariyer', 'sağlık', 'merak', 'bakış',
+    'dünya', 'bağlan', 've', 'ile', 'bir', 'bu',
+]
+# Not after an apostrophe, or "I've" would contain `ve`
+_TURKISH_WORD = re.compile(
+    r"(?<!['’])\b(?:" + '|'.join(w for word in _TURKISH_WORDS for w in (word, word.capitalize())) + r')\b'
+)
+
+# Code right before a literal that makes it a key argument
+_L10N_CALL = re.compile(
+    r'(?:L10nService\.(?:get|getWithParams|getList|getMap|getMapList)'
+    r'|\bl10n\.(?:get|getWithParams|getList|getMap|getMapList)|\btr|\btrParams)\(\s*\Z'
+)
+# ... or a log line, assertion or directive rather than UI text
+_NOT_UI = re.compile(
+    r'(?:\b(?:print|debugPrint|log|assert|developer\.log)\(\s*'
+    r'|\b(?:import|export|part|part of)\s*'
+    r'|\b(?:RegExp|DateFormat|Uri\.parse|Key|ValueKey)\(\s*)\Z'
+)
+# A field or argument that says its text is Turkish: `nameTr: '...'`,
+# `titleTr: ['...', ...]`
+_TAGGED = re.compile(
+    r'(?:(?:[a-z0-9]Tr|\btr|\bturkish|\bTurkish)\s*:'
+    # ... or a constant or getter named so: `monthsFullTr = [`,
+    # `_stopwordsTr = <String>{`, `String get nameTr => '`
+    r'|(?:[a-z0-9](?:Tr|TR)|\btr|_tr|\bturkish)\s*=\s*(?:const\s*)?(?:<[^<>]*>\s*)?'
+    r'|\bget\s+\w*?(?:Tr|TR)(?!\w)\s*(?:=>)?'
+    # ... or a method: `String labelTr(Mood m) {`
+    r'|(?:Tr|TR)\s*\([^(){};]*\)\s*(?:=>)?)'
+    r'\s*\Z'
+)
+# The code ahead of the `then` side of a language ternary
+# find_isen_ternaries() does not take: `!isEn ? '`, `isEn ? (`,
+# `language == AppLanguage.en ? '`, `lang.languageCode == 'tr' ? '`
+_LANGUAGE_THEN = re.compile(
+    r"(?:\bisEn|\bisTr|\bisTurkish|AppLanguage\.(?:en|tr)|languageCode\s*==\s*'(?:en|tr)')"
+    r"(?:\s*[=!]=\s*(?:true|false))?\s*\)?\s*\?\s*\Z"
+)
+_BRACKET = re.compile(r'=>|[\[\](){};]')
+_LINE_COMMENT = re.compile(r'//[^\n]*')
+_IDENTIFIER = re.compile(r'[a-z_$][A-Za-z0-9_$]*\Z|[A-Z0-9_]+\Z')
+_WORD = re.compile(r'[A-Za-z]{2,}')
+_MACHINE = re.compile(r'(?:https?:|mailto:|package:|assets/|dart:|[a-z]+/[a-z])')
+
+Literal = namedtuple('Literal', 'kind line text')
+
+# What classify() needs to know about the literal before this one
+Previous = namedtuple('Previous', 'literal kind')
+
+
+def _plain(literal):
+    """The literal's own text, interpolations left out."""
+    return ' '.join(p for p in literal.parts if isinstance(p, str))
+
+
+def classify(literal, before, keys, ternary_starts, previous=None, source='', enclosing=None):
+    """Kind of one StringLiteral.
+
+    `before` is the code run preceding it and `previous` the Previous
+    literal, which tells a `'tr': '...'` map value, the Turkish half of
+    an `('Cramps', 'Kramplar')` pair or the `else` side of a language
+    ternary apart from a stray string. `source` is the file text just
+    before the literal and `enclosing` the kind of the innermost
+    tagged_spans() span around it, if any.
+    """
+    if literal.start in ternary_starts:
+        return 'isen'
+    if source.rstrip().endswith('?') and _LANGUAGE_THEN.search(source):
+        return 'bilingual'
+    if previous and before.strip() == ':' and previous.kind == 'bilingual':
+        return 'bilingual'
+    value = literal.value
+    if value in keys or _L10N_CALL.search(before):
+        return 'migrated'
+    if _NOT_UI.search(before):
+        return 'other'
+    text = _plain(literal).strip()
+    if ' ' not in text and (text.startswith('/') or _MACHINE.search(text)):
+        return 'other'  # route, URL or path, even with Turkish words in it
+    if (_TURKISH_CHARS.search(text) or _TURKISH_WORD.search(text)
+            or _SHARED_CHARS.search(text) and not _GERMAN_FRENCH_CHARS.search(text)):
+        if enclosing:
+            return enclosing
+        if tagged(before):
+            return 'content'
+        if previous and before.strip() == ',' and previous.kind == 'english':
+            return 'content'
+        if previous and before.strip() == ':' and previous.literal.value in ('tr', 'TR'):
+            return 'content'
+        return 'turkish'
+    if not _WORD.search(text) or _MACHINE.search(text) or _IDENTIFIER.match(text):
+        return 'other'
+    words = _WORD.findall(text)
+    if len(words) > 1 and ' ' in text or text[:1].isupper() and text[1:2].islower():
+        return 'bilingual' if enclosing == 'bilingual' else 'english'
+    return 'other'
+
+
+def tagged(code):
+    """_TAGGED.search(code), skipping the regex where it cannot match."""
+    end = code.rstrip()
+    return (end[-1:] in (':', '=', '>', ')') or end.endswith(('Tr', 'TR'))) and bool(_TAGGED.search(code))
+
+
+def tagged_spans(text, tokens):
+    """[(start, end, kind)] of the code whose context localizes it.
+
+    'content' for the body of a *Tr getter or method and the list, map
+    or arguments a *Tr field or constant holds; 'bilingual' for either
+    side of a language ternary in parentheses or brackets. Spans nest.
+    """
+    spans = []
+    stack = []
+    after_then = None
+    for tok in tokens:
+        if tok.kind == PUNCT:
+            marks = [(tok.start, tok.value)]
+        elif tok.kind == CODE:
+            code = _LINE_COMMENT.sub(lambda m: ' ' * len(m.group()), text[tok.start:tok.end])
+            marks = [(tok.start + m.start(), m.group()) for m in _BRACKET.finditer(code)]
+        else:
+            continue
+        for at, mark in marks:
+            if mark == ';':
+                # the end of an arrow body, and of any bracket left open
+                while stack and stack[-1][1] == '=>':
+                    start, _, kind, _ = stack.pop()
+                    spans.append((start, at, kind))
+            elif mark == '=>':
+                if tagged(text[max(0, at - 120):at + 2]):
+                    stack.append((at, mark, 'content', False))
+            elif mark in '[({':
+                window = text[max(0, at - 120):at]
+                then = window.rstrip().endswith('?') and bool(_LANGUAGE_THEN.search(window))
+                if then or after_then is not None and text[after_then:at].strip() == ':':
+                    kind = 'bilingual'
+                else:
+                    kind = 'content' if tagged(window) else None
+                stack.append((at, mark, kind, then))
+            else:
+                # a closing bracket also ends an arrow body opened inside it
+                while stack and stack[-1][1] == '=>':
+                    start, _, kind, _ = stack.pop()
+                    spans.append((start, at, kind))
+                if not stack:
+                    continue
+                start, _, kind, then = stack.pop()
+                if kind:
+                    spans.append((start, at, kind))
+                after_then = at + 1 if then else None
+    return spans
+
+
+def span_index(spans):
+    """(points, kinds) for bisect: from points[i] on, up to the next
+    point, the innermost span is of kinds[i] (None: outside every span)."""
+    points, kinds = [], []
+    open_ = []
+    for start, end, kind in sorted(spans, key=lambda s: (s[0], -s[1])):
+        while open_ and open_[-1][0] <= start:
+            close, _ = open_.pop()
+            points.append(close)
+            kinds.append(open_[-1][1] if open_ else None)
+        open_.append((end, kind))
+        points.append(start)
+        kinds.append(kind)
+    while open_:
+        close, _ = open_.pop()
+        points.append(close)
+        kinds.append(open_[-1][1] if open_ else None)
+    return points, kinds
+
+
+def scan_text(text, keys):
+    """[Literal] for every literal in one file's source."""
+    if IGNORE_FILE in text:
+        return []
+    tokens = tokenize(text)
+    ternary_starts = set()
+    for t in find_isen_ternaries(text, tokens=tokens):
+        ternary_starts.update((t.en.start, t.tr.start))
+
+    points, kinds = span_index(tagged_spans(text, tokens))
+    found = []
+
+    def walk(tokens):
+        run = []
+        before = ''
+        previous = None
+        for tok in tokens + [None]:
+            if tok is not None and tok.kind == STRING:
+                run.append(tok)
+                for child in tok.value.children:
+                    walk(child)
+                continue
+            if run:
+                literal = StringLiteral(run)
+                kind = classify(literal, before, keys, ternary_starts, previous,
+                                text[max(0, literal.start - 120):literal.start],
+                                kinds[bisect(points, literal.start) - 1] if points else None)
+                line_end = text.find('\n', literal.end)
+                if IGNORE_LINE not in text[literal.end:line_end if line_end >= 0 else len(text)]:
+                    found.append(Literal(kind, text.count('\n', 0, literal.start) + 1, literal.value))
+                previous = Previous(literal, kind)
+                run = []
+            if tok is not None:
+                before = text[tok.start:tok.end][-60:] if tok.kind == CODE else tok.value or ''
+
+    walk(tokens)
+    return found
+
+
+def load_allowlist(path=ALLOWLIST):
+    """Path globs (relative to the project root) of files not to scan."""
+    if not Path(path).exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dart_files(paths, allowlist=()):
+    skip = str(keys_path(PROJECT_ROOT))
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(str(path))
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            files.extend(os.path.join(root, n) for n in names if n.endswith('.dart'))
+    return sorted(
+        f for f in files
+        if f != skip and not f.endswith(SKIP_FILES)
+        and not any(fnmatch.fnmatch(os.path.relpath(f, PROJECT_ROOT), g) for g in allowlist)
+    )
+
+
+def catalog_keys(l10n_dir=L10N_DIR):
+    with open(Path(l10n_dir) / 'en.json', 'r', encoding='utf-8') as f:
+        index = KeyIndex(f.read())
+    return set(index.leaves) | index.objects
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='*', help='files or directories to scan (default: lib/)')
+    parser.add_argument('--strict', action='store_true', help='fail on hardcoded English too')
+    parser.add_argument('--list', choices=KINDS, action='append', default=[], metavar='KIND',
+                        help=f"print every literal of KIND ({', '.join(KINDS)}); repeatable")
+    parser.add_argument('--worklist', metavar='FILE',
+                        help='write the files that still have isEn ternaries, for --files-from')
+    parser.add_argument('--top', type=int, default=15, metavar='N',
+                        help='files listed in the summary (default: 15)')
+    parser.add_argument('--allowlist', type=Path, default=ALLOWLIST, metavar='FILE',
+                        help=f'path globs not to scan (default: scripts/{ALLOWLIST.name})')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    keys = catalog_keys()
+    totals = Counter()
+    per_file = OrderedDict()
+    allowlist = load_allowlist(args.allowlist)
+    for path in dart_files(args.paths or [PROJECT_ROOT / 'lib'], allowlist):
+        with open(path, 'r', encoding='utf-8') as f:
+            literals = scan_text(f.read(), keys)
+        rel = os.path.relpath(path, PROJECT_ROOT)
+        counts = Counter(lit.kind for lit in literals)
+        totals.update(counts)
+        per_file[rel] = counts
+        for lit in literals:
+            if lit.kind in args.list:
+                print(f"{rel}:{lit.line}: {lit.kind}: {lit.text[:100]!r}")
+    ms = (time.perf_counter() - start) * 1000
+
+    print(f"Scanned {len(per_file)} files in {ms:.0f} ms: "
+          + ', '.join(f"{totals[kind]} {kind}" for kind in KINDS))
+    if allowlist:
+        print(f"Not scanned: {len(allowlist)} allowlisted globs in {args.allowlist.name}")
+    todo = sorted(((c['isen'] // 2, c['turkish'], c['english'], rel)
+                   for rel, c in per_file.items() if c['isen'] or c['turkish'] or c['english']),
+                  key=lambda t: (-t[0], -t[1], -t[2], t[3]))
+    if todo:
+        print(f"\n  {'ternaries':>9}  {'turkish':>7}  {'english':>7}  file")
+        for ternaries, turkish, english, rel in todo[:args.top]:
+            print(f"  {ternaries:>9}  {turkish:>7}  {english:>7}  {rel}")
+        if len(todo) > args.top:
+            print(f"  ... and {len(todo) - args.top} more files")
+
+    if args.worklist:
+        pending = sorted(rel for rel, c in per_file.items() if c['isen'])
+        with open(args.worklist, 'w', encoding='utf-8') as f:
+            f.write(''.join(f'{rel}\n' for rel in pending))
+        print(f"\n  Worklist: {len(pending)} files with ternaries -> {args.worklist}")
+
+    failed = totals['turkish'] or (args.strict and totals['english'])
+    print(f"\n{'FAILED' if failed else 'PASSED'}: {totals['turkish']} hardcoded Turkish, "
+          f"{totals['english']} hardcoded English{'' if args.strict else ' (advisory)'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
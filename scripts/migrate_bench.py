@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Benchmark the isEn -> L10nService migrate scripts on synthetic corpora.
+
+Builds a deterministic lib/ tree and locale catalogs (same seed, same
+bytes), runs each script on a fresh copy in its own process, and reports
+files/sec, matches/sec, peak RSS and JSON write time. Each script runs
+--repeat times and every metric is reported as the median. Results can
+be saved as a baseline and later runs compared against it. A change only
+counts as a regression when it exceeds both --tolerance and the spread
+(max - min, relative to the median) seen in either run, so a single noisy
+sample cannot fail the comparison.
+
+Usage:
+  python3 scripts/migrate_bench.py --size small
+  python3 scripts/migrate_bench.py --files 2000 --ternaries 50000 --scripts v4
+  python3 scripts/migrate_bench.py --size medium --save-baseline bench.json
+  python3 scripts/migrate_bench.py --size medium --baseline bench.json --repeat 9
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# name -> (Dart files, isEn ternaries)
+SIZES = OrderedDict([
+    ('small', (500, 10_000)),
+    ('medium', (5_000, 200_000)),
+    ('large', (20_000, 1_000_000)),
+])
+
+DEFAULT_SCRIPTS = ('v2', 'v3', 'v4')
+
+# Seconds-valued metrics regress upwards, rates downwards
+METRICS = OrderedDict([
+    ('wall_s', 'lower'),
+    ('files_per_s', 'higher'),
+    ('matches_per_s', 'higher'),
+    ('peak_rss_mb', 'lower'),
+    ('json_s', 'lower'),
+])
+
+# ═══════════════════════════════════════════════════════════════
+# CORPUS
+# ═══════════════════════════════════════════════════════════════
+
+FEATURES = [
+    'journal', 'mood', 'dreams', 'insights', 'profile', 'settings',
+    'premium', 'streak', 'cycle_sync', 'bond', 'rituals', 'archetype',
+]
+SUFFIXES = ['_screen', '_card', '_section', '_sheet', '_widget', '_modal']
+EN_WORDS = (
+    'your daily reflection entry mood pattern cycle streak insight dream '
+    'journal energy focus calm week month today saved shared review start '
+    'continue premium unlock growth balance rest notes gentle check view'
+).split()
+TR_WORDS = (
+    'günlük yansıma kayıt ruh hali örüntü döngü seri içgörü rüya enerji '
+    'odak sakin hafta ay bugün kaydedildi paylaşıldı inceleme başla devam '
+    'premium kilit büyüme denge dinlenme notlar nazik kontrol görünüm'
+).split()
+VARS = ['count', 'days', 'name', 'label', 'total', 'streak', 'entry.title', 'items.length']
+
+# File kinds, weighted: which migrate scripts accept them
+#   language  ConsumerWidget with `final language` (v2, v3, v4)
+#   consumer  ConsumerWidget without it (v3, v4)
+#   service   plain class (v4)
+#   noise     no isEn at all
+KINDS = [('language', 4), ('consumer', 3), ('service', 2), ('noise', 1)]
+
+
+def _phrase(rng, words, n_min=2, n_max=6):
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(n_min, n_max))).capitalize()
+
+
+def _interpolate(rng, text):
+    var = rng.choice(VARS)
+    token = f'${var}' if '.' not in var else f'${{{var}}}'
+    return var, f'{token} {text}'
+
+
+def _ternary(rng, shared):
+    """One isEn ternary in a random form: single-line, multiline,
+    double-quoted or interpolated."""
+    form = rng.random()
+    if shared and rng.random() < 0.1:
+        en, tr = rng.choice(shared)
+    else:
+        en, tr = _phrase(rng, EN_WORDS), _phrase(rng, TR_WORDS)
+    if form < 0.2:
+        var, en = _interpolate(rng, en)
+        tr = f"{en.split(' ', 1)[0]} {tr}"
+        return f"isEn ? '{en}' : '{tr}'"
+    if form < 0.35:
+        return f'isEn ? "{en}" : "{tr}"'
+    if form < 0.5:
+        return f"isEn\n            ? '{en}'\n            : '{tr}'"
+    return f"isEn ? '{en}' : '{tr}'"
+
+
+def _dart_file(rng, kind, class_name, n_ternaries, shared):
+    lines = [
+        "import 'package:flutter/material.dart';",
+        "import 'package:flutter_riverpod/flutter_riverpod.dart';",
+        '',
+    ]
+    if kind == 'service':
+        lines += [f'class {class_name} {{', '  String describe(bool isEn, int count) {', '    final parts = <String>[']
+    else:
+        lines += [
+            f'class {class_name} extends ConsumerWidget {{',
+            f'  const {class_name}({{super.key}});',
+            '',
+            '  @override',
+            '  Widget build(BuildContext context, WidgetRef ref) {',
+        ]
+        if kind == 'language':
+            lines.append('    final language = ref.watch(languageProvider);')
+        lines += [
+            '    final isEn = ref.watch(isEnProvider);',
+            '    // Layout follows the design spec; strings are localised below',
+            '    return Column(',
+            '      children: [',
+        ]
+
+    indent = '      ' if kind == 'service' else '        '
+    for i in range(n_ternaries):
+        lines.append(f'{indent}Text({_ternary(rng, shared)}),' if kind != 'service'
+                     else f'{indent}{_ternary(rng, shared)},')
+        if rng.random() < 0.3:
+            lines.append(f"{indent}const SizedBox(height: {rng.choice([4, 8, 12, 16])}),")
+    if kind == 'noise':
+        lines += [f"{indent}Text('{_phrase(rng, EN_WORDS)}'),"] * 3
+
+    if kind == 'service':
+        lines += ['    ];', "    return parts.join(' ');", '  }', '}', '']
+    else:
+        lines += ['      ],', '    );', '  }', '}', '']
+    return '\n'.join(lines)
+
+
+def _catalog(rng, n_keys, locale_words):
+    data = OrderedDict()
+    per_screen = 12
+    for i in range(0, n_keys, per_screen):
+        feature = FEATURES[(i // per_screen) % len(FEATURES)]
+        screen = f'{feature}_{i // per_screen}'
+        node = data.setdefault(feature, OrderedDict()).setdefault(screen, OrderedDict())
+        for j in range(min(per_screen, n_keys - i)):
+            node[f'text_{j}'] = _phrase(rng, locale_words)
+    return data
+
+
+def generate_corpus(root, files, ternaries, seed=0, catalog_keys=4000):
+    """Write a synthetic project (lib/, assets/l10n/) under `root`."""
+    rng = random.Random(seed)
+    root = Path(root)
+    kinds = [k for k, w in KINDS for _ in range(w)]
+    shared = [(_phrase(rng, EN_WORDS), _phrase(rng, TR_WORDS)) for _ in range(50)]
+
+    plan = [rng.choice(kinds) for _ in range(files)]
+    active = sum(1 for k in plan if k != 'noise') or 1
+    base, extra = divmod(ternaries, active)
+
+    n = 0
+    for i, kind in enumerate(plan):
+        feature = FEATURES[i % len(FEATURES)]
+        suffix = SUFFIXES[i % len(SUFFIXES)]
+        name = f'{feature}_{i}{suffix}'
+        subdir = 'data/services' if kind == 'service' else f'features/{feature}/presentation'
+        path = root / 'lib' / subdir / f'{name}.dart'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0 if kind == 'noise' else base + (1 if n < extra else 0)
+        n += kind != 'noise'
+        class_name = ''.join(p.capitalize() for p in name.split('_'))
+        path.write_text(_dart_file(rng, kind, class_name, count, shared), encoding='utf-8')
+
+    l10n = root / 'assets' / 'l10n'
+    l10n.mkdir(parents=True, exist_ok=True)
+    for loc, words in (('en', EN_WORDS), ('tr', TR_WORDS), ('de', EN_WORDS), ('fr', EN_WORDS)):
+        data = _catalog(random.Random(seed), catalog_keys, words)
+        (l10n / f'{loc}.json').write_text(
+            json.dumps(data, ensure_ascii=False, indent=2) + '\n', encoding='utf-8'
+        )
+
+    scripts = root / 'scripts'
+    scripts.mkdir(exist_ok=True)
+    for src in SCRIPTS_DIR.glob('*.py'):
+        shutil.copy2(src, scripts / src.name)
+
+# ═══════════════════════════════════════════════════════════════
+# RUN
+# ═══════════════════════════════════════════════════════════════
+
+
+def run_script(corpus, version, workdir, jobs=1):
+    """Run migrate_<version>.py on a fresh copy of `corpus`; returns metrics."""
+    tree = Path(workdir) / f'run_{version}'
+    shutil.rmtree(tree, ignore_errors=True)
+    shutil.copytree(corpus, tree)
+    stats_path = tree / 'bench_stats.json'
+
+    cmd = [
+        sys.executable, str(tree / 'scripts' / f'migrate_{version}.py'),
+        '--no-cache', '--jobs', str(jobs), '--stats-json', str(stats_path),
+    ]
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    code = os.waitstatus_to_exitcode(status)
+    if code:
+        raise RuntimeError(f'migrate_{version}.py exited with {code}')
+
+    with open(stats_path, 'r', encoding='utf-8') as f:
+        stats = json.load(f)
+    shutil.rmtree(tree, ignore_errors=True)
+
+    # ru_maxrss is in KiB on Linux; a pool's workers are not included
+    counters = stats['counters']
+    return OrderedDict([
+        ('files', counters['files']),
+        ('matches', counters['total_replacements']),
+        ('wall_s', wall),
+        ('files_per_s', counters['files'] / wall),
+        ('matches_per_s', counters['total_replacements'] / wall),
+        ('peak_rss_mb', usage.ru_maxrss / 1024),
+        ('json_s', stats['phases'].get('json', {}).get('wall_s', 0.0)),
+        ('phases', {name: p['wall_s'] for name, p in stats['phases'].items()}),
+    ])
+
+
+def summarize(samples):
+    """Median of each metric over repeated runs of one script, with its
+    relative spread ((max - min) / median) under 'spread'."""
+    first = samples[0]
+    result = OrderedDict([('files', first['files']), ('matches', first['matches'])])
+    spread = OrderedDict()
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples]
+        result[metric] = statistics.median(values)
+        spread[metric] = (max(values) - min(values)) / result[metric] if result[metric] else 0.0
+    result['phases'] = {name: statistics.median(sample['phases'].get(name, 0.0) for sample in samples)
+                        for name in first['phases']}
+    result['runs'] = len(samples)
+    result['spread'] = spread
+    return result
+
+# ═══════════════════════════════════════════════════════════════
+# REPORT
+# ═══════════════════════════════════════════════════════════════
+
+
+def print_results(results):
+    print(f"\n{'script':<8} {'files':>7} {'matches':>9} {'wall s':>8} {'spread':>7} {'files/s':>9} "
+          f"{'matches/s':>10} {'RSS MB':>7} {'JSON s':>7}")
+    for version, r in results.items():
+        print(f"{version:<8} {r['files']:>7} {r['matches']:>9} {r['wall_s']:>8.2f} "
+              f"{r['spread']['wall_s']:>7.1%} {r['files_per_s']:>9.0f} {r['matches_per_s']:>10.0f} "
+              f"{r['peak_rss_mb']:>7.1f} {r['json_s']:>7.3f}")
+    print(f"(medians of {next(iter(results.values()))['runs']} runs each; "
+          f"spread is (max - min) / median of the wall time)")
+
+    print("\nPhase wall time (s; per-file phases are summed over workers):")
+    for version, r in results.items():
+        print(f"  {version:<6} " + '  '.join(f"{name} {t:.2f}" for name, t in r['phases'].items()))
+
+
+def compare(results, baseline, tolerance):
+    """Print deltas against a stored baseline; returns the regressions.
+
+    A delta counts when it is worse by more than `tolerance` and by more
+    than the spread of either side (a baseline from a single run has 0).
+    """
+    regressions = []
+    print(f"\nAgainst baseline (tolerance {tolerance:.0%}, or the spread when larger):")
+    for version, r in results.items():
+        base = baseline['results'].get(version)
+        if base is None:
+            print(f"  {version}: not in baseline")
+            continue
+        for metric, better in METRICS.items():
+            old, new = base[metric], r[metric]
+            delta = (new - old) / old if old else 0.0
+            noise = max(base.get('spread', {}).get(metric, 0.0), r['spread'][metric])
+            limit = max(tolerance, noise)
+            worse = delta > limit if better == 'lower' else delta < -limit
+            flag = '  REGRESSION' if worse else ''
+            print(f"  {version} {metric:<14} {old:>12.3f} -> {new:>12.3f} "
+                  f"({delta:+.1%}, spread {noise:.1%}){flag}")
+            if worse:
+                regressions.append((version, metric, delta))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', choices=SIZES, default='small')
+    parser.add_argument('--files', type=int, help='Dart files (overrides --size)')
+    parser.add_argument('--ternaries', type=int, help='isEn ternaries in total (overrides --size)')
+    parser.add_argument('--catalog-keys', type=int, default=4000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scripts', default=','.join(DEFAULT_SCRIPTS),
+                        help='comma-separated script versions (default: v2,v3,v4)')
+    parser.add_argument('--jobs', '-j', type=int, default=1)
+    parser.add_argument('--workdir', help='where to build the corpus (default: a temp dir)')
+    parser.add_argument('--save-baseline', metavar='FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against a saved baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='relative change counted as a regression (default: 0.10)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs per script; metrics are their medians (default: 5)')
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    files, ternaries = SIZES[args.size]
+    files = args.files or files
+    ternaries = args.ternaries if args.ternaries is not None else ternaries
+    corpus_spec = {
+        'files': files, 'ternaries': ternaries,
+        'catalog_keys': args.catalog_keys, 'seed': args.seed, 'jobs': args.jobs,
+    }
+
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix='migrate_bench_'))
+    corpus = workdir / 'corpus'
+    shutil.rmtree(corpus, ignore_errors=True)
+    print(f"Generating {files} files / {ternaries} ternaries in {corpus} ...")
+    start = time.perf_counter()
+    generate_corpus(corpus, files, ternaries, args.seed, args.catalog_keys)
+    print(f"  done in {time.perf_counter() - start:.1f}s")
+
+    results = OrderedDict()
+    for version in args.scripts.split(','):
+        print(f"Running migrate_{version}.py x{args.repeat} ...")
+        results[version] = summarize([run_script(corpus, version, workdir, args.jobs)
+                                      for _ in range(args.repeat)])
+    if not args.workdir:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'corpus': corpus_spec, 'results': results}, f, indent=2)
+            f.write('\n')
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline['corpus'] != corpus_spec:
+            print(f"\n  Warning: baseline corpus {baseline['corpus']} differs from {corpus_spec}")
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
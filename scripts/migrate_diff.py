@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Unified diffs for the --dry-run output of the migrate and l10n scripts.
+
+Kept apart from migrate_engine so tools the engine itself imports (such
+as l10n_store) can emit patches without a circular import.
+"""
+
+import difflib
+
+
+def unified_diff(old, new, relpath, created=False, deleted=False):
+    """`git apply`/`patch -p1` compatible diff of one file."""
+    lines = difflib.unified_diff(
+        old.splitlines(True), new.splitlines(True),
+        '/dev/null' if created else f'a/{relpath}',
+        '/dev/null' if deleted else f'b/{relpath}',
+    )
+    return ''.join(
+        line if line.endswith('\n') else line + '\n\\ No newline at end of file\n'
+        for line in lines
+    )
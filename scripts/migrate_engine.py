@@ -0,0 +1,1161 @@
+#!/usr/bin/env python3
+"""
+Shared rewrite engine for the isEn -> L10nService migrations.
+Finds every `isEn ? <en> : <tr>` ternary in one combined pass, records the
+match offsets, and rebuilds the file with a single linear splice.
+
+A run has three phases:
+  1. scan    - per-file match manifests, no shared state (parallel-safe)
+  2. merge   - keys allocated serially in sorted-path order
+  3. rewrite - each file spliced and written (parallel-safe)
+so `--jobs N` produces byte-for-byte the same output as a serial run.
+
+Scan results are cached per file by content hash (see ScanCache), so a
+rerun only reads and scans the files that changed since the last run.
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from gen_l10n_keys import KEYS_CLASS, key_identifiers, keys_path, read_identifiers
+from gen_l10n_keys import render as render_keys
+from l10n_catalog import PENDING_POLICIES, KeyConflictError, KeyIndex, LocaleSet
+from l10n_check import CatalogCheck
+from l10n_index import update as update_index
+from l10n_store import merge as merge_store
+from l10n_store import pending_keys
+from migrate_diff import unified_diff
+from migrate_stats import Clock, Stats
+from migrate_txn import RECOVER_MODES, Transaction, begin, journal_path, write_staged
+from migrate_watch import open_watcher
+
+# Body of a quoted literal, handling escaped quotes inside strings
+_SQ_BODY = r"""'((?:[^'\\]|\\.)*)'"""
+_DQ_BODY = r'''"((?:[^"\\]|\\.)*)"'''
+
+# `\s` also spans newlines, so the multiline form
+#   isEn\n            ? 'text'\n            : 'text'
+# is covered by the same pattern and never matched twice.
+ISEN_PATTERN_SQ = re.compile(
+    rf"""isEn\s*\?\s*{_SQ_BODY}\s*:\s*{_SQ_BODY}"""
+)
+
+# Single- and double-quoted ternaries as one alternation (groups 1-2 / 3-4)
+ISEN_PATTERN_ALL = re.compile(
+    rf"""isEn\s*\?\s*(?:{_SQ_BODY}\s*:\s*{_SQ_BODY}|{_DQ_BODY}\s*:\s*{_DQ_BODY})"""
+)
+
+# `condition` is the source of the test (`isEn`, `widget.isEn`); en/tr are
+# the literal values (decoded when found by the lexer); `interpolated`
+# marks literals containing $var / ${expr}. For those, `params` holds the
+# ((name, dart_expr), ...) pairs when en/tr could be turned into {name}
+# templates (see extract_params), else None.
+Ternary = namedtuple('Ternary', 'start end condition en tr interpolated params')
+
+_PARAM_IDENT = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_PARAM_CHAIN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*(?:[?!]?\.[A-Za-z_][A-Za-z0-9_]*)*')
+
+
+def _param_expr(source):
+    """`$x` / `${ x }` -> `x`, so both spellings count as one parameter."""
+    return source[2:-1].strip() if source.startswith('${') else source[1:]
+
+
+def _param_name(expr):
+    """Placeholder name: `count` for `count`, `year` for `review.year`,
+    `pct_round` for `(pct * 100).round()`."""
+    if _PARAM_CHAIN.fullmatch(expr):
+        return _PARAM_IDENT.findall(expr)[-1]
+    return '_'.join(_PARAM_IDENT.findall(expr)[:3]) or 'value'
+
+
+def extract_params(en_parts, tr_parts):
+    """Turn interpolated en/tr literal parts into {name} templates.
+
+    Returns (en_template, tr_template, params) or None when the branches
+    interpolate different expressions or literal text contains braces
+    (which getWithParams would treat as placeholders).
+    """
+    def interpolations(parts):
+        return {_param_expr(p.source) for p in parts if not isinstance(p, str)}
+
+    exprs = interpolations(en_parts)
+    if exprs != interpolations(tr_parts):
+        return None
+
+    names = {}
+    for expr in sorted(exprs):
+        name = base = _param_name(expr)
+        n = 1
+        while name in names.values():
+            n += 1
+            name = f'{base}_{n}'
+        names[expr] = name
+
+    def template(parts):
+        out = []
+        for p in parts:
+            if isinstance(p, str):
+                if '{' in p or '}' in p:
+                    return None
+                out.append(p)
+            else:
+                out.append('{' + names[_param_expr(p.source)] + '}')
+        return ''.join(out)
+
+    en, tr = template(en_parts), template(tr_parts)
+    if en is None or tr is None:
+        return None
+    # Interpolating keeps the value a String whatever the expression's type
+    params = tuple(
+        (name, f"'${expr}'" if _PARAM_IDENT.fullmatch(expr) else f"'${{{expr}}}'")
+        for expr, name in sorted(names.items(), key=lambda item: item[1])
+    )
+    return en, tr, params
+
+
+def find_ternaries(content, pattern=ISEN_PATTERN_ALL):
+    """Non-overlapping isEn ternaries in source order.
+
+    `pattern` is one of the ISEN_PATTERN regexes or a
+    dart_lexer.TernaryMatcher.
+    """
+    if not isinstance(pattern, re.Pattern):
+        found = []
+        for t in pattern.find(content):
+            en, tr, params = t.en.value, t.tr.value, None
+            interpolated = t.en.interpolated or t.tr.interpolated
+            if interpolated:
+                extracted = extract_params(t.en.parts, t.tr.parts)
+                if extracted:
+                    en, tr, params = extracted
+            found.append(Ternary(t.start, t.end, t.condition, en, tr, interpolated, params))
+        return found
+
+    found = []
+    for match in pattern.finditer(content):
+        if match.group(1) is not None:
+            en_text, tr_text = match.group(1), match.group(2)
+        else:
+            en_text, tr_text = match.group(3), match.group(4)
+        found.append(Ternary(
+            match.start(), match.end(), 'isEn', en_text, tr_text,
+            '$' in en_text or '$' in tr_text, None,
+        ))
+    return found
+
+
+def l10n_call(key, language, params=None):
+    """`L10nService.get(...)`, or `getWithParams(...)` when there are params.
+
+    `key` is a catalog key, emitted as a string literal, or an
+    `L10nKeys.name` constant reference (see key_refs), emitted as is.
+    """
+    ref = key if key.startswith(f'{KEYS_CLASS}.') else f"'{key}'"
+    if params:
+        entries = ', '.join(f"'{name}': {expr}" for name, expr in params)
+        return f"L10nService.getWithParams({ref}, {language}, params: {{{entries}}})"
+    return f"L10nService.get({ref}, {language})"
+
+
+def key_refs(locales, new_keys, project_root):
+    """Catalog key -> `L10nKeys.name` for the catalogs plus `new_keys`,
+    keeping the names the generated file already has."""
+    names = key_identifiers(set(locales.indexes['en'].leaves) | set(new_keys),
+                            read_identifiers(keys_path(project_root)))
+    return {key: f'{KEYS_CLASS}.{name}' for key, name in names.items()}
+
+
+def keys_file(project_root, create=False):
+    """Path of the generated L10nKeys file to keep in sync, or None.
+
+    The file is regenerated whenever it exists; `create` (the default,
+    unless --literal-keys) also makes it when it does not.
+    """
+    path = keys_path(project_root)
+    return path if create or path.exists() else None
+
+
+def splice(content, edits):
+    """Apply (start, end, replacement) edits, sorted by start, in one pass."""
+    parts = []
+    pos = 0
+    for start, end, replacement in edits:
+        parts.append(content[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
+def add_imports(content, import_lines):
+    """Insert missing import lines, in order, after the last existing import."""
+    missing = [imp for imp in import_lines if imp not in content]
+    if not missing:
+        return content
+
+    lines = content.split('\n')
+    last_import_idx = -1
+    for i, line in enumerate(lines):
+        if line.strip().startswith('import '):
+            last_import_idx = i
+
+    lines[last_import_idx + 1:last_import_idx + 1] = missing
+    return '\n'.join(lines)
+
+
+# ═══════════════════════════════════════════════════════════════
+# KEYS
+# ═══════════════════════════════════════════════════════════════
+
+def sanitize_key(s):
+    s = s.lower().strip()
+    s = re.sub(r'[^a-z0-9_\s]', '', s)
+    s = re.sub(r'\s+', '_', s)
+    s = s[:40].rstrip('_')
+    return s or 'text'
+
+
+def file_to_prefix(filepath, lib_dir, suffixes):
+    rel = os.path.relpath(filepath, lib_dir)
+    parts = rel.replace('.dart', '').split(os.sep)
+    skip = {'presentation', 'widgets', 'lib'}
+    parts = [p for p in parts if p not in skip]
+    if parts and parts[0] == 'features':
+        parts = parts[1:]
+    if parts:
+        last = parts[-1]
+        for sfx in suffixes:
+            last = last.replace(sfx, '')
+        parts[-1] = last
+    return '.'.join(parts)
+
+
+class KeyAllocator:
+    """Hands out `prefix.text`, `prefix.text_1`, ... and records new keys.
+
+    Keys are content-addressed: an (en, tr) pair that already has a key,
+    in the catalogs (`pool`) or earlier in the run, reuses it. A pair
+    found in more than `common_after` files gets a `common.*` key rather
+    than the prefix of the first file it was seen in.
+
+    Any other pair gets a key nobody holds. `taken(key)` (see
+    LocaleSet.taken) rules out keys in use in the catalogs, and keys
+    minted this run are tracked the same way. Each base key keeps its
+    suffix counter, so no suffix is tried twice. A suffix cannot get
+    past a value on the key's path (`blocked(key)`, see
+    LocaleSet.blocking_parent), so such a key moves under a free sibling
+    of that value: `a.b.c` under a value at `a.b` becomes `a.b_2.c`.
+    """
+
+    def __init__(self, pool=None, common_after=0, taken=None, blocked=None):
+        self.key_counter = {}
+        self.minted = KeyIndex()
+        self.taken = taken or (lambda key: False)
+        self.blocked = blocked or (lambda key: None)
+        self.new_en_keys = {}
+        self.new_tr_keys = {}
+        self.pool = dict(pool or {})
+        self.common_after = common_after
+        self.file_counts = {}
+        self.reused = 0
+        self.promoted = 0
+
+    def count_files(self, scans):
+        """Record how many files each (en, tr) pair appears in."""
+        for scan in scans:
+            if scan is None:
+                continue
+            for pair in {(match.en, match.tr) for match in scan.matches}:
+                self.file_counts[pair] = self.file_counts.get(pair, 0) + 1
+
+    def _free(self, key):
+        return key not in self.minted and not self.minted.conflict(key) and not self.taken(key)
+
+    def _blocker(self, key):
+        return self.minted.blocking_parent(key) or self.blocked(key)
+
+    def _unblocked(self, key):
+        """`key`, moved under `parent_2`, `parent_3`, ... while a value on
+        its path blocks it."""
+        parent = self._blocker(key)
+        while parent:
+            rest, n = key[len(parent):], 2
+            key = f"{parent}_{n}{rest}"
+            while self._blocker(key) == f"{parent}_{n}":
+                n += 1
+                key = f"{parent}_{n}{rest}"
+            # Anything still in the way sits elsewhere on the new path
+            parent = self._blocker(key)
+        return key
+
+    def make_unique_key(self, prefix, en_text):
+        desc = sanitize_key(en_text[:50])
+        base_key = self._unblocked(f"{prefix}.{desc}" if desc else f"{prefix}.text")
+        if base_key not in self.key_counter:
+            self.key_counter[base_key] = 0
+            if self._free(base_key):
+                self.minted.add(base_key, en_text)
+                return base_key
+        while True:
+            self.key_counter[base_key] += 1
+            key = f"{base_key}_{self.key_counter[base_key]}"
+            if self._free(key):
+                self.minted.add(key, en_text)
+                return key
+
+    def allocate(self, prefix, en_text, tr_text):
+        pair = (en_text, tr_text)
+        key = self.pool.get(pair)
+        if key is not None:
+            self.reused += 1
+            return key
+        if self.common_after and self.file_counts.get(pair, 0) > self.common_after:
+            prefix = 'common'
+            self.promoted += 1
+        key = self.make_unique_key(prefix, en_text)
+        self.new_en_keys[key] = en_text
+        self.new_tr_keys[key] = tr_text
+        self.pool[pair] = key
+        return key
+
+
+# ═══════════════════════════════════════════════════════════════
+# MIGRATION RUN
+# ═══════════════════════════════════════════════════════════════
+
+# Per-script behaviour. Every field must be a module-level function
+# (or picklable value) so the spec can be shipped to pool workers.
+#   pattern          compiled ternary pattern (ISEN_PATTERN_SQ / _ALL)
+#   accepts          (data) -> bool, file-level filter on the raw bytes,
+#                    run before decoding
+#   prefix_for       (filepath) -> key prefix
+#   replacement_for  (key, condition, params) -> Dart expression replacing
+#                    the ternary; params as in Ternary (see l10n_call)
+#   imports_for      (filepath, content) -> import lines the file needs
+Migration = namedtuple(
+    'Migration', 'pattern accepts prefix_for replacement_for imports_for'
+)
+
+# Result of scanning one file; `matches` are the ternaries to migrate
+FileScan = namedtuple('FileScan', 'path prefix matches skipped imports')
+
+
+# Marker returned by scan_file when the file still matches its cached digest
+UNCHANGED = 'unchanged'
+
+
+class MigrationResult:
+    def __init__(self):
+        self.files_modified = 0
+        self.total_replacements = 0
+        self.skipped_interpolation = 0
+        self.interpolated = 0
+        self.cache_hits = 0
+        self.reused_keys = 0
+        self.promoted_keys = 0
+        self.patches = []
+        self.new_en_keys = {}
+        self.new_tr_keys = {}
+
+
+def collect_dart_files(lib_dir, stats=None, only=None):
+    """Sorted .dart files under `lib_dir`, or just those in `only` (see
+    selected_files) without walking the tree."""
+    stats = stats or Stats()
+    dart_files = []
+    with stats.phase('walk'):
+        if only is not None:
+            dart_files = [p for p in only
+                          if p.endswith('.dart') and '_archived' not in p and os.path.isfile(p)]
+        else:
+            for root, dirs, files in os.walk(lib_dir):
+                if '_archived' in root:
+                    continue
+                for f in files:
+                    if f.endswith('.dart'):
+                        dart_files.append(os.path.join(root, f))
+        dart_files.sort()
+    stats.count('files', len(dart_files))
+    return dart_files
+
+
+def scan_file(job, migration):
+    """Phase 1: find the migratable ternaries in one file.
+
+    `job` is (filepath, known_digest). Returns (scan, digest, size, laps)
+    where scan is a FileScan, None (nothing to migrate) or UNCHANGED when
+    the content still hashes to `known_digest` and the cached scan can be
+    reused, and laps are the file's read/scan Clock laps.
+    """
+    filepath, known_digest = job
+    clock = Clock()
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    size = len(data)
+    clock.lap('read')
+
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == known_digest:
+        scan = UNCHANGED
+    elif b'isEn' not in data or not migration.accepts(data):
+        # Most of lib/ stops here, without being decoded
+        scan = None
+    else:
+        scan = _scan_content(filepath, data.decode('utf-8'), migration)
+    clock.lap('scan')
+    return scan, digest, size, clock.laps
+
+
+def _scan_content(filepath, content, migration):
+
+    matches = []
+    skipped = 0
+    ternaries = find_ternaries(content, migration.pattern)
+    for i, match in enumerate(ternaries):
+        if match.interpolated:
+            # Migrated via getWithParams unless the params could not be
+            # extracted or a ${...} holds another ternary (migrated itself)
+            nested = i + 1 < len(ternaries) and ternaries[i + 1].start < match.end
+            if match.params is None or nested:
+                skipped += 1
+                continue
+        if len(match.en) < 2 and len(match.tr) < 2:
+            continue
+        matches.append(match)
+
+    return FileScan(
+        filepath,
+        migration.prefix_for(filepath),
+        matches,
+        skipped,
+        migration.imports_for(filepath, content),
+    )
+
+
+def render_file(job, clock):
+    """Phase 3: (original, rewritten) content of one file."""
+    filepath, edits, imports = job
+    with open(filepath, 'r', encoding='utf-8') as f:
+        original = f.read()
+    content = splice(original, edits)
+    clock.lap('rewrite')
+    content = add_imports(content, imports)
+    clock.lap('imports')
+    return original, content
+
+
+def rewrite_file(job):
+    """Phase 3: splice the replacements into one file and write it."""
+    clock = Clock()
+    _, content = render_file(job, clock)
+    with open(job[0], 'w', encoding='utf-8') as f:
+        f.write(content)
+    clock.lap('rewrite')
+    return clock.laps
+
+
+def stage_file(job):
+    """Phase 3 of a transactional run: write the rewrite to its staging file."""
+    clock = Clock()
+    _, content = render_file(job, clock)
+    write_staged(job[0], content)
+    clock.lap('rewrite')
+    return clock.laps
+
+
+def diff_file(job, project_root):
+    """Phase 3 of a dry run: (unified diff of the file's rewrite, laps)."""
+    clock = Clock()
+    original, content = render_file(job, clock)
+    patch = unified_diff(original, content, os.path.relpath(job[0], project_root))
+    clock.lap('rewrite')
+    return patch, clock.laps
+
+
+def _run_phase(fn, items, jobs):
+    if jobs == 1 or len(items) < 2:
+        return [fn(item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
+
+
+def _relocate(scan, filepath):
+    return scan._replace(path=filepath) if scan is not None else None
+
+
+def run_migration(migration, dart_files, project_root, jobs=1, cache=None,
+                  locales=None, common_after=0, dry_run=False, txn=None, stats=None,
+                  key_constants=False):
+    """Scan, allocate keys and rewrite `dart_files`; returns a MigrationResult.
+
+    With `locales` (a LocaleSet), strings the catalogs already hold reuse
+    their keys, and if an allocated key would clobber a catalog value or
+    subtree, KeyConflictError is raised before any file is written.
+    With `txn`, rewrites are only staged; the caller commits them together
+    with the catalogs. With `dry_run`, nothing is written and
+    `result.patches` holds one unified diff per file instead. Phase times
+    and per-file counts are recorded in `stats` (a Stats). With
+    `key_constants` (needs `locales`), call sites reference L10nKeys
+    constants instead of key literals.
+    """
+    result = MigrationResult()
+    stats = stats or Stats()
+
+    # Files whose size/mtime match the cache are not even opened; the rest
+    # are hashed by the workers and only decoded + scanned if they changed.
+    scans = [None] * len(dart_files)
+    pending = []
+    for i, filepath in enumerate(dart_files):
+        hit, entry = cache.lookup(filepath) if cache else (False, None)
+        if hit:
+            scans[i] = _relocate(entry.scan, filepath)
+        else:
+            pending.append((i, filepath, entry.digest if entry else None))
+
+    scanned = _run_phase(
+        partial(scan_file, migration=migration),
+        [(filepath, digest) for _, filepath, digest in pending],
+        jobs,
+    )
+    for (i, filepath, _), (scan, digest, size, laps) in zip(pending, scanned):
+        stats.file(filepath, nbytes=size, laps=laps)
+        # Compared by value: the sentinel is a fresh object after pickling
+        if scan == UNCHANGED:
+            scan = _relocate(cache.get(filepath).scan, filepath)
+            result.cache_hits += 1
+        scans[i] = scan
+        if cache:
+            cache.store(filepath, digest, scan)
+
+    if cache:
+        result.cache_hits += len(dart_files) - len(pending)
+        cache.retain(dart_files)
+        if result.cache_hits:
+            print(f"  ({result.cache_hits} unchanged files served from cache)\n")
+
+    # Merge: allocate keys in sorted-path order, exactly as a serial run would
+    rewrites = []
+    with stats.phase('allocate'):
+        allocator = KeyAllocator(
+            locales.pairs() if locales else None, common_after,
+            locales.taken if locales else None,
+            locales.blocking_parent if locales else None,
+        )
+        allocator.count_files(scans)
+        allocated = []
+        for scan in scans:
+            if scan is None:
+                continue
+            result.skipped_interpolation += scan.skipped
+            if scan.matches:
+                keys = [allocator.allocate(scan.prefix, m.en, m.tr) for m in scan.matches]
+                allocated.append((scan, keys))
+
+        # Constant names depend on the final key set, so render afterwards
+        refs = key_refs(locales, allocator.new_en_keys, project_root) if key_constants else {}
+        for scan, keys in allocated:
+            edits = []
+            for match, key in zip(scan.matches, keys):
+                result.interpolated += bool(match.params)
+                edits.append((match.start, match.end, migration.replacement_for(
+                    refs.get(key, key), match.condition, match.params)))
+
+            stats.file(scan.path, matches=len(edits))
+            rewrites.append((scan.path, edits, scan.imports))
+            result.files_modified += 1
+            result.total_replacements += len(edits)
+
+    if locales is not None:
+        en_leaves = locales.indexes['en'].leaves
+        conflicts = locales.conflicts(
+            key for key in allocator.new_en_keys if key not in en_leaves
+        )
+        if conflicts:
+            if cache and not dry_run:
+                cache.save()
+            raise KeyConflictError(
+                f'{len(conflicts)} keys conflict with the locale catalogs', conflicts)
+
+    if dry_run:
+        diffs = _run_phase(
+            partial(diff_file, project_root=project_root), rewrites, jobs
+        )
+        result.patches = [patch for patch, _ in diffs]
+        laps = [laps for _, laps in diffs]
+    elif txn is not None:
+        txn.add(filepath for filepath, _, _ in rewrites)
+        laps = _run_phase(stage_file, rewrites, jobs)
+    else:
+        laps = _run_phase(rewrite_file, rewrites, jobs)
+    for (filepath, edits, _), file_laps in zip(rewrites, laps):
+        stats.file(filepath, laps=file_laps)
+        # Rewritten files no longer match their cached scan
+        if cache and not dry_run:
+            cache.forget(filepath)
+        print(f"  [{len(edits):3d}] {os.path.relpath(filepath, project_root)}")
+
+    if cache and not dry_run:
+        cache.save()
+
+    result.reused_keys = allocator.reused
+    result.promoted_keys = allocator.promoted
+    result.new_en_keys = allocator.new_en_keys
+    result.new_tr_keys = allocator.new_tr_keys
+    for name in ('files_modified', 'total_replacements', 'interpolated',
+                 'skipped_interpolation', 'reused_keys', 'promoted_keys', 'cache_hits'):
+        stats.count(name, getattr(result, name))
+    stats.count('files_read', len(pending))
+    stats.count('bytes_read', sum(size for _, _, size, _ in scanned))
+    stats.count('new_keys', len(result.new_en_keys))
+    return result
+
+
+def report_conflicts(error):
+    """Print a KeyConflictError's conflicts for a script's main()."""
+    print(f"  {error}; nothing written:")
+    for key, reason in error.conflicts:
+        print(f"    {key}: {reason}")
+
+
+def parse_args(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1,
+        help='worker processes for scanning/rewriting (0 = all cores)',
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='ignore and do not update the incremental scan cache',
+    )
+    parser.add_argument(
+        '--pending', choices=PENDING_POLICIES, default='en',
+        help='text for de/fr keys without a translation (default: en)',
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help='write nothing; print a unified diff of every change to stdout',
+    )
+    parser.add_argument(
+        '--recover', choices=RECOVER_MODES,
+        help='finish (complete) or undo (rollback) an interrupted run first',
+    )
+    parser.add_argument(
+        '--common-after', type=int, default=2, metavar='N',
+        help='strings found in more than N files get a common.* key (0 = never)',
+    )
+    parser.add_argument(
+        '--literal-keys', action='store_true',
+        help="emit 'key' literals instead of L10nKeys.name constants",
+    )
+    parser.add_argument(
+        '--stats-json', metavar='FILE',
+        help='write phase timings, counters and per-file stats to FILE',
+    )
+    parser.add_argument(
+        '--stats-top', type=int, default=10, metavar='N',
+        help='slowest files listed in --stats-json (default: 10)',
+    )
+    parser.add_argument(
+        '--trace-memory', action='store_true',
+        help='record the tracemalloc peak in --stats-json (slow; main process only)',
+    )
+    changed = parser.add_mutually_exclusive_group()
+    changed.add_argument(
+        '--since', metavar='REF',
+        help='only files changed since the branch left REF (plus uncommitted and untracked ones)',
+    )
+    changed.add_argument(
+        '--staged', action='store_true',
+        help='only files with staged changes (for pre-commit hooks)',
+    )
+    changed.add_argument(
+        '--files-from', metavar='FILE',
+        help='only the files listed in FILE, one per line (e.g. an l10n_scan.py --worklist)',
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help='keep running and migrate each Dart file under lib/ as it is saved',
+    )
+    parser.add_argument(
+        '--poll', action='store_true',
+        help='with --watch: poll file stats instead of using inotify',
+    )
+    parser.add_argument(
+        '--debounce', type=float, default=1.0, metavar='SECONDS',
+        help='with --watch: write catalogs after this long without new keys (default: 1.0)',
+    )
+    args = parser.parse_args()
+    if args.dry_run and args.recover:
+        parser.error('--recover writes to the tree; resolve the journal before a --dry-run')
+    if args.watch and args.dry_run:
+        parser.error('--watch writes as files are saved; it cannot be combined with --dry-run')
+    if args.watch and (args.since or args.staged or args.files_from):
+        parser.error('--watch follows saves; it cannot be combined with --since/--staged/--files-from')
+    if args.jobs <= 0:
+        args.jobs = os.cpu_count() or 1
+    if args.dry_run:
+        # The patch owns stdout; progress and the summary go to stderr
+        args.patch_out = sys.stdout
+        sys.stdout = sys.stderr
+    return args
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOCALE CATALOGS
+# ═══════════════════════════════════════════════════════════════
+
+def _git(project_root, *git_args):
+    try:
+        proc = subprocess.run(
+            ['git', '-C', str(project_root), *git_args], capture_output=True, check=True
+        )
+    except FileNotFoundError:
+        print("  --since/--staged need git on PATH.")
+        sys.exit(1)
+    except subprocess.CalledProcessError as e:
+        print(f"  git {' '.join(git_args)}: {e.stderr.decode(errors='replace').strip()}")
+        sys.exit(1)
+    return proc.stdout
+
+
+def selected_files(args, project_root, lib_dir):
+    """Paths under `lib_dir` that --since/--staged/--files-from select;
+    None for the whole tree.
+
+    --since REF diffs the working tree against the merge-base of REF and
+    HEAD (what the branch changed) and adds untracked files. --staged
+    takes the index. --files-from reads paths relative to the project
+    root. Deleted files are left out. Keys are still allocated against
+    the full catalogs, so a partial run reuses and avoids the keys a full
+    run would.
+    """
+    rel = os.path.relpath(lib_dir, project_root)
+    if args.files_from:
+        with open(args.files_from, 'r', encoding='utf-8') as f:
+            listed = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        inside = [p for p in listed if os.path.normpath(p).split(os.sep)[0] == rel]
+        out = os.fsencode('\0'.join(inside))
+        source = f'listed in {args.files_from}'
+    elif args.staged:
+        out = _git(project_root, 'diff', '--cached', '--name-only', '-z', '--relative',
+                   '--diff-filter=d', '--', rel)
+        source = 'staged'
+    elif args.since:
+        base = _git(project_root, 'merge-base', args.since, 'HEAD').decode().strip()
+        out = _git(project_root, 'diff', '--name-only', '-z', '--relative',
+                   '--diff-filter=d', base, '--', rel)
+        out += _git(project_root, 'ls-files', '-z', '--others', '--exclude-standard', '--', rel)
+        source = f'changed since {args.since} ({base[:10]})'
+    else:
+        return None
+
+    paths = sorted({os.path.join(project_root, p) for p in os.fsdecode(out).split('\0') if p})
+    print(f"\n  {len(paths)} files {source}")
+    return paths
+
+
+def load_locales(l10n_dir, pending='en'):
+    """LocaleSet for a run; keys added in the l10n store and not yet
+    exported are reserved, so no new string is given one of them."""
+    locales = LocaleSet(l10n_dir, pending)
+    locales.reserve(pending_keys())
+    return locales
+
+
+def update_locale_files(locales, new_en_keys, new_tr_keys, stats=None):
+    """Add keys missing from en.json to all four locale catalogs in one pass.
+
+    New members are spliced into the existing catalog text (CatalogText),
+    so the untouched bulk of each file is never re-serialised. de/fr get
+    the text chosen by the LocaleSet's pending policy. Nothing is written
+    until commit(). Returns the number of keys added.
+    """
+    stats = stats or Stats()
+    added = 0
+    with stats.phase('json'):
+        for key in sorted(new_en_keys.keys()):
+            en_text = new_en_keys[key]
+            tr_text = new_tr_keys.get(key, en_text)
+            if locales.add(key, {'en': en_text, 'tr': tr_text}):
+                added += 1
+
+    stats.count('keys_added', added)
+    return added
+
+
+def check_placeholders(locales, keys, stats=None):
+    """Print the l10n_check placeholder mismatches among `keys` in the
+    in-memory catalogs; returns them (empty when consistent)."""
+    stats = stats or Stats()
+    with stats.phase('check'):
+        mismatches = CatalogCheck(locales.indexes, keys).mismatches
+    stats.count('placeholder_mismatches', len(mismatches))
+    if mismatches:
+        print(f"\n  {len(mismatches)} new keys have placeholders that differ from en.json:")
+        for m in mismatches:
+            print(f"    {m.locale}.json {m.key}: "
+                  f"{{{', '.join(sorted(m.found)) or '-'}}} vs en {{{', '.join(sorted(m.expected)) or '-'}}}")
+    return mismatches
+
+
+def open_transaction(args, project_root):
+    """Transaction for a run's writes; None for a dry run.
+
+    Stops the run if an earlier one was interrupted, unless --recover
+    says how to resolve it. A dry run never recovers (that would write
+    to the tree), so it stops on any journal.
+    """
+    journal = journal_path(project_root)
+    if args.dry_run:
+        if os.path.exists(journal):
+            print(f"  An interrupted migration left {journal}.")
+            print("  Resolve it with --recover complete or --recover rollback before a dry run.")
+            sys.exit(1)
+        return None
+    return begin(journal, args.recover)
+
+
+def _keys_file_update(locales, path):
+    """(old, new) content of the L10nKeys file, or None if it is current.
+    `old` is None when the file does not exist yet."""
+    old = path.read_text(encoding='utf-8') if path.exists() else None
+    new = render_keys(locales.indexes['en'].leaves, read_identifiers(path))
+    return None if new == old else (old, new)
+
+
+def commit(txn, locales, stats=None, keys_file=None):
+    """Stage the changed catalogs (with their pending sidecars and the
+    regenerated `keys_file`, see keys_file()) and land them with the
+    staged Dart files. The new catalog entries are merged into an l10n
+    store that has unexported edits, and an existing l10n index is
+    updated from the rewritten files and catalogs."""
+    stats = stats or Stats()
+    texts = {}
+    previous = {}
+    for loc, catalog in locales.catalogs.items():
+        if catalog.changed:
+            path = locales.l10n_dir / f'{loc}.json'
+            with stats.phase('json'):
+                texts[loc] = catalog.render()
+            previous[loc] = path.read_text(encoding='utf-8')
+            txn.stage(path, texts[loc])
+    for path, _, content in locales.pending_files():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        txn.stage(path, content)
+    if keys_file is not None:
+        update = _keys_file_update(locales, keys_file)
+        if update:
+            txn.stage(keys_file, update[1])
+    with stats.phase('commit'):
+        txn.commit()
+    merge_store({loc: (previous[loc], texts[loc]) for loc in texts if previous[loc] != texts[loc]})
+    with stats.phase('index'):
+        update_index(txn.paths, {loc: (text, locales.indexes[loc]) for loc, text in texts.items()})
+
+
+def write_patch(out, result, locales, project_root, stats=None, keys_file=None):
+    """Dry run: emit the Dart, locale, pending sidecar and L10nKeys diffs
+    as one patch."""
+    stats = stats or Stats()
+    for patch in result.patches:
+        out.write(patch)
+    for loc, catalog in locales.catalogs.items():
+        if catalog.changed:
+            path = os.path.relpath(locales.l10n_dir / f'{loc}.json', project_root)
+            with stats.phase('json'):
+                content = catalog.render()
+            out.write(unified_diff(catalog.text, content, path))
+    for path, old, new in locales.pending_files():
+        out.write(unified_diff(old or '', new, os.path.relpath(path, project_root),
+                               created=old is None))
+    if keys_file is not None:
+        update = _keys_file_update(locales, keys_file)
+        if update:
+            old, new = update
+            out.write(unified_diff(old or '', new, os.path.relpath(keys_file, project_root),
+                                   created=old is None))
+    out.flush()
+
+
+def open_stats(args, script_file):
+    """Stats for a run, written to --stats-json by write_stats()."""
+    return Stats(Path(script_file).stem, args.jobs, args.stats_top, args.trace_memory)
+
+
+def write_stats(args, stats, project_root):
+    if args.stats_json:
+        stats.write(args.stats_json, project_root)
+
+
+# ═══════════════════════════════════════════════════════════════
+# WATCH
+# ═══════════════════════════════════════════════════════════════
+
+def _forget_keys(allocator, keys):
+    """Drop allocated keys that were never used (their file was skipped)."""
+    for key in keys:
+        pair = (allocator.new_en_keys.pop(key), allocator.new_tr_keys.pop(key))
+        if allocator.pool.get(pair) == key:
+            del allocator.pool[pair]
+
+
+def _watch_file(filepath, migration, allocator, locales, project_root, key_constants=False):
+    """Migrate one saved file; returns (replacements, new keys, conflicts).
+
+    A file with conflicting keys is left untouched. None if the file has
+    nothing to migrate.
+    """
+    scan, _, _, _ = scan_file((filepath, None), migration)
+    if not scan or not scan.matches:
+        return None
+
+    before = set(allocator.new_en_keys)
+    keys = [allocator.allocate(scan.prefix, m.en, m.tr) for m in scan.matches]
+    new_keys = [k for k in allocator.new_en_keys if k not in before]
+
+    conflicts = locales.conflicts(new_keys)
+    if conflicts:
+        _forget_keys(allocator, new_keys)
+        return 0, [], conflicts
+
+    refs = key_refs(locales, new_keys, project_root) if key_constants else {}
+    edits = [(m.start, m.end, migration.replacement_for(refs.get(k, k), m.condition, m.params))
+             for m, k in zip(scan.matches, keys)]
+
+    for key in new_keys:
+        locales.add(key, {'en': allocator.new_en_keys[key], 'tr': allocator.new_tr_keys[key]})
+    txn = Transaction(journal_path(project_root))
+    _, content = render_file((filepath, edits, scan.imports), Clock())
+    txn.stage(filepath, content)
+    txn.commit()
+    update_index([filepath], {})
+    return len(edits), new_keys, []
+
+
+def _catalog_text(locales, loc):
+    catalog = locales.catalogs[loc]
+    return catalog.render() if catalog.changed else catalog.text
+
+
+def watch(migration, lib_dir, project_root, locales, args):
+    """--watch: migrate each Dart file under `lib_dir` as it is saved.
+
+    The catalogs, their key index and the key allocator stay loaded for
+    the whole session, so a save costs one scan and one splice of that
+    file. Its new keys go into the in-memory catalogs at once; the
+    catalog files (with what commit() keeps in sync) are written
+    `args.debounce` seconds after the last new key, and on exit (Ctrl-C
+    or SIGTERM). A catalog edited by someone else is reloaded, keeping
+    the keys not yet written. Keys are never promoted to common.* (that
+    needs every file's counts; see --common-after).
+    """
+    journal = journal_path(project_root)
+    catalog_paths = {str(locales.l10n_dir / f'{loc}.json'): loc for loc in locales.catalogs}
+    watcher = open_watcher([lib_dir, locales.l10n_dir], poll=args.poll)
+    allocator = KeyAllocator(locales.pairs(), taken=locales.taken, blocked=locales.blocking_parent)
+    keys_to_sync = keys_file(project_root, not args.literal_keys)
+    unsaved = []  # keys in the in-memory catalogs but not on disk yet
+    flush_at = None
+
+    def flush():
+        commit(Transaction(journal), locales, keys_file=keys_to_sync)
+        print(f"  Saved {'/'.join(locales.catalogs)}.json (+{len(unsaved)} keys)")
+        unsaved.clear()
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"\nWatching {os.path.relpath(lib_dir, project_root)}/ ({watcher.kind}); Ctrl-C to stop.\n")
+    try:
+        while True:
+            timeout = None if flush_at is None else max(0.0, flush_at - time.monotonic())
+            changed = watcher.poll(timeout)
+            if flush_at is not None and time.monotonic() >= flush_at:
+                flush()
+                flush_at = None
+
+            for path in sorted(changed):
+                if path in catalog_paths:
+                    loc = catalog_paths[path]
+                    try:
+                        with open(path, 'r', encoding='utf-8') as f:
+                            external = f.read() != _catalog_text(locales, loc)
+                    except FileNotFoundError:
+                        continue
+                    if external:
+                        print(f"  {loc}.json changed on disk; reloading catalogs")
+                        texts = {k: {'en': allocator.new_en_keys[k], 'tr': allocator.new_tr_keys[k]}
+                                 for k in unsaved}
+                        locales = load_locales(locales.l10n_dir, locales.pending_policy)
+                        unsaved = [k for k in unsaved if locales.add(k, texts[k])]
+                        allocator.pool.update(locales.pairs())
+                        allocator.taken = locales.taken
+                        allocator.blocked = locales.blocking_parent
+                        if unsaved:
+                            flush_at = time.monotonic() + args.debounce
+                    continue
+                if not path.endswith('.dart') or '_archived' in path or not os.path.exists(path):
+                    continue
+
+                start = time.perf_counter()
+                migrated = _watch_file(path, migration, allocator, locales, project_root,
+                                       not args.literal_keys)
+                if migrated is None:
+                    continue
+                replaced, new_keys, conflicts = migrated
+                ms = (time.perf_counter() - start) * 1000
+                if conflicts:
+                    print(f"  {os.path.relpath(path, project_root)}: not migrated, "
+                          f"{len(conflicts)} keys conflict with the locale catalogs:")
+                    for key, reason in conflicts:
+                        print(f"    {key}: {reason}")
+                    continue
+                print(f"  [{replaced:3d}] {os.path.relpath(path, project_root)} "
+                      f"(+{len(new_keys)} keys, {ms:.0f} ms)")
+                if new_keys:
+                    unsaved.extend(new_keys)
+                    flush_at = time.monotonic() + args.debounce
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+        if unsaved:
+            flush()
+
+
+# ═══════════════════════════════════════════════════════════════
+# INCREMENTAL CACHE
+# ═══════════════════════════════════════════════════════════════
+
+CACHE_VERSION = 3
+
+
+def spec_fingerprint(migration):
+    """Hash of everything a cached FileScan depends on.
+
+    Covers the pattern set, the engine's scan and key rules
+    (sanitize_key, file_to_prefix) and the source of the script that
+    defines the spec, so editing any of them invalidates the cache.
+    """
+    h = hashlib.sha1()
+    h.update(f"{CACHE_VERSION}:{migration.pattern.pattern}:{migration.pattern.flags}".encode())
+    for fn in (find_ternaries, extract_params, _param_name, scan_file,
+               _scan_content, sanitize_key, file_to_prefix):
+        h.update(inspect.getsource(fn).encode())
+    modules = {fn.__module__ for fn in migration[1:]}
+    if not isinstance(migration.pattern, re.Pattern):
+        modules.add(type(migration.pattern).__module__)
+    for module_name in sorted(modules):
+        h.update(inspect.getsource(sys.modules[module_name]).encode())
+    return h.hexdigest()
+
+
+CacheEntry = namedtuple('CacheEntry', 'size mtime_ns digest scan')
+
+
+class ScanCache:
+    """Persisted manifest: file path -> stat, content hash and FileScan."""
+
+    def __init__(self, path, migration, project_root):
+        self.path = Path(path)
+        self.project_root = project_root
+        self.fingerprint = spec_fingerprint(migration)
+        self.entries = {}
+        self.partial = False
+        self._load()
+
+    def _rel(self, filepath):
+        return os.path.relpath(filepath, self.project_root)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('fingerprint') != self.fingerprint:
+            return
+        for rel, e in data['files'].items():
+            scan = None
+            if e['scan'] is not None:
+                s = e['scan']
+                scan = FileScan(
+                    os.path.join(self.project_root, rel),
+                    s['prefix'],
+                    [Ternary(*m) for m in s['matches']],
+                    s['skipped'],
+                    s['imports'],
+                )
+            self.entries[rel] = CacheEntry(e['size'], e['mtime_ns'], e['digest'], scan)
+
+    def get(self, filepath):
+        return self.entries.get(self._rel(filepath))
+
+    def lookup(self, filepath):
+        """Return (hit, entry); a hit means size and mtime are unchanged."""
+        entry = self.get(filepath)
+        if entry is None:
+            return False, None
+        st = os.stat(filepath)
+        return (st.st_size, st.st_mtime_ns) == (entry.size, entry.mtime_ns), entry
+
+    def store(self, filepath, digest, scan):
+        st = os.stat(filepath)
+        self.entries[self._rel(filepath)] = CacheEntry(
+            st.st_size, st.st_mtime_ns, digest, scan
+        )
+
+    def forget(self, filepath):
+        self.entries.pop(self._rel(filepath), None)
+
+    def retain(self, dart_files):
+        """Drop entries for files no longer in the tree (unless partial)."""
+        if self.partial:
+            return
+        keep = {self._rel(fp) for fp in dart_files}
+        self.entries = {rel: e for rel, e in self.entries.items() if rel in keep}
+
+    def save(self):
+        files = {}
+        for rel, e in sorted(self.entries.items()):
+            scan = None
+            if e.scan is not None:
+                scan = {
+                    'prefix': e.scan.prefix,
+                    'matches': [list(m) for m in e.scan.matches],
+                    'skipped': e.scan.skipped,
+                    'imports': e.scan.imports,
+                }
+            files[rel] = {
+                'size': e.size, 'mtime_ns': e.mtime_ns,
+                'digest': e.digest, 'scan': scan,
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'files': files}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+def open_cache(args, migration, project_root, script_file):
+    """ScanCache for `script_file` under scripts/.migrate_cache, or None."""
+    if args.no_cache:
+        return None
+    name = Path(script_file).stem + '.json'
+    cache = ScanCache(Path(script_file).parent / '.migrate_cache' / name, migration, project_root)
+    # A --since/--staged/--files-from run sees only some files; keep the
+    # others' entries
+    cache.partial = bool(args.since or args.staged or args.files_from)
+    return cache
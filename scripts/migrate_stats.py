@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Timing and counters for the migrate scripts (`--stats-json`).
+
+Phases run in the main process (walk, allocate, json, commit) are timed
+around the call. Per-file phases (read, scan, rewrite, imports) are timed
+inside whichever process handles the file, returned as Clock laps and
+summed here, so with `--jobs N` their totals add up worker time and can
+exceed the run's wall time. CPU time includes reaped worker processes.
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+def _cpu():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+class Clock:
+    """Per-file (phase, wall, cpu) laps, picklable back from a worker."""
+
+    def __init__(self):
+        self.laps = []
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def lap(self, phase):
+        wall, cpu = time.perf_counter(), time.process_time()
+        self.laps.append((phase, wall - self._wall, cpu - self._cpu))
+        self._wall, self._cpu = wall, cpu
+
+
+class Stats:
+    """Phase times, counters and per-file records for one run."""
+
+    def __init__(self, script='', jobs=1, top=10, trace_memory=False):
+        self.script = script
+        self.jobs = jobs
+        self.top = top
+        self.phases = OrderedDict()
+        self.counters = OrderedDict()
+        self.files = {}
+        self._start = (time.perf_counter(), _cpu())
+        self.trace_memory = trace_memory
+        if trace_memory:
+            tracemalloc.start()
+
+    def _add(self, name, wall, cpu):
+        p = self.phases.setdefault(name, {'wall_s': 0.0, 'cpu_s': 0.0})
+        p['wall_s'] += wall
+        p['cpu_s'] += cpu
+
+    @contextmanager
+    def phase(self, name):
+        wall, cpu = time.perf_counter(), _cpu()
+        try:
+            yield
+        finally:
+            self._add(name, time.perf_counter() - wall, _cpu() - cpu)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def file(self, path, nbytes=None, matches=None, laps=()):
+        """Record bytes, matches and/or worker laps for one file."""
+        rec = self.files.setdefault(path, {'bytes': 0, 'matches': 0, 'seconds': 0.0})
+        if nbytes is not None:
+            rec['bytes'] = nbytes
+        if matches is not None:
+            rec['matches'] = matches
+        for phase, wall, cpu in laps:
+            self._add(phase, wall, cpu)
+            rec['seconds'] += wall
+            rec[f'{phase}_s'] = rec.get(f'{phase}_s', 0.0) + wall
+
+    def report(self, project_root=None):
+        def rel(path):
+            return os.path.relpath(path, project_root) if project_root else path
+
+        files = [dict(path=rel(p), **rec) for p, rec in sorted(self.files.items())]
+        slowest = sorted(files, key=lambda r: r['seconds'], reverse=True)[:self.top]
+
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+        report = OrderedDict([
+            ('script', self.script),
+            ('jobs', self.jobs),
+            ('wall_s', time.perf_counter() - self._start[0]),
+            ('cpu_s', _cpu() - self._start[1]),
+            ('peak_rss_mb', rss * scale / 2**20),
+            ('phases', self.phases),
+            ('counters', self.counters),
+            ('slowest_files', slowest),
+            ('files', files),
+        ])
+        if self.trace_memory:
+            report['tracemalloc_peak_mb'] = tracemalloc.get_traced_memory()[1] / 2**20
+        return report
+
+    def write(self, path, project_root=None):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(project_root), f, indent=2)
+            f.write('\n')
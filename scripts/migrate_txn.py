@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+All-or-nothing writes for the migrate scripts.
+
+Every output (Dart sources and locale catalogs) is first staged next to
+its target as `<path>.migrate-tmp` and fsynced. The originals are then
+hard-linked to `<path>.migrate-bak`, and the journal is marked
+`prepared`. Only after that are the staged files renamed into place. A
+run that dies part-way leaves the journal behind. The next run refuses
+to start until the journal is resolved with `--recover complete` (finish
+the renames) or `--recover rollback` (restore the originals). A journal
+still in the `staging` state is always rolled back, because nothing has
+been renamed yet.
+
+Deletions go through the same steps. A file queued with remove() is
+backed up with the others and deleted after the renames, so rollback
+restores it and complete deletes it.
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+STAGING = 'staging'
+PREPARED = 'prepared'
+RECOVER_MODES = ('complete', 'rollback')
+
+
+def journal_path(project_root):
+    return Path(project_root) / 'scripts' / '.migrate_cache' / 'journal.json'
+
+
+def temp_path(path):
+    return f'{path}.migrate-tmp'
+
+
+def backup_path(path):
+    return f'{path}.migrate-bak'
+
+
+def write_staged(path, content):
+    """Write `content` to the staging file for `path` and fsync it."""
+    with open(temp_path(path), 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fsync_dir(directory):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_json_atomic(path, data):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(path))
+
+
+class Transaction:
+    """A batch of file writes that lands completely or not at all."""
+
+    def __init__(self, journal):
+        self.journal = str(journal)
+        self.paths = []
+        self.removed = []
+        self._staged = []  # (path, content) journaled and written by commit()
+
+    def add(self, paths):
+        """Journal `paths` before their staging files are written.
+
+        Each call rewrites and fsyncs the journal, so callers add a whole
+        batch at once (stage() defers to commit() for the same reason).
+        """
+        paths = [str(p) for p in paths]
+        if not paths:
+            return
+        self.paths.extend(paths)
+        self._journal_staging()
+
+    def _journal_staging(self):
+        os.makedirs(os.path.dirname(self.journal), exist_ok=True)
+        _write_json_atomic(self.journal, {'state': STAGING, 'files': self.paths,
+                                          'removed': self.removed})
+
+    def stage(self, path, content):
+        """Queue `content` for `path`; commit() journals every queued path
+        in one write before the staging files are written."""
+        self._staged.append((str(path), content))
+
+    def remove(self, path):
+        """Queue `path` for deletion; commit() journals and backs it up
+        with the staged files."""
+        self.removed.append(str(path))
+
+    def commit(self):
+        """Back up the originals, then rename every staged file into place
+        and delete the removed ones."""
+        if self._staged:
+            self.add(path for path, _ in self._staged)
+            for path, content in self._staged:
+                write_staged(path, content)
+            self._staged = []
+        elif self.removed:
+            self._journal_staging()
+        if not self.paths and not self.removed:
+            return
+        existed = {}
+        for path in self.paths + self.removed:
+            existed[path] = os.path.exists(path)
+            if existed[path]:
+                _remove(backup_path(path))
+                try:
+                    os.link(path, backup_path(path))
+                except OSError:
+                    shutil.copy2(path, backup_path(path))
+        _write_json_atomic(self.journal, {
+            'state': PREPARED,
+            'files': self.paths,
+            'removed': self.removed,
+            'existed': [p for p in self.paths + self.removed if existed[p]],
+        })
+
+        try:
+            for path in self.paths:
+                os.replace(temp_path(path), path)
+            for path in self.removed:
+                _remove(path)
+        except BaseException:
+            recover(self.journal, 'rollback')
+            raise
+        for directory in sorted({os.path.dirname(p) for p in self.paths + self.removed}):
+            _fsync_dir(directory)
+
+        _finish(self.journal, self.paths + self.removed)
+
+
+def _finish(journal, paths):
+    for path in paths:
+        _remove(backup_path(path))
+        _remove(temp_path(path))
+    os.remove(journal)
+
+
+def recover(journal, mode):
+    """Resolve an interrupted transaction; returns the number of files touched."""
+    with open(journal, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    paths = data['files']
+    removed = data.get('removed', [])
+    existed = set(data.get('existed', ()))
+
+    touched = 0
+    if data['state'] == PREPARED and mode == 'complete':
+        for path in paths:
+            if os.path.exists(temp_path(path)):
+                os.replace(temp_path(path), path)
+                touched += 1
+        for path in removed:
+            if os.path.exists(path):
+                os.remove(path)
+                touched += 1
+    elif data['state'] == PREPARED:
+        for path in paths + removed:
+            if os.path.exists(backup_path(path)):
+                os.replace(backup_path(path), path)
+                touched += 1
+            elif path not in existed and not os.path.exists(temp_path(path)):
+                _remove(path)
+                touched += 1
+
+    _finish(journal, paths + removed)
+    return touched
+
+
+def begin(journal, recover_mode=None):
+    """A new Transaction, after resolving any journal a previous run left."""
+    if os.path.exists(journal):
+        if recover_mode is None:
+            print(f"  An interrupted migration left {journal}.")
+            print("  Rerun with --recover complete or --recover rollback.")
+            sys.exit(1)
+        touched = recover(journal, recover_mode)
+        print(f"  Recovered interrupted migration ({recover_mode}): {touched} files\n")
+    return Transaction(journal)
@@ -3,490 +3,218 @@
 isEn -> L10nService migration v5: Interpolated strings.
 Handles patterns like: isEn ? '$count words' : '$count kelime'
 Uses L10nService.getWithParams() with {param} placeholders.
+
+The entries live in migrate_v5_interpolated.json. They are planned per
+file: each file is read once, every entry is located in one lexer pass,
+and all of its replacements are applied in a single splice. Call sites
+reference L10nKeys constants unless run with --literal-keys.
+
+Usage:
+  python3 scripts/migrate_v5_interpolated.py
+  python3 scripts/migrate_v5_interpolated.py --dry-run > v5.patch
 """
 
-import json, os, re
-from pathlib import Path
+import argparse
+import json
+import os
+import sys
 from collections import OrderedDict
+from pathlib import Path
+
+import migrate_engine as engine
+from dart_lexer import find_isen_ternaries
+from migrate_diff import unified_diff
+from migrate_txn import RECOVER_MODES, write_staged
 
 PROJECT_ROOT = Path(__file__).parent.parent
 LIB_DIR = PROJECT_ROOT / "lib"
-EN_JSON = PROJECT_ROOT / "assets" / "l10n" / "en.json"
-TR_JSON = PROJECT_ROOT / "assets" / "l10n" / "tr.json"
-
-# Each migration entry: (file, line_search_text, l10n_key, en_template, tr_template, params_expr, isEn_accessor)
-# params_expr maps {placeholder} -> dart expression
-# isEn_accessor is how to reference isEn in that scope (isEn, widget.isEn, _isEn)
-
-MIGRATIONS = [
-    # ═══════════════════════════════════════════════════════════════
-    # JOURNAL
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/journal/presentation/daily_entry_screen.dart',
-        'old': "isEn ? '$words words' : '$words kelime'",
-        'key': 'journal.daily_entry.word_count',
-        'en': '{count} words',
-        'tr': '{count} kelime',
-        'params': "{'count': '$words'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/journal/presentation/daily_entry_screen.dart',
-        'old': "isEn ? '$streak day streak' : '$streak gün seri'",
-        'key': 'journal.daily_entry.day_streak',
-        'en': '{count} day streak',
-        'tr': '{count} gün seri',
-        'params': "{'count': '$streak'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/journal/presentation/annual_report_screen.dart',
-        'old': "isEn ? '$count entries recorded' : '$count kayıt yazıldı'",
-        'key': 'journal.annual_report.entries_recorded',
-        'en': '{count} entries recorded',
-        'tr': '{count} kayıt yazıldı',
-        'params': "{'count': '$count'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/journal/presentation/archive_screen.dart',
-        'old': "isEn ? 'Filter: $label' : 'Filtre: $label'",
-        'key': 'journal.archive.filter_label',
-        'en': 'Filter: {label}',
-        'tr': 'Filtre: {label}',
-        'params': "{'label': label}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/journal/presentation/archive_screen.dart',
-        'old': "isEn ? '$words words' : '$words kelime'",
-        'key': 'journal.archive.word_count',
-        'en': '{count} words',
-        'tr': '{count} kelime',
-        'params': "{'count': '$words'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/journal/presentation/emotional_cycle_screen.dart',
-        'old': "isEn ? 'Last $displayDays Days' : 'Son $displayDays Gün'",
-        'key': 'journal.emotional_cycle.last_n_days',
-        'en': 'Last {count} Days',
-        'tr': 'Son {count} Gün',
-        'params': "{'count': '$displayDays'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/journal/presentation/emotional_cycle_screen.dart',
-        'old': "isEn ? '$displayDays days ago' : '$displayDays gün önce'",
-        'key': 'journal.emotional_cycle.days_ago',
-        'en': '{count} days ago',
-        'tr': '{count} gün önce',
-        'params': "{'count': '$displayDays'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/journal/presentation/patterns_screen.dart',
-        'old': "isEn ? '$days days' : '$days gün'",
-        'key': 'journal.patterns.n_days',
-        'en': '{count} days',
-        'tr': '{count} gün',
-        'params': "{'count': '$days'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # MEDITATION
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/meditation/presentation/meditation_timer_screen.dart',
-        'old': "isEn ? '$m minutes' : '$m dakika'",
-        'key': 'meditation.timer.n_minutes',
-        'en': '{count} minutes',
-        'tr': '{count} dakika',
-        'params': "{'count': '$m'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # BLIND SPOT
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/blind_spot/presentation/blind_spot_screen.dart',
-        'old': "isEn ? '$entryCount / 14 entries' : '$entryCount / 14 kayıt'",
-        'key': 'blind_spot.entry_count_progress',
-        'en': '{count} / 14 entries',
-        'tr': '{count} / 14 kayıt',
-        'params': "{'count': '$entryCount'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # AFFIRMATION
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/affirmation/presentation/affirmation_library_screen.dart',
-        'old': "isEn ? 'Filter: $label' : 'Filtre: $label'",
-        'key': 'affirmation.library.filter_label',
-        'en': 'Filter: {label}',
-        'tr': 'Filtre: {label}',
-        'params': "{'label': label}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # ARCHETYPE
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/archetype/presentation/archetype_screen.dart',
-        'old': "isEn ? '$confidencePct% alignment' : '%$confidencePct uyum'",
-        'key': 'archetype.alignment_pct',
-        'en': '{pct}% alignment',
-        'tr': '%{pct} uyum',
-        'params': "{'pct': '$confidencePct'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # YEAR REVIEW
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/year_review/presentation/year_review_screen.dart',
-        'old': "isEn ? 'My ${review.year} Summary' : '${review.year} Özetim'",
-        'key': 'year_review.my_year_summary',
-        'en': 'My {year} Summary',
-        'tr': '{year} Özetim',
-        'params': "{'year': '${review.year}'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/year_review/presentation/wrapped_screen.dart',
-        'old': "isEn ? '$count entries this year' : 'Bu yıl $count kayıt'",
-        'key': 'year_review.entries_this_year',
-        'en': '{count} entries this year',
-        'tr': 'Bu yıl {count} kayıt',
-        'params': "{'count': '$count'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # TODAY FEED
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/today/presentation/today_feed_screen.dart',
-        'old': "isEn ? '$label Anniversary!' : '$label Y\\u0131l D\\u00f6n\\u00fcm\\u00fc!'",
-        'key': 'today.anniversary_label',
-        'en': '{label} Anniversary!',
-        'tr': '{label} Yıl Dönümü!',
-        'params': "{'label': label}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/today/presentation/widgets/daily_pulse_card.dart',
-        'old': "isEn ? 'Try this for $areaLabel' : '$areaLabel için dene'",
-        'key': 'today.daily_pulse.try_for_area',
-        'en': 'Try this for {area}',
-        'tr': '{area} için dene',
-        'params': "{'area': areaLabel}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # STREAK
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/streak/presentation/streak_stats_screen.dart',
-        'old': "isEn ? '$milestone d' : '$milestone g'",
-        'key': 'streak.milestone_days_short',
-        'en': '{count} d',
-        'tr': '{count} g',
-        'params': "{'count': '$milestone'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # CYCLE SYNC
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/cycle_sync/presentation/cycle_sync_screen.dart',
-        'old': "isEn ? 'of $cycleLength' : '/ $cycleLength'",
-        'key': 'cycle_sync.of_cycle_length',
-        'en': 'of {count}',
-        'tr': '/ {count}',
-        'params': "{'count': '$cycleLength'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/cycle_sync/presentation/cycle_sync_screen.dart',
-        'old': "isEn ? 'in ~$daysUntil days' : '~$daysUntil gün sonra'",
-        'key': 'cycle_sync.in_n_days',
-        'en': 'in ~{count} days',
-        'tr': '~{count} gün sonra',
-        'params': "{'count': '$daysUntil'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/cycle_sync/presentation/cycle_sync_screen.dart',
-        'old': """isEn ? 'Upgrade to Pro' : "Pro'ya Yükselt\"""",
-        'key': 'common.upgrade_to_pro',
-        'en': 'Upgrade to Pro',
-        'tr': "Pro'ya Yükselt",
-        'params': None,  # No params needed
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # DIGEST
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/digest/presentation/weekly_digest_screen.dart',
-        'old': "isEn ? 'Week of $range' : '$range Haftasi'",
-        'key': 'digest.week_of_range',
-        'en': 'Week of {range}',
-        'tr': '{range} Haftası',
-        'params': "{'range': range}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # RETROSPECTIVE
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/retrospective/presentation/retrospective_screen.dart',
-        'old': "isEn ? '$savedCount memories saved' : '$savedCount anı kaydedildi'",
-        'key': 'retrospective.memories_saved',
-        'en': '{count} memories saved',
-        'tr': '{count} anı kaydedildi',
-        'params': "{'count': '$savedCount'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # GROWTH
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/growth/presentation/growth_dashboard_screen.dart',
-        'old': "isEn ? 'Best: $longestStreak days' : 'En iyi: $longestStreak gün'",
-        'key': 'growth.best_streak_days',
-        'en': 'Best: {count} days',
-        'tr': 'En iyi: {count} gün',
-        'params': "{'count': '$longestStreak'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # SHADOW WORK
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/shadow_work/presentation/shadow_work_screen.dart',
-        'old': "isEn ? '$daysAgo days ago' : '$daysAgo gün önce'",
-        'key': 'shadow_work.days_ago',
-        'en': '{count} days ago',
-        'tr': '{count} gün önce',
-        'params': "{'count': '$daysAgo'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/shadow_work/presentation/shadow_work_screen.dart',
-        'old': """isEn ? 'Upgrade to Pro' : "Pro'ya Yükselt\"""",
-        'key': 'common.upgrade_to_pro',
-        'en': 'Upgrade to Pro',
-        'tr': "Pro'ya Yükselt",
-        'params': None,
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # PROGRAMS
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/programs/presentation/active_program_screen.dart',
-        'old': "isEn ? 'Day $dayNumber complete — keep the momentum going!' : '$dayNumber. gün tamam — ivmeni sürdür!'",
-        'key': 'programs.day_complete',
-        'en': 'Day {day} complete — keep the momentum going!',
-        'tr': '{day}. gün tamam — ivmeni sürdür!',
-        'params': "{'day': '$dayNumber'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # MILESTONES
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/milestones/presentation/milestone_screen.dart',
-        'old': "isEn ? '$label filter' : '$label filtresi'",
-        'key': 'milestones.filter_label',
-        'en': '{label} filter',
-        'tr': '{label} filtresi',
-        'params': "{'label': label}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # GRATITUDE
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/gratitude/presentation/gratitude_archive_screen.dart',
-        'old': "isEn ? '$count entries' : '$count kayıt'",
-        'key': 'gratitude.archive.entry_count',
-        'en': '{count} entries',
-        'tr': '{count} kayıt',
-        'params': "{'count': '$count'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # PREMIUM
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/features/premium/presentation/contextual_paywall_modal.dart',
-        'old': "isEn ? '$entryCount entries' : '$entryCount kayıt'",
-        'key': 'premium.entry_count',
-        'en': '{count} entries',
-        'tr': '{count} kayıt',
-        'params': "{'count': '$entryCount'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/premium/presentation/contextual_paywall_modal.dart',
-        'old': "isEn ? '$streakDays-day streak' : '$streakDays gün seri'",
-        'key': 'premium.day_streak',
-        'en': '{count}-day streak',
-        'tr': '{count} gün seri',
-        'params': "{'count': '$streakDays'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/features/premium/presentation/contextual_paywall_modal.dart',
-        'old': "isEn ? '$dreamCount dreams' : '$dreamCount rüya'",
-        'key': 'premium.dream_count',
-        'en': '{count} dreams',
-        'tr': '{count} rüya',
-        'params': "{'count': '$dreamCount'}",
-        'isEn': 'isEn',
-    },
-    # ═══════════════════════════════════════════════════════════════
-    # SHARE CARD TEMPLATES
-    # ═══════════════════════════════════════════════════════════════
-    {
-        'file': 'lib/data/content/share_card_templates.dart',
-        'old': "isEn ? 'Day $streakText' : '$streakText Gün'",
-        'key': 'share.day_streak_headline',
-        'en': 'Day {count}',
-        'tr': '{count} Gün',
-        'params': "{'count': streakText}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/data/content/share_card_templates.dart',
-        'old': "isEn ? '$days Days of Journaling' : '$days Gün Günlük'",
-        'key': 'share.days_of_journaling',
-        'en': '{count} Days of Journaling',
-        'tr': '{count} Gün Günlük',
-        'params': "{'count': '$days'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/data/content/share_card_templates.dart',
-        'old': "isEn ? 'Explored $count Dreams' : '$count Rüya Keşfedildi'",
-        'key': 'share.explored_dreams',
-        'en': 'Explored {count} Dreams',
-        'tr': '{count} Rüya Keşfedildi',
-        'params': "{'count': '$count'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/data/content/share_card_templates.dart',
-        'old': "isEn ? 'Found $count Patterns' : '$count Örüntü Bulundu'",
-        'key': 'share.found_patterns',
-        'en': 'Found {count} Patterns',
-        'tr': '{count} Örüntü Bulundu',
-        'params': "{'count': '$count'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/data/content/share_card_templates.dart',
-        'old': "isEn ? 'Day $day of $length' : '$length günün $day. günü'",
-        'key': 'share.day_of_length',
-        'en': 'Day {day} of {length}',
-        'tr': '{length} günün {day}. günü',
-        'params': "{'day': '$day', 'length': '$length'}",
-        'isEn': 'isEn',
-    },
-    {
-        'file': 'lib/data/content/share_card_templates.dart',
-        'old': "isEn ? '$name Completed!' : '$name Tamamlandı!'",
-        'key': 'share.program_completed',
-        'en': '{name} Completed!',
-        'tr': '{name} Tamamlandı!',
-        'params': "{'name': name}",
-        'isEn': 'isEn',
-    },
-]
-
-def set_nested_key(d, key, value):
-    parts = key.split('.')
-    current = d
-    for part in parts[:-1]:
-        if part not in current:
-            current[part] = OrderedDict()
-        elif not isinstance(current[part], dict):
-            current[part] = OrderedDict()
-        current = current[part]
-    current[parts[-1]] = value
+L10N_DIR = PROJECT_ROOT / "assets" / "l10n"
+TABLE = Path(__file__).with_suffix('.json')
+
+# Each table entry:
+#   file    path from the project root
+#   old     the ternary source to replace, e.g. isEn ? '$n words' : '$n kelime'
+#   key     l10n key; en/tr are its {param} templates
+#   params  Dart map expression for getWithParams(), or null for get()
+#   isEn    how to reference isEn in that scope (isEn, widget.isEn, _isEn)
+FIELDS = ('file', 'old', 'key', 'en', 'tr', 'params', 'isEn')
+
+
+def load_table(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    for i, entry in enumerate(entries):
+        missing = [field for field in FIELDS if field not in entry]
+        if missing:
+            raise ValueError(f"{path} entry {i} ({entry.get('key')}): missing {', '.join(missing)}")
+    return entries
+
+
+def replacement_for(entry, refs):
+    """The call replacing `entry`; `refs` maps keys to L10nKeys constants
+    (see engine.key_refs), other keys are emitted as literals."""
+    key, isEn = refs.get(entry['key'], f"'{entry['key']}'"), entry['isEn']
+    if entry['params'] is not None:
+        # Use getWithParams
+        return f"L10nService.getWithParams({key}, {isEn} ? AppLanguage.en : AppLanguage.tr, params: {entry['params']})"
+    # Simple get (no params)
+    return f"L10nService.get({key}, {isEn} ? AppLanguage.en : AppLanguage.tr)"
+
+
+def _claim(content, old, spans, taken):
+    """Offsets of the first unclaimed occurrence of `old`, or None."""
+    queue = spans.get(old)
+    if queue:
+        return queue.pop(0)
+    # Not a ternary the lexer recognises: plain substring search
+    pos = content.find(old)
+    while pos >= 0:
+        end = pos + len(old)
+        if not any(s < end and pos < e for s, e in taken):
+            return pos, end
+        pos = content.find(old, pos + 1)
+    return None
+
+
+def plan_file(filepath, entries):
+    """(content, edits, applied entries, unmatched entries) for one file;
+    edits are (start, end, entry), spliced once the keys are final.
+
+    Entries that share an `old` text take its occurrences in order, as
+    repeated first-occurrence replaces would.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    spans = {}
+    for t in find_isen_ternaries(content):
+        spans.setdefault(content[t.start:t.end], []).append((t.start, t.end))
+
+    edits, applied, unmatched, taken = [], [], [], []
+    for entry in entries:
+        span = _claim(content, entry['old'], spans, taken)
+        if span is None:
+            unmatched.append(entry)
+            continue
+        taken.append(span)
+        edits.append((span[0], span[1], entry))
+        applied.append(entry)
 
+    edits.sort(key=lambda edit: edit[0])
+    return content, edits, applied, unmatched
 
-def main():
-    print("=" * 60)
-    print("InnerCycles: isEn -> L10nService Migration v5")
-    print("Interpolated strings with getWithParams()")
-    print("=" * 60)
 
-    # Load JSON files
-    with open(EN_JSON, 'r', encoding='utf-8') as f:
-        en_data = json.load(f, object_pairs_hook=OrderedDict)
-    with open(TR_JSON, 'r', encoding='utf-8') as f:
-        tr_data = json.load(f, object_pairs_hook=OrderedDict)
+def plan(entries):
+    """Group entries by file and plan each file once.
 
-    total_replaced = 0
-    total_keys = 0
-    files_modified = set()
+    Returns (file -> (content, edits), applied entries in table order,
+    skip messages).
+    """
+    by_file = OrderedDict()
+    for entry in entries:
+        by_file.setdefault(entry['file'], []).append(entry)
 
-    for m in MIGRATIONS:
-        filepath = os.path.join(PROJECT_ROOT, m['file'])
+    contents, applied, skipped = OrderedDict(), [], []
+    for relpath, group in by_file.items():
+        filepath = os.path.join(PROJECT_ROOT, relpath)
         if not os.path.exists(filepath):
-            print(f"  SKIP (not found): {m['file']}")
+            skipped.append(f"SKIP (not found): {relpath} ({len(group)} entries)")
             continue
+        content, edits, done, unmatched = plan_file(filepath, group)
+        skipped.extend(f"SKIP (not found in file): {e['key']} in {relpath}" for e in unmatched)
+        if done:
+            contents[filepath] = (content, edits)
+            applied.extend(done)
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # Catalog updates follow table order, not file order
+    matched = {id(e) for e in applied}
+    return contents, [e for e in entries if id(e) in matched], skipped
 
-        old_text = m['old']
-        if old_text not in content:
-            print(f"  SKIP (not found in file): {m['key']} in {m['file']}")
-            continue
-
-        key = m['key']
-        isEn = m['isEn']
-
-        if m['params'] is not None:
-            # Use getWithParams
-            new_text = f"L10nService.getWithParams('{key}', {isEn} ? AppLanguage.en : AppLanguage.tr, params: {m['params']})"
-        else:
-            # Simple get (no params)
-            new_text = f"L10nService.get('{key}', {isEn} ? AppLanguage.en : AppLanguage.tr)"
-
-        content = content.replace(old_text, new_text, 1)
-        total_replaced += 1
-        files_modified.add(filepath)
-
-        # Add key to JSON
-        set_nested_key(en_data, key, m['en'])
-        set_nested_key(tr_data, key, m['tr'])
-        total_keys += 1
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help='write nothing; print a unified diff of every change to stdout',
+    )
+    parser.add_argument(
+        '--literal-keys', action='store_true',
+        help="emit 'key' literals instead of L10nKeys.name constants",
+    )
+    parser.add_argument(
+        '--recover', choices=RECOVER_MODES,
+        help='finish (complete) or undo (rollback) an interrupted run first',
+    )
+    args = parser.parse_args()
+    if args.dry_run and args.recover:
+        parser.error('--recover writes to the tree; resolve the journal before a --dry-run')
+    if args.dry_run:
+        # The patch owns stdout; progress and the summary go to stderr
+        args.patch_out = sys.stdout
+        sys.stdout = sys.stderr
 
-        print(f"  OK  {m['key']}")
+    print("=" * 60)
+    print("InnerCycles: isEn -> L10nService Migration v5")
+    print("Interpolated strings with getWithParams()")
+    print("=" * 60)
 
-    # Save JSON
-    with open(EN_JSON, 'w', encoding='utf-8') as f:
-        json.dump(en_data, f, ensure_ascii=False, indent=2)
-        f.write('\n')
-    with open(TR_JSON, 'w', encoding='utf-8') as f:
-        json.dump(tr_data, f, ensure_ascii=False, indent=2)
-        f.write('\n')
+    txn = engine.open_transaction(args, PROJECT_ROOT)
+
+    entries = load_table(TABLE)
+    contents, applied, skipped = plan(entries)
+    print(f"\n{len(entries)} entries, {len(applied)} matched\n")
+    for line in skipped:
+        print(f"  {line}")
+
+    # Load all locale catalogs once
+    locales = engine.load_locales(L10N_DIR)
+
+    # Keys that would clobber a catalog value or subtree: stop before writing
+    conflicts = locales.conflicts({e['key'] for e in applied})
+    if conflicts:
+        print(f"  {len(conflicts)} keys conflict with the locale catalogs; nothing written:")
+        for key, reason in conflicts:
+            print(f"    {key}: {reason}")
+        sys.exit(1)
+
+    for entry in applied:
+        locales.set(entry['key'], {'en': entry['en'], 'tr': entry['tr']})
+        print(f"  OK  {entry['key']}")
+
+    # A {param} missing from one locale would show up as literal braces
+    if engine.check_placeholders(locales, [e['key'] for e in applied]):
+        print("  Fix the table's en/tr texts; nothing written.")
+        sys.exit(1)
+
+    # Constant names depend on the final key set, so render afterwards
+    keys_file = engine.keys_file(PROJECT_ROOT, not args.literal_keys)
+    refs = {} if args.literal_keys else engine.key_refs(locales, [], PROJECT_ROOT)
+    rewritten = OrderedDict(
+        (filepath, (content, engine.splice(content, [(s, e, replacement_for(entry, refs))
+                                                     for s, e, entry in edits])))
+        for filepath, (content, edits) in contents.items()
+    )
+    if args.dry_run:
+        result = engine.MigrationResult()
+        result.patches = [unified_diff(original, content, os.path.relpath(filepath, PROJECT_ROOT))
+                          for filepath, (original, content) in rewritten.items()]
+        engine.write_patch(args.patch_out, result, locales, PROJECT_ROOT, keys_file=keys_file)
+    else:
+        # Land the Dart files and catalogs together (catalogs are spliced)
+        txn.add(rewritten)
+        for filepath, (_, content) in rewritten.items():
+            write_staged(filepath, content)
+        engine.commit(txn, locales, keys_file=keys_file)
 
     print(f"\n{'=' * 60}")
-    print(f"Files:     {len(files_modified)}")
-    print(f"Replaced:  {total_replaced}")
-    print(f"L10n keys: {total_keys}")
+    print(f"Files:     {len(contents)}")
+    print(f"Replaced:  {len(applied)}")
+    print(f"L10n keys: {len(applied)}")
+    if applied:
+        print("\n".join(locales.report()))
     print(f"{'=' * 60}")
+    if args.dry_run:
+        print("Dry run: nothing written.")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Filesystem events for `--watch`.
+
+On Linux the watcher uses inotify through ctypes (no extra dependency),
+with one watch per directory and new directories picked up as they
+appear. Elsewhere, or with `--poll`, it compares file stats every
+`interval` seconds. Both report changed paths, not events; callers
+decide what a change means.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+# Saves show up as close-after-write or as a rename over the file
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, name length
+
+
+class InotifyWatcher:
+    kind = 'inotify'
+
+    def __init__(self, roots):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._dirs = {}  # watch descriptor -> directory
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root):
+        """Watch `root` and its subdirectories; returns the files found."""
+        found = []
+        for dirpath, _, files in os.walk(root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = dirpath
+            found.extend(os.path.join(dirpath, f) for f in files)
+        return found
+
+    def poll(self, timeout=None):
+        """Paths changed within `timeout` seconds (None: wait for one)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, pos)
+            name = os.fsdecode(data[pos + _EVENT.size:pos + _EVENT.size + length].rstrip(b'\0'))
+            pos += _EVENT.size + length
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                # Files may land before the new directory is watched
+                changed.update(self._add_tree(path))
+            elif not mask & IN_CREATE:
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    kind = 'polling'
+
+    def __init__(self, roots, interval=0.5):
+        self.roots = roots
+        self.interval = interval
+        self._snapshot = self._stat_all()
+
+    def _stat_all(self):
+        snapshot = {}
+        for root in self.roots:
+            for dirpath, _, files in os.walk(root):
+                for f in files:
+                    path = os.path.join(dirpath, f)
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def poll(self, timeout=None):
+        """Paths changed within `timeout` seconds (None: wait for one)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+            snapshot = self._stat_all()
+            changed = {p for p, st in snapshot.items() if self._snapshot.get(p) != st}
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def open_watcher(roots, poll=False):
+    """InotifyWatcher where available, else (or with `poll`) PollingWatcher."""
+    roots = [str(r) for r in roots]
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots)
@@ -0,0 +1,51 @@
+"""Lexer edge cases the ISEN_PATTERN regexes get wrong."""
+
+from dart_lexer import STRING, Interpolation, StringLiteral, find_isen_ternaries, tokenize
+
+
+def literals(text):
+    return [t for t in tokenize(text) if t.kind == STRING]
+
+
+def test_raw_string_is_not_decoded_or_interpolated():
+    (tok,) = literals(r"x = r'a\n$b';")
+    literal = StringLiteral([tok])
+    assert literal.value == r'a\n$b'
+    assert not literal.interpolated
+
+
+def test_triple_quoted_keeps_newlines_and_quotes():
+    (tok,) = literals("x = '''one\n'two' $n''';")
+    assert tok.value.parts == ["one\n'two' ", Interpolation('$n')]
+
+
+def test_adjacent_literals_concatenate():
+    tokens = literals("x = 'a' 'b';")
+    assert len(tokens) == 2
+    assert StringLiteral(tokens).value == 'ab'
+
+    (t,) = find_isen_ternaries("x = isEn ? 'Hello ' 'there' : 'Merhaba';")
+    assert t.en.value == 'Hello there'
+    assert t.tr.value == 'Merhaba'
+
+
+def test_nested_interpolation_keeps_source():
+    (tok,) = literals("x = 'a ${m['k']} ${f('${y}')} b';")
+    sources = [p.source for p in tok.value.parts if isinstance(p, Interpolation)]
+    assert sources == ["${m['k']}", "${f('${y}')}"]
+
+
+def test_ternary_inside_interpolation():
+    text = "x = isEn ? 'A ${isEn ? 'b' : 'c'}' : 'D';"
+    found = find_isen_ternaries(text)
+    assert len(found) == 2
+    assert [t.en.value for t in found] == ["A ${isEn ? 'b' : 'c'}", 'b']
+
+
+def test_ternary_condition_and_exclusions():
+    (t,) = find_isen_ternaries("x = widget.isEn ? 'Yes' : 'Evet';")
+    assert t.condition == 'widget.isEn'
+
+    assert find_isen_ternaries("x = !isEn ? 'Evet' : 'Yes';") == []
+    assert find_isen_ternaries("x = isEn ? 'a' : 'b'.trim();") == []
+    assert find_isen_ternaries("// x = isEn ? 'a' : 'b';\n") == []
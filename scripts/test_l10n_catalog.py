@@ -0,0 +1,69 @@
+"""CatalogText splices must produce what a full load/dump would."""
+
+import json
+from collections import OrderedDict
+
+from l10n_catalog import CatalogText, prune
+
+
+def dump(data):
+    return json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+
+
+def reference_set(data, key, value):
+    parts = key.split('.')
+    node = data
+    for part in parts[:-1]:
+        if not isinstance(node.get(part), dict):
+            node[part] = OrderedDict()
+        node = node[part]
+    node[parts[-1]] = value
+
+
+CATALOG = dump(OrderedDict([
+    ('journal', OrderedDict([('title', 'Günlük'), ('tags', ['a', 'ş']), ('empty', {})])),
+    ('today', 'Bugün'),
+]))
+
+EDITS = [
+    ('journal.title', 'Yeni "başlık"'),       # replace a value
+    ('journal.daily.word_count', '{count} kelime'),  # new nested object
+    ('journal.empty.first', 'ilk'),            # fill an empty object
+    ('today.greeting', 'Merhaba'),             # value on the path becomes an object
+    ('premium', ['x', 1, None, {'y': 'z'}]),   # new top-level key, list value
+    ('journal.tags', 'düz'),                   # list replaced by a string
+]
+
+
+def test_set_matches_full_load_dump():
+    catalog = CatalogText(CATALOG)
+    data = json.loads(CATALOG, object_pairs_hook=OrderedDict)
+    for key, value in EDITS:
+        catalog.set(key, value)
+        reference_set(data, key, value)
+        assert catalog.render() == dump(data), key
+    assert catalog.changed
+
+
+def test_empty_catalog():
+    catalog = CatalogText('{}\n')
+    catalog.set('a.b', 'c')
+    assert catalog.render() == dump({'a': {'b': 'c'}})
+
+
+def test_non_canonical_layout_is_normalised():
+    catalog = CatalogText('{"a": {"b": "c"}}')
+    assert catalog.changed
+    catalog.set('a.d', 'e')
+    assert catalog.render() == dump({'a': {'b': 'c', 'd': 'e'}})
+
+
+def test_unchanged_catalog_renders_identically():
+    catalog = CatalogText(CATALOG)
+    assert not catalog.changed
+    assert catalog.render() == CATALOG
+
+
+def test_prune_drops_emptied_objects():
+    text = dump({'a': {'b': 'x'}, 'c': {'d': 'y', 'e': 'z'}})
+    assert prune(text, ['a.b', 'c.d']) == dump({'c': {'e': 'z'}})
@@ -0,0 +1,45 @@
+"""Placeholder comparison in l10n_check."""
+
+import json
+
+from l10n_catalog import KeyIndex
+from l10n_check import CatalogCheck, Mismatch, placeholders
+
+
+def indexes(**catalogs):
+    return {loc: KeyIndex(json.dumps(data)) for loc, data in catalogs.items()}
+
+
+def test_placeholders():
+    assert placeholders('{count} words, {total}') == {'count', 'total'}
+    assert placeholders(['{a}', 'b {c}']) == {'a', 'c'}
+    # Unicode escapes and prose braces are not placeholders
+    assert placeholders('\\u{1F382} {} { x }') == frozenset()
+    assert placeholders(3) == frozenset()
+
+
+def test_mismatch_reported():
+    check = CatalogCheck(indexes(
+        en={'a': '{count} words', 'b': 'Hi {name}'},
+        tr={'a': '{sayi} kelime', 'b': 'Selam {name}'},
+    ))
+    assert check.mismatches == [Mismatch('tr', 'a', {'count'}, {'sayi'})]
+    assert check.failed()
+
+
+def test_keys_limit_the_comparison():
+    check = CatalogCheck(indexes(
+        en={'a': '{count} words', 'b': 'Hi'},
+        tr={'a': '{sayi} kelime', 'b': 'Selam'},
+    ), keys=['b'])
+    assert check.mismatches == []
+    assert not check.failed()
+
+
+def test_missing_priority_locale_key_fails():
+    check = CatalogCheck(indexes(en={'a': 'x', 'b': 'y'}, tr={'a': 'x'}, de={'a': 'x'}))
+    assert check.missing == {'tr': ['b'], 'de': ['b']}
+    assert check.failed()
+    check = CatalogCheck(indexes(en={'a': 'x'}, tr={'a': 'x'}, de={}))
+    assert not check.failed()
+    assert check.failed(strict=True)
@@ -0,0 +1,40 @@
+"""How l10n_scan classifies the literals of a Dart file."""
+
+from l10n_scan import scan_text
+
+SOURCE = '''
+Widget build() {
+  final a = isEn ? 'Hello there' : 'Merhaba orada';
+  final b = 'Günlük yorum';
+  final c = 'Save changes';
+  final d = L10nService.get('journal.title', lang);
+  final e = Item(nameTr: 'Kaydet şimdi');
+  final f = 'x_y';
+}
+'''
+
+
+def kinds(text, keys=()):
+    return {lit.text: lit.kind for lit in scan_text(text, set(keys))}
+
+
+def test_classifier_kinds():
+    assert kinds(SOURCE, {'journal.title'}) == {
+        'Hello there': 'isen',
+        'Merhaba orada': 'isen',
+        'Günlük yorum': 'turkish',
+        'Save changes': 'english',
+        'journal.title': 'migrated',
+        'Kaydet şimdi': 'content',
+        'x_y': 'other',
+    }
+
+
+def test_line_numbers():
+    lines = {lit.text: lit.line for lit in scan_text(SOURCE, set())}
+    assert lines['Hello there'] == 3
+    assert lines['x_y'] == 8
+
+
+def test_routes_are_not_turkish():
+    assert kinds("go('/günlük');") == {'/günlük': 'other'}
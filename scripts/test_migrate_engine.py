@@ -0,0 +1,97 @@
+"""extract_params templates and KeyAllocator key choice."""
+
+from dart_lexer import find_isen_ternaries
+from l10n_catalog import KeyIndex
+from migrate_engine import KeyAllocator, extract_params, splice
+
+
+def params_of(en, tr):
+    (t,) = find_isen_ternaries(f"x = isEn ? '{en}' : '{tr}';")
+    return extract_params(t.en.parts, t.tr.parts)
+
+
+# ── extract_params ───────────────────────────────────────────────
+
+def test_simple_interpolation():
+    assert params_of('$count words', '$count kelime') == (
+        '{count} words', '{count} kelime', (('count', "'$count'"),))
+
+
+def test_member_access_names_the_param_after_the_member():
+    en, tr, params = params_of('${review.year} review', '${review.year} yorumu')
+    assert (en, tr) == ('{year} review', '{year} yorumu')
+    assert params == (('year', "'${review.year}'"),)
+
+
+def test_call_chain_name():
+    en, _, params = params_of('${(pct * 100).round()}%', '%${(pct * 100).round()}')
+    assert en == '{pct_round}%'
+    assert params[0][0] == 'pct_round'
+
+
+def test_mismatched_expressions_are_rejected():
+    assert params_of('$a left', '$b kaldı') is None
+
+
+def test_literal_braces_are_rejected():
+    assert params_of('{x} $n', '{x} $n') is None
+
+
+# ── KeyAllocator ─────────────────────────────────────────────────
+
+def test_collision_with_taken_key_gets_a_suffix():
+    allocator = KeyAllocator(taken=lambda key: key == 'p.hello')
+    assert allocator.make_unique_key('p', 'Hello') == 'p.hello_1'
+    assert allocator.make_unique_key('p', 'Hello') == 'p.hello_2'
+
+
+def test_same_pair_reuses_its_key():
+    allocator = KeyAllocator(pool={('Hi', 'Selam'): 'x.hi'})
+    assert allocator.allocate('p', 'Hi', 'Selam') == 'x.hi'
+    first = allocator.allocate('p', 'Bye', 'Güle güle')
+    assert allocator.allocate('q', 'Bye', 'Güle güle') == first == 'p.bye'
+    assert allocator.reused == 2
+    assert allocator.new_en_keys == {'p.bye': 'Bye'}
+    assert allocator.new_tr_keys == {'p.bye': 'Güle güle'}
+
+
+def test_same_text_different_translation_gets_a_new_key():
+    allocator = KeyAllocator()
+    assert allocator.allocate('p', 'Close', 'Kapat') == 'p.close'
+    assert allocator.allocate('p', 'Close', 'Yakın') == 'p.close_1'
+
+
+def test_blocked_key_moves_under_a_free_sibling():
+    catalog = KeyIndex()
+    catalog.add('zz.foo', 'value')
+    catalog.add('zz.foo_2', 'value')
+    allocator = KeyAllocator(blocked=catalog.blocking_parent)
+    assert allocator.make_unique_key('zz.foo', 'Hi') == 'zz.foo_3.hi'
+
+
+def test_minted_leaf_blocks_later_keys():
+    allocator = KeyAllocator()
+    assert allocator.make_unique_key('a', 'B') == 'a.b'
+    assert allocator.make_unique_key('a.b', 'C') == 'a.b_2.c'
+
+
+def test_pair_in_many_files_is_promoted_to_common():
+    class Match:
+        def __init__(self, en, tr):
+            self.en, self.tr = en, tr
+
+    class Scan:
+        def __init__(self, *matches):
+            self.matches = matches
+
+    allocator = KeyAllocator(common_after=1)
+    allocator.count_files([Scan(Match('Save', 'Kaydet')), Scan(Match('Save', 'Kaydet')), None])
+    assert allocator.allocate('journal', 'Save', 'Kaydet') == 'common.save'
+    assert allocator.promoted == 1
+
+
+# ── splice ───────────────────────────────────────────────────────
+
+def test_splice_applies_sorted_edits():
+    assert splice('abcdef', [(0, 1, 'X'), (3, 5, '')]) == 'Xbcf'
+    assert splice('abc', [(1, 1, '-')]) == 'a-bc'
@@ -0,0 +1,114 @@
+"""Transaction commit and recovery of an interrupted commit."""
+
+import os
+
+import pytest
+
+import migrate_txn
+from migrate_txn import backup_path, begin, recover, temp_path, write_staged
+
+
+class Crash(BaseException):
+    pass
+
+
+def tree(tmp_path):
+    (tmp_path / 'a.txt').write_text('old a')
+    (tmp_path / 'b.txt').write_text('old b')
+    (tmp_path / 'gone.txt').write_text('old gone')
+    return tmp_path / 'journal.json'
+
+
+def contents(tmp_path):
+    return {p.name: p.read_text() for p in sorted(tmp_path.iterdir())}
+
+
+def stage_all(txn, tmp_path):
+    txn.stage(tmp_path / 'a.txt', 'new a')
+    txn.stage(tmp_path / 'b.txt', 'new b')
+    txn.stage(tmp_path / 'c.txt', 'new c')
+    txn.remove(tmp_path / 'gone.txt')
+
+
+def crash_commit(tmp_path, monkeypatch):
+    """Commit, dying after the first file is renamed into place."""
+    journal = tree(tmp_path)
+    txn = begin(journal)
+    stage_all(txn, tmp_path)
+
+    real_replace = os.replace
+    renamed = []
+
+    def replace(src, dst):
+        if str(src).endswith('.migrate-tmp'):
+            if renamed:
+                raise Crash()
+            renamed.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, 'replace', replace)
+    # The process dies: nothing gets to roll back
+    monkeypatch.setattr(migrate_txn, 'recover', lambda journal, mode: 0)
+    with pytest.raises(Crash):
+        txn.commit()
+    monkeypatch.undo()
+    assert journal.exists()
+    return journal
+
+
+def test_commit(tmp_path):
+    journal = tree(tmp_path)
+    txn = begin(journal)
+    stage_all(txn, tmp_path)
+    txn.commit()
+    assert contents(tmp_path) == {'a.txt': 'new a', 'b.txt': 'new b', 'c.txt': 'new c'}
+
+
+def test_failed_commit_rolls_back(tmp_path, monkeypatch):
+    journal = tree(tmp_path)
+    before = contents(tmp_path)
+    txn = begin(journal)
+    stage_all(txn, tmp_path)
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if str(src).endswith('.migrate-tmp') and str(dst).endswith('b.txt'):
+            raise OSError('disk full')
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, 'replace', replace)
+    with pytest.raises(OSError):
+        txn.commit()
+    assert contents(tmp_path) == before
+
+
+def test_recover_complete(tmp_path, monkeypatch):
+    journal = crash_commit(tmp_path, monkeypatch)
+    recover(str(journal), 'complete')
+    assert contents(tmp_path) == {'a.txt': 'new a', 'b.txt': 'new b', 'c.txt': 'new c'}
+
+
+def test_recover_rollback(tmp_path, monkeypatch):
+    journal = crash_commit(tmp_path, monkeypatch)
+    recover(str(journal), 'rollback')
+    assert contents(tmp_path) == {'a.txt': 'old a', 'b.txt': 'old b', 'gone.txt': 'old gone'}
+
+
+@pytest.mark.parametrize('mode', migrate_txn.RECOVER_MODES)
+def test_recover_before_prepare_discards_staging(tmp_path, mode):
+    journal = tree(tmp_path)
+    txn = begin(journal)
+    txn.add([tmp_path / 'a.txt'])
+    write_staged(str(tmp_path / 'a.txt'), 'new a')
+    assert os.path.exists(temp_path(str(tmp_path / 'a.txt')))
+    recover(str(journal), mode)
+    assert contents(tmp_path) == {'a.txt': 'old a', 'b.txt': 'old b', 'gone.txt': 'old gone'}
+
+
+def test_begin_refuses_a_leftover_journal(tmp_path, monkeypatch):
+    journal = crash_commit(tmp_path, monkeypatch)
+    with pytest.raises(SystemExit):
+        begin(str(journal))
+    begin(str(journal), 'rollback')
+    assert not journal.exists()
+    assert not os.path.exists(backup_path(str(tmp_path / 'a.txt')))